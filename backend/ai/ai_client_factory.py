@@ -13,6 +13,9 @@ AI Client Factory - Model Agnostic Design
     client = AIClientFactory.create("gemini-1.5-pro")
     response = await client.call_api("your prompt")
     search_result = await client.search_web("your query")
+
+LLM_REPLAY_MODE (backend.ai.llm_replay) 가 켜져 있으면 생성된 클라이언트는
+ReplayAIClient 로 감싸져 응답을 기록/재생합니다.
 """
 
 from abc import ABC, abstractmethod
@@ -22,6 +25,8 @@ import asyncio
 import os
 from datetime import datetime
 
+from backend.ai.llm_replay import LLMReplayCache, get_llm_replay_cache
+
 
 class BaseAIClient(ABC):
     """AI 클라이언트 기본 인터페이스"""
@@ -292,6 +297,49 @@ class MockAIClient(BaseAIClient):
         return f"[Mock Search] Verified: {query}. Partnership is active."
 
 
+class ReplayAIClient(BaseAIClient):
+    """응답 기록/재생 래퍼 (call_api / search_web)"""
+
+    def __init__(self, client: BaseAIClient, replay: LLMReplayCache):
+        super().__init__(client.model_name)
+        self.client = client
+        self.replay = replay
+
+    async def call_api(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        temperature: float = 0.3,
+        system_prompt: Optional[str] = None
+    ) -> str:
+        request = {
+            "kind": "ai_client.call_api",
+            "client": type(self.client).__name__,
+            "model": self.model_name,
+            "system_prompt": system_prompt,
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        return await self.replay.call(
+            request,
+            lambda: self.client.call_api(prompt, max_tokens, temperature, system_prompt)
+        )
+
+    async def search_web(self, query: str) -> str:
+        request = {
+            "kind": "ai_client.search_web",
+            "client": type(self.client).__name__,
+            "model": self.model_name,
+            "query": query,
+        }
+        return await self.replay.call(request, lambda: self.client.search_web(query))
+
+    def get_usage_stats(self) -> Dict:
+        """사용량 통계 (실제 API 호출분) + 기록/재생 통계"""
+        return {**self.client.get_usage_stats(), "replay": self.replay.get_stats()}
+
+
 class AIClientFactory:
     """AI 클라이언트 팩토리"""
     
@@ -301,7 +349,8 @@ class AIClientFactory:
     def create(
         cls, 
         model_name: str, 
-        provider: Optional[str] = None
+        provider: Optional[str] = None,
+        replay: Optional[LLMReplayCache] = None
     ) -> BaseAIClient:
         """
         모델 이름으로 적절한 클라이언트 생성
@@ -309,12 +358,17 @@ class AIClientFactory:
         Args:
             model_name: 모델 이름 (예: "gemini-1.5-pro", "claude-3-haiku-20240307")
             provider: 명시적 공급자 지정 (선택)
+            replay: 응답 기록/재생 캐시 (없으면 LLM_REPLAY_MODE 기반 공용 캐시)
         
         Returns:
             BaseAIClient: AI 클라이언트 인스턴스
         """
+        replay = replay if replay is not None else get_llm_replay_cache()
+
         # 캐싱된 클라이언트 반환
         cache_key = f"{provider or 'auto'}:{model_name}"
+        if replay.enabled:
+            cache_key += f":replay:{id(replay)}"
         if cache_key in cls._clients:
             return cls._clients[cache_key]
         
@@ -334,6 +388,9 @@ class AIClientFactory:
         else:
             raise ValueError(f"Unknown provider: {provider}")
         
+        if replay.enabled:
+            client = ReplayAIClient(client, replay)
+        
         cls._clients[cache_key] = client
         return client
     
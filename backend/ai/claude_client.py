@@ -2,7 +2,7 @@
 Claude API Client for AI Trading Analysis.
 
 This module provides a robust interface to Claude API with:
-- Automatic retries with exponential backoff
+- Native async client with non-blocking exponential backoff (shared LLM gateway pool)
 - Error handling and logging
 - Cost tracking
 - Response parsing
@@ -15,9 +15,9 @@ import time
 from typing import Optional
 from datetime import datetime, timedelta
 
-import anthropic
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 
+from backend.ai.llm_gateway import estimate_tokens, get_llm_gateway
 from backend.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -109,7 +109,9 @@ Always return valid JSON in this exact format:
                 "Claude API key not found. Set CLAUDE_API_KEY in .env file."
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        # Native async client (pooled HTTP connections); retries are handled by the gateway
+        self.client = AsyncAnthropic(api_key=self.api_key, max_retries=0)
+        self.gateway = get_llm_gateway()
 
         # Configuration
         self.model = "claude-3-5-haiku-20241022"  # Cost-efficient model
@@ -336,117 +338,83 @@ Return ONLY valid JSON.
             Exception: If all retries fail
         """
         effective_system_prompt = system_prompt if system_prompt else self.CONSTITUTION_SYSTEM_PROMPT
-        
-        for attempt in range(self.max_retries):
-            try:
-                start_time = time.time()
-
-                # Ensure prompt is properly encoded
-                prompt = str(prompt).encode('utf-8', errors='replace').decode('utf-8')
-
-                # Build messages
-                if self.enable_caching and use_caching:
-                    # Use system prompt with caching
-                    response = self.client.messages.create(
-                        model=self.model,
-                        max_tokens=self.max_tokens,
-                        temperature=self.temperature,
-                        system=[
-                            {
-                                "type": "text",
-                                "text": effective_system_prompt,
-                                "cache_control": {"type": "ephemeral"}
-                            }
-                        ],
-                        messages=[{"role": "user", "content": prompt}],
-                    )
-                else:
-                    # Standard call without caching
-                    # Pass system prompt as string if provided
-                    response_kwargs = {
-                        "model": self.model,
-                        "max_tokens": self.max_tokens,
-                        "temperature": self.temperature,
-                        "messages": [{"role": "user", "content": prompt}],
-                    }
-                    if effective_system_prompt:
-                         response_kwargs["system"] = effective_system_prompt
-                    
-                    response = self.client.messages.create(**response_kwargs)
-
-                latency_ms = (time.time() - start_time) * 1000
-
-                # Extract response text
-                response_text = response.content[0].text
-
-                # Update metrics
-                self.total_requests += 1
-                self.total_tokens_input += response.usage.input_tokens
-                self.total_tokens_output += response.usage.output_tokens
-
-                # Update cache metrics if available
-                if hasattr(response.usage, 'cache_creation_input_tokens'):
-                    self.total_cache_creation_tokens += response.usage.cache_creation_input_tokens
-                if hasattr(response.usage, 'cache_read_input_tokens'):
-                    self.total_cache_read_tokens += response.usage.cache_read_input_tokens
-                    self.total_cached_tokens += response.usage.cache_read_input_tokens
-                    if response.usage.cache_read_input_tokens > 0:
-                        self.cache_last_updated = datetime.now()
-
-                # Calculate cost (Claude 3.5 Haiku pricing)
-                # Input: $0.80 per million tokens
-                # Output: $4.00 per million tokens
-                # Cache creation: $1.00 per million tokens (25% premium)
-                # Cache read: $0.08 per million tokens (90% discount)
-                input_cost = response.usage.input_tokens * 0.80 / 1_000_000
-                output_cost = response.usage.output_tokens * 4.00 / 1_000_000
-
-                cache_creation_cost = 0.0
-                cache_read_cost = 0.0
-                if hasattr(response.usage, 'cache_creation_input_tokens'):
-                    cache_creation_cost = response.usage.cache_creation_input_tokens * 1.00 / 1_000_000
-                if hasattr(response.usage, 'cache_read_input_tokens'):
-                    cache_read_cost = response.usage.cache_read_input_tokens * 0.08 / 1_000_000
-
-                cost = input_cost + output_cost + cache_creation_cost + cache_read_cost
-                self.total_cost_usd += cost
-
-                # Log with cache info if available
-                cache_info = ""
-                if hasattr(response.usage, 'cache_read_input_tokens') and response.usage.cache_read_input_tokens > 0:
-                    cache_info = f", cached: {response.usage.cache_read_input_tokens}"
-
-                logger.info(
-                    f"Claude API call successful: "
-                    f"{response.usage.input_tokens} in, "
-                    f"{response.usage.output_tokens} out{cache_info}, "
-                    f"${cost:.4f}, {latency_ms:.0f}ms"
-                )
-
-                return response_text
-
-            except anthropic.RateLimitError as e:
-                wait_time = 2**attempt  # Exponential backoff
-                logger.warning(
-                    f"Rate limit hit (attempt {attempt + 1}/{self.max_retries}), "
-                    f"waiting {wait_time}s"
-                )
-                time.sleep(wait_time)
-
-            except anthropic.APIError as e:
-                logger.error(f"Claude API error (attempt {attempt + 1}): {e}")
-                if attempt == self.max_retries - 1:
-                    raise
-
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error (attempt {attempt + 1}): {e}",
-                    exc_info=True
-                )
-                if attempt == self.max_retries - 1:
-                    raise
-
-        raise Exception(f"Failed after {self.max_retries} retries")
+
+        # Ensure prompt is properly encoded
+        prompt = str(prompt).encode('utf-8', errors='replace').decode('utf-8')
+
+        request_kwargs = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if self.enable_caching and use_caching:
+            # Use system prompt with caching
+            request_kwargs["system"] = [
+                {
+                    "type": "text",
+                    "text": effective_system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ]
+        elif effective_system_prompt:
+            # Standard call without caching - pass system prompt as string
+            request_kwargs["system"] = effective_system_prompt
+
+        start_time = time.time()
+
+        # Shared anthropic pool: concurrency + TPM budget + async exponential backoff
+        response = await self.gateway.call(
+            "anthropic",
+            lambda: self.client.messages.create(**request_kwargs),
+            estimated_tokens=estimate_tokens(prompt + effective_system_prompt, self.max_tokens),
+            tokens_used=lambda r: r.usage.input_tokens + r.usage.output_tokens,
+            max_retries=self.max_retries - 1,
+        )
+
+        latency_ms = (time.time() - start_time) * 1000
+
+        # Extract response text
+        response_text = response.content[0].text
+
+        # Update metrics
+        self.total_requests += 1
+        self.total_tokens_input += response.usage.input_tokens
+        self.total_tokens_output += response.usage.output_tokens
+
+        # Update cache metrics if available
+        cache_creation_tokens = getattr(response.usage, 'cache_creation_input_tokens', None) or 0
+        cache_read_tokens = getattr(response.usage, 'cache_read_input_tokens', None) or 0
+        self.total_cache_creation_tokens += cache_creation_tokens
+        self.total_cache_read_tokens += cache_read_tokens
+        self.total_cached_tokens += cache_read_tokens
+        if cache_read_tokens > 0:
+            self.cache_last_updated = datetime.now()
+
+        # Calculate cost (Claude 3.5 Haiku pricing)
+        # Input: $0.80 per million tokens
+        # Output: $4.00 per million tokens
+        # Cache creation: $1.00 per million tokens (25% premium)
+        # Cache read: $0.08 per million tokens (90% discount)
+        input_cost = response.usage.input_tokens * 0.80 / 1_000_000
+        output_cost = response.usage.output_tokens * 4.00 / 1_000_000
+        cache_creation_cost = cache_creation_tokens * 1.00 / 1_000_000
+        cache_read_cost = cache_read_tokens * 0.08 / 1_000_000
+
+        cost = input_cost + output_cost + cache_creation_cost + cache_read_cost
+        self.total_cost_usd += cost
+
+        # Log with cache info if available
+        cache_info = f", cached: {cache_read_tokens}" if cache_read_tokens > 0 else ""
+
+        logger.info(
+            f"Claude API call successful: "
+            f"{response.usage.input_tokens} in, "
+            f"{response.usage.output_tokens} out{cache_info}, "
+            f"${cost:.4f}, {latency_ms:.0f}ms"
+        )
+
+        return response_text
 
     def _parse_trading_response(self, response_text: str) -> dict:
         """
@@ -33,6 +33,7 @@ from backend.ai.consensus.consensus_models import (
     ConsensusStats
 )
 from backend.ai.consensus.voting_rules import VotingRules, VoteRequirement
+from backend.ai.llm_replay import LLMReplayCache, get_llm_replay_cache
 
 # Phase F1: AI 집단지성 모듈 통합
 try:
@@ -71,7 +72,8 @@ class ConsensusEngine:
         claude_client=None,
         chatgpt_client=None,
         gemini_client=None,
-        enable_f1_features: bool = True  # Phase F1 기능 활성화
+        enable_f1_features: bool = True,  # Phase F1 기능 활성화
+        replay: Optional[LLMReplayCache] = None
     ):
         """
         Initialize Consensus Engine
@@ -81,8 +83,10 @@ class ConsensusEngine:
             chatgpt_client: ChatGPTClient 인스턴스
             gemini_client: GeminiClient 인스턴스
             enable_f1_features: Phase F1 기능 활성화 여부
+            replay: AI 응답 기록/재생 캐시 (없으면 LLM_REPLAY_MODE 기반 공용 캐시)
         """
         self.clients = {}
+        self.replay = replay if replay is not None else get_llm_replay_cache()
 
         if claude_client:
             self.clients["claude"] = claude_client
@@ -268,12 +272,22 @@ class ConsensusEngine:
             # Phase F1: 역할 기반 프롬프트 구성 (ai_name 전달)
             prompt = self._build_voting_prompt(context, action, additional_info, ai_name=ai_name)
 
-            # AI 호출 (기존 analyze_stock 메서드 활용)
-            response = await client.analyze_stock(
-                ticker=context.ticker or "UNKNOWN",
-                features=self._context_to_features(context),
-                market_context={"action_to_vote": action},
-                portfolio_context=additional_info
+            # AI 호출 (기존 analyze_stock 메서드 활용, 기록/재생 캐시 경유)
+            request = {
+                "ticker": context.ticker or "UNKNOWN",
+                "features": self._context_to_features(context),
+                "market_context": {"action_to_vote": action},
+                "portfolio_context": additional_info,
+            }
+            response = await self.replay.call(
+                {
+                    "kind": "consensus.analyze_stock",
+                    "ai_name": ai_name,
+                    "client": type(client).__name__,
+                    "model": getattr(client, "model", None) or ai_name,
+                    **request,
+                },
+                lambda: client.analyze_stock(**request)
             )
 
             # Phase F1: 응답 품질 검증
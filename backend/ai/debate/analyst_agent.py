@@ -13,6 +13,8 @@ import logging
 from typing import Dict, Any, Optional
 import random
 
+from backend.database.news_query import TickerNewsQuery, fetch_news_summary
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,9 +29,10 @@ class AnalystAgent:
     - Financial health check
     """
     
-    def __init__(self):
+    def __init__(self, news_query: Optional[TickerNewsQuery] = None):
         self.agent_name = "analyst"
         self.vote_weight = 0.15  # 15% voting weight
+        self.news_query = news_query  # None → 공용 TickerNewsQuery
     
     async def analyze(self, ticker: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -45,16 +48,20 @@ class AnalystAgent:
                 "action": "BUY|SELL|HOLD",
                 "confidence": 0.0-1.0,
                 "reasoning": str,
-                "fundamental_factors": {...}
+                "fundamental_factors": {...},
+                "news_context": {...} | None  # 최신 헤드라인 / 감성 요약 (news_query)
             }
         """
         try:
             logger.info(f"[Analyst Agent] Analyzing {ticker}")
             
             if context and "fundamental_data" in context:
-                return await self._analyze_with_real_data(ticker, context["fundamental_data"])
+                result = await self._analyze_with_real_data(ticker, context["fundamental_data"])
             else:
-                return await self._analyze_mock(ticker)
+                result = await self._analyze_mock(ticker)
+
+            result["news_context"] = await fetch_news_summary(ticker, self.news_query)
+            return result
         
         except Exception as e:
             logger.error(f"[Analyst Agent] Error analyzing {ticker}: {e}")
@@ -15,20 +15,36 @@ Date: 2025-12-21
 Updated: 2025-12-27 - Added regulatory and litigation news detection
 """
 
-from datetime import datetime, timedelta, date
-from typing import Dict, Any, List, Optional
+from datetime import datetime, date
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 import logging
 import json
 import anthropic
 import os
 
-from backend.database.models import NewsArticle, GroundingSearchLog
+from backend.database.news_query import (
+    EmergencyNewsItem,
+    TickerNewsItem,
+    TickerNewsQuery,
+    get_ticker_news_query,
+)
 from backend.database.repository import (
     get_sync_session,
     MacroContextRepository,
     NewsInterpretationRepository
 )
 from backend.ai.gemini_client import call_gemini_api
+from backend.ai.debate.news_interpretation import (
+    InterpretationCache,
+    build_batch_prompt,
+    build_single_prompt,
+    extract_json,
+    get_interpretation_cache,
+    interpretation_key,
+    parse_batch_response,
+    validate_interpretation,
+)
 
 # Use GLM instead of Claude for cost efficiency
 try:
@@ -44,8 +60,14 @@ logger = logging.getLogger(__name__)
 class NewsAgent:
     """뉴스 기반 투표 Agent (War Room 7th member)"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        news_query: Optional[TickerNewsQuery] = None,
+        interpretation_cache: Optional[InterpretationCache] = None,
+    ):
         self.agent_name = "news"
+        # 티커 뉴스 조회 계층 (sentiment / analyst 에이전트와 공유)
+        self.news_query = news_query or get_ticker_news_query()
         self.vote_weight = 0.10  # 10% 투표권
         self.model_name = "gemini-2.0-flash-exp"
         # Use GLM client instead of Claude for cost efficiency
@@ -60,6 +82,11 @@ class NewsAgent:
         else:
             self.use_glm = False
         self.enable_interpretation = os.getenv("ENABLE_NEWS_INTERPRETATION", "true").lower() == "true"
+        # 배치 해석: 프롬프트 1회당 기사 수 / 동시 LLM 호출 수 (배치 실패 시 개별 호출에도 적용)
+        self.interpretation_batch_size = int(os.getenv("NEWS_INTERPRETATION_BATCH_SIZE", "5"))
+        self.interpretation_concurrency = int(os.getenv("NEWS_INTERPRETATION_CONCURRENCY", "4"))
+        self.interpretation_cache = interpretation_cache or get_interpretation_cache()
+        self.interpretation_stats = {"llm_calls": 0, "batch_calls": 0, "single_calls": 0, "failures": 0}
     
     async def interpret_articles(self, ticker: str, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -75,32 +102,19 @@ class NewsAgent:
         if not self.enable_interpretation or not articles:
             return []
 
-        interpretations = []
         try:
-            # Sync session for reading macro context
-            db = get_sync_session()
-            macro_context = self._get_macro_context(db)
-            db.close()
-            
-            for article in articles:
+            macro_context = await self._load_macro_context()
+            items = [
                 # Use summary if available, else content
-                content = article.get('summary') or article.get('content') or ''
-                
-                # Call internal interpretation logic
-                result = await self._interpret_news(
-                    ticker=ticker,
-                    headline=article['title'],
-                    content=content,
-                    macro_context=macro_context
-                )
-                
-                if result:
-                    interpretations.append(result)
-                    
+                (article['title'], article.get('summary') or article.get('content') or '')
+                for article in articles
+            ]
+            results = await self.interpret_batch(ticker, items, macro_context)
+            return [result for result in results if result]
+
         except Exception as e:
             logger.error(f"❌ NewsAgent.interpret_articles failed: {e}")
-            
-        return interpretations
+            return []
 
     async def analyze(self, ticker: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -121,52 +135,20 @@ class NewsAgent:
                 "sentiment_score": float
             }
         """
-        db = get_sync_session()
-        
+        db = None
+
         try:
-            # 1. Emergency News 조회 (최근 15일)
-            cutoff = datetime.now() - timedelta(days=15)
-            
-            # GroundingSearchLog fields: query (not search_query), no ticker column, search_date (not created_at)
-            emergency_news = db.query(GroundingSearchLog)\
-                .filter(
-                    GroundingSearchLog.query.ilike(f"%{ticker}%"),  # Search in query text
-                    GroundingSearchLog.search_date >= cutoff         # Use search_date
-                )\
-                .order_by(GroundingSearchLog.search_date.desc())\
-                .limit(5)\
-                .all()
-            
-            # 2. 일반 뉴스 조회 (최근 15일) - Phase 20 real-time news
-            # Priority: tickers field > title/content search
-            recent_news = db.query(NewsArticle)\
-                .filter(
-                    NewsArticle.published_date >= cutoff
-                )\
-                .order_by(NewsArticle.published_date.desc())\
-                .limit(200)\
-                .all()
-
-            # 티커 필터링 (우선순위: tickers 배열 > 제목/내용)
-            ticker_news = []
-            for n in recent_news:
-                # Check tickers array first (from Phase 20)
-                if n.tickers and ticker.upper() in [t.upper() for t in n.tickers]:
-                    ticker_news.append(n)
-                # Fallback: title/content search
-                elif ticker.upper() in n.title.upper() or ticker.upper() in (n.content or '').upper():
-                    ticker_news.append(n)
-
-                if len(ticker_news) >= 30:
-                    break
+            # 1-2. 긴급 뉴스 + 일반 뉴스 (최근 15일, 티커별 최신순)
+            # tickers @> ARRAY[ticker] (GIN) + 제목/본문 FTS 보완, 필요한 컬럼만 비동기 조회
+            bundle = await self.news_query.get_bundle(ticker)
+            emergency_news = bundle.emergency
+            recent_news = bundle.news
 
-            recent_news = ticker_news
-            
             # 3. 뉴스 요약 생성
             news_summaries = []
             
             for news in emergency_news:
-                # GroundingSearchLog has: query, result_count, estimated_cost
+                # GroundingSearchLog has: query, search_date, was_emergency
                 # No 'urgency' field by default
                 news_summaries.append({
                     "type": "EMERGENCY",
@@ -205,13 +187,14 @@ class NewsAgent:
             # 4. [NEW] 뉴스 해석 (Phase 2)
             if self.enable_interpretation and (emergency_news or recent_news):
                 logger.info(f"🔍 News Agent: Interpreting important news for {ticker}")
+                db = get_sync_session()
                 await self._interpret_and_save_news(ticker, emergency_news, recent_news, db)
 
             # 5. 규제/소송 뉴스 감지
             regulatory_analysis = self._detect_regulatory_litigation(news_summaries)
             
             # 6. [NEW] 지정학/칩워 위기 감지
-            critical_event = self._detect_critical_events(news_summaries)
+            critical_event = self.detect_critical_events(news_summaries)
 
             # 7. 시계열 트렌드 분석
             trend_analysis = self._analyze_temporal_trend(news_summaries)
@@ -285,7 +268,8 @@ class NewsAgent:
             }
         
         finally:
-            db.close()
+            if db is not None:
+                db.close()
     
     def _analyze_temporal_trend(self, news_summaries: List[Dict]) -> Dict[str, Any]:
         """
@@ -704,12 +688,12 @@ class NewsAgent:
     async def _interpret_and_save_news(
         self,
         ticker: str,
-        emergency_news: List,
-        recent_news: List[NewsArticle],
+        emergency_news: List[EmergencyNewsItem],
+        recent_news: List[TickerNewsItem],
         db_session
     ):
         """
-        중요 뉴스를 선택하여 Claude API로 해석하고 DB에 저장
+        중요 뉴스를 선택하여 배치 해석(GLM)하고 DB에 저장
 
         Args:
             ticker: 종목 코드
@@ -717,68 +701,77 @@ class NewsAgent:
             recent_news: 일반 뉴스 목록
             db_session: DB 세션
         """
-        # 1. Macro context 조회
-        macro_context = self._get_macro_context(db_session)
-
-        # 2. 중요 뉴스 선택 (최대 5개)
+        # 1. 중요 뉴스 선택 (최대 5개)
         important_news = self._select_important_news(emergency_news, recent_news, limit=5)
 
         if not important_news:
             logger.info(f"🔍 News Agent: No important news to interpret for {ticker}")
             return
 
-        # 3. 각 뉴스 해석 + DB 저장
+        # 2. 이미 해석된 뉴스 제외
         interpretation_repo = NewsInterpretationRepository(db_session)
-
+        pending = []
         for news_item in important_news:
+            # 일반 뉴스 (news_articles)
+            if isinstance(news_item, TickerNewsItem):
+                news_id = news_item.id
+                headline = news_item.title
+                content = news_item.content or ""
+            else:
+                # 긴급 뉴스 (GroundingSearchLog)
+                news_id = None  # GroundingSearchLog는 news_articles 테이블에 없음
+                headline = news_item.query
+                content = ""
+
+            if news_id and interpretation_repo.get_by_news_article(news_id):
+                logger.info(f"🔍 News Agent: Already interpreted news_id={news_id}, skipping")
+                continue
+            pending.append((news_id, headline, content))
+
+        if not pending:
+            return
+
+        # 3. Macro context 1회 조회 + 배치 해석
+        macro_context = await self._load_macro_context()
+        interpretations = await self.interpret_batch(
+            ticker, [(headline, content) for _, headline, content in pending], macro_context
+        )
+
+        # 4. DB 저장 (news_id가 있는 경우만)
+        for (news_id, _, _), interpretation in zip(pending, interpretations):
+            if not news_id or not interpretation:
+                continue
             try:
-                # NewsArticle인 경우
-                if isinstance(news_item, NewsArticle):
-                    news_id = news_item.id
-                    headline = news_item.title
-                    content = news_item.content or ""
-                else:
-                    # GroundingSearchLog인 경우 (긴급 뉴스)
-                    news_id = None  # GroundingSearchLog는 news_articles 테이블에 없음
-                    headline = news_item.query
-                    content = ""
-
-                # 이미 해석된 뉴스는 skip
-                if news_id:
-                    existing = interpretation_repo.get_by_news_article(news_id)
-                    if existing:
-                        logger.info(f"🔍 News Agent: Already interpreted news_id={news_id}, skipping")
-                        continue
-
-                # Claude API로 해석
-                interpretation = await self._interpret_news(
-                    ticker=ticker,
-                    headline=headline,
-                    content=content,
-                    macro_context=macro_context
-                )
-
-                # DB 저장 (news_id가 있는 경우만)
-                if news_id and interpretation:
-                    interpretation_data = {
-                        "news_article_id": news_id,
-                        "ticker": ticker,
-                        "headline_bias": interpretation["headline_bias"],
-                        "expected_impact": interpretation["expected_impact"],
-                        "time_horizon": interpretation["time_horizon"],
-                        "confidence": interpretation["confidence"],
-                        "reasoning": interpretation["reasoning"],
-                        "macro_context_id": macro_context["id"] if macro_context else None,
-                        "interpreted_at": datetime.now()
-                    }
-
-                    saved = interpretation_repo.create(interpretation_data)
-                    logger.info(f"✅ News Agent: Saved interpretation id={saved.id} for news_id={news_id}")
+                interpretation_data = {
+                    "news_article_id": news_id,
+                    "ticker": ticker,
+                    "headline_bias": interpretation["headline_bias"],
+                    "expected_impact": interpretation["expected_impact"],
+                    "time_horizon": interpretation["time_horizon"],
+                    "confidence": interpretation["confidence"],
+                    "reasoning": interpretation["reasoning"],
+                    "macro_context_id": macro_context["id"] if macro_context else None,
+                    "interpreted_at": datetime.now()
+                }
+
+                saved = interpretation_repo.create(interpretation_data)
+                logger.info(f"✅ News Agent: Saved interpretation id={saved.id} for news_id={news_id}")
 
             except Exception as e:
-                logger.error(f"❌ News Agent: Failed to interpret news: {e}", exc_info=True)
+                logger.error(f"❌ News Agent: Failed to save interpretation: {e}", exc_info=True)
                 continue
 
+    async def _load_macro_context(self) -> Optional[Dict]:
+        """macro context 비동기 조회 (동기 repository를 워커 스레드에서 실행, 배치당 1회)"""
+        def _load():
+            db = get_sync_session()
+            try:
+                return self._get_macro_context(db)
+            finally:
+                db.close()
+
+        return await asyncio.to_thread(_load)
+
     def _get_macro_context(self, db_session) -> Optional[Dict]:
         """
         오늘의 macro context 조회
@@ -810,8 +803,8 @@ class NewsAgent:
 
     def _select_important_news(
         self,
-        emergency_news: List,
-        recent_news: List[NewsArticle],
+        emergency_news: List[EmergencyNewsItem],
+        recent_news: List[TickerNewsItem],
         limit: int = 5
     ) -> List:
         """
@@ -879,73 +872,113 @@ class NewsAgent:
                 "reasoning": "해석 근거"
             }
         """
-        macro_info = ""
-        if macro_context:
-            macro_info = f"""
-현재 거시 경제 상황:
-- 시장 체제: {macro_context['regime']}
-- Fed 스탠스: {macro_context['fed_stance']}
-- VIX: {macro_context['vix_category']}
-- 시장 센티먼트: {macro_context['market_sentiment']}
-- S&P 500 트렌드: {macro_context['sp500_trend']}
-- 지배적 서사: {macro_context['dominant_narrative']}
-"""
-
-        prompt = f"""
-당신은 {ticker} 주식에 대한 뉴스 해석 전문가입니다.
-
-다음 뉴스를 분석하여 투자 관점에서 해석하세요:
-
-**뉴스 헤드라인**: {headline}
-
-**뉴스 내용**: {content[:500] if content else "내용 없음"}
-{macro_info}
-
-다음 JSON 형식으로만 응답하세요 (추가 설명 없이):
-{{
-  "headline_bias": "BULLISH|BEARISH|NEUTRAL",
-  "expected_impact": "HIGH|MEDIUM|LOW",
-  "time_horizon": "IMMEDIATE|INTRADAY|MULTI_DAY",
-  "confidence": 0.0-1.0,
-  "reasoning": "이 뉴스가 {ticker} 주가에 미칠 영향에 대한 간결한 해석 (100자 이내)"
-}}
-
-**주의사항**:
-- headline_bias: 뉴스가 주가에 긍정적(BULLISH), 부정적(BEARISH), 중립적(NEUTRAL)인지
-- expected_impact: 주가 변동 예상 크기 (HIGH: 5%+, MEDIUM: 2-5%, LOW: <2%)
-- time_horizon: 영향 시점 (IMMEDIATE: 10분내, INTRADAY: 당일, MULTI_DAY: 며칠)
-- confidence: 이 해석에 대한 확신도 (0.0-1.0)
-- 거시 경제 상황을 고려하여 해석하세요
-"""
+        prompt = build_single_prompt(ticker, headline, content, macro_context)
 
         try:
-            # Use GLM for cost efficiency
-            response = await self.glm_client.chat(
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=300,
-                temperature=0.3
-            )
-            response_text = response["choices"][0]["message"]["content"].strip()
-
-            # JSON 파싱
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
-
-            interpretation = json.loads(response_text)
-
-            # 검증
-            required_fields = ["headline_bias", "expected_impact", "time_horizon", "confidence", "reasoning"]
-            for field in required_fields:
-                if field not in interpretation:
-                    raise ValueError(f"Missing field: {field}")
+            response_text = await self._call_interpretation_llm(prompt, max_tokens=300)
+            interpretation = validate_interpretation(extract_json(response_text))
+            self.interpretation_stats["single_calls"] += 1
 
             logger.info(f"✅ News Agent: Interpreted news - {interpretation['headline_bias']} / {interpretation['expected_impact']}")
             return interpretation
 
         except Exception as e:
+            self.interpretation_stats["failures"] += 1
             logger.error(f"❌ News Agent: Claude interpretation failed: {e}", exc_info=True)
             return None
+
+    async def interpret_batch(
+        self,
+        ticker: str,
+        items: List[Tuple[str, str]],
+        macro_context: Optional[Dict]
+    ) -> List[Optional[Dict]]:
+        """
+        여러 기사 해석 (캐시 → 배치 프롬프트 → 개별 호출 fallback)
+
+        - (티커, 기사 해시, 프롬프트 버전, macro 스냅샷) 캐시 적중 기사는 LLM 호출 없음
+        - 같은 요청 안의 중복 기사는 1회만 해석
+        - 나머지는 interpretation_batch_size 개씩 묶어 interpretation_concurrency 개까지 동시 호출
+
+        Args:
+            items: [(headline, content), ...]
+
+        Returns:
+            items 순서의 해석 결과 (실패 항목은 None)
+        """
+        keys = [interpretation_key(ticker, headline, content, macro_context) for headline, content in items]
+        results: Dict[Any, Optional[Dict]] = {}
+        pending: Dict[Any, Tuple[str, str]] = {}
+
+        for key, item in zip(keys, items):
+            if key in results or key in pending:
+                continue
+            cached = self.interpretation_cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = item
+
+        if pending:
+            semaphore = asyncio.Semaphore(max(1, self.interpretation_concurrency))
+            batch_size = max(1, self.interpretation_batch_size)
+            pending_keys = list(pending)
+            chunks = [pending_keys[i:i + batch_size] for i in range(0, len(pending_keys), batch_size)]
+
+            chunk_results = await asyncio.gather(*[
+                self._interpret_chunk(ticker, [pending[k] for k in chunk], macro_context, semaphore)
+                for chunk in chunks
+            ])
+            for chunk, interpretations in zip(chunks, chunk_results):
+                for key, interpretation in zip(chunk, interpretations):
+                    results[key] = interpretation
+                    if interpretation:
+                        self.interpretation_cache.put(key, interpretation)
+
+        return [dict(results[key]) if results.get(key) else None for key in keys]
+
+    async def _interpret_chunk(
+        self,
+        ticker: str,
+        chunk: List[Tuple[str, str]],
+        macro_context: Optional[Dict],
+        semaphore: asyncio.Semaphore
+    ) -> List[Optional[Dict]]:
+        """배치 프롬프트 1회 호출, 누락 항목은 개별 호출로 보완"""
+        parsed: Dict[int, Dict] = {}
+        if len(chunk) > 1:
+            prompt = build_batch_prompt(ticker, chunk, macro_context)
+            try:
+                async with semaphore:
+                    response_text = await self._call_interpretation_llm(prompt, max_tokens=200 * len(chunk) + 100)
+                parsed = parse_batch_response(response_text, len(chunk))
+                self.interpretation_stats["batch_calls"] += 1
+            except Exception as e:
+                logger.warning(f"⚠️ News Agent: Batch interpretation failed ({len(chunk)} items), falling back: {e}")
+
+        async def _single(idx: int) -> Optional[Dict]:
+            async with semaphore:
+                headline, content = chunk[idx]
+                return await self._interpret_news(ticker, headline, content, macro_context)
+
+        missing = [idx for idx in range(len(chunk)) if idx not in parsed]
+        if missing:
+            for idx, interpretation in zip(missing, await asyncio.gather(*[_single(idx) for idx in missing])):
+                parsed[idx] = interpretation
+
+        if len(chunk) > 1:
+            logger.info(f"✅ News Agent: Interpreted {sum(1 for r in parsed.values() if r)}/{len(chunk)} news in batch")
+        return [parsed.get(idx) for idx in range(len(chunk))]
+
+    async def _call_interpretation_llm(self, prompt: str, max_tokens: int) -> str:
+        """GLM 호출 (해석 프롬프트 공용)"""
+        self.interpretation_stats["llm_calls"] += 1
+        # Use GLM for cost efficiency
+        response = await self.glm_client.chat(
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            temperature=0.3
+        )
+        return response["choices"][0]["message"]["content"].strip()
@@ -0,0 +1,234 @@
+"""
+News Interpretation Helpers - Batched prompts and interpretation cache
+
+NewsAgent 뉴스 해석(GLM)을 기사 단위 순차 호출에서 배치/병렬 호출로 바꾸기 위한 헬퍼입니다.
+
+- 배치 프롬프트: 여러 헤드라인을 번호(id)와 함께 하나의 구조화된 프롬프트로 묶고
+  JSON 배열로 응답받아 id로 매칭
+- InterpretationCache: (티커, 기사 해시, 프롬프트 버전, macro 스냅샷) 키 TTL 캐시
+  → 같은 기사를 여러 토론/요청에서 다시 해석하지 않음
+  (headline_bias 가 티커 기준이므로 티커는 키에 포함)
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트/응답 형식이 바뀌면 올립니다 (기존 캐시 무효화)
+INTERPRETATION_PROMPT_VERSION = "news-interp-v2"
+
+REQUIRED_FIELDS = ("headline_bias", "expected_impact", "time_horizon", "confidence", "reasoning")
+
+SINGLE_CONTENT_CHARS = 500
+BATCH_CONTENT_CHARS = 300
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def article_hash(headline: str, content: str = "") -> str:
+    """기사 해시 (헤드라인 + 프롬프트에 들어가는 본문 앞부분)"""
+    normalized = " ".join((headline or "").split()).lower()
+    body = " ".join((content or "")[:SINGLE_CONTENT_CHARS].split())
+    return hashlib.sha256(f"{normalized}\n{body}".encode("utf-8")).hexdigest()[:32]
+
+
+def macro_snapshot_key(macro_context: Optional[Dict]) -> str:
+    """macro context 스냅샷 식별자 (해석 결과가 거시 상황에 의존하므로 캐시 키에 포함)"""
+    if not macro_context:
+        return "none"
+    if macro_context.get("id") is not None:
+        return f"id:{macro_context['id']}"
+    payload = json.dumps(macro_context, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def interpretation_key(ticker: str, headline: str, content: str, macro_context: Optional[Dict]) -> CacheKey:
+    return (ticker.upper(), article_hash(headline, content), INTERPRETATION_PROMPT_VERSION, macro_snapshot_key(macro_context))
+
+
+def format_macro_info(macro_context: Optional[Dict]) -> str:
+    if not macro_context:
+        return ""
+    return f"""
+현재 거시 경제 상황:
+- 시장 체제: {macro_context['regime']}
+- Fed 스탠스: {macro_context['fed_stance']}
+- VIX: {macro_context['vix_category']}
+- 시장 센티먼트: {macro_context['market_sentiment']}
+- S&P 500 트렌드: {macro_context['sp500_trend']}
+- 지배적 서사: {macro_context['dominant_narrative']}
+"""
+
+
+_FIELD_GUIDE = """**주의사항**:
+- headline_bias: 뉴스가 주가에 긍정적(BULLISH), 부정적(BEARISH), 중립적(NEUTRAL)인지
+- expected_impact: 주가 변동 예상 크기 (HIGH: 5%+, MEDIUM: 2-5%, LOW: <2%)
+- time_horizon: 영향 시점 (IMMEDIATE: 10분내, INTRADAY: 당일, MULTI_DAY: 며칠)
+- confidence: 이 해석에 대한 확신도 (0.0-1.0)
+- 거시 경제 상황을 고려하여 해석하세요
+"""
+
+
+def build_single_prompt(ticker: str, headline: str, content: str, macro_context: Optional[Dict]) -> str:
+    """기사 1건 해석 프롬프트"""
+    return f"""
+당신은 {ticker} 주식에 대한 뉴스 해석 전문가입니다.
+
+다음 뉴스를 분석하여 투자 관점에서 해석하세요:
+
+**뉴스 헤드라인**: {headline}
+
+**뉴스 내용**: {content[:SINGLE_CONTENT_CHARS] if content else "내용 없음"}
+{format_macro_info(macro_context)}
+
+다음 JSON 형식으로만 응답하세요 (추가 설명 없이):
+{{
+  "headline_bias": "BULLISH|BEARISH|NEUTRAL",
+  "expected_impact": "HIGH|MEDIUM|LOW",
+  "time_horizon": "IMMEDIATE|INTRADAY|MULTI_DAY",
+  "confidence": 0.0-1.0,
+  "reasoning": "이 뉴스가 {ticker} 주가에 미칠 영향에 대한 간결한 해석 (100자 이내)"
+}}
+
+{_FIELD_GUIDE}"""
+
+
+def build_batch_prompt(ticker: str, items: Sequence[Tuple[str, str]], macro_context: Optional[Dict]) -> str:
+    """
+    기사 여러 건 해석 프롬프트
+
+    Args:
+        items: [(headline, content), ...] - 응답의 id는 리스트 인덱스
+    """
+    news_lines = []
+    for idx, (headline, content) in enumerate(items):
+        snippet = " ".join((content or "")[:BATCH_CONTENT_CHARS].split()) or "내용 없음"
+        news_lines.append(f"[{idx}] 헤드라인: {headline}\n    내용: {snippet}")
+    news_block = "\n".join(news_lines)
+
+    return f"""
+당신은 {ticker} 주식에 대한 뉴스 해석 전문가입니다.
+
+다음 {len(items)}개 뉴스를 각각 독립적으로 분석하여 투자 관점에서 해석하세요:
+
+{news_block}
+{format_macro_info(macro_context)}
+
+다음 JSON 배열 형식으로만 응답하세요 (뉴스마다 하나씩, id는 위의 [번호], 추가 설명 없이):
+[
+  {{
+    "id": 0,
+    "headline_bias": "BULLISH|BEARISH|NEUTRAL",
+    "expected_impact": "HIGH|MEDIUM|LOW",
+    "time_horizon": "IMMEDIATE|INTRADAY|MULTI_DAY",
+    "confidence": 0.0-1.0,
+    "reasoning": "이 뉴스가 {ticker} 주가에 미칠 영향에 대한 간결한 해석 (100자 이내)"
+  }}
+]
+
+{_FIELD_GUIDE}"""
+
+
+def extract_json(response_text: str) -> Any:
+    """코드 블록(```json) 제거 후 JSON 파싱"""
+    text = response_text.strip()
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0].strip()
+    elif "```" in text:
+        text = text.split("```")[1].split("```")[0].strip()
+    return json.loads(text)
+
+
+def validate_interpretation(interpretation: Dict) -> Dict:
+    for field in REQUIRED_FIELDS:
+        if field not in interpretation:
+            raise ValueError(f"Missing field: {field}")
+    return {field: interpretation[field] for field in REQUIRED_FIELDS}
+
+
+def parse_batch_response(response_text: str, count: int) -> Dict[int, Dict]:
+    """
+    배치 응답 파싱
+
+    Returns:
+        {id: interpretation} - 누락/형식 오류 항목은 제외 (호출자가 개별 호출로 보완)
+    """
+    parsed = extract_json(response_text)
+    if isinstance(parsed, dict):
+        parsed = parsed.get("interpretations", [parsed])
+    if not isinstance(parsed, list):
+        raise ValueError("Batch interpretation response is not a JSON array")
+
+    results: Dict[int, Dict] = {}
+    for entry in parsed:
+        try:
+            idx = int(entry["id"])
+            if 0 <= idx < count and idx not in results:
+                results[idx] = validate_interpretation(entry)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Skipping malformed batch interpretation entry: {e}")
+    return results
+
+
+class InterpretationCache:
+    """
+    뉴스 해석 TTL + LRU 캐시 (프로세스 공유)
+
+    키: (ticker, article_hash, prompt_version, macro_snapshot)
+    """
+
+    def __init__(self, max_entries: int = 5000, ttl_seconds: float = 24 * 3600, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Dict]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def get(self, key: CacheKey) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None or self._clock() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return dict(entry[1])
+
+    def put(self, key: CacheKey, interpretation: Dict):
+        self._entries[key] = (self._clock(), dict(interpretation))
+        self._entries.move_to_end(key)
+        self.stats["stores"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+        }
+
+
+_interpretation_cache: Optional[InterpretationCache] = None
+
+
+def get_interpretation_cache() -> InterpretationCache:
+    """InterpretationCache 싱글톤"""
+    global _interpretation_cache
+    if _interpretation_cache is None:
+        _interpretation_cache = InterpretationCache()
+    return _interpretation_cache
@@ -13,6 +13,8 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import random
 
+from backend.database.news_query import TickerNewsQuery, fetch_news_summary
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,9 +29,10 @@ class SentimentAgent:
     - Retail investor psychology analysis
     """
 
-    def __init__(self):
+    def __init__(self, news_query: Optional[TickerNewsQuery] = None):
         self.agent_name = "sentiment"
         self.vote_weight = 0.08  # 8% voting weight (소셜은 참고용)
+        self.news_query = news_query  # None → 공용 TickerNewsQuery
 
     async def analyze(self, ticker: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -45,16 +48,20 @@ class SentimentAgent:
                 "action": "BUY|SELL|HOLD",
                 "confidence": 0.0-1.0,
                 "reasoning": str,
-                "sentiment_factors": {...}
+                "sentiment_factors": {...},
+                "news_sentiment": {...} | None  # 티커 뉴스 감성 요약 (news_query)
             }
         """
         try:
             logger.info(f"[Sentiment Agent] Analyzing {ticker}")
 
             if context and "social_data" in context:
-                return await self._analyze_with_real_data(ticker, context["social_data"])
+                result = await self._analyze_with_real_data(ticker, context["social_data"])
             else:
-                return await self._analyze_mock(ticker)
+                result = await self._analyze_mock(ticker)
+
+            result["news_sentiment"] = await fetch_news_summary(ticker, self.news_query)
+            return result
 
         except Exception as e:
             logger.error(f"[Sentiment Agent] Error analyzing {ticker}: {e}")
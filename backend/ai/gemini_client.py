@@ -23,6 +23,8 @@ except ImportError:
     GENAI_AVAILABLE = False
     logging.warning("google-generativeai not installed. Install with: pip install google-generativeai")
 
+from backend.ai.llm_gateway import estimate_tokens, get_llm_gateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,6 +75,7 @@ class GeminiClient:
         # Get model from environment, default to gemini-2.5-flash
         model_name = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
         self.model = genai.GenerativeModel(model_name)
+        self.gateway = get_llm_gateway()
         
         # Cost tracking
         self.metrics = {
@@ -132,8 +135,12 @@ class GeminiClient:
             # Build prompt
             prompt = self._build_prompt(ticker, news_headlines, recent_events)
             
-            # Call Gemini API
-            response = self.model.generate_content(prompt)
+            # Call Gemini API (native async, shared gemini pool)
+            response = await self.gateway.call(
+                "gemini",
+                lambda: self.model.generate_content_async(prompt),
+                estimated_tokens=estimate_tokens(prompt),
+            )
             
             # Parse response
             result = self._parse_response(response.text, ticker)
@@ -418,8 +425,12 @@ Respond with ONLY a valid JSON object (no markdown, no explanation):
             # Build prompt for RSS error diagnosis
             prompt = self._build_rss_diagnosis_prompt(feed_url, feed_name, error_message)
 
-            # Call Gemini API
-            response = self.model.generate_content(prompt)
+            # Call Gemini API (native async, shared gemini pool)
+            response = await self.gateway.call(
+                "gemini",
+                lambda: self.model.generate_content_async(prompt),
+                estimated_tokens=estimate_tokens(prompt),
+            )
 
             # Parse response
             result = self._parse_rss_diagnosis_response(response.text, feed_url, feed_name)
@@ -625,7 +636,11 @@ async def call_gemini_api(
         generation_config=generation_config
     )
     
-    response = model.generate_content(prompt)
+    response = await get_llm_gateway().call(
+        "gemini",
+        lambda: model.generate_content_async(prompt),
+        estimated_tokens=estimate_tokens(prompt),
+    )
     
     return response.text
 
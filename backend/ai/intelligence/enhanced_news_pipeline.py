@@ -12,14 +12,24 @@ Key Features:
 2. Each stage mockable for independent testing
 3. Contrarian view forced display (contrarian_view, invalidation_conditions, failure_triggers)
 4. End-to-end integration with error handling
+5. Stage dependency graph (PIPELINE_DAG): independent stages run concurrently
+
+   filter ─┬─ narrative ── market_confirm ─┬─ horizon
+           └─ fact_check                   └─ policy
+
+6. Batch processing: each stage runs once per article batch; components exposing
+   `<method>_batch` (e.g. analyze_news_batch) receive the whole batch for batched prompts
+7. Per-stage latency / throughput metrics (get_statistics()["stage_metrics"])
 
 Author: AI Trading System Team
 Date: 2026-01-19
 Reference: docs/planning/260118_market_intelligence_roadmap.md
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -107,6 +117,58 @@ class PipelineResult:
         }
 
 
+@dataclass(frozen=True)
+class StageSpec:
+    """
+    Pipeline stage node
+
+    Attributes:
+        name: Stage key in PipelineResult.stages
+        depends_on: Stages that must finish first
+        component: Key in intelligence_components
+        method: Component method for a single input (batch variant: f"{method}_batch")
+        handler: Pipeline method for a single input (component or default fallback)
+        input_key: Pipeline method building the stage input from the article run
+        gate: Reject the article (skip downstream stages) unless relevant
+    """
+    name: str
+    depends_on: Tuple[str, ...]
+    component: str
+    method: str
+    handler: str
+    input_key: str = "_article_input"
+    gate: bool = False
+
+
+# final_insight for articles rejected by the filter stage
+FILTERED_OUT_INSIGHT = "Article filtered out as irrelevant"
+
+PIPELINE_DAG: Tuple[StageSpec, ...] = (
+    StageSpec("filter", (), "news_filter", "filter_news", "_stage1_filter", gate=True),
+    StageSpec("narrative", ("filter",), "narrative_engine", "analyze_news", "_stage2_narrative"),
+    StageSpec("fact_check", ("filter",), "fact_checker", "verify_data", "_stage3_fact_check"),
+    StageSpec("market_confirm", ("narrative",), "market_confirmation", "confirm_narrative",
+              "_stage4_market_confirm", input_key="_narrative_input"),
+    StageSpec("horizon", ("market_confirm",), "horizon_tagger", "tag_horizons",
+              "_stage5_horizon_tagging", input_key="_insight_input"),
+    StageSpec("policy", ("market_confirm",), "policy_feasibility", "analyze_feasibility",
+              "_stage6_policy_analysis", input_key="_insight_input"),
+)
+
+
+@dataclass
+class _ArticleRun:
+    """Per-article state while a batch moves through the DAG"""
+    article: Dict[str, Any]
+    stages: Dict[str, IntelligenceResult] = field(default_factory=dict)
+    rejected: bool = False
+    error: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return not self.rejected and self.error is None
+
+
 # ============================================================================
 # Main Component
 # ============================================================================
@@ -126,6 +188,11 @@ class EnhancedNewsProcessingPipeline(BaseIntelligence):
     4. Invalidation condition identification
     5. Failure trigger detection
 
+    Stages are scheduled from PIPELINE_DAG: a stage starts as soon as all of its
+    dependencies have finished for the batch, so narrative ∥ fact_check and
+    horizon ∥ policy run concurrently. Articles rejected by the filter skip every
+    later stage.
+
     Usage:
         from backend.ai.llm_providers import get_llm_provider
         from backend.ai.intelligence.enhanced_news_pipeline import EnhancedNewsProcessingPipeline
@@ -139,6 +206,9 @@ class EnhancedNewsProcessingPipeline(BaseIntelligence):
         # Process a news article
         result = await pipeline.process_article(article)
 
+        # Process a crawl burst (one batch per stage)
+        results = await pipeline.process_batch(articles)
+
         if result.data["contrarian_view"]["bear_case"]:
             print("Contrarian view suggests caution")
     """
@@ -147,6 +217,9 @@ class EnhancedNewsProcessingPipeline(BaseIntelligence):
         self,
         llm_provider: LLMProvider,
         intelligence_components: Optional[Dict[str, Any]] = None,
+        dag: Sequence[StageSpec] = PIPELINE_DAG,
+        max_concurrency: int = 8,
+        batch_size: int = 50,
     ):
         """
         Initialize Enhanced News Processing Pipeline
@@ -154,6 +227,9 @@ class EnhancedNewsProcessingPipeline(BaseIntelligence):
         Args:
             llm_provider: LLM Provider instance
             intelligence_components: Dictionary of intelligence components
+            dag: Stage dependency graph (topologically ordered)
+            max_concurrency: Max in-flight per-article stage calls / insight LLM calls
+            batch_size: Max articles per component batch call
         """
         super().__init__(
             name="EnhancedNewsProcessingPipeline",
@@ -162,11 +238,32 @@ class EnhancedNewsProcessingPipeline(BaseIntelligence):
 
         self.llm = llm_provider
         self._components = intelligence_components or {}
+        self.dag = tuple(dag)
+        self._validate_dag(self.dag)
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
 
         # Statistics
         self._processed_count = 0
         self._early_termination_count = 0
         self._component_failures = {}
+        self._batch_count = 0
+        self._stage_metrics: Dict[str, Dict[str, float]] = {
+            spec.name: {"batches": 0, "items": 0, "total_ms": 0.0, "max_ms": 0.0} for spec in self.dag
+        }
+        self._stage_metrics["final_insight"] = {"batches": 0, "items": 0, "total_ms": 0.0, "max_ms": 0.0}
+
+    @staticmethod
+    def _validate_dag(dag: Sequence[StageSpec]) -> None:
+        """Stage names unique, dependencies declared before use (no cycles)"""
+        seen = set()
+        for spec in dag:
+            if spec.name in seen:
+                raise ValueError(f"Duplicate pipeline stage: {spec.name}")
+            missing = [d for d in spec.depends_on if d not in seen]
+            if missing:
+                raise ValueError(f"Stage {spec.name} depends on undeclared stages: {missing}")
+            seen.add(spec.name)
 
     async def analyze(self, data: Dict[str, Any]) -> IntelligenceResult:
         """
@@ -194,59 +291,207 @@ class EnhancedNewsProcessingPipeline(BaseIntelligence):
         Returns:
             PipelineResult: Complete pipeline result with all stages
         """
+        return (await self.process_batch([article]))[0]
+
+    async def process_batch(
+        self,
+        articles: Sequence[Dict[str, Any]],
+    ) -> List[PipelineResult]:
+        """
+        Process a batch of articles stage by stage along the DAG
+
+        Args:
+            articles: Article dicts (title required)
+
+        Returns:
+            List[PipelineResult]: One result per article, in input order
+        """
         start_time = datetime.now()
+        results: List[Optional[PipelineResult]] = [None] * len(articles)
+        runs: List[Tuple[int, _ArticleRun]] = []
+
+        for i, article in enumerate(articles):
+            if not article or not article.get("title"):
+                results[i] = self._create_error_result("Article title is required", article)
+            else:
+                runs.append((i, _ArticleRun(article=article)))
 
-        # Validate article
-        if not article or not article.get("title"):
-            return self._create_error_result("Article title is required", article)
+        if runs:
+            self._batch_count += 1
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            batch = [run for _, run in runs]
 
-        stages = {}
-        invalidation_conditions = []
-        failure_triggers = []
+            tasks: Dict[str, asyncio.Task] = {}
+            for spec in self.dag:
+                tasks[spec.name] = asyncio.ensure_future(self._run_stage(spec, batch, tasks, semaphore))
+            try:
+                await asyncio.gather(*tasks.values())
+            finally:
+                for task in tasks.values():
+                    task.cancel()
 
-        try:
-            # Stage 1: Filter (early exit if not relevant)
-            filter_result = await self._stage1_filter(article)
-            stages["filter"] = filter_result
+            finalized = await self._finalize_batch(batch, semaphore, start_time)
+            for (i, _), result in zip(runs, finalized):
+                results[i] = result
+
+        return results
+
+    async def _run_stage(
+        self,
+        spec: StageSpec,
+        batch: List[_ArticleRun],
+        tasks: Dict[str, asyncio.Task],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Wait for dependencies, then run one stage over every still-active article"""
+        if spec.depends_on:
+            await asyncio.gather(*(tasks[name] for name in spec.depends_on))
+
+        ready = [run for run in batch if run.active and all(d in run.stages for d in spec.depends_on)]
+        if not ready:
+            return
+
+        started = time.perf_counter()
+        outputs = await self._execute_stage(spec, ready, semaphore)
+        self._record_stage_metrics(spec.name, len(ready), started)
+
+        for run, output in zip(ready, outputs):
+            if isinstance(output, BaseException):
+                logger.error(f"Pipeline stage {spec.name} error: {output}")
+                self._component_failures[spec.name] = self._component_failures.get(spec.name, 0) + 1
+                if run.error is None:
+                    run.error = f"Pipeline error: {str(output)}"
+                continue
+
+            run.stages[spec.name] = output
+            if not output.success:
+                self._component_failures[spec.name] = self._component_failures.get(spec.name, 0) + 1
+            if spec.gate and (not output.success or not output.data.get("is_relevant", True)):
+                run.rejected = True
+
+    async def _execute_stage(
+        self,
+        spec: StageSpec,
+        runs: List[_ArticleRun],
+        semaphore: asyncio.Semaphore,
+    ) -> List[Any]:
+        """
+        Run a stage for many articles.
+
+        Uses the component's batch method when available (chunks of batch_size),
+        otherwise fans out single calls bounded by the semaphore. Exceptions are
+        returned in place of results.
+        """
+        inputs = [getattr(self, spec.input_key)(run) for run in runs]
+        component = self._components.get(spec.component)
+        batch_method = getattr(component, f"{spec.method}_batch", None) if component else None
+
+        if batch_method is not None:
+            outputs: List[Any] = []
+            for lo in range(0, len(inputs), self.batch_size):
+                chunk = inputs[lo:lo + self.batch_size]
+                try:
+                    chunk_results = list(await batch_method(chunk))
+                    if len(chunk_results) != len(chunk):
+                        raise ValueError(
+                            f"{spec.component}.{spec.method}_batch returned "
+                            f"{len(chunk_results)} results for {len(chunk)} inputs"
+                        )
+                except Exception as e:
+                    chunk_results = [e] * len(chunk)
+                outputs.extend(chunk_results)
+            return outputs
+
+        handler = getattr(self, spec.handler)
+
+        async def run_one(payload: Dict[str, Any]):
+            async with semaphore:
+                return await handler(payload)
+
+        return await asyncio.gather(*(run_one(payload) for payload in inputs), return_exceptions=True)
+
+    def _article_input(self, run: _ArticleRun) -> Dict[str, Any]:
+        return run.article
+
+    def _narrative_input(self, run: _ArticleRun) -> Dict[str, Any]:
+        return run.stages["narrative"].data.copy()
+
+    def _insight_input(self, run: _ArticleRun) -> Dict[str, Any]:
+        return {**run.stages["narrative"].data, **run.stages["market_confirm"].data}
+
+    def _record_stage_metrics(self, stage: str, items: int, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        metrics = self._stage_metrics.setdefault(
+            stage, {"batches": 0, "items": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        metrics["batches"] += 1
+        metrics["items"] += items
+        metrics["total_ms"] += elapsed_ms
+        metrics["max_ms"] = max(metrics["max_ms"], elapsed_ms)
 
-            if not filter_result.success or not filter_result.data.get("is_relevant", True):
+    async def _finalize_batch(
+        self,
+        batch: List[_ArticleRun],
+        semaphore: asyncio.Semaphore,
+        start_time: datetime,
+    ) -> List[PipelineResult]:
+        """Build PipelineResults (final insight LLM calls run concurrently)"""
+        completed = [run for run in batch if run.active]
+        started = time.perf_counter()
+
+        async def finalize(run: _ArticleRun) -> PipelineResult:
+            async with semaphore:
+                return await self._finalize_article(run, start_time)
+
+        finalized = iter(await asyncio.gather(*(finalize(run) for run in completed)))
+        if completed:
+            self._record_stage_metrics("final_insight", len(completed), started)
+
+        results = []
+        for run in batch:
+            stages = self._ordered_stages(run)
+            if run.error is not None:
+                results.append(self._create_error_result(
+                    run.error,
+                    stages=stages,
+                    processing_time_ms=self._calculate_time(start_time),
+                ))
+            elif run.rejected:
                 self._early_termination_count += 1
-                return self._create_result(
+                results.append(self._create_result(
                     stages=stages,
-                    final_insight="Article filtered out as irrelevant",
+                    final_insight=FILTERED_OUT_INSIGHT,
                     processing_time_ms=self._calculate_time(start_time),
-                )
+                ))
+            else:
+                results.append(next(finalized))
+        return results
 
-            # Stage 2: Narrative Analysis
-            narrative_result = await self._stage2_narrative(article)
-            stages["narrative"] = narrative_result
+    def _ordered_stages(self, run: _ArticleRun) -> Dict[str, IntelligenceResult]:
+        """Stage results in DAG order (stable prompt / report layout)"""
+        return {spec.name: run.stages[spec.name] for spec in self.dag if spec.name in run.stages}
 
-            # Stage 3: Fact Check
-            fact_check_result = await self._stage3_fact_check(article)
-            stages["fact_check"] = fact_check_result
+    async def _finalize_article(self, run: _ArticleRun, start_time: datetime) -> PipelineResult:
+        """Final insight, contrarian view and invalidation / failure lists for one article"""
+        stages = self._ordered_stages(run)
+        invalidation_conditions = []
+        failure_triggers = []
 
+        try:
             # Check for fact check failures
-            if not fact_check_result.success or fact_check_result.data.get("verification_status") == "HALLUCINATION":
+            fact_check_result = stages.get("fact_check")
+            if fact_check_result is not None and (
+                not fact_check_result.success
+                or fact_check_result.data.get("verification_status") == "HALLUCINATION"
+            ):
                 failure_triggers.append("Fact verification failed - potential hallucination")
 
-            # Stage 4: Market Confirmation
-            narrative_data = narrative_result.data.copy()
-            market_confirm_result = await self._stage4_market_confirm(narrative_data)
-            stages["market_confirm"] = market_confirm_result
-
             # Check for market invalidation
-            if market_confirm_result.data.get("confirmation_status") == "CONTRADICTED":
+            market_confirm_result = stages.get("market_confirm")
+            if market_confirm_result is not None and \
+                    market_confirm_result.data.get("confirmation_status") == "CONTRADICTED":
                 invalidation_conditions.append("Price action contradicts narrative")
 
-            # Stage 5: Horizon Tagging
-            insight_data = {**narrative_data, **market_confirm_result.data}
-            horizon_result = await self._stage5_horizon_tagging(insight_data)
-            stages["horizon"] = horizon_result
-
-            # Stage 6: Policy Analysis
-            policy_result = await self._stage6_policy_analysis(insight_data)
-            stages["policy"] = policy_result
-
             # Generate final insight
             final_insight = await self._generate_final_insight(stages)
 
@@ -711,10 +956,23 @@ Be direct and decisive. Traders need clear signals, not hedged language."""
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get pipeline processing statistics"""
+        stage_metrics = {}
+        for stage, metrics in self._stage_metrics.items():
+            total_s = metrics["total_ms"] / 1000
+            stage_metrics[stage] = {
+                "batches": metrics["batches"],
+                "items": metrics["items"],
+                "avg_batch_latency_ms": metrics["total_ms"] / metrics["batches"] if metrics["batches"] else 0.0,
+                "max_batch_latency_ms": metrics["max_ms"],
+                "items_per_sec": metrics["items"] / total_s if total_s > 0 else 0.0,
+            }
+
         return {
             "total_processed": self._processed_count,
             "early_terminations": self._early_termination_count,
             "component_failures": self._component_failures,
+            "batches": self._batch_count,
+            "stage_metrics": stage_metrics,
         }
 
 
@@ -725,6 +983,7 @@ Be direct and decisive. Traders need clear signals, not hedged language."""
 def create_enhanced_pipeline(
     llm_provider: Optional[LLMProvider] = None,
     intelligence_components: Optional[Dict[str, Any]] = None,
+    **kwargs,
 ) -> EnhancedNewsProcessingPipeline:
     """
     Create Enhanced News Processing Pipeline instance
@@ -732,6 +991,7 @@ def create_enhanced_pipeline(
     Args:
         llm_provider: LLM Provider (uses default if None)
         intelligence_components: Dictionary of intelligence components
+        **kwargs: max_concurrency, batch_size, dag
 
     Returns:
         EnhancedNewsProcessingPipeline: Configured pipeline instance
@@ -743,4 +1003,5 @@ def create_enhanced_pipeline(
     return EnhancedNewsProcessingPipeline(
         llm_provider=llm_provider,
         intelligence_components=intelligence_components,
+        **kwargs,
     )
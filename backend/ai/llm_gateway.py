@@ -0,0 +1,453 @@
+"""
+LLM Gateway - 비동기 LLM 호출 공통 관문
+
+모든 LLM 호출(LLMProvider, ClaudeClient, GeminiClient, MVP Gemini 에이전트)이
+같은 제공자별 풀을 공유하도록 하는 비동기 게이트웨이입니다.
+
+Features:
+- 제공자별 동시성 제한 (asyncio.Semaphore)
+- 제공자별 분당 토큰 예산 (TPM token bucket)
+- 비동기 지수 백오프 재시도 (full jitter, Retry-After 존중)
+- Hedged request: p95 지연 초과 시 fallback 제공자로 동시 요청, 먼저 끝난 응답 사용
+
+환경 변수 오버라이드:
+    LLM_<PROVIDER>_MAX_CONCURRENCY  (예: LLM_GEMINI_MAX_CONCURRENCY=32)
+    LLM_<PROVIDER>_TPM              (예: LLM_ANTHROPIC_TPM=80000, 0 = 무제한)
+
+Usage:
+    from backend.ai.llm_gateway import get_llm_gateway
+
+    gateway = get_llm_gateway()
+    response = await gateway.call(
+        "gemini",
+        lambda: model.generate_content_async(prompt),
+        estimated_tokens=estimate_tokens(prompt, 1000),
+    )
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 재시도 대상 HTTP 상태 코드 (529 = Anthropic overloaded)
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# 상태 코드 없이 예외 이름으로만 판별 가능한 일시적 오류
+_RETRYABLE_ERROR_NAMES = (
+    "RateLimit", "Timeout", "Connection", "Overloaded",
+    "ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded",
+)
+
+
+class LLMAPIError(Exception):
+    """LLM HTTP API 오류 (상태 코드와 Retry-After 포함)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+@dataclass
+class ProviderLimits:
+    """
+    제공자별 호출 제한
+
+    Attributes:
+        max_concurrency: 동시 요청 수 상한
+        tokens_per_minute: 분당 토큰 예산 (None = 무제한)
+        max_retries: 일시적 오류 재시도 횟수
+        base_delay: 백오프 기본 대기 (초)
+        max_delay: 백오프 최대 대기 (초)
+        timeout: 요청 1회 타임아웃 (초)
+    """
+    max_concurrency: int = 8
+    tokens_per_minute: Optional[int] = None
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    timeout: float = 120.0
+
+
+# 기본 제한 (GLM-4.7 concurrency 3, Gemini 60+ 등 각 클라이언트 주석 기준)
+DEFAULT_PROVIDER_LIMITS: Dict[str, ProviderLimits] = {
+    "openai": ProviderLimits(max_concurrency=16, tokens_per_minute=200_000),
+    "anthropic": ProviderLimits(max_concurrency=8, tokens_per_minute=80_000),
+    "gemini": ProviderLimits(max_concurrency=32, tokens_per_minute=1_000_000),
+    "glm": ProviderLimits(max_concurrency=3),
+    "ollama": ProviderLimits(max_concurrency=2, max_retries=1),
+    "mock": ProviderLimits(max_concurrency=64, max_retries=1, base_delay=0.01),
+}
+
+
+def _provider_name(provider: Any) -> str:
+    """ModelProvider enum 또는 문자열을 풀 키로 변환"""
+    return str(getattr(provider, "value", provider)).lower()
+
+
+def limits_from_env(provider: str, base: Optional[ProviderLimits] = None) -> ProviderLimits:
+    """환경 변수로 제공자 제한 오버라이드"""
+    limits = ProviderLimits(**asdict(base)) if base else ProviderLimits()
+    prefix = f"LLM_{provider.upper()}_"
+
+    concurrency = os.getenv(prefix + "MAX_CONCURRENCY")
+    if concurrency:
+        limits.max_concurrency = max(1, int(concurrency))
+
+    tpm = os.getenv(prefix + "TPM")
+    if tpm is not None and tpm != "":
+        limits.tokens_per_minute = int(tpm) or None
+
+    return limits
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 0) -> int:
+    """요청 토큰 수 추정 (약 4 chars/token + 최대 출력 토큰)"""
+    return len(text or "") // 4 + max(0, max_output_tokens)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """일시적 오류(429/5xx/타임아웃/연결 오류) 여부"""
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+        return True
+
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS_CODES
+
+    name = type(error).__name__
+    return any(marker in name for marker in _RETRYABLE_ERROR_NAMES)
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    retry_after: Optional[float] = None
+) -> float:
+    """지수 백오프 + full jitter (Retry-After가 있으면 그 이상 대기)"""
+    delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+    if retry_after:
+        delay = max(delay, min(float(retry_after), max_delay))
+    return delay
+
+
+class TokenBudget:
+    """
+    분당 토큰 예산 (token bucket)
+
+    요청 전에 추정 토큰을 예약하고, 응답 후 실제 사용량으로 정산합니다.
+    예산이 부족하면 이벤트 루프를 막지 않고 비동기로 대기합니다.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int) -> float:
+        """
+        토큰 예약 (부족하면 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        tokens = min(float(tokens), self.capacity)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self.available < tokens:
+                wait = (tokens - self.available) / self.rate
+                await asyncio.sleep(wait)
+                waited += wait
+                self._refill()
+            self.available -= tokens
+        return waited
+
+    def settle(self, reserved: int, actual: int):
+        """예약량과 실제 사용량 차이 정산 (초과분은 다음 요청에서 상환)"""
+        self._refill()
+        self.available = min(self.capacity, self.available + min(float(reserved), self.capacity) - actual)
+
+
+class LatencyWindow:
+    """최근 N개 요청의 지연 시간 분포"""
+
+    def __init__(self, size: int = 200):
+        self.samples: Deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.samples:
+            return {"samples": 0, "p50_ms": None, "p95_ms": None, "max_ms": None}
+        return {
+            "samples": len(self.samples),
+            "p50_ms": round(self.percentile(0.5) * 1000, 1),
+            "p95_ms": round(self.percentile(0.95) * 1000, 1),
+            "max_ms": round(max(self.samples) * 1000, 1),
+        }
+
+
+class ProviderPool:
+    """제공자별 동시성 풀 + 토큰 예산 + 지연 통계"""
+
+    def __init__(self, name: str, limits: ProviderLimits):
+        self.name = name
+        self.limits = limits
+        self.budget = TokenBudget(limits.tokens_per_minute) if limits.tokens_per_minute else None
+        self.latency = LatencyWindow()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.stats = {
+            "requests": 0,
+            "successes": 0,
+            "failures": 0,
+            "retries": 0,
+            "in_flight": 0,
+            "tokens_used": 0,
+            "throttled_seconds": 0.0,
+        }
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프용 세마포어 (asyncio.run 재호출 시 재생성)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limits.max_concurrency)
+            self._loop = loop
+            if self.budget:
+                self.budget._lock = None
+        return self._semaphore
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats["throttled_seconds"] = round(stats["throttled_seconds"], 3)
+        stats["max_concurrency"] = self.limits.max_concurrency
+        stats["tokens_per_minute"] = self.limits.tokens_per_minute
+        stats["latency"] = self.latency.to_dict()
+        return stats
+
+
+class LLMGateway:
+    """
+    통합 비동기 LLM 게이트웨이
+
+    호출 자체는 각 클라이언트의 코루틴 팩토리로 전달받고, 게이트웨이는
+    동시성/토큰 예산/재시도/hedging만 담당합니다.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, ProviderLimits]] = None,
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        hedge_min_delay: float = 0.5
+    ):
+        """
+        초기화
+
+        Args:
+            limits: 제공자별 제한 (없으면 DEFAULT_PROVIDER_LIMITS + 환경 변수)
+            hedge_percentile: hedge 발동 기준 지연 분위수
+            hedge_min_samples: 분위수를 신뢰하기 위한 최소 샘플 수
+            hedge_min_delay: hedge 발동 최소 대기 (초)
+        """
+        self._limits = {_provider_name(k): v for k, v in (limits or {}).items()}
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.pools: Dict[str, ProviderPool] = {}
+
+        self.hedge_stats = {
+            "hedged_requests": 0,
+            "hedge_wins": 0,
+            "failovers": 0,
+        }
+
+    def pool(self, provider: Any) -> ProviderPool:
+        """제공자 풀 가져오기 (지연 생성)"""
+        name = _provider_name(provider)
+        if name not in self.pools:
+            limits = self._limits.get(name) or limits_from_env(name, DEFAULT_PROVIDER_LIMITS.get(name))
+            self.pools[name] = ProviderPool(name, limits)
+        return self.pools[name]
+
+    async def call(
+        self,
+        provider: Any,
+        request: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+        tokens_used: Optional[Callable[[T], int]] = None,
+        max_retries: Optional[int] = None
+    ) -> T:
+        """
+        제공자 풀을 거쳐 요청 실행 (동시성 제한 + TPM 예산 + 비동기 재시도)
+
+        Args:
+            provider: 제공자 (ModelProvider 또는 문자열)
+            request: 호출마다 새 코루틴을 만드는 팩토리
+            estimated_tokens: 예약할 추정 토큰 수
+            tokens_used: 응답에서 실제 토큰 수를 꺼내는 함수
+            max_retries: 재시도 횟수 오버라이드 (클라이언트별 설정 유지용)
+
+        Returns:
+            request()의 결과
+        """
+        pool = self.pool(provider)
+        limits = pool.limits
+        semaphore = pool.semaphore
+        retries = limits.max_retries if max_retries is None else max(0, max_retries)
+
+        for attempt in range(retries + 1):
+            if pool.budget and estimated_tokens:
+                pool.stats["throttled_seconds"] += await pool.budget.acquire(estimated_tokens)
+
+            async with semaphore:
+                pool.stats["requests"] += 1
+                pool.stats["in_flight"] += 1
+                start = time.monotonic()
+                try:
+                    result = await asyncio.wait_for(request(), timeout=limits.timeout)
+                except Exception as e:
+                    pool.stats["failures"] += 1
+                    if pool.budget and estimated_tokens:
+                        pool.budget.settle(estimated_tokens, 0)
+                    if attempt >= retries or not is_retryable(e):
+                        raise
+                    delay = backoff_delay(
+                        attempt, limits.base_delay, limits.max_delay,
+                        getattr(e, "retry_after", None)
+                    )
+                    logger.warning(
+                        f"[LLMGateway] {pool.name} transient error "
+                        f"(attempt {attempt + 1}/{retries + 1}): {e}, retrying in {delay:.2f}s"
+                    )
+                else:
+                    pool.latency.record(time.monotonic() - start)
+                    pool.stats["successes"] += 1
+                    used = tokens_used(result) if tokens_used else 0
+                    pool.stats["tokens_used"] += used
+                    if pool.budget and estimated_tokens:
+                        pool.budget.settle(estimated_tokens, used or estimated_tokens)
+                    return result
+                finally:
+                    pool.stats["in_flight"] -= 1
+
+            # 백오프 중에는 슬롯을 반납
+            pool.stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+        raise RuntimeError("unreachable")
+
+    def hedge_deadline(self, provider: Any) -> Optional[float]:
+        """hedge 발동 시점 (p95 지연), 샘플이 부족하면 None"""
+        latency = self.pool(provider).latency
+        if len(latency.samples) < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay, latency.percentile(self.hedge_percentile))
+
+    async def hedge(
+        self,
+        provider: Any,
+        primary: Callable[[], Awaitable[T]],
+        fallback: Callable[[], Awaitable[T]],
+        hedge_after: Optional[float] = None
+    ) -> T:
+        """
+        Hedged request
+
+        primary가 p95 지연(또는 hedge_after) 안에 끝나지 않으면 fallback을
+        동시에 시작하고 먼저 성공한 결과를 반환합니다. primary가 실패하면
+        즉시 fallback으로 전환합니다.
+
+        Args:
+            provider: primary 제공자 (지연 분포 기준)
+            primary: primary 요청 코루틴 팩토리 (보통 self.call 래핑)
+            fallback: fallback 요청 코루틴 팩토리
+            hedge_after: hedge 발동 대기 (초, 없으면 p95 기반)
+        """
+        deadline = hedge_after if hedge_after is not None else self.hedge_deadline(provider)
+        primary_task = asyncio.ensure_future(primary())
+        hedge_task: Optional[asyncio.Future] = None
+
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=deadline)
+            if done:
+                error = primary_task.exception()
+                if error is None:
+                    return primary_task.result()
+                logger.warning(f"[LLMGateway] primary failed, failing over: {error}")
+                self.hedge_stats["failovers"] += 1
+                return await fallback()
+
+            self.hedge_stats["hedged_requests"] += 1
+            hedge_task = asyncio.ensure_future(fallback())
+            pending = {primary_task, hedge_task}
+            first_error: Optional[BaseException] = None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is hedge_task:
+                            self.hedge_stats["hedge_wins"] += 1
+                        return task.result()
+                    first_error = first_error or error
+
+            raise first_error
+        finally:
+            for task in (primary_task, hedge_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """제공자별 통계 + hedging 통계"""
+        return {
+            "providers": {name: pool.get_stats() for name, pool in self.pools.items()},
+            "hedging": dict(self.hedge_stats),
+        }
+
+
+# 싱글톤 인스턴스 (프로세스 전체가 같은 제공자 풀을 공유)
+_llm_gateway_instance: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """LLM Gateway 싱글톤 반환"""
+    global _llm_gateway_instance
+    if _llm_gateway_instance is None:
+        _llm_gateway_instance = LLMGateway()
+    return _llm_gateway_instance
@@ -18,11 +18,18 @@ Usage:
 
     # 비동기 호출
     result = await provider.complete("What is the market sentiment today?", config)
+
+    # Hedged 호출: primary가 p95 지연을 넘기면 fallback 모델로 동시 요청
+    result = await provider.complete(prompt, config, fallback_config=provider.create_gemini_config())
+
+모든 호출은 backend.ai.llm_gateway의 제공자별 풀(동시성/TPM 예산/비동기 재시도)을 거칩니다.
+LLM_REPLAY_MODE 가 설정되면 backend.ai.llm_replay 의 기록/재생 캐시가 게이트웨이 앞에서
+동작합니다 (재생 히트는 API/게이트웨이를 거치지 않음).
 """
 
 import os
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from enum import Enum
@@ -35,6 +42,15 @@ except ImportError:
     HTTPX_AVAILABLE = False
     import aiohttp
 
+try:
+    import google.generativeai as genai
+    GENAI_AVAILABLE = True
+except ImportError:
+    GENAI_AVAILABLE = False
+
+from backend.ai.llm_gateway import LLMAPIError, LLMGateway, estimate_tokens, get_llm_gateway
+from backend.ai.llm_replay import LLMReplayCache, get_llm_replay_cache
+
 
 class ModelProvider(Enum):
     """LLM 제공자"""
@@ -43,6 +59,7 @@ class ModelProvider(Enum):
     MOCK = "mock"  # 테스트용
     OLLAMA = "ollama"  # 로컬 LLM (Ollama)
     GLM = "glm"  # Z.AI GLM-4.7
+    GEMINI = "gemini"  # Google Gemini
 
 
 @dataclass
@@ -124,10 +141,26 @@ class LLMResponse:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LLMResponse":
+        """to_dict() 역변환"""
+        return cls(
+            content=data["content"],
+            model=data["model"],
+            provider=ModelProvider(data["provider"]),
+            tokens_used=data.get("tokens_used", 0),
+            latency_ms=data.get("latency_ms", 0),
+            finish_reason=data.get("finish_reason", ""),
+            metadata=dict(data.get("metadata") or {}),
+        )
+
 
 class BaseLLMClient:
     """LLM 클라이언트 기본 클래스"""
 
+    REQUEST_TIMEOUT = 60.0
+    MAX_CONNECTIONS = 20  # 클라이언트당 keep-alive 연결 풀 크기
+
     def __init__(self, api_key: str):
         """
         초기화
@@ -136,6 +169,78 @@ class BaseLLMClient:
             api_key: API 키
         """
         self.api_key = api_key
+        self._http = None
+        self._http_loop = None
+
+    def _get_http(self):
+        """공유 HTTP 세션 (요청마다 새 연결을 맺지 않도록 이벤트 루프별로 재사용)"""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            if HTTPX_AVAILABLE:
+                self._http = httpx.AsyncClient(
+                    timeout=self.REQUEST_TIMEOUT,
+                    limits=httpx.Limits(
+                        max_connections=self.MAX_CONNECTIONS,
+                        max_keepalive_connections=self.MAX_CONNECTIONS,
+                    ),
+                )
+            else:
+                self._http = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+                    connector=aiohttp.TCPConnector(limit=self.MAX_CONNECTIONS),
+                )
+            self._http_loop = loop
+        return self._http
+
+    def _format_error(self, error_text: str) -> str:
+        """API 오류 본문 → 메시지 (제공자별 오버라이드)"""
+        return error_text
+
+    async def _post_json(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        error_label: str
+    ) -> Dict[str, Any]:
+        """
+        JSON POST 요청
+
+        Raises:
+            LLMAPIError: 200이 아닌 응답 (status_code / retry_after 포함)
+        """
+        http = self._get_http()
+
+        if HTTPX_AVAILABLE:
+            response = await http.post(url, headers=headers, json=payload)
+            status, text = response.status_code, response.text
+            retry_after = response.headers.get("retry-after")
+        else:
+            async with http.post(url, headers=headers, json=payload) as response:
+                status, text = response.status, await response.text()
+                retry_after = response.headers.get("Retry-After")
+
+        if status != 200:
+            try:
+                retry_after = float(retry_after) if retry_after else None
+            except ValueError:
+                retry_after = None
+            raise LLMAPIError(
+                f"{error_label} API error: {status} - {self._format_error(text)}",
+                status_code=status,
+                retry_after=retry_after,
+            )
+
+        return json.loads(text)
+
+    async def aclose(self):
+        """HTTP 세션 종료"""
+        if self._http is not None:
+            if HTTPX_AVAILABLE:
+                await self._http.aclose()
+            else:
+                await self._http.close()
+            self._http = None
 
     async def complete(
         self,
@@ -197,27 +302,9 @@ class OpenAIClient(BaseLLMClient):
         payload = config.to_openai_dict()
         payload["messages"] = messages
 
-        if HTTPX_AVAILABLE:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
-        else:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.BASE_URL}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                ) as response:
-                    response = response
-
-        if response.status_code != 200:
-            error_text = response.text if hasattr(response, 'text') else await response.text()
-            raise Exception(f"OpenAI API error: {response.status_code} - {error_text}")
-
-        data = response.json()
+        data = await self._post_json(
+            f"{self.BASE_URL}/chat/completions", headers, payload, "OpenAI"
+        )
         latency = (datetime.now() - start_time).total_seconds() * 1000
 
         choice = data["choices"][0]
@@ -254,27 +341,9 @@ class AnthropicClient(BaseLLMClient):
         if config.system_prompt:
             payload["system"] = config.system_prompt
 
-        if HTTPX_AVAILABLE:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/messages",
-                    headers=headers,
-                    json=payload,
-                )
-        else:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.BASE_URL}/messages",
-                    headers=headers,
-                    json=payload,
-                ) as response:
-                    response = response
-
-        if response.status_code != 200:
-            error_text = response.text if hasattr(response, 'text') else await response.text()
-            raise Exception(f"Anthropic API error: {response.status_code} - {error_text}")
-
-        data = response.json()
+        data = await self._post_json(
+            f"{self.BASE_URL}/messages", headers, payload, "Anthropic"
+        )
         latency = (datetime.now() - start_time).total_seconds() * 1000
 
         usage = data.get("usage", {})
@@ -296,8 +365,16 @@ class MockLLMClient(BaseLLMClient):
     API 호출 없이 미리 정의된 응답을 반환합니다.
     """
 
-    def __init__(self, api_key: str = "mock"):
+    def __init__(self, api_key: str = "mock", latency: float = 0.1):
+        """
+        초기화
+
+        Args:
+            api_key: 사용하지 않음
+            latency: 모의 네트워크 지연 (초)
+        """
         super().__init__(api_key)
+        self.latency = latency
         self._responses = {
             "default": "This is a mock response for testing purposes.",
             "sentiment": "The market sentiment appears to be cautiously optimistic.",
@@ -307,10 +384,10 @@ class MockLLMClient(BaseLLMClient):
 
     async def complete(self, prompt: str, config: ModelConfig) -> LLMResponse:
         """Mock 텍스트 완성"""
-        await asyncio.sleep(0.1)  # Simulate network latency
-
         start_time = datetime.now()
 
+        await asyncio.sleep(self.latency)  # Simulate network latency
+
         # 프롬프트에 따라 다른 응답 반환
         content = self._responses["default"]
         prompt_lower = prompt.lower()
@@ -343,6 +420,7 @@ class OllamaClient(BaseLLMClient):
     """
 
     BASE_URL = "http://localhost:11434"
+    REQUEST_TIMEOUT = 120.0
 
     def __init__(self, api_key: str = "ollama", base_url: Optional[str] = None):
         """
@@ -381,27 +459,9 @@ class OllamaClient(BaseLLMClient):
             payload["system"] = config.system_prompt
 
         try:
-            if HTTPX_AVAILABLE:
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    response = await client.post(
-                        f"{self.base_url}/api/generate",
-                        headers=headers,
-                        json=payload,
-                    )
-            else:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        f"{self.base_url}/api/generate",
-                        headers=headers,
-                        json=payload,
-                    ) as response:
-                        response = response
-
-            if response.status_code != 200:
-                error_text = response.text if hasattr(response, 'text') else await response.text()
-                raise Exception(f"Ollama API error: {response.status_code} - {error_text}")
-
-            data = response.json()
+            data = await self._post_json(
+                f"{self.base_url}/api/generate", headers, payload, "Ollama"
+            )
             latency = (datetime.now() - start_time).total_seconds() * 1000
 
             # 토큰 수 추정 (Ollama는 토큰 수를 정확히 제공하지 않음)
@@ -444,6 +504,13 @@ class GLMClient(BaseLLMClient):
         super().__init__(api_key)
         self._logger = logging.getLogger(__name__) if "logging" in globals() else None
 
+    def _format_error(self, error_text: str) -> str:
+        """GLM 에러 메시지 분석"""
+        try:
+            return json.loads(error_text).get("error", {}).get("message", error_text)
+        except (ValueError, AttributeError):
+            return error_text
+
     async def complete(self, prompt: str, config: ModelConfig) -> LLMResponse:
         """GLM 텍스트 완성"""
         start_time = datetime.now()
@@ -468,35 +535,7 @@ class GLMClient(BaseLLMClient):
         }
 
         try:
-            if HTTPX_AVAILABLE:
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    response = await client.post(
-                        self.BASE_URL,
-                        headers=headers,
-                        json=payload,
-                    )
-            else:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        self.BASE_URL,
-                        headers=headers,
-                        json=payload,
-                    ) as response:
-                        response = response
-
-            if response.status_code != 200:
-                error_text = response.text if hasattr(response, 'text') else await response.text()
-                # GLM 에러 메시지 분석
-                error_data = {}
-                try:
-                    error_data = response.json() if isinstance(error_text, str) else error_text
-                except:
-                    pass
-
-                error_msg = error_data.get("error", {}).get("message", error_text)
-                raise Exception(f"GLM API error: {response.status_code} - {error_msg}")
-
-            data = response.json()
+            data = await self._post_json(self.BASE_URL, headers, payload, "GLM")
             latency = (datetime.now() - start_time).total_seconds() * 1000
 
             choice = data["choices"][0]
@@ -517,19 +556,81 @@ class GLMClient(BaseLLMClient):
             raise
 
 
+class GeminiLLMClient(BaseLLMClient):
+    """
+    Google Gemini 클라이언트
+
+    google-generativeai SDK의 네이티브 비동기 호출(generate_content_async)을 사용합니다.
+    """
+
+    def __init__(self, api_key: str):
+        """
+        초기화
+
+        Args:
+            api_key: Gemini API 키
+        """
+        if not GENAI_AVAILABLE:
+            raise ImportError("google-generativeai not installed. Install with: pip install google-generativeai")
+        super().__init__(api_key)
+        genai.configure(api_key=api_key)
+
+    async def complete(self, prompt: str, config: ModelConfig) -> LLMResponse:
+        """Gemini 텍스트 완성"""
+        start_time = datetime.now()
+
+        model = genai.GenerativeModel(
+            config.model,
+            system_instruction=config.system_prompt or None,
+            generation_config={
+                "max_output_tokens": config.max_tokens,
+                "temperature": config.temperature,
+                "top_p": config.top_p,
+            },
+        )
+        response = await model.generate_content_async(prompt)
+        latency = (datetime.now() - start_time).total_seconds() * 1000
+
+        usage = getattr(response, "usage_metadata", None)
+        finish_reason = ""
+        if getattr(response, "candidates", None):
+            reason = response.candidates[0].finish_reason
+            finish_reason = getattr(reason, "name", str(reason))
+
+        return LLMResponse(
+            content=response.text,
+            model=config.model,
+            provider=ModelProvider.GEMINI,
+            tokens_used=getattr(usage, "total_token_count", 0) if usage else 0,
+            latency_ms=int(latency),
+            finish_reason=finish_reason,
+        )
+
+
 class LLMProvider:
     """
     통합 LLM Provider
 
     여러 LLM 제공자를 일관된 인터페이스로 사용할 수 있습니다.
+    모든 호출은 LLMGateway를 거쳐 제공자별 동시성/TPM 예산/재시도가 적용되며,
+    fallback 설정이 있으면 primary가 p95 지연을 넘길 때 hedged request를 보냅니다.
     """
 
-    def __init__(self, default_config: Optional[ModelConfig] = None):
+    def __init__(
+        self,
+        default_config: Optional[ModelConfig] = None,
+        fallback_config: Optional[ModelConfig] = None,
+        gateway: Optional[LLMGateway] = None,
+        replay: Optional[LLMReplayCache] = None
+    ):
         """
         초기화
 
         Args:
             default_config: 기본 모델 설정
+            fallback_config: 기본 hedge/failover 모델 설정 (없으면 hedge 안 함)
+            gateway: LLM 게이트웨이 (없으면 프로세스 공용 게이트웨이)
+            replay: 응답 기록/재생 캐시 (없으면 LLM_REPLAY_MODE 기반 공용 캐시)
         """
         self.default_config = default_config or ModelConfig(
             model="GLM-4.7",  # GLM-4.7 reasoning model (consistent with glm_client.py)
@@ -542,6 +643,11 @@ class LLMProvider:
         self._openai_key = os.getenv("OPENAI_API_KEY", "")
         self._anthropic_key = os.getenv("ANTHROPIC_API_KEY", "")
         self._glm_key = os.getenv("GLM_API_KEY", "") or os.getenv("ZAI_API_KEY", "")
+        self._gemini_key = os.getenv("GEMINI_API_KEY", "")
+
+        self.fallback_config = fallback_config
+        self.gateway = gateway or get_llm_gateway()
+        self.replay = replay if replay is not None else get_llm_replay_cache()
 
         # 클라이언트 초기화
         self._clients: Dict[ModelProvider, BaseLLMClient] = {}
@@ -568,16 +674,66 @@ class LLMProvider:
             if not self._glm_key:
                 raise ValueError("GLM_API_KEY or ZAI_API_KEY not found in environment")
             client = GLMClient(self._glm_key)
+        elif provider == ModelProvider.GEMINI:
+            if not self._gemini_key:
+                raise ValueError("GEMINI_API_KEY not found in environment")
+            client = GeminiLLMClient(self._gemini_key)
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
         self._clients[provider] = client
         return client
 
+    def _request(self, prompt: str, config: ModelConfig):
+        """게이트웨이를 거치는 요청 코루틴 팩토리"""
+        async def call_api() -> LLMResponse:
+            client = self._get_client(config.provider)
+            return await self.gateway.call(
+                config.provider,
+                lambda: client.complete(prompt, config),
+                estimated_tokens=estimate_tokens(prompt + (config.system_prompt or ""), config.max_tokens),
+                tokens_used=lambda response: response.tokens_used,
+            )
+
+        async def run() -> LLMResponse:
+            if not self.replay.enabled:
+                return await call_api()
+            return await self.replay.call(
+                self._replay_request(prompt, config),
+                call_api,
+                encode=LLMResponse.to_dict,
+                decode=self._replayed_response,
+            )
+        return run
+
+    @staticmethod
+    def _replay_request(prompt: str, config: ModelConfig) -> Dict[str, Any]:
+        """기록/재생 fingerprint 대상 (응답에 영향을 주는 요청 필드 전부)"""
+        return {
+            "kind": "llm_provider.complete",
+            "provider": config.provider.value,
+            "model": config.model,
+            "system_prompt": config.system_prompt,
+            "prompt": prompt,
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+            "top_p": config.top_p,
+            "frequency_penalty": config.frequency_penalty,
+            "presence_penalty": config.presence_penalty,
+        }
+
+    @staticmethod
+    def _replayed_response(data: Dict[str, Any]) -> LLMResponse:
+        response = LLMResponse.from_dict(data)
+        response.metadata["replayed"] = True
+        return response
+
     async def complete(
         self,
         prompt: str,
-        config: Optional[ModelConfig] = None
+        config: Optional[ModelConfig] = None,
+        fallback_config: Optional[ModelConfig] = None,
+        hedge_after: Optional[float] = None
     ) -> LLMResponse:
         """
         텍스트 완성
@@ -585,19 +741,33 @@ class LLMProvider:
         Args:
             prompt: 사용자 프롬프트
             config: 모델 설정 (없으면 기본 설정 사용)
+            fallback_config: hedge/failover 모델 설정 (없으면 기본 fallback 사용)
+            hedge_after: hedge 발동 대기 (초, 없으면 primary 제공자의 p95 지연)
 
         Returns:
             LLMResponse: 생성 결과
         """
         cfg = config or self.default_config
-        client = self._get_client(cfg.provider)
-        return await client.complete(prompt, cfg)
+        fallback = fallback_config or self.fallback_config
+        primary = self._request(prompt, cfg)
+
+        if fallback is None or (fallback.provider, fallback.model) == (cfg.provider, cfg.model):
+            return await primary()
+
+        if cfg.system_prompt and not fallback.system_prompt:
+            fallback = replace(fallback, system_prompt=cfg.system_prompt)
+
+        return await self.gateway.hedge(
+            cfg.provider, primary, self._request(prompt, fallback), hedge_after=hedge_after
+        )
 
     async def complete_with_system(
         self,
         system_prompt: str,
         user_prompt: str,
-        config: Optional[ModelConfig] = None
+        config: Optional[ModelConfig] = None,
+        fallback_config: Optional[ModelConfig] = None,
+        hedge_after: Optional[float] = None
     ) -> LLMResponse:
         """
         시스템 프롬프트와 함께 텍스트 완성
@@ -606,13 +776,30 @@ class LLMProvider:
             system_prompt: 시스템 프롬프트
             user_prompt: 사용자 프롬프트
             config: 모델 설정 (없으면 기본 설정 사용)
+            fallback_config: hedge/failover 모델 설정
+            hedge_after: hedge 발동 대기 (초)
 
         Returns:
             LLMResponse: 생성 결과
         """
-        cfg = config or self.default_config
-        client = self._get_client(cfg.provider)
-        return await client.complete_with_system(system_prompt, user_prompt, cfg)
+        # 공유 설정(default_config 등)을 변경하지 않도록 복사본에 시스템 프롬프트 지정
+        cfg = replace(config or self.default_config, system_prompt=system_prompt)
+        fallback = fallback_config or self.fallback_config
+        if fallback is not None:
+            fallback = replace(fallback, system_prompt=system_prompt)
+        return await self.complete(user_prompt, cfg, fallback_config=fallback, hedge_after=hedge_after)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """게이트웨이 통계 (제공자별 동시성/토큰/지연 + hedging) + 기록/재생 히트율"""
+        stats = self.gateway.get_stats()
+        if self.replay.enabled:
+            stats["replay"] = self.replay.get_stats()
+        return stats
+
+    async def aclose(self):
+        """클라이언트 HTTP 세션 종료"""
+        for client in self._clients.values():
+            await client.aclose()
 
     def create_stage1_config(self) -> ModelConfig:
         """
@@ -677,6 +864,23 @@ class LLMProvider:
             temperature=0.7,
         )
 
+    def create_gemini_config(self, model: str = "gemini-2.5-flash") -> ModelConfig:
+        """
+        Gemini 설정
+
+        Args:
+            model: Gemini 모델 이름 (gemini-2.5-flash, gemini-2.5-flash-lite, etc.)
+
+        Returns:
+            ModelConfig: Gemini 설정
+        """
+        return ModelConfig(
+            model=model,
+            provider=ModelProvider.GEMINI,
+            max_tokens=2000,
+            temperature=0.7,
+        )
+
     def create_glm_config(self, model: str = "glm-4.7") -> ModelConfig:
         """
         GLM-4.7 설정
@@ -0,0 +1,260 @@
+"""
+LLM Replay Cache - LLM 응답 기록/재생 (결정적, 비용 0 백테스트/테스트)
+
+백테스트/테스트에서 LLM 을 부르는 컴포넌트 (LLMProvider, AIClientFactory 클라이언트,
+ConsensusEngine 투표) 가 매번 유료 API 를 다시 호출하거나 mock 생성기로 대체하던 것을,
+요청 fingerprint → 응답을 로컬 content-addressed 저장소에 기록해 재생하도록 합니다.
+
+- fingerprint: 요청 내용 (kind, 제공자, 모델, 프롬프트, 시스템 프롬프트, 샘플링 파라미터)
+  의 정규화 JSON SHA-256 → 같은 요청이면 같은 키
+- 저장: <root>/<fp[:2]>/<fp>.json (원자적 쓰기, 요청 원문 포함 → 감사/디버깅)
+- 모드 (LLM_REPLAY_MODE):
+  * off            : 비활성 (기본)
+  * record         : 항상 API 호출, 응답 기록 (덮어쓰기)
+  * replay         : 기록된 응답만 사용, 없으면 LLMReplayMissError (API 호출 없음)
+  * record_missing : 기록 있으면 재생, 없으면 API 호출 후 기록
+- get_stats(): 히트/미스/기록/API 호출 수 + 히트율 (전체, 모델별)
+
+Usage:
+    replay = LLMReplayCache(LLMReplayStore("data/llm_replay"), mode=ReplayMode.RECORD_MISSING)
+    provider = LLMProvider(replay=replay)
+    client = AIClientFactory.create("gemini-1.5-pro", replay=replay)
+
+    # 환경 변수로 프로세스 전체 적용
+    LLM_REPLAY_MODE=replay LLM_REPLAY_DIR=data/llm_replay python -m backend.backtesting.ai_strategy_backtest
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from backend.ai.llm_gateway import LLMAPIError
+
+logger = logging.getLogger(__name__)
+
+# 요청/응답 직렬화 형식이 바뀌면 올립니다 (기존 기록과 fingerprint 가 달라짐)
+REPLAY_FORMAT_VERSION = "llm-replay-v1"
+
+
+class ReplayMode(Enum):
+    """기록/재생 모드"""
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+    RECORD_MISSING = "record_missing"
+
+
+class LLMReplayMissError(LLMAPIError):
+    """replay 모드에서 기록된 응답이 없음 (API 는 호출하지 않음)"""
+
+    def __init__(self, fingerprint: str, scope: str):
+        super().__init__(f"No recorded LLM response for {scope} ({fingerprint[:12]})")
+        self.fingerprint = fingerprint
+        self.scope = scope
+
+
+def request_fingerprint(request: Dict[str, Any]) -> str:
+    """요청 dict → SHA-256 (키 정렬 JSON, 형식 버전 포함)"""
+    payload = json.dumps(
+        {"format": REPLAY_FORMAT_VERSION, **request},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMReplayStore:
+    """
+    content-addressed 응답 저장소 (fingerprint → JSON 파일)
+
+    최근 읽은 응답은 메모리에 보관합니다 (LRU, max_memory_entries).
+    """
+
+    def __init__(self, root: Union[str, Path], max_memory_entries: int = 10000):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+
+    def _path(self, fingerprint: str) -> Path:
+        return self.root / fingerprint[:2] / f"{fingerprint}.json"
+
+    def get(self, fingerprint: str) -> Optional[Any]:
+        """기록된 응답 (없으면 None)"""
+        if fingerprint in self._memory:
+            self._memory.move_to_end(fingerprint)
+            return self._memory[fingerprint]
+
+        path = self._path(fingerprint)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Unreadable LLM replay entry {path.name}: {e}")
+            return None
+        self._remember(fingerprint, entry["response"])
+        return entry["response"]
+
+    def put(self, fingerprint: str, request: Dict[str, Any], response: Any):
+        """응답 기록 (임시 파일 → rename)"""
+        path = self._path(fingerprint)
+        path.parent.mkdir(exist_ok=True)
+        entry = {
+            "fingerprint": fingerprint,
+            "format": REPLAY_FORMAT_VERSION,
+            "recorded_at": datetime.now().isoformat(),
+            "request": request,
+            "response": response,
+        }
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+        self._remember(fingerprint, response)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._memory or self._path(fingerprint).exists()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.root.glob("*/*.json"))
+
+    def _remember(self, fingerprint: str, response: Any):
+        self._memory[fingerprint] = response
+        self._memory.move_to_end(fingerprint)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+
+class LLMReplayCache:
+    """
+    LLM 호출 기록/재생 래퍼
+
+    call() 에 요청 dict 와 실제 호출 코루틴 팩토리를 넘기면 모드에 따라
+    저장소에서 재생하거나 API 를 호출해 기록합니다. 같은 fingerprint 의
+    동시 미스는 API 를 한 번만 호출합니다.
+    """
+
+    def __init__(self, store: Optional[LLMReplayStore] = None, mode: Union[ReplayMode, str] = ReplayMode.OFF):
+        self.mode = ReplayMode(mode)
+        if self.mode != ReplayMode.OFF and store is None:
+            raise ValueError(f"LLM replay mode '{self.mode.value}' requires a store")
+        self.store = store
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "recorded": 0,
+            "api_calls": 0,
+            "replay_misses": 0,
+        }
+        self._scope_stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != ReplayMode.OFF
+
+    async def call(
+        self,
+        request: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value,
+    ) -> Any:
+        """
+        기록/재생 호출
+
+        Args:
+            request: 요청 내용 (fingerprint 대상, JSON 직렬화 가능해야 함)
+            fetch: 실제 API 호출 코루틴 팩토리
+            encode: 응답 → 저장용 JSON 값
+            decode: 저장된 JSON 값 → 응답
+
+        Raises:
+            LLMReplayMissError: replay 모드에서 기록 없음
+        """
+        if not self.enabled:
+            return await fetch()
+
+        fingerprint = request_fingerprint(request)
+        scope = str(request.get("model") or request.get("kind") or "unknown")
+
+        if self.mode != ReplayMode.RECORD:
+            recorded = self.store.get(fingerprint)
+            if recorded is not None:
+                self._count(scope, "hits")
+                return decode(recorded)
+            self._count(scope, "misses")
+            if self.mode == ReplayMode.REPLAY:
+                self.stats["replay_misses"] += 1
+                raise LLMReplayMissError(fingerprint, scope)
+
+        pending = self._inflight.get(fingerprint)
+        if pending is not None:
+            return decode(await asyncio.shield(pending))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[fingerprint] = future
+        try:
+            self.stats["api_calls"] += 1
+            response = await fetch()
+            encoded = encode(response)
+            self.store.put(fingerprint, request, encoded)
+            self.stats["recorded"] += 1
+            future.set_result(encoded)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 경고 없이 소비
+            raise
+        finally:
+            self._inflight.pop(fingerprint, None)
+
+    def _count(self, scope: str, key: str):
+        self.stats[key] += 1
+        scope_stats = self._scope_stats.setdefault(scope, {"hits": 0, "misses": 0})
+        scope_stats[key] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "mode": self.mode.value,
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "by_model": {
+                scope: {**s, "hit_rate": s["hits"] / (s["hits"] + s["misses"]) if s["hits"] + s["misses"] else 0.0}
+                for scope, s in self._scope_stats.items()
+            },
+            "root": str(self.store.root) if self.store else None,
+        }
+
+
+# 싱글톤 인스턴스 (LLM_REPLAY_MODE / LLM_REPLAY_DIR)
+_llm_replay_instance: Optional[LLMReplayCache] = None
+
+
+def get_llm_replay_cache() -> LLMReplayCache:
+    """LLM Replay Cache 싱글톤 반환 (기본 off)"""
+    global _llm_replay_instance
+    if _llm_replay_instance is None:
+        mode = ReplayMode(os.getenv("LLM_REPLAY_MODE", ReplayMode.OFF.value).lower())
+        store = None
+        if mode != ReplayMode.OFF:
+            store = LLMReplayStore(os.getenv("LLM_REPLAY_DIR", "data/llm_replay"))
+            logger.info(f"LLM replay enabled: mode={mode.value}, dir={store.root}")
+        _llm_replay_instance = LLMReplayCache(store, mode)
+    return _llm_replay_instance
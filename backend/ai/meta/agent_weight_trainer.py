@@ -9,6 +9,14 @@ Phase F1: AI 집단지성 고도화
 가중치 조정 공식:
 new_weight = (win_rate * 0.5) + (avg_return * 0.3) - (max_drawdown * 0.2)
 
+성과 통계 (2026-10-18):
+- 전체 거래 기록 재필터링/재계산 대신 OnlineAgentStats (시간 감쇠 Welford 누적기)
+  → record_outcome O(1) 갱신, 메트릭/가중치 조회 O(1)
+- lookback_days 하드 창 대신 지수 감쇠 (τ = lookback_days)
+- 에이전트 전체 / 티커 / 레짐별 통계
+- 압축 상태(agent_stats_state.json) 저장, 거래 기록은 append-only (감사용)
+- update_on_record=True 이면 거래 종료마다 해당 에이전트 가중치 갱신
+
 작성일: 2025-12-08
 참조: 10_Ideas_Integration_Plan_v3.md
 """
@@ -21,6 +29,8 @@ import logging
 import json
 from pathlib import Path
 
+from backend.ai.meta.online_agent_stats import MIN_EFFECTIVE_WEIGHT, OnlineAgentStats
+
 logger = logging.getLogger(__name__)
 
 
@@ -140,8 +150,9 @@ class AgentWeightTrainer:
         # 가중치 재계산
         weights = trainer.recalculate_weights()
         
-        # 에이전트별 성과 조회
+        # 에이전트별 성과 조회 (티커/레짐별도 가능)
         metrics = trainer.get_agent_metrics("claude")
+        metrics = trainer.get_agent_metrics("claude", ticker="NVDA")
     """
     
     # 가중치 조정 상수
@@ -156,27 +167,32 @@ class AgentWeightTrainer:
     
     # EMA 학습률
     LEARNING_RATE = 0.1
+    # 거래 종료마다 갱신할 때의 학습률 (배치 재계산보다 훨씬 자주 적용되므로 작게)
+    PER_TRADE_LEARNING_RATE = 0.02
+    
+    STATE_FILE = "agent_stats_state.json"
     
     def __init__(
         self,
         agents: Optional[List[str]] = None,
         storage_path: Optional[Path] = None,
-        lookback_days: int = 30
+        lookback_days: int = 30,
+        update_on_record: bool = False
     ):
         """
         Args:
             agents: 관리할 에이전트 목록
             storage_path: 데이터 저장 경로
-            lookback_days: 성과 분석 기간 (일)
+            lookback_days: 성과 분석 기간 (일) - 통계 감쇠 시간 상수 (0 이면 감쇠 없음)
+            update_on_record: 거래 결과 기록 시 해당 에이전트 가중치 즉시 갱신
         """
         self.agents = agents or ["claude", "chatgpt", "gemini"]
         self.storage_path = storage_path
         self.lookback_days = lookback_days
+        self.update_on_record = update_on_record
         
-        # 거래 기록
-        self._outcomes: Dict[str, List[TradeOutcome]] = {
-            agent: [] for agent in self.agents
-        }
+        # 증분 성과 통계 (거래 기록 전체를 메모리에 두지 않음)
+        self._stats = OnlineAgentStats(decay_days=lookback_days)
         
         # 성과 메트릭
         self._metrics: Dict[str, AgentPerformanceMetrics] = {}
@@ -207,10 +223,12 @@ class AgentWeightTrainer:
         outcome: str,
         pnl_amount: float,
         pnl_percentage: float,
-        confidence: float
+        confidence: float,
+        regime: Optional[str] = None,
+        timestamp: Optional[datetime] = None
     ):
         """
-        거래 결과 기록
+        거래 결과 기록 (O(1) 통계 갱신)
         
         Args:
             agent_name: 에이전트 이름
@@ -220,12 +238,11 @@ class AgentWeightTrainer:
             pnl_amount: 손익 금액
             pnl_percentage: 손익률
             confidence: 투표 시 신뢰도
+            regime: 시장 레짐 (레짐별 통계용, 선택)
+            timestamp: 거래 종료 시각 (기본: 현재)
         """
-        if agent_name not in self._outcomes:
-            self._outcomes[agent_name] = []
-        
         trade = TradeOutcome(
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             ticker=ticker,
             agent_vote=vote.upper(),
             actual_outcome=outcome.upper(),
@@ -234,16 +251,48 @@ class AgentWeightTrainer:
             confidence_at_vote=confidence
         )
         
-        self._outcomes[agent_name].append(trade)
+        self._record_trade(agent_name, trade, regime)
         
         logger.debug(
             f"Recorded outcome for {agent_name}: {ticker} {vote} -> {outcome} "
             f"(PnL: {pnl_percentage:.2f}%)"
         )
         
-        # 저장
+        # 저장 (거래 1줄 append + 압축 상태)
+        if self.storage_path:
+            self._append_outcome(agent_name, trade, regime)
+            self._save_state()
+        
+        # 거래 종료마다 가중치 갱신
+        if self.update_on_record and agent_name in self.agents:
+            self._update_agent_weight(agent_name, self.PER_TRADE_LEARNING_RATE)
+    
+    def _record_trade(self, agent_name: str, trade: TradeOutcome, regime: Optional[str] = None):
+        self._stats.record(
+            agent=agent_name,
+            ticker=trade.ticker,
+            regime=regime,
+            timestamp=trade.timestamp,
+            return_pct=trade.pnl_percentage,
+            win=trade.pnl_amount > 0,
+            loss=trade.pnl_amount < 0,
+            correct=trade.was_correct(),
+            confidence=trade.confidence_at_vote
+        )
+        # 캐시된 메트릭 무효화 (다음 조회 시 O(1) 재계산)
+        self._metrics.pop(agent_name, None)
+    
+    def _update_agent_weight(self, agent_name: str, learning_rate: float) -> float:
+        """에이전트 1명 가중치 갱신 (O(1))"""
+        metrics = self._calculate_metrics(agent_name)
+        new_weight = self._calculate_weight(metrics, learning_rate)
+        metrics.recommended_weight = new_weight
+        self._metrics[agent_name] = metrics
+        self._weights[agent_name] = new_weight
+        
         if self.storage_path:
-            self._save_outcomes()
+            self._save_weights()
+        return new_weight
     
     def recalculate_weights(
         self,
@@ -291,69 +340,69 @@ class AgentWeightTrainer:
         
         return new_weights
     
-    def _calculate_metrics(self, agent_name: str) -> AgentPerformanceMetrics:
-        """에이전트 성과 메트릭 계산"""
-        outcomes = self._outcomes.get(agent_name, [])
+    def _calculate_metrics(
+        self,
+        agent_name: str,
+        ticker: Optional[str] = None,
+        regime: Optional[str] = None
+    ) -> AgentPerformanceMetrics:
+        """
+        에이전트 성과 메트릭 계산 (증분 통계 조회, O(1))
         
-        # 기간 필터링
-        cutoff = datetime.now() - timedelta(days=self.lookback_days)
-        recent_outcomes = [o for o in outcomes if o.timestamp >= cutoff]
+        거래 수/승패는 감쇠 가중 유효 건수(반올림)이며, 비율 지표는 감쇠 가중 평균입니다.
+        """
+        now = datetime.now()
+        cutoff = now - timedelta(days=self.lookback_days)
         
         metrics = AgentPerformanceMetrics(
             agent_name=agent_name,
             period_start=cutoff,
-            period_end=datetime.now(),
+            period_end=now,
             current_weight=self._weights.get(agent_name, self.DEFAULT_WEIGHT)
         )
         
-        if not recent_outcomes:
+        view = self._stats.view(agent_name, ticker=ticker, regime=regime, now=now)
+        if view is None or view["weight"] < MIN_EFFECTIVE_WEIGHT:
             return metrics
         
+        weight = view["weight"]
+        
         # 기본 통계
-        metrics.total_trades = len(recent_outcomes)
-        metrics.winning_trades = sum(1 for o in recent_outcomes if o.pnl_amount > 0)
-        metrics.losing_trades = sum(1 for o in recent_outcomes if o.pnl_amount < 0)
+        metrics.total_trades = max(1, round(weight))
+        metrics.winning_trades = round(view["wins"])
+        metrics.losing_trades = round(view["losses"])
         
         # 승률
-        if metrics.total_trades > 0:
-            metrics.win_rate = metrics.winning_trades / metrics.total_trades
+        metrics.win_rate = view["wins"] / weight
         
         # 수익률 통계
-        returns = [o.pnl_percentage for o in recent_outcomes]
-        if returns:
-            metrics.avg_return = sum(returns) / len(returns)
-            metrics.total_return = sum(returns)
-            
-            # 최대 손실 (Max Drawdown 근사)
-            negative_returns = [r for r in returns if r < 0]
-            metrics.max_drawdown = abs(min(negative_returns)) if negative_returns else 0.0
-            
-            # 샤프 비율 (간소화)
-            if len(returns) > 1:
-                import statistics
-                try:
-                    std_dev = statistics.stdev(returns)
-                    if std_dev > 0:
-                        metrics.sharpe_ratio = metrics.avg_return / std_dev
-                except:
-                    pass
+        metrics.avg_return = view["mean"]
+        metrics.total_return = view["mean"] * weight
+        
+        # 최대 손실 (감쇠 최대 손실)
+        metrics.max_drawdown = view["worst_loss"]
+        
+        # 샤프 비율 (간소화)
+        if view["std"] > 0:
+            metrics.sharpe_ratio = metrics.avg_return / view["std"]
         
         # 예측 정확도
-        correct = sum(1 for o in recent_outcomes if o.was_correct())
-        metrics.prediction_accuracy = correct / len(recent_outcomes)
+        metrics.prediction_accuracy = view["correct"] / weight
         
         # 신뢰도 보정
-        confidences = [o.confidence_at_vote for o in recent_outcomes]
-        if confidences:
-            metrics.avg_confidence = sum(confidences) / len(confidences)
-            if metrics.avg_confidence > 0:
-                metrics.confidence_calibration = (
-                    metrics.prediction_accuracy / metrics.avg_confidence
-                )
+        metrics.avg_confidence = view["confidence"] / weight
+        if metrics.avg_confidence > 0:
+            metrics.confidence_calibration = (
+                metrics.prediction_accuracy / metrics.avg_confidence
+            )
         
         return metrics
     
-    def _calculate_weight(self, metrics: AgentPerformanceMetrics) -> float:
+    def _calculate_weight(
+        self,
+        metrics: AgentPerformanceMetrics,
+        learning_rate: Optional[float] = None
+    ) -> float:
         """
         성과 기반 가중치 계산
         
@@ -381,10 +430,11 @@ class AgentWeightTrainer:
         base_weight *= calibration_factor
         
         # EMA 방식으로 기존 가중치와 혼합
+        lr = self.LEARNING_RATE if learning_rate is None else learning_rate
         current = metrics.current_weight
         new_weight = (
-            (1 - self.LEARNING_RATE) * current +
-            self.LEARNING_RATE * (base_weight * 2)  # 2를 곱해 1.0 기준으로 스케일링
+            (1 - lr) * current +
+            lr * (base_weight * 2)  # 2를 곱해 1.0 기준으로 스케일링
         )
         
         # 범위 제한
@@ -411,9 +461,13 @@ class AgentWeightTrainer:
     
     def get_agent_metrics(
         self, 
-        agent_name: str
+        agent_name: str,
+        ticker: Optional[str] = None,
+        regime: Optional[str] = None
     ) -> Optional[AgentPerformanceMetrics]:
-        """에이전트 성과 메트릭 조회"""
+        """에이전트 성과 메트릭 조회 (ticker/regime 지정 시 해당 범위 통계)"""
+        if ticker or regime:
+            return self._calculate_metrics(agent_name, ticker=ticker, regime=regime)
         if agent_name not in self._metrics:
             self._metrics[agent_name] = self._calculate_metrics(agent_name)
         return self._metrics.get(agent_name)
@@ -470,25 +524,29 @@ class AgentWeightTrainer:
                 "updated_at": datetime.now().isoformat()
             }, f, indent=2)
     
-    def _save_outcomes(self):
-        """거래 결과 저장"""
+    def _append_outcome(self, agent_name: str, trade: TradeOutcome, regime: Optional[str] = None):
+        """거래 결과 1줄 append (감사/재생용, 통계 복원에는 압축 상태 사용)"""
+        record = {
+            "timestamp": trade.timestamp.isoformat(),
+            "ticker": trade.ticker,
+            "vote": trade.agent_vote,
+            "outcome": trade.actual_outcome,
+            "pnl_amount": trade.pnl_amount,
+            "pnl_percentage": trade.pnl_percentage,
+            "confidence": trade.confidence_at_vote
+        }
+        if regime:
+            record["regime"] = regime
+        
+        file_path = self.storage_path / f"outcomes_{agent_name}.jsonl"
+        with open(file_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    
+    def _save_state(self):
+        """증분 통계 압축 상태 저장"""
         if not self.storage_path:
             return
-        
-        for agent, outcomes in self._outcomes.items():
-            file_path = self.storage_path / f"outcomes_{agent}.jsonl"
-            with open(file_path, "w", encoding="utf-8") as f:
-                for outcome in outcomes:
-                    record = {
-                        "timestamp": outcome.timestamp.isoformat(),
-                        "ticker": outcome.ticker,
-                        "vote": outcome.agent_vote,
-                        "outcome": outcome.actual_outcome,
-                        "pnl_amount": outcome.pnl_amount,
-                        "pnl_percentage": outcome.pnl_percentage,
-                        "confidence": outcome.confidence_at_vote
-                    }
-                    f.write(json.dumps(record) + "\n")
+        self._stats.save(self.storage_path / self.STATE_FILE)
     
     def _load_existing_data(self):
         """기존 데이터 로드"""
@@ -504,25 +562,41 @@ class AgentWeightTrainer:
                 self._weight_history = data.get("history", [])
             logger.info(f"Loaded weights: {self._weights}")
         
-        # 거래 결과 로드
-        for agent in self.agents:
-            file_path = self.storage_path / f"outcomes_{agent}.jsonl"
-            if file_path.exists():
-                outcomes = []
-                with open(file_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        record = json.loads(line.strip())
-                        outcomes.append(TradeOutcome(
-                            timestamp=datetime.fromisoformat(record["timestamp"]),
-                            ticker=record["ticker"],
-                            agent_vote=record["vote"],
-                            actual_outcome=record["outcome"],
-                            pnl_amount=record["pnl_amount"],
-                            pnl_percentage=record["pnl_percentage"],
-                            confidence_at_vote=record["confidence"]
-                        ))
-                self._outcomes[agent] = outcomes
-                logger.info(f"Loaded {len(outcomes)} outcomes for {agent}")
+        # 증분 통계 상태 로드
+        state_file = self.storage_path / self.STATE_FILE
+        if state_file.exists():
+            try:
+                self._stats = OnlineAgentStats.load(state_file, decay_days=self.lookback_days)
+                logger.info(f"Loaded agent stats state: {len(self._stats)} accumulators")
+                return
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Agent stats state unreadable, replaying outcomes: {e}")
+                self._stats = OnlineAgentStats(decay_days=self.lookback_days)
+        
+        # 상태 파일이 없으면 (이전 버전) 거래 기록을 한 번 재생해 상태 생성
+        replayed = 0
+        for file_path in sorted(self.storage_path.glob("outcomes_*.jsonl")):
+            agent = file_path.stem[len("outcomes_"):]
+            with open(file_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    trade = TradeOutcome(
+                        timestamp=datetime.fromisoformat(record["timestamp"]),
+                        ticker=record["ticker"],
+                        agent_vote=record["vote"],
+                        actual_outcome=record["outcome"],
+                        pnl_amount=record["pnl_amount"],
+                        pnl_percentage=record["pnl_percentage"],
+                        confidence_at_vote=record["confidence"]
+                    )
+                    self._record_trade(agent, trade, record.get("regime"))
+                    replayed += 1
+        
+        if replayed:
+            self._save_state()
+            logger.info(f"Replayed {replayed} outcomes into agent stats state")
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -16,9 +16,14 @@ AI들의 토론 과정과 결과를 구조화하여 저장하고,
 
 작성일: 2025-12-08
 참조: 10_Ideas_Integration_Plan_v3.md
+
+저장소 (2026-10-18):
+- append-only JSONL 세그먼트 + 오프셋 인덱스 (debate_segment_log.py)
+- 에이전트 / 합의 강도 / 티커 집계는 기록 시점에 증분 갱신
+- 기존 토론별 JSON 파일은 최초 로드 시 세그먼트로 이전
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
@@ -26,6 +31,14 @@ import json
 import logging
 from pathlib import Path
 
+from backend.ai.meta.debate_segment_log import (
+    DEFAULT_SEGMENT_MAX_BYTES,
+    OP_DEBATE,
+    DebateAggregates,
+    DebateSegmentLog,
+    DebateSummary,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -213,19 +226,26 @@ class DebateLogger:
     def __init__(
         self,
         storage_path: Optional[Path] = None,
-        max_memory_records: int = 1000
+        max_memory_records: int = 1000,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES
     ):
         """
         Args:
             storage_path: 로그 파일 저장 경로 (None이면 메모리만)
-            max_memory_records: 메모리에 유지할 최대 레코드 수
+            max_memory_records: 메모리에 유지할 최대 레코드 수 (최근 레코드 캐시)
+            segment_max_bytes: 세그먼트 파일 롤링 크기
         """
         self.storage_path = storage_path
         self.max_memory_records = max_memory_records
         
-        # 메모리 저장소
+        # 메모리 저장소 (기록 순서 = 시간 순서, 최근 max_memory_records 건)
         self._records: Dict[str, DebateRecord] = {}
-        self._records_by_ticker: Dict[str, List[str]] = {}
+        
+        # 증분 집계 + 티커/일자 인덱스 (메모리에서 밀려난 레코드 포함)
+        self._aggregates = DebateAggregates()
+        self._log: Optional[DebateSegmentLog] = (
+            DebateSegmentLog(storage_path, segment_max_bytes) if storage_path else None
+        )
         
         # 통계
         self._stats = {
@@ -294,17 +314,15 @@ class DebateLogger:
         # 메모리에 저장
         self._records[record_id] = record
         
-        # 티커별 인덱스
-        if ticker not in self._records_by_ticker:
-            self._records_by_ticker[ticker] = []
-        self._records_by_ticker[ticker].append(record_id)
+        # 파일로 저장 (세그먼트 append) + 티커/집계 인덱스 갱신
+        if self._log is not None:
+            summary = self._log.append_debate(record.to_dict())
+        else:
+            summary = DebateSummary.from_record_dict(record.to_dict())
+        self._aggregates.add_debate(summary)
         
         # 통계 업데이트
-        self._update_stats(record)
-        
-        # 파일로 저장
-        if self.storage_path:
-            self._save_record(record)
+        self._update_stats(summary)
         
         # 메모리 정리
         self._cleanup_memory()
@@ -337,7 +355,7 @@ class DebateLogger:
         Returns:
             bool: 업데이트 성공 여부
         """
-        record = self._records.get(record_id)
+        record = self.get_debate(record_id)
         if not record:
             logger.warning(f"Record not found: {record_id}")
             return False
@@ -353,17 +371,21 @@ class DebateLogger:
         
         record.outcome.outcome_recorded_at = datetime.now()
         
-        # 파일 업데이트
-        if self.storage_path:
-            self._save_record(record)
+        # 파일 업데이트 (outcome 엔트리 append)
+        if self._log is not None:
+            self._log.append_outcome(record_id, record.outcome.to_dict())
+        self._aggregates.set_pnl(record_id, record.outcome.pnl_result)
         
         logger.info(f"Outcome updated: {record_id} | PnL={pnl_result}")
         
         return True
     
     def get_debate(self, record_id: str) -> Optional[DebateRecord]:
-        """ID로 토론 조회"""
-        return self._records.get(record_id)
+        """ID로 토론 조회 (메모리 → 세그먼트 오프셋 읽기)"""
+        record = self._records.get(record_id)
+        if record is None and self._log is not None and record_id in self._log:
+            record = DebateRecord.from_dict(self._log.read(record_id))
+        return record
     
     def get_recent_debates(
         self,
@@ -379,19 +401,20 @@ class DebateLogger:
             limit: 최대 개수
             decision_filter: 결정 유형 필터 (선택)
         """
-        if ticker:
-            record_ids = self._records_by_ticker.get(ticker, [])
-            records = [self._records[rid] for rid in record_ids if rid in self._records]
-        else:
-            records = list(self._records.values())
-        
-        # 필터링
-        if decision_filter:
-            records = [r for r in records if r.outcome.final_decision == decision_filter]
-        
-        # 정렬 및 제한
+        records = []
+        for record_id in reversed(self._aggregates.ids_for_ticker(ticker)):
+            if len(records) >= limit:
+                break
+            summary = self._aggregates.summaries[record_id]
+            if decision_filter and summary.decision != decision_filter.value:
+                continue
+            record = self.get_debate(record_id)
+            if record:
+                records.append(record)
+        
+        # 정렬
         records.sort(key=lambda x: x.timestamp, reverse=True)
-        return records[:limit]
+        return records
     
     def get_debates_with_outcomes(
         self,
@@ -400,18 +423,23 @@ class DebateLogger:
         limit: int = 100
     ) -> List[DebateRecord]:
         """PnL 결과가 있는 토론 조회"""
-        records = [
-            r for r in self._records.values() 
-            if r.outcome.pnl_result is not None
-        ]
-        
-        if min_pnl is not None:
-            records = [r for r in records if r.outcome.pnl_result >= min_pnl]
-        if max_pnl is not None:
-            records = [r for r in records if r.outcome.pnl_result <= max_pnl]
+        records = []
+        for record_id in reversed(self._aggregates.ids_for_ticker()):
+            if len(records) >= limit:
+                break
+            pnl = self._aggregates.summaries[record_id].pnl
+            if pnl is None:
+                continue
+            if min_pnl is not None and pnl < min_pnl:
+                continue
+            if max_pnl is not None and pnl > max_pnl:
+                continue
+            record = self.get_debate(record_id)
+            if record:
+                records.append(record)
         
         records.sort(key=lambda x: x.timestamp, reverse=True)
-        return records[:limit]
+        return records
     
     def get_agent_performance(
         self,
@@ -419,7 +447,7 @@ class DebateLogger:
         days: int = 30
     ) -> Dict[str, Any]:
         """
-        에이전트별 성과 분석
+        에이전트별 성과 분석 (증분 집계 기반)
         
         Args:
             agent_name: 에이전트 이름
@@ -429,42 +457,7 @@ class DebateLogger:
             성과 통계
         """
         cutoff = datetime.now() - timedelta(days=days)
-        
-        records = [
-            r for r in self._records.values()
-            if r.timestamp >= cutoff and r.outcome.pnl_result is not None
-        ]
-        
-        agent_stats = {
-            "total_votes": 0,
-            "correct_predictions": 0,
-            "total_pnl": 0.0,
-            "wins": 0,
-            "losses": 0,
-            "abstains": 0
-        }
-        
-        for record in records:
-            for vote in record.votes:
-                if vote.agent_name == agent_name:
-                    agent_stats["total_votes"] += 1
-                    
-                    if vote.vote == VoteType.ABSTAIN:
-                        agent_stats["abstains"] += 1
-                        continue
-                    
-                    # 예측 정확성 판정
-                    pnl = record.outcome.pnl_result
-                    if pnl > 0:
-                        agent_stats["wins"] += 1
-                        if vote.vote in [VoteType.BUY, VoteType.DCA]:
-                            agent_stats["correct_predictions"] += 1
-                    elif pnl < 0:
-                        agent_stats["losses"] += 1
-                        if vote.vote in [VoteType.SELL, VoteType.STOP_LOSS]:
-                            agent_stats["correct_predictions"] += 1
-                    
-                    agent_stats["total_pnl"] += pnl
+        agent_stats = self._aggregates.agent_performance(agent_name, cutoff)
         
         # 비율 계산
         total = agent_stats["total_votes"] - agent_stats["abstains"]
@@ -480,36 +473,11 @@ class DebateLogger:
         return agent_stats
     
     def get_consensus_analysis(self, days: int = 30) -> Dict[str, Any]:
-        """합의 강도와 성과 간의 관계 분석"""
+        """합의 강도와 성과 간의 관계 분석 (증분 집계 기반)"""
         cutoff = datetime.now() - timedelta(days=days)
         
-        records = [
-            r for r in self._records.values()
-            if r.timestamp >= cutoff and r.outcome.pnl_result is not None
-        ]
-        
         # 합의 강도별 성과
-        strength_buckets = {
-            "low (0.0-0.5)": {"count": 0, "total_pnl": 0, "wins": 0},
-            "medium (0.5-0.8)": {"count": 0, "total_pnl": 0, "wins": 0},
-            "high (0.8-1.0)": {"count": 0, "total_pnl": 0, "wins": 0}
-        }
-        
-        for record in records:
-            strength = record.outcome.consensus_strength
-            pnl = record.outcome.pnl_result
-            
-            if strength < 0.5:
-                bucket = "low (0.0-0.5)"
-            elif strength < 0.8:
-                bucket = "medium (0.5-0.8)"
-            else:
-                bucket = "high (0.8-1.0)"
-            
-            strength_buckets[bucket]["count"] += 1
-            strength_buckets[bucket]["total_pnl"] += pnl
-            if pnl > 0:
-                strength_buckets[bucket]["wins"] += 1
+        strength_buckets = self._aggregates.consensus_analysis(cutoff)
         
         # 비율 계산
         for bucket, stats in strength_buckets.items():
@@ -528,7 +496,7 @@ class DebateLogger:
         format: str = "jsonl"
     ) -> int:
         """
-        학습용 데이터 내보내기
+        학습용 데이터 내보내기 (세그먼트에서 스트리밍)
         
         Args:
             output_path: 출력 파일 경로
@@ -537,109 +505,126 @@ class DebateLogger:
         Returns:
             내보낸 레코드 수
         """
-        records = [r for r in self._records.values() if r.outcome.pnl_result is not None]
+        count = 0
+        with open(output_path, "w", encoding="utf-8") as f:
+            if format != "jsonl":
+                f.write("[\n")
+            for data in self._iter_outcome_records():
+                if format == "jsonl":
+                    f.write(json.dumps(data, ensure_ascii=False) + "\n")
+                else:
+                    item = json.dumps(data, ensure_ascii=False, indent=2)
+                    f.write((",\n" if count else "") + "  " + item.replace("\n", "\n  "))
+                count += 1
+            if format != "jsonl":
+                f.write("\n]" if count else "]")
         
-        if format == "jsonl":
-            with open(output_path, "w", encoding="utf-8") as f:
-                for record in records:
-                    f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
-        else:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    [r.to_dict() for r in records],
-                    f,
-                    ensure_ascii=False,
-                    indent=2
-                )
-        
-        logger.info(f"Exported {len(records)} records to {output_path}")
-        return len(records)
+        logger.info(f"Exported {count} records to {output_path}")
+        return count
     
-    def _update_stats(self, record: DebateRecord):
+    def _iter_outcome_records(self) -> Iterator[Dict[str, Any]]:
+        """PnL 결과가 있는 레코드 dict (저장소가 있으면 세그먼트 스트리밍)"""
+        has_outcome = lambda data: data["outcome"].get("pnl_result") is not None
+        if self._log is not None:
+            yield from self._log.iter_records(has_outcome)
+            return
+        for record in list(self._records.values()):
+            data = record.to_dict()
+            if has_outcome(data):
+                yield data
+    
+    def _update_stats(self, summary: DebateSummary):
         """통계 업데이트"""
         self._stats["total_debates"] += 1
         
         # 결정별
-        decision = record.outcome.final_decision.value
+        decision = summary.decision
         if decision not in self._stats["by_decision"]:
             self._stats["by_decision"][decision] = 0
         self._stats["by_decision"][decision] += 1
         
         # 티커별
-        ticker = record.ticker
+        ticker = summary.ticker
         if ticker not in self._stats["by_ticker"]:
             self._stats["by_ticker"][ticker] = 0
         self._stats["by_ticker"][ticker] += 1
         
         # 에이전트별
-        for vote in record.votes:
-            agent = vote.agent_name
+        for agent, vote_type in summary.votes:
             if agent not in self._stats["by_agent"]:
                 self._stats["by_agent"][agent] = {"total": 0, "votes": {}}
             self._stats["by_agent"][agent]["total"] += 1
             
-            vote_type = vote.vote.value
             if vote_type not in self._stats["by_agent"][agent]["votes"]:
                 self._stats["by_agent"][agent]["votes"][vote_type] = 0
             self._stats["by_agent"][agent]["votes"][vote_type] += 1
     
-    def _save_record(self, record: DebateRecord):
-        """파일로 저장"""
-        if not self.storage_path:
+    def _load_existing_records(self):
+        """
+        기존 레코드 로드
+        
+        인덱스만 읽어 집계/통계를 복원하고, 최근 max_memory_records 건만
+        오프셋 읽기로 메모리에 올립니다.
+        """
+        if self._log is None:
             return
         
-        # 날짜별 디렉토리
-        date_dir = self.storage_path / record.timestamp.strftime("%Y-%m")
-        date_dir.mkdir(exist_ok=True)
+        for op, record_id, payload in self._log.open():
+            if op == OP_DEBATE:
+                if record_id not in self._aggregates.summaries:
+                    self._aggregates.add_debate(payload)
+                    self._update_stats(payload)
+            else:
+                self._aggregates.set_pnl(record_id, payload.get("pnl_result"))
         
-        # 파일 저장
-        file_path = date_dir / f"{record.id}.json"
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(record.to_dict(), f, ensure_ascii=False, indent=2)
-    
-    def _load_existing_records(self):
-        """기존 레코드 로드"""
-        if not self.storage_path or not self.storage_path.exists():
-            return
+        if len(self._log) == 0:
+            self._migrate_legacy_files()
         
-        count = 0
+        recent_ids = self._aggregates.ids_for_ticker()[-self.max_memory_records:]
+        for record_id in recent_ids:
+            try:
+                self._records[record_id] = DebateRecord.from_dict(self._log.read(record_id))
+            except Exception as e:
+                logger.warning(f"Failed to load {record_id}: {e}")
+        
+        logger.info(f"Loaded {len(self._aggregates)} existing debate records ({len(self._records)} in memory)")
+    
+    def _migrate_legacy_files(self):
+        """토론별 JSON 파일(이전 저장 형식)을 세그먼트로 이전"""
+        legacy = []
         for json_file in self.storage_path.rglob("*.json"):
             try:
                 with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                record = DebateRecord.from_dict(data)
-                self._records[record.id] = record
-                
-                if record.ticker not in self._records_by_ticker:
-                    self._records_by_ticker[record.ticker] = []
-                self._records_by_ticker[record.ticker].append(record.id)
-                
-                count += 1
+                    legacy.append(DebateRecord.from_dict(json.load(f)).to_dict())
             except Exception as e:
                 logger.warning(f"Failed to load {json_file}: {e}")
         
-        logger.info(f"Loaded {count} existing debate records")
+        legacy.sort(key=lambda data: data["timestamp"])
+        for data in legacy:
+            summary = self._log.append_debate(data)
+            self._aggregates.add_debate(summary)
+            self._update_stats(summary)
+        
+        if legacy:
+            logger.info(f"Migrated {len(legacy)} legacy debate files to segment log")
     
     def _cleanup_memory(self):
-        """메모리 정리"""
-        if len(self._records) <= self.max_memory_records:
+        """메모리 정리 (가장 오래 전에 기록된 레코드부터 제거)"""
+        to_remove = len(self._records) - self.max_memory_records
+        if to_remove <= 0:
             return
         
-        # 오래된 레코드 제거
-        sorted_records = sorted(
-            self._records.items(),
-            key=lambda x: x[1].timestamp
-        )
-        
-        to_remove = len(self._records) - self.max_memory_records
-        for record_id, _ in sorted_records[:to_remove]:
+        for record_id in list(self._records)[:to_remove]:
             del self._records[record_id]
         
         logger.debug(f"Removed {to_remove} old records from memory")
     
     def get_stats(self) -> Dict[str, Any]:
         """통계 조회"""
-        return self._stats.copy()
+        stats = self._stats.copy()
+        if self._log is not None:
+            stats["storage"] = self._log.get_stats()
+        return stats
 
 
 # ═══════════════════════════════════════════════════════════════
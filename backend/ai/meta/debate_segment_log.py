@@ -0,0 +1,447 @@
+"""
+Debate Segment Log - DebateLogger 저장소 (append-only JSONL 세그먼트 + 오프셋 인덱스)
+
+기존 방식:
+  - 토론 1건 = pretty-printed JSON 파일 1개, PnL 업데이트 시 파일 전체 재작성
+  - 시작 시 모든 파일을 읽어 DebateRecord 로 복원
+  - get_agent_performance / get_consensus_analysis 호출마다 전체 레코드 재스캔
+
+개선:
+  - segments/debates-000001.jsonl ... : 토론 / outcome 업데이트를 한 줄씩 append (롤링)
+  - index.jsonl: 엔트리마다 (세그먼트, 바이트 오프셋, 길이) + 요약(티커, 시각, 결정, 합의 강도, 투표)
+    → 시작 시 인덱스만 읽어 집계 복원, 본문은 필요할 때 seek 로 1건씩 읽음
+  - 인덱스보다 세그먼트가 앞서 있으면(인덱스 기록 전 중단) 꼬리만 재스캔해 복구
+  - DebateAggregates: 에이전트별 / 합의 강도 구간별 일 단위 집계를 기록 시점에 증분 갱신
+    (기간 조회는 일 버킷 합산 + 경계일 레코드만 정확히 확인)
+
+pyarrow 미설치 환경을 고려해 컬럼형 세그먼트 대신 JSONL + 요약 인덱스를 사용합니다.
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "debates-"
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_FILE = "index.jsonl"
+DEFAULT_SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+
+OP_DEBATE = "debate"
+OP_OUTCOME = "outcome"
+
+# 정답 판정 (DebateLogger.get_agent_performance 와 동일)
+BULLISH_VOTES = ("BUY", "DCA")
+BEARISH_VOTES = ("SELL", "STOP_LOSS")
+ABSTAIN_VOTE = "ABSTAIN"
+
+CONSENSUS_BUCKETS = ("low (0.0-0.5)", "medium (0.5-0.8)", "high (0.8-1.0)")
+
+
+def consensus_bucket(strength: float) -> str:
+    if strength < 0.5:
+        return CONSENSUS_BUCKETS[0]
+    if strength < 0.8:
+        return CONSENSUS_BUCKETS[1]
+    return CONSENSUS_BUCKETS[2]
+
+
+@dataclass
+class DebateSummary:
+    """인덱스에 저장되는 토론 요약 (집계 / 필터용)"""
+    id: str
+    ticker: str
+    timestamp: datetime
+    decision: str
+    consensus: float
+    votes: List[Tuple[str, str]]
+    pnl: Optional[float] = None
+
+    @classmethod
+    def from_record_dict(cls, data: Dict[str, Any]) -> "DebateSummary":
+        return cls(
+            id=data["id"],
+            ticker=data["ticker"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            decision=data["outcome"]["final_decision"],
+            consensus=data["outcome"]["consensus_strength"],
+            votes=[(v["agent_name"], v["vote"]) for v in data["votes"]],
+            pnl=data["outcome"].get("pnl_result"),
+        )
+
+    def to_index(self) -> Dict[str, Any]:
+        return {
+            "ticker": self.ticker,
+            "ts": self.timestamp.isoformat(),
+            "decision": self.decision,
+            "consensus": self.consensus,
+            "votes": [list(v) for v in self.votes],
+            "pnl": self.pnl,
+        }
+
+    @classmethod
+    def from_index(cls, record_id: str, data: Dict[str, Any]) -> "DebateSummary":
+        return cls(
+            id=record_id,
+            ticker=data["ticker"],
+            timestamp=datetime.fromisoformat(data["ts"]),
+            decision=data["decision"],
+            consensus=data["consensus"],
+            votes=[tuple(v) for v in data["votes"]],
+            pnl=data.get("pnl"),
+        )
+
+
+# ═══════════════════════════════════════════════════════════════
+# 증분 집계
+# ═══════════════════════════════════════════════════════════════
+
+def _empty_agent_stats() -> Dict[str, float]:
+    return {"total_votes": 0, "correct_predictions": 0, "total_pnl": 0.0, "wins": 0, "losses": 0, "abstains": 0}
+
+
+def _empty_bucket_stats() -> Dict[str, float]:
+    return {"count": 0, "total_pnl": 0, "wins": 0}
+
+
+class DebateAggregates:
+    """
+    에이전트 / 합의 강도 / 티커 집계 (증분)
+
+    PnL 이 기록된 토론만 성과 집계에 반영됩니다. outcome 이 다시 업데이트되면
+    이전 기여분을 빼고 새 기여분을 더합니다.
+    """
+
+    def __init__(self):
+        self.summaries: Dict[str, DebateSummary] = {}
+        self._ids_by_ticker: Dict[str, List[str]] = {}
+        self._ids_by_day: Dict[date, List[str]] = {}
+        # agent → day → stats
+        self._agent_days: Dict[str, Dict[date, Dict[str, float]]] = {}
+        # day → bucket → stats
+        self._consensus_days: Dict[date, Dict[str, Dict[str, float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.summaries)
+
+    def add_debate(self, summary: DebateSummary):
+        if summary.id in self.summaries:
+            return
+        pnl = summary.pnl
+        summary.pnl = None
+        self.summaries[summary.id] = summary
+        self._ids_by_ticker.setdefault(summary.ticker, []).append(summary.id)
+        self._ids_by_day.setdefault(summary.timestamp.date(), []).append(summary.id)
+        if pnl is not None:
+            self.set_pnl(summary.id, pnl)
+
+    def set_pnl(self, record_id: str, pnl: Optional[float]):
+        summary = self.summaries.get(record_id)
+        if summary is None:
+            return
+        if summary.pnl is not None:
+            self._apply(summary, summary.pnl, sign=-1)
+        summary.pnl = pnl
+        if pnl is not None:
+            self._apply(summary, pnl, sign=1)
+
+    def _apply(self, summary: DebateSummary, pnl: float, sign: int):
+        day = summary.timestamp.date()
+        for agent, vote in summary.votes:
+            stats = self._agent_days.setdefault(agent, {}).setdefault(day, _empty_agent_stats())
+            _add_vote(stats, vote, pnl, sign)
+
+        bucket = self._consensus_days.setdefault(day, {}).setdefault(
+            consensus_bucket(summary.consensus), _empty_bucket_stats()
+        )
+        bucket["count"] += sign
+        bucket["total_pnl"] += sign * pnl
+        if pnl > 0:
+            bucket["wins"] += sign
+
+    def ids_for_ticker(self, ticker: Optional[str] = None) -> List[str]:
+        """기록 순서 id 목록 (ticker=None이면 전체)"""
+        if ticker is None:
+            return list(self.summaries)
+        return list(self._ids_by_ticker.get(ticker, []))
+
+    def tickers(self) -> List[str]:
+        return list(self._ids_by_ticker)
+
+    def agent_performance(self, agent_name: str, cutoff: datetime) -> Dict[str, float]:
+        totals = _empty_agent_stats()
+        boundary = cutoff.date()
+        for day, stats in self._agent_days.get(agent_name, {}).items():
+            if day > boundary:
+                for key, value in stats.items():
+                    totals[key] += value
+
+        # 경계일: 시각까지 비교
+        for summary in self._boundary_summaries(cutoff):
+            for agent, vote in summary.votes:
+                if agent == agent_name:
+                    _add_vote(totals, vote, summary.pnl, 1)
+        return totals
+
+    def consensus_analysis(self, cutoff: datetime) -> Dict[str, Dict[str, float]]:
+        buckets = {name: _empty_bucket_stats() for name in CONSENSUS_BUCKETS}
+        boundary = cutoff.date()
+        for day, day_buckets in self._consensus_days.items():
+            if day > boundary:
+                for name, stats in day_buckets.items():
+                    for key, value in stats.items():
+                        buckets[name][key] += value
+
+        for summary in self._boundary_summaries(cutoff):
+            stats = buckets[consensus_bucket(summary.consensus)]
+            stats["count"] += 1
+            stats["total_pnl"] += summary.pnl
+            if summary.pnl > 0:
+                stats["wins"] += 1
+        return buckets
+
+    def _boundary_summaries(self, cutoff: datetime) -> Iterator[DebateSummary]:
+        for record_id in self._ids_by_day.get(cutoff.date(), []):
+            summary = self.summaries[record_id]
+            if summary.timestamp >= cutoff and summary.pnl is not None:
+                yield summary
+
+
+def _add_vote(stats: Dict[str, float], vote: str, pnl: float, sign: int):
+    stats["total_votes"] += sign
+    if vote == ABSTAIN_VOTE:
+        stats["abstains"] += sign
+        return
+    if pnl > 0:
+        stats["wins"] += sign
+        if vote in BULLISH_VOTES:
+            stats["correct_predictions"] += sign
+    elif pnl < 0:
+        stats["losses"] += sign
+        if vote in BEARISH_VOTES:
+            stats["correct_predictions"] += sign
+    stats["total_pnl"] += sign * pnl
+
+
+# ═══════════════════════════════════════════════════════════════
+# 세그먼트 로그
+# ═══════════════════════════════════════════════════════════════
+
+class DebateSegmentLog:
+    """
+    append-only JSONL 세그먼트 + 오프셋 인덱스
+
+    Usage:
+        log = DebateSegmentLog(Path("data/debates"))
+        for entry in log.open():            # 인덱스 엔트리 재생 (집계 복원)
+            ...
+        log.append_debate(record.to_dict())
+        log.append_outcome(record.id, record.outcome.to_dict())
+        data = log.read(record.id)          # 최신 outcome 반영
+        for data in log.iter_records():     # 세그먼트 스트리밍
+            ...
+    """
+
+    def __init__(self, root: Path, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES):
+        self.root = Path(root)
+        self.segments_dir = self.root / "segments"
+        self.index_path = self.root / INDEX_FILE
+        self.segment_max_bytes = segment_max_bytes
+
+        # id → (segment, offset, length)
+        self._locations: Dict[str, Tuple[int, int, int]] = {}
+        # id → 최신 outcome dict
+        self._outcomes: Dict[str, Dict[str, Any]] = {}
+        self._indexed_end: Dict[int, int] = {}
+        self._active_segment = 1
+        self._opened = False
+
+        self.stats = {
+            "appends": 0,
+            "reads": 0,
+            "segments": 0,
+            "recovered_entries": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._locations
+
+    # ─── open / recovery ──────────────────────────────────────
+
+    def open(self) -> Iterator[Tuple[str, str, Any]]:
+        """
+        인덱스를 읽고(필요 시 세그먼트 꼬리로 복구) 엔트리를 순서대로 반환
+
+        Yields:
+            ("debate", id, DebateSummary) | ("outcome", id, outcome dict)
+        """
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        self._opened = True
+
+        if self.index_path.exists():
+            offset = 0
+            torn = False
+            with open(self.index_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        torn = True  # 기록 중 중단된 인덱스 라인
+                        break
+                    offset += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping corrupt debate index line")
+                        continue
+                    yield self._register(entry)
+            if torn:
+                # 잘라내지 않으면 다음 append 가 조각 뒤에 붙어 그 엔트리까지 손상됨
+                # (해당 엔트리는 아래 세그먼트 꼬리 재스캔으로 복구)
+                logger.warning(f"Truncating partial debate index entry at {offset}")
+                os.truncate(self.index_path, offset)
+
+        segments = self._segment_numbers()
+        self.stats["segments"] = len(segments)
+        if segments:
+            self._active_segment = segments[-1]
+        last_indexed = max(self._indexed_end, default=0)
+        for segment in segments:
+            if segment >= last_indexed:
+                yield from self._recover_segment(segment)
+
+    def _register(self, entry: Dict[str, Any]) -> Tuple[str, str, Any]:
+        location = (entry["seg"], entry["off"], entry["len"])
+        self._indexed_end[entry["seg"]] = max(self._indexed_end.get(entry["seg"], 0), entry["off"] + entry["len"])
+        record_id = entry["id"]
+        if entry["op"] == OP_DEBATE:
+            self._locations[record_id] = location
+            return OP_DEBATE, record_id, DebateSummary.from_index(record_id, entry["s"])
+        self._outcomes[record_id] = entry["o"]
+        return OP_OUTCOME, record_id, entry["o"]
+
+    def _recover_segment(self, segment: int) -> Iterator[Tuple[str, str, Any]]:
+        """인덱스에 없는 세그먼트 꼬리 엔트리를 인덱싱"""
+        path = self._segment_path(segment)
+        start = self._indexed_end.get(segment, 0)
+        if path.stat().st_size <= start:
+            return
+
+        offset = start
+        with open(path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # 기록 중 중단된 마지막 줄 → 잘라내고 이후 append 가 이어서 쓰도록
+                    logger.warning(f"Truncating partial debate log entry in {path.name} at {offset}")
+                    f.close()
+                    os.truncate(path, offset)
+                    break
+                entry = json.loads(line)
+                yield self._index_entry(entry, segment, offset, len(line))
+                self.stats["recovered_entries"] += 1
+                offset += len(line)
+
+    # ─── append ───────────────────────────────────────────────
+
+    def append_debate(self, record: Dict[str, Any]) -> DebateSummary:
+        entry = {"op": OP_DEBATE, "record": record}
+        segment, offset, length = self._append(entry)
+        _, _, summary = self._index_entry(entry, segment, offset, length)
+        return summary
+
+    def append_outcome(self, record_id: str, outcome: Dict[str, Any]):
+        entry = {"op": OP_OUTCOME, "id": record_id, "outcome": outcome}
+        segment, offset, length = self._append(entry)
+        self._index_entry(entry, segment, offset, length)
+
+    def _append(self, entry: Dict[str, Any]) -> Tuple[int, int, int]:
+        if not self._opened:
+            for _ in self.open():
+                pass
+
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        path = self._segment_path(self._active_segment)
+        size = path.stat().st_size if path.exists() else 0
+        if size and size + len(line) > self.segment_max_bytes:
+            self._active_segment += 1
+            path = self._segment_path(self._active_segment)
+            size = 0
+
+        with open(path, "ab") as f:
+            f.write(line)
+        self.stats["appends"] += 1
+        self.stats["segments"] = self._active_segment
+        return self._active_segment, size, len(line)
+
+    def _index_entry(self, entry: Dict[str, Any], segment: int, offset: int, length: int) -> Tuple[str, str, Any]:
+        if entry["op"] == OP_DEBATE:
+            summary = DebateSummary.from_record_dict(entry["record"])
+            index_entry = {"op": OP_DEBATE, "id": summary.id, "seg": segment, "off": offset, "len": length,
+                           "s": summary.to_index()}
+        else:
+            index_entry = {"op": OP_OUTCOME, "id": entry["id"], "seg": segment, "off": offset, "len": length,
+                           "o": entry["outcome"]}
+
+        with open(self.index_path, "ab") as f:
+            f.write((json.dumps(index_entry, ensure_ascii=False) + "\n").encode("utf-8"))
+
+        return self._register(index_entry)
+
+    # ─── read ─────────────────────────────────────────────────
+
+    def read(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """오프셋으로 토론 1건 읽기 (최신 outcome 반영)"""
+        location = self._locations.get(record_id)
+        if location is None:
+            return None
+        segment, offset, length = location
+        with open(self._segment_path(segment), "rb") as f:
+            f.seek(offset)
+            record = json.loads(f.read(length))["record"]
+        self.stats["reads"] += 1
+        return self._with_latest_outcome(record)
+
+    def iter_records(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[Dict[str, Any]]:
+        """세그먼트를 순서대로 스트리밍 (레코드 전체를 메모리에 올리지 않음)"""
+        outcome_prefix = f'{{"op": "{OP_OUTCOME}"'.encode("utf-8")
+        for segment in self._segment_numbers():
+            with open(self._segment_path(segment), "rb") as f:
+                for line in f:
+                    if line.startswith(outcome_prefix) or not line.endswith(b"\n"):
+                        continue
+                    record = self._with_latest_outcome(json.loads(line)["record"])
+                    if predicate is None or predicate(record):
+                        yield record
+
+    def _with_latest_outcome(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        outcome = self._outcomes.get(record["id"])
+        if outcome is not None:
+            record["outcome"] = outcome
+        return record
+
+    # ─── helpers ──────────────────────────────────────────────
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.segments_dir / f"{SEGMENT_PREFIX}{segment:06d}{SEGMENT_SUFFIX}"
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for path in self.segments_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            try:
+                numbers.append(int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+            except ValueError:
+                continue
+        return sorted(numbers)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "records": len(self._locations), "active_segment": self._active_segment}
@@ -0,0 +1,249 @@
+"""
+Online Agent Stats - 에이전트 성과 증분 통계 (시간 감쇠 Welford 누적기)
+
+AgentWeightTrainer 가 가중치를 다시 계산할 때마다 에이전트의 전체 거래 기록을
+기간 필터링 → 리스트 재계산하던 방식을 O(1) 누적기로 대체합니다.
+
+- DecayedStats: 시간 감쇠(exp(-Δt/τ)) 가중 Welford 평균/분산 + 승/패/적중/신뢰도 합계
+  → record 시 O(1) 갱신, 조회 시 O(1) (현재 시각까지 감쇠만 적용)
+  → 하드 lookback 창 대신 지수 감쇠: τ = lookback_days (평균 수명)
+- OnlineAgentStats: (에이전트, 전체/티커/레짐) 별 DecayedStats 묶음
+  → JSON 으로 저장되는 압축 상태 (거래 기록 전체를 메모리에 올리지 않음)
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import json
+import logging
+import math
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCOPE_ALL = "all"
+SCOPE_TICKER = "ticker"
+SCOPE_REGIME = "regime"
+
+STATE_VERSION = 1
+
+# 유효 가중치가 이보다 작으면 "최근 거래 없음" 으로 취급 (τ 의 약 3배 경과)
+MIN_EFFECTIVE_WEIGHT = 0.05
+
+StatsKey = Tuple[str, str, str]
+
+
+@dataclass
+class DecayedStats:
+    """
+    시간 감쇠 가중 Welford 누적기
+
+    모든 가중 합계는 last_ts 시점 기준이며, 새 관측 전에 exp(-Δt/τ) 로 감쇠합니다.
+    τ = ∞ 이면 일반 Welford 와 같습니다 (표본 분산 보정 포함).
+    """
+    weight: float = 0.0        # Σw (유효 표본 수)
+    weight_sq: float = 0.0     # Σw² (유효 표본 수 n_eff = Σw² 보정용)
+    mean: float = 0.0          # 가중 평균 수익률 (%)
+    m2: float = 0.0            # Σw(x - mean)²
+    wins: float = 0.0
+    losses: float = 0.0
+    correct: float = 0.0
+    confidence: float = 0.0    # Σw·confidence
+    worst_loss: float = 0.0    # 감쇠 최대 손실 (%) - max(worst·f, loss)
+    count: int = 0             # 전체 누적 건수 (감쇠 없음)
+    last_ts: Optional[float] = None
+
+    def update(
+        self,
+        ts: float,
+        return_pct: float,
+        win: bool,
+        loss: bool,
+        correct: bool,
+        confidence: float,
+        tau_seconds: float
+    ):
+        """관측 1건 반영 (O(1)). 과거 시각 관측은 그만큼 감쇠된 가중치로 반영"""
+        if self.last_ts is None or ts >= self.last_ts:
+            self._decay(_decay_factor(ts - self.last_ts if self.last_ts is not None else 0.0, tau_seconds))
+            self.last_ts = ts
+            w = 1.0
+        else:
+            w = _decay_factor(self.last_ts - ts, tau_seconds)
+
+        self.count += 1
+        self.weight += w
+        self.weight_sq += w * w
+        delta = return_pct - self.mean
+        self.mean += (w / self.weight) * delta
+        self.m2 += w * delta * (return_pct - self.mean)
+
+        self.wins += w * win
+        self.losses += w * loss
+        self.correct += w * correct
+        self.confidence += w * confidence
+        if return_pct < 0:
+            self.worst_loss = max(self.worst_loss, -return_pct * w)
+
+    def _decay(self, factor: float):
+        if factor >= 1.0:
+            return
+        self.weight *= factor
+        self.weight_sq *= factor * factor
+        self.m2 *= factor
+        self.wins *= factor
+        self.losses *= factor
+        self.correct *= factor
+        self.confidence *= factor
+        self.worst_loss *= factor
+
+    def view(self, now: float, tau_seconds: float) -> Dict[str, float]:
+        """현재 시각 기준 감쇠된 통계 (상태는 바꾸지 않음, O(1))"""
+        factor = _decay_factor(now - self.last_ts, tau_seconds) if self.last_ts is not None else 0.0
+        weight = self.weight * factor
+        weight_sq = self.weight_sq * factor * factor
+
+        std = 0.0
+        if weight_sq > 0 and weight * weight > weight_sq:
+            # 신뢰도 가중치 보정 표본 분산: m2 / (W - Σw²/W)
+            variance = self.m2 / (self.weight - self.weight_sq / self.weight)
+            std = math.sqrt(max(variance, 0.0))
+
+        return {
+            "weight": weight,
+            "count": self.count,
+            "mean": self.mean,
+            "std": std,
+            "wins": self.wins * factor,
+            "losses": self.losses * factor,
+            "correct": self.correct * factor,
+            "confidence": self.confidence * factor,
+            "worst_loss": self.worst_loss * factor,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DecayedStats":
+        return cls(**data)
+
+
+def _decay_factor(elapsed_seconds: float, tau_seconds: float) -> float:
+    if elapsed_seconds <= 0 or math.isinf(tau_seconds):
+        return 1.0
+    return math.exp(-elapsed_seconds / tau_seconds)
+
+
+class OnlineAgentStats:
+    """
+    (에이전트, 전체/티커/레짐) 별 감쇠 통계
+
+    Usage:
+        stats = OnlineAgentStats(decay_days=30)
+        stats.record("claude", "NVDA", "RISK_ON", datetime.now(), 5.0, True, False, True, 0.7)
+        view = stats.view("claude")                    # 전체
+        view = stats.view("claude", ticker="NVDA")     # 티커별
+        stats.save(path) / OnlineAgentStats.load(path, decay_days=30)
+    """
+
+    def __init__(self, decay_days: float = 30):
+        self.decay_days = decay_days
+        self.tau_seconds = decay_days * 86400 if decay_days else math.inf
+        self._stats: Dict[StatsKey, DecayedStats] = {}
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def record(
+        self,
+        agent: str,
+        ticker: Optional[str],
+        regime: Optional[str],
+        timestamp: datetime,
+        return_pct: float,
+        win: bool,
+        loss: bool,
+        correct: bool,
+        confidence: float
+    ):
+        """거래 결과 1건을 에이전트 전체/티커/레짐 누적기에 반영 (O(1))"""
+        ts = timestamp.timestamp()
+        for key in self._keys(agent, ticker, regime):
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = DecayedStats()
+            stats.update(ts, return_pct, win, loss, correct, confidence, self.tau_seconds)
+
+    def view(
+        self,
+        agent: str,
+        ticker: Optional[str] = None,
+        regime: Optional[str] = None,
+        now: Optional[datetime] = None
+    ) -> Optional[Dict[str, float]]:
+        """감쇠 통계 조회 - 기록 없으면 None"""
+        if ticker is not None:
+            key = (agent, SCOPE_TICKER, ticker.upper())
+        elif regime is not None:
+            key = (agent, SCOPE_REGIME, regime.upper())
+        else:
+            key = (agent, SCOPE_ALL, "")
+        stats = self._stats.get(key)
+        if stats is None:
+            return None
+        return stats.view((now or datetime.now()).timestamp(), self.tau_seconds)
+
+    def scopes(self, agent: str) -> Iterator[StatsKey]:
+        return (key for key in self._stats if key[0] == agent)
+
+    @staticmethod
+    def _keys(agent: str, ticker: Optional[str], regime: Optional[str]) -> Iterator[StatsKey]:
+        yield (agent, SCOPE_ALL, "")
+        if ticker:
+            yield (agent, SCOPE_TICKER, ticker.upper())
+        if regime:
+            yield (agent, SCOPE_REGIME, regime.upper())
+
+    # ─── 저장 ─────────────────────────────────────────────────
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": STATE_VERSION,
+            "decay_days": self.decay_days,
+            "stats": [
+                {"agent": agent, "scope": scope, "value": value, **stats.to_dict()}
+                for (agent, scope, value), stats in self._stats.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], decay_days: float = 30) -> "OnlineAgentStats":
+        engine = cls(decay_days=decay_days)
+        if data.get("version") != STATE_VERSION:
+            logger.warning(f"Unknown agent stats state version: {data.get('version')}")
+            return engine
+        if data.get("decay_days") != decay_days:
+            # τ 가 바뀌어도 누적 합계는 재사용 가능 (이후 감쇠부터 새 τ 적용)
+            logger.info(f"Agent stats decay changed: {data.get('decay_days')} -> {decay_days} days")
+        for entry in data.get("stats", []):
+            entry = dict(entry)
+            key = (entry.pop("agent"), entry.pop("scope"), entry.pop("value"))
+            engine._stats[key] = DecayedStats.from_dict(entry)
+        return engine
+
+    def save(self, path: Path):
+        """원자적 저장 (임시 파일 → rename)"""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, decay_days: float = 30) -> "OnlineAgentStats":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f), decay_days=decay_days)
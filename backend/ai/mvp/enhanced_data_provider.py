@@ -5,6 +5,8 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 
+from backend.market_data.ohlcv_builder import get_ohlcv_builder, summarize_ohlcv
+
 class EnhancedDataProvider:
     """
     War Room MVP Phase 3: Data Enhancement
@@ -15,41 +17,12 @@ class EnhancedDataProvider:
     def get_multi_timeframe_data(symbol: str) -> Dict[str, Any]:
         """
         Fetch OHLCV data for multiple timeframes: 1D, 1W, 1M, 4H
+
+        Daily history comes from stock_prices (one hourly download fills recent days);
+        1W/1M/4H are resampled locally and cached per trading session.
         """
         try:
-            ticker = yf.Ticker(symbol)
-            result = {}
-
-            # 1. Daily (1D) - Baseline
-            hist_1d = ticker.history(period="1y", interval="1d")
-            if not hist_1d.empty:
-                result['1d'] = EnhancedDataProvider._process_ohlcv(hist_1d)
-
-            # 2. Weekly (1W)
-            hist_1w = ticker.history(period="2y", interval="1wk")
-            if not hist_1w.empty:
-                result['1w'] = EnhancedDataProvider._process_ohlcv(hist_1w)
-            
-            # 3. Monthly (1M)
-            hist_1m = ticker.history(period="5y", interval="1mo")
-            if not hist_1m.empty:
-                result['1m'] = EnhancedDataProvider._process_ohlcv(hist_1m)
-
-            # 4. 4H (Resampled from 1h)
-            # Fetch 1h data (valid for 730 days, we take 60 days)
-            hist_1h = ticker.history(period="60d", interval="1h")
-            if not hist_1h.empty:
-                # Resample to 4H
-                hist_4h = hist_1h.resample('4H').agg({
-                    'Open': 'first',
-                    'High': 'max',
-                    'Low': 'min',
-                    'Close': 'last',
-                    'Volume': 'sum'
-                }).dropna()
-                result['4h'] = EnhancedDataProvider._process_ohlcv(hist_4h)
-
-            return result
+            return get_ohlcv_builder().get_multi_timeframe_data(symbol)
         except Exception as e:
             print(f"⚠️ Failed to fetch multi-timeframe data for {symbol}: {e}")
             return {}
@@ -58,33 +31,7 @@ class EnhancedDataProvider:
     def _process_ohlcv(df: pd.DataFrame) -> Dict[str, Any]:
         """Process DataFrame to simplified technical summary"""
         try:
-            latest = df.iloc[-1]
-            prev = df.iloc[-2] if len(df) > 1 else latest
-            
-            # Simple Trend (SMA 20 vs SMA 50) - rudimentary check if enough data
-            sma_20 = df['Close'].rolling(20).mean().iloc[-1] if len(df) >= 20 else 0
-            sma_50 = df['Close'].rolling(50).mean().iloc[-1] if len(df) >= 50 else 0
-            
-            trend = "neutral"
-            if sma_20 > sma_50: trend = "uptrend"
-            elif sma_20 < sma_50: trend = "downtrend"
-
-            # RSI 14
-            delta = df['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = rsi.iloc[-1] if not rsi.empty else 50
-
-            return {
-                "current_price": float(latest['Close']),
-                "change_pct": float((latest['Close'] - prev['Close']) / prev['Close'] * 100) if prev['Close'] != 0 else 0,
-                "volume": int(latest['Volume']),
-                "trend": trend,
-                "rsi": float(current_rsi),
-                "last_date": str(latest.name)
-            }
+            return summarize_ohlcv(df)
         except Exception:
             return {}
 
@@ -21,7 +21,6 @@ Benefits:
 """
 
 import os
-import asyncio
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -33,6 +32,8 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+from backend.ai.llm_gateway import estimate_tokens, get_llm_gateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -162,13 +163,13 @@ class GeminiReasoningAgentBase(ABC):
         )
 
         try:
-            # Run Gemini in thread pool (it's synchronous)
-            loop = asyncio.get_event_loop()
+            # Native async call through the shared gemini pool (no executor thread)
             full_prompt = f"{self.system_prompt}\n\n{prompt}"
 
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.model.generate_content(full_prompt)
+            response = await get_llm_gateway().call(
+                "gemini",
+                lambda: self.model.generate_content_async(full_prompt),
+                estimated_tokens=estimate_tokens(full_prompt),
             )
 
             reasoning_text = response.text.strip()
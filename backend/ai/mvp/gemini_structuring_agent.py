@@ -24,7 +24,6 @@ Benefits:
 import os
 import json
 import logging
-import asyncio
 from typing import Dict, Any, Optional, Type, TypeVar
 from datetime import datetime
 from pydantic import BaseModel
@@ -35,6 +34,8 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+from backend.ai.llm_gateway import estimate_tokens, get_llm_gateway
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
@@ -123,13 +124,13 @@ class GeminiStructuringAgent:
 
         # Call Gemini with JSON response mode
         try:
-            # Run Gemini in thread pool (it's synchronous)
-            loop = asyncio.get_event_loop()
+            # Native async call through the shared gemini pool (no executor thread)
             full_prompt = f"{self.system_prompt}\n\n{prompt}"
 
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.model.generate_content(full_prompt)
+            response = await get_llm_gateway().call(
+                "gemini",
+                lambda: self.model.generate_content_async(full_prompt),
+                estimated_tokens=estimate_tokens(full_prompt),
             )
 
             response_text = response.text.strip()
@@ -5,10 +5,12 @@ Smart Options Flow 분석 - Bid-Ask 기반 방향성 판별
 
 from .smart_options_analyzer import SmartOptionsAnalyzer, SmartOptionFlow
 from .whale_detector import WhaleDetector, WhaleOrder
+from .chain_engine import OptionsChainEngine
 
 __all__ = [
     "SmartOptionsAnalyzer",
     "SmartOptionFlow",
     "WhaleDetector",
     "WhaleOrder",
+    "OptionsChainEngine",
 ]
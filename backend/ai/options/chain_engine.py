@@ -0,0 +1,344 @@
+"""
+Options Chain Engine
+
+옵션 체인 전체를 NumPy 배열 연산 한 번으로 분석합니다 (iterrows 없음).
+
+기능:
+  - Bid-Ask 위치 기반 체결 방향 판별 (BUY / SELL / NEUTRAL 마스크)
+  - Black-Scholes 내재변동성 (벡터화 Newton-Raphson + 구간 보호)
+  - Greeks: delta, gamma, vega
+  - 행사가/만기별 Dollar-Delta(체결 흐름) 및 Gamma Exposure(미결제약정) 집계
+
+부호 규약:
+  flow_dollar_delta = 체결방향(+1 매수 / -1 매도) × volume × delta × 100 × S
+    → Call 매수 / Put 매도 = 양수 (강세), Call 매도 / Put 매수 = 음수 (약세)
+  gamma_exposure = (+1 Call / -1 Put) × OI × gamma × 100 × S² × 1%
+    → 딜러 포지션 관점, 1% 가격 변동당 델타 변화 금액
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+CONTRACT_MULTIPLIER = 100
+TRADING_YEAR_DAYS = 365.0
+
+SIDE_BUY = "BUY"
+SIDE_SELL = "SELL"
+SIDE_NEUTRAL = "NEUTRAL"
+
+# 입력 컬럼 별칭 (yfinance / Massive API)
+_COLUMN_ALIASES = {
+    "last": ("lastPrice", "last", "last_price"),
+    "open_interest": ("openInterest", "open_interest"),
+    "implied_volatility": ("impliedVolatility", "implied_volatility", "iv"),
+    "expiration": ("expiration", "expiration_date", "expiry"),
+}
+
+_SQRT_2PI = np.sqrt(2.0 * np.pi)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def classify_trade_side(
+    last: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    buy_pct: float = 0.40,
+    sell_pct: float = 0.40,
+) -> np.ndarray:
+    """
+    체결가 위치로 매수/매도 판별 (벡터화)
+
+    Ask 쪽 buy_pct 내 → BUY, Bid 쪽 sell_pct 내 → SELL, 그 외/호가 이상 → NEUTRAL
+
+    Returns:
+        'BUY' / 'SELL' / 'NEUTRAL' 문자열 배열
+    """
+    last, bid, ask = (np.asarray(a, dtype=float) for a in (last, bid, ask))
+    valid = (bid < ask) & (ask > 0)
+    spread = ask - bid
+
+    buy = valid & (last >= ask - spread * buy_pct)
+    sell = valid & ~buy & (last <= bid + spread * sell_pct)
+
+    return np.select([buy, sell], [SIDE_BUY, SIDE_SELL], default=SIDE_NEUTRAL)
+
+
+def black_scholes_greeks(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    t: np.ndarray,
+    sigma: np.ndarray,
+    is_call: np.ndarray,
+    rate: float = 0.045,
+) -> Dict[str, np.ndarray]:
+    """
+    Black-Scholes 가격 및 Greeks (배열 입력)
+
+    Args:
+        spot: 기초자산 가격
+        strike: 행사가
+        t: 잔존 만기 (년)
+        sigma: 변동성 (연율)
+        is_call: Call 여부 (bool 배열)
+        rate: 무위험 이자율
+
+    Returns:
+        {'price', 'delta', 'gamma', 'vega'} (vega는 변동성 1%p 당 가격 변화)
+    """
+    spot, strike, t, sigma = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (spot, strike, t, sigma))
+    )
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), spot.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_t = np.sqrt(t)
+        vol_t = sigma * sqrt_t
+        d1 = (np.log(spot / strike) + (rate + 0.5 * sigma ** 2) * t) / vol_t
+        d2 = d1 - vol_t
+
+        discount = np.exp(-rate * t)
+        call_price = spot * ndtr(d1) - strike * discount * ndtr(d2)
+        put_price = strike * discount * ndtr(-d2) - spot * ndtr(-d1)
+
+        pdf_d1 = _norm_pdf(d1)
+        gamma = pdf_d1 / (spot * vol_t)
+        vega = spot * pdf_d1 * sqrt_t / 100.0
+
+    return {
+        "price": np.where(is_call, call_price, put_price),
+        "delta": np.where(is_call, ndtr(d1), ndtr(d1) - 1.0),
+        "gamma": gamma,
+        "vega": vega,
+    }
+
+
+def implied_volatility(
+    price: np.ndarray,
+    spot: np.ndarray,
+    strike: np.ndarray,
+    t: np.ndarray,
+    is_call: np.ndarray,
+    rate: float = 0.045,
+    initial: Optional[np.ndarray] = None,
+    iterations: int = 20,
+    tol: float = 1e-6,
+) -> np.ndarray:
+    """
+    내재변동성 (벡터화 Newton-Raphson, 발산 시 이분법 구간으로 보호)
+
+    가격이 무차익 범위 밖이거나 수렴하지 않는 계약은 NaN.
+    """
+    price, spot, strike, t = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (price, spot, strike, t))
+    )
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), price.shape)
+
+    # 무차익 하한/상한
+    discount = np.exp(-rate * t)
+    intrinsic = np.where(is_call, spot - strike * discount, strike * discount - spot)
+    lower = np.maximum(intrinsic, 0.0)
+    upper = np.where(is_call, spot, strike * discount)
+    solvable = (price > lower) & (price < upper) & (t > 0) & (spot > 0) & (strike > 0)
+
+    sigma = np.full(price.shape, 0.3)
+    if initial is not None:
+        seed = np.asarray(initial, dtype=float)
+        sigma = np.where(np.isfinite(seed) & (seed > 0.01) & (seed < 5.0), seed, sigma)
+
+    lo = np.full(price.shape, 1e-4)
+    hi = np.full(price.shape, 5.0)
+    done = ~solvable
+
+    for _ in range(iterations):
+        greeks = black_scholes_greeks(spot, strike, t, sigma, is_call, rate)
+        diff = greeks["price"] - price
+        converged = np.abs(diff) < tol
+        done = done | converged
+        if done.all():
+            break
+
+        # 구간 갱신 (가격은 sigma에 대해 단조 증가)
+        hi = np.where(diff > 0, np.minimum(hi, sigma), hi)
+        lo = np.where(diff < 0, np.maximum(lo, sigma), lo)
+
+        vega = greeks["vega"] * 100.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = sigma - diff / vega
+        bisect = 0.5 * (lo + hi)
+        step = np.where(np.isfinite(newton) & (newton > lo) & (newton < hi), newton, bisect)
+        sigma = np.where(done, sigma, step)
+
+    final = black_scholes_greeks(spot, strike, t, sigma, is_call, rate)["price"]
+    ok = solvable & (np.abs(final - price) < max(tol * 100, 1e-4))
+    return np.where(ok, sigma, np.nan)
+
+
+class OptionsChainEngine:
+    """
+    벡터화 옵션 체인 엔진
+
+    체인 DataFrame(콜+풋, contract_type 컬럼)을 받아 계약별 체결방향/프리미엄/IV/Greeks/
+    노출 금액 컬럼을 한 번에 추가하고, 행사가·만기별 집계를 제공합니다.
+    """
+
+    def __init__(
+        self,
+        risk_free_rate: float = 0.045,
+        bid_ask_buy_pct: float = 0.40,
+        bid_ask_sell_pct: float = 0.40,
+    ):
+        self.risk_free_rate = risk_free_rate
+        self.bid_ask_buy_pct = bid_ask_buy_pct
+        self.bid_ask_sell_pct = bid_ask_sell_pct
+
+    @staticmethod
+    def _column(chain: pd.DataFrame, name: str, default=0.0) -> pd.Series:
+        for alias in _COLUMN_ALIASES.get(name, (name,)):
+            if alias in chain.columns:
+                return chain[alias]
+        return pd.Series(default, index=chain.index)
+
+    def prepare(
+        self,
+        chain: pd.DataFrame,
+        spot: Optional[float] = None,
+        now: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        계약별 분석 컬럼 추가
+
+        Added columns:
+            last, open_interest, trade_side, side_sign, premium,
+            t_years, iv, delta, gamma, vega, flow_dollar_delta, gamma_exposure
+
+        spot이 없으면 Greeks 관련 컬럼은 NaN/0으로 채워집니다.
+        """
+        df = chain.copy()
+        n = len(df)
+        if n == 0:
+            return df
+
+        num = lambda s: pd.to_numeric(s, errors="coerce").fillna(0.0).to_numpy(dtype=float)  # noqa: E731
+
+        volume = num(self._column(df, "volume"))
+        last = num(self._column(df, "last"))
+        bid = num(self._column(df, "bid"))
+        ask = num(self._column(df, "ask"))
+        strike = num(self._column(df, "strike"))
+        open_interest = num(self._column(df, "open_interest"))
+        is_call = (self._column(df, "contract_type", "call").astype(str).str.lower() == "call").to_numpy()
+
+        side = classify_trade_side(last, bid, ask, self.bid_ask_buy_pct, self.bid_ask_sell_pct)
+        side_sign = np.select([side == SIDE_BUY, side == SIDE_SELL], [1.0, -1.0], default=0.0)
+
+        df["volume"] = volume
+        df["last"] = last
+        df["open_interest"] = open_interest
+        df["trade_side"] = side
+        df["side_sign"] = side_sign
+        df["premium"] = volume * last * CONTRACT_MULTIPLIER
+
+        # 잔존 만기 (만기일 16:00 기준, 최소 1시간)
+        now = pd.Timestamp(now or datetime.now()).tz_localize(None)
+        expiration = pd.to_datetime(self._column(df, "expiration", pd.NaT), errors="coerce")
+        if getattr(expiration.dt, "tz", None) is not None:
+            expiration = expiration.dt.tz_localize(None)
+        seconds = ((expiration.dt.normalize() + pd.Timedelta(hours=16)) - now).dt.total_seconds()
+        t_years = np.maximum(seconds.fillna(0.0).to_numpy(), 3600.0) / (TRADING_YEAR_DAYS * 86400)
+        df["t_years"] = t_years
+
+        if not spot or spot <= 0:
+            for column in ("iv", "delta", "gamma", "vega"):
+                df[column] = np.nan
+            df["flow_dollar_delta"] = 0.0
+            df["gamma_exposure"] = 0.0
+            return df
+
+        # 시장가: 유효 호가면 mid, 아니면 체결가
+        mid = np.where((bid > 0) & (ask > bid), 0.5 * (bid + ask), last)
+        seed = num(self._column(df, "implied_volatility", np.nan)) if any(
+            a in df.columns for a in _COLUMN_ALIASES["implied_volatility"]
+        ) else None
+
+        iv = implied_volatility(mid, spot, strike, t_years, is_call, self.risk_free_rate, initial=seed)
+        if seed is not None:
+            # 풀이 불가(호가 없음 등) 계약은 데이터 제공자 IV 사용
+            iv = np.where(np.isfinite(iv), iv, np.where(seed > 0, seed, np.nan))
+
+        greeks = black_scholes_greeks(spot, strike, t_years, np.where(np.isfinite(iv), iv, np.nan), is_call, self.risk_free_rate)
+        delta = np.nan_to_num(greeks["delta"])
+        gamma = np.nan_to_num(greeks["gamma"])
+
+        df["iv"] = iv
+        df["delta"] = greeks["delta"]
+        df["gamma"] = greeks["gamma"]
+        df["vega"] = greeks["vega"]
+        df["flow_dollar_delta"] = side_sign * volume * delta * CONTRACT_MULTIPLIER * spot
+        df["gamma_exposure"] = (
+            np.where(is_call, 1.0, -1.0) * open_interest * gamma * CONTRACT_MULTIPLIER * spot * spot * 0.01
+        )
+        return df
+
+    @staticmethod
+    def exposure_by_strike(prepared: pd.DataFrame) -> pd.DataFrame:
+        """
+        행사가/만기별 노출 집계
+
+        Returns:
+            index=(expiration, strike), columns=[flow_dollar_delta, gamma_exposure, volume, open_interest]
+        """
+        if prepared.empty:
+            return pd.DataFrame(columns=["flow_dollar_delta", "gamma_exposure", "volume", "open_interest"])
+        keys = prepared.assign(expiration=OptionsChainEngine._column(prepared, "expiration", "").astype(str))
+        return keys.groupby(["expiration", "strike"])[
+            ["flow_dollar_delta", "gamma_exposure", "volume", "open_interest"]
+        ].sum()
+
+    @staticmethod
+    def side_summary(prepared: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """
+        Call/Put 별 체결방향 거래량·프리미엄 집계 (SmartOptionsAnalyzer 형식)
+        """
+        result = {}
+        is_call = prepared.get("contract_type", pd.Series("call", index=prepared.index)).astype(str).str.lower() == "call"
+        for contract_type, mask in (("call", is_call), ("put", ~is_call)):
+            group = prepared[mask]
+            side = group["trade_side"].to_numpy() if len(group) else np.array([])
+            volume = group["volume"].to_numpy() if len(group) else np.array([])
+            premium = group["premium"].to_numpy() if len(group) else np.array([])
+            buy, sell = side == SIDE_BUY, side == SIDE_SELL
+
+            buy_volume = int(volume[buy].sum())
+            sell_volume = int(volume[sell].sum())
+            total_volume = int(volume.sum())
+            result[contract_type] = {
+                "total_volume": total_volume,
+                "buy_volume": buy_volume,
+                "sell_volume": sell_volume,
+                "neutral_volume": total_volume - buy_volume - sell_volume,
+                "total_premium": float(premium[buy].sum() + premium[sell].sum()),
+                "net_premium": float(premium[buy].sum() - premium[sell].sum()),
+            }
+        return result
+
+    @staticmethod
+    def net_delta(prepared: pd.DataFrame) -> Optional[float]:
+        """
+        체결 흐름 기반 Net Delta (-1 ~ +1)
+
+        방향이 판별된 체결의 Dollar-Delta 합 / 절대값 합. Greeks가 없으면 None.
+        """
+        if prepared.empty or "flow_dollar_delta" not in prepared:
+            return None
+        flow = prepared["flow_dollar_delta"].to_numpy()
+        gross = np.abs(flow).sum()
+        if gross == 0:
+            return None
+        return float(flow.sum() / gross)
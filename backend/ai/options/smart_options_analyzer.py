@@ -8,6 +8,8 @@ Bid-Ask 기반으로 매수/매도 성향을 판별
   Put Volume 증가 시:
   - Case A: 체결가가 Ask(매도호가) 근처 → 매수자가 급함 (Aggressive Buy) → Put 매수 = 하락 베팅 🐻
   - Case B: 체결가가 Bid(매수호가) 근처 → 매도자가 급함 (Aggressive Sell) → Put 매도 = 상승/횡보 베팅 🐂
+
+체인 전체 계산은 OptionsChainEngine (NumPy 벡터 연산)으로 한 번에 수행합니다.
 """
 
 from dataclasses import dataclass, field
@@ -18,6 +20,8 @@ import logging
 import pandas as pd
 import numpy as np
 
+from backend.ai.options.chain_engine import OptionsChainEngine, SIDE_BUY
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,6 +75,11 @@ class SmartOptionFlow:
     unusual_activity: bool = False
     key_insights: List[str] = field(default_factory=list)
 
+    # Greeks 기반 노출 (현재가가 있을 때만)
+    net_dollar_delta: float = 0.0       # 체결 흐름 Dollar-Delta 합계
+    net_gamma_exposure: float = 0.0     # 미결제약정 Gamma Exposure (1% 변동당 $)
+    gamma_by_strike: List[Dict] = field(default_factory=list)  # |GEX| 상위 행사가
+
 
 class SmartOptionsAnalyzer:
     """
@@ -86,11 +95,17 @@ class SmartOptionsAnalyzer:
         bid_ask_buy_pct: float = 0.40,        # Ask 쪽 40% 이내면 BUY
         bid_ask_sell_pct: float = 0.40,       # Bid 쪽 40% 이내면 SELL
         massive_api_client=None,
+        risk_free_rate: float = 0.045,
     ):
         self.whale_threshold = whale_threshold
         self.bid_ask_buy_pct = bid_ask_buy_pct
         self.bid_ask_sell_pct = bid_ask_sell_pct
         self.massive_api_client = massive_api_client
+        self.engine = OptionsChainEngine(
+            risk_free_rate=risk_free_rate,
+            bid_ask_buy_pct=bid_ask_buy_pct,
+            bid_ask_sell_pct=bid_ask_sell_pct,
+        )
     
     def _determine_trade_side(
         self,
@@ -156,18 +171,17 @@ class SmartOptionsAnalyzer:
             if chain_data is None or chain_data.empty:
                 return self._create_empty_flow(ticker)
             
+            # 체인 전체 벡터 연산 (체결방향, 프리미엄, IV, Greeks)
+            prepared = self.engine.prepare(chain_data, spot=current_price)
+            is_call = prepared['contract_type'] == 'call'
+            
             # 각 옵션 계약 분석
-            call_analysis = await self._analyze_contracts(
-                chain_data[chain_data['contract_type'] == 'call'],
-                "call",
-            )
-            put_analysis = await self._analyze_contracts(
-                chain_data[chain_data['contract_type'] == 'put'],
-                "put",
-            )
+            call_analysis = await self._analyze_contracts(prepared[is_call], "call")
+            put_analysis = await self._analyze_contracts(prepared[~is_call], "put")
             
             # Net Delta 계산
-            net_delta = self._calculate_net_delta(call_analysis, put_analysis)
+            net_delta = self._calculate_net_delta(call_analysis, put_analysis, prepared)
+            exposure = self._summarize_exposure(prepared)
             
             # 센티먼트 결정
             sentiment, sentiment_score = self._determine_sentiment(
@@ -175,7 +189,7 @@ class SmartOptionsAnalyzer:
             )
             
             # 고래 주문 분석
-            whale_orders = self._identify_whale_orders(chain_data)
+            whale_orders = self._identify_whale_orders(prepared)
             whale_bullish_pct = self._calculate_whale_bullish_pct(whale_orders)
             
             # 인사이트 생성
@@ -208,6 +222,7 @@ class SmartOptionsAnalyzer:
                 put_call_ratio=put_call_ratio,
                 unusual_activity=len(whale_orders) >= 3,
                 key_insights=key_insights,
+                **exposure,
             )
             
         except Exception as e:
@@ -239,44 +254,17 @@ class SmartOptionsAnalyzer:
                 'net_premium': 0,
             }
         
-        buy_volume = 0
-        sell_volume = 0
-        neutral_volume = 0
-        buy_premium = 0
-        sell_premium = 0
-        
-        for _, row in contracts.iterrows():
-            volume = row.get('volume', 0) or 0
-            last_price = row.get('lastPrice', row.get('last', 0)) or 0
-            bid = row.get('bid', 0) or 0
-            ask = row.get('ask', 0) or 0
-            
-            # 거래 방향 판별
-            side = self._determine_trade_side(last_price, bid, ask)
-            premium = volume * last_price * 100  # 계약당 100주
-            
-            if side == TradeSide.BUY:
-                buy_volume += volume
-                buy_premium += premium
-            elif side == TradeSide.SELL:
-                sell_volume += volume
-                sell_premium += premium
-            else:
-                neutral_volume += volume
+        if 'trade_side' not in contracts.columns:
+            contracts = self.engine.prepare(contracts)
         
-        return {
-            'total_volume': buy_volume + sell_volume + neutral_volume,
-            'buy_volume': buy_volume,
-            'sell_volume': sell_volume,
-            'neutral_volume': neutral_volume,
-            'total_premium': buy_premium + sell_premium,
-            'net_premium': buy_premium - sell_premium,  # 순매수 금액
-        }
+        summary = self.engine.side_summary(contracts.assign(contract_type=contract_type))
+        return summary[contract_type]
     
     def _calculate_net_delta(
         self,
         call_analysis: Dict,
         put_analysis: Dict,
+        prepared: Optional[pd.DataFrame] = None,
     ) -> float:
         """
         Net Delta 계산
@@ -286,9 +274,17 @@ class SmartOptionsAnalyzer:
         - Put 매수 → -Delta (약세)
         - Put 매도 → +Delta (강세)
         
+        Greeks가 계산된 체인이면 계약별 Black-Scholes delta로 가중한
+        Dollar-Delta 흐름을 사용하고, 없으면 거래량 근사치를 사용합니다.
+        
         Returns:
             -1 ~ +1 사이의 값
         """
+        if prepared is not None:
+            weighted = self.engine.net_delta(prepared)
+            if weighted is not None:
+                return round(weighted, 3)
+        
         # 가중치 적용
         bullish_signal = (
             call_analysis['buy_volume'] +   # Call 매수 (강세)
@@ -344,36 +340,65 @@ class SmartOptionsAnalyzer:
         """
         고래 주문 식별 ($50K+)
         """
-        whale_orders = []
+        if chain_data.empty:
+            return []
+        if 'trade_side' not in chain_data.columns:
+            chain_data = self.engine.prepare(chain_data)
         
-        for _, row in chain_data.iterrows():
-            volume = row.get('volume', 0) or 0
-            last_price = row.get('lastPrice', row.get('last', 0)) or 0
-            premium = volume * last_price * 100
-            
-            if premium >= self.whale_threshold:
-                bid = row.get('bid', 0) or 0
-                ask = row.get('ask', 0) or 0
-                side = self._determine_trade_side(last_price, bid, ask)
-                contract_type = row.get('contract_type', 'unknown')
-                
-                # 방향성 해석
-                if contract_type == 'call':
-                    direction = "BULLISH" if side == TradeSide.BUY else "BEARISH"
-                else:  # put
-                    direction = "BEARISH" if side == TradeSide.BUY else "BULLISH"
-                
-                whale_orders.append({
-                    'strike': row.get('strike'),
-                    'expiration': str(row.get('expiration', '')),
-                    'contract_type': contract_type,
-                    'volume': volume,
-                    'premium': round(premium, 2),
-                    'trade_side': side.value,
-                    'direction': direction,
-                })
+        whales = chain_data[chain_data['premium'] >= self.whale_threshold]
+        if whales.empty:
+            return []
+        
+        contract_type = whales.get('contract_type', pd.Series('unknown', index=whales.index))
+        is_buy = (whales['trade_side'] == SIDE_BUY).to_numpy()
+        is_call = (contract_type == 'call').to_numpy()
+        # Call 매수 / Put 매도(=Put 비매수) → 강세
+        direction = np.where(is_call == is_buy, "BULLISH", "BEARISH")
+        expiration = whales.get('expiration', pd.Series('', index=whales.index)).astype(str)
+        
+        return [
+            {
+                'strike': strike,
+                'expiration': exp,
+                'contract_type': ctype,
+                'volume': volume,
+                'premium': round(premium, 2),
+                'trade_side': side,
+                'direction': dirn,
+            }
+            for strike, exp, ctype, volume, premium, side, dirn in zip(
+                whales['strike'].tolist(),
+                expiration.tolist(),
+                contract_type.tolist(),
+                whales['volume'].tolist(),
+                whales['premium'].tolist(),
+                whales['trade_side'].tolist(),
+                direction.tolist(),
+            )
+        ]
+    
+    def _summarize_exposure(self, prepared: pd.DataFrame, top_n: int = 5) -> Dict:
+        """Dollar-Delta / Gamma Exposure 요약 (행사가·만기별 집계 중 |GEX| 상위)"""
+        by_strike = self.engine.exposure_by_strike(prepared)
+        if by_strike.empty:
+            return {}
         
-        return whale_orders
+        top = by_strike.reindex(
+            by_strike['gamma_exposure'].abs().sort_values(ascending=False).index[:top_n]
+        )
+        return {
+            'net_dollar_delta': round(float(prepared['flow_dollar_delta'].sum()), 2),
+            'net_gamma_exposure': round(float(prepared['gamma_exposure'].sum()), 2),
+            'gamma_by_strike': [
+                {
+                    'expiration': exp,
+                    'strike': float(strike),
+                    'gamma_exposure': round(float(row['gamma_exposure']), 2),
+                    'dollar_delta': round(float(row['flow_dollar_delta']), 2),
+                }
+                for (exp, strike), row in top.iterrows()
+            ],
+        }
     
     def _calculate_whale_bullish_pct(self, whale_orders: List[Dict]) -> float:
         """고래 중 강세 비율"""
@@ -437,6 +462,8 @@ class SmartOptionsAnalyzer:
             puts = chain.puts.copy()
             puts['contract_type'] = 'put'
             
+            calls['expiration'] = puts['expiration'] = exp
+            
             return pd.concat([calls, puts], ignore_index=True)
             
         except Exception as e:
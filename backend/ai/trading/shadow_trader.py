@@ -13,6 +13,7 @@ from backend.database.models import TradingSignal, Order
 from backend.ai.portfolio.account_partitioning import get_partition_manager, WalletType
 from backend.brokers.kis_broker import KISBroker
 from backend.ai.safety.leverage_guardian import get_leverage_guardian
+from backend.market_data.price_bus import get_price_bus
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,9 @@ class ShadowTradingAgent:
         account_no = os.getenv("KIS_ACCOUNT_NUMBER", "50155969-01")
         self.broker = KISBroker(account_no=account_no, is_virtual=True)  # For price data
         self.guardian = get_leverage_guardian()
+        self.price_bus = get_price_bus()
+        self.max_quote_age_seconds = 30
+        self._tracked_tickers = set()  # 버스 폴링/구독 대상으로 등록한 종목
         
         self.last_signal_id = self._load_last_id()
         
@@ -86,6 +90,7 @@ class ShadowTradingAgent:
                 return
 
             logger.info(f"👻 Processing {len(signals)} new signals...")
+            self._track_tickers(signal.ticker for signal in signals)
             
             for signal in signals:
                 await self.execute_trade(db, signal)
@@ -94,15 +99,26 @@ class ShadowTradingAgent:
         finally:
             db.close()
 
+    def _track_tickers(self, tickers):
+        """신호 종목을 PriceBus 관심 종목으로 등록 (소스가 폴링/구독해야 last() 캐시가 채워짐)"""
+        new = {t for t in tickers if t} - self._tracked_tickers
+        if new:
+            self.price_bus.track(new)
+            self._tracked_tickers |= new
+
     async def execute_trade(self, db: Session, signal: TradingSignal):
         """Execute virtual trade"""
         ticker = signal.ticker
         action = signal.action.upper()
         
-        # 1. Get Price (Sync call wrapped)
+        # 1. Get Price (streamed last value, else sync broker call wrapped)
         try:
-            price_info = await asyncio.to_thread(self.broker.get_current_price, ticker)
-            current_price = float(price_info.get('price', 0))
+            quote = self.price_bus.last(ticker, max_age=self.max_quote_age_seconds)
+            if quote is not None:
+                current_price = quote.price
+            else:
+                price_info = await asyncio.to_thread(self.broker.get_current_price, ticker)
+                current_price = float(price_info.get('price', 0))
             if current_price <= 0:
                 logger.warning(f"Skipping {ticker}: Invalid price {current_price}")
                 return
@@ -0,0 +1,33 @@
+"""
+Add indexes for set-based analytics rollups.
+
+Revision ID: analytics_rollup_001
+Revises: analytics_001
+Create Date: 2026-10-18
+
+The daily rollup groups trade_executions by exit day for closed trades
+(exit_timestamp range + status = 'CLOSED'); execution_timestamp and
+signal_performance.generated_at are already indexed.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "analytics_rollup_001"
+down_revision = "analytics_001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create rollup indexes."""
+    op.create_index(
+        "idx_trade_exit_timestamp_status",
+        "trade_executions",
+        ["exit_timestamp", "status"],
+    )
+
+
+def downgrade():
+    """Drop rollup indexes."""
+    op.drop_index("idx_trade_exit_timestamp_status", table_name="trade_executions")
@@ -0,0 +1,456 @@
+"""
+Correlation Engine - 보유 종목 상관/공분산 행렬
+
+stock_prices 일봉으로 보유 종목의 정렬된 일간 수익률 행렬을 만들고
+상관/공분산 행렬을 한 번의 벡터 연산으로 계산합니다.
+
+추정량:
+  - sample: 표본 공분산
+  - shrunk: Ledoit-Wolf 수축 (scaled identity 타깃, 관측치가 적어도 안정적인 역행렬)
+  - ewma:   RiskMetrics EWMA (λ=0.94, 최근 변동성 반영)
+
+캐시:
+  - (종목 집합, lookback) 별로 하루 1회 DB 조회 → 일간 수익률 행렬 보관
+  - 장중에는 DB 재조회 없이 현재가로 '오늘' 수익률 행만 갱신 후 재계산
+  - 리스크 대시보드 / 상관 분석 / 스트레스 테스트가 같은 행렬을 공유
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# tickers, start → 종가 DataFrame (index: 날짜, columns: 종목)
+CloseLoader = Callable[[List[str], date], Awaitable[pd.DataFrame]]
+# tickers → {ticker: 현재가}
+PriceSource = Callable[[List[str]], Awaitable[Dict[str, Optional[float]]]]
+
+TRADING_DAYS = 252
+
+
+# ============================================================================
+# Estimators
+# ============================================================================
+
+def daily_returns(closes: pd.DataFrame, max_gap_days: int = 2) -> pd.DataFrame:
+    """
+    정렬된 일간 수익률 행렬
+
+    종목별 결측(휴장/누락)은 max_gap_days 까지 직전 종가로 채우고,
+    그래도 비어 있는 날짜는 전체 종목에서 제외합니다.
+    """
+    closes = closes.sort_index().ffill(limit=max_gap_days)
+    return closes.pct_change(fill_method=None).iloc[1:].dropna(how="any")
+
+
+def ledoit_wolf(returns: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Ledoit-Wolf 수축 공분산 (Ledoit & Wolf, 2004)
+
+    Σ = δ·μI + (1-δ)·S, μ = tr(S)/p, δ = min(β², δ²)/δ²
+
+    sklearn.covariance.ledoit_wolf 와 같은 추정량입니다. 장중 재계산 경로에서
+    scikit-learn 임포트 없이 numpy 만으로 계산하고 수축 강도 δ 를 함께 반환합니다.
+
+    Args:
+        returns: (n, p) 수익률 행렬
+
+    Returns:
+        (수축 공분산, 수축 강도 δ)
+    """
+    n, p = returns.shape
+    x = returns - returns.mean(axis=0)
+    sample = x.T @ x / n
+    mu = np.trace(sample) / p
+
+    target_gap = sample.copy()
+    target_gap[np.diag_indices(p)] -= mu
+    delta2 = np.sum(target_gap ** 2) / p
+
+    # Σ_t ||x_t x_tᵀ - S||² = Σ_t ||x_t||⁴ - n·||S||²
+    row_norms = np.sum(x ** 2, axis=1)
+    beta2 = (np.sum(row_norms ** 2) - n * np.sum(sample ** 2)) / (n * n * p)
+    beta2 = min(max(beta2, 0.0), delta2)
+
+    shrinkage = float(beta2 / delta2) if delta2 > 0 else 1.0
+    shrunk = (1.0 - shrinkage) * sample
+    shrunk[np.diag_indices(p)] += shrinkage * mu
+    return shrunk, shrinkage
+
+
+def ewma_covariance(returns: np.ndarray, lam: float = 0.94) -> np.ndarray:
+    """
+    RiskMetrics EWMA 공분산 (평균 0 가정, 가중치 정규화)
+
+    cov = Σ_t w_t r_t r_tᵀ, w_t ∝ (1-λ)·λ^(n-1-t)
+    """
+    n = returns.shape[0]
+    weights = (1.0 - lam) * lam ** np.arange(n - 1, -1, -1, dtype=float)
+    weights /= weights.sum()
+    return (returns * weights[:, None]).T @ returns
+
+
+def cov_to_corr(cov: np.ndarray) -> np.ndarray:
+    """공분산 → 상관 행렬 (분산 0 종목은 상관 0)"""
+    std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.outer(std, std)
+    corr = np.nan_to_num(corr, nan=0.0, posinf=0.0, neginf=0.0)
+    np.fill_diagonal(corr, 1.0)
+    return np.clip(corr, -1.0, 1.0)
+
+
+# ============================================================================
+# Matrix
+# ============================================================================
+
+@dataclass
+class CorrelationMatrix:
+    """계산된 상관/공분산 행렬 (일간 수익률 기준)"""
+    tickers: List[str]
+    as_of: date
+    observations: int
+    covariances: Dict[str, np.ndarray]
+    shrinkage: float
+    intraday: bool = False
+    excluded: List[str] = field(default_factory=list)
+    computed_at: datetime = field(default_factory=datetime.utcnow)
+
+    def covariance(self, method: str = "shrunk") -> np.ndarray:
+        return self.covariances[method]
+
+    def correlation(self, method: str = "shrunk") -> np.ndarray:
+        return cov_to_corr(self.covariances[method])
+
+    def index(self, tickers: Sequence[str]) -> np.ndarray:
+        position = {t: i for i, t in enumerate(self.tickers)}
+        return np.array([position[t] for t in tickers if t in position], dtype=int)
+
+    def pairs(self, method: str = "sample", exclude: Sequence[str] = ()) -> List[Dict]:
+        """종목 쌍 상관계수 (상삼각, |상관| 내림차순)"""
+        keep = [t for t in self.tickers if t not in set(exclude)]
+        idx = self.index(keep)
+        corr = self.correlation(method)[np.ix_(idx, idx)]
+        i, j = np.triu_indices(len(idx), k=1)
+        values = corr[i, j]
+        order = np.argsort(-np.abs(values), kind="stable")
+        return [
+            {"ticker1": keep[i[k]], "ticker2": keep[j[k]], "correlation": float(values[k])}
+            for k in order
+        ]
+
+    def portfolio_volatility(self, weights: Dict[str, float], method: str = "shrunk") -> Optional[float]:
+        """포트폴리오 일간 변동성 √(wᵀΣw) (가중치는 행렬에 있는 종목만 사용)"""
+        tickers = [t for t in weights if t in self.tickers]
+        if not tickers:
+            return None
+        idx = self.index(tickers)
+        w = np.array([weights[t] for t in tickers], dtype=float)
+        cov = self.covariance(method)[np.ix_(idx, idx)]
+        return float(np.sqrt(max(w @ cov @ w, 0.0)))
+
+    def betas(self, benchmark: str, method: str = "shrunk") -> Dict[str, float]:
+        """벤치마크 대비 베타 (cov(i, m) / var(m))"""
+        if benchmark not in self.tickers:
+            return {}
+        cov = self.covariance(method)
+        m = self.tickers.index(benchmark)
+        var_m = cov[m, m]
+        if var_m <= 0:
+            return {}
+        return {t: float(cov[i, m] / var_m) for i, t in enumerate(self.tickers) if t != benchmark}
+
+
+@dataclass
+class _DailyState:
+    """종목 집합별 일 캐시 (완료된 일봉 수익률 + 마지막 종가)"""
+    tickers: List[str]
+    excluded: List[str]
+    as_of: date
+    last_close_date: Optional[date]
+    returns: np.ndarray
+    last_close: np.ndarray
+    matrix: Optional[CorrelationMatrix] = None
+    intraday_row: Optional[np.ndarray] = None
+    intraday_at: Optional[datetime] = None
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+class CorrelationEngine:
+    """
+    보유 종목 상관/공분산 엔진 (일 캐시 + 장중 증분 갱신)
+    """
+
+    def __init__(
+        self,
+        close_loader: Optional[CloseLoader] = None,
+        price_source: Optional[PriceSource] = None,
+        lookback_days: int = 60,
+        ewma_lambda: float = 0.94,
+        min_observations: int = 20,
+        intraday_refresh_seconds: float = 300.0,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        """
+        초기화
+
+        Args:
+            close_loader: 종가 로더 (기본: stock_prices 동기 세션을 스레드에서 실행)
+            price_source: 장중 현재가 소스 (기본: 공유 시장 스냅샷 서비스)
+            lookback_days: 기본 수익률 관측 거래일 수
+            ewma_lambda: EWMA 감쇠 계수
+            min_observations: 종목 포함 최소 관측치
+            intraday_refresh_seconds: 장중 오늘 수익률 행 갱신 주기
+            clock: 현재 시각 (테스트용)
+        """
+        self.close_loader = close_loader or load_closes_from_db
+        self._price_source = price_source
+        self.lookback_days = lookback_days
+        self.ewma_lambda = ewma_lambda
+        self.min_observations = min_observations
+        self.intraday_refresh_seconds = intraday_refresh_seconds
+        self.clock = clock
+
+        self._states: Dict[Tuple[Tuple[str, ...], int], _DailyState] = {}
+        self._locks: Dict[Tuple[Tuple[str, ...], int], asyncio.Lock] = {}
+        self._day: Optional[date] = None
+
+        self.stats = {
+            "daily_loads": 0,
+            "cache_hits": 0,
+            "intraday_updates": 0,
+            "computations": 0,
+            "evictions": 0,
+        }
+
+    async def get_matrix(
+        self,
+        tickers: Sequence[str],
+        lookback_days: Optional[int] = None,
+        close_loader: Optional[CloseLoader] = None,
+        intraday: bool = True,
+    ) -> Optional[CorrelationMatrix]:
+        """
+        상관/공분산 행렬 (종목 집합·lookback 별 일 캐시)
+
+        Args:
+            tickers: 종목 리스트 (순서 무관)
+            lookback_days: 관측 거래일 수 (기본: 엔진 설정)
+            close_loader: 이번 조회에만 사용할 종가 로더 (예: 호출자의 DB 세션)
+            intraday: 장중 현재가로 오늘 수익률 행 반영 여부
+
+        Returns:
+            CorrelationMatrix (유효 종목 2개 미만이면 None)
+        """
+        lookback = lookback_days or self.lookback_days
+        key = (tuple(sorted(set(tickers))), lookback)
+        if len(key[0]) < 2:
+            return None
+
+        self._evict_past_days(self.clock().date())
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            today = self.clock().date()
+            state = self._states.get(key)
+            if state is None or state.as_of != today:
+                state = await self._load_state(key[0], lookback, today, close_loader or self.close_loader)
+                if state is None:
+                    return None
+                self._states[key] = state
+            else:
+                self.stats["cache_hits"] += 1
+
+            if intraday:
+                await self._refresh_intraday(state)
+
+            if state.matrix is None:
+                state.matrix = self._compute(state)
+            return state.matrix
+
+    def update_intraday(self, prices: Dict[str, Optional[float]]) -> int:
+        """
+        현재가로 오늘 수익률 행 갱신 (DB 조회 없음)
+
+        Returns:
+            갱신된 캐시 항목 수
+        """
+        updated = 0
+        today = self.clock().date()
+        if today.weekday() >= 5:
+            return 0  # 주말: 마지막 종가 그대로이므로 새 관측치가 아님
+        for state in self._states.values():
+            if state.as_of != today or (state.last_close_date and state.last_close_date >= today):
+                continue
+            current = np.array([prices.get(t) or np.nan for t in state.tickers], dtype=float)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                row = current / state.last_close - 1.0
+            # 현재가가 없는 종목은 오늘 변동 없음으로 간주
+            state.intraday_row = np.nan_to_num(row, nan=0.0, posinf=0.0, neginf=0.0)
+            state.intraday_at = self.clock()
+            state.matrix = None
+            updated += 1
+        self.stats["intraday_updates"] += updated
+        return updated
+
+    def invalidate(self) -> None:
+        """일 캐시 초기화"""
+        self._states.clear()
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "cached_sets": len(self._states)}
+
+    # ------------------------------------------------------------------
+
+    def _evict_past_days(self, today: date) -> None:
+        """날짜가 바뀌면 지난 날의 캐시 항목과 사용 중이 아닌 락 제거"""
+        if self._day == today:
+            return
+        self._day = today
+        stale = [key for key, state in self._states.items() if state.as_of != today]
+        for key in stale:
+            del self._states[key]
+        # 보유 중인 락은 남겨 같은 키의 동시 로드가 직렬화되도록 유지
+        for key in [k for k, lock in self._locks.items() if k not in self._states and not lock.locked()]:
+            del self._locks[key]
+        self.stats["evictions"] += len(stale)
+
+    async def _load_state(
+        self,
+        tickers: Tuple[str, ...],
+        lookback: int,
+        today: date,
+        loader: CloseLoader,
+    ) -> Optional[_DailyState]:
+        # 거래일 lookback + 휴장일 여유
+        start = today - timedelta(days=int(lookback * 7 / 5) + 10)
+        closes = await loader(list(tickers), start)
+        self.stats["daily_loads"] += 1
+        if closes is None or closes.empty:
+            return None
+
+        # 오늘 종가(장중 임시 값)는 제외하고 완료된 일봉만 사용
+        closes.index = pd.to_datetime(closes.index).normalize()
+        closes = closes[closes.index < pd.Timestamp(today)]
+
+        counts = closes.notna().sum()
+        usable = [t for t in tickers if t in closes.columns and counts.get(t, 0) > self.min_observations]
+        excluded = [t for t in tickers if t not in usable]
+        if len(usable) < 2:
+            return None
+
+        returns = daily_returns(closes[usable]).tail(lookback)
+        if len(returns) < self.min_observations:
+            return None
+
+        last = closes[usable].ffill().iloc[-1]
+        return _DailyState(
+            tickers=usable,
+            excluded=excluded,
+            as_of=today,
+            last_close_date=closes.index[-1].date(),
+            returns=returns.to_numpy(dtype=float),
+            last_close=last.to_numpy(dtype=float),
+        )
+
+    async def _refresh_intraday(self, state: _DailyState) -> None:
+        now = self.clock()
+        if state.intraday_at and (now - state.intraday_at).total_seconds() < self.intraday_refresh_seconds:
+            return
+        try:
+            source = self._price_source or _default_price_source
+            prices = await source(state.tickers)
+        except Exception as e:
+            logger.debug(f"[Correlation] intraday prices unavailable: {e}")
+            return
+        if any(prices.get(t) for t in state.tickers):
+            self.update_intraday(prices)
+
+    def _compute(self, state: _DailyState) -> CorrelationMatrix:
+        returns = state.returns
+        intraday = state.intraday_row is not None
+        if intraday:
+            # 가장 오래된 행을 밀어내고 오늘 행을 붙여 창 길이 유지
+            returns = np.vstack([returns[1:], state.intraday_row])
+
+        shrunk, shrinkage = ledoit_wolf(returns)
+        self.stats["computations"] += 1
+        return CorrelationMatrix(
+            tickers=list(state.tickers),
+            as_of=state.as_of,
+            observations=len(returns),
+            covariances={
+                "sample": np.cov(returns, rowvar=False),
+                "shrunk": shrunk,
+                "ewma": ewma_covariance(returns, self.ewma_lambda),
+            },
+            shrinkage=shrinkage,
+            intraday=intraday,
+            excluded=list(state.excluded),
+        )
+
+
+# ============================================================================
+# Default sources
+# ============================================================================
+
+def close_prices_query():
+    """stock_prices 종가 조회 (종목 IN + 시작일)"""
+    from sqlalchemy import bindparam, text
+
+    return text(
+        "SELECT ticker, time, close FROM stock_prices "
+        "WHERE ticker IN :tickers AND time >= :start ORDER BY time"
+    ).bindparams(bindparam("tickers", expanding=True))
+
+
+def closes_frame(rows) -> pd.DataFrame:
+    """(ticker, time, close) 행 → 날짜 × 종목 종가 행렬"""
+    if not rows:
+        return pd.DataFrame()
+    df = pd.DataFrame(rows, columns=["ticker", "time", "close"])
+    df["time"] = pd.to_datetime(df["time"], utc=True).dt.tz_localize(None).dt.normalize()
+    return df.pivot_table(index="time", columns="ticker", values="close", aggfunc="last").sort_index()
+
+
+async def load_closes_from_db(tickers: List[str], start: date) -> pd.DataFrame:
+    """stock_prices 하이퍼테이블에서 종가 행렬 조회 (쿼리 1회, 동기 세션은 스레드에서)"""
+    from backend.database.repository import get_sync_session
+
+    def _load():
+        session = get_sync_session()
+        try:
+            return session.execute(close_prices_query(), {"tickers": tickers, "start": start}).fetchall()
+        finally:
+            session.close()
+
+    return closes_frame(await asyncio.to_thread(_load))
+
+
+async def _default_price_source(tickers: List[str]) -> Dict[str, Optional[float]]:
+    from backend.market_data.snapshot_service import get_market_snapshot_service
+
+    return await get_market_snapshot_service().get_prices(tickers)
+
+
+# 싱글톤 인스턴스
+_correlation_engine: Optional[CorrelationEngine] = None
+
+
+def get_correlation_engine() -> CorrelationEngine:
+    """CorrelationEngine 싱글톤 반환"""
+    global _correlation_engine
+    if _correlation_engine is None:
+        _correlation_engine = CorrelationEngine()
+    return _correlation_engine
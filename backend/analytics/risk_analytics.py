@@ -18,14 +18,21 @@ from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, select
+from sqlalchemy import select
 import numpy as np
 
 from backend.core.models.analytics_models import (
-    DailyAnalytics,
-    TradeExecution,
     PortfolioSnapshot,
 )
+from backend.analytics import risk_metrics, rollups
+from backend.analytics.correlation_engine import (
+    TRADING_DAYS,
+    CorrelationEngine,
+    CorrelationMatrix,
+    close_prices_query,
+    closes_frame,
+    get_correlation_engine,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,20 +49,64 @@ class RiskAnalyzer:
     - Drawdown analysis
     """
 
-    def __init__(self, db_session: Session):
+    # Benchmark loaded alongside holdings for portfolio beta
+    BENCHMARK = "SPY"
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        correlation_engine: Optional[CorrelationEngine] = None,
+    ):
         """
         Initialize risk analyzer.
 
         Args:
             db_session: Database session
+            correlation_engine: Shared correlation engine (defaults to the process-wide instance)
         """
         self.db = db_session
+        self.correlation_engine = correlation_engine or get_correlation_engine()
+        # (start, end) → (dates, daily_return_pct, portfolio_value_eod) from daily_analytics
+        self._series_cache: Optional[Tuple[date, date, List[date], np.ndarray, np.ndarray]] = None
         logger.info("RiskAnalyzer initialized")
 
+    async def _load_daily_series(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> Tuple[List[date], np.ndarray, np.ndarray]:
+        """
+        Load precomputed daily return / value series (columns only).
+
+        The widest range loaded so far is cached on the analyzer, so dashboard
+        sections with shorter lookbacks slice it instead of querying again.
+        """
+        cached = self._series_cache
+        if cached is None or start_date < cached[0] or end_date > cached[1]:
+            result = await self.db.execute(rollups.daily_series_stmt(
+                start_date, end_date, columns=("date", "daily_return_pct", "portfolio_value_eod")
+            ))
+            rows = result.all()
+            cached = (
+                start_date,
+                end_date,
+                [rollups.as_date(r.date) for r in rows],
+                np.array([float(r.daily_return_pct or 0) for r in rows], dtype=float),
+                np.array([float(r.portfolio_value_eod or 0) for r in rows], dtype=float),
+            )
+            self._series_cache = cached
+
+        _, _, dates, returns, values = cached
+        ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
+        lo = int(np.searchsorted(ordinals, start_date.toordinal(), side="left"))
+        hi = int(np.searchsorted(ordinals, end_date.toordinal(), side="right"))
+        return dates[lo:hi], returns[lo:hi], values[lo:hi]
+
     async def calculate_var_metrics(
         self,
         lookback_days: int = 90,
         confidence_levels: List[float] = [0.95, 0.99],
+        method: str = risk_metrics.HISTORICAL,
     ) -> Dict:
         """
         Calculate Value at Risk (VaR) metrics.
@@ -63,6 +114,7 @@ class RiskAnalyzer:
         Args:
             lookback_days: Days of historical data
             confidence_levels: List of confidence levels
+            method: historical | parametric | cornish_fisher
 
         Returns:
             VaR metrics dictionary
@@ -73,39 +125,20 @@ class RiskAnalyzer:
         end_date = datetime.utcnow().date()
         start_date = end_date - timedelta(days=lookback_days)
 
-        stmt = select(DailyAnalytics).where(
-
-
-            
-            DailyAnalytics.date >= start_date,
-            DailyAnalytics.date <= end_date,
-        ).order_by(DailyAnalytics.date
-
-
-        )
-
-
-        result = await self.db.execute(stmt)
-
-
-        daily_records = result.scalars().all()
+        dates, returns_array, values = await self._load_daily_series(start_date, end_date)
 
-        if len(daily_records) < 20:
+        if len(dates) < 20:
             raise ValueError("Insufficient data for VaR calculation")
 
-        returns = [float(r.daily_return_pct or 0) for r in daily_records]
-        returns_array = np.array(returns)
-
         # Get current portfolio value
-        latest = daily_records[-1]
-        portfolio_value = float(latest.portfolio_value_eod)
+        portfolio_value = float(values[-1])
 
-        # Calculate VaR for each confidence level
+        # Calculate VaR / CVaR for all confidence levels in one pass
         var_results = {}
+        var_by_level = risk_metrics.value_at_risk(returns_array, confidence_levels, method)
 
         for confidence in confidence_levels:
-            percentile = (1 - confidence) * 100
-            var_pct = np.percentile(returns_array, percentile)
+            var_pct = var_by_level[float(confidence)]['var']
             var_usd = portfolio_value * (var_pct / 100)
 
             var_results[f"var_{int(confidence*100)}"] = {
@@ -115,26 +148,22 @@ class RiskAnalyzer:
                 'interpretation': f"${abs(var_usd):,.2f} max loss at {confidence*100}% confidence"
             }
 
-        # Calculate Conditional VaR (CVaR / Expected Shortfall)
+        # Conditional VaR (CVaR / Expected Shortfall)
         for confidence in confidence_levels:
-            percentile = (1 - confidence) * 100
-            threshold = np.percentile(returns_array, percentile)
-            tail_losses = returns_array[returns_array <= threshold]
+            cvar_pct = var_by_level[float(confidence)]['cvar']
+            cvar_usd = portfolio_value * (cvar_pct / 100)
 
-            if len(tail_losses) > 0:
-                cvar_pct = np.mean(tail_losses)
-                cvar_usd = portfolio_value * (cvar_pct / 100)
-
-                var_results[f"cvar_{int(confidence*100)}"] = {
-                    'confidence_level': confidence,
-                    'cvar_pct': float(cvar_pct),
-                    'cvar_usd': float(cvar_usd),
-                    'interpretation': f"${abs(cvar_usd):,.2f} expected loss if VaR is breached"
-                }
+            var_results[f"cvar_{int(confidence*100)}"] = {
+                'confidence_level': confidence,
+                'cvar_pct': float(cvar_pct),
+                'cvar_usd': float(cvar_usd),
+                'interpretation': f"${abs(cvar_usd):,.2f} expected loss if VaR is breached"
+            }
 
         result = {
             'lookback_days': lookback_days,
-            'data_points': len(returns),
+            'data_points': len(returns_array),
+            'method': method,
             'portfolio_value': portfolio_value,
             'var_metrics': var_results,
             'calculated_at': datetime.utcnow().isoformat(),
@@ -163,73 +192,25 @@ class RiskAnalyzer:
         end_date = datetime.utcnow().date()
         start_date = end_date - timedelta(days=lookback_days)
 
-        stmt = select(DailyAnalytics).where(
-
-
-            
-            DailyAnalytics.date >= start_date,
-            DailyAnalytics.date <= end_date,
-        ).order_by(DailyAnalytics.date
-
-
-        )
-
-
-        result = await self.db.execute(stmt)
-
-
-        daily_records = result.scalars().all()
+        dates, _, values = await self._load_daily_series(start_date, end_date)
 
-        if len(daily_records) < 10:
+        if len(dates) < 10:
             raise ValueError("Insufficient data for drawdown analysis")
 
-        # Calculate drawdowns
-        values = [float(r.portfolio_value_eod) for r in daily_records]
-        dates = [r.date for r in daily_records]
-
-        running_max = np.maximum.accumulate(values)
-        drawdowns = [(v - m) / m * 100 for v, m in zip(values, running_max)]
-
-        # Find maximum drawdown
-        max_dd_idx = np.argmin(drawdowns)
-        max_drawdown_pct = drawdowns[max_dd_idx]
-
-        # Find peak before max drawdown
-        peak_idx = np.argmax(values[:max_dd_idx+1])
-
-        # Calculate recovery time if recovered
-        recovery_days = None
-        if max_dd_idx < len(values) - 1:
-            peak_value = values[peak_idx]
-            for i in range(max_dd_idx + 1, len(values)):
-                if values[i] >= peak_value:
-                    recovery_days = i - max_dd_idx
-                    break
-
-        # Current drawdown
-        current_max = max(values)
-        current_value = values[-1]
-        current_drawdown = ((current_value - current_max) / current_max) * 100
-
-        # Drawdown duration
-        drawdown_durations = []
-        current_duration = 0
-        in_drawdown = False
-
-        for i in range(len(values)):
-            if values[i] < running_max[i]:
-                if not in_drawdown:
-                    in_drawdown = True
-                    current_duration = 1
-                else:
-                    current_duration += 1
-            else:
-                if in_drawdown and current_duration > 0:
-                    drawdown_durations.append(current_duration)
-                in_drawdown = False
-                current_duration = 0
+        summary = risk_metrics.drawdown_summary(values)
+        max_dd_idx = summary.trough_index
+        peak_idx = summary.peak_index
+        max_drawdown_pct = summary.max_drawdown * 100
+        recovery_days = summary.recovery_periods
+
+        # Current drawdown (vs. highest value in the window)
+        current_max = float(values.max())
+        current_value = float(values[-1])
+        current_drawdown = summary.current_drawdown * 100
 
-        avg_drawdown_duration = np.mean(drawdown_durations) if drawdown_durations else 0
+        # Drawdown duration: closed underwater runs (an open run at the end is excluded)
+        drawdown_durations = summary.durations
+        avg_drawdown_duration = drawdown_durations.mean() if drawdown_durations.size else 0
 
         result = {
             'lookback_days': lookback_days,
@@ -237,8 +218,8 @@ class RiskAnalyzer:
                 'pct': float(max_drawdown_pct),
                 'peak_date': dates[peak_idx].isoformat(),
                 'trough_date': dates[max_dd_idx].isoformat(),
-                'peak_value': values[peak_idx],
-                'trough_value': values[max_dd_idx],
+                'peak_value': float(values[peak_idx]),
+                'trough_value': float(values[max_dd_idx]),
                 'recovery_days': recovery_days,
             },
             'current_drawdown': {
@@ -249,7 +230,7 @@ class RiskAnalyzer:
             'statistics': {
                 'avg_drawdown_duration_days': float(avg_drawdown_duration),
                 'total_drawdown_periods': len(drawdown_durations),
-                'max_drawdown_duration_days': max(drawdown_durations) if drawdown_durations else 0,
+                'max_drawdown_duration_days': int(drawdown_durations.max()) if drawdown_durations.size else 0,
             },
             'calculated_at': datetime.utcnow().isoformat(),
         }
@@ -349,96 +330,100 @@ class RiskAnalyzer:
 
         return result
 
+    async def _load_closes(self, tickers: List[str], start: date):
+        """Close price matrix from stock_prices using this analyzer's session."""
+        result = await self.db.execute(close_prices_query(), {"tickers": tickers, "start": start})
+        return closes_frame(result.all())
+
+    async def _latest_snapshot(self) -> Optional[PortfolioSnapshot]:
+        stmt = select(PortfolioSnapshot).order_by(PortfolioSnapshot.snapshot_date.desc()).limit(1)
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+
+    async def _position_matrix(
+        self,
+        snapshot: Optional[PortfolioSnapshot],
+        lookback_days: int,
+    ) -> Tuple[Dict[str, float], Optional[CorrelationMatrix]]:
+        """
+        Position weights and the shared (daily-cached) correlation matrix
+        for the held tickers plus the benchmark.
+        """
+        if snapshot is None or not snapshot.positions:
+            return {}, None
+
+        total_value = float(snapshot.total_value or 0)
+        weights: Dict[str, float] = {}
+        for pos in snapshot.positions:
+            ticker = pos.get('ticker')
+            if ticker and total_value > 0:
+                weights[ticker] = weights.get(ticker, 0.0) + float(pos.get('value', 0)) / total_value
+
+        matrix = await self.correlation_engine.get_matrix(
+            list(weights) + [self.BENCHMARK],
+            lookback_days=lookback_days,
+            close_loader=self._load_closes,
+        )
+        return weights, matrix
+
     async def analyze_correlation_risk(
         self,
         lookback_days: int = 60,
     ) -> Dict:
         """
-        Analyze correlation between positions.
+        Analyze correlation between held positions.
+
+        Uses aligned daily returns from stock_prices (sample correlation for
+        pairs, Ledoit-Wolf covariance for portfolio volatility, EWMA for the
+        recent-regime comparison).
 
         Args:
-            lookback_days: Days of historical data
+            lookback_days: Trading days of return history
 
         Returns:
             Correlation analysis
         """
         logger.info(f"Analyzing correlation risk ({lookback_days} days)")
 
-        # Get recent trades
-        end_date = datetime.utcnow().date()
-        start_date = end_date - timedelta(days=lookback_days)
-
-        stmt = select(TradeExecution).where(
+        weights, matrix = await self._position_matrix(await self._latest_snapshot(), lookback_days)
+        held = [t for t in weights if matrix is not None and t in matrix.tickers]
 
-
-            
-            func.date(TradeExecution.execution_timestamp) >= start_date,
-            func.date(TradeExecution.execution_timestamp) <= end_date,
-        
-
-        )
-
-        result = await self.db.execute(stmt)
-
-        snapshot = result.scalars().all()
-
-        # Group trades by ticker
-        ticker_returns = {}
-        for trade in trades:
-            if trade.pnl_pct is not None:
-                if trade.ticker not in ticker_returns:
-                    ticker_returns[trade.ticker] = []
-                ticker_returns[trade.ticker].append(float(trade.pnl_pct))
-
-        # Calculate average correlation
-        if len(ticker_returns) < 2:
+        if len(held) < 2:
             return {
                 'message': 'Insufficient data for correlation analysis',
-                'tickers_analyzed': len(ticker_returns),
+                'tickers_analyzed': len(held),
             }
 
-        # Find highly correlated pairs
-        correlations = []
-        tickers = list(ticker_returns.keys())
-
-        for i in range(len(tickers)):
-            for j in range(i + 1, len(tickers)):
-                ticker1 = tickers[i]
-                ticker2 = tickers[j]
-
-                returns1 = ticker_returns[ticker1]
-                returns2 = ticker_returns[ticker2]
-
-                # Need at least 5 data points
-                if len(returns1) >= 5 and len(returns2) >= 5:
-                    # Align lengths
-                    min_len = min(len(returns1), len(returns2))
-                    r1 = np.array(returns1[:min_len])
-                    r2 = np.array(returns2[:min_len])
-
-                    # Calculate correlation
-                    if len(r1) > 1:
-                        corr = np.corrcoef(r1, r2)[0, 1]
-                        if not np.isnan(corr):
-                            correlations.append({
-                                'ticker1': ticker1,
-                                'ticker2': ticker2,
-                                'correlation': float(corr),
-                            })
-
-        # Sort by absolute correlation
-        correlations.sort(key=lambda x: abs(x['correlation']), reverse=True)
-
-        # Average absolute correlation
+        # Benchmark is only part of the matrix for beta; exclude it unless held
+        exclude = () if self.BENCHMARK in weights else (self.BENCHMARK,)
+        correlations = matrix.pairs(method="sample", exclude=exclude)
         avg_correlation = np.mean([abs(c['correlation']) for c in correlations]) if correlations else 0
 
+        held_weights = {t: weights[t] for t in held}
+        vol_shrunk = matrix.portfolio_volatility(held_weights, method="shrunk")
+        vol_ewma = matrix.portfolio_volatility(held_weights, method="ewma")
+
+        # Diversification ratio: weighted sum of stand-alone vols / portfolio vol
+        idx = matrix.index(held)
+        stand_alone = np.sqrt(np.diag(matrix.covariance("shrunk"))[idx])
+        weighted_vol = float(np.dot([held_weights[t] for t in held], stand_alone))
+        diversification_ratio = weighted_vol / vol_shrunk if vol_shrunk else None
+
         result = {
             'lookback_days': lookback_days,
-            'tickers_analyzed': len(ticker_returns),
+            'as_of': matrix.as_of.isoformat(),
+            'observations': matrix.observations,
+            'tickers_analyzed': len(held),
+            'excluded_tickers': [t for t in matrix.excluded if t != self.BENCHMARK],
             'correlation_pairs': len(correlations),
             'avg_absolute_correlation': float(avg_correlation),
             'highly_correlated': [c for c in correlations if abs(c['correlation']) > 0.7][:10],
             'negatively_correlated': [c for c in correlations if c['correlation'] < -0.5][:10],
+            'shrinkage_intensity': matrix.shrinkage,
+            'portfolio_volatility_annual_pct': vol_shrunk * np.sqrt(TRADING_DAYS) * 100 if vol_shrunk is not None else None,
+            'ewma_volatility_annual_pct': vol_ewma * np.sqrt(TRADING_DAYS) * 100 if vol_ewma is not None else None,
+            'diversification_ratio': diversification_ratio,
+            'includes_intraday': matrix.intraday,
             'calculated_at': datetime.utcnow().isoformat(),
         }
 
@@ -449,12 +434,17 @@ class RiskAnalyzer:
     async def stress_test_portfolio(
         self,
         scenarios: Optional[List[Dict]] = None,
+        lookback_days: int = 60,
     ) -> Dict:
         """
         Perform stress testing on portfolio.
 
+        Market shocks scale by the portfolio beta and volatility shocks by the
+        parametric 99% 1-day VaR, both from the shared covariance matrix.
+
         Args:
             scenarios: List of stress scenarios
+            lookback_days: Trading days of return history for beta/volatility
 
         Returns:
             Stress test results
@@ -471,11 +461,7 @@ class RiskAnalyzer:
             ]
 
         # Get current portfolio
-        stmt = select(PortfolioSnapshot).order_by(
-            PortfolioSnapshot.snapshot_date.desc()
-        )
-        result = await self.db.execute(stmt)
-        latest_snapshot = result.scalars().first()
+        latest_snapshot = await self._latest_snapshot()
 
         if not latest_snapshot:
             raise ValueError("No portfolio data available")
@@ -483,8 +469,16 @@ class RiskAnalyzer:
         current_value = float(latest_snapshot.total_value)
         positions = latest_snapshot.positions or []
 
-        # Calculate average portfolio beta (simplified - assume 1.0 for now)
+        # Portfolio beta / daily volatility from the shared covariance matrix
+        # (falls back to beta 1.0 and a flat 5% VaR when price history is missing)
         portfolio_beta = 1.0
+        daily_volatility = None
+        weights, matrix = await self._position_matrix(latest_snapshot, lookback_days)
+        if matrix is not None:
+            betas = matrix.betas(self.BENCHMARK)
+            if betas:
+                portfolio_beta = sum(w * betas.get(t, 1.0) for t, w in weights.items())
+            daily_volatility = matrix.portfolio_volatility(weights)
 
         # Perform stress tests
         stress_results = []
@@ -499,10 +493,12 @@ class RiskAnalyzer:
                 scenario_impact = impact
 
             elif 'volatility_shock' in scenario:
-                # Estimate impact based on VaR
+                # Additional 1-day 99% VaR from scaled volatility
                 volatility_increase = scenario['volatility_shock']
-                # Simplified: assume VaR increases proportionally
-                var_impact = current_value * -0.05 * volatility_increase
+                if daily_volatility:
+                    var_impact = -current_value * 2.326 * daily_volatility * volatility_increase
+                else:
+                    var_impact = current_value * -0.05 * volatility_increase
                 scenario_impact = var_impact
 
             elif 'sector_shock' in scenario:
@@ -523,6 +519,8 @@ class RiskAnalyzer:
 
         result = {
             'current_portfolio_value': current_value,
+            'portfolio_beta': float(portfolio_beta),
+            'daily_volatility_pct': daily_volatility * 100 if daily_volatility is not None else None,
             'stress_scenarios': stress_results,
             'worst_case': min(stress_results, key=lambda x: x['impact_usd']),
             'calculated_at': datetime.utcnow().isoformat(),
@@ -542,6 +540,10 @@ class RiskAnalyzer:
         logger.info("Generating risk dashboard")
 
         try:
+            # Load the 180-day daily series once; VaR (90d) slices it
+            today = datetime.utcnow().date()
+            await self._load_daily_series(today - timedelta(days=180), today)
+
             # Get all risk metrics
             var_metrics = await self.calculate_var_metrics(lookback_days=90)
             drawdown = await self.analyze_drawdown_metrics(lookback_days=180)
@@ -0,0 +1,343 @@
+"""
+Risk Metrics - Shared vectorized drawdown / VaR / rolling ratio engine
+
+모든 엔진(RiskAnalyzer, 롤업, Shadow Trading, 백테스트)이 같은 구현을 사용하도록
+NumPy 배열 기반 리스크 지표를 한 곳에 모읍니다.
+
+구성:
+  - Drawdown: 낙폭 시계열, 최대 낙폭 (고점/저점/회복 인덱스), 수중(underwater) 구간 길이
+  - VaR / CVaR: historical, parametric (정규), Cornish-Fisher (왜도·첨도 보정)
+    여러 신뢰수준을 한 번의 정렬/분위수 계산으로 처리
+  - Rolling Sharpe / Sortino: 누적합 기반 O(n) 윈도우 계산 (윈도우 길이 무관)
+
+규약:
+  - equity: 자산 가치 배열 (양수), drawdown은 비율(≤ 0)로 반환
+  - returns: 기간 수익률 배열, 입력 단위(비율 또는 %)를 그대로 유지
+  - VaR / CVaR은 손실을 음수 수익률로 반환 (기존 risk_analytics 규약과 동일)
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+TRADING_DAYS = 252
+
+HISTORICAL = "historical"
+PARAMETRIC = "parametric"
+CORNISH_FISHER = "cornish_fisher"
+VAR_METHODS = (HISTORICAL, PARAMETRIC, CORNISH_FISHER)
+
+# Cornish-Fisher CVaR: 꼬리 구간 분위수 평균을 위한 적분 격자 크기
+_CF_TAIL_GRID = 200
+
+_NORMAL = NormalDist()
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+
+# =============================================================================
+# Drawdown
+# =============================================================================
+
+@dataclass
+class DrawdownSummary:
+    """최대 낙폭 요약 (인덱스는 입력 배열 기준)"""
+
+    max_drawdown: float           # 비율 (≤ 0)
+    peak_index: int
+    trough_index: int
+    recovery_index: Optional[int]  # 고점 회복 시점 (미회복이면 None)
+    current_drawdown: float       # 마지막 값의 낙폭 (비율)
+    durations: np.ndarray         # 회복된 수중 구간 길이 (기간 수)
+    open_duration: int            # 현재 진행 중인 수중 구간 길이 (0이면 고점)
+
+    @property
+    def recovery_periods(self) -> Optional[int]:
+        if self.recovery_index is None:
+            return None
+        return self.recovery_index - self.trough_index
+
+
+def as_array(values: ArrayLike) -> np.ndarray:
+    """리스트 / 배열 → float64 1차원 배열"""
+    return np.asarray(values, dtype=float).reshape(-1)
+
+
+def equity_from_returns(returns: ArrayLike, start: float = 1.0) -> np.ndarray:
+    """수익률(비율) → 누적 자산 곡선"""
+    return start * np.cumprod(1 + as_array(returns))
+
+
+def drawdown_series(equity: ArrayLike) -> np.ndarray:
+    """
+    낙폭 시계열 (비율, ≤ 0)
+
+    고점이 0 이하인 구간은 0으로 처리합니다.
+    """
+    values = as_array(equity)
+    if not values.size:
+        return values
+    running_max = np.maximum.accumulate(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = np.where(running_max > 0, values / running_max - 1, 0.0)
+    return drawdowns
+
+
+def max_drawdown(equity: ArrayLike) -> float:
+    """최대 낙폭 (비율, ≤ 0). 데이터가 없으면 0"""
+    drawdowns = drawdown_series(equity)
+    return float(drawdowns.min()) if drawdowns.size else 0.0
+
+
+def underwater_durations(equity: ArrayLike) -> np.ndarray:
+    """
+    수중 구간 길이 배열 (고점 아래에 머문 연속 기간 수)
+
+    마지막 구간이 아직 회복되지 않았다면 마지막 원소로 포함됩니다.
+    """
+    values = as_array(equity)
+    if not values.size:
+        return np.zeros(0, dtype=np.int64)
+    underwater = np.concatenate(([0], (values < np.maximum.accumulate(values)).astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(underwater))
+    return (edges[1::2] - edges[::2]).astype(np.int64)
+
+
+def drawdown_summary(equity: ArrayLike) -> DrawdownSummary:
+    """최대 낙폭 / 회복 / 수중 구간 통계를 한 번에 계산"""
+    values = as_array(equity)
+    if not values.size:
+        return DrawdownSummary(0.0, 0, 0, None, 0.0, np.zeros(0, dtype=np.int64), 0)
+
+    drawdowns = drawdown_series(values)
+    trough = int(np.argmin(drawdowns))
+    peak = int(np.argmax(values[:trough + 1]))
+
+    recovery = None
+    if drawdowns[trough] < 0:
+        recovered = np.flatnonzero(values[trough + 1:] >= values[peak])
+        if recovered.size:
+            recovery = trough + 1 + int(recovered[0])
+
+    durations = underwater_durations(values)
+    open_duration = 0
+    if drawdowns[-1] < 0 and durations.size:
+        open_duration = int(durations[-1])
+        durations = durations[:-1]
+
+    return DrawdownSummary(
+        max_drawdown=float(drawdowns[trough]),
+        peak_index=peak,
+        trough_index=trough,
+        recovery_index=recovery,
+        current_drawdown=float(drawdowns[-1]),
+        durations=durations,
+        open_duration=open_duration,
+    )
+
+
+# =============================================================================
+# VaR / CVaR
+# =============================================================================
+
+def _tail_probabilities(confidence_levels: ArrayLike) -> np.ndarray:
+    levels = as_array(confidence_levels)
+    if np.any((levels <= 0) | (levels >= 1)):
+        raise ValueError("confidence levels must be in (0, 1)")
+    return 1 - levels
+
+
+def _moments(returns: np.ndarray):
+    mu = returns.mean()
+    sigma = returns.std(ddof=1) if returns.size > 1 else 0.0
+    if sigma > 0:
+        z = (returns - mu) / returns.std()
+        skew = float(np.mean(z ** 3))
+        excess_kurt = float(np.mean(z ** 4) - 3)
+    else:
+        skew = excess_kurt = 0.0
+    return float(mu), float(sigma), skew, excess_kurt
+
+
+def _normal_ppf(probabilities: np.ndarray) -> np.ndarray:
+    return np.array([_NORMAL.inv_cdf(float(p)) for p in probabilities.reshape(-1)]).reshape(probabilities.shape)
+
+
+def _normal_pdf(z: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * z ** 2) / np.sqrt(2 * np.pi)
+
+
+def _cornish_fisher_z(z: np.ndarray, skew: float, excess_kurt: float) -> np.ndarray:
+    return (
+        z
+        + (z ** 2 - 1) * skew / 6
+        + (z ** 3 - 3 * z) * excess_kurt / 24
+        - (2 * z ** 3 - 5 * z) * skew ** 2 / 36
+    )
+
+
+def value_at_risk(
+    returns: ArrayLike,
+    confidence_levels: ArrayLike = (0.95, 0.99),
+    method: str = HISTORICAL,
+) -> Dict[float, Dict[str, float]]:
+    """
+    신뢰수준별 VaR / CVaR (Expected Shortfall)
+
+    Args:
+        returns: 기간 수익률 배열 (비율 또는 %)
+        confidence_levels: 신뢰수준 목록 (예: 0.95, 0.99)
+        method: historical | parametric | cornish_fisher
+
+    Returns:
+        {confidence: {"var": ..., "cvar": ...}} — 손실은 음수 (입력과 같은 단위)
+    """
+    if method not in VAR_METHODS:
+        raise ValueError(f"Unknown VaR method: {method}")
+
+    data = as_array(returns)
+    data = data[~np.isnan(data)]
+    levels = as_array(confidence_levels)
+    tails = _tail_probabilities(levels)
+    if not data.size:
+        return {float(c): {"var": 0.0, "cvar": 0.0} for c in levels}
+
+    if method == HISTORICAL:
+        var = np.percentile(data, tails * 100)
+        # 정렬 한 번 + 누적합으로 모든 신뢰수준의 꼬리 평균 계산
+        ordered = np.sort(data)
+        counts = np.searchsorted(ordered, var, side="right")
+        prefix = np.concatenate(([0.0], np.cumsum(ordered)))
+        cvar = np.where(counts > 0, prefix[counts] / np.maximum(counts, 1), var)
+    else:
+        mu, sigma, skew, excess_kurt = _moments(data)
+        z = _normal_ppf(tails)
+        if method == PARAMETRIC:
+            var = mu + sigma * z
+            cvar = mu - sigma * _normal_pdf(z) / tails
+        else:
+            var = mu + sigma * _cornish_fisher_z(z, skew, excess_kurt)
+            # ES_α = (1/α) ∫₀^α VaR_u du — 꼬리 확률 격자 중점에서 CF 분위수 평균
+            grid = (np.arange(_CF_TAIL_GRID) + 0.5) / _CF_TAIL_GRID
+            tail_z = _normal_ppf(np.outer(tails, grid))
+            cvar = mu + sigma * _cornish_fisher_z(tail_z, skew, excess_kurt).mean(axis=1)
+
+    return {
+        float(c): {"var": float(v), "cvar": float(cv)}
+        for c, v, cv in zip(levels, np.atleast_1d(var), np.atleast_1d(cvar))
+    }
+
+
+def historical_var(returns: ArrayLike, confidence: float = 0.95) -> float:
+    return value_at_risk(returns, (confidence,), HISTORICAL)[confidence]["var"]
+
+
+def historical_cvar(returns: ArrayLike, confidence: float = 0.95) -> float:
+    return value_at_risk(returns, (confidence,), HISTORICAL)[confidence]["cvar"]
+
+
+# =============================================================================
+# Ratios (full-sample and rolling)
+# =============================================================================
+
+def sharpe_ratio(
+    returns: ArrayLike,
+    risk_free: float = 0.0,
+    periods_per_year: int = TRADING_DAYS,
+    ddof: int = 1,
+) -> float:
+    """연율화 Sharpe (risk_free는 기간당 수익률). 표준편차 0이면 0"""
+    data = as_array(returns)
+    if data.size <= ddof:
+        return 0.0
+    std = data.std(ddof=ddof)
+    if not std > 0:
+        return 0.0
+    return float((data.mean() - risk_free) / std * np.sqrt(periods_per_year))
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    prefix = np.concatenate(([0.0], np.cumsum(values)))
+    return prefix[window:] - prefix[:-window]
+
+
+def _rolling_prefix(data: np.ndarray, window: int, stat: np.ndarray) -> np.ndarray:
+    """길이 n 결과 배열 (앞쪽 window-1개는 NaN)"""
+    out = np.full(data.size, np.nan)
+    out[window - 1:] = stat
+    return out
+
+
+def rolling_sharpe(
+    returns: ArrayLike,
+    window: int,
+    risk_free: float = 0.0,
+    periods_per_year: int = TRADING_DAYS,
+) -> np.ndarray:
+    """
+    윈도우별 연율화 Sharpe (표본 표준편차, ddof=1)
+
+    누적합으로 윈도우 평균/분산을 한 번에 계산합니다. 앞쪽 window-1개와
+    분산이 0인 윈도우는 NaN입니다.
+    """
+    data = as_array(returns) - risk_free
+    if window < 2:
+        raise ValueError("window must be >= 2")
+    if data.size < window:
+        return np.full(data.size, np.nan)
+
+    # 수치 안정성: 전체 평균을 빼고 누적 (분산은 이동 불변)
+    shifted = data - data.mean()
+    sums = _window_sums(shifted, window)
+    sq_sums = _window_sums(shifted ** 2, window)
+    mean = sums / window
+    var = np.maximum(sq_sums - window * mean ** 2, 0.0) / (window - 1)
+    std = np.sqrt(var)
+    window_mean = mean + data.mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(std > 1e-12 * (np.abs(window_mean) + 1), window_mean / std, np.nan)
+    return _rolling_prefix(data, window, ratio * np.sqrt(periods_per_year))
+
+
+def rolling_sortino(
+    returns: ArrayLike,
+    window: int,
+    target: float = 0.0,
+    periods_per_year: int = TRADING_DAYS,
+) -> np.ndarray:
+    """
+    윈도우별 연율화 Sortino
+
+    하방 편차 = sqrt(mean(min(r - target, 0)²)) (윈도우 전체 길이 기준).
+    하방 편차가 0인 윈도우는 NaN입니다.
+    """
+    data = as_array(returns) - target
+    if window < 2:
+        raise ValueError("window must be >= 2")
+    if data.size < window:
+        return np.full(data.size, np.nan)
+
+    mean = _window_sums(data, window) / window
+    downside = np.sqrt(_window_sums(np.minimum(data, 0.0) ** 2, window) / window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(downside > 0, mean / downside, np.nan)
+    return _rolling_prefix(data, window, ratio * np.sqrt(periods_per_year))
+
+
+def rolling_max_drawdown(equity: ArrayLike, window: int) -> np.ndarray:
+    """윈도우별 최대 낙폭 (비율). 앞쪽 window-1개는 NaN"""
+    values = as_array(equity)
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    if values.size < window:
+        return np.full(values.size, np.nan)
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    running_max = np.maximum.accumulate(windows, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = np.where(running_max > 0, windows / running_max - 1, 0.0)
+    return _rolling_prefix(values, window, drawdowns.min(axis=1))
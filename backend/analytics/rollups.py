@@ -0,0 +1,384 @@
+"""
+Analytics Rollups - Set-based daily/weekly/monthly aggregation
+
+일별 지표를 날짜 범위 단위로 한 번에 집계합니다.
+
+구조:
+  - 원천 테이블 집계는 GROUP BY date SQL로 DB에서 수행 (범위 조건은 인덱스 사용 가능한
+    timestamp >= start AND timestamp < end+1 형태)
+      * trade_executions (체결일): 거래 수, 매수/매도, 거래대금, 슬리피지, 체결 시간
+      * trade_executions (청산일, CLOSED): 승/패, 평균 수익/손실률
+      * signal_performance (생성일): 시그널 수, 평균 신뢰도, 적중률
+  - 리스크 지표(Sharpe/Sortino/MDD/변동성/VaR)는 daily_analytics 수익률 시계열 한 번 로드 후
+    30일 윈도우를 NumPy 슬라이스로 계산
+  - 주간/월간 롤업은 daily_analytics 행에서만 파생
+
+Statement 빌더는 동기 Session / AsyncSession 모두에서 실행할 수 있습니다.
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import and_, case, func, null, select
+
+from backend.analytics import risk_metrics
+from backend.core.models.analytics_models import (
+    DailyAnalytics,
+    PortfolioSnapshot,
+    SignalPerformance,
+    TradeExecution,
+)
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+RISK_WINDOW_DAYS = 30
+RISK_MIN_RECORDS = 5
+
+# 주간/월간 롤업에 필요한 daily_analytics 컬럼
+ROLLUP_COLUMNS = (
+    "date",
+    "portfolio_value_eod",
+    "daily_pnl",
+    "daily_return_pct",
+    "total_trades",
+    "total_volume_usd",
+    "win_count",
+    "loss_count",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "max_drawdown_pct",
+    "ai_cost_usd",
+    "ai_tokens_used",
+)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def as_date(value) -> date:
+    """DB 드라이버별 date 표현(date / datetime / 'YYYY-MM-DD') 정규화"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def to_float(value) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def to_decimal(value) -> Optional[Decimal]:
+    if value is None:
+        return None
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def day_bounds(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """[start 00:00, end+1 00:00) timestamp 범위"""
+    return (
+        datetime.combine(start_date, time.min),
+        datetime.combine(end_date + timedelta(days=1), time.min),
+    )
+
+
+# =============================================================================
+# Grouped SQL
+# =============================================================================
+
+def trade_activity_stmt(start_date: date, end_date: date):
+    """체결일별 거래 활동 / 체결 품질"""
+    lo, hi = day_bounds(start_date, end_date)
+    day = func.date(TradeExecution.execution_timestamp).label("day")
+    return (
+        select(
+            day,
+            func.count().label("total"),
+            func.sum(case((TradeExecution.action == "BUY", 1), else_=0)).label("buys"),
+            func.sum(case((TradeExecution.action == "SELL", 1), else_=0)).label("sells"),
+            func.coalesce(func.sum(TradeExecution.position_size_usd), 0).label("volume_usd"),
+            func.avg(func.coalesce(TradeExecution.slippage_bps, 0)).label("avg_slippage_bps"),
+            func.avg(func.coalesce(TradeExecution.execution_time_ms, 0)).label("avg_exec_time_ms"),
+        )
+        .where(TradeExecution.execution_timestamp >= lo, TradeExecution.execution_timestamp < hi)
+        .group_by(day)
+    )
+
+
+def closed_trade_stmt(start_date: date, end_date: date):
+    """청산일별 승/패 통계 (is_win이 NULL이면 패로 집계)"""
+    lo, hi = day_bounds(start_date, end_date)
+    day = func.date(TradeExecution.exit_timestamp).label("day")
+    win = TradeExecution.is_win.is_(True)
+    pnl_pct = func.coalesce(TradeExecution.pnl_pct, 0)
+    return (
+        select(
+            day,
+            func.count().label("closed"),
+            func.sum(case((win, 1), else_=0)).label("wins"),
+            func.avg(case((win, pnl_pct), else_=null())).label("avg_win_pct"),
+            func.avg(case((win, null()), else_=pnl_pct)).label("avg_loss_pct"),
+        )
+        .where(
+            TradeExecution.exit_timestamp >= lo,
+            TradeExecution.exit_timestamp < hi,
+            TradeExecution.status == "CLOSED",
+        )
+        .group_by(day)
+    )
+
+
+def signal_activity_stmt(start_date: date, end_date: date):
+    """생성일별 시그널 수 / 신뢰도 / 적중"""
+    lo, hi = day_bounds(start_date, end_date)
+    day = func.date(SignalPerformance.generated_at).label("day")
+    resolved = SignalPerformance.status == "RESOLVED"
+    return (
+        select(
+            day,
+            func.count().label("signals"),
+            func.avg(func.coalesce(SignalPerformance.confidence, 0)).label("avg_confidence"),
+            func.sum(case((resolved, 1), else_=0)).label("resolved"),
+            func.sum(case((and_(resolved, SignalPerformance.outcome == "WIN"), 1), else_=0)).label("resolved_wins"),
+        )
+        .where(SignalPerformance.generated_at >= lo, SignalPerformance.generated_at < hi)
+        .group_by(day)
+    )
+
+
+def snapshot_stmt(start_date: date, end_date: date):
+    """기간 내 포트폴리오 스냅샷 (같은 날짜는 마지막 스냅샷 사용)"""
+    return (
+        select(PortfolioSnapshot.snapshot_date, PortfolioSnapshot.total_value, PortfolioSnapshot.positions)
+        .where(PortfolioSnapshot.snapshot_date >= start_date, PortfolioSnapshot.snapshot_date <= end_date)
+        .order_by(PortfolioSnapshot.snapshot_date, PortfolioSnapshot.snapshot_timestamp)
+    )
+
+
+def daily_series_stmt(start_date: date, end_date: date, columns: Sequence[str] = ROLLUP_COLUMNS):
+    """daily_analytics에서 필요한 컬럼만 날짜순 조회"""
+    return (
+        select(*[getattr(DailyAnalytics, name) for name in columns])
+        .where(DailyAnalytics.date >= start_date, DailyAnalytics.date <= end_date)
+        .order_by(DailyAnalytics.date)
+    )
+
+
+def performance_summary_stmt(start_date: date, end_date: date):
+    """기간 성과 요약 (daily_analytics 한 번 집계)"""
+    return select(
+        func.count().label("days"),
+        func.sum(DailyAnalytics.daily_pnl).label("total_pnl"),
+        func.avg(DailyAnalytics.daily_pnl).label("avg_daily_pnl"),
+        func.sum(DailyAnalytics.total_trades).label("total_trades"),
+        func.sum(DailyAnalytics.total_volume_usd).label("total_volume_usd"),
+        func.sum(DailyAnalytics.win_count).label("win_count"),
+        func.sum(DailyAnalytics.loss_count).label("loss_count"),
+        func.min(DailyAnalytics.max_drawdown_pct).label("max_drawdown_pct"),
+        func.sum(DailyAnalytics.ai_cost_usd).label("total_ai_cost_usd"),
+        func.sum(DailyAnalytics.signals_generated).label("total_signals"),
+        func.avg(DailyAnalytics.signal_accuracy).label("avg_accuracy"),
+    ).where(DailyAnalytics.date >= start_date, DailyAnalytics.date <= end_date)
+
+
+def latest_daily_stmt(end_date: date):
+    """end_date 이전 가장 최근 daily_analytics 행"""
+    return (
+        select(DailyAnalytics)
+        .where(DailyAnalytics.date <= end_date)
+        .order_by(DailyAnalytics.date.desc())
+        .limit(1)
+    )
+
+
+def rows_by_day(rows: Iterable) -> Dict[date, Any]:
+    """(day, ...) 결과 행 → {date: row}"""
+    return {as_date(row.day): row for row in rows}
+
+
+def snapshots_by_day(rows: Iterable) -> Dict[date, Any]:
+    return {as_date(row.snapshot_date): row for row in rows}
+
+
+# =============================================================================
+# Risk windows
+# =============================================================================
+
+def risk_metrics_from_returns(returns_pct: np.ndarray, portfolio_value: float) -> Dict[str, float]:
+    """
+    수익률(%) 배열 → Sharpe / Sortino / MDD / 변동성 / VaR95
+
+    Sharpe·Sortino·변동성은 252 거래일 연율화, VaR은 5 퍼센타일 × 포트폴리오 가치.
+    """
+    avg_return = returns_pct.mean()
+    std_return = returns_pct.std()
+    annualizer = np.sqrt(TRADING_DAYS_PER_YEAR)
+
+    metrics: Dict[str, float] = {}
+    if std_return > 0:
+        metrics["sharpe_ratio"] = float(avg_return / std_return * annualizer)
+
+    downside = returns_pct[returns_pct < 0]
+    if downside.size:
+        downside_std = downside.std()
+        if downside_std > 0:
+            metrics["sortino_ratio"] = float(avg_return / downside_std * annualizer)
+
+    equity = risk_metrics.equity_from_returns(returns_pct / 100)
+    metrics["max_drawdown_pct"] = risk_metrics.max_drawdown(equity) * 100
+    metrics["volatility_30d"] = float(std_return * annualizer)
+    metrics["var_95"] = float(portfolio_value * risk_metrics.historical_var(returns_pct, 0.95) / 100)
+    return metrics
+
+
+def rolling_risk_metrics(
+    dates: Sequence[date],
+    returns_pct: Sequence[Optional[float]],
+    portfolio_values: Sequence[float],
+    window_days: int = RISK_WINDOW_DAYS,
+    min_records: int = RISK_MIN_RECORDS,
+) -> List[Dict[str, float]]:
+    """
+    날짜별 [date - window_days, date] 윈도우 리스크 지표
+
+    윈도우 경계는 searchsorted로 한 번에 구하고, 각 윈도우는 배열 슬라이스로 계산합니다.
+    0 / None 수익률은 제외합니다 (기존 일별 계산과 동일).
+    """
+    if not len(dates):
+        return []
+
+    ordinals = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=len(dates))
+    starts = np.searchsorted(ordinals, ordinals - window_days, side="left")
+    returns = np.asarray([np.nan if r is None else float(r) for r in returns_pct], dtype=float)
+    usable = ~np.isnan(returns) & (returns != 0)
+
+    results: List[Dict[str, float]] = []
+    for i, lo in enumerate(starts):
+        if i + 1 - lo < min_records:
+            results.append({})
+            continue
+        window = returns[lo:i + 1][usable[lo:i + 1]]
+        results.append(risk_metrics_from_returns(window, portfolio_values[i]) if window.size else {})
+    return results
+
+
+# =============================================================================
+# Weekly / monthly rollups from daily rows
+# =============================================================================
+
+def _period_base(rows: List[Any]) -> Dict[str, Any]:
+    """주간/월간 공통 합계 (rows: 날짜순 daily_analytics 행)"""
+    value_start = to_decimal(rows[0].portfolio_value_eod)
+    value_end = to_decimal(rows[-1].portfolio_value_eod)
+    total_trades = sum(r.total_trades or 0 for r in rows)
+    win_count = sum(r.win_count or 0 for r in rows)
+    loss_count = sum(r.loss_count or 0 for r in rows)
+    total_closed = win_count + loss_count
+    sharpe_ratios = [float(r.sharpe_ratio) for r in rows if r.sharpe_ratio]
+    drawdowns = [float(r.max_drawdown_pct) for r in rows if r.max_drawdown_pct]
+    ai_cost = Decimal(str(sum(float(r.ai_cost_usd or 0) for r in rows)))
+
+    base = {
+        "portfolio_value_start": value_start,
+        "portfolio_value_end": value_end,
+        "pnl": Decimal(str(sum(float(r.daily_pnl or 0) for r in rows))),
+        "return_pct": (value_end - value_start) / value_start * 100 if value_start and value_start > 0 else None,
+        "total_trades": total_trades,
+        "total_volume_usd": Decimal(str(sum(float(r.total_volume_usd or 0) for r in rows))),
+        "win_count": win_count,
+        "loss_count": loss_count,
+        "win_rate": Decimal(str(win_count / total_closed)) if total_closed > 0 else None,
+        "sharpe_ratio": Decimal(str(sum(sharpe_ratios) / len(sharpe_ratios))) if sharpe_ratios else None,
+        "max_drawdown_pct": Decimal(str(min(drawdowns))) if drawdowns else None,
+        "total_ai_cost_usd": ai_cost,
+        "avg_daily_ai_cost": ai_cost / len(rows),
+    }
+    return base
+
+
+def iso_week_key(day: date) -> Tuple[int, int]:
+    iso_year, iso_week, _ = day.isocalendar()
+    return iso_year, iso_week
+
+
+def weekly_rollups(rows: Sequence[Any]) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """ISO 주 단위 롤업: {(year, week): 필드}"""
+    rollups = {}
+    for (year, week), group in groupby(rows, key=lambda r: iso_week_key(as_date(r.date))):
+        group = list(group)
+        base = _period_base(group)
+        best = max(group, key=lambda r: float(r.daily_return_pct or 0))
+        worst = min(group, key=lambda r: float(r.daily_return_pct or 0))
+        week_start = date.fromisocalendar(year, week, 1)
+        rollups[(year, week)] = {
+            "week_start_date": week_start,
+            "week_end_date": week_start + timedelta(days=6),
+            "portfolio_value_start": base["portfolio_value_start"],
+            "portfolio_value_end": base["portfolio_value_end"],
+            "weekly_pnl": base["pnl"],
+            "weekly_return_pct": base["return_pct"],
+            "total_trades": base["total_trades"],
+            "total_volume_usd": base["total_volume_usd"],
+            "avg_daily_trades": Decimal(str(base["total_trades"] / len(group))),
+            "win_count": base["win_count"],
+            "loss_count": base["loss_count"],
+            "win_rate": base["win_rate"],
+            "sharpe_ratio": base["sharpe_ratio"],
+            "max_drawdown_pct": base["max_drawdown_pct"],
+            "total_ai_cost_usd": base["total_ai_cost_usd"],
+            "avg_daily_ai_cost": base["avg_daily_ai_cost"],
+            "best_day_date": as_date(best.date),
+            "best_day_return_pct": to_decimal(best.daily_return_pct),
+            "worst_day_date": as_date(worst.date),
+            "worst_day_return_pct": to_decimal(worst.daily_return_pct),
+        }
+    return rollups
+
+
+def monthly_rollups(rows: Sequence[Any]) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """월 단위 롤업: {(year, month): 필드} (주간 수익률은 월 내 ISO 주 구간 기준)"""
+    rollups = {}
+    for (year, month), group in groupby(rows, key=lambda r: (as_date(r.date).year, as_date(r.date).month)):
+        group = list(group)
+        base = _period_base(group)
+        sortino_ratios = [float(r.sortino_ratio) for r in group if r.sortino_ratio]
+
+        week_returns = []
+        for _, week in groupby(group, key=lambda r: iso_week_key(as_date(r.date))):
+            week = list(week)
+            start_value = float(week[0].portfolio_value_eod or 0)
+            if start_value > 0:
+                week_returns.append((float(week[-1].portfolio_value_eod) - start_value) / start_value * 100)
+
+        rollups[(year, month)] = {
+            "portfolio_value_start": base["portfolio_value_start"],
+            "portfolio_value_end": base["portfolio_value_end"],
+            "monthly_pnl": base["pnl"],
+            "monthly_return_pct": base["return_pct"],
+            "total_trades": base["total_trades"],
+            "total_volume_usd": base["total_volume_usd"],
+            "trading_days": len(group),
+            "win_count": base["win_count"],
+            "loss_count": base["loss_count"],
+            "win_rate": base["win_rate"],
+            "sharpe_ratio": base["sharpe_ratio"],
+            "sortino_ratio": Decimal(str(sum(sortino_ratios) / len(sortino_ratios))) if sortino_ratios else None,
+            "max_drawdown_pct": base["max_drawdown_pct"],
+            "total_ai_cost_usd": base["total_ai_cost_usd"],
+            "avg_daily_ai_cost": base["avg_daily_ai_cost"],
+            "total_tokens_used": sum(r.ai_tokens_used or 0 for r in group),
+            "best_week_return_pct": Decimal(str(max(week_returns))) if week_returns else None,
+            "worst_week_return_pct": Decimal(str(min(week_returns))) if week_returns else None,
+        }
+    return rollups
@@ -10,6 +10,8 @@ from scipy import stats
 from typing import Dict, List, Optional
 import logging
 
+from backend.analytics import risk_metrics
+
 logger = logging.getLogger(__name__)
 
 class ShadowTradingAnalyzer:
@@ -105,10 +107,8 @@ class ShadowTradingAnalyzer:
             return 0.0
             
         # 누적 수익 곡선 생성 (초기 자본 1.0 가정)
-        cumulative_returns = (1 + self.df['pnl_pct']).cumprod()
-        running_max = cumulative_returns.cummax()
-        drawdown = (cumulative_returns - running_max) / running_max
-        return float(drawdown.min())
+        cumulative_returns = risk_metrics.equity_from_returns(self.df['pnl_pct'].to_numpy())
+        return risk_metrics.max_drawdown(cumulative_returns)
 
     def analyze_streaks(self) -> Dict:
         """연승/연패 분석"""
@@ -15,7 +15,7 @@ Reference: docs/planning/260118_market_intelligence_roadmap.md
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
@@ -26,6 +26,7 @@ from backend.ai.intelligence.contrary_signal import (
     create_contrary_signal,
 )
 from backend.ai.intelligence.enhanced_news_pipeline import (
+    FILTERED_OUT_INSIGHT,
     EnhancedNewsProcessingPipeline,
     create_enhanced_pipeline,
 )
@@ -169,6 +170,26 @@ class PipelineProcessResponse(BaseModel):
     stages: Dict[str, Any]
 
 
+# 한 요청에서 동시에 처리할 최대 기사 수 (초과 시 422)
+MAX_PIPELINE_BATCH_SIZE = 200
+
+
+class PipelineBatchRequest(BaseModel):
+    """Enhanced news pipeline batch request (crawl burst)"""
+    articles: List[PipelineProcessRequest] = Field(
+        ...,
+        max_length=MAX_PIPELINE_BATCH_SIZE,
+        description=f"처리할 기사 (최대 {MAX_PIPELINE_BATCH_SIZE}건)",
+    )
+
+
+class PipelineBatchResponse(BaseModel):
+    """Enhanced news pipeline batch response"""
+    results: List[PipelineProcessResponse]
+    processed: int
+    filtered_out: int
+
+
 class ChartGenerateRequest(BaseModel):
     """Chart generation request"""
     chart_type: str  # THEME_BUBBLE, GEOPOLITICAL_TIMELINE, SECTOR_PERFORMANCE
@@ -273,42 +294,73 @@ async def process_news_article(request: PipelineProcessRequest):
     try:
         pipeline = get_enhanced_pipeline()
 
-        article = {
-            "title": request.title,
-            "content": request.content or "",
-            "source": request.source or "Unknown",
-            "published_at": request.published_at or datetime.now().isoformat(),
-        }
+        result = await pipeline.process_article(_pipeline_article(request))
+        return _pipeline_response(result)
+
+    except Exception as e:
+        logger.error(f"Pipeline processing error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        result = await pipeline.process_article(article)
 
-        # Convert ContrarianView to dict
-        contrarian_view_dict = None
-        if result.contrarian_view:
-            contrarian_view_dict = result.contrarian_view.to_dict()
+@router.post("/pipeline/process-batch", response_model=PipelineBatchResponse)
+async def process_news_batch(request: PipelineBatchRequest):
+    """
+    뉴스 기사 일괄 처리 (크롤링 사이클 단위)
 
-        # Convert stages to dict
-        stages_dict = {}
-        for stage_name, stage_result in result.stages.items():
-            stages_dict[stage_name] = {
-                "success": stage_result.success,
-                "data": stage_result.data,
-                "reasoning": stage_result.reasoning,
-            }
+    단계별로 기사 배치를 한 번에 처리합니다 (독립 단계 동시 실행,
+    필터 탈락 기사는 이후 단계 생략). 한 요청은 최대
+    MAX_PIPELINE_BATCH_SIZE 건이며 초과하면 422 를 반환합니다.
+    """
+    try:
+        pipeline = get_enhanced_pipeline()
+        results = await pipeline.process_batch([_pipeline_article(a) for a in request.articles])
 
-        return PipelineProcessResponse(
-            success=result.success,
-            final_insight=result.final_insight,
-            contrarian_view=contrarian_view_dict,
-            invalidation_conditions=result.invalidation_conditions,
-            failure_triggers=result.failure_triggers,
-            processing_time_ms=result.processing_time_ms,
-            stages=stages_dict,
+        return PipelineBatchResponse(
+            results=[_pipeline_response(r) for r in results],
+            processed=len(results),
+            filtered_out=sum(1 for r in results if r.final_insight == FILTERED_OUT_INSIGHT),
         )
 
     except Exception as e:
-        logger.error(f"Pipeline processing error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error(f"Pipeline batch processing error: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+def _pipeline_article(request: PipelineProcessRequest) -> Dict[str, Any]:
+    """Request → pipeline article dict"""
+    return {
+        "title": request.title,
+        "content": request.content or "",
+        "source": request.source or "Unknown",
+        "published_at": request.published_at or datetime.now().isoformat(),
+    }
+
+
+def _pipeline_response(result) -> PipelineProcessResponse:
+    """PipelineResult → API response"""
+    # Convert ContrarianView to dict
+    contrarian_view_dict = None
+    if result.contrarian_view:
+        contrarian_view_dict = result.contrarian_view.to_dict()
+
+    # Convert stages to dict
+    stages_dict = {}
+    for stage_name, stage_result in result.stages.items():
+        stages_dict[stage_name] = {
+            "success": stage_result.success,
+            "data": stage_result.data,
+            "reasoning": stage_result.reasoning,
+        }
+
+    return PipelineProcessResponse(
+        success=result.success,
+        final_insight=result.final_insight,
+        contrarian_view=contrarian_view_dict,
+        invalidation_conditions=result.invalidation_conditions,
+        failure_triggers=result.failure_triggers,
+        processing_time_ms=result.processing_time_ms,
+        stages=stages_dict,
+    )
 
 
 # ============================================================================
@@ -88,6 +88,7 @@ class TestNotificationResponse(BaseModel):
 class NotificationStatsResponse(BaseModel):
     telegram: Dict[str, Any]
     slack: Dict[str, Any]
+    websocket: Optional[Dict[str, Any]] = None
     history_size: int
     alert_counts: Dict[str, int]
     success_counts: Dict[str, int]
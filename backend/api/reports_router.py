@@ -38,6 +38,7 @@ except ImportError:
     PDF_RENDERER_AVAILABLE = False
 
 from backend.core.models.analytics_models import DailyAnalytics, WeeklyAnalytics, MonthlyAnalytics
+from backend.analytics import rollups
 from backend.analytics.performance_attribution import PerformanceAttributionAnalyzer
 from backend.analytics.risk_analytics import RiskAnalyzer
 from backend.analytics.trade_analytics import TradeAnalyzer
@@ -359,34 +360,39 @@ async def get_performance_summary(
     start_date = end_date - timedelta(days=lookback_days)
 
     try:
-        # TODO: Fix SQLAlchemy 2.0 async compatibility
-        # For now, return mock empty data
+        # Precomputed daily_analytics rows: one aggregate + the latest row
+        summary = (await db.execute(rollups.performance_summary_stmt(start_date, end_date))).one()
+        latest = (await db.execute(rollups.latest_daily_stmt(end_date))).scalars().first()
+
+        win_count = int(summary.win_count or 0)
+        closed = win_count + int(summary.loss_count or 0)
+
         return {
             "period": {
                 "start_date": start_date.isoformat(),
                 "end_date": end_date.isoformat(),
-                "days": 0,
+                "days": int(summary.days or 0),
             },
             "current": {
-                "portfolio_value": 0.0,
-                "positions_count": 0,
+                "portfolio_value": float(latest.portfolio_value_eod) if latest else 0.0,
+                "positions_count": (latest.positions_count or 0) if latest else 0,
             },
             "performance": {
-                "total_pnl": 0.0,
-                "total_trades": 0,
-                "total_volume_usd": 0.0,
-                "win_rate": None,
-                "avg_daily_pnl": 0.0,
+                "total_pnl": float(summary.total_pnl or 0),
+                "total_trades": int(summary.total_trades or 0),
+                "total_volume_usd": float(summary.total_volume_usd or 0),
+                "win_rate": win_count / closed if closed else None,
+                "avg_daily_pnl": float(summary.avg_daily_pnl or 0),
             },
             "risk": {
-                "sharpe_ratio": None,
-                "max_drawdown_pct": None,
-                "volatility_30d": None,
+                "sharpe_ratio": rollups.to_float(latest.sharpe_ratio) if latest else None,
+                "max_drawdown_pct": rollups.to_float(summary.max_drawdown_pct),
+                "volatility_30d": rollups.to_float(latest.volatility_30d) if latest else None,
             },
             "ai": {
-                "total_cost_usd": 0.0,
-                "total_signals": 0,
-                "avg_accuracy": None,
+                "total_cost_usd": float(summary.total_ai_cost_usd or 0),
+                "total_signals": int(summary.total_signals or 0),
+                "avg_accuracy": rollups.to_float(summary.avg_accuracy),
             },
         }
     except Exception as e:
@@ -413,18 +419,6 @@ async def get_time_series_data(
 
     Useful for charting.
     """
-    from sqlalchemy import select
-    stmt = select(DailyAnalytics).where(
-        DailyAnalytics.date >= start_date,
-        DailyAnalytics.date <= end_date,
-    ).order_by(DailyAnalytics.date)
-    
-    result = await db.execute(stmt)
-    daily_records = result.scalars().all()
-
-    if not daily_records:
-        raise HTTPException(status_code=404, detail="No data available for date range")
-
     # Map metric name to column
     metric_map = {
         "portfolio_value": "portfolio_value_eod",
@@ -441,8 +435,15 @@ async def get_time_series_data(
 
     column_name = metric_map[metric]
 
+    # Precomputed daily rows, requested column only
+    result = await db.execute(rollups.daily_series_stmt(start_date, end_date, columns=("date", column_name)))
+    daily_records = result.all()
+
+    if not daily_records:
+        raise HTTPException(status_code=404, detail="No data available for date range")
+
     # Extract data
-    dates = [r.date.isoformat() for r in daily_records]
+    dates = [rollups.as_date(r.date).isoformat() for r in daily_records]
     values = []
 
     for r in daily_records:
@@ -6,9 +6,10 @@ Endpoints:
 - GET /api/stock-prices/{ticker} - 특정 종목 히스토리
 - POST /api/stock-prices/sync - 종목 동기화
 - GET /api/stock-prices/sectors - 섹터별 현황 (상승/하락 Top 3)
+- WS  /api/stock-prices/stream - 실시간 가격 버스 스트림 (틱 + 임계값 이벤트)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from datetime import date, datetime, timedelta
@@ -289,6 +290,29 @@ async def sync_stock_prices(
     return results
 
 
+@router.websocket("/stream")
+async def stream_prices(websocket: WebSocket, tickers: str = Query(..., description="Comma separated list of tickers")):
+    """
+    실시간 가격 스트림 (PriceBus last-value cache + 틱 / 임계값 이벤트 푸시)
+    """
+    from backend.market_data.price_bus import get_price_bus
+
+    symbols = [t.strip().upper() for t in tickers.split(",") if t.strip()]
+    bus = get_price_bus()
+
+    await websocket.accept()
+    bus.track(symbols)
+    try:
+        async for message in bus.stream(symbols):
+            await websocket.send_json(message)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning(f"Price stream closed: {e}")
+    finally:
+        bus.untrack(symbols)
+
+
 @router.get("/quotes")
 @log_endpoint("stock_prices", "system")
 async def get_realtime_quotes(
@@ -52,6 +52,7 @@ from backend.api.schemas.strategy_schemas import (
     BulkOperationResponse
 )
 from backend.core.cache import get_cache
+from backend.notifications.dispatcher import WebSocketBroadcaster
 import hashlib
 import json
 
@@ -66,32 +67,26 @@ class ConflictWebSocketManager:
     """Manages WebSocket connections for real-time conflict alerts"""
 
     def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
+        self.broadcaster = WebSocketBroadcaster(name="ConflictWS")
+
+    @property
+    def active_connections(self) -> Set[WebSocket]:
+        return self.broadcaster.connections
 
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.add(websocket)
-        logger.info(f"[ConflictWS] New connection. Total: {len(self.active_connections)}")
+        self.broadcaster.add(websocket)
+        logger.info(f"[ConflictWS] New connection. Total: {len(self.broadcaster)}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        self.active_connections.discard(websocket)
-        logger.info(f"[ConflictWS] Connection closed. Total: {len(self.active_connections)}")
+        self.broadcaster.remove(websocket)
+        logger.info(f"[ConflictWS] Connection closed. Total: {len(self.broadcaster)}")
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"[ConflictWS] Broadcast error: {e}")
-                disconnected.add(connection)
-
-        # Remove disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        """Broadcast message to all connected clients (queued per client, non-blocking)"""
+        await self.broadcaster.broadcast(message)
 
 # Global WebSocket manager instance
 conflict_ws_manager = ConflictWebSocketManager()
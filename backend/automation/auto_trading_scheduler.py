@@ -121,6 +121,39 @@ class AutoTradingScheduler:
 
         logger.info("Scheduled jobs configured")
 
+    def register_jobs(self, runtime):
+        """공용 SchedulerRuntime 에 작업 등록 (setup_jobs() + start() 대신)"""
+        from backend.schedulers.scheduler_runtime import ScheduledJob
+
+        runtime.add_job(ScheduledJob(
+            id="auto_trading_pre_market_analysis",
+            name="Auto Trading Pre-Market Analysis",
+            func=self.pre_market_analysis,
+            trigger=CronTrigger(day_of_week='mon-fri', hour=22, minute=0, timezone=self.korea),
+            concurrency_class="llm",
+        ))
+        runtime.add_job(ScheduledJob(
+            id="auto_trading_cycle",
+            name="Auto Trading Cycle (Every 30min)",
+            func=self.trading_cycle,
+            trigger=IntervalTrigger(minutes=30),
+            concurrency_class="broker",
+            misfire_grace_seconds=300,
+        ))
+        runtime.add_job(ScheduledJob(
+            id="auto_trading_market_close_report",
+            name="Auto Trading Market Close Report",
+            func=self.market_close_report,
+            trigger=CronTrigger(day_of_week='tue-sat', hour=6, minute=0, timezone=self.korea),
+        ))
+        runtime.add_job(ScheduledJob(
+            id="auto_trading_news_monitoring",
+            name="Auto Trading News Monitoring (Every 10min)",
+            func=self.news_monitoring,
+            trigger=IntervalTrigger(minutes=10),
+            jitter_seconds=30,
+        ))
+
     async def pre_market_analysis(self):
         """장전 시장 분석"""
         logger.info("=" * 60)
@@ -165,6 +165,32 @@ class KISAutoScheduler:
         )
         
         logger.info("Scheduled jobs configured")
+
+    def register_jobs(self, runtime):
+        """공용 SchedulerRuntime 에 작업 등록 (setup_jobs() + start() 대신)"""
+        from backend.schedulers.scheduler_runtime import ScheduledJob
+
+        runtime.add_job(ScheduledJob(
+            id="kis_trading_cycle",
+            name="KIS News Crawling + Trading (Every 30min)",
+            func=self.trading_cycle,
+            trigger=IntervalTrigger(minutes=30),
+            concurrency_class="broker",
+            misfire_grace_seconds=300,
+        ))
+        runtime.add_job(ScheduledJob(
+            id="kis_pre_market_analysis",
+            name="KIS Pre-Market Analysis",
+            func=self.pre_market_analysis,
+            trigger=CronTrigger(day_of_week='mon-fri', hour=22, minute=0, timezone=self.korea),
+            concurrency_class="llm",
+        ))
+        runtime.add_job(ScheduledJob(
+            id="kis_market_close_report",
+            name="KIS Market Close Report",
+            func=self.market_close_report,
+            trigger=CronTrigger(day_of_week='tue-sat', hour=6, minute=0, timezone=self.korea),
+        ))
     
     async def trading_cycle(self):
         """매매 사이클: Enhanced 크롤링 + 4-way 필터링 + RAG"""
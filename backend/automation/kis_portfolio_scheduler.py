@@ -5,11 +5,13 @@ KIS Portfolio Auto-Sync Scheduler
 Features:
 - 시장 개장 시간에만 동작
 - 설정 가능한 동기화 주기 (기본 5분)
-- APScheduler 사용
+- APScheduler 사용 (단독 실행: start_kis_auto_sync(),
+  공용 SchedulerRuntime: register_jobs() → SCHEDULER_JOB_GROUPS=kis_portfolio_sync)
 """
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime, time
 import logging
 import os
@@ -110,6 +112,20 @@ def start_kis_auto_sync(interval_minutes: int = 5):
     logger.info(f"KIS auto-sync scheduler started (interval: {interval_minutes} min)")
 
 
+def register_jobs(runtime, interval_minutes: int = 5):
+    """공용 SchedulerRuntime 에 동기화 작업 등록 (start_kis_auto_sync() 대신)"""
+    from backend.schedulers.scheduler_runtime import ScheduledJob
+
+    runtime.add_job(ScheduledJob(
+        id="kis_auto_sync",
+        name=f"KIS Portfolio Auto-Sync (Every {interval_minutes}min)",
+        func=auto_sync_kis_portfolio,  # 동기 함수 → 런타임이 스레드에서 실행
+        trigger=IntervalTrigger(minutes=interval_minutes),
+        concurrency_class="broker",
+        misfire_grace_seconds=interval_minutes * 60,
+    ))
+
+
 def stop_kis_auto_sync():
     """KIS 자동 동기화 스케줄러 중지"""
     if scheduler.running:
@@ -121,6 +137,5 @@ def stop_kis_auto_sync():
 AUTO_SYNC_ENABLED = os.getenv("KIS_AUTO_SYNC_ENABLED", "true").lower() == "true"
 AUTO_SYNC_INTERVAL = int(os.getenv("KIS_AUTO_SYNC_INTERVAL", "5"))  # 기본 5분
 
-if AUTO_SYNC_ENABLED:
-    # 자동 시작 (import 시)
-    start_kis_auto_sync(interval_minutes=AUTO_SYNC_INTERVAL)
+# import 시 자동 시작하지 않음 (SchedulerRuntime 이 import 하면 같은 동기화가 두 번 실행됨).
+# 단독 실행은 start_kis_auto_sync(AUTO_SYNC_INTERVAL) 를 직접 호출
@@ -10,6 +10,8 @@ import numpy as np
 from typing import List, Dict
 from dataclasses import dataclass
 
+from backend.analytics import risk_metrics
+
 
 @dataclass
 class PerformanceMetrics:
@@ -97,18 +99,7 @@ def calculate_max_drawdown(portfolio_values: List[float]) -> float:
     if len(portfolio_values) == 0:
         return 0.0
     
-    peak = portfolio_values[0]
-    max_dd = 0.0
-    
-    for value in portfolio_values:
-        if value > peak:
-            peak = value
-        
-        dd = (value - peak) / peak
-        if dd < max_dd:
-            max_dd = dd
-    
-    return max_dd
+    return risk_metrics.max_drawdown(portfolio_values)
 
 
 def calculate_volatility(returns: List[float]) -> float:
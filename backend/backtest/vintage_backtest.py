@@ -134,12 +134,14 @@ class VintageBacktest:
     4. Transaction Costs: 수수료 + 슬리피지 반영
     """
 
-    def __init__(self, config: Optional[BacktestConfig] = None):
+    def __init__(self, config: Optional[BacktestConfig] = None, data_source=None):
         """
         Args:
             config: 백테스트 설정 (None이면 기본값)
+            data_source: 공용 BacktestDataSource (price_data 미지정 시 가격 로드)
         """
         self.config = config or BacktestConfig()
+        self.data_source = data_source
 
         # 포트폴리오 상태
         self.cash = self.config.initial_capital
@@ -157,7 +159,7 @@ class VintageBacktest:
     def run_backtest(
         self,
         signals: List[Dict[str, Any]],
-        price_data: Dict[str, List[Dict[str, Any]]],
+        price_data: Optional[Dict[str, List[Dict[str, Any]]]],
         start_date: datetime,
         end_date: datetime
     ) -> BacktestResult:
@@ -167,6 +169,7 @@ class VintageBacktest:
         Args:
             signals: 시그널 리스트 [{"ticker": "NVDA", "action": "BUY", "date": datetime, ...}, ...]
             price_data: 가격 데이터 {"NVDA": [{"date": datetime, "open": 100, "close": 105, ...}], ...}
+                        (None 이면 data_source 에서 로드)
             start_date: 백테스트 시작일
             end_date: 백테스트 종료일
 
@@ -176,6 +179,12 @@ class VintageBacktest:
         self.start_date = start_date
         self.end_date = end_date
 
+        if price_data is None:
+            if self.data_source is None:
+                raise ValueError("price_data or data_source is required")
+            tickers = sorted({signal["ticker"] for signal in signals})
+            price_data = self.data_source.price_points(tickers, start_date - timedelta(days=7), end_date)
+
         logger.info(f"Starting backtest from {start_date.date()} to {end_date.date()}")
 
         # 시그널 정렬 (시간순)
@@ -18,6 +18,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 import json
 
+from backend.backtesting.data_cache import BacktestDataSource, yfinance_columns
+
 try:
     import yfinance as yf
     import pandas as pd
@@ -153,11 +155,14 @@ class ABBacktestEngine:
         self,
         deep_reasoning_strategy=None,
         trading_days: int = 120,
-        benchmark: str = "SPY"
+        benchmark: str = "SPY",
+        data_source: Optional[BacktestDataSource] = None
     ):
         self.deep_reasoning = deep_reasoning_strategy
         self.trading_days = trading_days
         self.benchmark = benchmark
+        # 공용 데이터 소스 (BacktestDataCache 등) - 없으면 yfinance 직접 다운로드
+        self.data_source = data_source
         
         # 캐시
         self._price_cache: Dict[str, pd.DataFrame] = {}
@@ -173,13 +178,20 @@ class ABBacktestEngine:
         end: datetime
     ):
         """가격 데이터 조회"""
-        if not HAS_YFINANCE:
-            return self._mock_prices(ticker, start, end)
-        
         cache_key = f"{ticker}_{start.date()}_{end.date()}"
         if cache_key in self._price_cache:
             return self._price_cache[cache_key]
         
+        if self.data_source is not None:
+            df = yfinance_columns(self.data_source.get_prices(ticker, start, end))
+            if df.empty:
+                return None
+            self._price_cache[cache_key] = df
+            return df
+        
+        if not HAS_YFINANCE:
+            return self._mock_prices(ticker, start, end)
+        
         try:
             df = yf.download(
                 ticker,
@@ -49,6 +49,7 @@ class BacktestEngine:
         slippage_bps: float = 1.0,  # 1 basis point
         commission_rate: float = 0.00015,  # 0.015%
         max_positions: int = 10,
+        data_source=None,
     ):
         """
         Initialize backtest engine.
@@ -58,12 +59,14 @@ class BacktestEngine:
             slippage_bps: Slippage in basis points (1 = 0.01%)
             commission_rate: Commission rate (0.00015 = 0.015%)
             max_positions: Maximum number of positions
+            data_source: Shared BacktestDataSource for daily bars (None = mock prices)
         """
         self.initial_capital = initial_capital
         self.cash = initial_capital
         self.slippage_bps = slippage_bps
         self.commission_rate = commission_rate
         self.max_positions = max_positions
+        self.data_source = data_source
         
         # Portfolio state
         self.positions: Dict[str, dict] = {}  # {ticker: {shares, entry_price, ...}}
@@ -428,11 +431,18 @@ class BacktestEngine:
         """
         Get market data for given date.
         
-        In production, this would load from database.
-        For now, using mock data.
+        Uses the shared data source (local backtest cache) when configured,
+        otherwise mock data.
         """
         market_data = {}
         
+        if self.data_source is not None:
+            for ticker in tickers:
+                bar = self.data_source.get_bar(ticker, date)
+                if bar is not None:
+                    market_data[ticker] = bar
+            return market_data
+        
         for ticker in tickers:
             # Mock: generate random price movement
             # In production: load actual historical data
@@ -23,9 +23,11 @@ class ConsensusBacktest:
         self,
         initial_capital: float = 100000.0,
         consensus_threshold: float = 0.6,  # 60% approval needed
-        use_mock_consensus: bool = True
+        use_mock_consensus: bool = True,
+        data_source=None
     ):
-        self.engine = BacktestEngine(initial_capital=initial_capital)
+        # data_source: 공용 BacktestDataSource (로컬 캐시) - 없으면 mock 가격
+        self.engine = BacktestEngine(initial_capital=initial_capital, data_source=data_source)
         self.analyzer = ConsensusPerformanceAnalyzer()
         self.consensus_threshold = consensus_threshold
         self.use_mock_consensus = use_mock_consensus
@@ -51,6 +51,9 @@ class ConstitutionalBacktestEngine:
     ) -> Dict:
         """
         Run the Backtest.
+
+        feature_store: FeatureSnapshotStore - the agent receives the point-in-time
+        snapshot (snapshot=...) instead of rebuilding its context each step.
         """
         logger.info(f"Starting Constitutional Backtest: {start_date.date()} to {end_date.date()}")
         
@@ -79,7 +82,11 @@ class ConstitutionalBacktestEngine:
                 # A. Generate Proposal
                 try:
                     # Mocking agent response if it's a mock test, otherwise call agent
-                    decision = await trading_agent.analyze(ticker, current_date=current_date) 
+                    if feature_store is not None:
+                        snapshot = feature_store.as_of(ticker, current_date)
+                        decision = await trading_agent.analyze(ticker, current_date=current_date, snapshot=snapshot)
+                    else:
+                        decision = await trading_agent.analyze(ticker, current_date=current_date) 
                     # decision expected to have: action, conviction, rationale, etc.
                 except Exception as e:
                     logger.error(f"Agent failed for {ticker}: {e}")
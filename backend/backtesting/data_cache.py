@@ -0,0 +1,618 @@
+"""
+Backtest Data Cache - 백테스트 엔진 공용 로컬 데이터 캐시
+
+백테스트 엔진마다 가격/뉴스를 각자 (대부분 매 실행 yfinance 재다운로드로) 가져오던 것을
+하나의 데이터 소스 인터페이스와 로컬 증분 캐시로 통합합니다.
+같은 기간을 반복 실행하면 네트워크/DB I/O 없이 로컬 파일만 읽습니다.
+
+저장 형식 (root 아래):
+- prices/<TICKER>/<column>.bin + meta.json
+  → 컬럼별 고정폭 바이너리 (time: int64 ns, OHLCV: float64), np.memmap 으로 zero-copy 오픈
+  → 새 기간은 파일 끝에 append (meta.json 의 rows 가 커밋 지점, 이후 바이트는 무시/정리)
+  → 앞쪽 확장(전체 재작성)은 새 세대 파일(<column>.<generation>.bin)에 쓰고
+    meta.json 의 generation 교체로 커밋 (중간에 중단되어도 이전 세대가 그대로 유효)
+- news/YYYY-MM/YYYY-MM-DD.jsonl, analysis/YYYY-MM/YYYY-MM-DD.jsonl
+  → 일자 파티션 (빈 파일도 "해당 일자 캐시됨" 표시), 뉴스는 crawled_at 기준 (Point-in-Time)
+
+loader 가 평일을 포함한 구간에 대해 0건을 반환하면 (rate limit / 장애) 실패로 보고
+캐시 구간(covered_*)이나 일자 파티션을 커밋하지 않습니다 → 다음 요청에서 다시 조회.
+
+pyarrow 가 의존성에 없어 Parquet/Arrow 대신 numpy memmap 컬럼 파일을 사용합니다
+(동일하게 memory-mappable, 행 append 가능).
+
+오늘(미완결 일자) 데이터는 캐시하지 않고 매번 loader 에서 가져옵니다.
+
+Usage:
+    cache = BacktestDataCache("data/backtest_cache", loader=DatabaseBacktestLoader(db))
+    df = cache.get_prices("NVDA", start, end)          # 캐시 미스 구간만 loader 조회
+    arrays = cache.get_price_arrays("NVDA", start, end)  # memmap 뷰 (복사 없음)
+    news = cache.get_news(start, end, ticker="NVDA")
+
+    engine = ABBacktestEngine(data_source=cache)
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import json
+import logging
+import os
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume", "adjusted_close")
+TIME_DTYPE = np.dtype("<i8")
+VALUE_DTYPE = np.dtype("<f8")
+
+NEWS_TIME_FIELD = "crawled_at"
+ANALYSIS_TIME_FIELD = "created_at"
+
+CACHE_VERSION = 1
+
+DateLike = Union[date, datetime, str]
+
+
+def _to_date(value: DateLike) -> date:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _day_bounds(start: date, end: date) -> Tuple[datetime, datetime]:
+    """[start 00:00, end+1 00:00) - 일자 범위를 시각 범위로"""
+    return datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+
+
+def _last_complete_day() -> date:
+    return date.today() - timedelta(days=1)
+
+
+def _has_weekdays(start: date, end: date) -> bool:
+    """[start, end] 에 평일(거래 가능일)이 있는지"""
+    return len(pd.bdate_range(start, end)) > 0
+
+
+def _normalize_prices(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """loader 결과를 PRICE_COLUMNS + 정렬된 DatetimeIndex 로 정규화"""
+    if df is None or len(df) == 0:
+        return pd.DataFrame(columns=list(PRICE_COLUMNS), index=pd.DatetimeIndex([], name="time"), dtype=float)
+
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):  # yfinance 단일 티커 다운로드
+        df.columns = df.columns.get_level_values(0)
+    df.columns = [str(c).lower().replace(" ", "_").replace("adj_close", "adjusted_close") for c in df.columns]
+    if "time" in df.columns:
+        df = df.set_index("time")
+    df.index = pd.DatetimeIndex(pd.to_datetime(df.index)).tz_localize(None).astype("datetime64[ns]")
+    df.index.name = "time"
+
+    for column in PRICE_COLUMNS:
+        if column not in df.columns:
+            df[column] = np.nan
+    df = df[list(PRICE_COLUMNS)].astype(float)
+    df = df[~df.index.duplicated(keep="last")]
+    return df.sort_index()
+
+
+def yfinance_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """get_prices 결과를 yfinance 컬럼명(Open/Close/Adj Close ...)으로 변환 (기존 엔진 호환)"""
+    df = df.rename(columns={
+        "open": "Open", "high": "High", "low": "Low", "close": "Close",
+        "volume": "Volume", "adjusted_close": "Adj Close",
+    })
+    df["Adj Close"] = df["Adj Close"].fillna(df["Close"])
+    return df
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+# ═══════════════════════════════════════════════════════════════
+# 데이터 소스 인터페이스
+# ═══════════════════════════════════════════════════════════════
+
+class BacktestDataSource:
+    """
+    백테스트 엔진 공통 데이터 소스 인터페이스
+
+    get_prices / get_news / get_analyses 를 구현하면 엔진별 형식 변환
+    (get_bar, closes_by_date, price_points) 은 그대로 사용할 수 있습니다.
+    """
+
+    def get_prices(self, ticker: str, start: DateLike, end: DateLike) -> pd.DataFrame:
+        """일봉 OHLCV (index: time, columns: PRICE_COLUMNS), 양끝 일자 포함"""
+        raise NotImplementedError("Subclass must implement get_prices()")
+
+    def get_news(self, start: DateLike, end: DateLike, ticker: Optional[str] = None) -> List[Dict[str, Any]]:
+        """crawled_at 이 [start, end] 일자인 뉴스 (dict)"""
+        raise NotImplementedError("Subclass must implement get_news()")
+
+    def get_analyses(self, start: DateLike, end: DateLike, ticker: Optional[str] = None) -> List[Dict[str, Any]]:
+        """created_at 이 [start, end] 일자인 분석 결과 (dict)"""
+        raise NotImplementedError("Subclass must implement get_analyses()")
+
+    # ─── 엔진별 형식 변환 ──────────────────────────────────────
+
+    def get_bar(self, ticker: str, as_of: DateLike, lookback_days: int = 7) -> Optional[Dict[str, float]]:
+        """as_of 일자 또는 그 이전 가장 최근 일봉 (Point-in-Time)"""
+        as_of = _to_date(as_of)
+        df = self.get_prices(ticker, as_of - timedelta(days=lookback_days), as_of)
+        if df.empty:
+            return None
+        return {column: float(value) for column, value in df.iloc[-1].items()}
+
+    def closes_by_date(self, tickers: List[str], start: DateLike, end: DateLike) -> Dict[str, Dict[str, float]]:
+        """{YYYY-MM-DD: {ticker: close}} - SignalBacktestEngine.run(price_data=...) 형식"""
+        result: Dict[str, Dict[str, float]] = {}
+        for ticker in tickers:
+            df = self.get_prices(ticker, start, end)
+            for ts, close in zip(df.index, df["close"].to_numpy()):
+                result.setdefault(ts.strftime("%Y-%m-%d"), {})[ticker] = float(close)
+        return dict(sorted(result.items()))
+
+    def price_points(self, tickers: List[str], start: DateLike, end: DateLike) -> Dict[str, List[Dict[str, Any]]]:
+        """{ticker: [{"date": datetime, "open": ..., "close": ...}]} - VintageBacktestEngine 형식"""
+        result = {}
+        for ticker in tickers:
+            df = self.get_prices(ticker, start, end)
+            result[ticker] = [
+                {"date": ts.to_pydatetime(), **{c: float(row[i]) for i, c in enumerate(PRICE_COLUMNS)}}
+                for ts, row in zip(df.index, df.to_numpy())
+            ]
+        return result
+
+
+class BacktestDataLoader:
+    """캐시 미스 구간을 채우는 원천 데이터 로더 인터페이스 (DB, yfinance 등)"""
+
+    def load_prices(self, ticker: str, start: date, end: date) -> pd.DataFrame:
+        raise NotImplementedError("Subclass must implement load_prices()")
+
+    def load_news(self, start: date, end: date) -> List[Dict[str, Any]]:
+        return []
+
+    def load_analyses(self, start: date, end: date) -> List[Dict[str, Any]]:
+        return []
+
+
+class DatabaseBacktestLoader(BacktestDataLoader):
+    """stock_prices / news_articles / analysis_results 테이블 로더 (SQLAlchemy Session)"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def load_prices(self, ticker: str, start: date, end: date) -> pd.DataFrame:
+        from backend.database.models import StockPrice
+
+        start_ts, end_ts = _day_bounds(start, end)
+        rows = (
+            self.db.query(
+                StockPrice.time, StockPrice.open, StockPrice.high, StockPrice.low,
+                StockPrice.close, StockPrice.volume, StockPrice.adjusted_close,
+            )
+            .filter(StockPrice.ticker == ticker, StockPrice.time >= start_ts, StockPrice.time < end_ts)
+            .order_by(StockPrice.time)
+            .all()
+        )
+        return pd.DataFrame(rows, columns=["time", *PRICE_COLUMNS])
+
+    def load_news(self, start: date, end: date) -> List[Dict[str, Any]]:
+        from backend.database.models import NewsArticle
+
+        start_ts, end_ts = _day_bounds(start, end)
+        rows = (
+            self.db.query(
+                NewsArticle.id, NewsArticle.title, NewsArticle.summary, NewsArticle.source,
+                NewsArticle.url, NewsArticle.published_date, NewsArticle.crawled_at,
+                NewsArticle.tickers, NewsArticle.sentiment_score, NewsArticle.sentiment_label,
+            )
+            .filter(NewsArticle.crawled_at >= start_ts, NewsArticle.crawled_at < end_ts)
+            .order_by(NewsArticle.crawled_at)
+            .all()
+        )
+        return [dict(row._mapping) for row in rows]
+
+    def load_analyses(self, start: date, end: date) -> List[Dict[str, Any]]:
+        from backend.database.models import AnalysisResult
+
+        start_ts, end_ts = _day_bounds(start, end)
+        rows = (
+            self.db.query(
+                AnalysisResult.id, AnalysisResult.article_id, AnalysisResult.ticker,
+                AnalysisResult.reasoning_theme, AnalysisResult.final_verdict,
+                AnalysisResult.confidence_score, AnalysisResult.created_at,
+            )
+            .filter(AnalysisResult.created_at >= start_ts, AnalysisResult.created_at < end_ts)
+            .order_by(AnalysisResult.created_at)
+            .all()
+        )
+        return [dict(row._mapping) for row in rows]
+
+
+class YFinanceBacktestLoader(BacktestDataLoader):
+    """yfinance 일봉 로더 (DB 에 가격이 없을 때)"""
+
+    def load_prices(self, ticker: str, start: date, end: date) -> pd.DataFrame:
+        if not YFINANCE_AVAILABLE:
+            logger.warning("yfinance not installed; no prices loaded")
+            return _normalize_prices(None)
+        df = yf.download(
+            ticker,
+            start=start.isoformat(),
+            end=(end + timedelta(days=1)).isoformat(),  # yfinance end 는 미포함
+            progress=False,
+            auto_adjust=False,
+        )
+        return df
+
+
+# ═══════════════════════════════════════════════════════════════
+# 로컬 캐시
+# ═══════════════════════════════════════════════════════════════
+
+class BacktestDataCache(BacktestDataSource):
+    """
+    로컬 증분 백테스트 데이터 캐시
+
+    요청 구간 중 캐시되지 않은 일자만 loader 에서 가져와 append 하고,
+    나머지는 memmap / 일자 파티션 파일에서 읽습니다.
+    """
+
+    def __init__(self, root: Union[str, Path], loader: Optional[BacktestDataLoader] = None):
+        self.root = Path(root)
+        self.loader = loader
+        self.prices_dir = self.root / "prices"
+        self.prices_dir.mkdir(parents=True, exist_ok=True)
+
+        # ticker → (rows, {column: memmap}, generation), ticker → meta (단일 writer 가정)
+        self._mapped: Dict[str, Tuple[int, Dict[str, np.ndarray], int]] = {}
+        self._meta: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {
+            "price_hits": 0,
+            "price_misses": 0,
+            "day_hits": 0,
+            "day_misses": 0,
+            "loader_calls": 0,
+            "rows_appended": 0,
+            "rewrites": 0,
+            "empty_loads": 0,
+        }
+
+    # ─── 가격 ──────────────────────────────────────────────────
+
+    def get_prices(self, ticker: str, start: DateLike, end: DateLike) -> pd.DataFrame:
+        arrays = self.get_price_arrays(ticker, start, end)
+        return pd.DataFrame(
+            {column: arrays[column] for column in PRICE_COLUMNS},
+            index=pd.DatetimeIndex(arrays["time"].astype("datetime64[ns]"), name="time"),
+        )
+
+    def get_price_arrays(self, ticker: str, start: DateLike, end: DateLike) -> Dict[str, np.ndarray]:
+        """
+        [start, end] 일봉 컬럼 배열
+
+        캐시된 구간은 memmap 슬라이스 (복사 없음), 오늘 일자는 loader 결과를 뒤에 붙입니다.
+        """
+        ticker = ticker.upper()
+        start, end = _to_date(start), _to_date(end)
+        cacheable_end = min(end, _last_complete_day())
+
+        if start <= cacheable_end:
+            self._ensure_prices(ticker, start, cacheable_end)
+            arrays = self._slice(ticker, start, cacheable_end)
+        else:
+            arrays = self._empty_arrays()
+
+        if end > cacheable_end and self.loader is not None:
+            # 미완결 일자는 캐시하지 않음
+            live = _normalize_prices(self._load_prices(ticker, max(start, cacheable_end + timedelta(days=1)), end))
+            if len(live):
+                live_arrays = self._frame_to_arrays(live)
+                arrays = {c: np.concatenate([arrays[c], live_arrays[c]]) for c in arrays}
+        return arrays
+
+    def _ensure_prices(self, ticker: str, start: date, end: date):
+        meta = self._read_meta(ticker)
+        if meta is None:
+            self.stats["price_misses"] += 1
+            df = _normalize_prices(self._load_prices(ticker, start, end))
+            if self._loaded(df, ticker, start, end):
+                self._write_prices(ticker, df, start, end)
+            return
+
+        covered_start = date.fromisoformat(meta["covered_start"])
+        covered_end = date.fromisoformat(meta["covered_end"])
+        if start >= covered_start and end <= covered_end:
+            self.stats["price_hits"] += 1
+            return
+
+        self.stats["price_misses"] += 1
+        if start < covered_start:
+            # 앞쪽 확장은 드물어 전체 재작성
+            head_end = covered_start - timedelta(days=1)
+            head = _normalize_prices(self._load_prices(ticker, start, head_end))
+            if self._loaded(head, ticker, start, head_end):
+                existing = self._slice(ticker, covered_start, covered_end)
+                merged = pd.concat([head, self._arrays_to_frame(existing)])
+                self._write_prices(ticker, _normalize_prices(merged), start, covered_end)
+                self.stats["rewrites"] += 1
+                covered_start = start
+        if end > covered_end:
+            tail_start = covered_end + timedelta(days=1)
+            tail = _normalize_prices(self._load_prices(ticker, tail_start, end))
+            if self._loaded(tail, ticker, tail_start, end):
+                self._append_prices(ticker, tail, covered_start, end)
+
+    def _loaded(self, df: pd.DataFrame, ticker: str, start: date, end: date) -> bool:
+        """평일이 있는 구간인데 0건이면 실패로 보고 커밋하지 않음 (다음 요청에서 재조회)"""
+        if len(df) or not _has_weekdays(start, end):
+            return True
+        self.stats["empty_loads"] += 1
+        logger.warning(f"[BacktestDataCache] {ticker} {start}~{end}: loader returned no rows, not cached")
+        return False
+
+    def _load_prices(self, ticker: str, start: date, end: date) -> pd.DataFrame:
+        if self.loader is None:
+            return _normalize_prices(None)
+        self.stats["loader_calls"] += 1
+        return self.loader.load_prices(ticker, start, end)
+
+    def _write_prices(self, ticker: str, df: pd.DataFrame, covered_start: date, covered_end: date):
+        """전체 (재)작성: 새 세대 파일에 쓴 뒤 meta.json 교체로 커밋, 이전 세대 삭제"""
+        ticker_dir = self._ticker_dir(ticker)
+        ticker_dir.mkdir(parents=True, exist_ok=True)
+        meta = self._read_meta(ticker)
+        previous = meta.get("generation", 0) if meta else None
+        generation = previous + 1 if previous is not None else 0
+
+        self._mapped.pop(ticker, None)
+        arrays = self._frame_to_arrays(df)
+        for column, values in arrays.items():
+            values.tofile(self._column_path(ticker, column, generation))
+        self._write_meta(ticker, len(df), covered_start, covered_end, generation)
+        self.stats["rows_appended"] += len(df)
+
+        if previous is not None:
+            for column in arrays:
+                try:
+                    self._column_path(ticker, column, previous).unlink()
+                except OSError:
+                    pass  # Windows: 열린 memmap → 다음 재작성 때 덮어씀
+
+    def _append_prices(self, ticker: str, df: pd.DataFrame, covered_start: date, covered_end: date):
+        meta = self._read_meta(ticker)
+        rows = meta["rows"]
+        generation = meta.get("generation", 0)
+        if rows and len(df):
+            last = self._map(ticker)[1]["time"][rows - 1]
+            df = df[df.index.asi8 > last]
+
+        arrays = self._frame_to_arrays(df)
+        for column, values in arrays.items():
+            path = self._column_path(ticker, column, generation)
+            dtype = TIME_DTYPE if column == "time" else VALUE_DTYPE
+            with open(path, "r+b" if path.exists() else "wb") as f:
+                f.truncate(rows * dtype.itemsize)  # 커밋되지 않은 꼬리 정리
+                f.seek(0, os.SEEK_END)
+                f.write(values.tobytes())
+        # meta.json 갱신이 커밋 지점
+        self._write_meta(ticker, rows + len(df), covered_start, covered_end, generation)
+        self.stats["rows_appended"] += len(df)
+
+    def _slice(self, ticker: str, start: date, end: date) -> Dict[str, np.ndarray]:
+        rows, mapped = self._map(ticker)
+        if rows == 0:
+            return self._empty_arrays()
+        start_ts, end_ts = _day_bounds(start, end)
+        times = mapped["time"]
+        lo = int(np.searchsorted(times, np.datetime64(start_ts, "ns").astype(np.int64), side="left"))
+        hi = int(np.searchsorted(times, np.datetime64(end_ts, "ns").astype(np.int64), side="left"))
+        return {column: values[lo:hi] for column, values in mapped.items()}
+
+    def _map(self, ticker: str) -> Tuple[int, Dict[str, np.ndarray]]:
+        """memmap 오픈 (rows 가 바뀌면 다시 매핑)"""
+        meta = self._read_meta(ticker)
+        rows = meta["rows"] if meta else 0
+        generation = meta.get("generation", 0) if meta else 0
+        cached = self._mapped.get(ticker)
+        if cached and cached[0] == rows and cached[2] == generation:
+            return cached[0], cached[1]
+        mapped = {}
+        if rows:
+            mapped["time"] = np.memmap(self._column_path(ticker, "time", generation),
+                                       dtype=TIME_DTYPE, mode="r", shape=(rows,))
+            for column in PRICE_COLUMNS:
+                mapped[column] = np.memmap(self._column_path(ticker, column, generation),
+                                           dtype=VALUE_DTYPE, mode="r", shape=(rows,))
+        self._mapped[ticker] = (rows, mapped, generation)
+        return rows, mapped
+
+    @staticmethod
+    def _frame_to_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        arrays = {"time": np.ascontiguousarray(df.index.asi8, dtype=TIME_DTYPE)}
+        for column in PRICE_COLUMNS:
+            arrays[column] = np.ascontiguousarray(df[column].to_numpy(), dtype=VALUE_DTYPE)
+        return arrays
+
+    @staticmethod
+    def _arrays_to_frame(arrays: Dict[str, np.ndarray]) -> pd.DataFrame:
+        return pd.DataFrame(
+            {column: np.asarray(arrays[column]) for column in PRICE_COLUMNS},
+            index=pd.DatetimeIndex(np.asarray(arrays["time"]).astype("datetime64[ns]"), name="time"),
+        )
+
+    @staticmethod
+    def _empty_arrays() -> Dict[str, np.ndarray]:
+        return {"time": np.empty(0, TIME_DTYPE), **{c: np.empty(0, VALUE_DTYPE) for c in PRICE_COLUMNS}}
+
+    def _ticker_dir(self, ticker: str) -> Path:
+        return self.prices_dir / ticker
+
+    def _column_path(self, ticker: str, column: str, generation: int) -> Path:
+        """세대 0 은 기존 파일명(<column>.bin) 유지"""
+        name = f"{column}.bin" if generation == 0 else f"{column}.{generation}.bin"
+        return self._ticker_dir(ticker) / name
+
+    def _read_meta(self, ticker: str) -> Optional[Dict[str, Any]]:
+        if ticker in self._meta:
+            return self._meta[ticker]
+        path = self._ticker_dir(ticker) / "meta.json"
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != CACHE_VERSION:
+            return None
+        self._meta[ticker] = meta
+        return meta
+
+    def _write_meta(self, ticker: str, rows: int, covered_start: date, covered_end: date, generation: int = 0):
+        path = self._ticker_dir(ticker) / "meta.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        meta = {
+            "version": CACHE_VERSION,
+            "generation": generation,
+            "rows": rows,
+            "covered_start": covered_start.isoformat(),
+            "covered_end": covered_end.isoformat(),
+            "updated_at": datetime.now().isoformat(),
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+        self._meta[ticker] = meta
+
+    # ─── 뉴스 / 분석 (일자 파티션) ─────────────────────────────
+
+    def get_news(self, start: DateLike, end: DateLike, ticker: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._get_days("news", NEWS_TIME_FIELD, start, end, ticker)
+
+    def get_analyses(self, start: DateLike, end: DateLike, ticker: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._get_days("analysis", ANALYSIS_TIME_FIELD, start, end, ticker)
+
+    def _get_days(self, kind: str, time_field: str, start: DateLike, end: DateLike,
+                  ticker: Optional[str]) -> List[Dict[str, Any]]:
+        start, end = _to_date(start), _to_date(end)
+        cacheable_end = min(end, _last_complete_day())
+
+        # 캐시되지 않은 연속 일자 구간마다 loader 1회
+        for run_start, run_end in self._missing_runs(kind, start, cacheable_end):
+            self.stats["day_misses"] += (run_end - run_start).days + 1
+            items = self._load_items(kind, run_start, run_end)
+            if not items and _has_weekdays(run_start, run_end):
+                # 0건 = 장애/rate limit 가능 → 일자를 캐시됨으로 표시하지 않음
+                self.stats["empty_loads"] += 1
+                logger.warning(f"[BacktestDataCache] {kind} {run_start}~{run_end}: loader returned no rows, not cached")
+                continue
+            by_day: Dict[date, List[Dict[str, Any]]] = {}
+            for item in items:
+                by_day.setdefault(_to_date(item[time_field]), []).append(item)
+            day = run_start
+            while day <= run_end:
+                self._write_day(kind, day, by_day.get(day, []))
+                day += timedelta(days=1)
+
+        items: List[Dict[str, Any]] = []
+        day = start
+        while day <= cacheable_end:
+            items.extend(self._read_day(kind, day))
+            day += timedelta(days=1)
+        if end > cacheable_end:
+            live_start = max(start, cacheable_end + timedelta(days=1))
+            items.extend(json.loads(json.dumps(item, default=_json_default))
+                         for item in self._load_items(kind, live_start, end))
+
+        if ticker:
+            ticker = ticker.upper()
+            items = [item for item in items if _matches_ticker(item, ticker)]
+        return items
+
+    def _missing_runs(self, kind: str, start: date, end: date) -> Iterator[Tuple[date, date]]:
+        run_start = None
+        day = start
+        while day <= end:
+            if self._day_path(kind, day).exists():
+                self.stats["day_hits"] += 1
+                if run_start is not None:
+                    yield run_start, day - timedelta(days=1)
+                    run_start = None
+            elif run_start is None:
+                run_start = day
+            day += timedelta(days=1)
+        if run_start is not None:
+            yield run_start, end
+
+    def _load_items(self, kind: str, start: date, end: date) -> List[Dict[str, Any]]:
+        if self.loader is None:
+            return []
+        self.stats["loader_calls"] += 1
+        if kind == "news":
+            return self.loader.load_news(start, end)
+        return self.loader.load_analyses(start, end)
+
+    def _day_path(self, kind: str, day: date) -> Path:
+        return self.root / kind / day.strftime("%Y-%m") / f"{day.isoformat()}.jsonl"
+
+    def _write_day(self, kind: str, day: date, items: List[Dict[str, Any]]):
+        path = self._day_path(kind, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False, default=_json_default) + "\n")
+        os.replace(tmp_path, path)
+
+    def _read_day(self, kind: str, day: date) -> List[Dict[str, Any]]:
+        with open(self._day_path(kind, day), "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "root": str(self.root),
+            "tickers": sorted(p.name for p in self.prices_dir.iterdir() if p.is_dir()),
+        }
+
+
+def _matches_ticker(item: Dict[str, Any], ticker: str) -> bool:
+    if (item.get("ticker") or "").upper() == ticker:
+        return True
+    return ticker in [t.upper() for t in (item.get("tickers") or [])]
+
+
+# ═══════════════════════════════════════════════════════════════
+# Global Singleton
+# ═══════════════════════════════════════════════════════════════
+
+_backtest_data_cache: Optional[BacktestDataCache] = None
+
+
+def get_backtest_data_cache(loader: Optional[BacktestDataLoader] = None) -> BacktestDataCache:
+    """
+    BacktestDataCache 싱글톤 (BACKTEST_CACHE_DIR, 기본 data/backtest_cache)
+
+    loader 를 넘기면 기존 인스턴스의 loader 를 교체합니다.
+    """
+    global _backtest_data_cache
+    if _backtest_data_cache is None:
+        root = os.getenv("BACKTEST_CACHE_DIR", "data/backtest_cache")
+        _backtest_data_cache = BacktestDataCache(root, loader=loader or YFinanceBacktestLoader())
+    elif loader is not None:
+        _backtest_data_cache.loader = loader
+    return _backtest_data_cache
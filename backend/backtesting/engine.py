@@ -6,6 +6,10 @@ MASTER_GUIDE.md (Section 3.4, 5.6) based implementation:
 - Slippage and commission modeling
 - Performance metrics (Sharpe, MDD, Win Rate)
 - Constitution rules integration
+- Fast path (fast_path=True) for rule-based VectorizedStrategy:
+  bars preloaded as a (time x symbol x field) array, signals/rule checks
+  vectorized per bar, array portfolio accounting, no queue/coroutines in the
+  hot loop. Results are identical to the event path (same fills, history, trades).
 
 This code does NOT use AI APIs (zero cost).
 """
@@ -16,7 +20,7 @@ import logging
 import math
 import queue
 from datetime import datetime
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -123,6 +127,59 @@ class FillEvent(Event):
         }
 
 
+# =============================================================================
+# BAR ARRAY (fast path)
+# =============================================================================
+
+
+class BarArray:
+    """
+    Preloaded bars as a (time × symbol × field) float64 array.
+
+    Missing bars are NaN; a symbol whose close is NaN at a step is treated as
+    absent from that step's market data (same as the event path).
+    """
+
+    def __init__(
+        self,
+        timestamps: pd.DatetimeIndex,
+        symbols: List[str],
+        fields: List[str],
+        values: np.ndarray,
+    ):
+        self.timestamps = timestamps
+        self.symbols = list(symbols)
+        self.fields = list(fields)
+        self.values = values  # shape (T, S, F)
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> "BarArray":
+        """Stack per-symbol DataFrames (aligned on the union of their indexes)."""
+        symbols = list(frames.keys())
+        index = pd.DatetimeIndex([])
+        for s, df in enumerate(frames.values()):
+            if s == 0:
+                index = pd.DatetimeIndex(df.index).sort_values()
+            elif not index.equals(df.index):
+                index = index.union(df.index)
+        fields: List[str] = []
+        for df in frames.values():
+            fields.extend(column for column in df.columns if column not in fields)
+
+        values = np.full((len(index), len(symbols), len(fields)), np.nan)
+        for s, symbol in enumerate(symbols):
+            df = frames[symbol].reindex(index=index, columns=fields)
+            values[:, s, :] = df.to_numpy(dtype=float)
+        return cls(index, symbols, fields, values)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def field(self, name: str) -> np.ndarray:
+        """(T, S) view of one field."""
+        return self.values[:, :, self.fields.index(name)]
+
+
 # =============================================================================
 # ABSTRACT COMPONENTS
 # =============================================================================
@@ -152,6 +209,10 @@ class DataHandler:
         """Get latest market data for all symbols."""
         raise NotImplementedError("Subclass must implement get_latest_data()")
 
+    def get_bar_array(self) -> BarArray:
+        """All bars as a BarArray (required for fast_path)."""
+        raise NotImplementedError("Subclass must implement get_bar_array() for fast_path")
+
 
 class Strategy:
     """
@@ -168,6 +229,36 @@ class Strategy:
         raise NotImplementedError("Subclass must implement on_market()")
 
 
+class VectorizedStrategy(Strategy):
+    """
+    Rule-based strategy for the fast path.
+
+    Instead of emitting SignalEvents from on_market, on_bar returns per-symbol
+    action codes and convictions for one bar (vectorized over symbols).
+    Signal order is symbol order, as in an on_market loop over event.data.
+    """
+
+    HOLD = 0
+    BUY = 1
+    SELL = 2
+    EXIT = 3
+
+    def prepare(self, bars: BarArray):
+        """Called once before the loop (precompute indicators on the full array)."""
+        self.bars = bars
+
+    def on_bar(self, t: int, row: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Args:
+            t: bar index
+            row: (symbol × field) view of bar t
+
+        Returns:
+            (actions int array, convictions float array), both of length S
+        """
+        raise NotImplementedError("Subclass must implement on_bar()")
+
+
 # =============================================================================
 # CONCRETE COMPONENTS
 # =============================================================================
@@ -433,6 +524,134 @@ class Portfolio:
         )
 
 
+class ArrayPortfolio(Portfolio):
+    """
+    Portfolio for the fast path: quantities/entry prices as arrays indexed by symbol.
+
+    Signals of a bar are evaluated together against the start-of-bar state, which is
+    what the event queue does (all SignalEvents of a bar are handled before their
+    OrderEvents/FillEvents). Fills are applied in symbol order with the same float
+    operations as Portfolio.on_fill, so history/trades are identical.
+    """
+
+    def __init__(
+        self,
+        event_queue: queue.Queue,
+        initial_capital: float,
+        constitution_rules: Optional[dict] = None,
+    ):
+        super().__init__(event_queue, initial_capital, constitution_rules)
+        self.symbols: List[str] = []
+        self.quantities = np.zeros(0)
+        self.entry_prices: List[Optional[float]] = []
+        self._index: Dict[str, int] = {}
+
+    def bind(self, symbols: List[str]):
+        self.symbols = list(symbols)
+        self.quantities = np.zeros(len(symbols))
+        self.entry_prices = [None] * len(symbols)
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.positions = {}
+
+    def orders_for_bar(
+        self,
+        close: np.ndarray,
+        actions: np.ndarray,
+        convictions: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized on_signal for one bar.
+
+        Returns:
+            (symbol indexes, order quantities) in symbol order
+        """
+        valid = ~np.isnan(close)
+        holding = self.quantities
+        max_position_value = self.initial_capital * (self.max_position_size_pct / 100.0)
+
+        # BUY: conviction, max positions, cash pre-check, only when flat
+        buy = (actions == VectorizedStrategy.BUY) & valid & (convictions >= self.conviction_threshold_buy)
+        buy &= holding == 0
+        if len(self.positions) >= self.max_positions:
+            buy[:] = False
+        if max_position_value > self.cash:
+            buy &= ~(close > 0)
+        buy &= close > 0
+
+        quantities = np.zeros(len(close))
+        if buy.any():
+            price = close[buy]
+            quantity = np.floor(max_position_value / price)
+            over = quantity * price > self.cash
+            quantity[over] = np.floor(self.cash / price[over])
+            quantities[buy] = quantity
+
+        # SELL: conviction, only when long / EXIT: close any position
+        sell = (actions == VectorizedStrategy.SELL) & valid & (convictions >= self.conviction_threshold_sell) & (holding > 0)
+        exit_ = (actions == VectorizedStrategy.EXIT) & valid
+        quantities[sell | exit_] = -holding[sell | exit_]
+
+        indexes = np.flatnonzero(quantities)
+        return indexes, quantities[indexes]
+
+    def apply_fill(self, index: int, event: FillEvent, close: List[float]):
+        """
+        Array version of Portfolio.on_fill (same arithmetic and history entries).
+
+        close: the bar's closes as a list (NaN = no bar), indexed like symbols
+        """
+        # 1. Update cash
+        if event.quantity > 0:  # Buy
+            self.cash -= event.cost
+        else:  # Sell
+            self.cash += abs(event.quantity * event.fill_price) - event.commission
+
+        # 2. Update positions
+        current_quantity = self.positions.get(event.symbol, 0.0)
+        new_quantity = current_quantity + event.quantity
+
+        entry_price = self.entry_prices[index]
+        if current_quantity > 0 and new_quantity == 0 and entry_price is not None:
+            pnl = (event.fill_price - entry_price) * current_quantity - event.commission
+            self.trades.append(
+                {
+                    "symbol": event.symbol,
+                    "entry_price": entry_price,
+                    "exit_price": event.fill_price,
+                    "quantity": current_quantity,
+                    "pnl": pnl,
+                    "exit_timestamp": event.timestamp,
+                }
+            )
+        if event.quantity > 0:
+            self.entry_prices[index] = event.fill_price
+
+        self.quantities[index] = new_quantity
+        if new_quantity == 0:
+            self.positions.pop(event.symbol, None)
+        else:
+            self.positions[event.symbol] = new_quantity
+
+        # 3. Record history
+        total_value = self.cash
+        for symbol, quantity in self.positions.items():
+            price = close[self._index[symbol]]
+            if price == price:  # NaN = no bar for the symbol
+                total_value += quantity * price
+        self.history.append(
+            {
+                "timestamp": event.timestamp,
+                "total_value": total_value,
+                "cash": self.cash,
+                "positions": self.positions.copy(),
+                "fill": event.to_dict(),
+            }
+        )
+        logger.debug(
+            "[%s] Fill executed: %s %s @ $%.2f", event.timestamp, event.quantity, event.symbol, event.fill_price
+        )
+
+
 # =============================================================================
 # MAIN ENGINE
 # =============================================================================
@@ -441,6 +660,8 @@ class Portfolio:
 class BacktestEngine:
     """
     Event-Driven Backtest Engine orchestrator.
+
+    fast_path=True runs run_fast() (VectorizedStrategy + DataHandler.get_bar_array()).
     """
 
     def __init__(
@@ -455,8 +676,10 @@ class BacktestEngine:
         data_kwargs: Optional[dict] = None,
         strategy_kwargs: Optional[dict] = None,
         constitution_rules: Optional[dict] = None,
+        fast_path: bool = False,
     ):
         self.event_queue = queue.Queue()
+        self.fast_path = fast_path
         self.start_date = start_date
         self.end_date = end_date
         self.initial_capital = initial_capital
@@ -479,7 +702,8 @@ class BacktestEngine:
         self.strategy = StrategyCls(
             self.event_queue, self.data_handler, **(strategy_kwargs or {})
         )
-        self.portfolio = Portfolio(
+        PortfolioCls = ArrayPortfolio if fast_path else Portfolio
+        self.portfolio = PortfolioCls(
             self.event_queue, self.initial_capital, constitution_rules
         )
         self.broker = Broker(
@@ -493,6 +717,9 @@ class BacktestEngine:
 
     async def run(self) -> Dict:
         """Execute event loop and return performance metrics."""
+        if self.fast_path:
+            return self.run_fast()
+
         logger.info(f"Backtest starting: {self.start_date} ~ {self.end_date}")
 
         event_count = 0
@@ -538,6 +765,60 @@ class BacktestEngine:
         logger.info(f"Event loop complete. Processed {event_count} events.")
         return self.calculate_performance()
 
+    def run_fast(self) -> Dict:
+        """
+        Fast path: same results as run() for a VectorizedStrategy, without the
+        event queue or coroutines in the hot loop.
+
+        Per bar: strategy.on_bar (vectorized signals) → ArrayPortfolio.orders_for_bar
+        (vectorized Constitution checks and sizing against the start-of-bar state) →
+        broker fills in symbol order (one slippage draw per order, as Broker.on_order).
+        """
+        if not isinstance(self.strategy, VectorizedStrategy):
+            raise TypeError("fast_path requires a VectorizedStrategy")
+        if not isinstance(self.portfolio, ArrayPortfolio):
+            raise TypeError("fast_path requires an ArrayPortfolio (BacktestEngine(fast_path=True))")
+
+        logger.info(f"Backtest starting (fast path): {self.start_date} ~ {self.end_date}")
+
+        bars = self.data_handler.get_bar_array()
+        self.strategy.prepare(bars)
+        self.portfolio.bind(bars.symbols)
+
+        close = bars.field("close")
+        slippage_rate = self.broker.slippage_bps / 10000.0
+        commission_rate = self.broker.commission_rate
+        order_count = 0
+
+        for t in range(len(bars)):
+            actions, convictions = self.strategy.on_bar(t, bars.values[t])
+            if not actions.any():
+                continue
+
+            indexes, quantities = self.portfolio.orders_for_bar(close[t], actions, convictions)
+            if not len(indexes):
+                continue
+
+            close_t = close[t].tolist()
+            timestamp = bars.timestamps[t]
+            for index, quantity in zip(indexes.tolist(), quantities.tolist()):
+                price = close_t[index]
+                slippage = (price * slippage_rate) * np.random.choice([-1, 1])
+                fill_price = price + slippage
+                commission = abs(quantity * fill_price) * commission_rate
+                fill_event = FillEvent(
+                    timestamp=timestamp,
+                    symbol=bars.symbols[index],
+                    quantity=quantity,
+                    fill_price=fill_price,
+                    commission=commission,
+                )
+                self.portfolio.apply_fill(index, fill_event, close_t)
+            order_count += len(indexes)
+
+        logger.info(f"Fast path complete. {len(bars)} bars, {order_count} orders.")
+        return self.calculate_performance()
+
     def calculate_performance(self) -> Dict:
         """
         Calculate performance metrics:
@@ -602,6 +883,65 @@ class BacktestEngine:
         }
 
 
+# =============================================================================
+# CACHED DATA HANDLER
+# =============================================================================
+
+
+class CachedDataHandler(DataHandler):
+    """
+    Data handler backed by a shared BacktestDataSource (local backtest cache).
+
+    Repeated runs over the same period read memory-mapped local files only.
+    """
+
+    def __init__(
+        self,
+        event_queue: queue.Queue,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        data_source=None,
+    ):
+        super().__init__(event_queue)
+        if data_source is None:
+            from backend.backtesting.data_cache import get_backtest_data_cache
+
+            data_source = get_backtest_data_cache()
+
+        self.data = {
+            symbol: data_source.get_prices(symbol, start_date, end_date)
+            for symbol in symbols
+        }
+        timestamps = sorted(set().union(*(df.index for df in self.data.values()))) if self.data else []
+        self.data_stream = iter(timestamps)
+        self.latest_data = {}
+
+    async def next(self) -> bool:
+        try:
+            timestamp = next(self.data_stream)
+        except StopIteration:
+            return False
+        self.latest_data = {
+            symbol: df.loc[timestamp]
+            for symbol, df in self.data.items()
+            if timestamp in df.index
+        }
+        self.event_queue.put(MarketEvent(timestamp, self.latest_data))
+        return True
+
+    def get_latest_price(self, symbol: str) -> Optional[float]:
+        if symbol in self.latest_data and "close" in self.latest_data[symbol]:
+            return float(self.latest_data[symbol]["close"])
+        return None
+
+    def get_latest_data(self) -> Dict[str, pd.Series]:
+        return self.latest_data
+
+    def get_bar_array(self) -> BarArray:
+        return BarArray.from_frames(self.data)
+
+
 # =============================================================================
 # DEMO IMPLEMENTATION (for testing)
 # =============================================================================
@@ -650,6 +990,9 @@ class DemoDataHandler(DataHandler):
     def get_latest_data(self) -> Dict[str, pd.Series]:
         return self.latest_data
 
+    def get_bar_array(self) -> BarArray:
+        return BarArray.from_frames(self.data)
+
 
 class DemoStrategy(Strategy):
     """Demo strategy: simple moving average crossover."""
@@ -662,12 +1005,12 @@ class DemoStrategy(Strategy):
     ):
         super().__init__(event_queue, data_handler)
         self.window = window
-        self.prices = {symbol: [] for symbol in ["AAPL"]}
+        self.prices: Dict[str, List[float]] = {}
 
     async def on_market(self, event: MarketEvent):
         for symbol, data in event.data.items():
             price = data["close"]
-            self.prices[symbol].append(price)
+            self.prices.setdefault(symbol, []).append(price)
 
             if len(self.prices[symbol]) > self.window:
                 ma = np.mean(self.prices[symbol][-self.window :])
@@ -692,6 +1035,45 @@ class DemoStrategy(Strategy):
                     self.event_queue.put(signal)
 
 
+class DemoVectorizedStrategy(VectorizedStrategy):
+    """
+    DemoStrategy for the fast path (same moving-average rule, all symbols per bar).
+
+    Assumes every symbol has a bar at every step (as DemoDataHandler provides).
+    """
+
+    def __init__(
+        self,
+        event_queue: queue.Queue,
+        data_handler: DataHandler,
+        window: int = 3,
+    ):
+        super().__init__(event_queue, data_handler)
+        self.window = window
+
+    def prepare(self, bars: BarArray):
+        super().prepare(bars)
+        # (symbol, time) C-contiguous: each window is a contiguous row slice, so
+        # mean(axis=1) sums in the same order as np.mean over DemoStrategy's list
+        self._closes = np.ascontiguousarray(bars.field("close").T)
+        self._hold = np.zeros(len(bars.symbols), dtype=np.int8)
+
+    def on_bar(self, t: int, row: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if t < self.window:  # DemoStrategy needs more than `window` prices
+            return self._hold, np.zeros(len(self._hold))
+
+        price = self._closes[:, t]
+        ma = self._closes[:, t - self.window + 1 : t + 1].mean(axis=1)
+
+        buy = price > ma * 1.02  # 2% above MA
+        sell = ~buy & (price < ma * 0.98)  # 2% below MA
+
+        actions = np.zeros(len(price), dtype=np.int8)
+        actions[buy] = self.BUY
+        actions[sell] = self.SELL
+        return actions, np.where(buy, 0.75, 0.65)
+
+
 # =============================================================================
 # MAIN (for testing)
 # =============================================================================
@@ -0,0 +1,751 @@
+"""
+Feature Snapshots - AI 에이전트 백테스트용 Point-in-Time 입력 스냅샷 저장소
+
+AI 결정을 재현하는 백테스트 (ai_strategy_backtest / consensus_backtest /
+constitutional_backtest_engine) 가 매 스텝 시장 컨텍스트를 다시 만들고
+PointInTimeDataAccess 가 스텝마다 ORM 쿼리를 실행하던 것을,
+(티커, 결정 시각) 별로 에이전트가 "그 시점에" 볼 수 있었던 입력을 미리 물질화해
+as-of 이진 탐색 한 번으로 읽도록 바꿉니다.
+
+스냅샷 내용:
+- features: 가격 기반 피처 (가용 시각 = 일봉 날짜 + price_lag, 기본 장 마감 16:00)
+- news_ids: crawled_at ∈ [as_of - news_window, as_of] 인 뉴스 ID
+- macro: as_of 이전에 생성된 마지막 거시 스냅샷
+- prior_decisions: as_of 이전 (미포함) 같은 티커의 최근 결정 N 건
+
+저장 형식 (root/snapshots/<TICKER>/):
+- as_of.bin          int64 ns, 오름차순 → as-of 인덱스 (np.searchsorted)
+- features.bin       float64 (rows × F), 피처 이름은 meta.json
+- news_offsets.bin   int64 (rows + 1) / news_ids.bin int64 → 행별 가변 길이 (CSR)
+- context_offsets.bin int64 (rows + 1) / context.jsonl → 행별 macro + prior_decisions
+- meta.json          rows, feature_names, 파일 길이 (커밋 지점)
+
+pyarrow 가 의존성에 없어 data_cache 와 같은 numpy memmap 컬럼 파일을 사용합니다.
+더 늦은 시각의 스냅샷은 append, 그 외 (과거 구간 재생성 / 피처 변경) 는 병합 후 재작성합니다.
+
+Usage:
+    store = FeatureSnapshotStore("data/feature_snapshots")
+    builder = FeatureSnapshotBuilder(store, data_source=get_backtest_data_cache())
+    builder.build(["NVDA", "AAPL"], start, end, macro_snapshots=macro, decisions=signals)
+
+    snapshot = store.as_of("NVDA", datetime(2025, 3, 4, 9, 30))   # 이진 탐색
+    pit = PointInTimeDataAccess(db, snapshot_store=store)
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from backend.backtesting.data_cache import BacktestDataSource
+
+logger = logging.getLogger(__name__)
+
+TIME_DTYPE = np.dtype("<i8")
+VALUE_DTYPE = np.dtype("<f8")
+ID_DTYPE = np.dtype("<i8")
+
+SNAPSHOT_VERSION = 1
+
+# 일봉 가용 시각: 날짜 00:00 + 16h (장 마감) → 09:30 결정은 전일 종가까지 사용
+DEFAULT_PRICE_LAG = timedelta(hours=16)
+
+PRICE_FEATURES = (
+    "close",
+    "return_1d",
+    "return_5d",
+    "return_20d",
+    "volatility_20d",
+    "sma_20_ratio",
+    "volume_ratio_20d",
+    "rsi_14",
+)
+
+
+@dataclass
+class FeatureSnapshot:
+    """(티커, 결정 시각) 의 Point-in-Time 입력"""
+    ticker: str
+    as_of: datetime
+    features: Dict[str, float] = field(default_factory=dict)
+    news_ids: List[int] = field(default_factory=list)
+    macro: Optional[Dict[str, Any]] = None
+    prior_decisions: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticker": self.ticker,
+            "as_of": self.as_of.isoformat(),
+            "features": self.features,
+            "news_ids": self.news_ids,
+            "macro": self.macro,
+            "prior_decisions": self.prior_decisions,
+        }
+
+
+@dataclass
+class SnapshotBatch:
+    """한 티커의 스냅샷 묶음 (컬럼 형태, as_of 오름차순)"""
+    as_of: np.ndarray                 # int64 ns (n,)
+    feature_names: List[str]
+    features: np.ndarray              # float64 (n, F)
+    news_offsets: np.ndarray          # int64 (n + 1,)
+    news_ids: np.ndarray              # int64
+    contexts: List[bytes]             # 행별 JSON ({"macro": ..., "prior_decisions": [...]})
+
+    def __len__(self) -> int:
+        return len(self.as_of)
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Sequence[FeatureSnapshot], feature_names: Optional[List[str]] = None) -> "SnapshotBatch":
+        snapshots = sorted(snapshots, key=lambda s: s.as_of)
+        if feature_names is None:
+            feature_names = []
+            for snapshot in snapshots:
+                feature_names.extend(name for name in snapshot.features if name not in feature_names)
+        features = np.full((len(snapshots), len(feature_names)), np.nan, dtype=VALUE_DTYPE)
+        for i, snapshot in enumerate(snapshots):
+            for j, name in enumerate(feature_names):
+                value = snapshot.features.get(name)
+                if value is not None:
+                    features[i, j] = value
+        lengths = [len(s.news_ids) for s in snapshots]
+        return cls(
+            as_of=np.array([_to_ns(s.as_of) for s in snapshots], dtype=TIME_DTYPE),
+            feature_names=list(feature_names),
+            features=features,
+            news_offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(ID_DTYPE),
+            news_ids=np.array([i for s in snapshots for i in s.news_ids], dtype=ID_DTYPE),
+            contexts=[_encode_context(s.macro, s.prior_decisions) for s in snapshots],
+        )
+
+
+def _to_ns(value: Union[datetime, date, str, pd.Timestamp]) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_localize(None)
+    return timestamp.value
+
+
+def _delta_ns(value: timedelta) -> int:
+    return pd.Timedelta(value).value
+
+
+def _from_ns(value: int) -> datetime:
+    return pd.Timestamp(int(value)).to_pydatetime()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _encode_context(macro: Optional[Dict[str, Any]], prior_decisions: List[Dict[str, Any]]) -> bytes:
+    line = json.dumps({"macro": macro, "prior_decisions": prior_decisions}, default=_json_default, ensure_ascii=False)
+    return (line + "\n").encode("utf-8")
+
+
+def compute_price_features(prices: pd.DataFrame) -> pd.DataFrame:
+    """
+    일봉 → PRICE_FEATURES (행 = 해당 일봉 시점까지의 데이터만 사용)
+
+    Args:
+        prices: close (+ volume) 컬럼, 오름차순 DatetimeIndex
+    """
+    close = prices["close"].astype(float)
+    returns = close.pct_change()
+    delta = close.diff()
+    gain = delta.clip(lower=0).rolling(14).mean()
+    loss = (-delta.clip(upper=0)).rolling(14).mean()
+
+    features = pd.DataFrame(index=prices.index)
+    features["close"] = close
+    features["return_1d"] = returns
+    features["return_5d"] = close.pct_change(5)
+    features["return_20d"] = close.pct_change(20)
+    features["volatility_20d"] = returns.rolling(20).std() * np.sqrt(252)
+    features["sma_20_ratio"] = close / close.rolling(20).mean()
+    if "volume" in prices:
+        volume = prices["volume"].astype(float)
+        features["volume_ratio_20d"] = volume / volume.rolling(20).mean()
+    else:
+        features["volume_ratio_20d"] = np.nan
+    features["rsi_14"] = 100 - 100 / (1 + gain / loss.replace(0, np.nan))
+    return features[list(PRICE_FEATURES)]
+
+
+class FeatureSnapshotStore:
+    """
+    티커별 컬럼 스냅샷 저장소 + as-of 이진 탐색
+
+    단일 writer 가정 (빌더 1개). meta.json 갱신이 커밋 지점입니다.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.snapshots_dir = self.root / "snapshots"
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+        # ticker → (rows, {name: memmap}), ticker → meta
+        self._mapped: Dict[str, Tuple[int, Dict[str, np.ndarray]]] = {}
+        self._meta: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {
+            "lookups": 0,
+            "hits": 0,
+            "misses": 0,
+            "rows_appended": 0,
+            "rewrites": 0,
+        }
+
+    # ─── 조회 ─────────────────────────────────────────────────
+
+    def tickers(self) -> List[str]:
+        return sorted(p.name for p in self.snapshots_dir.iterdir() if p.is_dir() and (p / "meta.json").exists())
+
+    def feature_names(self, ticker: str) -> List[str]:
+        meta = self._read_meta(ticker.upper())
+        return list(meta["feature_names"]) if meta else []
+
+    def __len__(self) -> int:
+        return sum(self._rows(ticker) for ticker in self.tickers())
+
+    def index_of(self, ticker: str, when: Union[datetime, date, str]) -> int:
+        """as_of <= when 인 마지막 행 (없으면 -1) - O(log n)"""
+        rows, mapped = self._map(ticker.upper())
+        if rows == 0:
+            return -1
+        return int(np.searchsorted(mapped["as_of"], _to_ns(when), side="right")) - 1
+
+    def as_of(
+        self,
+        ticker: str,
+        when: Union[datetime, date, str],
+        max_staleness: Optional[timedelta] = None,
+    ) -> Optional[FeatureSnapshot]:
+        """
+        when 시점에 유효한 (as_of <= when 인 최신) 스냅샷
+
+        Args:
+            max_staleness: 스냅샷이 이보다 오래되면 None
+        """
+        ticker = ticker.upper()
+        self.stats["lookups"] += 1
+        index = self.index_of(ticker, when)
+        if index < 0:
+            self.stats["misses"] += 1
+            return None
+        snapshot = self._read_row(ticker, index)
+        if max_staleness is not None and _to_ns(when) - _to_ns(snapshot.as_of) > _delta_ns(max_staleness):
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return snapshot
+
+    def snapshots(
+        self,
+        ticker: str,
+        start: Optional[Union[datetime, date, str]] = None,
+        end: Optional[Union[datetime, date, str]] = None,
+    ) -> Iterator[FeatureSnapshot]:
+        """[start, end] 구간 스냅샷 (as_of 오름차순)"""
+        ticker = ticker.upper()
+        rows, mapped = self._map(ticker)
+        lo = int(np.searchsorted(mapped["as_of"], _to_ns(start), side="left")) if rows and start is not None else 0
+        hi = int(np.searchsorted(mapped["as_of"], _to_ns(end), side="right")) if rows and end is not None else rows
+        for index in range(lo, hi):
+            yield self._read_row(ticker, index)
+
+    def feature_frame(self, ticker: str) -> pd.DataFrame:
+        """as_of × 피처 DataFrame (벡터화 재생/분석용)"""
+        ticker = ticker.upper()
+        rows, mapped = self._map(ticker)
+        names = self.feature_names(ticker)
+        if rows == 0:
+            return pd.DataFrame(columns=names, index=pd.DatetimeIndex([], name="as_of"), dtype=float)
+        return pd.DataFrame(
+            np.asarray(mapped["features"]),
+            columns=names,
+            index=pd.DatetimeIndex(np.asarray(mapped["as_of"]).astype("datetime64[ns]"), name="as_of"),
+        )
+
+    def audit_lookahead(
+        self,
+        ticker: str,
+        news_times: Dict[int, Union[datetime, str]],
+    ) -> List[Dict[str, Any]]:
+        """
+        저장된 스냅샷이 미래 데이터를 참조하는지 검사
+
+        Args:
+            news_times: news_id → crawled_at (실제 테이블 기준)
+
+        Returns:
+            위반 목록 (빈 리스트 = 문제 없음)
+        """
+        violations = []
+        for snapshot in self.snapshots(ticker):
+            as_of_ns = _to_ns(snapshot.as_of)
+            for news_id in snapshot.news_ids:
+                crawled_at = news_times.get(news_id)
+                if crawled_at is not None and _to_ns(crawled_at) > as_of_ns:
+                    violations.append({"as_of": snapshot.as_of.isoformat(), "source": f"NewsArticle:{news_id}",
+                                       "data_timestamp": str(crawled_at)})
+            for decision in snapshot.prior_decisions:
+                created_at = decision.get("created_at")
+                if created_at is not None and _to_ns(created_at) >= as_of_ns:
+                    violations.append({"as_of": snapshot.as_of.isoformat(), "source": "prior_decision",
+                                       "data_timestamp": str(created_at)})
+        return violations
+
+    # ─── 저장 ─────────────────────────────────────────────────
+
+    def write(self, ticker: str, batch: Union[SnapshotBatch, Sequence[FeatureSnapshot]]) -> int:
+        """
+        스냅샷 저장 - 마지막 as_of 이후 행만 있으면 append, 아니면 병합 재작성
+
+        같은 as_of 가 이미 있으면 새 값으로 교체합니다.
+        """
+        ticker = ticker.upper()
+        if not isinstance(batch, SnapshotBatch):
+            names = self.feature_names(ticker)
+            for snapshot in batch:
+                names.extend(name for name in snapshot.features if name not in names)
+            batch = SnapshotBatch.from_snapshots(batch, names)
+        if len(batch) == 0:
+            return 0
+
+        meta = self._read_meta(ticker)
+        rows, mapped = self._map(ticker)
+        if rows and batch.as_of[0] > mapped["as_of"][rows - 1] and batch.feature_names == meta["feature_names"]:
+            self._append(ticker, batch)
+        else:
+            if rows:
+                batch = _merge(self._read_batch(ticker), batch)
+                self.stats["rewrites"] += 1
+            self._rewrite(ticker, batch)
+        return len(batch)
+
+    def _append(self, ticker: str, batch: SnapshotBatch):
+        meta = self._read_meta(ticker)
+        rows, mapped = self._map(ticker)
+        news_count, context_bytes = meta["news_count"], meta["context_bytes"]
+        news_offsets = batch.news_offsets[1:] + news_count
+        context_lengths = np.fromiter((len(c) for c in batch.contexts), dtype=ID_DTYPE, count=len(batch))
+        context_offsets = np.cumsum(context_lengths) + context_bytes
+
+        ticker_dir = self._ticker_dir(ticker)
+        tails = {
+            "as_of": (rows * TIME_DTYPE.itemsize, batch.as_of.tobytes()),
+            "features": (rows * len(meta["feature_names"]) * VALUE_DTYPE.itemsize, batch.features.tobytes()),
+            "news_offsets": ((rows + 1) * ID_DTYPE.itemsize, news_offsets.astype(ID_DTYPE).tobytes()),
+            "news_ids": (news_count * ID_DTYPE.itemsize, batch.news_ids.tobytes()),
+            "context_offsets": ((rows + 1) * ID_DTYPE.itemsize, context_offsets.astype(ID_DTYPE).tobytes()),
+            "context": (context_bytes, b"".join(batch.contexts)),
+        }
+        self._mapped.pop(ticker, None)
+        for name, (committed, data) in tails.items():
+            with open(self._path(ticker_dir, name), "r+b") as f:
+                f.truncate(committed)  # 커밋되지 않은 꼬리 정리
+                f.seek(0, os.SEEK_END)
+                f.write(data)
+        # meta.json 갱신이 커밋 지점
+        self._write_meta(ticker, rows + len(batch), meta["feature_names"],
+                         news_count + len(batch.news_ids), int(context_offsets[-1]))
+        self.stats["rows_appended"] += len(batch)
+
+    def _rewrite(self, ticker: str, batch: SnapshotBatch):
+        ticker_dir = self._ticker_dir(ticker)
+        ticker_dir.mkdir(parents=True, exist_ok=True)
+        self._mapped.pop(ticker, None)
+        context_lengths = np.fromiter((len(c) for c in batch.contexts), dtype=ID_DTYPE, count=len(batch))
+        contents = {
+            "as_of": batch.as_of.astype(TIME_DTYPE).tobytes(),
+            "features": np.ascontiguousarray(batch.features, dtype=VALUE_DTYPE).tobytes(),
+            "news_offsets": batch.news_offsets.astype(ID_DTYPE).tobytes(),
+            "news_ids": batch.news_ids.astype(ID_DTYPE).tobytes(),
+            "context_offsets": np.concatenate([[0], np.cumsum(context_lengths)]).astype(ID_DTYPE).tobytes(),
+            "context": b"".join(batch.contexts),
+        }
+        for name, data in contents.items():
+            path = self._path(ticker_dir, name)
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        self._write_meta(ticker, len(batch), batch.feature_names, len(batch.news_ids), int(context_lengths.sum()))
+        self.stats["rows_appended"] += len(batch)
+
+    # ─── 내부 ─────────────────────────────────────────────────
+
+    def _read_row(self, ticker: str, index: int) -> FeatureSnapshot:
+        _, mapped = self._map(ticker)
+        names = self._read_meta(ticker)["feature_names"]
+        values = mapped["features"][index]
+        news = mapped["news_ids"][mapped["news_offsets"][index]:mapped["news_offsets"][index + 1]]
+        context = json.loads(bytes(mapped["context"][mapped["context_offsets"][index]:mapped["context_offsets"][index + 1]]))
+        return FeatureSnapshot(
+            ticker=ticker,
+            as_of=_from_ns(mapped["as_of"][index]),
+            features={name: float(value) for name, value in zip(names, values) if not np.isnan(value)},
+            news_ids=news.tolist(),
+            macro=context["macro"],
+            prior_decisions=context["prior_decisions"],
+        )
+
+    def _read_batch(self, ticker: str) -> SnapshotBatch:
+        rows, mapped = self._map(ticker)
+        offsets = np.asarray(mapped["context_offsets"])
+        context = bytes(mapped["context"])
+        return SnapshotBatch(
+            as_of=np.array(mapped["as_of"]),
+            feature_names=self.feature_names(ticker),
+            features=np.array(mapped["features"]),
+            news_offsets=np.array(mapped["news_offsets"]),
+            news_ids=np.array(mapped["news_ids"]),
+            contexts=[context[offsets[i]:offsets[i + 1]] for i in range(rows)],
+        )
+
+    def _rows(self, ticker: str) -> int:
+        meta = self._read_meta(ticker)
+        return meta["rows"] if meta else 0
+
+    def _map(self, ticker: str) -> Tuple[int, Dict[str, np.ndarray]]:
+        """memmap 오픈 (rows 가 바뀌면 다시 매핑)"""
+        meta = self._read_meta(ticker)
+        rows = meta["rows"] if meta else 0
+        cached = self._mapped.get(ticker)
+        if cached and cached[0] == rows:
+            return cached
+        mapped: Dict[str, np.ndarray] = {}
+        if rows:
+            ticker_dir = self._ticker_dir(ticker)
+            width = len(meta["feature_names"])
+            shapes = {
+                "as_of": (TIME_DTYPE, (rows,)),
+                "features": (VALUE_DTYPE, (rows, width)),
+                "news_offsets": (ID_DTYPE, (rows + 1,)),
+                "news_ids": (ID_DTYPE, (meta["news_count"],)),
+                "context_offsets": (ID_DTYPE, (rows + 1,)),
+                "context": (np.dtype("u1"), (meta["context_bytes"],)),
+            }
+            for name, (dtype, shape) in shapes.items():
+                if 0 in shape:
+                    mapped[name] = np.empty(shape, dtype)
+                else:
+                    mapped[name] = np.memmap(self._path(ticker_dir, name), dtype=dtype, mode="r", shape=shape)
+        else:
+            mapped["as_of"] = np.empty(0, TIME_DTYPE)
+        self._mapped[ticker] = (rows, mapped)
+        return self._mapped[ticker]
+
+    def _ticker_dir(self, ticker: str) -> Path:
+        return self.snapshots_dir / ticker
+
+    @staticmethod
+    def _path(ticker_dir: Path, name: str) -> Path:
+        return ticker_dir / (f"{name}.jsonl" if name == "context" else f"{name}.bin")
+
+    def _read_meta(self, ticker: str) -> Optional[Dict[str, Any]]:
+        if ticker in self._meta:
+            return self._meta[ticker]
+        path = self._ticker_dir(ticker) / "meta.json"
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != SNAPSHOT_VERSION:
+            return None
+        self._meta[ticker] = meta
+        return meta
+
+    def _write_meta(self, ticker: str, rows: int, feature_names: List[str], news_count: int, context_bytes: int):
+        path = self._ticker_dir(ticker) / "meta.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "rows": rows,
+            "feature_names": list(feature_names),
+            "news_count": news_count,
+            "context_bytes": context_bytes,
+            "updated_at": datetime.now().isoformat(),
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+        self._meta[ticker] = meta
+
+    def get_stats(self) -> Dict[str, Any]:
+        tickers = self.tickers()
+        return {
+            **self.stats,
+            "root": str(self.root),
+            "tickers": tickers,
+            "rows": sum(self._rows(t) for t in tickers),
+        }
+
+
+def _merge(existing: SnapshotBatch, new: SnapshotBatch) -> SnapshotBatch:
+    """기존 + 신규 (같은 as_of 는 신규 우선), 피처는 합집합 (없는 값 NaN)"""
+    names = list(existing.feature_names) + [n for n in new.feature_names if n not in existing.feature_names]
+
+    def widen(batch: SnapshotBatch) -> np.ndarray:
+        out = np.full((len(batch), len(names)), np.nan, dtype=VALUE_DTYPE)
+        for j, name in enumerate(batch.feature_names):
+            out[:, names.index(name)] = batch.features[:, j]
+        return out
+
+    keep = ~np.isin(existing.as_of, new.as_of)
+    as_of = np.concatenate([existing.as_of[keep], new.as_of])
+    features = np.concatenate([widen(existing)[keep], widen(new)])
+    news_lists = [existing.news_ids[existing.news_offsets[i]:existing.news_offsets[i + 1]]
+                  for i in np.flatnonzero(keep)]
+    news_lists += [new.news_ids[new.news_offsets[i]:new.news_offsets[i + 1]] for i in range(len(new))]
+    contexts = [existing.contexts[i] for i in np.flatnonzero(keep)] + list(new.contexts)
+
+    order = np.argsort(as_of, kind="stable")
+    news_lists = [news_lists[i] for i in order]
+    lengths = [len(n) for n in news_lists]
+    return SnapshotBatch(
+        as_of=as_of[order],
+        feature_names=names,
+        features=features[order],
+        news_offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(ID_DTYPE),
+        news_ids=np.concatenate(news_lists).astype(ID_DTYPE) if news_lists else np.empty(0, ID_DTYPE),
+        contexts=[contexts[i] for i in order],
+    )
+
+
+class FeatureSnapshotBuilder:
+    """
+    (티커, 결정 시각) 스냅샷 생성
+
+    입력 데이터는 구간 전체를 한 번씩만 읽고 (가격: 티커당 1회, 뉴스: 1회),
+    결정 시각별 as-of 선택은 정렬된 시각 배열 위 이진 탐색으로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        store: FeatureSnapshotStore,
+        data_source: Optional[BacktestDataSource] = None,
+        news_window_hours: int = 24,
+        price_lag: timedelta = DEFAULT_PRICE_LAG,
+        feature_lookback_days: int = 60,
+        max_prior_decisions: int = 5,
+    ):
+        self.store = store
+        self.data_source = data_source
+        self.news_window = timedelta(hours=news_window_hours)
+        self.price_lag = price_lag
+        self.feature_lookback_days = feature_lookback_days
+        self.max_prior_decisions = max_prior_decisions
+
+    def build(
+        self,
+        tickers: List[str],
+        start: Union[date, datetime],
+        end: Union[date, datetime],
+        decision_time: time = time(9, 30),
+        decision_times: Optional[Sequence[datetime]] = None,
+        macro_snapshots: Optional[List[Dict[str, Any]]] = None,
+        decisions: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, int]:
+        """
+        스냅샷 생성 후 저장
+
+        Args:
+            decision_times: 결정 시각 목록 (없으면 start~end 영업일의 decision_time)
+            macro_snapshots: 거시 스냅샷 dict 목록 (created_at / snapshot_date 기준 가용)
+            decisions: 과거 결정 dict 목록 (ticker, created_at, action, confidence, ...)
+
+        Returns:
+            {ticker: 저장된 스냅샷 수}
+        """
+        start_d = start.date() if isinstance(start, datetime) else start
+        end_d = end.date() if isinstance(end, datetime) else end
+        if decision_times is None:
+            decision_times = [datetime.combine(d.date(), decision_time) for d in pd.bdate_range(start_d, end_d)]
+        as_of = np.sort(np.array([_to_ns(t) for t in decision_times], dtype=TIME_DTYPE))
+        if len(as_of) == 0:
+            return {}
+
+        news_by_ticker = self._index_news(tickers, start_d, end_d)
+        macro_times, macro_items = _sorted_by_time(macro_snapshots or [], ("created_at", "snapshot_date"))
+        macro_index = np.searchsorted(macro_times, as_of, side="right") - 1
+        decisions_by_ticker = _group_decisions(decisions or [])
+
+        written = {}
+        for ticker in tickers:
+            ticker = ticker.upper()
+            feature_names, features = self._features(ticker, start_d, end_d, as_of)
+
+            news_times, news_ids = news_by_ticker.get(ticker, (np.empty(0, TIME_DTYPE), np.empty(0, ID_DTYPE)))
+            lo = np.searchsorted(news_times, as_of - _delta_ns(self.news_window), side="left")
+            hi = np.searchsorted(news_times, as_of, side="right")
+            news_offsets = np.concatenate([[0], np.cumsum(hi - lo)]).astype(ID_DTYPE)
+            ids = np.concatenate([news_ids[a:b] for a, b in zip(lo, hi)]) if len(news_ids) else np.empty(0, ID_DTYPE)
+
+            decision_times_t, decision_items = decisions_by_ticker.get(ticker, (np.empty(0, TIME_DTYPE), []))
+            prior_end = np.searchsorted(decision_times_t, as_of, side="left")  # as_of 시각 결정은 제외
+
+            contexts = []
+            for i in range(len(as_of)):
+                macro = macro_items[macro_index[i]] if macro_index[i] >= 0 else None
+                first = max(0, prior_end[i] - self.max_prior_decisions)
+                contexts.append(_encode_context(macro, decision_items[first:prior_end[i]]))
+
+            batch = SnapshotBatch(
+                as_of=as_of,
+                feature_names=feature_names,
+                features=features,
+                news_offsets=news_offsets,
+                news_ids=ids.astype(ID_DTYPE),
+                contexts=contexts,
+            )
+            written[ticker] = self.store.write(ticker, batch)
+
+        logger.info(f"Feature snapshots built: {len(tickers)} tickers × {len(as_of)} decision times")
+        return written
+
+    def _features(self, ticker: str, start: date, end: date, as_of: np.ndarray) -> Tuple[List[str], np.ndarray]:
+        names = list(PRICE_FEATURES)
+        features = np.full((len(as_of), len(names)), np.nan, dtype=VALUE_DTYPE)
+        if self.data_source is None:
+            return names, features
+
+        prices = self.data_source.get_prices(ticker, start - timedelta(days=self.feature_lookback_days), end)
+        if len(prices) == 0:
+            return names, features
+        table = compute_price_features(prices).to_numpy(dtype=VALUE_DTYPE)
+        bar_times = pd.DatetimeIndex(prices.index)
+        if bar_times.tz is not None:
+            bar_times = bar_times.tz_localize(None)
+        available = bar_times.astype("datetime64[ns]").asi8 + _delta_ns(self.price_lag)
+        index = np.searchsorted(available, as_of, side="right") - 1
+        valid = index >= 0
+        features[valid] = table[index[valid]]
+        return names, features
+
+    def _index_news(self, tickers: List[str], start: date, end: date) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """티커별 (crawled_at 정렬 시각, 뉴스 ID)"""
+        if self.data_source is None:
+            return {}
+        window_days = self.news_window.days + 1
+        items = self.data_source.get_news(start - timedelta(days=window_days), end)
+        wanted = {t.upper() for t in tickers}
+        grouped: Dict[str, List[Tuple[int, int]]] = {}
+        for item in items:
+            crawled_at = item.get("crawled_at")
+            if crawled_at is None or item.get("id") is None:
+                continue
+            related = {(item.get("ticker") or "").upper(), *[(t or "").upper() for t in item.get("tickers") or []]}
+            for ticker in related & wanted:
+                grouped.setdefault(ticker, []).append((_to_ns(crawled_at), int(item["id"])))
+        result = {}
+        for ticker, pairs in grouped.items():
+            pairs.sort()
+            result[ticker] = (np.array([p[0] for p in pairs], dtype=TIME_DTYPE), np.array([p[1] for p in pairs], dtype=ID_DTYPE))
+        return result
+
+
+def _sorted_by_time(items: List[Dict[str, Any]], time_fields: Tuple[str, ...]) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    keyed = []
+    for item in items:
+        value = next((item[f] for f in time_fields if item.get(f) is not None), None)
+        if value is not None:
+            keyed.append((_to_ns(value), item))
+    keyed.sort(key=lambda pair: pair[0])
+    return np.array([k for k, _ in keyed], dtype=TIME_DTYPE), [item for _, item in keyed]
+
+
+def _group_decisions(decisions: List[Dict[str, Any]]) -> Dict[str, Tuple[np.ndarray, List[Dict[str, Any]]]]:
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for decision in decisions:
+        ticker = (decision.get("ticker") or "").upper()
+        if ticker:
+            grouped.setdefault(ticker, []).append(decision)
+    return {ticker: _sorted_by_time(items, ("created_at", "timestamp")) for ticker, items in grouped.items()}
+
+
+# ═══════════════════════════════════════════════════════════════
+# DB 입력 (구간당 쿼리 1회)
+# ═══════════════════════════════════════════════════════════════
+
+def load_macro_snapshots(db, start: date, end: date) -> List[Dict[str, Any]]:
+    """MacroContextSnapshot → dict 목록 (start 이전 마지막 스냅샷 포함)"""
+    from backend.database.models import MacroContextSnapshot
+
+    previous = (
+        db.query(MacroContextSnapshot)
+        .filter(MacroContextSnapshot.snapshot_date < start)
+        .order_by(MacroContextSnapshot.snapshot_date.desc())
+        .first()
+    )
+    rows = (
+        db.query(MacroContextSnapshot)
+        .filter(MacroContextSnapshot.snapshot_date.between(start, end))
+        .order_by(MacroContextSnapshot.snapshot_date)
+        .all()
+    )
+    return [
+        {
+            "snapshot_date": row.snapshot_date,
+            "created_at": row.created_at,
+            "regime": row.regime,
+            "fed_stance": row.fed_stance,
+            "vix_level": float(row.vix_level) if row.vix_level is not None else None,
+            "vix_category": row.vix_category,
+            "market_sentiment": row.market_sentiment,
+            "sp500_trend": row.sp500_trend,
+        }
+        for row in ([previous] if previous else []) + rows
+    ]
+
+
+def load_trading_signals(
+    db,
+    tickers: List[str],
+    start: date,
+    end: date,
+    lookback_days: int = 90,
+) -> List[Dict[str, Any]]:
+    """TradingSignal → 과거 결정 dict 목록 (start 이전 lookback_days 포함)"""
+    from backend.database.models import TradingSignal
+
+    rows = (
+        db.query(TradingSignal)
+        .filter(
+            TradingSignal.ticker.in_([t.upper() for t in tickers]),
+            TradingSignal.created_at >= datetime.combine(start - timedelta(days=lookback_days), time.min),
+            TradingSignal.created_at < datetime.combine(end + timedelta(days=1), time.min),
+        )
+        .order_by(TradingSignal.created_at)
+        .all()
+    )
+    return [
+        {
+            "ticker": row.ticker,
+            "created_at": row.created_at,
+            "action": row.action,
+            "confidence": row.confidence,
+            "signal_type": row.signal_type,
+            "source": row.source,
+        }
+        for row in rows
+    ]
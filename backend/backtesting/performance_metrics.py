@@ -9,6 +9,8 @@ import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional, Union
 
+from backend.analytics import risk_metrics
+
 def calculate_total_return(initial_capital: float, final_equity: float) -> float:
     """Calculate total percentage return."""
     if initial_capital == 0:
@@ -27,16 +29,7 @@ def calculate_drawdown_series(equity_curve: List[float]) -> List[float]:
     if not equity_curve:
         return []
     
-    peak = equity_curve[0]
-    drawdowns = []
-    
-    for equity in equity_curve:
-        if equity > peak:
-            peak = equity
-        drawdown = (peak - equity) / peak if peak > 0 else 0.0
-        drawdowns.append(drawdown)
-        
-    return drawdowns
+    return (-risk_metrics.drawdown_series(equity_curve)).tolist()
 
 def calculate_max_drawdown(equity_curve: List[float]) -> float:
     """Calculate Maximum Drawdown."""
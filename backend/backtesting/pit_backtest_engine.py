@@ -16,7 +16,7 @@ Date: 2025-11-15
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -295,12 +295,19 @@ class PointInTimeNewsProvider:
 class HistoricalMarketDataProvider:
     """
     Provides historical market data for backtesting.
-    In production, this would query TimescaleDB or Yahoo Finance cache.
+    With a data_source (BacktestDataCache), daily closes for the backtest range
+    are read from the local cache; otherwise prices must be injected.
     """
     
-    def __init__(self, db_session=None):
+    def __init__(self, db_session=None, data_source=None):
         self.db = db_session
+        self.data_source = data_source
         self._price_cache: Dict[str, Dict[datetime, float]] = {}
+        self._range: Optional[Tuple[datetime, datetime]] = None
+    
+    def set_range(self, start: datetime, end: datetime):
+        """Backtest range used when loading prices from the data source"""
+        self._range = (start, end)
     
     def get_price(self, ticker: str, timestamp: datetime) -> Optional[float]:
         """
@@ -331,10 +338,22 @@ class HistoricalMarketDataProvider:
         return None
     
     def _load_historical_prices(self, ticker: str):
-        """Load historical prices from database"""
-        # Placeholder: In production, load from TimescaleDB
-        # For testing, you can inject mock data
-        self._price_cache[ticker] = {}
+        """Load historical prices from the data source (or empty for injected data)"""
+        if self.data_source is None or self._range is None:
+            self._price_cache[ticker] = {}
+            return
+        
+        from backend.backtesting.feature_snapshots import DEFAULT_PRICE_LAG
+        
+        start, end = self._range
+        # Include a week before start so the first step has a prior close
+        df = self.data_source.get_prices(ticker, start - timedelta(days=7), end)
+        # Daily bars are keyed at 00:00 but hold the close: key each bar at the time
+        # it becomes available (date + close), so intraday steps see the prior close
+        self._price_cache[ticker] = {
+            ts.to_pydatetime() + DEFAULT_PRICE_LAG: float(close)
+            for ts, close in zip(df.index, df["close"].to_numpy())
+        }
     
     def load_mock_prices(self, ticker: str, prices: Dict[datetime, float]):
         """Load mock prices for testing"""
@@ -363,6 +382,7 @@ class PointInTimeBacktestEngine:
         slippage_bps: float = 1.0,  # 1 basis point
         commission_pct: float = 0.015,  # 0.015%
         max_position_pct: float = 0.10,  # 10% max per position
+        data_source=None,
     ):
         """
         Initialize backtest engine.
@@ -373,6 +393,7 @@ class PointInTimeBacktestEngine:
             slippage_bps: Slippage in basis points
             commission_pct: Commission percentage
             max_position_pct: Maximum position size as % of portfolio
+            data_source: Shared BacktestDataSource for prices (optional)
         """
         self.db = db_session
         self.initial_capital = initial_capital
@@ -382,7 +403,7 @@ class PointInTimeBacktestEngine:
         
         # Data providers
         self.news_provider = PointInTimeNewsProvider(db_session)
-        self.market_data = HistoricalMarketDataProvider(db_session)
+        self.market_data = HistoricalMarketDataProvider(db_session, data_source=data_source)
         
         # State
         self.cash = initial_capital
@@ -425,6 +446,7 @@ class PointInTimeBacktestEngine:
         self.positions = {}
         self.trades = []
         self.equity_curve = []
+        self.market_data.set_range(start_date, end_date)
         
         current_time = start_date
         last_processed_time = start_date
@@ -5,6 +5,8 @@ Prevents Lookahead Bias by ensuring:
 - Only data available at simulation time is accessed
 - News crawled_at (not published_at) is used for availability
 - AI analyses completed before simulation time only
+- Optional precomputed feature snapshots (feature_snapshots.FeatureSnapshotStore):
+  per-(ticker, decision time) inputs read by as-of binary search, no ORM query per step
 
 Author: AI Trading System
 Date: 2025-11-15
@@ -28,14 +30,16 @@ class PointInTimeDataAccess:
     All queries are filtered by the simulation timestamp.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Optional[Session] = None, snapshot_store=None):
         """
         Initialize with database session.
         
         Args:
             db: SQLAlchemy database session
+            snapshot_store: Optional FeatureSnapshotStore (snapshot replay without DB queries)
         """
         self.db = db
+        self.snapshot_store = snapshot_store
         self._current_simulation_time: Optional[datetime] = None
         self._lookahead_violations: List[Dict[str, Any]] = []
     
@@ -180,6 +184,18 @@ class PointInTimeDataAccess:
         """
         sim_time = self.get_simulation_time()
         
+        snapshot = self.get_snapshot(ticker)
+        if snapshot is not None:
+            return {
+                "ticker": ticker,
+                "as_of": sim_time.isoformat(),
+                "snapshot_as_of": snapshot.as_of.isoformat(),
+                "lookback_days": lookback_days,
+                "features": snapshot.features,
+                "macro": snapshot.macro,
+                "data": [],
+            }
+        
         # TODO: Implement based on your price data storage
         # Example structure:
         # query = self.db.query(PriceData).filter(
@@ -199,6 +215,32 @@ class PointInTimeDataAccess:
             "data": []  # Placeholder
         }
     
+    def get_snapshot(self, ticker: str):
+        """
+        Get the precomputed feature snapshot valid at simulation time.
+        
+        Reads the latest snapshot with as_of <= simulation time (binary search).
+        
+        Args:
+            ticker: Stock symbol
+        
+        Returns:
+            FeatureSnapshot, or None without a snapshot store / snapshot
+        """
+        if self.snapshot_store is None:
+            return None
+        
+        sim_time = self.get_simulation_time()
+        snapshot = self.snapshot_store.as_of(ticker, sim_time)
+        if snapshot is not None:
+            self.validate_no_lookahead(snapshot.as_of, f"FeatureSnapshot:{ticker}")
+        return snapshot
+    
+    def get_available_news_ids(self, ticker: str) -> List[int]:
+        """News IDs the agents saw at simulation time (from the snapshot)"""
+        snapshot = self.get_snapshot(ticker)
+        return snapshot.news_ids if snapshot is not None else []
+    
     def validate_no_lookahead(
         self,
         data_timestamp: datetime,
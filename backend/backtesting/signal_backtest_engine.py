@@ -21,6 +21,8 @@ from enum import Enum
 import math
 import logging
 
+from backend.analytics import risk_metrics
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -336,8 +338,10 @@ class SignalBacktestEngine:
         max_holding_days: int = 5,  # 최대 보유 기간
         stop_loss_pct: float = 2.0,  # 손절 %
         take_profit_pct: float = 5.0,  # 익절 %
+        data_source=None,  # 공용 BacktestDataSource (price_data 미지정 시 사용)
     ):
         self.initial_capital = initial_capital
+        self.data_source = data_source
         self.commission_rate = commission_rate
         self.slippage_bps = slippage_bps / 10000  # Convert to decimal
         self.max_holding_days = max_holding_days
@@ -366,11 +370,14 @@ class SignalBacktestEngine:
     async def run(
         self,
         news_analyses: List[NewsAnalysis],
-        price_data: Dict[str, Dict[str, float]],  # {date: {ticker: price}}
+        price_data: Optional[Dict[str, Dict[str, float]]],  # {date: {ticker: price}}
         start_date: datetime,
         end_date: datetime
     ) -> BacktestResult:
-        """백테스트 실행"""
+        """백테스트 실행 (price_data 가 None 이면 data_source 에서 로드)"""
+        
+        if price_data is None:
+            price_data = self._load_price_data(news_analyses, start_date, end_date)
         
         logger.info(f"Starting backtest from {start_date} to {end_date}")
         logger.info(f"Initial capital: ${self.initial_capital:,.2f}")
@@ -423,6 +430,20 @@ class SignalBacktestEngine:
         # 8. 결과 계산
         return self._calculate_results(start_date, end_date)
     
+    def _load_price_data(
+        self,
+        news_analyses: List[NewsAnalysis],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, Dict[str, float]]:
+        """분석 대상 티커 종가를 공용 데이터 소스(로컬 캐시)에서 로드"""
+        if self.data_source is None:
+            raise ValueError("price_data or data_source is required")
+        tickers = sorted({
+            ticker for ticker in map(self.signal_generator._extract_primary_ticker, news_analyses) if ticker
+        })
+        return self.data_source.closes_by_date(tickers, start_date, end_date)
+    
     def _get_available_analyses(
         self,
         all_analyses: List[NewsAnalysis],
@@ -743,17 +764,7 @@ class SignalBacktestEngine:
         if len(self.equity_curve) < 2:
             return 0.0
         
-        peak = self.equity_curve[0]
-        max_drawdown = 0.0
-        
-        for value in self.equity_curve[1:]:
-            if value > peak:
-                peak = value
-            
-            drawdown = (peak - value) / peak * 100
-            max_drawdown = max(max_drawdown, drawdown)
-        
-        return -max_drawdown
+        return risk_metrics.max_drawdown(self.equity_curve) * 100
 
 
 # =============================================================================
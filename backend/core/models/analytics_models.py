@@ -165,6 +165,7 @@ class TradeExecution(Base):
     __table_args__ = (
         Index('idx_trade_ticker', 'ticker'),
         Index('idx_trade_execution_timestamp', 'execution_timestamp'),
+        Index('idx_trade_exit_timestamp_status', 'exit_timestamp', 'status'),
         Index('idx_trade_status', 'status'),
         Index('idx_trade_ai_source', 'ai_source'),
         Index('idx_trade_strategy', 'strategy_name'),
@@ -12,6 +12,7 @@ Includes support for:
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, Boolean, Index, Float
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
+from sqlalchemy.orm import validates
 from sqlalchemy.sql import func
 
 from backend.core.database import Base
@@ -68,6 +69,12 @@ class NewsArticle(Base):
         Index('idx_news_event_type', 'event_type'),
     )
     
+    @validates("tickers")
+    def _normalize_tickers(self, key, tickers):
+        """티커 태그는 대문자로 저장 (news_query 의 tickers @> ARRAY[티커] 는 대소문자 구분)"""
+        from backend.database.news_query import normalize_ticker_tags
+        return normalize_ticker_tags(tickers)
+
     def __repr__(self):
         return f"<NewsArticle(id={self.id}, title='{self.title[:50]}...')>"
 
@@ -0,0 +1,656 @@
+"""
+Backfill Job Queue - 영속 백필 작업 큐 (청크 단위 체크포인트/재시도)
+
+data_backfill_router 가 in-process `active_jobs` dict + FastAPI BackgroundTasks 로
+백필을 API 워커 이벤트 루프에서 돌리던 것을, DB 테이블 기반 작업 큐로 옮깁니다.
+API 는 작업을 등록/조회만 하고, 실제 수집은 별도 워커 프로세스
+(backend.data.backfill_worker) 가 청크를 가져가 실행합니다.
+
+- 저장소: Postgres (운영, BACKFILL_QUEUE_URL) 또는 SQLite (로컬 기본값)
+  → 재시작해도 진행 상황 유지, 여러 uvicorn 워커가 같은 작업 뷰를 봄
+- 청크: 작업을 (ticker, 기간) 단위로 분할 → 청크별 상태/시도 횟수/체크포인트/진행률
+- claim: Postgres 는 SELECT ... FOR UPDATE SKIP LOCKED, SQLite 는 조건부 UPDATE
+  (두 경우 모두 rowcount 로 선점 확인) + lease (locked_until) 만료 시 다른 워커가 회수
+- 재시도: 실패 시 지수 back-off (retry_base_seconds * 2^(attempts-1), 상한 retry_max_seconds),
+  max_attempts 초과 시 청크 failed
+- 진행률: 청크 진행률을 조회 시 합산 → 기존 /status/{job_id} 응답 형식 유지
+
+Usage:
+    queue = BackfillQueue("sqlite:///data/backfill_queue.db")
+    job = queue.enqueue("price_backfill", {"tickers": ["AAPL"], "start_date": "2020-01-01",
+                                           "end_date": "2025-01-01", "interval": "1d"})
+    chunk = queue.claim("worker-1", "yfinance")
+    queue.checkpoint(chunk["id"], "worker-1", {"last_time": "..."}, {"saved_data_points": 250})
+    queue.complete(chunk["id"], "worker-1", {"saved_data_points": 1258})
+    queue.get_job(job["job_id"])["progress"]
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    create_engine,
+    event,
+    func,
+    or_,
+    select,
+    update,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# 작업 유형 → 데이터 소스 (소스별 워커 병렬도 단위)
+JOB_SOURCES = {
+    "price_backfill": "yfinance",
+    "news_backfill": "multi_source",
+}
+
+# 소스별 기본 워커 프로세스 수 (BACKFILL_CONCURRENCY="yfinance=8,multi_source=1" 로 변경)
+DEFAULT_CONCURRENCY = {
+    "yfinance": 4,
+    "multi_source": 2,
+}
+
+# 청크 기간 (일): Yahoo Finance 인터벌별 조회 한도 이내
+PRICE_CHUNK_DAYS = {"1d": 365, "1h": 60, "1m": 7}
+NEWS_CHUNK_DAYS = 7
+
+# 기존 API 응답과 같은 progress 키 (청크 진행률 합산 시작값)
+PROGRESS_TEMPLATES = {
+    "price_backfill": {
+        "total_tickers": 0,
+        "processed_tickers": 0,
+        "total_data_points": 0,
+        "saved_data_points": 0,
+        "failed_tickers": 0,
+    },
+    "news_backfill": {
+        "total_articles": 0,
+        "crawled_articles": 0,
+        "processed_articles": 0,
+        "saved_articles": 0,
+        "failed_articles": 0,
+    },
+}
+
+JOB_TERMINAL = ("completed", "failed", "cancelled")
+CHUNK_TERMINAL = ("completed", "failed", "cancelled")
+
+metadata = MetaData()
+
+backfill_jobs = Table(
+    "backfill_jobs",
+    metadata,
+    Column("id", String(36), primary_key=True),
+    Column("job_type", String(32), nullable=False),
+    Column("source", String(32), nullable=False),
+    Column("status", String(16), nullable=False, default="pending"),
+    Column("params", JSON, nullable=False),
+    Column("total_chunks", Integer, nullable=False, default=0),
+    Column("created_at", DateTime, nullable=False),
+    Column("started_at", DateTime),
+    Column("completed_at", DateTime),
+    Column("error_message", Text),
+)
+
+backfill_chunks = Table(
+    "backfill_chunks",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("job_id", String(36), nullable=False, index=True),
+    Column("source", String(32), nullable=False),
+    Column("ticker", String(20)),
+    Column("start_date", DateTime, nullable=False),
+    Column("end_date", DateTime, nullable=False),
+    Column("status", String(16), nullable=False, default="pending"),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("max_attempts", Integer, nullable=False, default=5),
+    Column("next_run_at", DateTime, nullable=False),
+    Column("locked_by", String(64)),
+    Column("locked_until", DateTime),
+    Column("checkpoint", JSON),
+    Column("progress", JSON),
+    Column("error", Text),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Index("idx_backfill_jobs_created", backfill_jobs.c.created_at)
+
+# claim 스캔용 (status, source, next_run_at)
+Index("idx_backfill_chunks_claim", backfill_chunks.c.status, backfill_chunks.c.source, backfill_chunks.c.next_run_at)
+
+
+def parse_concurrency(spec: Optional[str]) -> Dict[str, int]:
+    """"yfinance=8,multi_source=1" → {"yfinance": 8, "multi_source": 1} (기본값에 덮어씀)"""
+    concurrency = dict(DEFAULT_CONCURRENCY)
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        source, _, count = item.partition("=")
+        concurrency[source.strip()] = max(0, int(count))
+    return concurrency
+
+
+def _windows(start: datetime, end: datetime, days: int) -> List[tuple]:
+    """[start, end) 를 days 일 단위 연속 구간으로 분할 (마지막 구간은 end 까지)"""
+    windows = []
+    cursor = start
+    while True:
+        window_end = min(cursor + timedelta(days=days), end)
+        windows.append((cursor, window_end))
+        if window_end >= end:
+            return windows
+        cursor = window_end
+
+
+def plan_chunks(job_type: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    작업 파라미터 → (ticker, start, end) 청크 목록
+
+    - price_backfill: 티커별 × 인터벌 청크 기간
+    - news_backfill: 티커별 (없으면 ticker=None 하나) × NEWS_CHUNK_DAYS
+    """
+    start = datetime.fromisoformat(params["start_date"]).replace(tzinfo=None)
+    end = datetime.fromisoformat(params["end_date"]).replace(tzinfo=None)
+
+    if job_type == "price_backfill":
+        tickers = [t.upper() for t in params["tickers"]]
+        days = PRICE_CHUNK_DAYS.get(params.get("interval", "1d"), 365)
+    elif job_type == "news_backfill":
+        tickers = [t.upper() for t in params.get("tickers") or []] or [None]
+        days = NEWS_CHUNK_DAYS
+    else:
+        raise ValueError(f"Unknown backfill job type: {job_type}")
+
+    return [
+        {"ticker": ticker, "start_date": window_start, "end_date": window_end}
+        for ticker in tickers
+        for window_start, window_end in _windows(start, end, days)
+    ]
+
+
+class BackfillQueue:
+    """
+    DB 기반 백필 작업 큐
+
+    jobs (작업 메타) / chunks (실행 단위) 두 테이블을 사용합니다. 워커 간 조정은
+    전부 DB 트랜잭션으로 하므로 API 프로세스와 워커 프로세스가 URL 만 공유하면 됩니다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_attempts: int = 5,
+        lease_seconds: int = 300,
+        retry_base_seconds: float = 30.0,
+        retry_max_seconds: float = 3600.0,
+    ):
+        self.url = url
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+
+        self.is_sqlite = url.startswith("sqlite")
+        if self.is_sqlite:
+            db_path = url.split(":///", 1)[-1]
+            if db_path and db_path != ":memory:" and os.path.dirname(db_path):
+                os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self.engine = create_engine(url, connect_args={"timeout": 30})
+            event.listen(self.engine, "connect", _sqlite_on_connect)
+        else:
+            self.engine = create_engine(url.replace("postgresql+asyncpg://", "postgresql://"), pool_pre_ping=True)
+
+        metadata.create_all(self.engine)
+
+        self.stats = {
+            "enqueued_jobs": 0,
+            "claimed_chunks": 0,
+            "completed_chunks": 0,
+            "retried_chunks": 0,
+            "failed_chunks": 0,
+            "cancelled_chunks": 0,
+            "claim_conflicts": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 작업 등록 / 취소
+    # ------------------------------------------------------------------
+
+    def enqueue(self, job_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 + 청크 등록 (한 트랜잭션)"""
+        chunks = plan_chunks(job_type, params)
+        source = JOB_SOURCES[job_type]
+        now = datetime.now()
+        job_id = str(uuid4())
+
+        with self.engine.begin() as conn:
+            conn.execute(backfill_jobs.insert().values(
+                id=job_id,
+                job_type=job_type,
+                source=source,
+                status="pending",
+                params=params,
+                total_chunks=len(chunks),
+                created_at=now,
+            ))
+            conn.execute(backfill_chunks.insert(), [
+                {
+                    "job_id": job_id,
+                    "source": source,
+                    "ticker": chunk["ticker"],
+                    "start_date": chunk["start_date"],
+                    "end_date": chunk["end_date"],
+                    "status": "pending",
+                    "attempts": 0,
+                    "max_attempts": self.max_attempts,
+                    "next_run_at": now,
+                    "progress": {},
+                    "updated_at": now,
+                }
+                for chunk in chunks
+            ])
+
+        self.stats["enqueued_jobs"] += 1
+        logger.info(f"Backfill job {job_id} ({job_type}) queued with {len(chunks)} chunks")
+        return self.get_job(job_id)
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """
+        작업 취소 (대기 청크는 cancelled, 실행 중 청크는 다음 체크포인트에서 중단)
+
+        Returns:
+            취소 전 상태 (작업 없으면 None)
+        """
+        now = datetime.now()
+        with self.engine.begin() as conn:
+            status = conn.execute(
+                select(backfill_jobs.c.status).where(backfill_jobs.c.id == job_id)
+            ).scalar()
+            if status is None or status in JOB_TERMINAL:
+                return status
+            conn.execute(update(backfill_jobs).where(backfill_jobs.c.id == job_id).values(
+                status="cancelled", completed_at=now, error_message="Cancelled by user",
+            ))
+            conn.execute(update(backfill_chunks).where(and_(
+                backfill_chunks.c.job_id == job_id,
+                backfill_chunks.c.status == "pending",
+            )).values(status="cancelled", updated_at=now))
+        logger.info(f"Backfill job {job_id} cancelled")
+        return status
+
+    # ------------------------------------------------------------------
+    # 워커 API
+    # ------------------------------------------------------------------
+
+    def claim(self, worker_id: str, source: str) -> Optional[Dict[str, Any]]:
+        """
+        실행할 청크 하나 선점 (없으면 None)
+
+        대상: 실행 시각이 된 pending 청크 또는 lease 가 만료된 running 청크
+        (워커 크래시). 만료 청크가 시도 횟수를 다 썼으면 failed, 작업이 취소됐으면
+        cancelled 처리 후 다음 청크.
+        """
+        while True:
+            now = datetime.now()
+            claimable = and_(
+                backfill_chunks.c.source == source,
+                or_(
+                    and_(backfill_chunks.c.status == "pending", backfill_chunks.c.next_run_at <= now),
+                    and_(backfill_chunks.c.status == "running", backfill_chunks.c.locked_until < now),
+                ),
+            )
+            with self.engine.begin() as conn:
+                row = conn.execute(
+                    select(backfill_chunks)
+                    .where(claimable)
+                    .order_by(backfill_chunks.c.next_run_at, backfill_chunks.c.id)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                ).mappings().first()
+                if row is None:
+                    return None
+
+                job = conn.execute(
+                    select(backfill_jobs.c.job_type, backfill_jobs.c.params, backfill_jobs.c.status)
+                    .where(backfill_jobs.c.id == row["job_id"])
+                ).mappings().first()
+                if job["status"] == "cancelled":
+                    claimed = conn.execute(update(backfill_chunks).where(and_(
+                        backfill_chunks.c.id == row["id"], claimable,
+                    )).values(status="cancelled", locked_by=None, locked_until=None, updated_at=now)).rowcount
+                    if claimed:
+                        self.stats["cancelled_chunks"] += 1
+                    continue
+
+                if row["status"] == "running" and row["attempts"] >= row["max_attempts"]:
+                    claimed = conn.execute(update(backfill_chunks).where(and_(
+                        backfill_chunks.c.id == row["id"], claimable,
+                    )).values(
+                        status="failed", locked_by=None, locked_until=None, updated_at=now,
+                        error=f"Worker lease expired ({row['locked_by']})",
+                    )).rowcount
+                    if claimed:
+                        self.stats["failed_chunks"] += 1
+                        self._finalize_job(conn, row["job_id"])
+                    continue
+
+                claimed = conn.execute(update(backfill_chunks).where(and_(
+                    backfill_chunks.c.id == row["id"], claimable,
+                )).values(
+                    status="running",
+                    attempts=backfill_chunks.c.attempts + 1,
+                    locked_by=worker_id,
+                    locked_until=now + timedelta(seconds=self.lease_seconds),
+                    updated_at=now,
+                )).rowcount
+                if not claimed:
+                    # SQLite: 다른 프로세스가 먼저 선점 (Postgres 는 SKIP LOCKED 로 발생하지 않음)
+                    self.stats["claim_conflicts"] += 1
+                    continue
+
+                conn.execute(update(backfill_jobs).where(and_(
+                    backfill_jobs.c.id == row["job_id"],
+                    backfill_jobs.c.status == "pending",
+                )).values(status="running", started_at=now))
+
+            self.stats["claimed_chunks"] += 1
+            return {
+                **row,
+                "status": "running",
+                "attempts": row["attempts"] + 1,
+                "locked_by": worker_id,
+                "checkpoint": row["checkpoint"] or {},
+                "progress": row["progress"] or {},
+                "job_type": job["job_type"],
+                "params": job["params"],
+            }
+
+    def checkpoint(
+        self,
+        chunk_id: int,
+        worker_id: str,
+        checkpoint: Dict[str, Any],
+        progress: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        청크 체크포인트 저장 + lease 연장
+
+        Returns:
+            계속 진행해도 되면 True (작업 취소 또는 lease 상실 시 False)
+        """
+        now = datetime.now()
+        values = {
+            "checkpoint": checkpoint,
+            "locked_until": now + timedelta(seconds=self.lease_seconds),
+            "updated_at": now,
+        }
+        if progress is not None:
+            values["progress"] = progress
+
+        with self.engine.begin() as conn:
+            owned = conn.execute(update(backfill_chunks).where(and_(
+                backfill_chunks.c.id == chunk_id,
+                backfill_chunks.c.status == "running",
+                backfill_chunks.c.locked_by == worker_id,
+            )).values(**values)).rowcount
+            if not owned:
+                return False
+            job_status = conn.execute(
+                select(backfill_jobs.c.status)
+                .select_from(backfill_jobs.join(backfill_chunks, backfill_chunks.c.job_id == backfill_jobs.c.id))
+                .where(backfill_chunks.c.id == chunk_id)
+            ).scalar()
+        return job_status != "cancelled"
+
+    def complete(self, chunk_id: int, worker_id: str, progress: Dict[str, Any]) -> bool:
+        """청크 완료 (lease 를 가진 워커만)"""
+        return self._release(chunk_id, worker_id, status="completed", progress=progress)
+
+    def fail(self, chunk_id: int, worker_id: str, error: str, progress: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        청크 실패 → 시도 횟수가 남았으면 back-off 후 재시도, 아니면 failed
+
+        체크포인트는 유지되므로 재시도는 이어서 실행됩니다.
+        """
+        return self._release(chunk_id, worker_id, status="failed", progress=progress, error=error)
+
+    def abandon(self, chunk_id: int, worker_id: str, progress: Optional[Dict[str, Any]] = None) -> bool:
+        """취소된 작업의 실행 중 청크 정리 (cancelled)"""
+        return self._release(chunk_id, worker_id, status="cancelled", progress=progress)
+
+    def retry_delay(self, attempts: int) -> float:
+        """attempts 번째 실패 후 대기 시간 (초)"""
+        return min(self.retry_base_seconds * 2 ** max(attempts - 1, 0), self.retry_max_seconds)
+
+    def _release(
+        self,
+        chunk_id: int,
+        worker_id: str,
+        status: str,
+        progress: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        now = datetime.now()
+        with self.engine.begin() as conn:
+            row = conn.execute(
+                select(backfill_chunks.c.job_id, backfill_chunks.c.attempts, backfill_chunks.c.max_attempts)
+                .where(and_(
+                    backfill_chunks.c.id == chunk_id,
+                    backfill_chunks.c.status == "running",
+                    backfill_chunks.c.locked_by == worker_id,
+                ))
+                .with_for_update()
+            ).mappings().first()
+            if row is None:
+                logger.warning(f"Backfill chunk {chunk_id}: lease lost by {worker_id}")
+                return False
+
+            values = {"locked_by": None, "locked_until": None, "updated_at": now}
+            if progress is not None:
+                values["progress"] = progress
+            job_status = conn.execute(
+                select(backfill_jobs.c.status).where(backfill_jobs.c.id == row["job_id"])
+            ).scalar()
+            if status == "failed" and job_status == "cancelled":
+                status = "cancelled"  # 취소된 작업은 재시도하지 않음
+            if status == "failed":
+                values["error"] = (error or "")[:1000]
+                if row["attempts"] < row["max_attempts"]:
+                    status = "pending"
+                    values["next_run_at"] = now + timedelta(seconds=self.retry_delay(row["attempts"]))
+            values["status"] = status
+
+            conn.execute(update(backfill_chunks).where(backfill_chunks.c.id == chunk_id).values(**values))
+            if status in CHUNK_TERMINAL:
+                self._finalize_job(conn, row["job_id"])
+
+        key = {
+            "completed": "completed_chunks",
+            "pending": "retried_chunks",
+            "failed": "failed_chunks",
+            "cancelled": "cancelled_chunks",
+        }[status]
+        self.stats[key] += 1
+        return True
+
+    def _finalize_job(self, conn, job_id: str):
+        """남은 청크가 없으면 작업 완료/실패 처리 (취소된 작업은 그대로)"""
+        # 작업 행을 먼저 잠가 마지막 청크 둘이 동시에 끝날 때 서로의 상태를 못 보고
+        # 둘 다 미완료로 판단하는 경합 방지 (SQLite 는 쓰기 트랜잭션이 이미 직렬화)
+        conn.execute(select(backfill_jobs.c.id).where(backfill_jobs.c.id == job_id).with_for_update())
+        counts = dict(conn.execute(
+            select(backfill_chunks.c.status, func.count())
+            .where(backfill_chunks.c.job_id == job_id)
+            .group_by(backfill_chunks.c.status)
+        ).all())
+        if any(status not in CHUNK_TERMINAL for status in counts):
+            return
+
+        failed = counts.get("failed", 0)
+        conn.execute(update(backfill_jobs).where(and_(
+            backfill_jobs.c.id == job_id,
+            backfill_jobs.c.status.in_(("pending", "running")),
+        )).values(
+            status="failed" if failed else "completed",
+            completed_at=datetime.now(),
+            error_message=f"{failed} chunk(s) failed after retries" if failed else None,
+        ))
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 + 합산 진행률 (없으면 None)"""
+        jobs = self._load_jobs(select(backfill_jobs).where(backfill_jobs.c.id == job_id))
+        return jobs[0] if jobs else None
+
+    def list_jobs(
+        self,
+        status: Optional[str] = None,
+        job_type: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """작업 목록 (최신순)"""
+        query = select(backfill_jobs)
+        if status:
+            query = query.where(backfill_jobs.c.status == status)
+        if job_type:
+            query = query.where(backfill_jobs.c.job_type == job_type)
+        return self._load_jobs(query.order_by(backfill_jobs.c.created_at.desc()).limit(limit))
+
+    def get_chunks(self, job_id: str) -> List[Dict[str, Any]]:
+        """작업의 청크 목록 (id 순)"""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(backfill_chunks)
+                .where(backfill_chunks.c.job_id == job_id)
+                .order_by(backfill_chunks.c.id)
+            ).mappings().all()
+        return [dict(row) for row in rows]
+
+    def _load_jobs(self, query) -> List[Dict[str, Any]]:
+        with self.engine.connect() as conn:
+            jobs = [dict(row) for row in conn.execute(query).mappings().all()]
+            if not jobs:
+                return []
+            chunks = conn.execute(
+                select(
+                    backfill_chunks.c.job_id,
+                    backfill_chunks.c.ticker,
+                    backfill_chunks.c.status,
+                    backfill_chunks.c.progress,
+                ).where(backfill_chunks.c.job_id.in_([job["id"] for job in jobs]))
+            ).mappings().all()
+
+        by_job: Dict[str, List] = {}
+        for chunk in chunks:
+            by_job.setdefault(chunk["job_id"], []).append(chunk)
+
+        return [
+            {
+                "job_id": job["id"],
+                "job_type": job["job_type"],
+                "source": job["source"],
+                "status": job["status"],
+                "progress": _aggregate_progress(job, by_job.get(job["id"], [])),
+                "created_at": job["created_at"],
+                "started_at": job["started_at"],
+                "completed_at": job["completed_at"],
+                "error_message": job["error_message"],
+                "params": job["params"],
+            }
+            for job in jobs
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.engine.connect() as conn:
+            chunk_counts = dict(conn.execute(
+                select(backfill_chunks.c.status, func.count()).group_by(backfill_chunks.c.status)
+            ).all())
+        return {
+            **self.stats,
+            "backend": "sqlite" if self.is_sqlite else "postgresql",
+            "chunks_by_status": chunk_counts,
+        }
+
+
+def _aggregate_progress(job: Dict[str, Any], chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """청크 진행률 합산 → 기존 progress 키 + 청크 카운트"""
+    progress = dict(PROGRESS_TEMPLATES.get(job["job_type"], {}))
+    counts = {status: 0 for status in ("pending", "running", "completed", "failed", "cancelled")}
+    for chunk in chunks:
+        counts[chunk["status"]] = counts.get(chunk["status"], 0) + 1
+        for key, value in (chunk["progress"] or {}).items():
+            if isinstance(value, (int, float)):
+                progress[key] = progress.get(key, 0) + value
+
+    if job["job_type"] == "price_backfill":
+        tickers: Dict[str, set] = {}
+        for chunk in chunks:
+            tickers.setdefault(chunk["ticker"], set()).add(chunk["status"])
+        progress["total_tickers"] = len(tickers)
+        progress["processed_tickers"] = sum(
+            1 for statuses in tickers.values() if statuses <= set(CHUNK_TERMINAL)
+        )
+        progress["failed_tickers"] = sum(1 for statuses in tickers.values() if "failed" in statuses)
+
+    total = job["total_chunks"] or len(chunks)
+    done = counts["completed"] + counts["failed"] + counts["cancelled"]
+    progress.update({
+        "total_chunks": total,
+        "completed_chunks": counts["completed"],
+        "failed_chunks": counts["failed"],
+        "running_chunks": counts["running"],
+        "pending_chunks": counts["pending"],
+        "percent_complete": round(100.0 * done / total, 1) if total else 100.0,
+    })
+    return progress
+
+
+def _sqlite_on_connect(dbapi_connection, connection_record):
+    """SQLite: WAL (API 읽기와 워커 쓰기 동시 진행)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+# 프로젝트 루트 기준 data 디렉토리 (API 와 워커의 실행 디렉토리가 달라도 같은 DB 사용)
+DEFAULT_QUEUE_DB_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "backfill_queue.db"
+
+
+def default_queue_url() -> str:
+    """BACKFILL_QUEUE_URL (운영: Postgres) → 없으면 로컬 SQLite (프로젝트 루트 data/)"""
+    return os.getenv("BACKFILL_QUEUE_URL", f"sqlite:///{DEFAULT_QUEUE_DB_PATH}")
+
+
+# 싱글톤 인스턴스
+_backfill_queue_instance: Optional[BackfillQueue] = None
+
+
+def get_backfill_queue() -> BackfillQueue:
+    """Backfill Queue 싱글톤 반환"""
+    global _backfill_queue_instance
+    if _backfill_queue_instance is None:
+        _backfill_queue_instance = BackfillQueue(default_queue_url())
+    return _backfill_queue_instance
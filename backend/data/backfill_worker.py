@@ -0,0 +1,359 @@
+"""
+Backfill Worker - 백필 큐 워커 프로세스 풀
+
+BackfillQueue 의 청크를 가져가 실행하는 별도 프로세스입니다. API 워커와 분리되어
+수년치 백필이 실시간 요청과 이벤트 루프를 다투지 않습니다.
+
+- 소스별 병렬도: 소스마다 N 개 프로세스 (BACKFILL_CONCURRENCY / --concurrency),
+  각 프로세스는 자기 소스의 청크만 claim → 소스 API rate limit 단위로 조절
+- 체크포인트: 가격은 저장 배치마다 마지막 시각, 뉴스는 저장한 URL
+  → 재시도/lease 회수 시 이미 저장한 데이터는 건너뜀
+- 실패: 예외 → queue.fail() (back-off 재시도), 작업 취소 → 다음 체크포인트에서 중단
+- 배포: 워커 풀을 따로 띄우면 API 는 BACKFILL_WORKER_MODE=external,
+  아니면 API lifespan 이 EmbeddedBackfillWorkers 로 소스당 워커 1개를 직접 실행
+  (워커마다 전용 스레드 + 자체 이벤트 루프 → 동기 수집/DB 호출이 API 루프를 막지 않음)
+
+Usage:
+    python -m backend.data.backfill_worker
+    python -m backend.data.backfill_worker --concurrency yfinance=8,multi_source=1
+    BACKFILL_QUEUE_URL=postgresql://... python -m backend.data.backfill_worker
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from backend.data.backfill_queue import DEFAULT_CONCURRENCY, BackfillQueue, default_queue_url, parse_concurrency
+
+logger = logging.getLogger(__name__)
+
+# 체크포인트 콜백: (checkpoint, progress) → 계속 진행 여부
+CheckpointFn = Callable[[Dict[str, Any], Dict[str, Any]], bool]
+ChunkHandler = Callable[[Dict[str, Any], CheckpointFn], Awaitable[Dict[str, Any]]]
+
+PRICE_SAVE_BATCH = 5000
+NEWS_CHECKPOINT_EVERY = 50
+
+
+class BackfillChunkCancelled(Exception):
+    """작업 취소 또는 lease 상실 → 청크 중단"""
+
+
+async def run_price_chunk(chunk: Dict[str, Any], checkpoint: CheckpointFn) -> Dict[str, Any]:
+    """(ticker, 기간) 가격 수집 → stock_prices 배치 저장 (배치마다 체크포인트)"""
+    from backend.data.collectors.stock_price_collector import StockPriceCollector
+    from backend.database.repository import StockRepository, get_db_session
+
+    interval = chunk["params"].get("interval", "1d")
+    points = StockPriceCollector().collect_ticker_data(
+        chunk["ticker"], chunk["start_date"], chunk["end_date"], interval
+    )
+
+    # 재시도: 이전 시도에서 저장한 시각까지는 건너뜀
+    saved = chunk["progress"].get("saved_data_points", 0)
+    last_time = chunk["checkpoint"].get("last_time")
+    if last_time:
+        resume_after = datetime.fromisoformat(last_time)
+        points = [p for p in points if p.date > resume_after]
+
+    progress = {"total_data_points": saved + len(points), "saved_data_points": saved}
+    for i in range(0, len(points), PRICE_SAVE_BATCH):
+        batch = points[i:i + PRICE_SAVE_BATCH]
+        async with get_db_session() as session:
+            StockRepository(session).save_prices([p.to_dict() for p in batch])
+        progress["saved_data_points"] += len(batch)
+        if not checkpoint({"last_time": batch[-1].date.isoformat()}, progress):
+            raise BackfillChunkCancelled(f"chunk {chunk['id']}")
+
+    return progress
+
+
+async def run_news_chunk(chunk: Dict[str, Any], checkpoint: CheckpointFn) -> Dict[str, Any]:
+    """(ticker, 기간) 뉴스 크롤링 → NLP 처리 → news_articles 저장 (저장 URL 체크포인트)"""
+    from backend.data.crawlers.multi_source_crawler import MultiSourceNewsCrawler
+    from backend.data.processors.news_processor import NewsProcessor
+    from backend.database.repository import NewsRepository, get_db_session
+
+    params = chunk["params"]
+    async with MultiSourceNewsCrawler() as crawler:
+        articles = await crawler.crawl_all(
+            start_date=chunk["start_date"],
+            end_date=chunk["end_date"],
+            keywords=params.get("keywords"),
+            tickers=[chunk["ticker"]] if chunk["ticker"] else params.get("tickers"),
+        )
+
+    saved_urls = set(chunk["checkpoint"].get("saved_urls", []))
+    pending = [a for a in articles if a.url not in saved_urls]
+    processed = await NewsProcessor().process_batch(pending, batch_size=10)
+
+    progress = {
+        "total_articles": len(articles),
+        "crawled_articles": len(articles),
+        "processed_articles": len(saved_urls) + len(processed),
+        "saved_articles": len(saved_urls),
+        "failed_articles": 0,
+    }
+
+    async with get_db_session() as session:
+        news_repo = NewsRepository(session)
+        for i, proc_news in enumerate(processed, 1):
+            article = proc_news.article
+            try:
+                news_repo.save_processed_article({
+                    'title': article.title,
+                    'content': article.content,
+                    'url': article.url,
+                    'source': article.source,
+                    'published_at': article.published_at,
+                    'content_hash': article.generate_hash() if hasattr(article, 'generate_hash') else None,
+                    'processed_at': proc_news.processed_at,
+                    'embedding': proc_news.embedding,
+                    'sentiment_score': proc_news.sentiment_score,
+                    'sentiment_label': proc_news.sentiment_label,
+                    'tags': article.tags,
+                    'tickers': article.tickers,
+                    'source_category': article.source_category,
+                    'metadata': {
+                        'author': article.author,
+                        'processing_errors': proc_news.processing_errors
+                    },
+                    'embedding_model': proc_news.embedding_model
+                })
+                saved_urls.add(article.url)
+                progress["saved_articles"] += 1
+            except Exception as e:
+                logger.error(f"Failed to save article {article.url}: {e}")
+                progress["failed_articles"] += 1
+
+            if i % NEWS_CHECKPOINT_EVERY == 0 and not checkpoint({"saved_urls": sorted(saved_urls)}, progress):
+                raise BackfillChunkCancelled(f"chunk {chunk['id']}")
+
+    checkpoint({"saved_urls": sorted(saved_urls)}, progress)
+    return progress
+
+
+CHUNK_HANDLERS: Dict[str, ChunkHandler] = {
+    "price_backfill": run_price_chunk,
+    "news_backfill": run_news_chunk,
+}
+
+
+class BackfillWorker:
+    """단일 소스 청크 실행 루프 (프로세스당 하나)"""
+
+    def __init__(
+        self,
+        queue: BackfillQueue,
+        source: str,
+        worker_id: Optional[str] = None,
+        handlers: Optional[Dict[str, ChunkHandler]] = None,
+        poll_interval: float = 5.0,
+    ):
+        self.queue = queue
+        self.source = source
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{source}"
+        self.handlers = handlers or CHUNK_HANDLERS
+        self.poll_interval = poll_interval
+
+        self.stats = {
+            "chunks_completed": 0,
+            "chunks_failed": 0,
+            "chunks_cancelled": 0,
+        }
+
+    async def run_once(self) -> bool:
+        """청크 하나 실행 (가져갈 청크가 없으면 False)"""
+        chunk = self.queue.claim(self.worker_id, self.source)
+        if chunk is None:
+            return False
+
+        chunk_id = chunk["id"]
+        latest = {"progress": chunk["progress"]}
+
+        def checkpoint(state: Dict[str, Any], progress: Dict[str, Any]) -> bool:
+            chunk["checkpoint"] = state
+            latest["progress"] = dict(progress)
+            return self.queue.checkpoint(chunk_id, self.worker_id, state, latest["progress"])
+
+        label = f"{chunk['job_type']} chunk {chunk_id} ({chunk['ticker'] or '*'} {chunk['start_date']:%Y-%m-%d}~{chunk['end_date']:%Y-%m-%d})"
+        try:
+            progress = await self.handlers[chunk["job_type"]](chunk, checkpoint)
+        except BackfillChunkCancelled:
+            self.queue.abandon(chunk_id, self.worker_id, latest["progress"])
+            self.stats["chunks_cancelled"] += 1
+            logger.info(f"{label}: cancelled")
+        except Exception as e:
+            self.queue.fail(chunk_id, self.worker_id, f"{type(e).__name__}: {e}", latest["progress"])
+            self.stats["chunks_failed"] += 1
+            logger.warning(f"{label}: attempt {chunk['attempts']} failed - {e}")
+        else:
+            self.queue.complete(chunk_id, self.worker_id, progress)
+            self.stats["chunks_completed"] += 1
+            logger.info(f"{label}: completed {progress}")
+        return True
+
+    async def run(self, stop_event=None):
+        """stop_event 가 설정될 때까지 실행 (청크가 없으면 poll_interval 대기)"""
+        logger.info(f"Backfill worker {self.worker_id} started (source={self.source})")
+        while stop_event is None or not stop_event.is_set():
+            try:
+                ran = await self.run_once()
+            except Exception as e:
+                logger.error(f"Backfill worker {self.worker_id}: queue error - {e}")
+                ran = False
+            if not ran:
+                await asyncio.sleep(self.poll_interval)
+        logger.info(f"Backfill worker {self.worker_id} stopped ({self.stats})")
+
+
+def _worker_main(url: str, source: str, worker_id: str, poll_interval: float, stop_event):
+    """워커 프로세스 진입점 (spawn)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # 종료는 부모의 stop_event 로
+    worker = BackfillWorker(BackfillQueue(url), source, worker_id, poll_interval=poll_interval)
+    asyncio.run(worker.run(stop_event))
+
+
+class BackfillWorkerPool:
+    """
+    소스별 워커 프로세스 풀
+
+    stop() 은 stop_event 를 설정하고 실행 중인 청크가 끝나기를 기다립니다.
+    중간에 죽은 프로세스의 청크는 lease 만료 후 다른 워커가 이어서 실행합니다.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        concurrency: Optional[Dict[str, int]] = None,
+        poll_interval: float = 5.0,
+    ):
+        self.url = url or default_queue_url()
+        self.concurrency = concurrency or parse_concurrency(os.getenv("BACKFILL_CONCURRENCY"))
+        self.poll_interval = poll_interval
+
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._processes = []
+
+    def start(self):
+        BackfillQueue(self.url)  # 테이블 생성 (워커 동시 생성 경합 방지)
+        host = socket.gethostname()
+        for source, count in self.concurrency.items():
+            for i in range(count):
+                process = self._context.Process(
+                    target=_worker_main,
+                    args=(self.url, source, f"{host}-{source}-{i}", self.poll_interval, self._stop_event),
+                    name=f"backfill-{source}-{i}",
+                )
+                process.start()
+                self._processes.append(process)
+        logger.info(f"Backfill worker pool started: {self.concurrency} ({len(self._processes)} processes)")
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                logger.warning(f"{process.name} did not stop in time, terminating")
+                process.terminate()
+        self._processes = []
+
+    def wait(self):
+        """SIGINT/SIGTERM 까지 대기 후 정리"""
+        signal.signal(signal.SIGTERM, lambda *_: self._stop_event.set())
+        try:
+            while not self._stop_event.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+
+class EmbeddedBackfillWorkers:
+    """
+    API 프로세스 내 워커 (BACKFILL_WORKER_MODE=embedded, 기본값)
+
+    별도 워커 프로세스 없이 실행하는 단일 프로세스 배포에서 큐가 멈추지 않도록
+    소스당 하나의 BackfillWorker 를 API 프로세스 안에서 돌립니다. 청크 핸들러
+    (yfinance 수집, 동기 DB 저장)와 큐 호출이 모두 블로킹이므로 각 워커는 전용
+    daemon 스레드의 자체 이벤트 루프에서 실행되고, API 이벤트 루프는 막히지 않습니다.
+    워커 풀을 따로 띄우는 배포는 BACKFILL_WORKER_MODE=external 로 끕니다.
+    """
+
+    def __init__(self, queue: BackfillQueue, poll_interval: float = 5.0):
+        self.workers = [
+            BackfillWorker(queue, source, f"{socket.gethostname()}-{os.getpid()}-{source}-embedded",
+                           poll_interval=poll_interval)
+            for source in DEFAULT_CONCURRENCY
+        ]
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def start(self):
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=asyncio.run, args=(worker.run(self._stop_event),),
+                             name=f"backfill-{worker.source}", daemon=True)
+            for worker in self.workers
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    async def stop(self, timeout: float = 30.0):
+        """
+        실행 중인 청크가 끝나기를 기다린 뒤 종료
+
+        timeout 을 넘긴 스레드는 daemon 이라 프로세스와 함께 끝나고,
+        그 청크는 lease 만료 후 다른 워커가 회수합니다.
+        """
+        self._stop_event.set()
+        deadline = asyncio.get_running_loop().time() + timeout
+        for thread in self._threads:
+            remaining = max(0.0, deadline - asyncio.get_running_loop().time())
+            await asyncio.to_thread(thread.join, remaining)
+            if thread.is_alive():
+                logger.warning(f"{thread.name} did not stop in time")
+        self._threads = []
+
+
+def main():
+    """Main entry point for backfill workers"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill Worker Pool")
+    parser.add_argument("--url", default=None, help="Queue database URL (default: BACKFILL_QUEUE_URL or local SQLite)")
+    parser.add_argument("--concurrency", default=os.getenv("BACKFILL_CONCURRENCY"),
+                        help="Processes per source, e.g. yfinance=8,multi_source=1")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="Idle poll interval in seconds (default: 5)")
+
+    args = parser.parse_args()
+
+    pool = BackfillWorkerPool(args.url, parse_concurrency(args.concurrency), args.poll_interval)
+    pool.start()
+    pool.wait()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+    main()
@@ -75,6 +75,15 @@ FEATURE_DEFINITIONS = {
         "note": "Rule-based keyword analysis, no AI cost",
     },
     
+    "whale_wisdom_score": {
+        "description": "13F 기반 기관투자자 확신도 점수 (0-1)",
+        "category": "institutional_flow",
+        "data_sources": ["sec_13f"],
+        "update_frequency": "quarterly",
+        "cache_ttl": 86400 * 45,  # 다음 13F까지
+        "note": "Bulk-computed from the columnar 13F holdings store",
+    },
+    
     # =========================================================================
     # Fundamental Features (예정)
     # =========================================================================
@@ -139,6 +148,9 @@ async def calculate_feature(
         elif feature_name == "non_standard_risk":
             from .ai_factors import calculate_non_standard_risk_feature
             return await calculate_non_standard_risk_feature(ticker, as_of_date)
+        elif feature_name == "whale_wisdom_score":
+            values = await calculate_whale_wisdom_bulk([ticker], as_of_date)
+            return values.get(ticker)
         
         # Fundamental features
         elif feature_name == "pe_ratio":
@@ -313,6 +325,35 @@ async def calculate_market_cap(ticker: str, as_of_date: datetime) -> Optional[fl
         return None
 
 
+# =============================================================================
+# Bulk Feature Calculations
+# =============================================================================
+
+async def calculate_whale_wisdom_bulk(
+    tickers: List[str],
+    as_of_date: datetime,
+) -> Dict[str, Optional[float]]:
+    """Whale Wisdom Score for many tickers in one grouped pass."""
+    from backend.data.features.whale_wisdom_factor import get_whale_wisdom_feature
+
+    results = await get_whale_wisdom_feature().calculate_bulk(tickers, as_of_date)
+    return {ticker: result["value"] for ticker, result in results.items()}
+
+
+BULK_FEATURE_CALCULATORS = {
+    "whale_wisdom_score": calculate_whale_wisdom_bulk,
+}
+
+
+def get_bulk_feature_calculator(feature_name: str):
+    """
+    Get bulk calculator for a feature, or None if it is computed per ticker.
+
+    Bulk calculators take (tickers, as_of_date) and return {ticker: value}.
+    """
+    return BULK_FEATURE_CALCULATORS.get(feature_name)
+
+
 # =============================================================================
 # Feature Metadata
 # =============================================================================
@@ -366,8 +407,8 @@ def validate_feature_value(feature_name: str, value: float) -> bool:
         # Returns should be between -0.9 and 10 (-90% to 1000%)
         return -0.9 <= value <= 10.0
     
-    elif feature_name == "non_standard_risk":
-        # Risk score should be between 0 and 1
+    elif feature_name in ["non_standard_risk", "whale_wisdom_score"]:
+        # Scores should be between 0 and 1
         return 0 <= value <= 1.0
     
     elif feature_name == "pe_ratio":
@@ -387,6 +428,7 @@ def validate_feature_value(feature_name: str, value: float) -> bool:
 
 FEATURE_DEPENDENCIES = {
     "non_standard_risk": [],  # No dependencies
+    "whale_wisdom_score": [],
     "ret_5d": [],
     "ret_20d": [],
     "vol_20d": [],
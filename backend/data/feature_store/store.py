@@ -14,6 +14,7 @@ Usage:
     >>> print(features)  # {"ret_5d": 0.0523, "vol_20d": 0.0234}
 """
 
+import asyncio
 import logging
 import time
 import json
@@ -22,7 +23,11 @@ from typing import Optional, List, Dict, Any
 from backend.data.feature_store.cache_layer import RedisCache, TimescaleCache
 from backend.data.collectors.yahoo_collector import YahooFinanceCollector
 from backend.data.models.feature import FeatureResponse
-from backend.data.feature_store.features import get_feature_calculator, list_available_features
+from backend.data.feature_store.features import (
+    get_bulk_feature_calculator,
+    get_feature_calculator,
+    list_available_features,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +37,7 @@ class FeatureStore:
 
     Key Methods:
     - get_features(): Retrieve features with caching
+    - get_features_bulk(): One feature for many tickers (bulk compute on misses)
     - compute_feature(): Calculate feature from raw data
     - warm_cache(): Pre-load popular tickers (basic)
     - get_cache_warmer(): Get advanced CacheWarmer instance
@@ -158,6 +164,71 @@ class FeatureStore:
             cost_usd=cache_misses * 0.0,  # No cost for feature calculations (free)
         )
 
+    async def get_features_bulk(
+        self,
+        tickers: list[str],
+        feature_name: str,
+        as_of: Optional[datetime] = None,
+    ) -> Dict[str, Optional[float]]:
+        """
+        Retrieve one feature for many tickers.
+
+        Cache lookups run concurrently. Misses are computed in a single call
+        when the feature has a bulk calculator (e.g. whale_wisdom_score),
+        otherwise per ticker via compute_feature().
+
+        Args:
+            tickers: Stock ticker symbols
+            feature_name: Feature name
+            as_of: Point-in-time (None = latest)
+
+        Returns:
+            {ticker: value}
+        """
+        start_time = time.time()
+        tickers = [ticker.upper() for ticker in tickers]
+        feature_name = feature_name.lower()
+        if as_of is None:
+            as_of = datetime.utcnow()
+
+        cached = await asyncio.gather(
+            *(self._get_from_cache(ticker, feature_name, as_of) for ticker in tickers)
+        )
+        results = {ticker: value for ticker, value in zip(tickers, cached) if value is not None}
+        misses = [ticker for ticker in tickers if ticker not in results]
+
+        if misses:
+            bulk_calculator = get_bulk_feature_calculator(feature_name)
+            if bulk_calculator is not None:
+                self.computations += 1
+                try:
+                    computed = await bulk_calculator(misses, as_of)
+                except Exception as e:
+                    logger.error(f"Error bulk computing {feature_name} for {len(misses)} tickers: {e}")
+                    computed = {}
+            else:
+                values = await asyncio.gather(
+                    *(self.compute_feature(ticker, feature_name, as_of) for ticker in misses)
+                )
+                computed = dict(zip(misses, values))
+
+            await asyncio.gather(*(
+                self._save_feature(ticker, feature_name, value, as_of)
+                for ticker, value in computed.items()
+                if value is not None
+            ))
+            for ticker in misses:
+                results[ticker] = computed.get(ticker)
+
+        self.cache_misses += len(misses)
+        latency_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"get_features_bulk({feature_name}, {len(tickers)} tickers): "
+            f"{len(tickers) - len(misses)} hits, {len(misses)} misses, {latency_ms:.2f}ms"
+        )
+
+        return {ticker: results.get(ticker) for ticker in tickers}
+
     async def _get_from_cache(
         self, ticker: str, feature_name: str, as_of: datetime
     ) -> Optional[float]:
@@ -1,6 +1,14 @@
 """
 AI Factor Features Module
 """
-from .management_credibility import ManagementCredibilityCalculator
 
-__all__ = ["ManagementCredibilityCalculator"]
\ No newline at end of file
+__all__ = ["ManagementCredibilityCalculator"]
+
+
+def __getattr__(name):
+    # 지연 import: management_credibility의 설정/Anthropic 의존성이
+    # whale_wisdom_factor 등 다른 팩터 모듈 import를 막지 않도록 함
+    if name == "ManagementCredibilityCalculator":
+        from .management_credibility import ManagementCredibilityCalculator
+        return ManagementCredibilityCalculator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
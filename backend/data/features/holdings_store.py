@@ -0,0 +1,188 @@
+"""
+13F Holdings Columnar Store
+
+Filing13F.holdings(리스트 of dict)를 투자자 × 분기 × 종목 컬럼 배열로 보관합니다.
+
+구조:
+  - 컬럼: investor, report_date, filing_date, ticker, shares, value
+  - 파생 컬럼 (적재 시 1회 계산): weight, quarter_rank(0=최신),
+    prev_shares, prev_weight, share_delta, weight_delta, is_new
+  - 역색인: ticker → 최신 분기 행 위치 (investor, weight, delta)
+
+종목별 조회는 역색인 O(1), 유니버스 전체 스코어링은 groupby 한 번으로 처리합니다.
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BASE_COLUMNS = ["investor", "report_date", "filing_date", "ticker", "shares", "value"]
+
+
+class HoldingsStore:
+    """
+    13F 보유 종목 컬럼 저장소
+
+    Usage:
+        store = HoldingsStore()
+        store.add_filings("BRK.A", filings)
+        store.positions("AAPL")          # 최신 분기 보유 투자자
+        store.latest()                   # 투자자별 최신 분기 전체 (스코어링용)
+    """
+
+    def __init__(self):
+        self._frames: Dict[str, pd.DataFrame] = {}  # investor → 원본 컬럼
+        self._table: Optional[pd.DataFrame] = None
+        self._latest: Optional[pd.DataFrame] = None
+        self._ticker_index: Dict[str, np.ndarray] = {}
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+
+    def add_filings(self, investor_id: str, filings: Iterable) -> int:
+        """
+        투자자의 13F 보고서 적재 (같은 투자자는 교체)
+
+        Args:
+            investor_id: 투자자 ID
+            filings: Filing13F 리스트
+
+        Returns:
+            적재된 보유 행 수
+        """
+        investors, report_dates, filing_dates, tickers, shares, values = [], [], [], [], [], []
+        for filing in filings:
+            for holding in filing.holdings:
+                investors.append(investor_id)
+                report_dates.append(filing.report_date)
+                filing_dates.append(filing.filing_date)
+                tickers.append(holding.get("ticker"))
+                shares.append(holding.get("shares", 0) or 0)
+                values.append(holding.get("value", 0) or 0)
+
+        self._frames[investor_id] = pd.DataFrame({
+            "investor": investors,
+            "report_date": pd.to_datetime(report_dates),
+            "filing_date": pd.to_datetime(filing_dates),
+            "ticker": tickers,
+            "shares": np.asarray(shares, dtype=float),
+            "value": np.asarray(values, dtype=float),
+        }, columns=BASE_COLUMNS)
+        self._dirty = True
+        return len(investors)
+
+    def has_investor(self, investor_id: str) -> bool:
+        return investor_id in self._frames
+
+    @property
+    def investors(self) -> List[str]:
+        return list(self._frames)
+
+    # ------------------------------------------------------------------
+    # 파생 컬럼 / 역색인 (적재 후 1회)
+    # ------------------------------------------------------------------
+
+    def _build(self) -> None:
+        if not self._dirty and self._table is not None:
+            return
+
+        frames = [f for f in self._frames.values() if not f.empty]
+        if not frames:
+            table = pd.DataFrame(columns=BASE_COLUMNS)
+        else:
+            table = pd.concat(frames, ignore_index=True)
+            # 같은 분기 동일 종목 중복 행은 합산
+            table = table.groupby(
+                ["investor", "report_date", "ticker"], as_index=False, sort=False
+            ).agg(filing_date=("filing_date", "max"), shares=("shares", "sum"), value=("value", "sum"))
+
+        if not table.empty:
+            totals = table.groupby(["investor", "report_date"])["value"].transform("sum")
+            table["weight"] = np.where(totals > 0, table["value"] / totals.replace(0, np.nan), 0.0)
+            table["quarter_rank"] = (
+                table.groupby("investor")["report_date"].rank(method="dense", ascending=False).astype(int) - 1
+            )
+
+            # 직전 분기(quarter_rank + 1)와 (investor, ticker)로 조인 → 분기 대비 변화
+            previous = table[["investor", "ticker", "quarter_rank", "shares", "weight"]].rename(
+                columns={"shares": "prev_shares", "weight": "prev_weight"}
+            )
+            previous["quarter_rank"] -= 1
+            table = table.merge(previous, on=["investor", "ticker", "quarter_rank"], how="left")
+            table[["prev_shares", "prev_weight"]] = table[["prev_shares", "prev_weight"]].fillna(0.0)
+        else:
+            for column in ("weight", "prev_shares", "prev_weight"):
+                table[column] = pd.Series(dtype=float)
+            table["quarter_rank"] = pd.Series(dtype=int)
+
+        table["share_delta"] = table["shares"] - table["prev_shares"]
+        table["weight_delta"] = table["weight"] - table["prev_weight"]
+        table["is_new"] = table["prev_weight"] == 0
+
+        latest = table[table["quarter_rank"] == 0].reset_index(drop=True)
+        self._table = table
+        self._latest = latest
+        self._ticker_index = {
+            ticker: np.asarray(rows) for ticker, rows in latest.groupby("ticker").indices.items()
+        }
+        self._dirty = False
+        logger.debug(
+            f"HoldingsStore built: {len(table)} rows, {len(self._frames)} investors, "
+            f"{len(self._ticker_index)} tickers"
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """전체 분기 컬럼 테이블"""
+        self._build()
+        return self._table
+
+    def latest(self, investor_ids: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """투자자별 최신 분기 보유 (파생 컬럼 포함)"""
+        self._build()
+        if investor_ids is None:
+            return self._latest
+        return self._latest[self._latest["investor"].isin(list(investor_ids))]
+
+    def positions(self, ticker: str, investor_ids: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        역색인으로 특정 종목의 최신 분기 보유 투자자 조회
+
+        Returns:
+            investor, weight, prev_weight, weight_delta, shares, share_delta, is_new, filing_date 컬럼
+        """
+        self._build()
+        rows = self._ticker_index.get(ticker)
+        if rows is None:
+            return self._latest.iloc[0:0]
+        result = self._latest.iloc[rows]
+        if investor_ids is not None:
+            result = result[result["investor"].isin(list(investor_ids))]
+        return result
+
+    def weight(self, investor_id: str, ticker: str) -> float:
+        """최신 분기 종목 비중"""
+        held = self.positions(ticker, [investor_id])
+        return float(held["weight"].iloc[0]) if not held.empty else 0.0
+
+    def get_stats(self) -> Dict:
+        self._build()
+        return {
+            "investors": len(self._frames),
+            "rows": len(self._table),
+            "latest_rows": len(self._latest),
+            "tickers": len(self._ticker_index),
+        }
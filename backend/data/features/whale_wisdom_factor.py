@@ -19,6 +19,9 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
+
+from backend.data.features.holdings_store import HoldingsStore
 
 logger = logging.getLogger(__name__)
 
@@ -135,18 +138,29 @@ class Filing13F:
         self.filing_date = filing_date
         self.report_date = report_date
         self.holdings = holdings  # [{"ticker": "AAPL", "shares": 1000000, "value": 150000000}, ...]
+        self._by_ticker: Optional[Dict[str, Dict]] = None
+        self._total_value: Optional[float] = None
     
     @property
     def total_value(self) -> float:
         """총 포트폴리오 가치"""
-        return sum(h.get("value", 0) for h in self.holdings)
+        if self._total_value is None:
+            self._total_value = sum(h.get("value", 0) for h in self.holdings)
+        return self._total_value
+    
+    @property
+    def by_ticker(self) -> Dict[str, Dict]:
+        """ticker → holding 색인 (최초 조회 시 1회 생성)"""
+        if self._by_ticker is None:
+            self._by_ticker = {h.get("ticker"): h for h in self.holdings}
+        return self._by_ticker
     
     def get_position_weight(self, ticker: str) -> float:
         """특정 종목의 비중"""
-        for h in self.holdings:
-            if h.get("ticker") == ticker:
-                return h.get("value", 0) / self.total_value if self.total_value > 0 else 0.0
-        return 0.0
+        holding = self.by_ticker.get(ticker)
+        if holding is None or self.total_value <= 0:
+            return 0.0
+        return holding.get("value", 0) / self.total_value
     
     def get_top_holdings(self, n: int = 10) -> List[Dict]:
         """상위 N개 보유 종목"""
@@ -162,7 +176,7 @@ class Filing13F:
         if not previous_filing:
             return self.holdings
         
-        prev_tickers = {h.get("ticker") for h in previous_filing.holdings}
+        prev_tickers = previous_filing.by_ticker
         new_positions = [h for h in self.holdings if h.get("ticker") not in prev_tickers]
         return new_positions
     
@@ -171,7 +185,7 @@ class Filing13F:
         if not previous_filing:
             return []
         
-        prev_holdings = {h.get("ticker"): h for h in previous_filing.holdings}
+        prev_holdings = previous_filing.by_ticker
         increased = []
         
         for h in self.holdings:
@@ -201,11 +215,15 @@ class SEC13FCollector:
     여기서는 데모를 위해 시뮬레이션 데이터를 사용합니다.
     
     비용: $0 (무료 공공 데이터)
+    
+    가져온 보고서는 HoldingsStore(컬럼 저장소 + ticker 역색인)에도 적재되어
+    종목별 조회가 투자자 보고서를 다시 순회하지 않습니다.
     """
     
-    def __init__(self):
+    def __init__(self, holdings_store: Optional[HoldingsStore] = None):
         self.base_url = "https://www.sec.gov/cgi-bin/browse-edgar"
         self._cache: Dict[str, List[Filing13F]] = {}
+        self.holdings_store = holdings_store or HoldingsStore()
     
     async def fetch_13f_filings(
         self,
@@ -232,8 +250,22 @@ class SEC13FCollector:
         filings = self._generate_sample_filings(investor_id, num_quarters)
         
         self._cache[investor_id] = filings
+        self.holdings_store.add_filings(investor_id, filings)
         return filings
     
+    async def load_investors(
+        self,
+        investor_ids: Optional[List[str]] = None,
+        num_quarters: int = 2,
+    ) -> HoldingsStore:
+        """투자자 보고서를 컬럼 저장소에 적재 (이미 적재된 투자자는 생략)"""
+        if investor_ids is None:
+            investor_ids = list(MAJOR_INVESTORS.keys())
+        
+        missing = [inv_id for inv_id in investor_ids if not self.holdings_store.has_investor(inv_id)]
+        await asyncio.gather(*(self.fetch_13f_filings(inv_id, num_quarters) for inv_id in missing))
+        return self.holdings_store
+    
     def _generate_sample_filings(
         self,
         investor_id: str,
@@ -332,35 +364,30 @@ class SEC13FCollector:
         if investor_ids is None:
             investor_ids = list(MAJOR_INVESTORS.keys())
         
-        results = []
+        store = await self.load_investors(investor_ids, num_quarters=2)
+        held = store.positions(ticker, investor_ids)
+        held = held[held["weight"] > 0]
         
-        for inv_id in investor_ids:
-            filings = await self.fetch_13f_filings(inv_id, num_quarters=2)
-            if not filings:
-                continue
-            
-            latest = filings[0]
-            previous = filings[1] if len(filings) > 1 else None
-            
-            weight = latest.get_position_weight(ticker)
-            if weight > 0:
-                # 신규 매수인지 확인
-                prev_weight = previous.get_position_weight(ticker) if previous else 0
-                is_new = prev_weight == 0
-                
-                results.append({
-                    "investor_id": inv_id,
-                    "investor_name": MAJOR_INVESTORS[inv_id]["name"],
-                    "style": MAJOR_INVESTORS[inv_id]["style"],
-                    "success_rate": MAJOR_INVESTORS[inv_id]["historical_success_rate"],
-                    "position_weight": weight,
-                    "is_new_position": is_new,
-                    "weight_change": weight - prev_weight,
-                    "filing_date": latest.filing_date.isoformat(),
-                })
-        
-        # 성공률 순으로 정렬
-        results.sort(key=lambda x: x["success_rate"], reverse=True)
+        results = [
+            {
+                "investor_id": inv_id,
+                "investor_name": MAJOR_INVESTORS[inv_id]["name"],
+                "style": MAJOR_INVESTORS[inv_id]["style"],
+                "success_rate": MAJOR_INVESTORS[inv_id]["historical_success_rate"],
+                "position_weight": weight,
+                "is_new_position": bool(is_new),
+                "weight_change": weight_change,
+                "filing_date": filing_date.isoformat(),
+            }
+            for inv_id, weight, is_new, weight_change, filing_date in zip(
+                held["investor"], held["weight"], held["is_new"],
+                held["weight_delta"], held["filing_date"].dt.to_pydatetime(),
+            )
+        ]
+        
+        # 성공률 순으로 정렬 (동률은 요청 순서 유지)
+        order = {inv_id: i for i, inv_id in enumerate(investor_ids)}
+        results.sort(key=lambda x: (-x["success_rate"], order[x["investor_id"]]))
         return results
 
 
@@ -455,6 +482,71 @@ class WhaleWisdomCalculator:
             "cost_usd": 0.0013 if use_ai else 0.0,
         }
     
+    async def calculate_whale_scores(
+        self,
+        tickers: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        유니버스 전체 Whale Wisdom Score (groupby 한 번)
+        
+        Top 투자자들의 최신 분기 보유 테이블을 ticker로 묶어
+        구성 요소와 최종 스코어를 한 번에 계산합니다.
+        
+        Args:
+            tickers: 대상 종목 (없으면 Top 투자자가 보유한 전체 종목)
+            
+        Returns:
+            {ticker: {"score", "components", "big_bet_detected"}}
+            보유 투자자가 없는 요청 종목은 score 0으로 포함
+        """
+        store = await self.sec_collector.load_investors(self.top_investor_ids, num_quarters=2)
+        latest = store.latest(self.top_investor_ids)
+        latest = latest[latest["weight"] > 0]
+        if tickers is not None:
+            latest = latest[latest["ticker"].isin(tickers)]
+        
+        success = latest["investor"].map(
+            {inv_id: info["historical_success_rate"] for inv_id, info in MAJOR_INVESTORS.items()}
+        )
+        grouped = latest.assign(
+            weighted_success=latest["weight"] * success,
+            is_new=latest["is_new"].astype(int),
+        ).groupby("ticker").agg(
+            top_investor_count=("investor", "size"),
+            avg_position_weight=("weight", "mean"),
+            weight_sum=("weight", "sum"),
+            new_position_count=("is_new", "sum"),
+            weighted_success=("weighted_success", "sum"),
+        )
+        grouped["weighted_success_rate"] = grouped["weighted_success"] / grouped["weight_sum"]
+        grouped["score"] = self._calculate_final_scores(grouped)
+        
+        calculated_at = datetime.now().isoformat()
+        results: Dict[str, Dict[str, Any]] = {}
+        for ticker in (tickers if tickers is not None else grouped.index):
+            if ticker in grouped.index:
+                row = grouped.loc[ticker]
+                components = {
+                    "top_investor_count": int(row["top_investor_count"]),
+                    "avg_position_weight": float(row["avg_position_weight"]),
+                    "new_position_count": int(row["new_position_count"]),
+                    "weighted_success_rate": float(row["weighted_success_rate"]),
+                }
+                score = float(row["score"])
+            else:
+                components = self._calculate_components([])
+                score = self._calculate_final_score(components)
+            
+            results[ticker] = {
+                "ticker": ticker,
+                "score": score,
+                "components": components,
+                "big_bet_detected": components["avg_position_weight"] > 0.10,
+                "calculated_at": calculated_at,
+            }
+        
+        return results
+    
     def _calculate_components(self, investor_holdings: List[Dict]) -> Dict[str, float]:
         """스코어 구성 요소 계산"""
         if not investor_holdings:
@@ -518,6 +610,18 @@ class WhaleWisdomCalculator:
         
         return min(score, 1.0)
     
+    def _calculate_final_scores(self, components: pd.DataFrame) -> pd.Series:
+        """_calculate_final_score의 컬럼 연산 버전 (종목별 행)"""
+        count = components["top_investor_count"]
+        new_ratio = (components["new_position_count"] / count.where(count > 0)).fillna(0.0)
+        score = (
+            np.minimum(count / 10, 1.0) * 0.30
+            + np.minimum(components["avg_position_weight"] / 0.10, 1.0) * 0.30
+            + new_ratio * 0.20
+            + components["weighted_success_rate"] * 0.20
+        )
+        return np.minimum(score, 1.0)
+    
     async def _generate_ai_reasoning(
         self,
         ticker: str,
@@ -633,8 +737,8 @@ WHALE_WISDOM_FEATURE_DEFINITION = {
 class WhaleWisdomFeature:
     """Feature Store 통합용 래퍼"""
     
-    def __init__(self):
-        self.calculator = WhaleWisdomCalculator()
+    def __init__(self, calculator: Optional[WhaleWisdomCalculator] = None):
+        self.calculator = calculator or WhaleWisdomCalculator()
     
     async def calculate(
         self,
@@ -669,11 +773,56 @@ class WhaleWisdomFeature:
             }
         }
     
+    async def calculate_bulk(
+        self,
+        tickers: List[str],
+        as_of_date: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Feature Store 일괄 인터페이스 (종목 수와 무관하게 groupby 한 번)
+        
+        Args:
+            tickers: 종목 티커 리스트
+            as_of_date: 기준 날짜 (현재는 무시)
+            
+        Returns:
+            {ticker: Feature Store 형식의 결과}
+        """
+        scores = await self.calculator.calculate_whale_scores(tickers)
+        
+        return {
+            ticker: {
+                "value": result["score"],
+                "factor_name": "whale_wisdom_score",
+                "category": "institutional_flow",
+                "big_bet": result["big_bet_detected"],
+                "top_investors_count": result["components"]["top_investor_count"],
+                "metadata": {
+                    "calculated_at": result["calculated_at"],
+                    "ttl_days": 45,
+                    "cost_usd": 0.0,
+                    "data_source": "SEC_13F",
+                }
+            }
+            for ticker, result in scores.items()
+        }
+    
     def get_feature_definition(self) -> Dict:
         """Feature Store 등록용 정의"""
         return WHALE_WISDOM_FEATURE_DEFINITION
 
 
+_whale_wisdom_feature: Optional[WhaleWisdomFeature] = None
+
+
+def get_whale_wisdom_feature() -> WhaleWisdomFeature:
+    """WhaleWisdomFeature 싱글톤 (13F 컬럼 저장소를 프로세스 내에서 공유)"""
+    global _whale_wisdom_feature
+    if _whale_wisdom_feature is None:
+        _whale_wisdom_feature = WhaleWisdomFeature()
+    return _whale_wisdom_feature
+
+
 # =============================================================================
 # Demo
 # =============================================================================
@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from sqlalchemy.orm import Session
 # Use PostgreSQL models (backend.database.models) instead of SQLite (backend.data.news_models)
 from backend.database.models import NewsArticle, NewsAnalysis, NewsTickerRelevance
+from backend.database.news_vector_search import embedding_columns, get_news_vector_search
 from backend.data.rss_crawler import generate_content_hash
 from backend.data.news_analyzer import NewsDeepAnalyzer
 from backend.ai.llm.local_embeddings import LocalEmbeddingService
@@ -219,12 +220,38 @@ class UnifiedNewsProcessor:
         의미적 중복 체크 (임베딩 유사도)
         
         최근 24시간 기사와 비교하여 유사도 > threshold면 중복으로 판단
+        embedding_vec HNSW 인덱스로 최근접 기사를 조회하고,
+        vector 컬럼을 사용할 수 없으면(마이그레이션 전 등) 최근 100건 스캔으로 대체합니다.
         """
         if not self.semantic_dedup:
             return None
         
-        # 최근 24시간 기사 조회
         cutoff = datetime.utcnow() - timedelta(hours=24)
+
+        try:
+            hits = get_news_vector_search().find_near_duplicates(
+                self.db, embedding, self.semantic_threshold, since=cutoff
+            )
+        except Exception as e:
+            logger.debug(f"Vector search unavailable, scanning recent articles: {e}")
+            return self._scan_semantic_duplicate(title, embedding, cutoff)
+
+        for hit in hits:
+            article = self.db.get(NewsArticle, hit.id)
+            if article is not None:
+                self._log_semantic_duplicate(title, article, hit.similarity)
+                return article
+
+        return None
+
+    def _scan_semantic_duplicate(
+        self,
+        title: str,
+        embedding: List[float],
+        cutoff: datetime
+    ) -> Optional[NewsArticle]:
+        """ARRAY(Float) 임베딩 스캔 (dual write 기간 fallback)"""
+        # 최근 24시간 기사 조회
         recent_articles = (
             self.db.query(NewsArticle)
             .filter(NewsArticle.published_date >= cutoff)
@@ -247,27 +274,29 @@ class UnifiedNewsProcessor:
                 )
                 
                 if similarity > self.semantic_threshold:
-                    logger.info(f"🔄 Semantic duplicate found (similarity: {similarity:.3f})")
-                    logger.info(f"   New: {title[:80]}...")
-                    logger.info(f"   Existing: {article.title[:80]}...")
-                    logger.info(f"   Article ID: {article.id} | Similarity: {similarity:.3f}")
-
-                    # GLM 분석 데이터 확인
-                    if article.glm_analysis:
-                        tickers = article.glm_analysis.get('tickers', [])
-                        logger.info(f"   Existing data: GLM analysis ✅ (Tickers: {tickers})")
-                    else:
-                        logger.info(f"   Existing data: GLM analysis ❌")
-
-                    # Deep Analysis 데이터 확인
-                    if article.analysis:
-                        logger.info(f"   Existing data: Deep analysis ✅ (Sentiment: {article.analysis.sentiment_overall})")
-                    else:
-                        logger.info(f"   Existing data: Deep analysis ❌")
-
+                    self._log_semantic_duplicate(title, article, similarity)
                     return article
         
         return None
+
+    def _log_semantic_duplicate(self, title: str, article: NewsArticle, similarity: float):
+        logger.info(f"🔄 Semantic duplicate found (similarity: {similarity:.3f})")
+        logger.info(f"   New: {title[:80]}...")
+        logger.info(f"   Existing: {article.title[:80]}...")
+        logger.info(f"   Article ID: {article.id} | Similarity: {similarity:.3f}")
+
+        # GLM 분석 데이터 확인
+        if article.glm_analysis:
+            tickers = article.glm_analysis.get('tickers', [])
+            logger.info(f"   Existing data: GLM analysis ✅ (Tickers: {tickers})")
+        else:
+            logger.info(f"   Existing data: GLM analysis ❌")
+
+        # Deep Analysis 데이터 확인
+        if article.analysis:
+            logger.info(f"   Existing data: Deep analysis ✅ (Sentiment: {article.analysis.sentiment_overall})")
+        else:
+            logger.info(f"   Existing data: Deep analysis ❌")
     
     def _should_analyze(self, article_data: Dict[str, Any]) -> bool:
         """
@@ -373,7 +402,7 @@ class UnifiedNewsProcessor:
                 summary=raw_article.get("summary", ""),
                 author=author_val,
                 content_hash=content_hash,
-                embedding=embedding,
+                **embedding_columns(embedding),  # dual write: embedding + embedding_vec
                 tags=raw_article.get("keywords", []),  # keywords -> tags
                 metadata_={  # Store extra fields in JSONB metadata
                     "feed_source": raw_article.get("feed_source", "rss"),
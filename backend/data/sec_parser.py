@@ -8,9 +8,9 @@ Date: 2025-11-22
 """
 
 import re
-from typing import Dict, Optional, List
+from html.parser import HTMLParser
+from typing import Dict, Optional, List, Iterable, Iterator, Tuple, Union
 from datetime import datetime
-from bs4 import BeautifulSoup
 import logging
 
 from backend.core.models.sec_models import (
@@ -21,16 +21,116 @@ from backend.core.models.sec_models import (
     SECParsingError
 )
 
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+# 텍스트 추출 시 통째로 건너뛸 태그 (표, 스크립트, 인라인 XBRL 헤더)
+_SKIP_TAGS = frozenset({'script', 'style', 'table', 'ix:header'})
+
+# 정규화 패턴 (모듈 로드 시 1회 컴파일)
+_XBRL_TAG_RE = re.compile(r'<[^>]+>')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_SPACES_RE = re.compile(r'[ \t]+')
+
+# 모든 Item 제목을 한 번에 찾는 경계 패턴 (줄 시작 기준)
+_ITEM_HEADING_RE = re.compile(r'^[ \t]*ITEM\s+(\d{1,2}[A-Z]?)\.?\s+', re.IGNORECASE | re.MULTILINE)
+
+# 스트리밍 입력 기본 청크 크기 (문자 수)
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+class _TextCollector:
+    """
+    HTML 이벤트 → 텍스트 변환기
+
+    lxml target 파서와 표준 HTMLParser가 공통으로 사용.
+    텍스트 노드 사이에는 줄바꿈을 넣어 기존 get_text(separator) 출력과 맞춘다.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._skip_tag: Optional[str] = None
+        self._skip_depth = 0
+        self._has_text = False
+        self._break = False
+
+    def start(self, tag, attrib=None):
+        tag = tag.lower() if isinstance(tag, str) else ''
+        # 건너뛰는 구간은 같은 이름의 태그만 세어 닫히지 않은 내부 태그에 영향받지 않음
+        if self._skip_tag is None:
+            if tag in _SKIP_TAGS:
+                self._skip_tag = tag
+                self._skip_depth = 1
+        elif tag == self._skip_tag:
+            self._skip_depth += 1
+        self._break = True
+
+    def end(self, tag):
+        tag = tag.lower() if isinstance(tag, str) else ''
+        if self._skip_tag is not None and tag == self._skip_tag:
+            self._skip_depth -= 1
+            if self._skip_depth == 0:
+                self._skip_tag = None
+        self._break = True
+
+    def data(self, text):
+        if self._skip_tag is not None:
+            return
+        if self._break and self._has_text:
+            self._parts.append('\n')
+        self._break = False
+        self._has_text = True
+        self._parts.append(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return self.drain()
+
+    def drain(self) -> str:
+        """지금까지 수집된 텍스트를 꺼내고 버퍼를 비움"""
+        text = ''.join(self._parts)
+        self._parts = []
+        return text
+
+
+class _StdlibTextParser(HTMLParser):
+    """lxml 미설치 환경용 폴백 (표준 라이브러리 증분 파서)"""
+
+    def __init__(self, collector: _TextCollector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/>, <img/> 등 self-closing 태그는 줄 구분만 추가
+        self.collector.start(tag)
+        self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+
 class SECParser:
     """
     SEC 공시 문서 파서
     
     Features:
-    - HTML 정제
-    - 섹션별 추출 (Item 1, 1A, 7, 8 등)
+    - HTML 정제 (lxml 이벤트 파서, 미설치 시 표준 HTMLParser)
+    - 섹션별 추출 (Item 1, 1A, 7, 8 등) - 단일 패스
+    - 스트리밍 섹션 추출 (iter_sections)
     - 텍스트 정규화
     - 표/이미지 제거
     """
@@ -62,10 +162,19 @@ class SECParser:
             r"ITEM\s+9A\.?\s+Controls and Procedures"
         ]
     }
+
+    # 섹션별 제목 패턴 (제목 위치에서 match 하므로 전체 텍스트를 다시 훑지 않음)
+    _COMPILED_PATTERNS: Dict[SECSection, List["re.Pattern"]] = {
+        section_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+        for section_type, patterns in SECTION_PATTERNS.items()
+    }
+
+    # 섹션 본문 최소 단어 수 (목차 항목 걸러내기)
+    MIN_SECTION_WORDS = 50
     
     def __init__(self):
         """파서 초기화"""
-        self.soup = None
+        self.use_lxml = LXML_AVAILABLE
     
     def parse(
         self,
@@ -111,7 +220,80 @@ class SECParser:
             return parsed
             
         except Exception as e:
-            raise SECParsingError(f"Failed to parse filing: {e}")
+            raise SECParsingError(f"Failed to parse filing: {e}") from e
+
+    def iter_sections(
+        self,
+        content: Union[str, Iterable[str]],
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[ParsedSection]:
+        """
+        섹션 스트리밍 추출
+
+        HTML을 청크 단위로 파서에 밀어 넣고, 다음 Item 제목이 나타나는 즉시
+        완성된 섹션을 yield 한다. 버퍼에는 현재 섹션 텍스트만 유지되므로
+        전체 문서를 메모리에 올리지 않는다.
+
+        Args:
+            content: HTML 문자열 또는 HTML 청크 iterable (파일 객체 등)
+            chunk_size: 문자열 입력 시 분할 크기
+
+        Yields:
+            ParsedSection (섹션 타입별 최대 1회)
+
+        Raises:
+            SECParsingError: 파싱 실패
+        """
+        if isinstance(content, str):
+            html = content
+            content = (
+                html[i:i + chunk_size]
+                for i in range(0, len(html), chunk_size)
+            )
+
+        found = set()
+        buffer = ''
+        current = None  # 버퍼 맨 앞 제목 (start, heading_end)
+
+        try:
+            for text in self._iter_clean_text(content):
+                # 청크 경계에 걸친 제목도 잡도록 이전 버퍼 끝부분부터 재검색
+                scan_from = max(0, len(buffer) - 200)
+                buffer += text
+
+                headings = [
+                    h for h in self._find_headings(buffer, scan_from)
+                    if current is None or h[0] > current[0]
+                ]
+                if current is not None:
+                    headings.insert(0, current)
+
+                # 마지막 제목 이전까지의 섹션은 완성됨
+                for (start, heading_end), (next_start, _) in zip(headings, headings[1:]):
+                    section = self._build_section(buffer, start, heading_end, next_start, found)
+                    if section:
+                        found.add(section.section_type)
+                        yield section
+
+                if headings:
+                    # 마지막 제목부터만 남김 (이전 텍스트는 폐기)
+                    offset, heading_end = headings[-1]
+                    buffer = buffer[offset:]
+                    current = (0, heading_end - offset)
+                else:
+                    # 제목이 없으면 줄 단위로 끝부분만 남김
+                    cut = buffer.rfind('\n', 0, max(0, len(buffer) - 200))
+                    if cut > 0:
+                        buffer = buffer[cut:]
+
+            if current is not None:
+                section = self._build_section(buffer, current[0], current[1], len(buffer), found)
+                if section:
+                    yield section
+        except SECParsingError:
+            raise
+        except Exception as e:
+            raise SECParsingError(f"Failed to stream filing: {e}") from e
     
     def _clean_html(self, content: str) -> str:
         """
@@ -124,32 +306,56 @@ class SECParser:
         - XBRL 태그
         - 과도한 공백
         """
-        # BeautifulSoup으로 파싱
-        self.soup = BeautifulSoup(content, 'html.parser')
-        
-        # 불필요한 태그 제거
-        for tag in self.soup(['script', 'style', 'table', 'img']):
-            tag.decompose()
-        
-        # 텍스트 추출
-        text = self.soup.get_text(separator='\n')
-        
+        return ''.join(self._iter_clean_text([content])).strip()
+
+    def _iter_clean_text(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        HTML 청크를 증분 파싱하여 정제된 텍스트 조각을 순서대로 반환
+
+        DOM 트리를 만들지 않고 태그/텍스트 이벤트만 처리한다.
+        """
+        collector = _TextCollector()
+
+        if self.use_lxml:
+            parser = etree.HTMLParser(target=collector, remove_comments=True)
+        else:
+            parser = _StdlibTextParser(collector)
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            parser.feed(chunk)
+            text = collector.drain()
+            if text:
+                yield self._normalize_text(text)
+
+        parser.close()
+        text = collector.drain()
+        if text:
+            yield self._normalize_text(text)
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """XBRL 태그 제거 및 공백 정리"""
         # XBRL 태그 제거
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _XBRL_TAG_RE.sub('', text)
         
         # 과도한 공백 정리
-        text = re.sub(r'\n\s*\n', '\n\n', text)  # 연속된 빈 줄 → 2줄로
-        text = re.sub(r'[ \t]+', ' ', text)      # 연속된 공백 → 1칸
+        text = _BLANK_LINES_RE.sub('\n\n', text)  # 연속된 빈 줄 → 2줄로
+        text = _SPACES_RE.sub(' ', text)           # 연속된 공백 → 1칸
         
         # 특수 문자 정리
         text = text.replace('\xa0', ' ')  # Non-breaking space
         text = text.replace('\u200b', '')  # Zero-width space
         
-        return text.strip()
+        return text
     
     def _extract_sections(self, text: str) -> Dict[SECSection, ParsedSection]:
         """
-        주요 섹션 추출
+        주요 섹션 추출 (단일 패스)
+        
+        Item 제목 위치를 한 번에 찾은 뒤, 인접한 제목 사이를 섹션 본문으로 사용.
+        목차처럼 본문이 짧은 항목은 건너뛰고 다음 출현 위치를 사용한다.
         
         Args:
             text: 정제된 텍스트
@@ -158,74 +364,87 @@ class SECParser:
             섹션 딕셔너리
         """
         sections = {}
-        
-        for section_type, patterns in self.SECTION_PATTERNS.items():
-            section = self._extract_section(text, section_type, patterns)
+        headings = self._find_headings(text)
+        bounds = [h[0] for h in headings[1:]] + [len(text)]
+
+        for (start, heading_end), end in zip(headings, bounds):
+            section = self._build_section(text, start, heading_end, end, sections)
             if section:
-                sections[section_type] = section
+                sections[section.section_type] = section
+
+        for section_type in self.SECTION_PATTERNS:
+            if section_type not in sections:
+                logger.warning(f"Section not found: {section_type}")
         
         return sections
-    
-    def _extract_section(
+
+    @staticmethod
+    def _find_headings(text: str, pos: int = 0) -> List[Tuple[int, int]]:
+        """
+        Item 제목 위치 목록
+
+        Returns:
+            [(제목 시작, 제목 'ITEM n.' 끝), ...]
+        """
+        return [
+            (m.start(), m.end())
+            for m in _ITEM_HEADING_RE.finditer(text, pos)
+        ]
+
+    def _build_section(
         self,
         text: str,
-        section_type: SECSection,
-        patterns: List[str]
+        start: int,
+        heading_end: int,
+        end: int,
+        found: Iterable[SECSection]
     ) -> Optional[ParsedSection]:
         """
-        특정 섹션 추출
-        
+        제목 위치에서 섹션 생성
+
         Args:
-            text: 전체 텍스트
-            section_type: 섹션 타입
-            patterns: 검색 패턴 (정규식)
-            
+            text: 텍스트 (전체 또는 스트리밍 버퍼)
+            start: 제목 시작 위치
+            heading_end: 'ITEM n.' 끝 위치 (짧은 제목 분리 시 사용)
+            end: 다음 제목 시작 위치
+            found: 이미 추출된 섹션 타입
+
         Returns:
-            ParsedSection 또는 None
+            ParsedSection 또는 None (대상 섹션이 아니거나 본문이 너무 짧음)
         """
-        # 여러 패턴 시도
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-            
-            if match:
-                start_pos = match.start()
-                
-                # 다음 섹션 찾기 (Item 2, Item 1B 등)
-                next_section_match = re.search(
-                    r'\n\s*ITEM\s+\d+[A-Z]?\.?\s+',
-                    text[start_pos + 100:],  # 100자 이후부터 검색 (현재 섹션 제목 스킵)
-                    re.IGNORECASE
-                )
-                
-                if next_section_match:
-                    end_pos = start_pos + 100 + next_section_match.start()
-                else:
-                    # 다음 섹션 없으면 끝까지
-                    end_pos = len(text)
-                
-                # 섹션 내용 추출
-                content = text[start_pos:end_pos].strip()
-                
-                # 제목 추출 (첫 줄)
-                title_match = re.search(r'^.*?$', content, re.MULTILINE)
-                title = title_match.group(0) if title_match else section_type.value
-                
-                # 내용 (제목 제외)
-                body = content[len(title):].strip()
-                
-                # 너무 짧으면 스킵 (실제 내용 아닐 가능성)
-                if len(body.split()) < 50:
-                    continue
-                
-                return ParsedSection(
-                    section_type=section_type,
-                    title=title,
-                    content=body,
-                    word_count=len(body.split()),
-                    extracted_at=datetime.now()
-                )
-        
-        logger.warning(f"Section not found: {section_type}")
+        # 들여쓰기를 건너뛰고 제목 패턴을 해당 위치에서만 확인
+        while start < heading_end and text[start] in ' \t\n':
+            start += 1
+
+        for section_type, patterns in self._COMPILED_PATTERNS.items():
+            if section_type in found:
+                continue
+            if not any(p.match(text, start, end) for p in patterns):
+                continue
+
+            # 섹션 내용 추출
+            content = text[start:end].strip()
+
+            # 제목 추출 (첫 줄)
+            newline = content.find('\n')
+            title = content if newline == -1 else content[:newline]
+
+            # 내용 (제목 제외)
+            body = content[len(title):].strip()
+            word_count = len(body.split())
+
+            # 너무 짧으면 스킵 (실제 내용 아닐 가능성)
+            if word_count < self.MIN_SECTION_WORDS:
+                return None
+
+            return ParsedSection(
+                section_type=section_type,
+                title=title,
+                content=body,
+                word_count=word_count,
+                extracted_at=datetime.now()
+            )
+
         return None
     
     def extract_risk_factors(self, parsed: ParsedFiling) -> List[str]:
@@ -425,6 +644,32 @@ def extract_risks(parsed: ParsedFiling) -> List[str]:
     return parser.extract_risk_factors(parsed)
 
 
+def stream_filing_chunks(
+    content: Union[str, Iterable[str]],
+    chunk_size: int = 4000,
+    overlap: int = 200
+) -> Iterator[Dict]:
+    """
+    공시 문서를 섹션 단위로 스트리밍 파싱하여 임베딩용 청크로 반환 (편의 함수)
+
+    Args:
+        content: HTML 문자열 또는 HTML 청크 iterable
+        chunk_size: 청크당 목표 토큰 수
+        overlap: 청크 간 중첩 토큰 수
+
+    Yields:
+        {"content": str, "metadata": dict}
+    """
+    from backend.data.vector_store.chunker import TextChunker
+
+    parser = SECParser()
+    yield from TextChunker.chunk_sections(
+        parser.iter_sections(content),
+        chunk_size=chunk_size,
+        overlap=overlap
+    )
+
+
 # ============================================
 # 테스트/데모
 # ============================================
@@ -4,10 +4,11 @@ TextChunker - Document chunking logic for embedding.
 Supports:
 - Token-based chunking with overlap
 - Section-based chunking (for SEC filings)
+- Streaming chunking of pre-parsed SEC sections
 - Paragraph-based chunking
 """
 
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
 import re
 
 
@@ -143,6 +144,54 @@ class TextChunker:
         
         return chunks
     
+    @staticmethod
+    def chunk_sections(
+        sections: Iterable,
+        chunk_size: int = 4000,
+        overlap: int = 200
+    ) -> Iterator[Dict]:
+        """
+        Lazily chunk sections produced by SECParser.iter_sections().
+        
+        Each section is consumed as soon as the parser emits it, so a whole
+        filing never has to be held in memory. Sections larger than
+        chunk_size are split further with chunk_by_tokens().
+        
+        Args:
+            sections: Iterable of ParsedSection-like objects
+                      (section_type, title, content)
+            chunk_size: Target tokens per chunk (default: 4000)
+            overlap: Overlapping tokens between chunks (default: 200)
+        
+        Yields:
+            {"content": str, "metadata": dict} dictionaries
+        
+        Example:
+            >>> parser = SECParser()
+            >>> for chunk in TextChunker.chunk_sections(parser.iter_sections(html)):
+            ...     await store.add_document(content=chunk["content"], ...)
+        """
+        for section in sections:
+            section_type = getattr(section.section_type, "value", section.section_type)
+            
+            if TextChunker.estimate_tokens(section.content) <= chunk_size:
+                parts = [section.content]
+            else:
+                parts = TextChunker.chunk_by_tokens(
+                    section.content, chunk_size=chunk_size, overlap=overlap
+                )
+            
+            for i, part in enumerate(parts):
+                yield {
+                    "content": part,
+                    "metadata": {
+                        "section": section_type,
+                        "title": section.title,
+                        "chunk_index": i,
+                        "method": "section"
+                    }
+                }
+    
     @staticmethod
     def chunk_by_paragraphs(
         text: str,
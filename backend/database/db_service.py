@@ -24,6 +24,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 try:
     from backend.config import get_settings
     from backend.database.models import Base, NewsArticle
+    from backend.database.news_vector_search import embedding_columns
 except ImportError:
     # Standalone execution fallback
     import os
@@ -86,6 +87,14 @@ class DatabaseService:
             f"{self.settings.timescale_database}"
         )
 
+    async def _init_connection(self, conn: asyncpg.Connection):
+        """pgvector 코덱 등록 (news_articles.embedding_vec COPY/INSERT)"""
+        try:
+            from pgvector.asyncpg import register_vector
+            await register_vector(conn)
+        except Exception as e:
+            self.logger.debug(f"pgvector codec not registered: {e}")
+
     async def connect(self):
         """Initialize database connections."""
         try:
@@ -94,7 +103,8 @@ class DatabaseService:
                 self.asyncpg_url,
                 min_size=5,
                 max_size=20,
-                command_timeout=60
+                command_timeout=60,
+                init=self._init_connection
             )
             self.logger.info("asyncpg connection pool created")
 
@@ -186,6 +196,8 @@ class DatabaseService:
                     # Prepare data for COPY
                     records = []
                     for article in batch:
+                        # Dual write: embedding(ARRAY) + embedding_vec(vector)
+                        vectors = embedding_columns(article.get('embedding'))
                         # Required fields
                         record = (
                             article.get('title'),
@@ -196,7 +208,7 @@ class DatabaseService:
                             article.get('content_hash'),
                             article.get('crawled_at', datetime.now()),
                             # Extended fields
-                            article.get('embedding'),  # VECTOR type
+                            vectors['embedding'],  # FLOAT[] (dual write)
                             article.get('tags'),  # TEXT[]
                             article.get('tickers'),  # TEXT[]
                             article.get('sentiment_score'),  # FLOAT
@@ -205,6 +217,7 @@ class DatabaseService:
                             article.get('metadata'),  # JSONB
                             article.get('processed_at'),  # TIMESTAMPTZ
                             article.get('embedding_model'),  # VARCHAR
+                            vectors['embedding_vec'],  # VECTOR(384)
                         )
                         records.append(record)
 
@@ -217,7 +230,7 @@ class DatabaseService:
                             'published_date', 'content_hash', 'crawled_at',
                             'embedding', 'tags', 'tickers', 'sentiment_score',
                             'sentiment_label', 'source_category', 'metadata',
-                            'processed_at', 'embedding_model'
+                            'processed_at', 'embedding_model', 'embedding_vec'
                         ],
                         # Note: asyncpg copy_records_to_table doesn't support
                         # ON CONFLICT, so we need to use executemany instead
@@ -262,14 +275,15 @@ class DatabaseService:
             INSERT INTO news_articles (
                 title, content, url, source, published_date, content_hash, crawled_at,
                 embedding, tags, tickers, sentiment_score, sentiment_label,
-                source_category, metadata, processed_at, embedding_model
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
+                source_category, metadata, processed_at, embedding_model, embedding_vec
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
             ON CONFLICT (url) DO NOTHING
             RETURNING id
         """
 
         inserted_count = 0
         for article in articles:
+            vectors = embedding_columns(article.get('embedding'))
             try:
                 result = await conn.fetchval(
                     query,
@@ -280,7 +294,7 @@ class DatabaseService:
                     article.get('published_date'),
                     article.get('content_hash'),
                     article.get('crawled_at', datetime.now()),
-                    article.get('embedding'),
+                    vectors['embedding'],
                     article.get('tags'),
                     article.get('tickers'),
                     article.get('sentiment_score'),
@@ -289,6 +303,7 @@ class DatabaseService:
                     article.get('metadata'),
                     article.get('processed_at'),
                     article.get('embedding_model'),
+                    vectors['embedding_vec'],
                 )
                 if result:  # If id was returned, insert succeeded
                     inserted_count += 1
@@ -0,0 +1,54 @@
+-- Backfill Job Queue (영속 백필 작업 큐 + 청크 체크포인트)
+-- 목표: in-process active_jobs + BackgroundTasks → DB 큐 + 별도 워커 프로세스 풀
+-- 날짜: 2026-10-18
+-- 관련 코드: backend/data/backfill_queue.py, backend/data/backfill_worker.py
+-- 참고: BackfillQueue 가 시작 시 CREATE IF NOT EXISTS 로도 생성합니다 (SQLite 로컬 포함)
+
+-- ============================================================================
+-- 작업 (API 등록 단위)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS backfill_jobs (
+    id VARCHAR(36) PRIMARY KEY,
+    job_type VARCHAR(32) NOT NULL,          -- price_backfill / news_backfill
+    source VARCHAR(32) NOT NULL,            -- yfinance / multi_source (워커 병렬도 단위)
+    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+    params JSON NOT NULL,
+    total_chunks INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    error_message TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_backfill_jobs_created ON backfill_jobs (created_at);
+
+-- ============================================================================
+-- 청크 (워커 실행 단위: ticker × 기간)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS backfill_chunks (
+    id SERIAL PRIMARY KEY,
+    job_id VARCHAR(36) NOT NULL,
+    source VARCHAR(32) NOT NULL,
+    ticker VARCHAR(20),
+    start_date TIMESTAMP NOT NULL,
+    end_date TIMESTAMP NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    next_run_at TIMESTAMP NOT NULL,         -- 재시도 back-off
+    locked_by VARCHAR(64),
+    locked_until TIMESTAMP,                 -- lease (만료 시 다른 워커가 회수)
+    checkpoint JSON,
+    progress JSON,
+    error TEXT,
+    updated_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_backfill_chunks_job_id ON backfill_chunks (job_id);
+
+-- claim: WHERE source = ? AND status IN (...) ORDER BY next_run_at FOR UPDATE SKIP LOCKED LIMIT 1
+CREATE INDEX IF NOT EXISTS idx_backfill_chunks_claim ON backfill_chunks (status, source, next_run_at);
+
+COMMENT ON TABLE backfill_chunks IS '백필 작업 청크 (SKIP LOCKED claim, 체크포인트 재개)';
@@ -0,0 +1,55 @@
+-- News 임베딩 pgvector 전환 (ARRAY(Float) → vector(384) + HNSW)
+-- 목표: 최근 N건 로드 후 Python 코사인 계산 → 인덱스 기반 top-k 검색
+-- 날짜: 2026-10-18
+-- 관련 코드: backend/database/news_vector_search.py
+--
+-- 적용 순서:
+--   1. 이 마이그레이션 (컬럼 + 인덱스, 기존 데이터 변경 없음)
+--   2. 애플리케이션 배포 → embedding / embedding_vec dual write 시작
+--   3. 백필: python backend/scripts/backfill_news_embedding_vectors.py
+--   4. 백필 완료 확인 후 NEWS_EMBEDDING_DUAL_WRITE=false, 이후 embedding 컬럼 제거
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- ============================================================================
+-- 컬럼 (nullable, 기본값 없음 → 테이블 재작성 없이 즉시 완료)
+-- ============================================================================
+
+ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS embedding_vec vector(384);
+
+COMMENT ON COLUMN news_articles.embedding_vec IS 'all-MiniLM-L6-v2 임베딩 (pgvector). embedding(ARRAY) 대체';
+
+-- ============================================================================
+-- HNSW 인덱스 (코사인 거리)
+-- ============================================================================
+
+-- 빌드 메모리: 인덱스가 maintenance_work_mem 에 들어가야 빌드가 빠릅니다
+-- SET maintenance_work_mem = '2GB';
+
+-- m / ef_construction 은 news_vector_search.HNSW_M / HNSW_EF_CONSTRUCTION 과 동일
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_embedding_hnsw ON news_articles
+    USING hnsw (embedding_vec vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+COMMENT ON INDEX idx_news_embedding_hnsw IS '뉴스 의미 검색 / 의미적 중복 체크 (ORDER BY embedding_vec <=> q LIMIT k)';
+
+ANALYZE news_articles;
+
+-- ============================================================================
+-- 검증 쿼리
+-- ============================================================================
+
+-- 백필 진행률
+-- SELECT count(*) FILTER (WHERE embedding IS NOT NULL) AS array_rows,
+--        count(*) FILTER (WHERE embedding_vec IS NOT NULL) AS vector_rows
+-- FROM news_articles;
+
+-- BEGIN;
+-- SELECT set_config('hnsw.ef_search', '100', true);
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT id, 1 - (embedding_vec <=> (SELECT embedding_vec FROM news_articles WHERE embedding_vec IS NOT NULL LIMIT 1)) AS similarity
+-- FROM news_articles
+-- WHERE embedding_vec IS NOT NULL
+-- ORDER BY embedding_vec <=> (SELECT embedding_vec FROM news_articles WHERE embedding_vec IS NOT NULL LIMIT 1)
+-- LIMIT 10;
+-- COMMIT;
+-- 기대: Index Scan using idx_news_embedding_hnsw
@@ -0,0 +1,60 @@
+-- Ticker News Query 인덱스 (War Room 토론 에이전트 공용 뉴스 조회)
+-- 목표: 최근 200건 로드 후 Python 필터링 → 인덱스 기반 티커별 LATERAL 조회
+-- 날짜: 2026-10-18
+-- 관련 코드: backend/database/news_query.py
+
+-- ============================================================================
+-- NewsArticle: 제목/본문 전문 검색 (tickers 태그 누락 기사 보완)
+-- ============================================================================
+
+-- 표현식은 news_query.NEWS_FTS_EXPRESSION 과 동일해야 합니다
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_fts ON news_articles USING gin (
+    to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))
+);
+
+COMMENT ON INDEX idx_news_fts IS '티커 뉴스 조회 FTS 보조 매칭 (tickers @> 와 BitmapOr)';
+
+-- idx_news_tickers (GIN, tickers) 는 기존 인덱스를 그대로 사용합니다
+
+-- tickers @> ARRAY[티커] 는 대소문자를 구분 → 기존 소문자/혼합 태그를 대문자로 정규화
+-- (이후 저장은 NewsArticle.tickers validator 가 대문자로 변환)
+UPDATE news_articles
+SET tickers = ARRAY(SELECT upper(trim(t)) FROM unnest(tickers) AS t WHERE trim(t) <> '')
+WHERE tickers IS NOT NULL
+  AND tickers::text <> upper(tickers::text);
+
+-- ============================================================================
+-- GroundingSearchLog: 긴급 뉴스
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- query ILIKE '%TICKER%' (선행 와일드카드) 용 trigram 인덱스
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_grounding_query_trgm ON grounding_search_logs USING gin (query gin_trgm_ops);
+
+-- ticker 컬럼 일치 + 최신순
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_grounding_ticker_date ON grounding_search_logs (ticker, search_date);
+
+COMMENT ON INDEX idx_grounding_query_trgm IS '긴급 뉴스 query 부분 문자열 검색 (pg_trgm)';
+
+COMMENT ON INDEX idx_grounding_ticker_date IS '티커별 최신 긴급 뉴스 조회';
+
+ANALYZE news_articles;
+
+ANALYZE grounding_search_logs;
+
+-- ============================================================================
+-- 검증 쿼리
+-- ============================================================================
+
+-- EXPLAIN (ANALYZE, BUFFERS)
+-- SELECT t.ticker, n.id
+-- FROM unnest(ARRAY['NVDA', 'AMD']) AS t(ticker)
+-- CROSS JOIN LATERAL (
+--     SELECT n.id FROM news_articles n
+--     WHERE n.published_date >= now() - interval '15 days'
+--       AND (n.tickers @> ARRAY[t.ticker]::varchar[]
+--            OR to_tsvector('simple', coalesce(n.title, '') || ' ' || coalesce(n.content, '')) @@ plainto_tsquery('simple', t.ticker))
+--     ORDER BY n.published_date DESC LIMIT 30
+-- ) n;
+-- 기대: Bitmap Heap Scan ← BitmapOr (idx_news_tickers, idx_news_fts)
@@ -0,0 +1,37 @@
+-- Scheduler Runtime 실행 이력 / 작업 잠금
+-- 목표: 서비스별 APScheduler + lifespan while 루프 → 전용 스케줄러 워커 (실행 이력, 중복 실행 방지)
+-- 날짜: 2026-10-18
+-- 관련 코드: backend/schedulers/scheduler_runtime.py
+-- 참고: JobRunHistory 가 시작 시 CREATE IF NOT EXISTS 로도 생성합니다 (SQLite 로컬 포함)
+
+-- ============================================================================
+-- 작업 실행 이력
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS scheduler_job_runs (
+    id SERIAL PRIMARY KEY,
+    job_id VARCHAR(64) NOT NULL,
+    run_type VARCHAR(16) NOT NULL,          -- scheduled / manual / catch_up
+    concurrency_class VARCHAR(32) NOT NULL, -- llm / broker / yfinance / db_heavy / default
+    status VARCHAR(16) NOT NULL,            -- success / failed / timeout / skipped / missed
+    attempt INTEGER NOT NULL DEFAULT 1,
+    scheduled_at TIMESTAMP,
+    started_at TIMESTAMP NOT NULL,
+    finished_at TIMESTAMP,
+    wait_ms INTEGER,                        -- 동시성 클래스 슬롯 대기
+    duration_ms INTEGER,                    -- 실제 실행 시간
+    error TEXT,
+    host VARCHAR(128)
+);
+
+CREATE INDEX IF NOT EXISTS idx_scheduler_job_runs_job_started ON scheduler_job_runs (job_id, started_at);
+
+-- ============================================================================
+-- 작업 잠금 (여러 스케줄러 프로세스 중 한 곳에서만 실행, lease + heartbeat)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS scheduler_job_locks (
+    job_id VARCHAR(64) PRIMARY KEY,
+    owner VARCHAR(128),
+    locked_until TIMESTAMP
+);
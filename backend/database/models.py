@@ -70,7 +70,7 @@ Database: TimescaleDB (PostgreSQL with time-series extensions)
 
 from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Text, Boolean, ForeignKey, Index, BigInteger, Numeric, UniqueConstraint, JSON, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from pgvector.sqlalchemy import Vector
 from datetime import datetime
@@ -95,7 +95,8 @@ class NewsArticle(Base):
     summary = Column(Text, nullable=True)
 
     # NLP & Embedding Fields (Added in Phase 17)
-    embedding = Column(ARRAY(Float), nullable=True)  # Fallback: ARRAY(Float)
+    embedding = Column(ARRAY(Float), nullable=True)  # Fallback: ARRAY(Float), dual write 기간 후 제거 예정
+    embedding_vec = Column(Vector(384), nullable=True)  # pgvector (all-MiniLM-L6-v2), HNSW 검색: database/news_vector_search.py
     tags = Column(ARRAY(String), nullable=True)
     tickers = Column(ARRAY(String), nullable=True)
     sentiment_score = Column(Float, nullable=True)
@@ -131,6 +132,12 @@ class NewsArticle(Base):
     analysis = relationship("NewsAnalysis", back_populates="article", uselist=False, cascade="all, delete-orphan")
     ticker_relevances = relationship("NewsTickerRelevance", back_populates="article", cascade="all, delete-orphan")
 
+    @validates("tickers")
+    def _normalize_tickers(self, key, tickers):
+        """티커 태그는 대문자로 저장 (news_query 의 tickers @> ARRAY[티커] 는 대소문자 구분)"""
+        from backend.database.news_query import normalize_ticker_tags
+        return normalize_ticker_tags(tickers)
+
     # Indexes
     __table_args__ = (
         Index('idx_news_published_date', 'published_date'),
@@ -145,8 +152,9 @@ class NewsArticle(Base):
         Index('idx_news_narrative_phase', 'narrative_phase', postgresql_where='narrative_phase IS NOT NULL'),
         Index('idx_news_fact_status', 'fact_verification_status', postgresql_where='fact_verification_status IS NOT NULL'),
         Index('idx_news_confirmation_status', 'confirmation_status', postgresql_where='confirmation_status IS NOT NULL'),
-        # Vector index would be created via migration, rarely defined in model for basic sync usage
-        # Index('idx_news_embedding', 'embedding', postgresql_using='ivfflat', postgresql_ops={'embedding': 'vector_cosine_ops'}, postgresql_with={'lists': 100}),
+        # 제목/본문 FTS 인덱스(idx_news_fts)는 마이그레이션으로 생성 (20261018_news_ticker_query_indexes.sql)
+        # 벡터 인덱스 (운영 DB는 마이그레이션으로 CONCURRENTLY 생성: 20261018_news_embedding_vector_hnsw.sql)
+        Index('idx_news_embedding_hnsw', 'embedding_vec', postgresql_using='hnsw', postgresql_ops={'embedding_vec': 'vector_cosine_ops'}, postgresql_with={'m': 16, 'ef_construction': 64}),
     )
 
     def __repr__(self):
@@ -362,6 +370,8 @@ class GroundingSearchLog(Base):
     # Indexes
     __table_args__ = (
         Index('idx_grounding_date', 'search_date'),
+        Index('idx_grounding_ticker_date', 'ticker', 'search_date'),  # 티커별 긴급 뉴스 (news_query)
+        # query gin_trgm_ops 인덱스(idx_grounding_query_trgm)는 pg_trgm 확장이 필요하여 마이그레이션으로 생성
     )
 
     def __repr__(self):
@@ -0,0 +1,382 @@
+"""
+Ticker News Query - Index-backed news retrieval for debate agents
+
+War Room 에이전트(news / sentiment / analyst)가 공유하는 티커별 뉴스 조회 계층입니다.
+
+기존 방식 (NewsAgent.analyze):
+  - 최근 15일 뉴스 200건을 전체 컬럼(본문 포함)으로 로드 → Python에서 tickers 대문자 변환 +
+    제목/본문 부분 문자열 검색 → 200건을 넘는 날에는 관련 뉴스 누락
+  - GroundingSearchLog.query 선행 와일드카드 ILIKE (인덱스 사용 불가)
+
+개선:
+  - 다중 티커를 쿼리 1회로 조회: unnest(:tickers) × LATERAL (티커별 최신 N건)
+  - 1순위 tickers @> ARRAY[티커] (GIN idx_news_tickers)
+    보조 to_tsvector('simple', title || content) @@ 티커 (GIN idx_news_fts)
+  - 긴급 뉴스: ticker 컬럼 일치 또는 query ILIKE (pg_trgm idx_grounding_query_trgm)
+  - 필요한 컬럼만 조회 (본문은 snippet_chars 길이로 잘라서 전송)
+  - AsyncSession 비동기 실행, 짧은 TTL 캐시로 한 토론 내 에이전트 간 결과 공유
+
+인덱스: database/migrations/20261018_news_ticker_query_indexes.sql
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKBACK_DAYS = 15
+DEFAULT_NEWS_PER_TICKER = 30
+DEFAULT_EMERGENCY_PER_TICKER = 5
+DEFAULT_SNIPPET_CHARS = 500
+
+# idx_news_fts 표현식과 동일해야 인덱스를 사용합니다
+NEWS_FTS_EXPRESSION = "to_tsvector('simple', coalesce(n.title, '') || ' ' || coalesce(n.content, ''))"
+
+_TICKER_NEWS_SQL = """
+SELECT t.ticker AS query_ticker,
+       n.id, n.title, n.snippet, n.source, n.published_date,
+       n.tickers, n.tags, n.sentiment_score, n.matched_by
+FROM unnest(CAST(:tickers AS text[])) AS t(ticker)
+CROSS JOIN LATERAL (
+    SELECT n.id,
+           n.title,
+           left(coalesce(n.summary, n.content), :snippet_chars) AS snippet,
+           n.source,
+           n.published_date,
+           n.tickers,
+           n.tags,
+           n.sentiment_score,
+           CASE WHEN n.tickers @> ARRAY[t.ticker]::varchar[] THEN 'tickers' ELSE 'text' END AS matched_by
+    FROM news_articles n
+    WHERE n.published_date >= :since
+      AND ({match})
+    ORDER BY n.published_date DESC
+    LIMIT :per_ticker
+) n
+ORDER BY t.ticker, n.published_date DESC
+"""
+
+_TICKER_MATCH = "n.tickers @> ARRAY[t.ticker]::varchar[]"
+_TEXT_MATCH = f"{NEWS_FTS_EXPRESSION} @@ plainto_tsquery('simple', t.ticker)"
+
+
+def ticker_news_sql(text_fallback: bool = True):
+    """
+    티커별 최신 뉴스 LATERAL 쿼리
+
+    text_fallback=True면 tickers 태그가 없는 기사도 제목/본문 FTS로 포함합니다
+    (GIN 인덱스 두 개의 BitmapOr).
+    """
+    match = f"{_TICKER_MATCH} OR {_TEXT_MATCH}" if text_fallback else _TICKER_MATCH
+    return text(_TICKER_NEWS_SQL.format(match=match))
+
+
+EMERGENCY_NEWS_SQL = text("""
+SELECT t.ticker AS query_ticker, g.id, g.ticker, g.query, g.search_date, g.was_emergency
+FROM unnest(CAST(:tickers AS text[])) AS t(ticker)
+CROSS JOIN LATERAL (
+    SELECT g.id, g.ticker, left(g.query, 200) AS query, g.search_date, g.was_emergency
+    FROM grounding_search_logs g
+    WHERE g.search_date >= :since
+      AND (g.ticker = t.ticker OR g.query ILIKE '%' || t.ticker || '%')
+    ORDER BY g.search_date DESC
+    LIMIT :per_ticker
+) g
+ORDER BY t.ticker, g.search_date DESC
+""")
+
+
+@dataclass
+class TickerNewsItem:
+    """티커 뉴스 (경량 행 — 본문 대신 snippet)"""
+    id: int
+    title: str
+    snippet: str
+    source: Optional[str]
+    published_date: datetime
+    tickers: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    sentiment_score: Optional[float] = None
+    matched_by: str = "tickers"   # tickers | text
+
+    @property
+    def content(self) -> str:
+        """해석 프롬프트 호환 (NewsArticle.content 대체)"""
+        return self.snippet
+
+
+@dataclass
+class EmergencyNewsItem:
+    """긴급 뉴스 (GroundingSearchLog 경량 행)"""
+    id: int
+    ticker: Optional[str]
+    query: str
+    search_date: datetime
+    was_emergency: bool = False
+
+
+@dataclass
+class TickerNewsBundle:
+    """한 티커의 토론용 뉴스 묶음"""
+    ticker: str
+    news: List[TickerNewsItem] = field(default_factory=list)
+    emergency: List[EmergencyNewsItem] = field(default_factory=list)
+
+    @property
+    def sentiment_scores(self) -> List[float]:
+        return [n.sentiment_score for n in self.news if n.sentiment_score]
+
+
+SessionFactory = Callable[[], Any]
+
+
+def _default_session_factory():
+    from backend.core.database import AsyncSessionLocal
+    return AsyncSessionLocal()
+
+
+def normalize_ticker_tags(tickers: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """
+    news_articles.tickers 저장용 대문자 변환 (NewsArticle 모델 validator)
+
+    tickers @> ARRAY[:ticker] 는 대소문자를 구분하므로 조회 티커(normalize_tickers)와
+    같은 형태로 저장해야 GIN 인덱스 조회에서 누락되지 않습니다.
+    """
+    if tickers is None:
+        return None
+    return normalize_tickers(tickers)
+
+
+def normalize_tickers(tickers: Iterable[str]) -> List[str]:
+    """대문자 + 중복 제거 (순서 유지)"""
+    seen = []
+    for ticker in tickers:
+        symbol = (ticker or "").strip().upper()
+        if symbol and symbol not in seen:
+            seen.append(symbol)
+    return seen
+
+
+class TickerNewsQuery:
+    """
+    다중 티커 뉴스 조회 (쿼리 1회 / 종류)
+
+    Usage:
+        query = get_ticker_news_query()
+        bundles = await query.fetch_for_debate(["NVDA", "AMD"])
+        bundles["NVDA"].news        # 최신순, 최대 30건
+        bundles["NVDA"].emergency   # 최신순, 최대 5건
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[SessionFactory] = None,
+        lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+        news_per_ticker: int = DEFAULT_NEWS_PER_TICKER,
+        emergency_per_ticker: int = DEFAULT_EMERGENCY_PER_TICKER,
+        snippet_chars: int = DEFAULT_SNIPPET_CHARS,
+        text_fallback: bool = True,
+        cache_ttl_seconds: float = 60.0,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        Args:
+            session_factory: AsyncSession 팩토리 (기본: core.database.AsyncSessionLocal)
+            lookback_days: 조회 기간 (일)
+            news_per_ticker: 티커별 일반 뉴스 최대 건수
+            emergency_per_ticker: 티커별 긴급 뉴스 최대 건수
+            snippet_chars: 본문 전송 길이 (summary 우선)
+            text_fallback: tickers 태그가 없는 기사를 제목/본문 FTS로 보완
+            cache_ttl_seconds: 티커별 결과 캐시 TTL (0이면 비활성)
+        """
+        self.session_factory = session_factory or _default_session_factory
+        self.lookback_days = lookback_days
+        self.news_per_ticker = news_per_ticker
+        self.emergency_per_ticker = emergency_per_ticker
+        self.snippet_chars = snippet_chars
+        self.text_fallback = text_fallback
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.clock = clock
+
+        # (ticker, lookback_days) → (expires_monotonic, bundle)
+        self._cache: Dict[Tuple[str, int], Tuple[float, TickerNewsBundle]] = {}
+        self._news_sql = ticker_news_sql(text_fallback)
+
+        self.stats = {
+            "queries": 0,
+            "cache_hits": 0,
+            "tickers_fetched": 0,
+            "rows": 0,
+            "errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def fetch_for_debate(
+        self,
+        tickers: Sequence[str],
+        lookback_days: Optional[int] = None,
+    ) -> Dict[str, TickerNewsBundle]:
+        """
+        티커별 일반 + 긴급 뉴스 (캐시 미스 티커만 한 세션에서 두 쿼리로 조회)
+        """
+        symbols = normalize_tickers(tickers)
+        days = lookback_days or self.lookback_days
+        now = time.monotonic()
+
+        bundles: Dict[str, TickerNewsBundle] = {}
+        missing = []
+        for symbol in symbols:
+            cached = self._cache.get((symbol, days))
+            if cached and cached[0] > now:
+                bundles[symbol] = cached[1]
+                self.stats["cache_hits"] += 1
+            else:
+                missing.append(symbol)
+
+        if missing:
+            fetched = await self._fetch(missing, days)
+            expires = time.monotonic() + self.cache_ttl_seconds
+            for symbol, bundle in fetched.items():
+                if self.cache_ttl_seconds > 0:
+                    self._cache[(symbol, days)] = (expires, bundle)
+                bundles[symbol] = bundle
+
+        return {symbol: bundles[symbol] for symbol in symbols}
+
+    async def fetch_news(
+        self,
+        tickers: Sequence[str],
+        lookback_days: Optional[int] = None,
+    ) -> Dict[str, List[TickerNewsItem]]:
+        """티커별 일반 뉴스만"""
+        bundles = await self.fetch_for_debate(tickers, lookback_days)
+        return {symbol: bundle.news for symbol, bundle in bundles.items()}
+
+    async def get_bundle(self, ticker: str, lookback_days: Optional[int] = None) -> TickerNewsBundle:
+        symbol = normalize_tickers([ticker])[0]
+        return (await self.fetch_for_debate([symbol], lookback_days))[symbol]
+
+    def invalidate(self, tickers: Optional[Sequence[str]] = None) -> None:
+        if tickers is None:
+            self._cache.clear()
+            return
+        symbols = set(normalize_tickers(tickers))
+        for key in [k for k in self._cache if k[0] in symbols]:
+            del self._cache[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "cached_tickers": len(self._cache)}
+
+    # ------------------------------------------------------------------
+    # Query execution
+    # ------------------------------------------------------------------
+
+    def news_params(self, tickers: List[str], since: datetime) -> Dict[str, Any]:
+        return {
+            "tickers": tickers,
+            "since": since,
+            "per_ticker": self.news_per_ticker,
+            "snippet_chars": self.snippet_chars,
+        }
+
+    def emergency_params(self, tickers: List[str], since: datetime) -> Dict[str, Any]:
+        return {"tickers": tickers, "since": since, "per_ticker": self.emergency_per_ticker}
+
+    async def _fetch(self, tickers: List[str], days: int) -> Dict[str, TickerNewsBundle]:
+        since = self.clock() - timedelta(days=days)
+        bundles = {symbol: TickerNewsBundle(ticker=symbol) for symbol in tickers}
+
+        try:
+            async with self.session_factory() as session:
+                news_rows = (await session.execute(self._news_sql, self.news_params(tickers, since))).all()
+                emergency_rows = (
+                    await session.execute(EMERGENCY_NEWS_SQL, self.emergency_params(tickers, since))
+                ).all()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"❌ Ticker news query failed for {tickers}: {e}")
+            raise
+
+        self.stats["queries"] += 2
+        self.stats["tickers_fetched"] += len(tickers)
+        self.stats["rows"] += len(news_rows) + len(emergency_rows)
+
+        for row in news_rows:
+            bundle = bundles.get(row.query_ticker)
+            if bundle is not None:
+                bundle.news.append(TickerNewsItem(
+                    id=row.id,
+                    title=row.title,
+                    snippet=row.snippet or "",
+                    source=row.source,
+                    published_date=row.published_date,
+                    tickers=list(row.tickers or []),
+                    tags=list(row.tags or []),
+                    sentiment_score=row.sentiment_score,
+                    matched_by=row.matched_by,
+                ))
+
+        for row in emergency_rows:
+            bundle = bundles.get(row.query_ticker)
+            if bundle is not None:
+                bundle.emergency.append(EmergencyNewsItem(
+                    id=row.id,
+                    ticker=row.ticker,
+                    query=row.query or "",
+                    search_date=row.search_date,
+                    was_emergency=bool(row.was_emergency),
+                ))
+
+        return bundles
+
+
+def summarize_bundle(bundle: TickerNewsBundle, headlines: int = 3) -> Dict[str, Any]:
+    """에이전트 컨텍스트용 뉴스 요약 (건수 / 평균 감성 / 최신 헤드라인)"""
+    scores = bundle.sentiment_scores
+    return {
+        "news_count": len(bundle.news),
+        "emergency_count": len(bundle.emergency),
+        "avg_sentiment": sum(scores) / len(scores) if scores else 0.0,
+        "positive_count": sum(1 for s in scores if s > 0.2),
+        "negative_count": sum(1 for s in scores if s < -0.2),
+        "recent_headlines": [n.title for n in bundle.news[:headlines]],
+    }
+
+
+async def fetch_news_summary(
+    ticker: str,
+    news_query: Optional["TickerNewsQuery"] = None,
+) -> Optional[Dict[str, Any]]:
+    """티커 뉴스 요약 (조회 실패 시 None — 에이전트 투표는 계속 진행)"""
+    try:
+        bundle = await (news_query or get_ticker_news_query()).get_bundle(ticker)
+        return summarize_bundle(bundle)
+    except Exception as e:
+        logger.warning(f"⚠️ Ticker news summary unavailable for {ticker}: {e}")
+        return None
+
+
+# ============================================================================
+# Singleton
+# ============================================================================
+
+_ticker_news_query: Optional[TickerNewsQuery] = None
+
+
+def get_ticker_news_query() -> TickerNewsQuery:
+    """TickerNewsQuery 싱글톤"""
+    global _ticker_news_query
+    if _ticker_news_query is None:
+        _ticker_news_query = TickerNewsQuery()
+    return _ticker_news_query
@@ -0,0 +1,368 @@
+"""
+News Vector Search - pgvector HNSW search over news_articles.embedding_vec
+
+NewsArticle.embedding 은 ARRAY(Float) 로 저장되어 인덱스를 사용할 수 없었습니다.
+(의미적 중복 체크: 최근 100건을 로드해 Python에서 코사인 유사도 계산 → 100건 밖의 중복 누락)
+
+마이그레이션 단계:
+  1. embedding_vec vector(384) 컬럼 + HNSW(vector_cosine_ops) 인덱스 추가
+     (database/migrations/20261018_news_embedding_vector_hnsw.sql)
+  2. Dual write: 저장소는 embedding(ARRAY) 과 embedding_vec 을 함께 기록
+     (NEWS_EMBEDDING_DUAL_WRITE=false 로 ARRAY 기록 중단)
+  3. NewsEmbeddingBackfill: 기존 ARRAY 값을 id 키셋 배치로 vector 변환
+  4. 백필 완료 후 읽기는 embedding_vec 만 사용, ARRAY 컬럼은 이후 제거
+
+검색:
+  - ORDER BY embedding_vec <=> :query LIMIT k (HNSW 인덱스 스캔)
+  - hnsw.ef_search 쿼리별 조정 (set_config(..., is_local=true) → 트랜잭션 범위)
+  - WHERE 필터(published_date 등)는 인덱스 스캔 후 적용되므로 필터가 좁을수록 ef_search 를 높이거나
+    iterative_scan='relaxed_order' (pgvector 0.8+) 를 사용합니다
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# all-MiniLM-L6-v2 (LocalEmbeddingService / NewsProcessor)
+NEWS_EMBEDDING_DIM = 384
+
+# pgvector 기본값 40, k 보다 작으면 k 로 올립니다
+DEFAULT_EF_SEARCH = 40
+MAX_EF_SEARCH = 1000
+
+# 시간 필터가 붙는 의미적 중복 체크용 (필터 후 결과 부족 방지)
+DEDUP_EF_SEARCH = 100
+ITERATIVE_SCAN_MODES = ("off", "relaxed_order", "strict_order")
+
+# HNSW 빌드 파라미터 (마이그레이션 / 모델 Index 와 동일)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+
+DEFAULT_BACKFILL_BATCH_SIZE = 1000
+
+
+def dual_write_enabled() -> bool:
+    """Dual write 기간 여부 (ARRAY 컬럼도 함께 기록)"""
+    return os.getenv("NEWS_EMBEDDING_DUAL_WRITE", "true").lower() == "true"
+
+
+def to_vector_value(
+    embedding: Optional[Sequence[float]],
+    dim: int = NEWS_EMBEDDING_DIM,
+) -> Optional[List[float]]:
+    """
+    embedding_vec 컬럼 값으로 변환
+
+    차원이 다르거나(예: 1536차원 fallback) 영벡터(임베딩 실패 fallback)면 None.
+    영벡터는 코사인 거리가 정의되지 않아 검색 결과를 오염시킵니다.
+    """
+    if embedding is None:
+        return None
+    values = [float(v) for v in embedding]
+    if len(values) != dim:
+        return None
+    if not any(values) or not all(math.isfinite(v) for v in values):
+        return None
+    return values
+
+
+def embedding_columns(
+    embedding: Optional[Sequence[float]],
+    dual_write: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    NewsArticle 임베딩 컬럼 값 (dual write)
+
+    Returns:
+        {"embedding": ARRAY 값 또는 None, "embedding_vec": vector 값 또는 None}
+    """
+    if dual_write is None:
+        dual_write = dual_write_enabled()
+    return {
+        "embedding": list(embedding) if (dual_write and embedding is not None) else None,
+        "embedding_vec": to_vector_value(embedding),
+    }
+
+
+def vector_literal(values: Sequence[float]) -> str:
+    """pgvector 텍스트 표현 ('[0.1,0.2,...]') - 드라이버와 무관하게 CAST(:q AS vector) 로 전달"""
+    return "[" + ",".join(repr(float(v)) for v in values) + "]"
+
+
+@dataclass
+class NewsVectorHit:
+    """벡터 검색 결과"""
+    id: int
+    title: str
+    published_date: Optional[datetime]
+    tickers: List[str]
+    similarity: float
+
+
+_SEARCH_SQL = """
+SELECT n.id, n.title, n.published_date, n.tickers,
+       1 - (n.embedding_vec <=> CAST(:query AS vector)) AS similarity
+FROM news_articles n
+WHERE n.embedding_vec IS NOT NULL{filters}
+ORDER BY n.embedding_vec <=> CAST(:query AS vector)
+LIMIT :k
+"""
+
+
+class NewsVectorSearch:
+    """
+    news_articles.embedding_vec HNSW 검색
+
+    Usage:
+        search = NewsVectorSearch()
+        hits = search.search(db, query_embedding, k=10, ef_search=100)
+    """
+
+    def __init__(self, default_ef_search: int = DEFAULT_EF_SEARCH, dim: int = NEWS_EMBEDDING_DIM):
+        self.default_ef_search = default_ef_search
+        self.dim = dim
+        self.stats = {
+            "queries": 0,
+            "total_latency_ms": 0.0,
+            "errors": 0,
+        }
+
+    def search(
+        self,
+        session,
+        query_embedding: Sequence[float],
+        k: int = 10,
+        ef_search: Optional[int] = None,
+        since: Optional[datetime] = None,
+        exclude_id: Optional[int] = None,
+        iterative_scan: Optional[str] = None,
+    ) -> List[NewsVectorHit]:
+        """
+        코사인 유사도 top-k 검색
+
+        Args:
+            session: 동기 SQLAlchemy Session
+            query_embedding: 질의 임베딩 (dim 차원)
+            k: 결과 수
+            ef_search: HNSW 탐색 폭 (높을수록 recall ↑, 지연 ↑). None이면 기본값
+            since: published_date 하한 (인덱스 스캔 후 필터)
+            exclude_id: 제외할 기사 id (자기 자신)
+            iterative_scan: hnsw.iterative_scan (pgvector 0.8+). None이면 서버 설정 유지
+
+        Raises:
+            ValueError: 질의 임베딩 차원 불일치 / 영벡터, 알 수 없는 iterative_scan
+        """
+        query = to_vector_value(query_embedding, self.dim)
+        if query is None:
+            raise ValueError(f"query embedding must be a non-zero {self.dim}-dim vector")
+        if iterative_scan is not None and iterative_scan not in ITERATIVE_SCAN_MODES:
+            raise ValueError(f"iterative_scan must be one of {ITERATIVE_SCAN_MODES}")
+
+        filters = ""
+        params: Dict[str, Any] = {"query": vector_literal(query), "k": k}
+        if since is not None:
+            filters += "\n  AND n.published_date >= :since"
+            params["since"] = since
+        if exclude_id is not None:
+            filters += "\n  AND n.id <> :exclude_id"
+            params["exclude_id"] = exclude_id
+
+        start = time.perf_counter()
+        try:
+            # savepoint: 컬럼 미생성(마이그레이션 전) 등 실패가 호출자 트랜잭션을 망가뜨리지 않도록
+            with session.begin_nested():
+                session.execute(
+                    text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+                    {"ef_search": str(self._ef_search(k, ef_search))},
+                )
+                if iterative_scan is not None:
+                    session.execute(
+                        text("SELECT set_config('hnsw.iterative_scan', :mode, true)"),
+                        {"mode": iterative_scan},
+                    )
+                rows = session.execute(text(_SEARCH_SQL.format(filters=filters)), params).all()
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            self.stats["queries"] += 1
+            self.stats["total_latency_ms"] += (time.perf_counter() - start) * 1000
+
+        return [
+            NewsVectorHit(
+                id=row.id,
+                title=row.title,
+                published_date=row.published_date,
+                tickers=list(row.tickers or []),
+                similarity=float(row.similarity),
+            )
+            for row in rows
+        ]
+
+    def find_near_duplicates(
+        self,
+        session,
+        embedding: Sequence[float],
+        threshold: float,
+        since: Optional[datetime] = None,
+        k: int = 10,
+        ef_search: int = DEDUP_EF_SEARCH,
+    ) -> List[NewsVectorHit]:
+        """유사도 threshold 초과 기사 (의미적 중복 체크)"""
+        hits = self.search(session, embedding, k=k, ef_search=ef_search, since=since)
+        return [hit for hit in hits if hit.similarity > threshold]
+
+    def _ef_search(self, k: int, ef_search: Optional[int]) -> int:
+        ef = ef_search or self.default_ef_search
+        return max(k, min(int(ef), MAX_EF_SEARCH))
+
+    def get_stats(self) -> Dict[str, Any]:
+        queries = self.stats["queries"]
+        return {
+            **self.stats,
+            "avg_latency_ms": self.stats["total_latency_ms"] / queries if queries else 0.0,
+        }
+
+
+# =============================================================================
+# Backfill: ARRAY(Float) → vector
+# =============================================================================
+
+_BACKFILL_SQL = """
+WITH batch AS (
+    SELECT id FROM news_articles
+    WHERE id > :after_id
+      AND embedding IS NOT NULL
+      AND embedding_vec IS NULL
+    ORDER BY id
+    LIMIT :batch_size
+),
+converted AS (
+    UPDATE news_articles n
+    SET embedding_vec = CAST(n.embedding AS vector({dim}))
+    FROM batch b
+    WHERE n.id = b.id
+      AND array_length(n.embedding, 1) = {dim}
+      AND n.embedding <> array_fill(0::float8, ARRAY[{dim}])
+    RETURNING n.id
+)
+SELECT (SELECT max(id) FROM batch) AS last_id,
+       (SELECT count(*) FROM batch) AS scanned,
+       (SELECT count(*) FROM converted) AS converted
+"""
+
+
+class NewsEmbeddingBackfill:
+    """
+    기존 ARRAY 임베딩을 embedding_vec 로 배치 변환
+
+    - id 키셋 페이지네이션 (변환 불가 행은 건너뛰고 다시 스캔하지 않음)
+    - 배치마다 커밋 → 짧은 행 잠금, 중단 후 재실행 시 남은 행만 처리
+    - 배치 사이 pause_seconds 대기로 운영 부하 완화
+
+    Usage:
+        backfill = NewsEmbeddingBackfill()
+        stats = backfill.run()                  # 동기
+        await backfill.run_in_background()      # 이벤트 루프 차단 없이
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE,
+        pause_seconds: float = 0.05,
+        dim: int = NEWS_EMBEDDING_DIM,
+    ):
+        self.session_factory = session_factory or _default_session_factory
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.dim = int(dim)
+        self._sql = text(_BACKFILL_SQL.format(dim=self.dim))
+        self.stats = {
+            "batches": 0,
+            "scanned": 0,
+            "converted": 0,
+            "skipped": 0,
+            "last_id": 0,
+            "elapsed_seconds": 0.0,
+        }
+
+    def run_batch(self, session, after_id: int) -> Dict[str, int]:
+        """배치 1회 변환 후 커밋"""
+        row = session.execute(self._sql, {"after_id": after_id, "batch_size": self.batch_size}).one()
+        session.commit()
+        return {
+            "last_id": row.last_id if row.last_id is not None else after_id,
+            "scanned": int(row.scanned or 0),
+            "converted": int(row.converted or 0),
+        }
+
+    def run(self, after_id: int = 0, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """남은 행이 없을 때까지(또는 max_batches) 배치 변환"""
+        start = time.perf_counter()
+        session = self.session_factory()
+        try:
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                result = self.run_batch(session, after_id)
+                if result["scanned"] == 0:
+                    break
+
+                batches += 1
+                after_id = result["last_id"]
+                self.stats["batches"] += 1
+                self.stats["scanned"] += result["scanned"]
+                self.stats["converted"] += result["converted"]
+                self.stats["skipped"] += result["scanned"] - result["converted"]
+                self.stats["last_id"] = after_id
+                logger.info(
+                    f"🧮 Embedding backfill batch {self.stats['batches']}: "
+                    f"{result['converted']}/{result['scanned']} converted (last_id={after_id})"
+                )
+
+                if self.pause_seconds:
+                    time.sleep(self.pause_seconds)
+        except Exception as e:
+            session.rollback()
+            logger.error(f"❌ Embedding backfill failed after id={after_id}: {e}")
+            raise
+        finally:
+            session.close()
+            self.stats["elapsed_seconds"] += time.perf_counter() - start
+
+        return self.get_stats()
+
+    async def run_in_background(self, after_id: int = 0, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """워커 스레드에서 run() 실행"""
+        return await asyncio.to_thread(self.run, after_id, max_batches)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
+
+
+def _default_session_factory():
+    from backend.database.repository import get_sync_session
+    return get_sync_session()
+
+
+_news_vector_search: Optional[NewsVectorSearch] = None
+
+
+def get_news_vector_search() -> NewsVectorSearch:
+    """NewsVectorSearch 싱글톤"""
+    global _news_vector_search
+    if _news_vector_search is None:
+        _news_vector_search = NewsVectorSearch()
+    return _news_vector_search
@@ -50,6 +50,11 @@ from backend.database.models import (
     PositionOwnership,
     ConflictLog
 )
+from backend.database.news_vector_search import (
+    NewsVectorHit,
+    embedding_columns,
+    get_news_vector_search,
+)
 
 if TYPE_CHECKING:
     from backend.news.rss_crawler import NewsArticle as RSSNewsArticle
@@ -157,7 +162,7 @@ class NewsRepository:
             'content_hash': content_hash,
             'author': article_data.get('author'),
             'summary': article_data.get('summary'),
-            'embedding': article_data.get('embedding'),
+            **embedding_columns(article_data.get('embedding')),  # dual write: embedding + embedding_vec
             'sentiment_score': article_data.get('sentiment_score'),
             'sentiment_label': article_data.get('sentiment_label'),
             'tags': article_data.get('tags'),
@@ -280,6 +285,19 @@ class NewsRepository:
 
         return query.order_by(desc(NewsArticle.published_date)).all()
 
+    def find_similar_articles(
+        self,
+        embedding: List[float],
+        k: int = 10,
+        ef_search: Optional[int] = None,
+        since: Optional[datetime] = None,
+        exclude_id: Optional[int] = None,
+    ) -> List[NewsVectorHit]:
+        """임베딩 유사 기사 top-k (embedding_vec HNSW 인덱스)"""
+        return get_news_vector_search().search(
+            self.session, embedding, k=k, ef_search=ef_search, since=since, exclude_id=exclude_id
+        )
+
     def count_by_source(self, start_date: datetime, end_date: datetime) -> List[Tuple[str, int]]:
         """소스별 기사 수 집계"""
         return (
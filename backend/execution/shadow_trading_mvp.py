@@ -43,6 +43,8 @@ from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
 from pathlib import Path
 
+from backend.analytics import risk_metrics
+
 # .env 파일 로드 (DB 연결용)
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
@@ -496,18 +498,7 @@ class ShadowTradingMVP:
         if not self.equity_curve:
             return 0.0
 
-        equity_values = [e['equity'] for e in self.equity_curve]
-        peak = equity_values[0]
-        max_dd = 0.0
-
-        for equity in equity_values:
-            if equity > peak:
-                peak = equity
-            dd = (equity - peak) / peak
-            if dd < max_dd:
-                max_dd = dd
-
-        return max_dd
+        return risk_metrics.max_drawdown([e['equity'] for e in self.equity_curve])
 
     def _calculate_sharpe_ratio(self) -> float:
         """Calculate Sharpe ratio (simplified)"""
@@ -15,11 +15,14 @@ Date: 2025-11-14
 """
 
 import asyncio
+import logging
 from datetime import datetime
 from typing import Dict, List, Optional
 
 from .execution_engine import SmartExecutionEngine, ExecutionResult
 
+logger = logging.getLogger(__name__)
+
 
 class SimplePortfolioManager:
     """
@@ -239,7 +242,13 @@ class SmartExecutor:
         execution_engine: Optional[SmartExecutionEngine] = None,
         portfolio_manager: Optional[SimplePortfolioManager] = None,
         risk_manager: Optional[SimpleRiskManager] = None,
+        market_data_service=None,
     ):
+        """
+        Args:
+            market_data_service: Shared market snapshot service for live prices
+                (None = get_market_snapshot_service(); mock prices only if unavailable)
+        """
         # Import here to avoid circular dependency
         if trading_agent is None:
             try:
@@ -254,6 +263,13 @@ class SmartExecutor:
         self.execution_engine = execution_engine or SmartExecutionEngine()
         self.portfolio_manager = portfolio_manager or SimplePortfolioManager()
         self.risk_manager = risk_manager or SimpleRiskManager()
+        if market_data_service is None:
+            try:
+                from backend.market_data.snapshot_service import get_market_snapshot_service
+                market_data_service = get_market_snapshot_service()
+            except ImportError as e:
+                logger.warning(f"Market snapshot service not available, using mock prices: {e}")
+        self.market_data_service = market_data_service
 
     async def process_ticker(
         self,
@@ -403,7 +419,15 @@ class SmartExecutor:
         return processed_results
 
     async def _get_current_price(self, ticker: str) -> float:
-        """Get current market price (mock for now)."""
+        """Get current market price (shared snapshot service, mock fallback)."""
+        if self.market_data_service is not None:
+            try:
+                price = await self.market_data_service.get_price(ticker)
+                if price:
+                    return float(price)
+            except Exception as e:
+                logger.warning(f"Price lookup failed for {ticker}, using mock: {e}")
+
         # Mock prices for testing
         mock_prices = {
             "NVDA": 875.50,
@@ -294,59 +294,37 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Order Recovery failed: {e}")
         # Don't fail startup if recovery fails
 
-    # 📊 Initialize and start Stock Price Scheduler
-    try:
-        from backend.services.stock_price_scheduler import get_stock_price_scheduler
-        stock_scheduler = get_stock_price_scheduler()
-        stock_scheduler.start()
-        if stock_scheduler:
-            logger.info("Stock Price Scheduler started")
-        
-        # 📊 Initialize and start Daily Report Scheduler
-        from backend.services.daily_report_scheduler import get_daily_report_scheduler
-        report_scheduler = get_daily_report_scheduler()
-        report_scheduler.start()
-        if report_scheduler:
-            logger.info("✅ Daily Report Scheduler started (7:10 AM Daily, 7:15 AM Mon, 7:20 AM 1st)")
-    except Exception as e:
-        logger.warning(f"Failed to start Stock Price Scheduler: {e}")
-
-    # 🆕 Start Daily Learning Scheduler (Option 3: Self-Learning System)
-    try:
-        from backend.ai.learning.daily_learning_scheduler import DailyLearningScheduler
-        from datetime import time
-        import asyncio
-
-        # Run twice daily:
-        # 1. 10:00 KST - After US after-hours close (20:00 EST = 10:00 KST next day)
-        # 2. 16:00 KST - After Korean market close (15:30 KST)
-        learning_scheduler = DailyLearningScheduler(
-            run_times=[time(10, 0), time(16, 0)]
-        )
-
-        # Run in background task to avoid blocking main event loop
-        asyncio.create_task(learning_scheduler.start())
-        logger.info("✅ Daily Learning Scheduler started (10:00 & 16:00 KST - 2x daily)")
-    except Exception as e:
-        logger.warning(f"⚠️ Failed to start Daily Learning Scheduler: {e}")
-
-    # 🆕 Start Accountability Scheduler (News Interpretation Accuracy Tracking)
-    try:
-        from backend.automation.accountability_scheduler import AccountabilityScheduler
-        import asyncio
-
-        # Run hourly to verify 1h/1d/3d price changes after news interpretations
-        accountability_scheduler = AccountabilityScheduler(
-            run_interval_minutes=60,
-            retry_on_failure=True,
-            trigger_failure_learning=True
-        )
+    # ⏰ Scheduler Runtime - periodic jobs (stock prices, reports, learning, accountability,
+    # news poller, shadow trader). Default (embedded): run inside this process.
+    # Deployments with the dedicated scheduler worker set SCHEDULER_MODE=worker:
+    #   python -m backend.schedulers.scheduler_runtime
+    scheduler_runtime = None
+    if os.getenv("SCHEDULER_MODE", "embedded").lower() == "embedded":
+        try:
+            from backend.schedulers.scheduler_runtime import get_scheduler_runtime
+            scheduler_runtime = get_scheduler_runtime()
+            scheduler_runtime.start()
+            logger.info(f"✅ Scheduler Runtime started in-process ({len(scheduler_runtime.jobs)} jobs)")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to start Scheduler Runtime: {e}")
+    else:
+        logger.info("⏭️ Periodic jobs run in the scheduler worker (SCHEDULER_MODE=worker)")
 
-        # Run in background task
-        asyncio.create_task(accountability_scheduler.start())
-        logger.info("✅ Accountability Scheduler started (hourly)")
-    except Exception as e:
-        logger.warning(f"⚠️ Failed to start Accountability Scheduler: {e}")
+    # 📦 Backfill Workers - chunks queued via /api/backfill run in the backfill worker pool
+    # (python -m backend.data.backfill_worker, BACKFILL_WORKER_MODE=external).
+    # Default (embedded): one worker thread per source in this process so the queue never stalls
+    backfill_workers = None
+    if os.getenv("BACKFILL_WORKER_MODE", "embedded").lower() == "embedded":
+        try:
+            from backend.data.backfill_queue import get_backfill_queue
+            from backend.data.backfill_worker import EmbeddedBackfillWorkers
+            backfill_workers = EmbeddedBackfillWorkers(get_backfill_queue())
+            backfill_workers.start()
+            logger.info(f"✅ Backfill workers started in-process ({len(backfill_workers.workers)} sources)")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to start Backfill workers: {e}")
+    else:
+        logger.info("⏭️ Backfill chunks run in the backfill worker pool (BACKFILL_WORKER_MODE=external)")
 
     # 🆕 Initialize Monitoring Components (Circuit Breaker & Kill Switch)
     try:
@@ -370,17 +348,6 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to initialize monitoring components: {e}")
 
-    # 🆕 Start News Poller (5m Interval)
-    # Set DISABLE_EMBEDDED_NEWS_POLLER=1 to disable (when running standalone crawler)
-    if os.environ.get("DISABLE_EMBEDDED_NEWS_POLLER", "").lower() not in ("1", "true", "yes"):
-        try:
-            from backend.services.news_poller import NewsPoller
-            news_poller = NewsPoller()
-            asyncio.create_task(news_poller.start())
-            logger.info("✅ News Poller started (5m interval - Pre-filtered AI Analysis)")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to start News Poller: {e}")
-            
     # 🆕 Initialize Event Subscriber (Order -> WebSocket bridge)
     try:
         from backend.events import event_bus
@@ -391,22 +358,39 @@ async def lifespan(app: FastAPI):
         logger.info("✅ Event Subscriber initialized (Order -> WebSocket bridge)")
     except Exception as e:
         logger.warning(f"⚠️ Failed to initialize Event Subscriber: {e}")
-    else:
-        logger.info("⏭️ Embedded News Poller disabled (DISABLE_EMBEDDED_NEWS_POLLER=1)")
 
-    # 👻 Start Shadow Trading Agent
+    # 📸 Start Market Snapshot background refresh (War Room / Stop-Loss / Paper Trading)
+    snapshot_service = None
+    try:
+        from backend.market_data.snapshot_service import get_market_snapshot_service
+        snapshot_service = get_market_snapshot_service()
+        snapshot_service.start()
+        logger.info(f"✅ Market Snapshot Service started ({len(snapshot_service.watchlist)} watchlist symbols)")
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to start Market Snapshot Service: {e}")
+
+    # 📡 Start Realtime Price Bus (PRICE_BUS_SOURCE=poll|kis|off)
+    price_bus = None
     try:
-        from backend.ai.trading.shadow_trader import ShadowTradingAgent
-        shadow_trader = ShadowTradingAgent()
-        asyncio.create_task(shadow_trader.start())
-        logger.info("✅ Shadow Trading Agent started (Monitoring Signals)")
+        from backend.market_data.price_bus import start_price_bus_from_env
+        price_bus = start_price_bus_from_env()
+        if price_bus:
+            logger.info(f"✅ Realtime Price Bus started (source={price_bus.source.name})")
     except Exception as e:
-        logger.warning(f"⚠️ Failed to start Shadow Trading Agent: {e}")
+        logger.warning(f"⚠️ Failed to start Realtime Price Bus: {e}")
 
     yield
 
     # Shutdown sequence
     logger.info("Shutting down AI Trading System...")
+    if scheduler_runtime:
+        scheduler_runtime.shutdown()
+    if backfill_workers:
+        await backfill_workers.stop()
+    if snapshot_service:
+        await snapshot_service.stop()
+    if price_bus:
+        await price_bus.stop()
     if health_monitor:
         health_monitor.stop()
     if metrics_collector:
@@ -6,6 +6,7 @@ Real-time and historical market data fetching
 Components:
 - price_fetcher: Yahoo Finance + Alpha Vantage integration
 - price_scheduler: Periodic portfolio price updates
+- ohlcv_builder: Multi-timeframe OHLCV (stock_prices first, resampled, session cache)
 """
 
 from .price_fetcher import (
@@ -13,16 +14,29 @@ from .price_fetcher import (
     get_price_fetcher,
     get_current_price,
     get_multiple_prices,
+    get_prices_async,
     get_price_history
 )
 
 from .price_scheduler import PriceUpdateScheduler
+from .ohlcv_builder import MultiTimeframeBuilder, get_ohlcv_builder
+from .snapshot_service import MarketSnapshotService, get_market_snapshot_service
+from .price_bus import PriceBus, Quote, ReplayQuoteSource, get_price_bus
 
 __all__ = [
     'PriceFetcher',
     'get_price_fetcher',
     'get_current_price',
     'get_multiple_prices',
+    'get_prices_async',
     'get_price_history',
-    'PriceUpdateScheduler'
+    'PriceUpdateScheduler',
+    'MultiTimeframeBuilder',
+    'get_ohlcv_builder',
+    'MarketSnapshotService',
+    'get_market_snapshot_service',
+    'PriceBus',
+    'Quote',
+    'ReplayQuoteSource',
+    'get_price_bus'
 ]
@@ -0,0 +1,524 @@
+"""
+Multi-Timeframe OHLCV Builder
+
+종목당 일봉/시간봉 시계열을 한 번만 확보하고 나머지 타임프레임은 로컬에서 만듭니다.
+
+Data flow:
+1. 일봉: stock_prices 하이퍼테이블 (워치리스트 전체를 쿼리 1회로 조회)
+2. 시간봉: yfinance 60d/1h (워치리스트 전체를 다운로드 1회로 조회)
+   - DB에 아직 없는 최근 거래일 일봉은 시간봉을 집계해 보충
+   - DB에 데이터가 없는 종목(cold)만 일봉을 네트워크로 다운로드 (배치 1회)
+     → 1W/1M 요약과 MA200 이 약 60거래일 시간봉 집계로 잘리지 않음
+3. 1W / 1M / 4H: 일봉·시간봉 리샘플링
+4. 거래 세션(미국 동부 날짜) 단위 캐시, 장중 시간봉은 intraday_ttl 마다 갱신
+
+DB에 있는 종목은 세션당 시세 네트워크 요청이 시간봉 1회뿐이고, cold 종목은 일봉 배치
+다운로드 1회가 더해집니다. 프로필(get_profile → ticker.info)은 별도로 세션당 1회 조회됩니다.
+
+Usage:
+    from backend.market_data.ohlcv_builder import get_ohlcv_builder
+
+    builder = get_ohlcv_builder()
+    frames = builder.get_frames("NVDA")            # {'1d','1w','1m','1h','4h'}
+    summary = builder.summarize_watchlist(["NVDA", "AAPL", "MSFT"], "1d")
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pytz
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EST = pytz.timezone("America/New_York")
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+OHLCV_AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+# 타임프레임별 요약 구간 (기존 yfinance 개별 다운로드 기간과 동일)
+TIMEFRAME_LOOKBACK = {
+    "1d": pd.DateOffset(years=1),
+    "1w": pd.DateOffset(years=2),
+    "1m": pd.DateOffset(years=5),
+}
+
+DailyLoader = Callable[[List[str], date], Dict[str, pd.DataFrame]]
+IntradayLoader = Callable[[List[str]], Dict[str, pd.DataFrame]]
+
+
+def _session_key(now: Optional[datetime] = None) -> date:
+    """거래 세션 키 (미국 동부 날짜)"""
+    return (now or datetime.now(EST)).astimezone(EST).date()
+
+
+def _is_market_hours(now: Optional[datetime] = None) -> bool:
+    """정규장 시간 여부 (09:30 ~ 16:00 ET, 평일)"""
+    now = (now or datetime.now(EST)).astimezone(EST)
+    if now.weekday() >= 5:
+        return False
+    minutes = now.hour * 60 + now.minute
+    return 9 * 60 + 30 <= minutes < 16 * 60
+
+
+def _normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """컬럼을 Open/High/Low/Close/Volume 으로 맞추고 시간순 정렬"""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    df = df.rename(columns={c: c.capitalize() for c in df.columns if isinstance(c, str)})
+    df = df[[c for c in OHLCV_COLUMNS if c in df.columns]].astype(float)
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    return df.dropna(subset=["Close"])
+
+
+def _strip_tz(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    if getattr(index, "tz", None) is not None:
+        return index.tz_convert(EST).tz_localize(None)
+    return index
+
+
+def resample_ohlcv(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """OHLCV 리샘플링 (빈 구간 제거)"""
+    if df.empty:
+        return df
+    return df.resample(rule).agg(OHLCV_AGG).dropna(subset=["Close"])
+
+
+def daily_from_intraday(intraday: pd.DataFrame) -> pd.DataFrame:
+    """시간봉 → 일봉 (거래소 현지 날짜 기준)"""
+    if intraday.empty:
+        return intraday
+    local = intraday.copy()
+    local.index = _strip_tz(local.index).normalize()
+    return local.groupby(level=0).agg(OHLCV_AGG)
+
+
+# ============================================================================
+# Vectorized indicators (wide frame: index=time, columns=symbol)
+# ============================================================================
+
+def compute_indicators(close: pd.DataFrame) -> pd.DataFrame:
+    """
+    워치리스트 전체 지표를 한 번에 계산 (종목별 루프 없음)
+
+    Args:
+        close: 종가 wide DataFrame (index=시간, columns=종목)
+
+    Returns:
+        종목별 최신 지표 DataFrame
+        columns: current_price, change_pct, rsi, macd, macd_signal,
+                 sma_20, sma_50, ma_200, volatility, trend
+    """
+    close = close.sort_index()
+    counts = close.notna().sum()
+
+    def latest(frame: pd.DataFrame) -> pd.Series:
+        # 종목별 마지막 관측치 기준 (워치리스트 종목마다 마지막 봉 날짜가 다를 수 있음)
+        return frame.ffill().iloc[-1]
+
+    delta = close.diff()
+    gain = delta.clip(lower=0).rolling(14).mean()
+    loss = (-delta.clip(upper=0)).rolling(14).mean()
+    rsi = 100 - 100 / (1 + gain / loss)
+
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+
+    last = latest(close)
+    prev = close.apply(lambda col: col.dropna().iloc[-2] if col.count() > 1 else col.dropna().iloc[-1])
+
+    summary = pd.DataFrame({
+        "current_price": last,
+        "change_pct": ((last - prev) / prev.replace(0, np.nan) * 100).fillna(0.0),
+        "rsi": latest(rsi).fillna(50.0),
+        "macd": latest(macd),
+        "macd_signal": latest(signal),
+        "sma_20": latest(close.rolling(20).mean()).where(counts >= 20, 0.0),
+        "sma_50": latest(close.rolling(50).mean()).where(counts >= 50, 0.0),
+        "ma_200": latest(close.rolling(200).mean()).where(counts >= 200, last),
+        "volatility": (close.pct_change(fill_method=None).tail(60).std() * 100).fillna(0.0),
+    })
+    summary["trend"] = np.select(
+        [summary["sma_20"] > summary["sma_50"], summary["sma_20"] < summary["sma_50"]],
+        ["uptrend", "downtrend"],
+        default="neutral",
+    )
+    return summary
+
+
+def summarize_ohlcv(df: pd.DataFrame) -> Dict:
+    """단일 시계열 요약 (EnhancedDataProvider 멀티 타임프레임 형식)"""
+    if df is None or len(df) == 0:
+        return {}
+    row = compute_indicators(df[["Close"]].rename(columns={"Close": "value"})).iloc[0]
+    latest = df.iloc[-1]
+    return {
+        "current_price": float(latest["Close"]),
+        "change_pct": float(row["change_pct"]),
+        "volume": int(latest["Volume"]),
+        "trend": row["trend"],
+        "rsi": float(row["rsi"]),
+        "last_date": str(latest.name),
+    }
+
+
+# ============================================================================
+# Loaders
+# ============================================================================
+
+def load_daily_from_db(symbols: List[str], start: date) -> Dict[str, pd.DataFrame]:
+    """stock_prices 하이퍼테이블에서 워치리스트 일봉 조회 (쿼리 1회)"""
+    from sqlalchemy import bindparam, text
+    from backend.database.repository import get_sync_session
+
+    query = text(
+        "SELECT ticker, time, open, high, low, close, volume "
+        "FROM stock_prices WHERE ticker IN :tickers AND time >= :start "
+        "ORDER BY ticker, time"
+    ).bindparams(bindparam("tickers", expanding=True))
+
+    session = get_sync_session()
+    try:
+        rows = session.execute(query, {"tickers": symbols, "start": start}).fetchall()
+    finally:
+        session.close()
+
+    if not rows:
+        return {}
+
+    df = pd.DataFrame(rows, columns=["ticker", "time", "Open", "High", "Low", "Close", "Volume"])
+    # 일봉은 날짜 단위로 저장되므로 시간대 변환 없이 날짜만 사용
+    df["time"] = pd.to_datetime(df["time"], utc=True).dt.tz_localize(None).dt.normalize()
+    return {
+        ticker: _normalize_ohlcv(group.set_index("time").drop(columns="ticker"))
+        for ticker, group in df.groupby("ticker")
+    }
+
+
+def _split_download(data: pd.DataFrame, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """yf.download 결과(MultiIndex/단일)를 종목별로 분리"""
+    frames: Dict[str, pd.DataFrame] = {}
+    if data is None or data.empty:
+        return frames
+    if isinstance(data.columns, pd.MultiIndex):
+        level = 0 if set(symbols) & set(data.columns.get_level_values(0)) else 1
+        for symbol in symbols:
+            if symbol in data.columns.get_level_values(level):
+                frame = _normalize_ohlcv(data.xs(symbol, axis=1, level=level))
+                if not frame.empty:
+                    frames[symbol] = frame
+    elif len(symbols) == 1:
+        frames[symbols[0]] = _normalize_ohlcv(data)
+    return frames
+
+
+def download_daily(symbols: List[str], start: date) -> Dict[str, pd.DataFrame]:
+    """DB에 없는 종목 일봉 배치 다운로드"""
+    if not YFINANCE_AVAILABLE or not symbols:
+        return {}
+    data = yf.download(
+        symbols, start=start.isoformat(), interval="1d",
+        group_by="ticker", auto_adjust=True, threads=True, progress=False,
+    )
+    frames = _split_download(data, symbols)
+    for frame in frames.values():
+        frame.index = _strip_tz(frame.index)
+    return frames
+
+
+def download_intraday(symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """워치리스트 60d/1h 시간봉 배치 다운로드"""
+    if not YFINANCE_AVAILABLE or not symbols:
+        return {}
+    data = yf.download(
+        symbols, period="60d", interval="1h",
+        group_by="ticker", auto_adjust=True, threads=True, progress=False,
+    )
+    return _split_download(data, symbols)
+
+
+# ============================================================================
+# Builder
+# ============================================================================
+
+@dataclass
+class _SessionFrames:
+    """세션 캐시 엔트리"""
+    session: date
+    daily: pd.DataFrame
+    intraday: pd.DataFrame
+    intraday_fetched_at: float
+    derived: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
+class MultiTimeframeBuilder:
+    """
+    멀티 타임프레임 OHLCV 빌더
+
+    종목당 일봉(DB 우선)과 시간봉을 한 번만 가져오고 1W/1M/4H는 리샘플링합니다.
+    파생 프레임은 거래 세션 단위로 캐시됩니다.
+    """
+
+    DAILY_HISTORY_DAYS = 5 * 365 + 31  # 월봉 5년 요약용
+
+    def __init__(
+        self,
+        daily_loader: Optional[DailyLoader] = None,
+        intraday_loader: Optional[IntradayLoader] = None,
+        daily_downloader: Optional[DailyLoader] = download_daily,
+        intraday_ttl: float = 300.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(EST)
+    ):
+        """
+        초기화
+
+        Args:
+            daily_loader: 일봉 DB 로더 (기본: stock_prices)
+            intraday_loader: 시간봉 로더 (기본: yfinance 60d/1h)
+            daily_downloader: DB 미보유 종목 일봉 로더 (기본: yfinance 배치 다운로드,
+                None 이면 추가 요청 없이 시간봉 집계 일봉만 사용 → 약 60거래일)
+            intraday_ttl: 장중 시간봉 재사용 시간 (초)
+            clock: 현재 시각 (테스트용)
+        """
+        self.daily_loader = daily_loader or load_daily_from_db
+        self.intraday_loader = intraday_loader or download_intraday
+        self.daily_downloader = daily_downloader
+        self.intraday_ttl = intraday_ttl
+        self.clock = clock
+
+        self._cache: Dict[str, _SessionFrames] = {}
+        self._profiles: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+
+        self.stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "db_symbols": 0,
+            "network_daily_symbols": 0,
+            "intraday_daily_symbols": 0,
+            "network_intraday_requests": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _is_fresh(self, entry: Optional[_SessionFrames], session: date, now: datetime) -> bool:
+        if entry is None or entry.session != session:
+            return False
+        if _is_market_hours(now) and time.monotonic() - entry.intraday_fetched_at > self.intraday_ttl:
+            return False
+        return True
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """캐시 무효화 (symbol 없으면 전체)"""
+        with self._lock:
+            if symbol is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(symbol.upper(), None)
+
+    # ------------------------------------------------------------------
+    # Fetch
+    # ------------------------------------------------------------------
+
+    def _load(self, symbols: List[str], session: date) -> Dict[str, _SessionFrames]:
+        """캐시 미스 종목 일괄 로드 (DB 1회 + 시간봉 다운로드 1회 + cold 종목 일봉 다운로드 1회)"""
+        start = session - timedelta(days=self.DAILY_HISTORY_DAYS)
+
+        try:
+            daily = self.daily_loader(symbols, start)
+        except Exception as e:
+            logger.warning(f"[OHLCVBuilder] stock_prices query failed, falling back to network: {e}")
+            daily = {}
+        self.stats["db_symbols"] += len(daily)
+
+        self.stats["network_intraday_requests"] += 1
+        try:
+            intraday = self.intraday_loader(symbols)
+        except Exception as e:
+            logger.warning(f"[OHLCVBuilder] intraday download failed: {e}")
+            intraday = {}
+
+        # DB에 없는 종목만 일봉 다운로드 (daily_downloader=None 이면 시간봉 집계 일봉만 사용)
+        cold = [s for s in symbols if s not in daily or daily[s].empty]
+        if cold and self.daily_downloader is None:
+            self.stats["intraday_daily_symbols"] += len(cold)
+        elif cold:
+            self.stats["network_daily_symbols"] += len(cold)
+            try:
+                daily.update(self.daily_downloader(cold, start))
+            except Exception as e:
+                logger.warning(f"[OHLCVBuilder] daily download failed for {cold}: {e}")
+
+        fetched_at = time.monotonic()
+        entries = {}
+        for symbol in symbols:
+            hourly = intraday.get(symbol, pd.DataFrame(columns=OHLCV_COLUMNS))
+            history = daily.get(symbol, pd.DataFrame(columns=OHLCV_COLUMNS))
+
+            # DB 마지막 날짜 이후 거래일은 시간봉을 집계해 보충 (당일 진행 중인 봉 포함)
+            recent = daily_from_intraday(hourly)
+            if not history.empty and not recent.empty:
+                recent = recent[recent.index > history.index.max()]
+            combined = pd.concat([history, recent]) if not recent.empty else history
+
+            entries[symbol] = _SessionFrames(
+                session=session,
+                daily=combined.sort_index(),
+                intraday=hourly,
+                intraday_fetched_at=fetched_at,
+            )
+        return entries
+
+    def prefetch(self, symbols: Iterable[str]) -> Dict[str, _SessionFrames]:
+        """워치리스트 캐시 채우기 (미스 종목만 배치 로드)"""
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        now = self.clock()
+        session = _session_key(now)
+
+        with self._fetch_lock:
+            with self._lock:
+                missing = [s for s in symbols if not self._is_fresh(self._cache.get(s), session, now)]
+            self.stats["cache_hits"] += len(symbols) - len(missing)
+            self.stats["cache_misses"] += len(missing)
+
+            if missing:
+                loaded = self._load(missing, session)
+                with self._lock:
+                    self._cache.update(loaded)
+
+        with self._lock:
+            return {s: self._cache[s] for s in symbols if s in self._cache}
+
+    # ------------------------------------------------------------------
+    # Frames
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _derive(entry: _SessionFrames, timeframe: str) -> pd.DataFrame:
+        if timeframe not in entry.derived:
+            if timeframe == "1d":
+                frame = entry.daily
+            elif timeframe == "1w":
+                frame = resample_ohlcv(entry.daily, "W-FRI")
+            elif timeframe == "1m":
+                frame = resample_ohlcv(entry.daily, "MS")
+            elif timeframe == "1h":
+                frame = entry.intraday
+            elif timeframe == "4h":
+                frame = resample_ohlcv(entry.intraday, "4h")
+            else:
+                raise ValueError(f"Unknown timeframe: {timeframe}")
+            entry.derived[timeframe] = frame
+        return entry.derived[timeframe]
+
+    def get_frames(self, symbol: str, timeframes: Iterable[str] = ("1d", "1w", "1m", "1h", "4h")) -> Dict[str, pd.DataFrame]:
+        """
+        종목 타임프레임별 OHLCV
+
+        Returns:
+            {'1d': DataFrame, '1w': ..., '1m': ..., '1h': ..., '4h': ...}
+        """
+        entry = self.prefetch([symbol]).get(symbol.upper())
+        if entry is None:
+            return {}
+        return {tf: self._derive(entry, tf) for tf in timeframes}
+
+    def get_multi_timeframe_data(self, symbol: str) -> Dict[str, Dict]:
+        """EnhancedDataProvider.get_multi_timeframe_data 형식의 요약 (1d/1w/1m/4h)"""
+        frames = self.get_frames(symbol, ("1d", "1w", "1m", "4h"))
+        result = {}
+        for timeframe, frame in frames.items():
+            if frame.empty:
+                continue
+            lookback = TIMEFRAME_LOOKBACK.get(timeframe)
+            if lookback is not None:
+                frame = frame[frame.index >= frame.index.max() - lookback]
+            summary = summarize_ohlcv(frame)
+            if summary:
+                result[timeframe] = summary
+        return result
+
+    def summarize_watchlist(self, symbols: Iterable[str], timeframe: str = "1d") -> pd.DataFrame:
+        """
+        워치리스트 지표 요약 (벡터화)
+
+        Returns:
+            index=종목, columns=compute_indicators 결과 + volume
+        """
+        entries = self.prefetch(symbols)
+        frames = {s: self._derive(e, timeframe) for s, e in entries.items()}
+        frames = {s: f for s, f in frames.items() if not f.empty}
+        if not frames:
+            return pd.DataFrame()
+
+        close = pd.DataFrame({s: f["Close"] for s, f in frames.items()})
+        summary = compute_indicators(close)
+        summary["volume"] = pd.Series({s: int(f["Volume"].iloc[-1]) for s, f in frames.items()})
+        return summary
+
+    def get_profile(self, symbol: str) -> Dict:
+        """
+        종목 프로필 (marketCap/sector/industry) - 세션당 1회만 조회
+
+        52주 고가/저가는 일봉에서 계산하므로 ticker.info 재조회가 필요 없습니다.
+        """
+        symbol = symbol.upper()
+        session = _session_key(self.clock())
+        with self._lock:
+            cached = self._profiles.get(symbol)
+        if cached and cached[0] == session:
+            return cached[1]
+
+        profile = {}
+        if YFINANCE_AVAILABLE:
+            try:
+                info = yf.Ticker(symbol).info or {}
+                profile = {
+                    "market_cap": info.get("marketCap", 0),
+                    "sector": info.get("sector", "Unknown"),
+                    "industry": info.get("industry", "Unknown"),
+                }
+            except Exception as e:
+                logger.warning(f"[OHLCVBuilder] profile lookup failed for {symbol}: {e}")
+
+        with self._lock:
+            self._profiles[symbol] = (session, profile)
+        return profile
+
+    def get_stats(self) -> Dict:
+        """캐시/로드 통계"""
+        total = self.stats["cache_hits"] + self.stats["cache_misses"]
+        return {
+            **self.stats,
+            "cached_symbols": len(self._cache),
+            "hit_rate": self.stats["cache_hits"] / total if total else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_builder_instance: Optional[MultiTimeframeBuilder] = None
+
+
+def get_ohlcv_builder() -> MultiTimeframeBuilder:
+    """MultiTimeframeBuilder 싱글톤 반환"""
+    global _builder_instance
+    if _builder_instance is None:
+        _builder_instance = MultiTimeframeBuilder()
+    return _builder_instance
@@ -0,0 +1,700 @@
+"""
+Realtime Price Bus
+
+스트리밍 시세를 받아 마지막 체결가 캐시(last-value cache)를 유지하고
+가격 임계값 돌파 이벤트를 구독자에게 즉시 전달합니다.
+
+구조:
+  QuoteSource (KIS WebSocket / 배치 폴링 / 로컬 리플레이)
+      → PriceBus.publish(quote)
+          - last-value cache 갱신 (프로세스 내 공유)
+          - 틱 리스너 (대시보드 스트림, 포트폴리오 평가)
+          - 임계값 감시 (종목별 정렬 리스트 + 이진 탐색 → 돌파한 감시만 발화)
+
+Stop-Loss 모니터, Shadow Trader, 대시보드가 같은 버스를 구독하므로
+틱마다 종목별 가격 조회가 발생하지 않습니다.
+
+Usage:
+    from backend.market_data.price_bus import get_price_bus, ReplayQuoteSource
+
+    bus = get_price_bus()
+    bus.add_threshold("NVDA", 450.0, "below", on_stop, key="stop_loss:NVDA")
+    bus.start(ReplayQuoteSource(quotes))
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import inspect
+import itertools
+import logging
+import os
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+BELOW = "below"
+ABOVE = "above"
+
+
+@dataclass
+class Quote:
+    """실시간 체결가"""
+    symbol: str
+    price: float
+    timestamp: float = field(default_factory=time.time)  # 체결 시각 (epoch)
+    volume: int = 0
+    source: str = ""
+    received_at: float = field(default_factory=time.monotonic)
+    heartbeat: bool = False  # 가격 변동 없음: 캐시 시각만 갱신 (리스너/임계값 미호출)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "price": self.price,
+            "timestamp": self.timestamp,
+            "volume": self.volume,
+            "source": self.source,
+        }
+
+
+@dataclass(eq=False)
+class ThresholdWatch:
+    """가격 임계값 감시"""
+    symbol: str
+    level: float
+    direction: str  # below: price <= level / above: price >= level
+    callback: Callable
+    key: Optional[str] = None
+    once: bool = True
+    armed: bool = True
+    seq: int = 0
+
+
+@dataclass
+class ThresholdEvent:
+    """임계값 돌파 이벤트"""
+    watch: ThresholdWatch
+    quote: Quote
+
+    @property
+    def symbol(self) -> str:
+        return self.quote.symbol
+
+    @property
+    def price(self) -> float:
+        return self.quote.price
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "price": self.price,
+            "level": self.watch.level,
+            "direction": self.watch.direction,
+            "key": self.watch.key,
+            "timestamp": self.quote.timestamp,
+        }
+
+
+class _SymbolWatches:
+    """종목별 감시 (방향별 level 정렬 리스트)"""
+
+    def __init__(self):
+        # below: level 오름차순, price <= level 인 구간 = levels[bisect_left(p):]
+        # above: level 오름차순, price >= level 인 구간 = levels[:bisect_right(p)]
+        self.levels: Dict[str, List[Tuple[float, int]]] = {BELOW: [], ABOVE: []}
+        self.watches: Dict[str, List[ThresholdWatch]] = {BELOW: [], ABOVE: []}
+        self.disarmed: List[ThresholdWatch] = []
+
+    def add(self, watch: ThresholdWatch) -> None:
+        entry = (watch.level, watch.seq)
+        levels = self.levels[watch.direction]
+        i = bisect_left(levels, entry)
+        levels.insert(i, entry)
+        self.watches[watch.direction].insert(i, watch)
+
+    def remove(self, watch: ThresholdWatch) -> bool:
+        if watch in self.disarmed:
+            self.disarmed.remove(watch)
+            return True
+        levels = self.levels[watch.direction]
+        i = bisect_left(levels, (watch.level, watch.seq))
+        if i < len(levels) and self.watches[watch.direction][i] is watch:
+            del levels[i]
+            del self.watches[watch.direction][i]
+            return True
+        return False
+
+    def crossed(self, price: float) -> List[ThresholdWatch]:
+        """돌파한 감시를 꺼내서 반환 (재무장 감시는 disarmed로 이동)"""
+        fired: List[ThresholdWatch] = []
+
+        below_levels = self.levels[BELOW]
+        i = bisect_left(below_levels, (price, -1))
+        if i < len(below_levels):
+            fired.extend(self.watches[BELOW][i:])
+            del below_levels[i:]
+            del self.watches[BELOW][i:]
+
+        above_levels = self.levels[ABOVE]
+        j = bisect_right(above_levels, (price, float("inf")))
+        if j:
+            fired.extend(self.watches[ABOVE][:j])
+            del above_levels[:j]
+            del self.watches[ABOVE][:j]
+
+        for watch in fired:
+            watch.armed = False
+            if not watch.once:
+                self.disarmed.append(watch)
+        return fired
+
+    def rearm(self, price: float) -> None:
+        """가격이 임계값 반대편으로 돌아온 반복 감시 재무장"""
+        if not self.disarmed:
+            return
+        still = []
+        for watch in self.disarmed:
+            back = price > watch.level if watch.direction == BELOW else price < watch.level
+            if back:
+                watch.armed = True
+                self.add(watch)
+            else:
+                still.append(watch)
+        self.disarmed = still
+
+    def __len__(self) -> int:
+        return len(self.watches[BELOW]) + len(self.watches[ABOVE]) + len(self.disarmed)
+
+
+# ============================================================================
+# Quote Sources
+# ============================================================================
+
+class QuoteSource:
+    """
+    시세 소스 인터페이스
+
+    stream(symbols)은 버스의 관심 종목 집합(라이브 참조)을 받아 Quote를 생성합니다.
+    """
+
+    name = "base"
+
+    def stream(self, symbols: Set[str]) -> AsyncIterator[Quote]:
+        raise NotImplementedError
+
+
+class ReplayQuoteSource(QuoteSource):
+    """
+    로컬 리플레이 소스 (테스트 / 백테스트 / 장 마감 후 점검)
+
+    realtime=True면 체결 시각 간격을 speed 배속으로 재현합니다.
+    """
+
+    name = "replay"
+
+    def __init__(self, quotes: Iterable[Any], realtime: bool = False, speed: float = 1.0):
+        self.quotes = [q if isinstance(q, Quote) else Quote(*q) for q in quotes]
+        self.realtime = realtime
+        self.speed = speed
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, Any], column: str = "Close", **kwargs) -> "ReplayQuoteSource":
+        """종목별 OHLCV DataFrame → 시각순으로 섞인 Quote 리플레이"""
+        quotes = [
+            Quote(symbol=symbol, price=float(price), timestamp=ts.timestamp(), source=cls.name)
+            for symbol, frame in frames.items()
+            for ts, price in frame[column].dropna().items()
+        ]
+        quotes.sort(key=lambda q: q.timestamp)
+        return cls(quotes, **kwargs)
+
+    async def stream(self, symbols: Set[str]) -> AsyncIterator[Quote]:
+        previous_ts = None
+        for quote in self.quotes:
+            if symbols and quote.symbol not in symbols:
+                continue
+            if self.realtime and previous_ts is not None:
+                await asyncio.sleep(max(0.0, (quote.timestamp - previous_ts) / self.speed))
+            previous_ts = quote.timestamp
+            yield Quote(
+                symbol=quote.symbol,
+                price=quote.price,
+                timestamp=quote.timestamp,
+                volume=quote.volume,
+                source=quote.source or self.name,
+            )
+            await asyncio.sleep(0)
+
+
+class PollingQuoteSource(QuoteSource):
+    """
+    배치 폴링 소스 (스트리밍이 없는 해외 종목용)
+
+    관심 종목 전체를 주기당 1회 일괄 조회하고 가격이 바뀐 종목만 Quote로 내보냅니다.
+    가격이 그대로인 종목은 heartbeat Quote로 캐시 시각만 갱신합니다
+    (횡보 종목이 last(max_age)에서 만료되지 않도록).
+    """
+
+    name = "poll"
+
+    def __init__(self, price_fetcher=None, interval_seconds: float = 5.0):
+        self._price_fetcher = price_fetcher
+        self.interval_seconds = interval_seconds
+
+    @property
+    def price_fetcher(self):
+        if self._price_fetcher is None:
+            from backend.market_data.price_fetcher import get_price_fetcher
+            self._price_fetcher = get_price_fetcher()
+        return self._price_fetcher
+
+    async def stream(self, symbols: Set[str]) -> AsyncIterator[Quote]:
+        last: Dict[str, float] = {}
+        while True:
+            if symbols:
+                try:
+                    prices = await self.price_fetcher.get_prices_async(
+                        sorted(symbols), max_age=self.interval_seconds
+                    )
+                except Exception as e:
+                    logger.warning(f"[PriceBus] poll failed: {e}")
+                    prices = {}
+                for symbol, price in prices.items():
+                    if not price:
+                        continue
+                    unchanged = last.get(symbol) == price
+                    last[symbol] = price
+                    yield Quote(symbol=symbol, price=float(price), source=self.name, heartbeat=unchanged)
+            await asyncio.sleep(self.interval_seconds)
+
+
+class KISQuoteSource(QuoteSource):
+    """
+    한국투자증권 WebSocket 체결가 소스 (국내 종목)
+
+    관심 종목이 늘어나면 다음 메시지 수신 시 추가 구독합니다.
+    """
+
+    name = "kis"
+
+    def __init__(self, is_paper: bool = True, ws_factory: Optional[Callable] = None, queue_size: int = 10000):
+        self.is_paper = is_paper
+        self.ws_factory = ws_factory
+        self.queue_size = queue_size
+
+    async def stream(self, symbols: Set[str]) -> AsyncIterator[Quote]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        def on_message(data: Dict):
+            if data.get("type") != "price" or not data.get("price"):
+                return
+            quote = Quote(symbol=data["ticker"], price=float(data["price"]),
+                          volume=int(data.get("volume", 0)), source=self.name)
+            if queue.full():
+                queue.get_nowait()  # 느린 소비자: 가장 오래된 틱 버림
+            queue.put_nowait(quote)
+
+        if self.ws_factory is not None:
+            ws = self.ws_factory(on_message=on_message)
+        else:
+            from backend.trading.kis_websocket import KISWebSocket
+            ws = KISWebSocket(is_paper=self.is_paper, on_message=on_message)
+
+        await ws.connect()
+        subscribed: Set[str] = set()
+        listen_task = asyncio.create_task(ws.listen())
+        try:
+            while True:
+                for symbol in sorted(symbols - subscribed):
+                    await ws.subscribe_price(symbol)
+                    subscribed.add(symbol)
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    if listen_task.done():
+                        break
+        finally:
+            listen_task.cancel()
+            await ws.disconnect()
+
+
+# ============================================================================
+# Price Bus
+# ============================================================================
+
+class PriceBus:
+    """
+    실시간 가격 버스 (last-value cache + 임계값 이벤트)
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """
+        초기화
+
+        Args:
+            clock: 현재 시각 (epoch, 테스트용)
+        """
+        self.clock = clock
+        self._last: Dict[str, Quote] = {}
+        self._watches: Dict[str, _SymbolWatches] = {}
+        self._by_key: Dict[str, ThresholdWatch] = {}
+        self._listeners: Dict[int, Tuple[Callable, Optional[Set[str]]]] = {}
+        self._event_listeners: Dict[int, Tuple[Callable, Optional[Set[str]]]] = {}
+        self._tracked: Dict[str, int] = {}
+        self._symbols: Set[str] = set()
+        self._seq = itertools.count()
+        self._pending: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self.source: Optional[QuoteSource] = None
+
+        self.stats = {
+            "quotes": 0,
+            "heartbeats": 0,
+            "threshold_events": 0,
+            "listener_errors": 0,
+            "max_dispatch_ms": 0.0,
+            "source_restarts": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Last-value cache
+    # ------------------------------------------------------------------
+
+    def last(self, symbol: str, max_age: Optional[float] = None) -> Optional[Quote]:
+        """마지막 체결가 (max_age 초보다 오래되었으면 None)"""
+        quote = self._last.get(symbol)
+        if quote is None or (max_age is not None and self.clock() - quote.timestamp > max_age):
+            return None
+        return quote
+
+    def last_prices(self, symbols: Iterable[str], max_age: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """여러 종목 마지막 체결가"""
+        result = {}
+        for symbol in symbols:
+            quote = self.last(symbol, max_age)
+            result[symbol] = quote.price if quote else None
+        return result
+
+    # ------------------------------------------------------------------
+    # Interest set
+    # ------------------------------------------------------------------
+
+    @property
+    def symbols(self) -> Set[str]:
+        """스트리밍 관심 종목 (소스가 라이브로 참조)"""
+        return self._symbols
+
+    def track(self, symbols: Iterable[str]) -> None:
+        """관심 종목 추가 (참조 카운트)"""
+        for symbol in symbols:
+            self._tracked[symbol] = self._tracked.get(symbol, 0) + 1
+            self._symbols.add(symbol)
+
+    def untrack(self, symbols: Iterable[str]) -> None:
+        for symbol in symbols:
+            count = self._tracked.get(symbol, 0) - 1
+            if count > 0:
+                self._tracked[symbol] = count
+            else:
+                self._tracked.pop(symbol, None)
+                self._refresh_interest(symbol)
+
+    def _refresh_interest(self, symbol: str) -> None:
+        watches = self._watches.get(symbol)
+        listening = any(s is not None and symbol in s for _, s in self._listeners.values())
+        if symbol in self._tracked or (watches and len(watches)) or listening:
+            self._symbols.add(symbol)
+        else:
+            self._symbols.discard(symbol)
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def on_quote(self, callback: Callable, symbols: Optional[Iterable[str]] = None) -> int:
+        """
+        틱 리스너 등록 (callback(quote), 동기/비동기 모두 가능)
+
+        Returns:
+            리스너 토큰 (remove_listener 용)
+        """
+        token = next(self._seq)
+        symbol_set = set(symbols) if symbols is not None else None
+        self._listeners[token] = (callback, symbol_set)
+        if symbol_set:
+            self._symbols.update(symbol_set)
+        return token
+
+    def on_threshold(self, callback: Callable, symbols: Optional[Iterable[str]] = None) -> int:
+        """
+        모든 임계값 이벤트 관찰자 등록 (대시보드 알림 등, callback(ThresholdEvent))
+
+        Returns:
+            리스너 토큰 (remove_listener 용)
+        """
+        token = next(self._seq)
+        self._event_listeners[token] = (callback, set(symbols) if symbols is not None else None)
+        return token
+
+    def remove_listener(self, token: int) -> None:
+        self._event_listeners.pop(token, None)
+        _, symbol_set = self._listeners.pop(token, (None, None))
+        for symbol in symbol_set or ():
+            self._refresh_interest(symbol)
+
+    def add_threshold(
+        self,
+        symbol: str,
+        level: float,
+        direction: str,
+        callback: Callable,
+        key: Optional[str] = None,
+        once: bool = True,
+    ) -> ThresholdWatch:
+        """
+        임계값 감시 등록
+
+        Args:
+            symbol: 종목
+            level: 임계 가격
+            direction: below (price <= level) / above (price >= level)
+            callback: callback(ThresholdEvent), 동기/비동기 모두 가능
+            key: 고유 키 (같은 키가 있으면 교체)
+            once: True면 1회 발화 후 제거, False면 반대편 복귀 시 재무장
+        """
+        if direction not in (BELOW, ABOVE):
+            raise ValueError(f"direction must be '{BELOW}' or '{ABOVE}': {direction}")
+        if key is not None:
+            self.remove_threshold(key)
+
+        watch = ThresholdWatch(symbol=symbol, level=float(level), direction=direction,
+                               callback=callback, key=key, once=once, seq=next(self._seq))
+        self._watches.setdefault(symbol, _SymbolWatches()).add(watch)
+        if key is not None:
+            self._by_key[key] = watch
+        self._symbols.add(symbol)
+
+        # 이미 임계값을 넘은 상태면 다음 틱을 기다리지 않고 즉시 판정
+        quote = self._last.get(symbol)
+        if quote is not None:
+            self._check_thresholds(quote)
+        return watch
+
+    def remove_threshold(self, watch_or_key: Any) -> bool:
+        watch = self._by_key.pop(watch_or_key, None) if isinstance(watch_or_key, str) else watch_or_key
+        if watch is None:
+            return False
+        if watch.key is not None and self._by_key.get(watch.key) is watch:
+            del self._by_key[watch.key]
+        watches = self._watches.get(watch.symbol)
+        removed = bool(watches and watches.remove(watch))
+        self._refresh_interest(watch.symbol)
+        return removed
+
+    def get_threshold(self, key: str) -> Optional[ThresholdWatch]:
+        return self._by_key.get(key)
+
+    # ------------------------------------------------------------------
+    # Publish
+    # ------------------------------------------------------------------
+
+    def publish(self, quote: Quote) -> List[ThresholdEvent]:
+        """
+        틱 반영: last-value cache → 틱 리스너 → 임계값 판정
+
+        Returns:
+            발생한 임계값 이벤트
+        """
+        previous = self._last.get(quote.symbol)
+        if previous is not None and quote.timestamp < previous.timestamp:
+            return []  # 늦게 도착한 과거 틱은 무시
+        self._last[quote.symbol] = quote
+        if quote.heartbeat:
+            self.stats["heartbeats"] += 1
+            return []
+        self.stats["quotes"] += 1
+
+        for callback, symbol_set in list(self._listeners.values()):
+            if symbol_set is None or quote.symbol in symbol_set:
+                self._dispatch(callback, quote)
+
+        events = self._check_thresholds(quote)
+        dispatch_ms = (time.monotonic() - quote.received_at) * 1000
+        if dispatch_ms > self.stats["max_dispatch_ms"]:
+            self.stats["max_dispatch_ms"] = dispatch_ms
+        return events
+
+    def _check_thresholds(self, quote: Quote) -> List[ThresholdEvent]:
+        watches = self._watches.get(quote.symbol)
+        if not watches:
+            return []
+        watches.rearm(quote.price)
+        fired = watches.crossed(quote.price)
+
+        events = []
+        for watch in fired:
+            if watch.once and watch.key is not None and self._by_key.get(watch.key) is watch:
+                del self._by_key[watch.key]
+            event = ThresholdEvent(watch=watch, quote=quote)
+            events.append(event)
+            self._dispatch(watch.callback, event)
+            for callback, symbol_set in list(self._event_listeners.values()):
+                if symbol_set is None or quote.symbol in symbol_set:
+                    self._dispatch(callback, event)
+        if fired:
+            self.stats["threshold_events"] += len(fired)
+            self._refresh_interest(quote.symbol)
+        return events
+
+    def _dispatch(self, callback: Callable, payload: Any) -> None:
+        try:
+            result = callback(payload)
+        except Exception as e:
+            self.stats["listener_errors"] += 1
+            logger.error(f"[PriceBus] listener {getattr(callback, '__name__', callback)} failed: {e}")
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._pending.add(task)
+            task.add_done_callback(self._on_listener_done)
+
+    def _on_listener_done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["listener_errors"] += 1
+            logger.error(f"[PriceBus] async listener failed: {task.exception()}")
+
+    async def drain(self) -> None:
+        """대기 중인 비동기 리스너 완료 대기"""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Dashboard stream
+    # ------------------------------------------------------------------
+
+    async def stream(self, symbols: Optional[Iterable[str]] = None, maxsize: int = 1000) -> AsyncIterator[Dict]:
+        """
+        대시보드용 메시지 스트림 (틱 + 임계값 이벤트)
+
+        느린 소비자는 가장 오래된 메시지부터 버립니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        symbol_set = set(symbols) if symbols is not None else None
+
+        def push(message: Dict) -> None:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+        def on_tick(quote: Quote) -> None:
+            push({"type": "quote", **quote.to_dict()})
+
+        def on_event(event: ThresholdEvent) -> None:
+            push({"type": "threshold", **event.to_dict()})
+
+        token = self.on_quote(on_tick, symbol_set)
+        event_token = self.on_threshold(on_event, symbol_set)
+        try:
+            for symbol in symbol_set or ():
+                quote = self._last.get(symbol)
+                if quote is not None:
+                    on_tick(quote)
+            while True:
+                yield await queue.get()
+        finally:
+            self.remove_listener(token)
+            self.remove_listener(event_token)
+
+    # ------------------------------------------------------------------
+    # Source lifecycle
+    # ------------------------------------------------------------------
+
+    async def run(self, source: QuoteSource, restart_delay: float = 5.0, restart: bool = True) -> None:
+        """소스 소비 루프 (소스가 끊기면 restart_delay 후 재시작)"""
+        self.source = source
+        while True:
+            try:
+                async for quote in source.stream(self._symbols):
+                    self.publish(quote)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[PriceBus] source {source.name} failed: {e}")
+            if not restart:
+                return
+            self.stats["source_restarts"] += 1
+            await asyncio.sleep(restart_delay)
+
+    def start(self, source: QuoteSource, **kwargs) -> asyncio.Task:
+        """백그라운드 소비 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self.source = source
+            self._task = asyncio.get_running_loop().create_task(self.run(source, **kwargs))
+            logger.info(f"[PriceBus] started ({source.name}, {len(self._symbols)} symbols)")
+        return self._task
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "symbols": len(self._symbols),
+            "cached_quotes": len(self._last),
+            "thresholds": sum(len(w) for w in self._watches.values()),
+            "listeners": len(self._listeners) + len(self._event_listeners),
+            "source": self.source.name if self.source else None,
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
+# 싱글톤 인스턴스
+_price_bus: Optional[PriceBus] = None
+
+
+def get_price_bus() -> PriceBus:
+    """PriceBus 싱글톤 반환"""
+    global _price_bus
+    if _price_bus is None:
+        _price_bus = PriceBus()
+    return _price_bus
+
+
+def start_price_bus_from_env() -> Optional[PriceBus]:
+    """
+    PRICE_BUS_SOURCE (poll|kis|off, 기본 poll) 에 따라 프로세스의 PriceBus 시작
+
+    버스는 프로세스 내 캐시이므로 구독자가 있는 프로세스(API, 스케줄러 워커)가 각각 시작합니다.
+
+    Returns:
+        시작한 PriceBus (off 면 None)
+    """
+    source_name = os.getenv("PRICE_BUS_SOURCE", "poll").lower()
+    if source_name == "off":
+        return None
+    source = KISQuoteSource() if source_name == "kis" else PollingQuoteSource()
+    bus = get_price_bus()
+    bus.start(source)
+    return bus
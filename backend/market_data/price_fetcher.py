@@ -8,8 +8,8 @@ Supports:
 - Alpha Vantage (무료 500 calls/day)
 - IEX Cloud (무료 50k calls/month)
 
-Primary: Yahoo Finance (yfinance)
-Fallback: Alpha Vantage
+Primary: Yahoo Finance (yfinance, bulk download for ticker lists)
+Fallback: Alpha Vantage (hedged after a latency budget in the async API)
 
 Usage:
     from backend.market_data.price_fetcher import get_current_price, get_multiple_prices
@@ -19,18 +19,59 @@ Usage:
 
     # Multiple tickers
     prices = get_multiple_prices(["AAPL", "MSFT", "NVDA"])
+
+    # Async batch (shared cache, concurrent callers share one fetch)
+    prices = await get_prices_async(["AAPL", "MSFT", "NVDA"])
 """
 
+import asyncio
+import threading
+import time
 import yfinance as yf
+import pandas as pd
 import requests
 import os
-from typing import Dict, Optional, List
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, List
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SourceStats:
+    """Per-source request statistics"""
+    requests: int = 0
+    failures: int = 0
+    tickers_requested: int = 0
+    tickers_returned: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    def record(self, latency_ms: float, requested: int, returned: int, failed: bool):
+        self.requests += 1
+        self.tickers_requested += requested
+        self.tickers_returned += returned
+        if failed:
+            self.failures += 1
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "failure_rate": round(self.failures / self.requests, 4) if self.requests else 0.0,
+            "ticker_hit_rate": (
+                round(self.tickers_returned / self.tickers_requested, 4)
+                if self.tickers_requested else 0.0
+            ),
+            "avg_latency_ms": round(self.total_latency_ms / self.requests, 1) if self.requests else 0.0,
+            "max_latency_ms": round(self.max_latency_ms, 1),
+        }
+
+
 class PriceFetcher:
     """
     Price fetcher with multiple data sources
@@ -39,28 +80,81 @@ class PriceFetcher:
     1. Yahoo Finance (primary, free)
     2. Alpha Vantage (fallback, 500 calls/day)
     3. Cache (1-minute cache)
+
+    The async batch API (get_prices_async) fetches all cache misses in one
+    Yahoo bulk download, starts Alpha Vantage for the outstanding tickers
+    once `latency_budget` seconds have passed, and lets concurrent callers
+    asking for the same tickers share a single in-flight fetch.
     """
 
-    def __init__(self):
+    def __init__(self, latency_budget: float = 2.0, max_concurrency: int = 8):
+        """
+        Args:
+            latency_budget: Seconds to wait for Yahoo before hedging with Alpha Vantage
+            max_concurrency: Max concurrent per-ticker fallback requests
+        """
         self.alpha_vantage_key = os.getenv("ALPHA_VANTAGE_API_KEY")
         self.cache: Dict[str, tuple] = {}  # {ticker: (price, timestamp)}
         self.cache_duration = 60  # seconds
+        self.latency_budget = latency_budget
+        self.max_concurrency = max_concurrency
+
+        # Shared between threads (sync callers, to_thread workers)
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        self.source_stats: Dict[str, SourceStats] = {
+            "yahoo": SourceStats(),
+            "alpha_vantage": SourceStats(),
+        }
+        self.cache_stats = {"hits": 0, "misses": 0}
 
-    def get_cached_price(self, ticker: str) -> Optional[float]:
+    def get_cached_price(self, ticker: str, max_age: Optional[float] = None) -> Optional[float]:
         """Get price from cache if not expired"""
-        if ticker in self.cache:
-            price, timestamp = self.cache[ticker]
+        max_age = self.cache_duration if max_age is None else max_age
+        entry = self.cache.get(ticker)
+        if entry is not None:
+            price, timestamp = entry
             age = (datetime.now() - timestamp).total_seconds()
 
-            if age < self.cache_duration:
+            if age < max_age:
                 logger.debug(f"Cache hit for {ticker}: ${price:.2f} (age: {age:.1f}s)")
+                self.cache_stats["hits"] += 1
                 return price
 
+        self.cache_stats["misses"] += 1
         return None
 
     def set_cache(self, ticker: str, price: float):
         """Set price in cache"""
-        self.cache[ticker] = (price, datetime.now())
+        with self._lock:
+            self.cache[ticker] = (price, datetime.now())
+
+    def _timed(
+        self,
+        source: str,
+        fetch: Callable[[List[str]], Dict[str, float]],
+        tickers: List[str]
+    ) -> Dict[str, float]:
+        """Run a source fetch and record its latency / failure statistics"""
+        start = time.perf_counter()
+        prices: Dict[str, float] = {}
+        failed = False
+        try:
+            prices = fetch(tickers)
+        except Exception as e:
+            logger.error(f"{source} batch error for {len(tickers)} tickers: {e}")
+            failed = True
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.source_stats[source].record(
+                latency_ms,
+                requested=len(tickers),
+                returned=len(prices),
+                failed=failed or not prices,
+            )
+        return prices
 
     def get_price_yahoo(self, ticker: str) -> Optional[float]:
         """
@@ -100,6 +194,59 @@ class PriceFetcher:
             logger.error(f"Yahoo Finance error for {ticker}: {e}")
             return None
 
+    def get_prices_yahoo_bulk(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Get latest prices for many tickers with one Yahoo Finance download
+
+        The current day's daily bar carries the live price during market hours.
+
+        Returns:
+            dict: {ticker: price} for tickers that returned data
+        """
+        if not tickers:
+            return {}
+
+        data = yf.download(
+            tickers=" ".join(tickers),
+            period="5d",
+            interval="1d",
+            group_by="ticker",
+            auto_adjust=False,
+            progress=False,
+            threads=True,
+        )
+
+        if data is None or data.empty:
+            return {}
+
+        prices: Dict[str, float] = {}
+        for ticker in tickers:
+            try:
+                if isinstance(data.columns, pd.MultiIndex):
+                    if ticker not in data.columns.get_level_values(0):
+                        continue
+                    closes = data[ticker]["Close"].dropna()
+                else:
+                    # Single ticker download returns flat columns
+                    closes = data["Close"].dropna()
+            except KeyError:
+                continue
+
+            if not closes.empty and closes.iloc[-1] > 0:
+                prices[ticker] = float(closes.iloc[-1])
+
+        logger.debug(f"Yahoo Finance bulk: {len(prices)}/{len(tickers)} tickers")
+        return prices
+
+    def _get_prices_alpha_vantage(self, tickers: List[str]) -> Dict[str, float]:
+        """Alpha Vantage has no free bulk quote; fetch tickers one by one"""
+        prices = {}
+        for ticker in tickers:
+            price = self.get_price_alpha_vantage(ticker)
+            if price is not None:
+                prices[ticker] = price
+        return prices
+
     def get_price_alpha_vantage(self, ticker: str) -> Optional[float]:
         """
         Get current price from Alpha Vantage
@@ -156,12 +303,14 @@ class PriceFetcher:
                 return cached_price
 
         # Try Yahoo Finance
-        price = self.get_price_yahoo(ticker)
+        price = self._timed(
+            "yahoo", lambda t: self._single(self.get_price_yahoo, t[0]), [ticker]
+        ).get(ticker)
 
         # Fallback to Alpha Vantage
-        if price is None:
+        if price is None and self.alpha_vantage_key:
             logger.info(f"Yahoo Finance failed for {ticker}, trying Alpha Vantage...")
-            price = self.get_price_alpha_vantage(ticker)
+            price = self._timed("alpha_vantage", self._get_prices_alpha_vantage, [ticker]).get(ticker)
 
         # Cache the result
         if price is not None:
@@ -187,12 +336,190 @@ class PriceFetcher:
         Returns:
             dict: {ticker: price} or {ticker: None} if failed
         """
-        results = {}
+        results: Dict[str, Optional[float]] = {}
+        missing = []
+
+        for ticker in dict.fromkeys(tickers):
+            cached = self.get_cached_price(ticker) if use_cache else None
+            if cached is not None:
+                results[ticker] = cached
+            else:
+                missing.append(ticker)
+
+        if missing:
+            # One bulk request for every cache miss
+            prices = self._timed("yahoo", self.get_prices_yahoo_bulk, missing)
+
+            # Fallback to Alpha Vantage for what Yahoo did not return
+            failed = [t for t in missing if t not in prices]
+            if failed and self.alpha_vantage_key:
+                logger.info(f"Yahoo Finance missed {failed}, trying Alpha Vantage...")
+                prices.update(self._timed("alpha_vantage", self._get_prices_alpha_vantage, failed))
+
+            for ticker in missing:
+                price = prices.get(ticker)
+                if price is not None:
+                    self.set_cache(ticker, price)
+                else:
+                    logger.error(f"✗ {ticker}: Failed to fetch price from all sources")
+                results[ticker] = price
+
+        return {ticker: results.get(ticker) for ticker in tickers}
+
+    async def get_prices_async(
+        self,
+        tickers: Iterable[str],
+        use_cache: bool = True,
+        max_age: Optional[float] = None,
+        latency_budget: Optional[float] = None
+    ) -> Dict[str, Optional[float]]:
+        """
+        Get current prices for multiple tickers without blocking the event loop
+
+        - Cache hits (younger than max_age) are returned immediately
+        - Misses are fetched with one Yahoo bulk download in a worker thread
+        - If Yahoo has not answered within latency_budget, Alpha Vantage is
+          raced for the outstanding tickers; the first price per ticker wins
+        - Concurrent callers requesting the same ticker share one fetch
 
+        Args:
+            tickers: Stock tickers
+            use_cache: Use cached prices if available
+            max_age: Max cache age in seconds (default: cache_duration)
+            latency_budget: Seconds before hedging (default: self.latency_budget)
+
+        Returns:
+            dict: {ticker: price} or {ticker: None} if failed
+        """
+        tickers = list(dict.fromkeys(tickers))
+        results: Dict[str, Optional[float]] = {}
+        missing = []
+
+        for ticker in tickers:
+            cached = self.get_cached_price(ticker, max_age=max_age) if use_cache else None
+            if cached is not None:
+                results[ticker] = cached
+            else:
+                missing.append(ticker)
+
+        if not missing:
+            return results
+
+        loop = asyncio.get_running_loop()
+        shared = {
+            t: task for t in missing
+            if (task := self._inflight.get(t)) is not None and task.get_loop() is loop
+        }
+        own = [t for t in missing if t not in shared]
+
+        if own:
+            task = loop.create_task(self._fetch_batch(own, latency_budget))
+            for ticker in own:
+                self._inflight[ticker] = task
+            task.add_done_callback(lambda t, keys=own: self._clear_inflight(keys, t))
+            shared.update({ticker: task for ticker in own})
+
+        for task in set(shared.values()):
+            try:
+                await asyncio.shield(task)
+            except Exception as e:
+                logger.error(f"Batch price fetch failed: {e}")
+
+        for ticker in missing:
+            task = shared[ticker]
+            prices = task.result() if task.done() and not task.cancelled() and task.exception() is None else {}
+            results[ticker] = prices.get(ticker)
+
+        return {ticker: results.get(ticker) for ticker in tickers}
+
+    def _clear_inflight(self, tickers: List[str], task: asyncio.Task):
         for ticker in tickers:
-            results[ticker] = self.get_current_price(ticker, use_cache=use_cache)
+            if self._inflight.get(ticker) is task:
+                del self._inflight[ticker]
+
+    async def _fetch_batch(
+        self,
+        tickers: List[str],
+        latency_budget: Optional[float] = None
+    ) -> Dict[str, float]:
+        """Yahoo bulk download, hedged with Alpha Vantage after the latency budget"""
+        budget = self.latency_budget if latency_budget is None else latency_budget
+        prices: Dict[str, float] = {}
+
+        yahoo = asyncio.create_task(
+            asyncio.to_thread(self._timed, "yahoo", self.get_prices_yahoo_bulk, tickers)
+        )
+        pending = {yahoo}
+        hedged = False
+
+        done, _ = await asyncio.wait(pending, timeout=budget)
+
+        while True:
+            for task in done:
+                pending.discard(task)
+                if task.exception() is None:
+                    for ticker, price in task.result().items():
+                        prices.setdefault(ticker, price)
+
+            outstanding = [t for t in tickers if t not in prices]
+            if not outstanding:
+                break
+
+            # Hedge: Yahoo is slow (budget elapsed) or finished without these tickers
+            if not hedged and self.alpha_vantage_key:
+                hedged = True
+                if pending:
+                    logger.info(f"Yahoo exceeded {budget:.1f}s budget, racing Alpha Vantage for {len(outstanding)} tickers")
+                pending.add(asyncio.create_task(self._fetch_alpha_vantage_many(outstanding)))
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        # Losing requests keep running in their threads; results are discarded
+        for ticker, price in prices.items():
+            self.set_cache(ticker, price)
 
-        return results
+        for ticker in tickers:
+            if ticker not in prices:
+                logger.error(f"✗ {ticker}: Failed to fetch price from all sources")
+
+        return prices
+
+    async def _fetch_alpha_vantage_many(self, tickers: List[str]) -> Dict[str, float]:
+        """Concurrent per-ticker Alpha Vantage requests (bounded)"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(ticker: str) -> Dict[str, float]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._timed, "alpha_vantage", self._get_prices_alpha_vantage, [ticker]
+                )
+
+        prices: Dict[str, float] = {}
+        for result in await asyncio.gather(*(fetch_one(t) for t in tickers)):
+            prices.update(result)
+        return prices
+
+    @staticmethod
+    def _single(fetch: Callable[[str], Optional[float]], ticker: str) -> Dict[str, float]:
+        price = fetch(ticker)
+        return {ticker: price} if price is not None else {}
+
+    def get_source_stats(self) -> Dict:
+        """Per-source latency / failure statistics and cache hit rate"""
+        with self._lock:
+            sources = {name: stats.to_dict() for name, stats in self.source_stats.items()}
+        lookups = self.cache_stats["hits"] + self.cache_stats["misses"]
+        return {
+            "sources": sources,
+            "cache": {
+                **self.cache_stats,
+                "hit_rate": round(self.cache_stats["hits"] / lookups, 4) if lookups else 0.0,
+                "size": len(self.cache),
+            },
+        }
 
     def get_price_history(
         self,
@@ -260,6 +587,15 @@ def get_multiple_prices(tickers: List[str], use_cache: bool = True) -> Dict[str,
     return get_price_fetcher().get_multiple_prices(tickers, use_cache=use_cache)
 
 
+async def get_prices_async(
+    tickers: List[str],
+    use_cache: bool = True,
+    max_age: Optional[float] = None
+) -> Dict[str, Optional[float]]:
+    """Get current prices for multiple tickers (async, shared cache)"""
+    return await get_price_fetcher().get_prices_async(tickers, use_cache=use_cache, max_age=max_age)
+
+
 def get_price_history(ticker: str, period: str = "1mo") -> Optional[Dict]:
     """Get historical price data"""
     return get_price_fetcher().get_price_history(ticker, period=period)
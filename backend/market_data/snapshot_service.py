@@ -0,0 +1,541 @@
+"""
+Market Data Snapshot Service
+
+종목별 시세/기술지표/시장 상황 스냅샷을 프로세스 내에서 공유합니다.
+
+구조:
+  - 스냅샷 = War Room market_data 형식 (price_data, technical_data, market_conditions,
+    multi_timeframe, option_data, events)
+  - 세션별 TTL: 정규장 < 프리/애프터마켓 < 장 마감 (장 마감 후에는 값이 거의 바뀌지 않음)
+  - Single-flight: 같은 종목 동시 요청은 하나의 갱신 작업을 공유
+  - Stale-while-revalidate: 만료 직후(grace 구간) 요청은 이전 스냅샷을 즉시 반환하고
+    백그라운드에서 갱신 → 심의 응답 시간에 Yahoo 왕복이 포함되지 않음
+  - 워치리스트 백그라운드 갱신: 만료 전에 OHLCV 배치 프리페치 1회 + 종목별 스냅샷 재계산
+  - 현재가(get_prices)는 PriceFetcher 공유 캐시/배치 조회 사용 (stop-loss, paper trading)
+
+Usage:
+    from backend.market_data.snapshot_service import get_market_snapshot_service
+
+    service = get_market_snapshot_service()
+    market_data = await service.get_market_data("NVDA")
+    prices = await service.get_prices(["NVDA", "AAPL"])
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from backend.market_data.ohlcv_builder import (
+    EST,
+    MultiTimeframeBuilder,
+    _is_market_hours,
+    _session_key,
+    compute_indicators,
+    get_ohlcv_builder,
+)
+from backend.market_data.price_fetcher import PriceFetcher, get_price_fetcher
+
+logger = logging.getLogger(__name__)
+
+VIX_SYMBOL = "^VIX"
+
+# 세션별 스냅샷 TTL (초)
+DEFAULT_SNAPSHOT_TTL = {"regular": 60.0, "extended": 300.0, "closed": 3600.0}
+# 세션별 현재가 TTL (초)
+DEFAULT_PRICE_TTL = {"regular": 15.0, "extended": 60.0, "closed": 900.0}
+
+
+def market_session_phase(now: Optional[datetime] = None) -> str:
+    """
+    거래 세션 구분 (미국 동부 기준)
+
+    Returns:
+        regular (09:30~16:00) / extended (04:00~09:30, 16:00~20:00) / closed
+    """
+    now = (now or datetime.now(EST)).astimezone(EST)
+    if _is_market_hours(now):
+        return "regular"
+    if now.weekday() < 5 and 4 * 60 <= now.hour * 60 + now.minute < 20 * 60:
+        return "extended"
+    return "closed"
+
+
+def fallback_market_data() -> Dict[str, Any]:
+    """데이터가 없을 때의 최소 market_data"""
+    return {
+        "price_data": {
+            "current_price": 0,
+            "open": 0,
+            "high": 0,
+            "low": 0,
+            "volume": 0,
+            "high_52w": 0,
+            "low_52w": 0
+        },
+        "technical_data": {
+            "rsi": 50,
+            "macd": {"value": 0, "signal": 0},
+            "moving_averages": {"ma50": 0, "ma200": 0}
+        },
+        "market_conditions": {
+            "is_market_open": False,
+            "volatility": 0,
+            "vix": 15,
+            "market_sentiment": 0.5
+        }
+    }
+
+
+def build_market_data(
+    symbol: str,
+    builder: Optional[MultiTimeframeBuilder] = None,
+    include_extras: bool = True,
+) -> Dict[str, Any]:
+    """
+    War Room market_data 생성 (동기, 네트워크 포함)
+
+    일봉은 stock_prices + 세션 캐시(OHLCV 빌더), 지표는 벡터화 계산,
+    VIX는 같은 배치, 프로필은 세션당 1회 조회.
+
+    Args:
+        symbol: 종목 심볼
+        builder: OHLCV 빌더 (기본: 공유 인스턴스)
+        include_extras: 멀티 타임프레임 / 옵션 / 이벤트 포함 여부
+    """
+    builder = builder or get_ohlcv_builder()
+    builder.prefetch([symbol, VIX_SYMBOL])
+    hist = builder.get_frames(symbol, ("1d",)).get("1d")
+
+    if hist is None or hist.empty:
+        return fallback_market_data()
+
+    latest = hist.iloc[-1]
+    current_price = float(latest['Close'])
+
+    # RSI(14) / MACD / MA / 60-day volatility (vectorized)
+    indicators = compute_indicators(hist[["Close"]]).iloc[0]
+    rsi = float(indicators['rsi'])
+    ma50 = float(indicators['sma_50']) or current_price
+    ma200 = float(indicators['ma_200'])
+    volatility = float(indicators['volatility'])
+
+    # 52-week range from the daily series (no ticker.info round trip)
+    last_year = hist[hist.index >= hist.index.max() - pd.DateOffset(years=1)]
+
+    # VIX (market volatility index) - same cached batch
+    vix_value = 15  # Default
+    vix_hist = builder.get_frames(VIX_SYMBOL, ("1d",)).get("1d")
+    if vix_hist is not None and not vix_hist.empty:
+        vix_value = float(vix_hist['Close'].iloc[-1])
+
+    # Market sentiment based on price vs MA50
+    market_sentiment = 0.6 if current_price > ma50 else 0.4
+
+    # Sector / market cap (cached once per session)
+    profile = builder.get_profile(symbol)
+
+    market_data = {
+        "price_data": {
+            "current_price": current_price,
+            "open": float(latest['Open']),
+            "high": float(latest['High']),
+            "low": float(latest['Low']),
+            "volume": int(latest['Volume']),
+            "high_52w": float(last_year['High'].max()),
+            "low_52w": float(last_year['Low'].min())
+        },
+        "technical_data": {
+            "rsi": round(rsi, 2),
+            "macd": {
+                "value": round(float(indicators['macd']), 2),
+                "signal": round(float(indicators['macd_signal']), 2)
+            },
+            "moving_averages": {
+                "ma50": round(ma50, 2),
+                "ma200": round(ma200, 2)
+            }
+        },
+        "market_conditions": {
+            "is_market_open": _is_market_hours(builder.clock()),
+            "volatility": round(volatility, 2),
+            "vix": round(vix_value, 2),
+            "market_sentiment": market_sentiment,
+            "market_cap": profile.get('market_cap', 0),
+            "sector": profile.get('sector', 'Unknown'),
+            "industry": profile.get('industry', 'Unknown')
+        },
+    }
+
+    if include_extras:
+        # [Phase 3] Enhanced Data (multi-TF from the same frames; options/events cached with the snapshot)
+        from backend.ai.mvp.enhanced_data_provider import EnhancedDataProvider
+        market_data["multi_timeframe"] = EnhancedDataProvider.get_multi_timeframe_data(symbol)
+        market_data["option_data"] = EnhancedDataProvider.get_option_data(symbol)
+        market_data["events"] = EnhancedDataProvider.get_event_proximity(symbol)
+
+    return market_data
+
+
+@dataclass
+class MarketSnapshot:
+    """종목 스냅샷"""
+    symbol: str
+    market_data: Dict[str, Any]
+    built_at: datetime
+    session: date
+
+    @property
+    def price(self) -> Optional[float]:
+        price = self.market_data.get("price_data", {}).get("current_price")
+        return float(price) if price else None
+
+    def age(self, now: datetime) -> float:
+        return (now - self.built_at).total_seconds()
+
+
+class MarketSnapshotService:
+    """
+    공유 시장 데이터 스냅샷 서비스
+
+    War Room 심의, Stop-Loss 모니터, Paper Trading, Smart Executor가 같은 캐시를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        snapshot_builder: Optional[Callable[[str], Dict[str, Any]]] = None,
+        ohlcv_builder: Optional[MultiTimeframeBuilder] = None,
+        price_fetcher: Optional[PriceFetcher] = None,
+        snapshot_ttl: Optional[Dict[str, float]] = None,
+        price_ttl: Optional[Dict[str, float]] = None,
+        stale_grace: float = 3.0,
+        refresh_ahead: float = 0.8,
+        refresh_interval: float = 15.0,
+        max_concurrency: int = 4,
+        max_watchlist: int = 100,
+        clock: Callable[[], datetime] = lambda: datetime.now(EST),
+    ):
+        """
+        초기화
+
+        Args:
+            snapshot_builder: symbol → market_data (기본: build_market_data)
+            ohlcv_builder: 워치리스트 배치 프리페치용 OHLCV 빌더
+            price_fetcher: 현재가 조회기 (기본: 공유 PriceFetcher)
+            snapshot_ttl: 세션별 스냅샷 TTL {regular, extended, closed}
+            price_ttl: 세션별 현재가 TTL
+            stale_grace: TTL × stale_grace 까지는 이전 스냅샷 반환 + 백그라운드 갱신
+            refresh_ahead: 워치리스트는 TTL × refresh_ahead 경과 시 미리 갱신
+            refresh_interval: 백그라운드 갱신 주기 (초)
+            max_concurrency: 동시 스냅샷 빌드 수
+            max_watchlist: 워치리스트 최대 종목 수 (오래된 순 제거)
+            clock: 현재 시각 (테스트용)
+        """
+        self.ohlcv_builder = ohlcv_builder
+        self.snapshot_builder = snapshot_builder or (
+            lambda symbol: build_market_data(symbol, self.ohlcv_builder)
+        )
+        self._price_fetcher = price_fetcher
+        self.snapshot_ttl = {**DEFAULT_SNAPSHOT_TTL, **(snapshot_ttl or {})}
+        self.price_ttl = {**DEFAULT_PRICE_TTL, **(price_ttl or {})}
+        self.stale_grace = stale_grace
+        self.refresh_ahead = refresh_ahead
+        self.refresh_interval = refresh_interval
+        self.max_concurrency = max_concurrency
+        self.max_watchlist = max_watchlist
+        self.clock = clock
+
+        self._snapshots: Dict[str, MarketSnapshot] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._watchlist: "OrderedDict[str, None]" = OrderedDict()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "shared_waits": 0,
+            "builds": 0,
+            "build_errors": 0,
+            "background_refreshes": 0,
+            "price_snapshot_hits": 0,
+            "price_fetches": 0,
+        }
+
+    @property
+    def price_fetcher(self) -> PriceFetcher:
+        if self._price_fetcher is None:
+            self._price_fetcher = get_price_fetcher()
+        return self._price_fetcher
+
+    # ------------------------------------------------------------------
+    # TTL
+    # ------------------------------------------------------------------
+
+    def ttl(self, now: Optional[datetime] = None) -> float:
+        """현재 세션의 스냅샷 TTL"""
+        return self.snapshot_ttl[market_session_phase(now or self.clock())]
+
+    def _state(self, snapshot: Optional[MarketSnapshot], now: datetime) -> str:
+        """fresh / stale (grace 구간) / expired"""
+        if snapshot is None:
+            return "expired"
+        ttl = self.ttl(now)
+        age = snapshot.age(now)
+        if age < ttl and snapshot.session == _session_key(now):
+            return "fresh"
+        if age < ttl * self.stale_grace:
+            return "stale"
+        return "expired"
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def peek(self, symbol: str) -> Optional[MarketSnapshot]:
+        """네트워크 없이 캐시된 스냅샷 조회 (만료 여부 무관)"""
+        return self._snapshots.get(symbol.upper())
+
+    async def get_snapshot(self, symbol: str, allow_stale: bool = True) -> Optional[MarketSnapshot]:
+        """
+        종목 스냅샷
+
+        - fresh: 즉시 반환
+        - stale (grace 구간): 이전 스냅샷 즉시 반환 + 백그라운드 갱신 (allow_stale)
+        - 없음/만료: 갱신 완료 대기 (동시 요청은 같은 갱신을 공유)
+
+        Returns:
+            MarketSnapshot (빌드 실패 시 이전 스냅샷 또는 None)
+        """
+        symbol = symbol.upper()
+        now = self.clock()
+        snapshot = self._snapshots.get(symbol)
+        state = self._state(snapshot, now)
+
+        if state == "fresh":
+            self.stats["hits"] += 1
+            return snapshot
+
+        if state == "stale" and allow_stale:
+            self.stats["stale_hits"] += 1
+            self._refresh(symbol)
+            return snapshot
+
+        self.stats["misses"] += 1
+        try:
+            return await asyncio.shield(self._refresh(symbol))
+        except Exception as e:
+            logger.warning(f"[Snapshot] refresh failed for {symbol}: {e}")
+            return snapshot
+
+    async def get_market_data(self, symbol: str, allow_stale: bool = True) -> Dict[str, Any]:
+        """War Room market_data (없으면 최소 fallback)"""
+        snapshot = await self.get_snapshot(symbol, allow_stale=allow_stale)
+        return snapshot.market_data if snapshot is not None else fallback_market_data()
+
+    def _refresh(self, symbol: str) -> asyncio.Task:
+        """종목 갱신 작업 (진행 중이면 기존 작업 공유)"""
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(symbol)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.stats["shared_waits"] += 1
+            return task
+
+        task = loop.create_task(self._build(symbol))
+        self._inflight[symbol] = task
+        task.add_done_callback(lambda t, s=symbol: self._on_built(s, t))
+        return task
+
+    def _on_built(self, symbol: str, task: asyncio.Task) -> None:
+        if self._inflight.get(symbol) is task:
+            del self._inflight[symbol]
+        # 백그라운드 갱신 실패는 여기서 소비 (대기자가 없을 수 있음)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"[Snapshot] build error for {symbol}: {task.exception()}")
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop_id = id(asyncio.get_running_loop())
+        semaphore = self._semaphores.get(loop_id)
+        if semaphore is None:
+            semaphore = self._semaphores[loop_id] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _build(self, symbol: str) -> MarketSnapshot:
+        async with self._semaphore():
+            try:
+                market_data = await asyncio.to_thread(self.snapshot_builder, symbol)
+            except Exception:
+                self.stats["build_errors"] += 1
+                raise
+        now = self.clock()
+        snapshot = MarketSnapshot(symbol=symbol, market_data=market_data, built_at=now, session=_session_key(now))
+        self._snapshots[symbol] = snapshot
+        self.stats["builds"] += 1
+        return snapshot
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """스냅샷 무효화 (symbol 없으면 전체)"""
+        if symbol is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(symbol.upper(), None)
+
+    # ------------------------------------------------------------------
+    # Prices
+    # ------------------------------------------------------------------
+
+    async def get_prices(self, symbols: Iterable[str], max_age: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """
+        현재가 일괄 조회
+
+        가격 TTL 이내 스냅샷은 그대로 사용하고, 나머지는 PriceFetcher 배치 조회
+        (공유 캐시 + 동시 요청 공유)로 가져옵니다.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        now = self.clock()
+        max_age = self.price_ttl[market_session_phase(now)] if max_age is None else max_age
+
+        prices: Dict[str, Optional[float]] = {}
+        missing = []
+        for symbol in symbols:
+            snapshot = self._snapshots.get(symbol.upper())
+            if snapshot is not None and snapshot.price and snapshot.age(now) < max_age:
+                prices[symbol] = snapshot.price
+            else:
+                missing.append(symbol)
+        self.stats["price_snapshot_hits"] += len(symbols) - len(missing)
+
+        if missing:
+            self.stats["price_fetches"] += 1
+            prices.update(await self.price_fetcher.get_prices_async(missing, max_age=max_age))
+
+        return {symbol: prices.get(symbol) for symbol in symbols}
+
+    async def get_price(self, symbol: str) -> Optional[float]:
+        return (await self.get_prices([symbol]))[symbol]
+
+    # ------------------------------------------------------------------
+    # Watchlist / background refresh
+    # ------------------------------------------------------------------
+
+    def watch(self, symbols: Iterable[str]) -> None:
+        """워치리스트 추가 (최근 추가 순 유지, max_watchlist 초과 시 오래된 종목 제거)"""
+        for symbol in symbols:
+            symbol = symbol.upper()
+            self._watchlist[symbol] = None
+            self._watchlist.move_to_end(symbol)
+        while len(self._watchlist) > self.max_watchlist:
+            self._watchlist.popitem(last=False)
+
+    def unwatch(self, symbols: Iterable[str]) -> None:
+        for symbol in symbols:
+            self._watchlist.pop(symbol.upper(), None)
+
+    @property
+    def watchlist(self) -> List[str]:
+        return list(self._watchlist)
+
+    def _due(self, now: datetime) -> List[str]:
+        """만료 임박(TTL × refresh_ahead 경과) 또는 미보유 워치리스트 종목"""
+        threshold = self.ttl(now) * self.refresh_ahead
+        due = []
+        for symbol in self._watchlist:
+            snapshot = self._snapshots.get(symbol)
+            if (
+                snapshot is None
+                or snapshot.session != _session_key(now)
+                or snapshot.age(now) >= threshold
+            ):
+                due.append(symbol)
+        return due
+
+    async def refresh_watchlist(self) -> List[str]:
+        """
+        갱신 시점이 된 워치리스트 종목 재계산
+
+        OHLCV 빌더가 있으면 대상 종목 + VIX를 배치 1회로 먼저 채웁니다.
+
+        Returns:
+            갱신된 종목 리스트
+        """
+        due = self._due(self.clock())
+        if not due:
+            return []
+
+        if self.ohlcv_builder is not None:
+            try:
+                await asyncio.to_thread(self.ohlcv_builder.prefetch, due + [VIX_SYMBOL])
+            except Exception as e:
+                logger.warning(f"[Snapshot] watchlist prefetch failed: {e}")
+
+        results = await asyncio.gather(*(self._refresh(s) for s in due), return_exceptions=True)
+        refreshed = [s for s, r in zip(due, results) if not isinstance(r, BaseException)]
+        self.stats["background_refreshes"] += len(refreshed)
+        return refreshed
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                refreshed = await self.refresh_watchlist()
+                if refreshed:
+                    logger.debug(f"[Snapshot] refreshed {len(refreshed)} watchlist symbols")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[Snapshot] background refresh error: {e}")
+            await asyncio.sleep(min(self.refresh_interval, self.ttl() / 2))
+
+    def start(self, watchlist: Optional[Iterable[str]] = None) -> asyncio.Task:
+        """백그라운드 갱신 시작 (실행 중인 이벤트 루프 필요)"""
+        if watchlist:
+            self.watch(watchlist)
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_loop())
+            logger.info(f"[Snapshot] background refresh started ({len(self._watchlist)} symbols)")
+        return self._refresh_task
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 중지"""
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict:
+        """캐시/갱신 통계"""
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "cached_symbols": len(self._snapshots),
+            "watchlist": len(self._watchlist),
+            "inflight": len(self._inflight),
+            "hit_rate": (self.stats["hits"] + self.stats["stale_hits"]) / lookups if lookups else 0.0,
+            "session": market_session_phase(self.clock()),
+            "background_running": self._refresh_task is not None and not self._refresh_task.done(),
+        }
+
+
+# 싱글톤 인스턴스
+_snapshot_service: Optional[MarketSnapshotService] = None
+
+
+def get_market_snapshot_service() -> MarketSnapshotService:
+    """MarketSnapshotService 싱글톤 반환 (워치리스트: MARKET_SNAPSHOT_WATCHLIST)"""
+    global _snapshot_service
+    if _snapshot_service is None:
+        _snapshot_service = MarketSnapshotService(ohlcv_builder=get_ohlcv_builder())
+        watchlist = os.getenv("MARKET_SNAPSHOT_WATCHLIST", "")
+        _snapshot_service.watch(s.strip() for s in watchlist.split(",") if s.strip())
+    return _snapshot_service
@@ -6,6 +6,7 @@ Real-time trading alerts via multiple channels.
 Components:
 - TelegramNotifier: Telegram Bot integration
 - NotificationManager: Trading system integration
+- WebSocketBroadcaster / OutboundBatcher: Non-blocking fan-out and rate-shaped delivery
 
 Author: AI Trading System Team
 Date: 2025-11-15
@@ -13,10 +14,14 @@ Date: 2025-11-15
 
 from .telegram_notifier import TelegramNotifier
 from .notification_manager import NotificationManager
+from .dispatcher import WebSocketBroadcaster, OutboundBatcher, SlowConsumerPolicy
 
 __all__ = [
     "TelegramNotifier",
     "NotificationManager",
+    "WebSocketBroadcaster",
+    "OutboundBatcher",
+    "SlowConsumerPolicy",
 ]
 
 __version__ = "1.0.0"
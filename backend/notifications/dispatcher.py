@@ -0,0 +1,455 @@
+"""
+Fan-out Notification Dispatcher for AI Trading System
+
+Features:
+- Per-connection WebSocket send queues (a stalled client never blocks others)
+- Messages serialized once per broadcast
+- Drop-oldest / coalesce policy for slow consumers
+- Rate-shaped, batched outbound queue for Telegram/Slack
+- Send latency and dropped-message statistics
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class SlowConsumerPolicy(Enum):
+    """What to do when a client's send queue is full"""
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest pending message
+    COALESCE = "coalesce"        # Replace a pending message with the same key, else drop oldest
+
+
+class _LatencyTracker:
+    """Rolling send-latency statistics (milliseconds)"""
+
+    def __init__(self, window: int = 1000):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float):
+        self._samples.append(latency_ms)
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def snapshot(self) -> Dict[str, float]:
+        if not self._samples:
+            return {"avg_send_latency_ms": 0.0, "p95_send_latency_ms": 0.0, "max_send_latency_ms": 0.0}
+
+        ordered = sorted(self._samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return {
+            "avg_send_latency_ms": round(self.total_ms / self.count, 2),
+            "p95_send_latency_ms": round(p95, 2),
+            "max_send_latency_ms": round(self.max_ms, 2),
+        }
+
+
+class _ClientChannel:
+    """
+    Send queue + writer task for a single WebSocket connection.
+
+    Pending entries are [coalesce_key, text, enqueued_at].
+    """
+
+    def __init__(self, websocket, broadcaster: "WebSocketBroadcaster"):
+        self.websocket = websocket
+        self.broadcaster = broadcaster
+        self.pending: Deque[List[Any]] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.in_flight = False
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.pending) or self.in_flight
+
+    def start(self):
+        """Start the writer task if an event loop is running"""
+        if self.task is not None:
+            return
+        try:
+            self.task = asyncio.get_running_loop().create_task(self._run())
+        except RuntimeError:
+            # No running loop yet; started on the first offer()
+            self.task = None
+
+    def offer(self, text: str, key: Optional[Hashable]) -> str:
+        """
+        Enqueue a serialized message.
+
+        Returns:
+            "queued", "coalesced" or "dropped" (oldest message discarded)
+        """
+        result = "queued"
+        policy = self.broadcaster.policy
+
+        if key is not None and policy == SlowConsumerPolicy.COALESCE:
+            for entry in self.pending:
+                if entry[0] == key:
+                    entry[1] = text
+                    return "coalesced"
+
+        if len(self.pending) >= self.broadcaster.max_queue:
+            self.pending.popleft()
+            result = "dropped"
+
+        self.pending.append([key, text, time.monotonic()])
+        self.wakeup.set()
+        self.start()
+        return result
+
+    async def _run(self):
+        stats = self.broadcaster.stats
+        timeout = self.broadcaster.send_timeout
+
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+
+            while self.pending:
+                _, text, enqueued_at = self.pending.popleft()
+                self.in_flight = True
+                try:
+                    await asyncio.wait_for(self.websocket.send_text(text), timeout=timeout)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"[{self.broadcaster.name}] WebSocket send error: {e!r}")
+                    stats["send_errors"] += 1
+                    self.broadcaster.remove(self.websocket, cancel=False)
+                    return
+                finally:
+                    self.in_flight = False
+
+                stats["messages_sent"] += 1
+                self.broadcaster.latency.record((time.monotonic() - enqueued_at) * 1000)
+
+            self.broadcaster._notify_idle()
+
+
+class WebSocketBroadcaster:
+    """
+    Fan-out broadcaster with one send queue per WebSocket connection.
+
+    broadcast() serializes the message once and only enqueues it, so a slow
+    or stalled client delays nobody but itself. When a client's queue is full
+    the oldest pending message is dropped (or, with COALESCE, a pending message
+    with the same coalesce key is replaced). Clients whose send fails or times
+    out are disconnected.
+
+    Usage:
+        broadcaster = WebSocketBroadcaster(name="signals")
+        broadcaster.add(websocket)
+        await broadcaster.broadcast({"type": "new_signal", "data": signal})
+    """
+
+    def __init__(
+        self,
+        name: str = "websocket",
+        max_queue: int = 100,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+        send_timeout: float = 5.0,
+    ):
+        """
+        Args:
+            name: Label used in logs
+            max_queue: Max pending messages per connection
+            policy: Slow consumer policy
+            send_timeout: Seconds before a single send is treated as failed
+        """
+        self.name = name
+        self.max_queue = max_queue
+        self.policy = policy
+        self.send_timeout = send_timeout
+
+        self._channels: Dict[Any, _ClientChannel] = {}
+        self._idle = asyncio.Event()
+        self.latency = _LatencyTracker()
+
+        self.stats = {
+            "broadcasts": 0,
+            "messages_queued": 0,
+            "messages_sent": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "send_errors": 0,
+        }
+
+    @property
+    def connections(self) -> set:
+        """Currently registered WebSocket objects"""
+        return set(self._channels)
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def add(self, websocket):
+        """Register a connection and start its writer task"""
+        if websocket in self._channels:
+            return
+        channel = _ClientChannel(websocket, self)
+        self._channels[websocket] = channel
+        channel.start()
+
+    def remove(self, websocket, cancel: bool = True):
+        """Unregister a connection and stop its writer task"""
+        channel = self._channels.pop(websocket, None)
+        if channel is None:
+            return
+        if cancel and channel.task is not None and not channel.task.done():
+            channel.task.cancel()
+        self._notify_idle()
+
+    async def broadcast(
+        self,
+        message: Union[Dict[str, Any], str],
+        coalesce_key: Optional[Hashable] = None,
+    ) -> int:
+        """
+        Enqueue a message for every connected client.
+
+        Args:
+            message: Dict (serialized once with json.dumps) or pre-serialized text
+            coalesce_key: Key for COALESCE policy (e.g. "position_update:AAPL").
+                Only state-like messages where the latest value supersedes
+                earlier ones should pass a key.
+
+        Returns:
+            Number of clients the message was queued for
+        """
+        if not self._channels:
+            return 0
+
+        text = message if isinstance(message, str) else json.dumps(message)
+        self.stats["broadcasts"] += 1
+
+        for channel in list(self._channels.values()):
+            result = channel.offer(text, coalesce_key)
+            if result == "coalesced":
+                self.stats["coalesced"] += 1
+                continue
+            self.stats["messages_queued"] += 1
+            if result == "dropped":
+                self.stats["dropped"] += 1
+
+        return len(self._channels)
+
+    async def flush(self, timeout: Optional[float] = None):
+        """Wait until every client's queue has been drained"""
+        async def _wait():
+            while True:
+                self._idle.clear()
+                if not any(c.busy for c in self._channels.values()):
+                    return
+                await self._idle.wait()
+
+        await asyncio.wait_for(_wait(), timeout=timeout)
+
+    async def close(self):
+        """Stop all writer tasks"""
+        for websocket in list(self._channels):
+            self.remove(websocket)
+
+    def _notify_idle(self):
+        self._idle.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get broadcast statistics"""
+        return {
+            **self.stats,
+            "connections": len(self._channels),
+            "queued_now": sum(len(c.pending) for c in self._channels.values()),
+            "policy": self.policy.value,
+            **self.latency.snapshot(),
+        }
+
+
+class OutboundBatcher:
+    """
+    Rate-shaped outbound queue for chat providers (Telegram, Slack).
+
+    Messages are queued instead of rejected when the provider limit is reached.
+    A single worker sends at most one request per `min_interval` seconds and
+    `max_per_minute` requests per minute, merging consecutive queued messages
+    that share a group key into one request (bounded by `max_batch_size`
+    messages and `max_batch_weight`, e.g. Telegram's 4096 characters).
+
+    Usage:
+        batcher = OutboundBatcher(send_batch, min_interval=1.0, max_per_minute=20)
+        await batcher.submit({"text": "hello"})
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[Any]], Awaitable[bool]],
+        name: str = "outbound",
+        min_interval: float = 1.0,
+        max_per_minute: int = 20,
+        max_batch_size: int = 10,
+        max_batch_weight: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+        group_key: Optional[Callable[[Any], Hashable]] = None,
+        max_queue: int = 500,
+    ):
+        """
+        Args:
+            send_batch: Coroutine that delivers a list of messages as one request
+            name: Label used in logs
+            min_interval: Minimum seconds between provider requests
+            max_per_minute: Max provider requests per rolling minute
+            max_batch_size: Max messages merged into one request
+            max_batch_weight: Max summed weight per request (None = unlimited)
+            weigh: Weight of a message (e.g. text length)
+            group_key: Only messages with equal keys are merged
+            max_queue: Max pending messages (oldest dropped beyond this)
+        """
+        self.send_batch = send_batch
+        self.name = name
+        self.min_interval = min_interval
+        self.max_per_minute = max_per_minute
+        self.max_batch_size = max_batch_size
+        self.max_batch_weight = max_batch_weight
+        self.weigh = weigh or (lambda _: 0)
+        self.group_key = group_key or (lambda _: None)
+        self.max_queue = max_queue
+
+        self._pending: Deque[tuple] = deque()
+        self._send_times: Deque[float] = deque()
+        self._last_send = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.latency = _LatencyTracker()
+
+        self.stats = {
+            "queued": 0,
+            "batches_sent": 0,
+            "messages_sent": 0,
+            "failed": 0,
+            "dropped": 0,
+        }
+
+    async def submit(self, message: Any) -> bool:
+        """
+        Queue a message for delivery.
+
+        Returns:
+            True when accepted (an older message may have been dropped)
+        """
+        self._ensure_worker()
+
+        if len(self._pending) >= self.max_queue:
+            self._pending.popleft()
+            self.stats["dropped"] += 1
+            logger.warning(f"[{self.name}] Outbound queue full, dropped oldest message")
+
+        self._pending.append((message, time.monotonic()))
+        self.stats["queued"] += 1
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    async def flush(self, timeout: Optional[float] = None):
+        """Wait until all queued messages have been sent"""
+        if self._idle is None:
+            return
+        await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+
+    async def close(self):
+        """Stop the worker (pending messages are discarded)"""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+
+    def _ensure_worker(self):
+        if self._worker is not None and not self._worker.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    def _next_batch(self) -> List[tuple]:
+        first = self._pending.popleft()
+        batch = [first]
+        key = self.group_key(first[0])
+        weight = self.weigh(first[0])
+
+        while self._pending and len(batch) < self.max_batch_size:
+            candidate = self._pending[0][0]
+            if self.group_key(candidate) != key:
+                break
+            candidate_weight = self.weigh(candidate)
+            if self.max_batch_weight is not None and weight + candidate_weight > self.max_batch_weight:
+                break
+            batch.append(self._pending.popleft())
+            weight += candidate_weight
+
+        return batch
+
+    async def _wait_for_slot(self):
+        """Sleep until both the spacing and the per-minute budget allow a send"""
+        while True:
+            now = time.monotonic()
+            while self._send_times and now - self._send_times[0] >= 60:
+                self._send_times.popleft()
+
+            delay = self._last_send + self.min_interval - now
+            if len(self._send_times) >= self.max_per_minute:
+                delay = max(delay, self._send_times[0] + 60 - now)
+
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    async def _run(self):
+        while True:
+            if not self._pending:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            await self._wait_for_slot()
+            batch = self._next_batch()
+
+            try:
+                success = await self.send_batch([message for message, _ in batch])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[{self.name}] Batch send error: {e}")
+                success = False
+
+            sent_at = time.monotonic()
+            self._last_send = sent_at
+            self._send_times.append(sent_at)
+
+            if success:
+                self.stats["batches_sent"] += 1
+                self.stats["messages_sent"] += len(batch)
+                for _, enqueued_at in batch:
+                    self.latency.record((sent_at - enqueued_at) * 1000)
+            else:
+                self.stats["failed"] += len(batch)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get outbound queue statistics"""
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            **self.latency.snapshot(),
+        }
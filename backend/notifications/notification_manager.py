@@ -7,6 +7,7 @@ Features:
 - Priority-based routing
 - Settings persistence
 - Statistics aggregation
+- Non-blocking WebSocket fan-out (per-client send queues)
 
 Author: AI Trading System
 Date: 2025-11-15
@@ -21,6 +22,7 @@ import json
 
 from .telegram_notifier import TelegramNotifier, AlertPriority, create_telegram_notifier
 from .slack_notifier import SlackNotifier, create_slack_notifier
+from .dispatcher import WebSocketBroadcaster
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +63,7 @@ class NotificationManager:
         self.slack = slack_notifier or create_slack_notifier()
         
         # WebSocket connections (frontend clients)
-        self.websocket_connections: set = set()
+        self.ws_broadcaster = WebSocketBroadcaster(name="notifications")
         
         self.settings_path = settings_path or "./config/notification_settings.json"
         
@@ -162,34 +164,29 @@ class NotificationManager:
     # WebSocket Management
     # =========================================================================
 
+    @property
+    def websocket_connections(self) -> set:
+        """Connected WebSocket clients"""
+        return self.ws_broadcaster.connections
+
     def add_websocket_connection(self, websocket):
         """Add WebSocket connection"""
-        self.websocket_connections.add(websocket)
-        logger.info(f"WebSocket client connected (total: {len(self.websocket_connections)})")
+        self.ws_broadcaster.add(websocket)
+        logger.info(f"WebSocket client connected (total: {len(self.ws_broadcaster)})")
 
     def remove_websocket_connection(self, websocket):
         """Remove WebSocket connection"""
-        self.websocket_connections.discard(websocket)
-        logger.info(f"WebSocket client disconnected (total: {len(self.websocket_connections)})")
+        self.ws_broadcaster.remove(websocket)
+        logger.info(f"WebSocket client disconnected (total: {len(self.ws_broadcaster)})")
 
     async def broadcast_websocket(self, message: Dict[str, Any]):
-        """Broadcast message to all connected WebSocket clients"""
-        if not self.websocket_connections:
-            return
-
-        message_json = json.dumps(message)
-        disconnected = set()
-
-        for ws in self.websocket_connections:
-            try:
-                await ws.send_text(message_json)
-            except Exception as e:
-                logger.error(f"WebSocket send error: {e}")
-                disconnected.add(ws)
-        
-        # Cleanup disconnected clients
-        for ws in disconnected:
-            self.remove_websocket_connection(ws)
+        """
+        Broadcast message to all connected WebSocket clients.
+        
+        The message is serialized once and queued per client; slow clients
+        never delay the caller (see WebSocketBroadcaster).
+        """
+        await self.ws_broadcaster.broadcast(message)
 
     # =========================================================================
     # News Alerts
@@ -515,6 +512,7 @@ class NotificationManager:
         return {
             "telegram": self.telegram.get_stats(),
             "slack": self.slack.get_stats(),
+            "websocket": self.ws_broadcaster.get_stats(),
             "history_size": len(self._history),
             "alert_counts": alert_counts,
             "success_counts": success_counts,
@@ -559,19 +557,23 @@ class NotificationManager:
 
 def create_notification_manager(
     settings_path: Optional[str] = None,
+    batch_outbound: bool = False,
 ) -> NotificationManager:
     """
     Create NotificationManager with notifiers from environment variables.
     
     Args:
         settings_path: Path to settings file
+        batch_outbound: Rate-shape and batch outgoing messages. When on,
+            notifier send() returns True once the message is queued, not
+            delivered, so callers cannot observe delivery failures.
         
     Returns:
         Configured NotificationManager instance
     """
     return NotificationManager(
-        telegram_notifier=create_telegram_notifier(),
-        slack_notifier=create_slack_notifier(),
+        telegram_notifier=create_telegram_notifier(batch_outbound=batch_outbound),
+        slack_notifier=create_slack_notifier(batch_outbound=batch_outbound),
         settings_path=settings_path or "./config/notification_settings.json",
     )
 
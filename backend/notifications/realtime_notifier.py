@@ -25,7 +25,8 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Set
 from enum import Enum
-import json
+
+from backend.notifications.dispatcher import WebSocketBroadcaster, SlowConsumerPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +82,11 @@ class RealtimeNotifier:
         self.enable_slack = enable_slack
 
         # WebSocket connections (프론트엔드 클라이언트)
-        self.websocket_connections: Set[Any] = set()
+        # 느린 클라이언트는 같은 종목의 position_update를 최신 값으로 병합
+        self.ws_broadcaster = WebSocketBroadcaster(
+            name="realtime",
+            policy=SlowConsumerPolicy.COALESCE
+        )
 
         # Telegram
         self.telegram_bot_token = telegram_bot_token
@@ -102,6 +107,11 @@ class RealtimeNotifier:
     # WebSocket 관리
     # ========================================================================
 
+    @property
+    def websocket_connections(self) -> Set[Any]:
+        """연결된 WebSocket 클라이언트"""
+        return self.ws_broadcaster.connections
+
     def add_websocket_connection(self, websocket):
         """
         WebSocket 연결 추가
@@ -109,8 +119,8 @@ class RealtimeNotifier:
         Args:
             websocket: WebSocket 객체
         """
-        self.websocket_connections.add(websocket)
-        logger.info(f"WebSocket client connected (total: {len(self.websocket_connections)})")
+        self.ws_broadcaster.add(websocket)
+        logger.info(f"WebSocket client connected (total: {len(self.ws_broadcaster)})")
 
     def remove_websocket_connection(self, websocket):
         """
@@ -119,38 +129,33 @@ class RealtimeNotifier:
         Args:
             websocket: WebSocket 객체
         """
-        self.websocket_connections.discard(websocket)
-        logger.info(f"WebSocket client disconnected (total: {len(self.websocket_connections)})")
+        self.ws_broadcaster.remove(websocket)
+        logger.info(f"WebSocket client disconnected (total: {len(self.ws_broadcaster)})")
 
     async def broadcast_websocket(self, message: Dict[str, Any]):
         """
         모든 WebSocket 클라이언트에 브로드캐스트
 
+        메시지는 1회만 직렬화되어 클라이언트별 큐에 적재되므로
+        느린 클라이언트가 다른 클라이언트나 호출자를 막지 않는다.
+
         Args:
             message: 메시지 딕셔너리
         """
         if not self.enable_websocket:
             return
 
-        if not self.websocket_connections:
+        if not self.ws_broadcaster.connections:
             logger.debug("No WebSocket clients to broadcast")
             return
 
-        message_json = json.dumps(message)
-        disconnected = set()
-
-        for ws in self.websocket_connections:
-            try:
-                await ws.send(message_json)
-                logger.debug(f"Sent WebSocket message: {message['type']}")
-
-            except Exception as e:
-                logger.error(f"WebSocket send error: {e}")
-                disconnected.add(ws)
+        # 상태성 메시지(position_update)는 종목별 최신 값만 있으면 충분
+        coalesce_key = None
+        if message.get("type") == "position_update":
+            coalesce_key = f"position_update:{message.get('ticker')}"
 
-        # 연결 끊긴 클라이언트 제거
-        for ws in disconnected:
-            self.remove_websocket_connection(ws)
+        await self.ws_broadcaster.broadcast(message, coalesce_key=coalesce_key)
+        logger.debug(f"Queued WebSocket message: {message['type']}")
 
     # ========================================================================
     # 이벤트별 알림
@@ -477,7 +482,8 @@ class RealtimeNotifier:
 
         return {
             "total_notifications": total,
-            "websocket_clients": len(self.websocket_connections),
+            "websocket_clients": len(self.ws_broadcaster),
+            "websocket": self.ws_broadcaster.get_stats(),
             "by_type": by_type,
             "by_level": by_level,
             "recent_notifications": self.notification_history[-5:]  # 최근 5개
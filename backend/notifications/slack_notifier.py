@@ -18,6 +18,8 @@ from typing import Dict, List, Optional, Any
 
 import aiohttp
 
+from .dispatcher import OutboundBatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,14 +32,19 @@ class SlackNotifier:
     - Color-coded attachments
     - Interactive action buttons
     - Rate limiting
+    - Optional rate-shaped batching (Incoming Webhooks: ~1 msg/sec)
     """
     
+    # Slack Block Kit limits per message
+    MAX_BLOCKS = 50
+    
     def __init__(
         self,
         webhook_url: str,
         enabled: bool = True,
         rate_limit_per_minute: int = 30,
         channel_overrides: Optional[Dict[str, str]] = None,
+        batch_outbound: bool = False,
     ):
         """
         Initialize Slack notifier.
@@ -48,6 +55,8 @@ class SlackNotifier:
             rate_limit_per_minute: Max messages per minute
             channel_overrides: Override channels for specific priorities
                 e.g., {"CRITICAL": "#trading-critical", "HIGH": "#trading-alerts"}
+            batch_outbound: Queue messages and send them rate-shaped,
+                merging queued payloads into one webhook call
         """
         self.webhook_url = webhook_url
         self.enabled = enabled
@@ -66,6 +75,18 @@ class SlackNotifier:
             "signal_alerts": 0,
         }
         
+        # Outbound queue
+        self.batch_outbound = batch_outbound
+        self.outbox = OutboundBatcher(
+            self._send_batch,
+            name="slack",
+            min_interval=1.0,
+            max_per_minute=rate_limit_per_minute,
+            max_batch_weight=self.MAX_BLOCKS,
+            weigh=self._count_blocks,
+            group_key=lambda p: p.get("channel"),
+        )
+        
         logger.info(f"SlackNotifier initialized: enabled={enabled}")
     
     async def _check_rate_limit(self) -> bool:
@@ -94,7 +115,7 @@ class SlackNotifier:
             payload: Slack message payload (Block Kit format)
             
         Returns:
-            True if sent successfully
+            True if sent successfully (queued, when batch_outbound is on)
         """
         if not self.enabled:
             logger.debug("Slack notifications disabled, skipping")
@@ -104,9 +125,48 @@ class SlackNotifier:
             logger.warning("Slack webhook URL not configured")
             return False
         
+        # Batched mode: accept into the rate-shaped queue instead of rejecting
+        if self.batch_outbound:
+            return await self.outbox.submit(payload)
+        
         if not await self._check_rate_limit():
             return False
         
+        return await self._post_payload(payload)
+    
+    @staticmethod
+    def _count_blocks(payload: Dict[str, Any]) -> int:
+        """Number of blocks a payload contributes to a merged message (incl. its divider)"""
+        count = len(payload.get("blocks", []))
+        for attachment in payload.get("attachments", []):
+            count += len(attachment.get("blocks", [])) or 1
+        return count + 1  # divider inserted between merged payloads
+    
+    async def _send_batch(self, payloads: List[Dict[str, Any]]) -> bool:
+        """Send queued payloads merged into a single webhook call"""
+        if len(payloads) == 1:
+            return await self._post_payload(payloads[0])
+        
+        merged: Dict[str, Any] = {"blocks": [], "attachments": []}
+        texts = []
+        for payload in payloads:
+            if merged["blocks"] and payload.get("blocks"):
+                merged["blocks"].append({"type": "divider"})
+            merged["blocks"].extend(payload.get("blocks", []))
+            merged["attachments"].extend(payload.get("attachments", []))
+            if payload.get("text"):
+                texts.append(payload["text"])
+            if payload.get("channel"):
+                merged["channel"] = payload["channel"]
+        
+        # Batches are capped at MAX_BLOCKS by weight (blocks + divider), so nothing is cut here
+        if texts:
+            merged["text"] = "\n".join(texts)
+        
+        return await self._post_payload({k: v for k, v in merged.items() if v})
+    
+    async def _post_payload(self, payload: Dict[str, Any]) -> bool:
+        """POST a payload to the Incoming Webhook"""
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.post(
@@ -615,6 +675,7 @@ class SlackNotifier:
             "enabled": self.enabled,
             "rate_limit_per_minute": self.rate_limit,
             "messages_in_last_minute": len(self._message_times),
+            **({"outbound": self.outbox.get_stats()} if self.batch_outbound else {}),
         }
     
     def update_settings(
@@ -634,6 +695,7 @@ class SlackNotifier:
         
         if rate_limit is not None:
             self.rate_limit = rate_limit
+            self.outbox.max_per_minute = rate_limit
             logger.info(f"Rate limit set to: {rate_limit}/min")
 
 
@@ -643,6 +705,7 @@ class SlackNotifier:
 
 def create_slack_notifier(
     webhook_url: Optional[str] = None,
+    batch_outbound: bool = False,
 ) -> SlackNotifier:
     """
     Create a SlackNotifier instance from environment variables.
@@ -680,4 +743,5 @@ def create_slack_notifier(
         enabled=enabled,
         rate_limit_per_minute=rate_limit,
         channel_overrides=channel_overrides,
+        batch_outbound=batch_outbound,
     )
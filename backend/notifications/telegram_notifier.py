@@ -20,6 +20,8 @@ from enum import Enum
 
 import aiohttp
 
+from .dispatcher import OutboundBatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,6 +52,9 @@ class TelegramNotifier:
         await notifier.send_daily_report(portfolio)
     """
     
+    MAX_MESSAGE_LENGTH = 4096
+    BATCH_SEPARATOR = "\n\n"
+    
     def __init__(
         self,
         bot_token: str,
@@ -58,6 +63,7 @@ class TelegramNotifier:
         rate_limit_per_minute: int = 20,
         min_priority: Optional['AlertPriority'] = None,
         throttle_minutes: int = 5,
+        batch_outbound: bool = False,
     ):
         """
         Initialize Telegram notifier.
@@ -69,6 +75,8 @@ class TelegramNotifier:
             rate_limit_per_minute: Max messages per minute
             min_priority: Minimum priority level to send (defaults to NORMAL)
             throttle_minutes: Message throttle window in minutes
+            batch_outbound: Queue messages and send them rate-shaped,
+                merging queued messages up to Telegram's 4096-char limit
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
@@ -89,6 +97,18 @@ class TelegramNotifier:
             "rate_limited": 0,
         }
         
+        # Outbound queue (Telegram: ~1 msg/sec per chat, 4096 chars per message)
+        self.batch_outbound = batch_outbound
+        self.outbox = OutboundBatcher(
+            self._send_batch,
+            name="telegram",
+            min_interval=1.0,
+            max_per_minute=rate_limit_per_minute,
+            max_batch_weight=self.MAX_MESSAGE_LENGTH,
+            weigh=lambda m: len(m["text"]) + len(self.BATCH_SEPARATOR),
+            group_key=lambda m: (m["parse_mode"], m["disable_notification"]),
+        )
+        
         logger.info(f"TelegramNotifier initialized (enabled={enabled})")
     
     async def _check_rate_limit(self) -> bool:
@@ -122,22 +142,41 @@ class TelegramNotifier:
             disable_notification: Silent message
         
         Returns:
-            True if sent successfully
+            True if sent successfully (queued, when batch_outbound is on)
         """
         if not self.enabled:
             logger.debug("Notifications disabled, skipping")
             return False
         
+        message = {
+            "text": text,
+            "parse_mode": parse_mode,
+            "disable_notification": disable_notification,
+        }
+        
+        # Batched mode: accept into the rate-shaped queue instead of rejecting
+        if self.batch_outbound:
+            return await self.outbox.submit(message)
+        
         if not await self._check_rate_limit():
             return False
         
+        return await self._post_message(message)
+    
+    async def _send_batch(self, messages: List[Dict[str, Any]]) -> bool:
+        """Send queued messages merged into a single Telegram message"""
+        return await self._post_message({
+            **messages[0],
+            "text": self.BATCH_SEPARATOR.join(m["text"] for m in messages),
+        })
+    
+    async def _post_message(self, message: Dict[str, Any]) -> bool:
+        """POST sendMessage to the Telegram Bot API"""
         try:
             url = f"{self.base_url}/sendMessage"
             payload = {
                 "chat_id": self.chat_id,
-                "text": text,
-                "parse_mode": parse_mode,
-                "disable_notification": disable_notification,
+                **message,
             }
             
             async with aiohttp.ClientSession() as session:
@@ -591,9 +630,12 @@ Ready to receive trading signals.
             f"<code>⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</code>"
         )
     
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """Get notification statistics"""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        if self.batch_outbound:
+            stats["outbound"] = self.outbox.get_stats()
+        return stats
 
 
 # Convenience function for quick notifications
@@ -616,7 +658,8 @@ def create_telegram_notifier(
     bot_token: Optional[str] = None,
     chat_id: Optional[str] = None,
     enabled: bool = True,
-    min_priority: AlertPriority = AlertPriority.HIGH
+    min_priority: AlertPriority = AlertPriority.HIGH,
+    batch_outbound: bool = False,
 ) -> Optional[TelegramNotifier]:
     """
     Factory function to create TelegramNotifier instance.
@@ -626,6 +669,7 @@ def create_telegram_notifier(
         chat_id: Telegram chat ID (from environment if not provided)
         enabled: Whether notifications are enabled
         min_priority: Minimum priority level for notifications
+        batch_outbound: Rate-shape and batch outgoing messages
 
     Returns:
         TelegramNotifier instance or None if credentials not available
@@ -642,5 +686,6 @@ def create_telegram_notifier(
     return TelegramNotifier(
         bot_token=token,
         chat_id=chat,
-        enabled=enabled
+        enabled=enabled,
+        batch_outbound=batch_outbound,
     )
\ No newline at end of file
@@ -22,6 +22,24 @@ from dataclasses import dataclass
 import yfinance as yf
 from collections import defaultdict
 
+# Shared batch price fetcher (bulk download + cross-caller cache)
+try:
+    from backend.market_data.price_fetcher import PriceFetcher, get_price_fetcher
+    BATCH_FETCHER_AVAILABLE = True
+except ImportError:
+    BATCH_FETCHER_AVAILABLE = False
+    PriceFetcher = None
+    get_price_fetcher = None
+
+# Shared market snapshot service (snapshot prices within the session price TTL)
+try:
+    from backend.market_data.snapshot_service import MarketSnapshotService, get_market_snapshot_service
+    SNAPSHOT_SERVICE_AVAILABLE = True
+except ImportError:
+    SNAPSHOT_SERVICE_AVAILABLE = False
+    MarketSnapshotService = None
+    get_market_snapshot_service = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,16 +80,32 @@ class MarketDataFetcher:
     - Batch fetching
     """
 
-    def __init__(self, cache_ttl_seconds: int = 15):
+    def __init__(
+        self,
+        cache_ttl_seconds: int = 15,
+        price_fetcher: Optional["PriceFetcher"] = None,
+        snapshot_service: Optional["MarketSnapshotService"] = None,
+        price_bus=None,
+    ):
         """
         Initialize market data fetcher.
 
         Args:
             cache_ttl_seconds: Cache time-to-live for quotes
+            price_fetcher: Batch price fetcher (defaults to the shared instance)
+            snapshot_service: Shared market snapshot service
+                (defaults to the shared instance unless a price_fetcher is given)
+            price_bus: Realtime price bus; streamed quotes newer than the cache TTL
+                are used without a fetch
         """
         self.cache_ttl = cache_ttl_seconds
         self._price_cache: Dict[str, MarketQuote] = {}
         self._ticker_objects: Dict[str, yf.Ticker] = {}
+        if snapshot_service is None and price_fetcher is None and SNAPSHOT_SERVICE_AVAILABLE:
+            snapshot_service = get_market_snapshot_service()
+        self.snapshot_service = snapshot_service
+        self.price_bus = price_bus
+        self.price_fetcher = price_fetcher or (get_price_fetcher() if BATCH_FETCHER_AVAILABLE else None)
 
         logger.info(f"Market Data Fetcher initialized (cache TTL: {cache_ttl_seconds}s)")
 
@@ -120,6 +154,9 @@ class MarketDataFetcher:
                 logger.debug(f"Using cached price for {ticker}: ${cached_quote.price:.2f}")
                 return cached_quote
 
+        if self.snapshot_service is not None:
+            return (await self._get_quotes_bulk([ticker], use_cache=False)).get(ticker)
+
         # Fetch fresh data
         try:
             # Get or create ticker object
@@ -176,6 +213,9 @@ class MarketDataFetcher:
         Returns:
             Dictionary mapping ticker to MarketQuote
         """
+        if self.price_bus is not None or self.snapshot_service is not None or self.price_fetcher is not None:
+            return await self._get_quotes_bulk(tickers)
+
         quotes = {}
 
         # Fetch concurrently
@@ -191,6 +231,53 @@ class MarketDataFetcher:
         logger.info(f"Fetched {len(quotes)}/{len(tickers)} quotes")
         return quotes
 
+    async def _get_quotes_bulk(self, tickers: List[str], use_cache: bool = True) -> Dict[str, MarketQuote]:
+        """
+        Fetch all cache misses in one batch request via the shared snapshot
+        service (or the shared PriceFetcher).
+
+        Falls back to the last known (stale) quote for tickers that fail.
+        """
+        now = datetime.now()
+        quotes: Dict[str, MarketQuote] = {}
+        missing = []
+
+        for ticker in tickers:
+            cached = self._price_cache.get(ticker)
+            if use_cache and cached and (now - cached.timestamp).total_seconds() < self.cache_ttl:
+                quotes[ticker] = cached
+            else:
+                missing.append(ticker)
+
+        if missing and self.price_bus is not None:
+            streamed = self.price_bus.last_prices(missing, max_age=self.cache_ttl)
+            for ticker, price in streamed.items():
+                if price:
+                    quote = MarketQuote(ticker=ticker, price=price, timestamp=now)
+                    self._price_cache[ticker] = quote
+                    quotes[ticker] = quote
+            missing = [t for t in missing if t not in quotes]
+
+        if missing and (self.snapshot_service is not None or self.price_fetcher is not None):
+            if self.snapshot_service is not None:
+                prices = await self.snapshot_service.get_prices(missing, max_age=self.cache_ttl)
+            else:
+                prices = await self.price_fetcher.get_prices_async(missing, max_age=self.cache_ttl)
+            fetched_at = datetime.now()
+
+            for ticker in missing:
+                price = prices.get(ticker)
+                if price:
+                    quote = MarketQuote(ticker=ticker, price=price, timestamp=fetched_at)
+                    self._price_cache[ticker] = quote
+                    quotes[ticker] = quote
+                elif ticker in self._price_cache:
+                    logger.warning(f"Using stale cached price for {ticker}")
+                    quotes[ticker] = self._price_cache[ticker]
+
+        logger.info(f"Fetched {len(quotes)}/{len(tickers)} quotes ({len(missing)} from source)")
+        return quotes
+
     def get_cached_price(self, ticker: str) -> Optional[float]:
         """
         Get cached price without fetching.
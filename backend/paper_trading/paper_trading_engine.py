@@ -82,17 +82,21 @@ class PaperTradingEngine:
     - Performance tracking
     """
 
-    def __init__(self, config: PaperTradingConfig):
+    def __init__(self, config: PaperTradingConfig, price_bus=None):
         """
         Initialize paper trading engine.
 
         Args:
             config: Paper trading configuration
+            price_bus: Realtime price bus (marks positions on every tick and
+                serves decision-loop quotes from its last-value cache)
         """
         self.config = config
+        self.price_bus = price_bus
+        self._price_listener: Optional[int] = None
 
         # Core components
-        self.market_data = MarketDataFetcher(cache_ttl_seconds=15)
+        self.market_data = MarketDataFetcher(cache_ttl_seconds=15, price_bus=price_bus)
         self.portfolio = LivePortfolio(
             initial_cash=config.initial_cash,
             commission_rate=config.commission_rate,
@@ -359,6 +363,10 @@ class PaperTradingEngine:
 
     # ===== Main Loop =====
 
+    def _on_quote(self, quote):
+        """Mark the portfolio on each streamed tick (no fetch)."""
+        self.portfolio.update_prices({quote.symbol: quote.price})
+
     async def _trading_loop(self):
         """Main trading loop."""
         logger.info("Trading loop started")
@@ -467,8 +475,19 @@ class PaperTradingEngine:
             except Exception as e:
                 logger.warning(f"Failed to send Telegram startup notification: {e}")
 
+        # Mark positions from the realtime price bus between decision cycles
+        if self.price_bus is not None:
+            self.price_bus.track(self.config.tickers)
+            self._price_listener = self.price_bus.on_quote(self._on_quote, self.config.tickers)
+
         # Start trading loop
-        await self._trading_loop()
+        try:
+            await self._trading_loop()
+        finally:
+            if self.price_bus is not None and self._price_listener is not None:
+                self.price_bus.remove_listener(self._price_listener)
+                self.price_bus.untrack(self.config.tickers)
+                self._price_listener = None
 
     def stop(self):
         """Stop paper trading."""
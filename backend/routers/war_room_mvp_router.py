@@ -29,8 +29,11 @@ from execution.shadow_trading_mvp import ShadowTradingMVP, ShadowTradingStatus
 # PostgreSQL 사용 (backend.database.repository)
 from backend.database.repository import get_sync_session
 from backend.ai.mvp.data_helper import prepare_additional_data
-from backend.ai.mvp.enhanced_data_provider import EnhancedDataProvider
-import yfinance as yf
+from backend.market_data.snapshot_service import (
+    build_market_data,
+    fallback_market_data,
+    get_market_snapshot_service,
+)
 
 # ============================================================================
 # Feature Flag for Skill Mode
@@ -102,148 +105,16 @@ class ShadowTradeRequest(BaseModel):
 
 def fetch_market_data(symbol: str) -> Dict[str, Any]:
     """
-    Fetch real-time market data for a symbol using yfinance
+    Fetch market data for a symbol synchronously (bypasses the shared snapshot cache)
 
     Returns:
         market_data dict with price_data and market_conditions
     """
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        hist = ticker.history(period="60d")  # 60 days for technical indicators
-
-        if hist.empty:
-            # Fallback to minimal data
-            return {
-                "price_data": {
-                    "current_price": 0,
-                    "open": 0,
-                    "high": 0,
-                    "low": 0,
-                    "volume": 0,
-                    "high_52w": 0,
-                    "low_52w": 0
-                },
-                "technical_data": {
-                    "rsi": 50,
-                    "macd": {"value": 0, "signal": 0},
-                    "moving_averages": {"ma50": 0, "ma200": 0}
-                },
-                "market_conditions": {
-                    "is_market_open": False,
-                    "volatility": 0,
-                    "vix": 15,
-                    "market_sentiment": 0.5
-                }
-            }
-
-        latest = hist.iloc[-1]
-        current_price = float(latest['Close'])
-
-        # Calculate volatility
-        volatility = float(hist['Close'].pct_change().std() * 100) if len(hist) > 1 else 0
-
-        # Calculate RSI (14-day)
-        def calculate_rsi(prices, period=14):
-            if len(prices) < period:
-                return 50
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return float(rsi.iloc[-1]) if not rsi.empty else 50
-
-        rsi = calculate_rsi(hist['Close'])
-
-        # Calculate MACD
-        exp12 = hist['Close'].ewm(span=12, adjust=False).mean()
-        exp26 = hist['Close'].ewm(span=26, adjust=False).mean()
-        macd = exp12 - exp26
-        signal = macd.ewm(span=9, adjust=False).mean()
-        
-        # Moving Averages
-        ma50 = float(hist['Close'].rolling(window=50).mean().iloc[-1]) if len(hist) >= 50 else current_price
-        ma200 = float(hist['Close'].rolling(window=200).mean().iloc[-1]) if len(hist) >= 200 else current_price
-
-        # Fetch VIX (market volatility index)
-        vix_value = 15  # Default
-        try:
-            vix_ticker = yf.Ticker("^VIX")
-            vix_hist = vix_ticker.history(period="1d")
-            if not vix_hist.empty:
-                vix_value = float(vix_hist['Close'].iloc[-1])
-        except:
-            pass
-
-        # Market sentiment based on price vs MA50
-        market_sentiment = 0.6 if current_price > ma50 else 0.4
-        
-        # [Phase 3] Enhanced Data Fetching
-        print(f"📊 [Enhanced] Fetching Multi-TF, Options, Events for {symbol}...")
-        multi_tf_data = EnhancedDataProvider.get_multi_timeframe_data(symbol)
-        option_data = EnhancedDataProvider.get_option_data(symbol)
-        event_data = EnhancedDataProvider.get_event_proximity(symbol)
-
-        return {
-            "price_data": {
-                "current_price": current_price,
-                "open": float(latest['Open']),
-                "high": float(latest['High']),
-                "low": float(latest['Low']),
-                "volume": int(latest['Volume']),
-                "high_52w": float(info.get('fiftyTwoWeekHigh', current_price * 1.2)),
-                "low_52w": float(info.get('fiftyTwoWeekLow', current_price * 0.8))
-            },
-            "technical_data": {
-                "rsi": round(rsi, 2),
-                "macd": {
-                    "value": round(float(macd.iloc[-1]), 2),
-                    "signal": round(float(signal.iloc[-1]), 2)
-                },
-                "moving_averages": {
-                    "ma50": round(ma50, 2),
-                    "ma200": round(ma200, 2)
-                }
-            },
-            "market_conditions": {
-                "is_market_open": True,
-                "volatility": round(volatility, 2),
-                "vix": round(vix_value, 2),
-                "market_sentiment": market_sentiment,
-                "market_cap": info.get('marketCap', 0),
-                "sector": info.get('sector', 'Unknown'),
-                "industry": info.get('industry', 'Unknown')
-            },
-            "multi_timeframe": multi_tf_data,
-            "option_data": option_data,
-            "events": event_data
-        }
+        return build_market_data(symbol)
     except Exception as e:
         print(f"⚠️  Failed to fetch market data for {symbol}: {e}")
-        # Return minimal fallback data
-        return {
-            "price_data": {
-                "current_price": 0,
-                "open": 0,
-                "high": 0,
-                "low": 0,
-                "volume": 0,
-                "high_52w": 0,
-                "low_52w": 0
-            },
-            "technical_data": {
-                "rsi": 50,
-                "macd": {"value": 0, "signal": 0},
-                "moving_averages": {"ma50": 0, "ma200": 0}
-            },
-            "market_conditions": {
-                "is_market_open": False,
-                "volatility": 0,
-                "vix": 15,
-                "market_sentiment": 0.5
-            }
-        }
+        return fallback_market_data()
 
 
 # ============================================================================
@@ -288,9 +159,11 @@ async def deliberate(request: DeliberationRequest, db: Session = Depends(get_syn
         # Task A: Fetch Market Data (if missing)
         market_data_task = None
         if not request.market_data:
-            print(f"📊 [Async] Fetching real-time market data for {request.symbol}...")
-            # Run blocking yfinance calls in thread pool
-            market_data_task = loop.run_in_executor(None, fetch_market_data, request.symbol)
+            # Shared snapshot (session-aware TTL, concurrent requests share one refresh);
+            # deliberated symbols join the background-refresh watchlist
+            snapshot_service = get_market_snapshot_service()
+            snapshot_service.watch([request.symbol])
+            market_data_task = asyncio.create_task(snapshot_service.get_market_data(request.symbol))
         else:
              # Already provided
              market_data_task = asyncio.create_task(asyncio.sleep(0, result=request.market_data))
@@ -602,13 +475,16 @@ async def get_shadow_status() -> Dict[str, Any]:
         # 포지션 세부 정보 추가
         open_positions = []
         if hasattr(shadow_trading, 'open_positions') and shadow_trading.open_positions:
+            # 현재 가격 일괄 조회 (공유 스냅샷/가격 캐시)
+            try:
+                prices = await get_market_snapshot_service().get_prices(
+                    {trade.symbol for trade in shadow_trading.open_positions.values()}
+                )
+            except Exception:
+                prices = {}
+
             for trade_id, trade in shadow_trading.open_positions.items():
-                # 현재 가격 조회 (실시간)
-                try:
-                    ticker = yf.Ticker(trade.symbol)
-                    current_price = float(ticker.history(period="1d")['Close'].iloc[-1])
-                except:
-                    current_price = trade.entry_price  # Fallback
+                current_price = prices.get(trade.symbol) or trade.entry_price  # Fallback
                 
                 # P&L 계산
                 try:
@@ -20,6 +20,12 @@ from datetime import datetime
 
 from paper_trading import PaperTradingEngine, PaperTradingConfig
 
+try:
+    from backend.market_data.price_bus import start_price_bus_from_env
+except ImportError:
+    # Run from backend/ without the repo root on PYTHONPATH
+    start_price_bus_from_env = None
+
 
 def parse_duration(duration_str: str) -> int:
     """
@@ -191,8 +197,11 @@ async def main():
     print(f"  Mode:                {'Quick Test' if args.quick else 'Full Trading'}")
     print("=" * 70)
 
+    # Realtime price bus (PRICE_BUS_SOURCE=poll|kis|off): positions are marked on every tick
+    price_bus = start_price_bus_from_env() if start_price_bus_from_env else None
+
     # Create engine
-    engine = PaperTradingEngine(config)
+    engine = PaperTradingEngine(config, price_bus=price_bus)
 
     try:
         if args.continuous:
@@ -211,6 +220,9 @@ async def main():
         engine.stop()
         await asyncio.sleep(1)  # Give time for graceful shutdown
 
+    if price_bus:
+        await price_bus.stop()
+
     # Print final summary
     print("\n")
     engine.print_summary()
@@ -0,0 +1,758 @@
+"""
+Scheduler Runtime - 주기 작업 통합 실행기 (전용 워커 프로세스)
+
+서비스마다 각자 APScheduler 인스턴스를 띄우거나 (stock_price_scheduler,
+daily_report_scheduler, ...) main.py lifespan 에서 `while self.is_running` 루프를
+asyncio task 로 돌리던 주기 작업을 하나의 런타임이 소유합니다. 기본값
+(SCHEDULER_MODE=embedded) 은 API 프로세스 안에서 실행하고, 전용 워커
+`python -m backend.schedulers.scheduler_runtime` 를 띄우는 배포는 API 를
+SCHEDULER_MODE=worker 로 두어 요청만 처리하게 합니다 (docker-compose.prod.yml).
+
+- 중복 실행 방지: 작업당 1 인스턴스 (APScheduler max_instances=1 + 실행 중 집합)
+  + DB 작업 잠금 (lease + heartbeat) → 여러 프로세스가 떠도 같은 작업은 한 곳에서만
+- 동시성 클래스: llm / broker / yfinance / db_heavy / default 별 세마포어
+  (SCHEDULER_CONCURRENCY="llm=2,broker=1" 로 조정)
+- misfire: misfire_grace_seconds 이내 지연은 실행, 밀린 실행은 coalesce 로 한 번만.
+  재시작으로 놓친 cron 실행은 이력과 비교해 시작 시 한 번 catch-up
+- jitter: 트리거 jitter (같은 시각 작업들이 외부 API 를 동시에 두드리지 않도록)
+- 실행 이력: scheduler_job_runs 테이블 (상태, 대기/실행 시간 ms, 오류)
+- Shadow Trader 는 PriceBus 마지막 체결가를 쓰므로 워커 프로세스도 자체 버스를 시작
+  (PRICE_BUS_SOURCE, API 와 동일)
+
+Usage:
+    python -m backend.schedulers.scheduler_runtime
+    python -m backend.schedulers.scheduler_runtime --list
+    python -m backend.schedulers.scheduler_runtime --run-now news_poller
+    SCHEDULER_JOB_GROUPS=stock_prices,reports,correlation python -m backend.schedulers.scheduler_runtime
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    create_engine,
+    event,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+
+# 동시성 클래스별 동시 실행 수 (SCHEDULER_CONCURRENCY 로 덮어씀)
+DEFAULT_CONCURRENCY_CLASSES = {
+    "llm": 2,
+    "broker": 1,
+    "yfinance": 2,
+    "db_heavy": 2,
+    "default": 4,
+}
+
+# 프로젝트 루트 기준 data 디렉토리 (API 와 워커의 실행 디렉토리가 달라도 같은 이력 DB 사용)
+DEFAULT_HISTORY_DB_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "scheduler_runs.db"
+
+# 작업 잠금 lease (실행 중에는 heartbeat 로 연장, 프로세스가 죽으면 만료)
+LOCK_LEASE_SECONDS = 120
+
+metadata = MetaData()
+
+scheduler_job_runs = Table(
+    "scheduler_job_runs",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("job_id", String(64), nullable=False),
+    Column("run_type", String(16), nullable=False),   # scheduled / manual / catch_up
+    Column("concurrency_class", String(32), nullable=False),
+    Column("status", String(16), nullable=False),     # success / failed / timeout / skipped / missed
+    Column("attempt", Integer, nullable=False, default=1),
+    Column("scheduled_at", DateTime),
+    Column("started_at", DateTime, nullable=False),
+    Column("finished_at", DateTime),
+    Column("wait_ms", Integer),
+    Column("duration_ms", Integer),
+    Column("error", Text),
+    Column("host", String(128)),
+)
+
+Index("idx_scheduler_job_runs_job_started", scheduler_job_runs.c.job_id, scheduler_job_runs.c.started_at)
+
+scheduler_job_locks = Table(
+    "scheduler_job_locks",
+    metadata,
+    Column("job_id", String(64), primary_key=True),
+    Column("owner", String(128)),
+    Column("locked_until", DateTime),
+)
+
+
+def parse_concurrency_classes(spec: Optional[str]) -> Dict[str, int]:
+    """"llm=2,broker=1" → 기본값에 덮어쓴 클래스별 동시 실행 수 (최소 1)"""
+    classes = dict(DEFAULT_CONCURRENCY_CLASSES)
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        name, _, count = item.partition("=")
+        classes[name.strip()] = max(1, int(count))
+    return classes
+
+
+@dataclass
+class ScheduledJob:
+    """
+    런타임에 등록하는 주기 작업
+
+    func 는 코루틴 함수 또는 일반 함수 (스레드에서 실행). jitter 는 트리거에 적용되고,
+    retries 는 같은 실행 안에서의 재시도 (대기 중에는 동시성 슬롯을 잡지 않음).
+    timeout 은 코루틴 작업만 취소됩니다 (스레드 작업은 기록만 timeout).
+    """
+    id: str
+    func: Callable[[], Any]
+    trigger: Any
+    concurrency_class: str = "default"
+    name: Optional[str] = None
+    jitter_seconds: Optional[int] = None
+    misfire_grace_seconds: int = 300
+    coalesce: bool = True
+    timeout_seconds: Optional[float] = None
+    retries: int = 0
+    retry_delay_seconds: float = 300.0
+    catch_up: bool = True
+
+
+class JobRunHistory:
+    """
+    작업 실행 이력 + 프로세스 간 작업 잠금 (Postgres 또는 SQLite)
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.is_sqlite = url.startswith("sqlite")
+        if self.is_sqlite:
+            db_path = url.split(":///", 1)[-1]
+            if db_path and db_path != ":memory:" and os.path.dirname(db_path):
+                os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self.engine = create_engine(url, connect_args={"timeout": 30})
+            event.listen(self.engine, "connect", _sqlite_on_connect)
+        else:
+            self.engine = create_engine(url.replace("postgresql+asyncpg://", "postgresql://"), pool_pre_ping=True)
+
+        metadata.create_all(self.engine)
+
+    def record(self, run: Dict[str, Any]):
+        with self.engine.begin() as conn:
+            conn.execute(scheduler_job_runs.insert().values(**run))
+
+    def recent(self, job_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 실행 (최신순)"""
+        query = select(scheduler_job_runs)
+        if job_id:
+            query = query.where(scheduler_job_runs.c.job_id == job_id)
+        query = query.order_by(scheduler_job_runs.c.id.desc()).limit(limit)
+        with self.engine.connect() as conn:
+            return [dict(row) for row in conn.execute(query).mappings().all()]
+
+    def last_started(self, job_id: str) -> Optional[datetime]:
+        """마지막 실제 실행 시작 시각 (skipped/missed 제외)"""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(func.max(scheduler_job_runs.c.started_at)).where(and_(
+                    scheduler_job_runs.c.job_id == job_id,
+                    scheduler_job_runs.c.status.in_(("success", "failed", "timeout")),
+                ))
+            ).scalar()
+
+    def summary(self, since: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """작업별 실행 수/상태별 수/평균·최대 실행 시간 (since 이후)"""
+        query = select(
+            scheduler_job_runs.c.job_id,
+            scheduler_job_runs.c.status,
+            func.count(),
+            func.avg(scheduler_job_runs.c.duration_ms),
+            func.max(scheduler_job_runs.c.duration_ms),
+            func.max(scheduler_job_runs.c.started_at),
+        ).group_by(scheduler_job_runs.c.job_id, scheduler_job_runs.c.status)
+        if since:
+            query = query.where(scheduler_job_runs.c.started_at >= since)
+
+        summary: Dict[str, Dict[str, Any]] = {}
+        with self.engine.connect() as conn:
+            for job_id, status, count, avg_ms, max_ms, last in conn.execute(query).all():
+                job = summary.setdefault(job_id, {"runs": 0, "by_status": {}, "last_started": None})
+                job["runs"] += count
+                job["by_status"][status] = count
+                job["last_started"] = max(filter(None, (job["last_started"], last)), default=None)
+                if status == "success":
+                    job["avg_duration_ms"] = round(avg_ms or 0)
+                    job["max_duration_ms"] = max_ms
+        return summary
+
+    def try_lock(self, job_id: str, owner: str, lease_seconds: int = LOCK_LEASE_SECONDS) -> bool:
+        """작업 잠금 획득 (다른 소유자의 lease 가 살아 있으면 False)"""
+        now = datetime.now()
+        until = now + timedelta(seconds=lease_seconds)
+        with self.engine.begin() as conn:
+            acquired = conn.execute(update(scheduler_job_locks).where(and_(
+                scheduler_job_locks.c.job_id == job_id,
+                or_(
+                    scheduler_job_locks.c.owner.is_(None),
+                    scheduler_job_locks.c.owner == owner,
+                    scheduler_job_locks.c.locked_until < now,
+                ),
+            )).values(owner=owner, locked_until=until)).rowcount
+            if acquired:
+                return True
+            exists = conn.execute(
+                select(scheduler_job_locks.c.job_id).where(scheduler_job_locks.c.job_id == job_id)
+            ).first()
+        if exists:
+            return False
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(scheduler_job_locks.insert().values(job_id=job_id, owner=owner, locked_until=until))
+            return True
+        except IntegrityError:
+            return False  # 동시에 다른 프로세스가 먼저 생성
+
+    def extend_lock(self, job_id: str, owner: str, lease_seconds: int = LOCK_LEASE_SECONDS) -> bool:
+        with self.engine.begin() as conn:
+            return bool(conn.execute(update(scheduler_job_locks).where(and_(
+                scheduler_job_locks.c.job_id == job_id,
+                scheduler_job_locks.c.owner == owner,
+            )).values(locked_until=datetime.now() + timedelta(seconds=lease_seconds))).rowcount)
+
+    def unlock(self, job_id: str, owner: str):
+        with self.engine.begin() as conn:
+            conn.execute(update(scheduler_job_locks).where(and_(
+                scheduler_job_locks.c.job_id == job_id,
+                scheduler_job_locks.c.owner == owner,
+            )).values(owner=None, locked_until=None))
+
+
+class SchedulerRuntime:
+    """
+    주기 작업 런타임 (AsyncIOScheduler + 동시성 클래스 + 실행 이력)
+
+    모든 실행은 _execute() 를 거칩니다: 중복 확인 → 작업 잠금 → 클래스 세마포어 대기
+    → 실행 (timeout) → 이력 기록 → 필요 시 재시도.
+    """
+
+    def __init__(
+        self,
+        history: JobRunHistory,
+        concurrency: Optional[Dict[str, int]] = None,
+        owner: Optional[str] = None,
+        timezone: Optional[str] = None,
+    ):
+        self.history = history
+        self.concurrency = concurrency or parse_concurrency_classes(os.getenv("SCHEDULER_CONCURRENCY"))
+        self.owner = owner or f"{socket.gethostname()}-{os.getpid()}"
+
+        scheduler_kwargs = {"timezone": timezone} if timezone else {}
+        self.scheduler = AsyncIOScheduler(
+            job_defaults={"max_instances": 1, "coalesce": True},
+            **scheduler_kwargs,
+        )
+        self.scheduler.add_listener(self._on_scheduler_event, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._running: set = set()
+
+        self.stats = {
+            "runs": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "skipped_overlap": 0,
+            "skipped_locked": 0,
+            "missed": 0,
+            "catch_up_runs": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 등록 / 시작 / 종료
+    # ------------------------------------------------------------------
+
+    def add_job(self, job: ScheduledJob):
+        """작업 등록 (같은 id 는 교체)"""
+        if job.concurrency_class not in self.concurrency:
+            raise ValueError(f"Unknown concurrency class '{job.concurrency_class}' for job {job.id}")
+        if job.jitter_seconds and hasattr(job.trigger, "jitter"):
+            job.trigger.jitter = job.jitter_seconds
+
+        self.jobs[job.id] = job
+        self.scheduler.add_job(
+            self._execute,
+            trigger=job.trigger,
+            args=[job.id],
+            id=job.id,
+            name=job.name or job.id,
+            coalesce=job.coalesce,
+            misfire_grace_time=job.misfire_grace_seconds,
+            max_instances=1,
+            replace_existing=True,
+        )
+
+    def start(self):
+        """스케줄러 시작 (실행 중인 이벤트 루프 필요) + 재시작 중 놓친 cron 실행 catch-up"""
+        self.scheduler.start()
+        for job_id in self._missed_while_down():
+            self.stats["catch_up_runs"] += 1
+            logger.info(f"Scheduler: catching up missed run of {job_id}")
+            asyncio.get_running_loop().create_task(self._execute(job_id, run_type="catch_up"))
+        logger.info(
+            f"Scheduler runtime started: {len(self.jobs)} jobs, classes={self.concurrency}, owner={self.owner}"
+        )
+
+    def shutdown(self, wait: bool = False):
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=wait)
+        logger.info("Scheduler runtime stopped")
+
+    async def run_now(self, job_id: str) -> Optional[str]:
+        """즉시 한 번 실행 (스케줄과 같은 중복/잠금/동시성 규칙), 최종 상태 반환"""
+        return await self._execute(job_id, run_type="manual")
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+
+    async def _execute(self, job_id: str, run_type: str = "scheduled") -> Optional[str]:
+        job = self.jobs[job_id]
+        scheduled_at = datetime.now()
+
+        if job_id in self._running:
+            self.stats["skipped_overlap"] += 1
+            await self._record(job, run_type, "skipped", scheduled_at, error="previous run still in progress")
+            return "skipped"
+
+        self._running.add(job_id)
+        try:
+            if not await asyncio.to_thread(self.history.try_lock, job_id, self.owner):
+                self.stats["skipped_locked"] += 1
+                await self._record(job, run_type, "skipped", scheduled_at, error="locked by another scheduler")
+                return "skipped"
+
+            heartbeat = asyncio.get_running_loop().create_task(self._heartbeat(job_id))
+            try:
+                status = None
+                for attempt in range(1, job.retries + 2):
+                    status = await self._attempt(job, run_type, scheduled_at, attempt)
+                    if status == "success" or attempt > job.retries:
+                        break
+                    await asyncio.sleep(job.retry_delay_seconds)
+                return status
+            finally:
+                heartbeat.cancel()
+                await asyncio.to_thread(self.history.unlock, job_id, self.owner)
+        finally:
+            self._running.discard(job_id)
+
+    async def _attempt(self, job: ScheduledJob, run_type: str, scheduled_at: datetime, attempt: int) -> str:
+        queued = time.perf_counter()
+        async with self._semaphore(job.concurrency_class):
+            started_at = datetime.now()
+            began = time.perf_counter()
+            error = None
+            try:
+                call = job.func() if asyncio.iscoroutinefunction(job.func) else asyncio.to_thread(job.func)
+                await asyncio.wait_for(call, timeout=job.timeout_seconds)
+                status = "success"
+            except asyncio.TimeoutError:
+                status, error = "timeout", f"exceeded {job.timeout_seconds}s"
+            except Exception as e:
+                status, error = "failed", f"{type(e).__name__}: {e}"
+                logger.error(f"Scheduler job {job.id} failed (attempt {attempt}): {e}", exc_info=True)
+            finished = time.perf_counter()
+
+        self.stats["runs"] += 1
+        self.stats[{"success": "succeeded", "failed": "failed", "timeout": "timeouts"}[status]] += 1
+        await self._record(
+            job, run_type, status, scheduled_at,
+            attempt=attempt,
+            started_at=started_at,
+            finished_at=datetime.now(),
+            wait_ms=round((began - queued) * 1000),
+            duration_ms=round((finished - began) * 1000),
+            error=error,
+        )
+        return status
+
+    async def _heartbeat(self, job_id: str):
+        while True:
+            await asyncio.sleep(LOCK_LEASE_SECONDS / 3)
+            try:
+                await asyncio.to_thread(self.history.extend_lock, job_id, self.owner)
+            except Exception as e:
+                logger.warning(f"Scheduler: failed to extend lock for {job_id}: {e}")
+
+    def _semaphore(self, concurrency_class: str) -> asyncio.Semaphore:
+        # 이벤트 루프 안에서 생성 (embedded 모드에서도 uvicorn 루프에 묶이도록)
+        if concurrency_class not in self._semaphores:
+            self._semaphores[concurrency_class] = asyncio.Semaphore(self.concurrency[concurrency_class])
+        return self._semaphores[concurrency_class]
+
+    async def _record(self, job: ScheduledJob, run_type: str, status: str, scheduled_at: datetime, **fields):
+        run = {
+            "job_id": job.id,
+            "run_type": run_type,
+            "concurrency_class": job.concurrency_class,
+            "status": status,
+            "attempt": fields.pop("attempt", 1),
+            "scheduled_at": scheduled_at,
+            "started_at": fields.pop("started_at", scheduled_at),
+            "host": self.owner,
+            **fields,
+        }
+        try:
+            await asyncio.to_thread(self.history.record, run)
+        except Exception as e:
+            logger.warning(f"Scheduler: failed to record run of {job.id}: {e}")
+
+    def _on_scheduler_event(self, event):
+        """APScheduler misfire (grace 초과) / max_instances 건너뜀 → 이력 기록"""
+        job = self.jobs.get(event.job_id)
+        if job is None:
+            return
+        scheduled_at = event.scheduled_run_time.astimezone().replace(tzinfo=None)
+        if event.code == EVENT_JOB_MISSED:
+            self.stats["missed"] += 1
+            status, error = "missed", f"misfire grace {job.misfire_grace_seconds}s exceeded"
+        else:
+            self.stats["skipped_overlap"] += 1
+            status, error = "skipped", "previous run still in progress"
+        try:
+            self.history.record({
+                "job_id": job.id, "run_type": "scheduled", "concurrency_class": job.concurrency_class,
+                "status": status, "attempt": 1, "scheduled_at": scheduled_at, "started_at": datetime.now(),
+                "host": self.owner, "error": error,
+            })
+        except Exception as e:
+            logger.warning(f"Scheduler: failed to record {status} run of {job.id}: {e}")
+
+    def _missed_while_down(self) -> List[str]:
+        """cron 작업 중 grace 이내 발화 시각이 마지막 실행 이후인 작업 (프로세스 재시작으로 놓침)"""
+        now = datetime.now().astimezone()
+        missed = []
+        for job in self.jobs.values():
+            if not job.catch_up or not isinstance(job.trigger, CronTrigger):
+                continue
+            window_start = now - timedelta(seconds=job.misfire_grace_seconds)
+            fire_time = job.trigger.get_next_fire_time(None, window_start)
+            if fire_time is None or fire_time > now:
+                continue
+            last = self.history.last_started(job.id)
+            if last is None or last < fire_time.astimezone().replace(tzinfo=None):
+                missed.append(job.id)
+        return missed
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get_jobs(self) -> List[Dict[str, Any]]:
+        jobs = []
+        for job in self.jobs.values():
+            scheduled = self.scheduler.get_job(job.id)
+            next_run = getattr(scheduled, "next_run_time", None) if scheduled else None
+            jobs.append({
+                "id": job.id,
+                "name": job.name or job.id,
+                "trigger": str(job.trigger),
+                "concurrency_class": job.concurrency_class,
+                "next_run_time": next_run.isoformat() if next_run else None,
+                "running": job.id in self._running,
+            })
+        return jobs
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "owner": self.owner,
+            "jobs": len(self.jobs),
+            "running": sorted(self._running),
+            "concurrency": self.concurrency,
+        }
+
+
+def _sqlite_on_connect(dbapi_connection, connection_record):
+    """SQLite: WAL (이력 조회와 기록 동시 진행)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+# ============================================================================
+# 기본 작업 그룹 (기존 main.py lifespan / 개별 스케줄러가 돌리던 작업)
+# ============================================================================
+
+def _register_stock_prices(runtime: SchedulerRuntime):
+    from backend.services.stock_price_scheduler import get_stock_price_scheduler
+    get_stock_price_scheduler().register_jobs(runtime)
+
+
+def _register_reports(runtime: SchedulerRuntime):
+    from backend.services.daily_report_scheduler import get_daily_report_scheduler
+    get_daily_report_scheduler().register_jobs(runtime)
+
+
+def _register_learning(runtime: SchedulerRuntime):
+    from backend.ai.learning.daily_learning_scheduler import DailyLearningScheduler
+
+    # 10:00 KST (미국 장 마감 후), 16:00 KST (한국 장 마감 후)
+    learning = DailyLearningScheduler()
+    runtime.add_job(ScheduledJob(
+        id="daily_learning",
+        name="Daily Learning Cycle",
+        func=learning.run_once,
+        trigger=CronTrigger(hour="10,16", minute=0),
+        concurrency_class="llm",
+        retries=2,
+        retry_delay_seconds=300,
+    ))
+
+
+def _register_accountability(runtime: SchedulerRuntime):
+    from backend.automation.accountability_scheduler import AccountabilityScheduler
+
+    accountability = AccountabilityScheduler(run_interval_minutes=60, trigger_failure_learning=True)
+    runtime.add_job(ScheduledJob(
+        id="accountability_verification",
+        name="News Interpretation Accountability (hourly)",
+        func=accountability.run_once,
+        trigger=CronTrigger(minute=0),
+        concurrency_class="db_heavy",
+        retries=2,
+        retry_delay_seconds=300,
+        misfire_grace_seconds=900,
+    ))
+
+
+def _register_news_poller(runtime: SchedulerRuntime):
+    # 단독 크롤러를 돌리는 경우 (DISABLE_EMBEDDED_NEWS_POLLER=1) 등록하지 않음
+    if os.environ.get("DISABLE_EMBEDDED_NEWS_POLLER", "").lower() in ("1", "true", "yes"):
+        logger.info("News Poller disabled (DISABLE_EMBEDDED_NEWS_POLLER=1)")
+        return
+    from backend.services.news_poller import NewsPoller
+
+    poller = NewsPoller()
+    runtime.add_job(ScheduledJob(
+        id="news_poller",
+        name="News Poller",
+        func=poller.poll_and_process,
+        trigger=IntervalTrigger(seconds=poller.interval_seconds),
+        concurrency_class="llm",
+        jitter_seconds=15,
+        misfire_grace_seconds=60,
+        timeout_seconds=poller.interval_seconds * 3,
+    ))
+
+
+def _register_shadow_trader(runtime: SchedulerRuntime):
+    from backend.ai.trading.shadow_trader import ShadowTradingAgent
+
+    shadow_trader = ShadowTradingAgent()
+    runtime.add_job(ScheduledJob(
+        id="shadow_trader",
+        name="Shadow Trading Agent",
+        func=shadow_trader.process_signals,
+        trigger=IntervalTrigger(seconds=shadow_trader.interval_seconds),
+        concurrency_class="broker",
+        misfire_grace_seconds=30,
+        timeout_seconds=shadow_trader.interval_seconds * 5,
+    ))
+
+
+def _register_price_sync(runtime: SchedulerRuntime):
+    from backend.services.daily_price_sync import get_price_sync_scheduler
+    get_price_sync_scheduler().register_jobs(runtime)
+
+
+def _register_screener(runtime: SchedulerRuntime):
+    from backend.services.market_scanner.scheduler import get_scheduler
+    get_scheduler().register_jobs(runtime)
+
+
+def _register_correlation(runtime: SchedulerRuntime):
+    from backend.schedulers.correlation_scheduler import CorrelationScheduler
+    runtime.add_job(ScheduledJob(
+        id="asset_correlation",
+        name="Asset Correlation (30d/90d/1y)",
+        func=CorrelationScheduler().run_correlation_calculation,
+        trigger=CronTrigger(hour=1, minute=0),
+        concurrency_class="yfinance",
+        jitter_seconds=120,
+    ))
+
+
+def _register_failure_learning(runtime: SchedulerRuntime):
+    from backend.schedulers.failure_learning_scheduler import FailureLearningScheduler
+    runtime.add_job(ScheduledJob(
+        id="failure_learning",
+        name="Failure Learning (NIA weight adjustment)",
+        func=FailureLearningScheduler().run_daily_learning_cycle,
+        trigger=CronTrigger(hour=0, minute=0),
+        concurrency_class="llm",
+    ))
+
+
+def _register_kis_auto_trading(runtime: SchedulerRuntime):
+    from backend.automation.kis_auto_scheduler import KISAutoScheduler
+    KISAutoScheduler(is_virtual=os.getenv("KIS_IS_VIRTUAL", "true").lower() == "true").register_jobs(runtime)
+
+
+def _register_kis_portfolio_sync(runtime: SchedulerRuntime):
+    from backend.automation import kis_portfolio_scheduler
+    if not kis_portfolio_scheduler.AUTO_SYNC_ENABLED:
+        logger.info("KIS portfolio auto-sync disabled (KIS_AUTO_SYNC_ENABLED=false)")
+        return
+    kis_portfolio_scheduler.register_jobs(runtime, kis_portfolio_scheduler.AUTO_SYNC_INTERVAL)
+
+
+def _register_auto_trading(runtime: SchedulerRuntime):
+    from backend.automation.auto_trading_scheduler import AutoTradingScheduler
+    AutoTradingScheduler().register_jobs(runtime)
+
+
+JOB_GROUPS: Dict[str, Callable[[SchedulerRuntime], None]] = {
+    "stock_prices": _register_stock_prices,
+    "reports": _register_reports,
+    "learning": _register_learning,
+    "accountability": _register_accountability,
+    "news_poller": _register_news_poller,
+    "shadow_trader": _register_shadow_trader,
+    "price_sync": _register_price_sync,
+    "screener": _register_screener,
+    "correlation": _register_correlation,
+    "failure_learning": _register_failure_learning,
+    # 자동매매 (주문 발생) → 기본 그룹에 넣지 않고 SCHEDULER_JOB_GROUPS 로만 활성화
+    "kis_auto_trading": _register_kis_auto_trading,
+    "kis_portfolio_sync": _register_kis_portfolio_sync,
+    "auto_trading": _register_auto_trading,
+}
+
+# 기존에 API 프로세스가 시작하던 작업 (나머지는 SCHEDULER_JOB_GROUPS 로 선택)
+DEFAULT_JOB_GROUPS = ["stock_prices", "reports", "learning", "accountability", "news_poller", "shadow_trader"]
+
+
+def build_scheduler_runtime(
+    groups: Optional[List[str]] = None,
+    history_url: Optional[str] = None,
+) -> SchedulerRuntime:
+    """
+    기본 런타임 구성 (그룹별 등록 실패는 경고 후 계속)
+
+    Args:
+        groups: 작업 그룹 (기본: SCHEDULER_JOB_GROUPS 또는 DEFAULT_JOB_GROUPS)
+        history_url: 이력 DB (기본: SCHEDULER_HISTORY_URL 또는 로컬 SQLite)
+    """
+    if groups is None:
+        env_groups = os.getenv("SCHEDULER_JOB_GROUPS")
+        groups = [g.strip() for g in env_groups.split(",") if g.strip()] if env_groups else DEFAULT_JOB_GROUPS
+
+    history = JobRunHistory(history_url or os.getenv("SCHEDULER_HISTORY_URL", f"sqlite:///{DEFAULT_HISTORY_DB_PATH}"))
+    runtime = SchedulerRuntime(history)
+    for group in groups:
+        if group not in JOB_GROUPS:
+            raise ValueError(f"Unknown scheduler job group: {group} (available: {', '.join(JOB_GROUPS)})")
+        try:
+            JOB_GROUPS[group](runtime)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to register scheduler job group '{group}': {e}")
+    return runtime
+
+
+# 싱글톤 인스턴스
+_scheduler_runtime_instance: Optional[SchedulerRuntime] = None
+
+
+def get_scheduler_runtime() -> SchedulerRuntime:
+    """Scheduler Runtime 싱글톤 반환"""
+    global _scheduler_runtime_instance
+    if _scheduler_runtime_instance is None:
+        _scheduler_runtime_instance = build_scheduler_runtime()
+    return _scheduler_runtime_instance
+
+
+async def main():
+    """Main entry point for the scheduler worker"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scheduler Runtime")
+    parser.add_argument("--groups", default=None,
+                        help=f"Comma separated job groups (default: {','.join(DEFAULT_JOB_GROUPS)})")
+    parser.add_argument("--list", action="store_true", help="List registered jobs and recent run summary, then exit")
+    parser.add_argument("--run-now", default=None, metavar="JOB_ID", help="Run one job once and exit")
+
+    args = parser.parse_args()
+
+    groups = [g.strip() for g in args.groups.split(",")] if args.groups else None
+    runtime = build_scheduler_runtime(groups)
+
+    if args.list:
+        summary = runtime.history.summary(since=datetime.now() - timedelta(days=7))
+        for job in runtime.get_jobs():
+            stats = summary.get(job["id"], {})
+            print(f"{job['id']:<32} {job['concurrency_class']:<10} {job['trigger']:<45} "
+                  f"runs(7d)={stats.get('runs', 0)} avg={stats.get('avg_duration_ms', '-')}ms "
+                  f"{stats.get('by_status', {})}")
+        return
+
+    if args.run_now:
+        status = await runtime.run_now(args.run_now)
+        print(f"{args.run_now}: {status}")
+        return
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    # Shadow Trader 는 API 프로세스의 버스를 볼 수 없으므로 이 프로세스에서 시작
+    price_bus = None
+    if "shadow_trader" in runtime.jobs:
+        from backend.market_data.price_bus import start_price_bus_from_env
+        price_bus = start_price_bus_from_env()
+
+    runtime.start()
+    await stop.wait()
+    runtime.shutdown()
+    if price_bus:
+        await price_bus.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+    asyncio.run(main())
@@ -0,0 +1,41 @@
+"""
+Backfill news_articles.embedding_vec from the legacy ARRAY(Float) column.
+
+Run after database/migrations/20261018_news_embedding_vector_hnsw.sql is applied
+and the dual-write release is deployed. Safe to interrupt and re-run: only rows
+with embedding_vec IS NULL are converted, in id order, one commit per batch.
+
+Usage:
+    python -m backend.scripts.backfill_news_embedding_vectors
+    python -m backend.scripts.backfill_news_embedding_vectors --batch-size 5000 --pause 0
+    python -m backend.scripts.backfill_news_embedding_vectors --after-id 120000 --max-batches 10
+"""
+
+import argparse
+import logging
+
+from backend.database.news_vector_search import DEFAULT_BACKFILL_BATCH_SIZE, NewsEmbeddingBackfill
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert news embeddings to pgvector")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BACKFILL_BATCH_SIZE, help="rows per batch/commit")
+    parser.add_argument("--pause", type=float, default=0.05, help="seconds to sleep between batches")
+    parser.add_argument("--after-id", type=int, default=0, help="resume after this article id")
+    parser.add_argument("--max-batches", type=int, default=None, help="stop after N batches")
+    args = parser.parse_args()
+
+    backfill = NewsEmbeddingBackfill(batch_size=args.batch_size, pause_seconds=args.pause)
+    stats = backfill.run(after_id=args.after_id, max_batches=args.max_batches)
+    logger.info(
+        f"Backfill finished: {stats['converted']} converted, {stats['skipped']} skipped "
+        f"(dimension mismatch / zero vector), last_id={stats['last_id']}, "
+        f"{stats['elapsed_seconds']:.1f}s"
+    )
@@ -0,0 +1,141 @@
+"""
+Performance Benchmark: Event-driven BacktestEngine vs. vectorized fast path.
+
+Runs the moving-average demo strategy over a synthetic daily universe
+(default 10 years × 500 symbols) with:
+
+1. Event queue path (BacktestEngine.run: MarketEvent → SignalEvent → OrderEvent →
+   FillEvent through queue.Queue and coroutines, one signal per symbol per bar)
+2. Fast path (BacktestEngine(fast_path=True).run_fast: BarArray + VectorizedStrategy +
+   ArrayPortfolio, only fills are handled per symbol)
+
+Expected Results:
+- Event path cost grows with bars × symbols (Python objects per signal)
+- Fast path cost grows with bars (NumPy per bar) + fills
+- Identical history / trades / performance (checked when both paths run)
+
+Usage:
+    PYTHONPATH=. python backend/scripts/benchmark_backtest_fast_path.py
+    PYTHONPATH=. python backend/scripts/benchmark_backtest_fast_path.py --years 2 --symbols 50
+    PYTHONPATH=. python backend/scripts/benchmark_backtest_fast_path.py --skip-event
+"""
+
+import argparse
+import asyncio
+import logging
+import queue
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from backend.backtesting.engine import (
+    BacktestEngine,
+    BarArray,
+    DataHandler,
+    DemoStrategy,
+    DemoVectorizedStrategy,
+    MarketEvent,
+)
+
+RULES = {
+    "max_position_size_pct": 0.05,
+    "max_positions": 20,
+    "conviction_threshold_buy": 0.7,
+    "conviction_threshold_sell": 0.6,
+    "kill_switch_daily_loss_pct": 0.05,
+}
+
+
+class SyntheticDataHandler(DataHandler):
+    """시드 고정 랜덤 워크 일봉 (영업일)"""
+
+    def __init__(self, event_queue: queue.Queue, symbols: List[str], days: int, seed: int = 42):
+        super().__init__(event_queue)
+        rng = np.random.default_rng(seed)
+        dates = pd.bdate_range("2015-01-01", periods=days)
+        closes = 100 * np.exp(rng.normal(0.0002, 0.015, (days, len(symbols))).cumsum(axis=0))
+        self.data = {
+            symbol: pd.DataFrame({"close": closes[:, i], "volume": 1e6}, index=dates)
+            for i, symbol in enumerate(symbols)
+        }
+        self.data_stream = iter(dates)
+        self.latest_data = {}
+
+    async def next(self) -> bool:
+        try:
+            timestamp = next(self.data_stream)
+        except StopIteration:
+            return False
+        self.latest_data = {symbol: df.loc[timestamp] for symbol, df in self.data.items()}
+        self.event_queue.put(MarketEvent(timestamp, self.latest_data))
+        return True
+
+    def get_latest_price(self, symbol: str):
+        if symbol in self.latest_data:
+            return float(self.latest_data[symbol]["close"])
+        return None
+
+    def get_latest_data(self):
+        return self.latest_data
+
+    def get_bar_array(self) -> BarArray:
+        return BarArray.from_frames(self.data)
+
+
+def _run(fast: bool, symbols: List[str], days: int, window: int):
+    np.random.seed(7)  # Broker 슬리피지 부호
+    engine = BacktestEngine(
+        "2015-01-01", "2025-01-01", 1_000_000.0,
+        SyntheticDataHandler,
+        DemoVectorizedStrategy if fast else DemoStrategy,
+        data_kwargs={"symbols": symbols, "days": days},
+        strategy_kwargs={"window": window},
+        constitution_rules=RULES,
+        fast_path=fast,
+    )
+    start = time.perf_counter()
+    result = asyncio.run(engine.run())
+    return time.perf_counter() - start, engine.portfolio, result
+
+
+def run_full_benchmark(years: int = 10, symbols: int = 500, window: int = 20, skip_event: bool = False) -> Dict:
+    logging.getLogger("backend.backtesting.engine").setLevel(logging.WARNING)
+    days = years * 252
+    universe = [f"S{i:04d}" for i in range(symbols)]
+
+    print("\n" + "=" * 72)
+    print(f"Backtest engine benchmark ({years}y × {symbols} symbols = {days * symbols:,} bars, MA{window})")
+    print("=" * 72)
+
+    fast_s, fast_portfolio, fast_result = _run(True, universe, days, window)
+    results = {"fast_s": fast_s, "fills": len(fast_portfolio.history)}
+    print(f"  fast path   {fast_s:9.2f}s  fills={len(fast_portfolio.history):,}  "
+          f"trades={len(fast_portfolio.trades):,}")
+
+    if not skip_event:
+        event_s, event_portfolio, event_result = _run(False, universe, days, window)
+        results.update(event_s=event_s, speedup=event_s / fast_s)
+        print(f"  event path  {event_s:9.2f}s  speedup={event_s / fast_s:8.1f}x")
+
+        # 동일 결과 확인
+        assert fast_portfolio.history == event_portfolio.history
+        assert fast_portfolio.trades == event_portfolio.trades
+        assert fast_result == event_result
+        print("  results identical: history / trades / performance")
+
+    print(f"  total return {fast_result.get('total_return_pct', 0.0):+.2f}%  "
+          f"sharpe {fast_result.get('sharpe_ratio', 0.0):.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event vs. fast path backtest benchmark")
+    parser.add_argument("--years", type=int, default=10, help="years of daily bars")
+    parser.add_argument("--symbols", type=int, default=500, help="universe size")
+    parser.add_argument("--window", type=int, default=20, help="moving-average window")
+    parser.add_argument("--skip-event", action="store_true", help="run only the fast path")
+    args = parser.parse_args()
+
+    run_full_benchmark(args.years, args.symbols, args.window, args.skip_event)
@@ -0,0 +1,157 @@
+"""
+Performance Benchmark: War Room deliberation latency through the LLM gateway.
+
+Simulates WarRoomMVP.deliberate (3 agents x Two-Stage = 6 LLM calls, agents
+gathered in parallel) against mock providers, without any API key.
+
+Scenarios:
+1. Blocking SDK calls inside async def (old ClaudeClient/GeminiClient behavior)
+2. Native async calls through LLMGateway
+3. Heavy-tail provider latency without / with hedged requests
+
+Expected Results:
+- Blocking: ~6x single-call latency, concurrent deliberations serialize
+- Gateway: ~2x single-call latency (Stage 1 → Stage 2 per agent)
+- Hedging: p95 close to the p95 deadline instead of the tail latency
+
+Usage:
+    python backend/scripts/benchmark_llm_gateway.py
+    python backend/scripts/benchmark_llm_gateway.py --latency 0.2 --concurrency 10 --runs 50
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from backend.ai.llm_gateway import LLMGateway, ProviderLimits
+from backend.ai.llm_providers import LLMProvider, LLMResponse, MockLLMClient, ModelConfig, ModelProvider
+
+AGENTS = ("trader", "risk", "analyst")
+
+
+class TailLatencyMockClient(MockLLMClient):
+    """Mock client with a heavy latency tail (tail_ratio of calls take tail_multiplier x latency)"""
+
+    def __init__(self, latency: float, tail_ratio: float = 0.0, tail_multiplier: float = 10.0, seed: int = 7):
+        super().__init__(latency=latency)
+        self.base_latency = latency
+        self.tail_ratio = tail_ratio
+        self.tail_multiplier = tail_multiplier
+        self._random = random.Random(seed)
+
+    async def complete(self, prompt: str, config: ModelConfig) -> LLMResponse:
+        slow = self._random.random() < self.tail_ratio
+        self.latency = self.base_latency * (self.tail_multiplier if slow else 1.0)
+        return await super().complete(prompt, config)
+
+
+def _summary(name: str, samples: List[float]) -> Dict:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    result = {
+        "scenario": name,
+        "runs": len(samples),
+        "p50_ms": statistics.median(samples) * 1000,
+        "p95_ms": p95 * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+    print(
+        f"  {name:<28} p50={result['p50_ms']:8.1f}ms  "
+        f"p95={result['p95_ms']:8.1f}ms  max={result['max_ms']:8.1f}ms"
+    )
+    return result
+
+
+async def _blocking_agent(latency: float) -> None:
+    """Old behavior: sync SDK call + time.sleep inside async def"""
+    for _ in range(2):  # Stage 1 reasoning + Stage 2 structuring
+        time.sleep(latency)
+
+
+async def _blocking_deliberation(latency: float) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(_blocking_agent(latency) for _ in AGENTS))
+    return time.perf_counter() - start
+
+
+async def _gateway_deliberation(provider: LLMProvider, config: ModelConfig, fallback: ModelConfig = None) -> float:
+    async def agent(name: str):
+        reasoning = await provider.complete(f"{name} reasoning", config, fallback_config=fallback)
+        await provider.complete(f"structure: {reasoning.content}", config, fallback_config=fallback)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(agent(name) for name in AGENTS))
+    return time.perf_counter() - start
+
+
+async def _run(concurrency: int, runs: int, deliberate) -> List[float]:
+    samples: List[float] = []
+    for _ in range(0, runs, concurrency):
+        batch = min(concurrency, runs - len(samples))
+        samples.extend(await asyncio.gather(*(deliberate() for _ in range(batch))))
+    return samples
+
+
+def _make_provider(client: MockLLMClient) -> LLMProvider:
+    gateway = LLMGateway(
+        limits={"mock": ProviderLimits(max_concurrency=64, max_retries=0)},
+        hedge_min_samples=20,
+        hedge_min_delay=0.0,
+    )
+    provider = LLMProvider(gateway=gateway)
+    provider._clients[ModelProvider.MOCK] = client
+    return provider
+
+
+async def run_full_benchmark(latency: float = 0.1, concurrency: int = 5, runs: int = 40):
+    print("\n" + "=" * 72)
+    print(f"LLM Gateway benchmark (call latency={latency * 1000:.0f}ms, "
+          f"{concurrency} concurrent deliberations, {runs} runs)")
+    print("=" * 72)
+
+    primary = ModelConfig(model="mock-primary", provider=ModelProvider.MOCK)
+    fallback = ModelConfig(model="mock-fallback", provider=ModelProvider.MOCK)
+    results = []
+
+    print("\n1️⃣  Blocking vs native async")
+    results.append(_summary(
+        "blocking sdk calls",
+        await _run(concurrency, runs, lambda: _blocking_deliberation(latency)),
+    ))
+
+    provider = _make_provider(TailLatencyMockClient(latency))
+    results.append(_summary(
+        "async gateway",
+        await _run(concurrency, runs, lambda: _gateway_deliberation(provider, primary)),
+    ))
+
+    print("\n2️⃣  Heavy-tail provider (5% of calls 10x slower)")
+    provider = _make_provider(TailLatencyMockClient(latency, tail_ratio=0.05))
+    results.append(_summary(
+        "async gateway, no hedge",
+        await _run(concurrency, runs, lambda: _gateway_deliberation(provider, primary)),
+    ))
+
+    provider = _make_provider(TailLatencyMockClient(latency, tail_ratio=0.05))
+    # warm-up so the p95 deadline is known before hedging kicks in
+    await _run(concurrency, 5, lambda: _gateway_deliberation(provider, primary))
+    results.append(_summary(
+        "async gateway, hedged",
+        await _run(concurrency, runs, lambda: _gateway_deliberation(provider, primary, fallback)),
+    ))
+    print(f"  hedging stats: {provider.get_stats()['hedging']}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LLM gateway deliberation latency benchmark")
+    parser.add_argument("--latency", type=float, default=0.1, help="mock call latency (seconds)")
+    parser.add_argument("--concurrency", type=int, default=5, help="concurrent deliberations")
+    parser.add_argument("--runs", type=int, default=40, help="total deliberations per scenario")
+    args = parser.parse_args()
+
+    asyncio.run(run_full_benchmark(args.latency, args.concurrency, args.runs))
@@ -0,0 +1,163 @@
+"""
+Performance Benchmark: Enhanced news pipeline on a crawl burst.
+
+Processes N articles (default 200) through the six-stage pipeline with
+simulated component latency (asyncio.sleep per call, LLM-like) using:
+
+1. Serial (old process_article): articles one at a time, stages awaited in order
+2. Per-article DAG: process_article in a loop (narrative ∥ fact_check, horizon ∥ policy)
+3. Batched DAG: process_batch (one stage run per batch, bounded fan-out)
+4. Batched DAG + batch prompts: narrative / fact-check components expose *_batch
+
+Expected Results:
+- Per-article DAG: ~4/6 of serial (critical path of 4 stages)
+- Batched DAG: bounded by max_concurrency, a small fraction of serial
+- Batch prompts: one call per chunk for LLM stages
+
+Usage:
+    python backend/scripts/benchmark_news_pipeline.py
+    python backend/scripts/benchmark_news_pipeline.py --articles 500 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Dict, List
+
+from backend.ai.intelligence.base import IntelligenceResult
+from backend.ai.intelligence.enhanced_news_pipeline import EnhancedNewsProcessingPipeline
+
+
+def _result(name: str, **data) -> IntelligenceResult:
+    return IntelligenceResult(success=True, component_name=name, data=data, reasoning=name)
+
+
+class SimulatedComponents:
+    """Stage components with fixed per-call latency; every 4th article is irrelevant"""
+
+    def __init__(self, latency: float, batch_prompts: bool = False):
+        self.latency = latency
+        self.calls = 0
+        if batch_prompts:
+            self.analyze_news_batch = self._analyze_news_batch
+            self.verify_data_batch = self._verify_data_batch
+
+    async def _call(self):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+
+    async def filter_news(self, article):
+        await self._call()
+        return _result("filter", is_relevant=article["id"] % 4 != 0)
+
+    async def analyze_news(self, article):
+        await self._call()
+        return _result("narrative", narrative_phase="EMERGING", theme=article["title"])
+
+    async def verify_data(self, article):
+        await self._call()
+        return _result("fact_check", verification_status="VERIFIED")
+
+    async def _analyze_news_batch(self, articles):
+        await self._call()
+        return [_result("narrative", narrative_phase="EMERGING", theme=a["title"]) for a in articles]
+
+    async def _verify_data_batch(self, articles):
+        await self._call()
+        return [_result("fact_check", verification_status="VERIFIED") for _ in articles]
+
+    async def confirm_narrative(self, narrative):
+        await self._call()
+        return _result("market_confirm", confirmation_status="CONFIRMED")
+
+    async def tag_horizons(self, insight):
+        await self._call()
+        return _result("horizon", horizons=["short_term"])
+
+    async def analyze_feasibility(self, insight):
+        await self._call()
+        return _result("policy", realization_probability=0.5)
+
+    def as_components(self) -> Dict[str, "SimulatedComponents"]:
+        return {name: self for name in (
+            "news_filter", "narrative_engine", "fact_checker",
+            "market_confirmation", "horizon_tagger", "policy_feasibility",
+        )}
+
+
+async def serial_process_article(pipeline: EnhancedNewsProcessingPipeline, article: Dict) -> None:
+    """Old process_article: every stage awaited in sequence"""
+    stages = {"filter": await pipeline._stage1_filter(article)}
+    if not stages["filter"].data.get("is_relevant", True):
+        return
+    stages["narrative"] = await pipeline._stage2_narrative(article)
+    stages["fact_check"] = await pipeline._stage3_fact_check(article)
+    stages["market_confirm"] = await pipeline._stage4_market_confirm(stages["narrative"].data.copy())
+    insight = {**stages["narrative"].data, **stages["market_confirm"].data}
+    stages["horizon"] = await pipeline._stage5_horizon_tagging(insight)
+    stages["policy"] = await pipeline._stage6_policy_analysis(insight)
+    await pipeline._generate_final_insight(stages)
+    await pipeline._generate_contrarian_view(stages)
+
+
+async def _run_mode(mode: str, articles: List[Dict], latency: float, max_concurrency: int) -> Dict:
+    components = SimulatedComponents(latency, batch_prompts=(mode == "batched DAG + batch"))
+    pipeline = EnhancedNewsProcessingPipeline(
+        llm_provider=None,
+        intelligence_components=components.as_components(),
+        max_concurrency=max_concurrency,
+    )
+
+    start = time.perf_counter()
+    if mode == "serial (old)":
+        for article in articles:
+            await serial_process_article(pipeline, article)
+    elif mode == "per-article DAG":
+        for article in articles:
+            await pipeline.process_article(article)
+    else:
+        await pipeline.process_batch(articles)
+    elapsed = time.perf_counter() - start
+
+    return {"total_s": elapsed, "calls": components.calls, "stats": pipeline.get_statistics()}
+
+
+async def run_full_benchmark(articles: int = 200, latency_ms: float = 20.0, max_concurrency: int = 16):
+    logging.getLogger("backend.ai").setLevel(logging.WARNING)
+    burst = [{"id": i, "title": f"Headline {i}", "content": "..."} for i in range(articles)]
+    latency = latency_ms / 1000
+
+    print("\n" + "=" * 72)
+    print(f"News pipeline benchmark ({articles} articles, {latency_ms:.0f}ms/stage call, "
+          f"max_concurrency={max_concurrency})")
+    print("=" * 72)
+
+    results = {}
+    for mode in ("serial (old)", "per-article DAG", "batched DAG", "batched DAG + batch"):
+        result = await _run_mode(mode, burst, latency, max_concurrency)
+        results[mode] = result
+        print(f"  {mode:<22} total={result['total_s'] * 1000:9.1f}ms  "
+              f"component calls={result['calls']:5d}  "
+              f"articles/s={articles / result['total_s']:8.1f}")
+
+    print("\n  stage metrics (batched DAG):")
+    for stage, metrics in results["batched DAG"]["stats"]["stage_metrics"].items():
+        print(f"    {stage:<15} items={metrics['items']:4d}  "
+              f"latency={metrics['avg_batch_latency_ms']:8.1f}ms  "
+              f"throughput={metrics['items_per_sec']:8.1f}/s")
+
+    baseline = results["serial (old)"]["total_s"]
+    for mode in ("per-article DAG", "batched DAG", "batched DAG + batch"):
+        print(f"  speedup vs serial ({mode}): {baseline / results[mode]['total_s']:.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Enhanced news pipeline benchmark")
+    parser.add_argument("--articles", type=int, default=200, help="articles in the burst")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="simulated latency per component call")
+    parser.add_argument("--max-concurrency", type=int, default=16, help="pipeline fan-out bound")
+    args = parser.parse_args()
+
+    asyncio.run(run_full_benchmark(args.articles, args.latency_ms, args.max_concurrency))
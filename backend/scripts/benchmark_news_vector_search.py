@@ -0,0 +1,164 @@
+"""
+Performance Benchmark: Top-k news similarity search at 100k / 1M articles.
+
+Runs a top-k (default k=10) cosine search over N synthetic 384-dim embeddings
+(all-MiniLM-L6-v2 size) with:
+
+1. Python scan (old): load ARRAY(Float) rows, np.array + np.dot per article
+   (timed on --loop-cap rows and extrapolated linearly to N)
+2. NumPy brute force: one matrix-vector product + argpartition (exact, in-process)
+3. pgvector HNSW (with --dsn): ORDER BY embedding_vec <=> q LIMIT k on a temp
+   table with the same index as idx_news_embedding_hnsw, for several ef_search
+   values, with recall@k against the exact result
+
+Expected Results:
+- Python scan grows linearly with N (seconds per query at 1M)
+- HNSW latency stays roughly flat (ms) as N grows; higher ef_search → recall ↑, latency ↑
+
+Usage:
+    python backend/scripts/benchmark_news_vector_search.py --sizes 100000
+    python backend/scripts/benchmark_news_vector_search.py --dsn postgresql://postgres:pw@localhost:5432/ai_trading
+    python backend/scripts/benchmark_news_vector_search.py --sizes 100000,1000000 --ef-search 40,100,200 --queries 50
+"""
+
+import argparse
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from backend.database.news_vector_search import HNSW_EF_CONSTRUCTION, HNSW_M, NEWS_EMBEDDING_DIM
+
+
+def _corpus(n: int, rng: np.random.Generator) -> np.ndarray:
+    # 토픽 클러스터 구조 (실제 뉴스 임베딩처럼 균일 분포가 아님)
+    centers = rng.normal(size=(256, NEWS_EMBEDDING_DIM)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), n)] + 0.5 * rng.normal(size=(n, NEWS_EMBEDDING_DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def python_scan(rows: List[List[float]], query: List[float], k: int) -> List[int]:
+    """Old UnifiedNewsProcessor._check_semantic_duplicate style loop"""
+    new_emb = np.array(query)
+    scored = []
+    for i, row in enumerate(rows):
+        old_emb = np.array(row)
+        scored.append((np.dot(new_emb, old_emb) / (np.linalg.norm(new_emb) * np.linalg.norm(old_emb)), i))
+    scored.sort(reverse=True)
+    return [i for _, i in scored[:k]]
+
+
+def numpy_topk(corpus: np.ndarray, query: np.ndarray, k: int) -> np.ndarray:
+    scores = corpus @ query
+    top = np.argpartition(-scores, k)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+def _pgvector_bench(dsn: str, corpus: np.ndarray, queries: np.ndarray, exact: List[set],
+                    k: int, ef_values: List[int]) -> Dict[int, Dict[str, float]]:
+    import psycopg
+    from pgvector.psycopg import register_vector
+
+    results = {}
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+        register_vector(conn)
+        conn.execute(f"CREATE TEMP TABLE bench_news (id bigint PRIMARY KEY, embedding_vec vector({NEWS_EMBEDDING_DIM}))")
+
+        start = time.perf_counter()
+        with conn.cursor().copy("COPY bench_news (id, embedding_vec) FROM STDIN WITH (FORMAT BINARY)") as copy:
+            copy.set_types(["int8", "vector"])
+            for i, vec in enumerate(corpus):
+                copy.write_row((i, vec))
+        load_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        conn.execute("SET maintenance_work_mem = '2GB'")
+        conn.execute(
+            f"CREATE INDEX ON bench_news USING hnsw (embedding_vec vector_cosine_ops) "
+            f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+        )
+        build_s = time.perf_counter() - start
+        conn.execute("ANALYZE bench_news")
+        print(f"    pgvector load={load_s:.1f}s  hnsw build={build_s:.1f}s")
+
+        for ef in ef_values:
+            conn.execute(f"SET hnsw.ef_search = {int(ef)}")
+            latencies, recalls = [], []
+            for query, truth in zip(queries, exact):
+                start = time.perf_counter()
+                rows = conn.execute(
+                    "SELECT id FROM bench_news ORDER BY embedding_vec <=> %s LIMIT %s", (query, k)
+                ).fetchall()
+                latencies.append(time.perf_counter() - start)
+                recalls.append(len({r[0] for r in rows} & truth) / k)
+            results[ef] = {"p50_ms": float(np.median(latencies)) * 1000,
+                           "p95_ms": float(np.percentile(latencies, 95)) * 1000,
+                           "recall": float(np.mean(recalls))}
+    return results
+
+
+def run_full_benchmark(sizes: List[int], k: int = 10, queries: int = 20, loop_cap: int = 20_000,
+                       ef_values: Optional[List[int]] = None, dsn: Optional[str] = None):
+    ef_values = ef_values or [40, 100, 200]
+    rng = np.random.default_rng(42)
+
+    print("\n" + "=" * 72)
+    print(f"News vector search benchmark (dim={NEWS_EMBEDDING_DIM}, top-{k}, {queries} queries)")
+    print("=" * 72)
+
+    results = {}
+    for n in sizes:
+        corpus = _corpus(n, rng)
+        query_vectors = _corpus(queries, rng)
+        print(f"\n  N = {n:,}")
+
+        # 1. Python scan (old), 일부 행만 측정 후 선형 외삽
+        rows = corpus[:min(n, loop_cap)].tolist()
+        start = time.perf_counter()
+        python_scan(rows, query_vectors[0].tolist(), k)
+        scan_s = (time.perf_counter() - start) * n / len(rows)
+        print(f"    python scan (old)      {scan_s * 1000:10.1f}ms/query"
+              f"{'  (extrapolated)' if n > len(rows) else ''}")
+
+        # 2. NumPy brute force (exact → recall 기준)
+        start = time.perf_counter()
+        exact = [set(numpy_topk(corpus, q, k).tolist()) for q in query_vectors]
+        brute_s = (time.perf_counter() - start) / queries
+        print(f"    numpy brute force      {brute_s * 1000:10.1f}ms/query")
+
+        result = {"python_scan_ms": scan_s * 1000, "numpy_ms": brute_s * 1000}
+
+        # 3. pgvector HNSW
+        if dsn:
+            hnsw = _pgvector_bench(dsn, corpus, query_vectors, exact, k, ef_values)
+            for ef, metrics in hnsw.items():
+                print(f"    hnsw ef_search={ef:<5}   p50={metrics['p50_ms']:7.2f}ms  "
+                      f"p95={metrics['p95_ms']:7.2f}ms  recall@{k}={metrics['recall']:.3f}  "
+                      f"speedup vs scan={scan_s * 1000 / metrics['p50_ms']:8.0f}x")
+            result["hnsw"] = hnsw
+        else:
+            print("    hnsw: skipped (pass --dsn to benchmark pgvector)")
+
+        results[n] = result
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="News vector search benchmark")
+    parser.add_argument("--sizes", default="100000,1000000", help="comma-separated corpus sizes")
+    parser.add_argument("--k", type=int, default=10, help="top-k")
+    parser.add_argument("--queries", type=int, default=20, help="queries per size")
+    parser.add_argument("--loop-cap", type=int, default=20_000, help="rows timed for the python scan")
+    parser.add_argument("--ef-search", default="40,100,200", help="comma-separated hnsw.ef_search values")
+    parser.add_argument("--dsn", default=None, help="PostgreSQL DSN with pgvector (psycopg)")
+    args = parser.parse_args()
+
+    run_full_benchmark(
+        sizes=[int(s) for s in args.sizes.split(",")],
+        k=args.k,
+        queries=args.queries,
+        loop_cap=args.loop_cap,
+        ef_values=[int(e) for e in args.ef_search.split(",")],
+        dsn=args.dsn,
+    )
@@ -0,0 +1,139 @@
+"""
+Performance Benchmark: Sector signal throttling at 10k signals/hour.
+
+Replays N candidate signals spread evenly over a simulated hour
+(can_generate_signal + record_signal for each) against:
+
+1. List scan (old SectorSignalTracker: every check rescans the signal list,
+   every record rebuilds it in _cleanup_old_signals)
+2. Ring-buffer window counters (current SectorSignalTracker)
+
+Expected Results:
+- List scan: per-signal cost grows with history → quadratic total
+- Ring buffer: flat per-signal cost (O(1) counts and expiry)
+
+Usage:
+    python backend/scripts/benchmark_sector_throttling.py
+    python backend/scripts/benchmark_sector_throttling.py --signals 20000
+"""
+
+import argparse
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from backend.signals.sector_throttling import (
+    SECTOR_MAPPING,
+    SectorSignalTracker,
+    SectorThrottleConfig,
+    SignalRecord,
+)
+
+
+class ListScanTracker:
+    """Old counting strategy: full list scans per check, list rebuild per record"""
+
+    def __init__(self, config: SectorThrottleConfig, clock):
+        self.config = config
+        self.clock = clock
+        self._signals: List[SignalRecord] = []
+
+    def can_generate_signal(self, ticker: str, action: str) -> bool:
+        now = datetime.fromtimestamp(self.clock())
+        sector = SECTOR_MAPPING.get(ticker, "UNKNOWN")
+        hourly_cutoff = now - timedelta(minutes=self.config.hourly_window_minutes)
+        daily_cutoff = now - timedelta(hours=self.config.daily_window_hours)
+
+        hourly_sector = sum(1 for s in self._signals if s.sector == sector and s.timestamp >= hourly_cutoff)
+        daily_sector = sum(1 for s in self._signals if s.sector == sector and s.timestamp >= daily_cutoff)
+        hourly_total = sum(1 for s in self._signals if s.timestamp >= hourly_cutoff)
+        daily_total = sum(1 for s in self._signals if s.timestamp >= daily_cutoff)
+
+        return (
+            hourly_sector < self.config.max_trades_per_sector_per_hour
+            and daily_sector < self.config.max_trades_per_sector_per_day
+            and hourly_total < self.config.max_total_trades_per_hour
+            and daily_total < self.config.max_total_trades_per_day
+        )
+
+    def record_signal(self, ticker: str, action: str, confidence: float) -> None:
+        now = datetime.fromtimestamp(self.clock())
+        self._signals.append(SignalRecord(
+            ticker=ticker,
+            sector=SECTOR_MAPPING.get(ticker, "UNKNOWN"),
+            action=action,
+            timestamp=now,
+            confidence=confidence,
+        ))
+        cutoff = now - timedelta(days=7)
+        self._signals = [s for s in self._signals if s.timestamp >= cutoff]
+
+
+class SimClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _replay(tracker, clock: SimClock, signals: int, seed: int = 7) -> Dict:
+    rng = random.Random(seed)
+    tickers = list(SECTOR_MAPPING)
+    step = 3600.0 / signals
+    checkpoints = {signals // 10, signals // 2, signals}
+    split = {}
+
+    start = time.perf_counter()
+    for i in range(1, signals + 1):
+        clock.now += step
+        ticker = rng.choice(tickers)
+        action = "BUY" if rng.random() < 0.6 else "SELL"
+        tracker.can_generate_signal(ticker, action)
+        tracker.record_signal(ticker, action, 0.8)
+        if i in checkpoints:
+            split[i] = time.perf_counter() - start
+    total = time.perf_counter() - start
+
+    return {"total_s": total, "per_signal_us": total / signals * 1e6, "split": split}
+
+
+def run_full_benchmark(signals: int = 10_000):
+    logging.getLogger("backend.signals").setLevel(logging.WARNING)
+    # 스로틀이 걸려도 항상 기록하여 이력 크기를 동일하게 유지
+    config = SectorThrottleConfig(
+        max_trades_per_sector_per_hour=signals,
+        max_trades_per_sector_per_day=signals,
+        max_total_trades_per_hour=signals,
+        max_total_trades_per_day=signals,
+    )
+
+    print("\n" + "=" * 72)
+    print(f"Sector throttling benchmark ({signals:,} signals over one simulated hour)")
+    print("=" * 72)
+
+    results = {}
+    for name, factory in (
+        ("list scan (old)", lambda clock: ListScanTracker(config, clock)),
+        ("ring buffer", lambda clock: SectorSignalTracker(config, clock=clock)),
+    ):
+        clock = SimClock()
+        result = _replay(factory(clock), clock, signals)
+        results[name] = result
+        splits = "  ".join(f"@{n:,}: {t * 1000:8.1f}ms" for n, t in sorted(result["split"].items()))
+        print(f"  {name:<18} total={result['total_s'] * 1000:9.1f}ms  "
+              f"per signal={result['per_signal_us']:8.1f}µs  ({splits})")
+
+    speedup = results["list scan (old)"]["total_s"] / results["ring buffer"]["total_s"]
+    print(f"\n  speedup: {speedup:.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sector throttling microbenchmark")
+    parser.add_argument("--signals", type=int, default=10_000, help="signals per simulated hour")
+    args = parser.parse_args()
+
+    run_full_benchmark(args.signals)
@@ -6,7 +6,8 @@ Features:
 - Trade execution tracking
 - Portfolio snapshots
 - Signal performance validation
-- Weekly/monthly rollups
+- Weekly/monthly rollups (derived from daily rows)
+- Set-based range backfill (grouped SQL per source table)
 - Automatic scheduling
 
 Author: AI Trading System Team
@@ -14,8 +15,9 @@ Date: 2025-11-25
 """
 
 import logging
+from calendar import monthrange
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -23,14 +25,13 @@ import asyncio
 
 from backend.core.models.analytics_models import (
     DailyAnalytics,
-    TradeExecution,
     PortfolioSnapshot,
-    SignalPerformance,
     WeeklyAnalytics,
     MonthlyAnalytics,
 )
 from backend.core.database import get_db
 from backend.monitoring import trading_metrics
+from backend.analytics import rollups
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +65,10 @@ class AnalyticsAggregator:
 
     async def aggregate_daily_metrics(self, target_date: Optional[date] = None) -> DailyAnalytics:
         """
-        Aggregate daily metrics from Prometheus.
+        Aggregate daily metrics for a single day.
+
+        Runs the same set-based job as backfill_daily_metrics over a one-day range;
+        the end-of-day value comes from the portfolio manager when available.
 
         Args:
             target_date: Date to aggregate (defaults to yesterday)
@@ -77,90 +81,186 @@ class AnalyticsAggregator:
 
         logger.info(f"Aggregating daily metrics for {target_date}")
 
-        # Check if already exists
-        existing = self.db.query(DailyAnalytics).filter(
-            DailyAnalytics.date == target_date
-        ).first()
+        daily_record = (await self.backfill_daily_metrics(
+            target_date,
+            target_date,
+            rollup_periods=False,
+            portfolio_values={target_date: await self._get_portfolio_value_eod(target_date)},
+        ))[0]
 
-        if existing:
-            logger.info(f"Daily analytics for {target_date} already exists, updating...")
-            daily_record = existing
-        else:
-            daily_record = DailyAnalytics(date=target_date)
-
-        # Portfolio metrics
-        daily_record.portfolio_value_eod = await self._get_portfolio_value_eod(target_date)
-        daily_record.daily_pnl = await self._get_daily_pnl(target_date)
-        daily_record.daily_return_pct = self._calculate_daily_return(
-            daily_record.daily_pnl,
-            daily_record.portfolio_value_eod,
+        logger.info(
+            f"Daily analytics saved for {target_date}: "
+            f"Portfolio=${daily_record.portfolio_value_eod:,.2f}, "
+            f"PnL=${daily_record.daily_pnl:,.2f}, "
+            f"Trades={daily_record.total_trades}"
         )
 
-        # Calculate cumulative PnL
-        daily_record.cumulative_pnl = await self._get_cumulative_pnl(target_date)
+        return daily_record
 
-        # Trading activity
-        trade_stats = await self._get_trade_stats(target_date)
-        daily_record.total_trades = trade_stats['total']
-        daily_record.buy_trades = trade_stats['buys']
-        daily_record.sell_trades = trade_stats['sells']
-        daily_record.total_volume_usd = trade_stats['volume_usd']
+    async def backfill_daily_metrics(
+        self,
+        start_date: date,
+        end_date: date,
+        rollup_periods: bool = True,
+        portfolio_values: Optional[Dict[date, Decimal]] = None,
+    ) -> List[DailyAnalytics]:
+        """
+        Set-based daily aggregation over a date range.
 
-        # Performance metrics
-        perf_metrics = await self._get_performance_metrics(target_date)
-        daily_record.win_count = perf_metrics['win_count']
-        daily_record.loss_count = perf_metrics['loss_count']
-        daily_record.win_rate = perf_metrics['win_rate']
-        daily_record.avg_win_pct = perf_metrics['avg_win_pct']
-        daily_record.avg_loss_pct = perf_metrics['avg_loss_pct']
-
-        # Risk metrics
-        risk_metrics = await self._calculate_risk_metrics(target_date)
-        daily_record.sharpe_ratio = risk_metrics.get('sharpe_ratio')
-        daily_record.sortino_ratio = risk_metrics.get('sortino_ratio')
-        daily_record.max_drawdown_pct = risk_metrics.get('max_drawdown_pct')
-        daily_record.volatility_30d = risk_metrics.get('volatility_30d')
-        daily_record.var_95 = risk_metrics.get('var_95')
-
-        # AI metrics
-        ai_metrics = await self._get_ai_metrics(target_date)
-        daily_record.ai_cost_usd = ai_metrics['cost_usd']
-        daily_record.ai_tokens_used = ai_metrics['tokens_used']
-        daily_record.signals_generated = ai_metrics['signals_generated']
-        daily_record.signal_avg_confidence = ai_metrics.get('avg_confidence')
-        daily_record.signal_accuracy = ai_metrics.get('accuracy')
-
-        # Execution quality
-        exec_quality = await self._get_execution_quality(target_date)
-        daily_record.avg_slippage_bps = exec_quality.get('avg_slippage_bps')
-        daily_record.avg_execution_time_ms = exec_quality.get('avg_exec_time_ms')
+        One grouped query per source table (trades by execution day, closed trades
+        by exit day, signals by generation day, snapshots), one read of existing
+        daily rows (plus the 30-day risk warmup), a single flush and commit.
+
+        Days are written when they have trades, signals, a snapshot or an existing
+        row; single-day calls (start == end) always write the day.
+
+        Args:
+            start_date: First day (inclusive)
+            end_date: Last day (inclusive)
+            rollup_periods: Also rebuild weekly/monthly rows touching the range
+            portfolio_values: Explicit end-of-day values (override snapshots)
+
+        Returns:
+            DailyAnalytics records in date order
+        """
+        if end_date < start_date:
+            raise ValueError(f"end_date {end_date} is before start_date {start_date}")
+
+        logger.info(f"Backfilling daily analytics {start_date} ~ {end_date}")
+
+        trades = rollups.rows_by_day(self.db.execute(rollups.trade_activity_stmt(start_date, end_date)))
+        closed = rollups.rows_by_day(self.db.execute(rollups.closed_trade_stmt(start_date, end_date)))
+        signals = rollups.rows_by_day(self.db.execute(rollups.signal_activity_stmt(start_date, end_date)))
+        snapshots = rollups.snapshots_by_day(self.db.execute(rollups.snapshot_stmt(start_date, end_date)))
+
+        warmup_start = start_date - timedelta(days=rollups.RISK_WINDOW_DAYS)
+        stored = self.db.query(DailyAnalytics).filter(
+            DailyAnalytics.date >= warmup_start,
+            DailyAnalytics.date <= end_date,
+        ).order_by(DailyAnalytics.date).all()
+        existing = {r.date: r for r in stored if r.date >= start_date}
+        warmup = [r for r in stored if r.date < start_date]
+
+        portfolio_values = portfolio_values or {}
+        days = set(trades) | set(closed) | set(signals) | set(snapshots) | set(existing) | set(portfolio_values)
+        if start_date == end_date:
+            days.add(start_date)
+        days = sorted(d for d in days if start_date <= d <= end_date)
+
+        # Running values: previous EOD value and cumulative PnL before the range
+        prev_value = warmup[-1].portfolio_value_eod if warmup else None
+        if prev_value is None:
+            prev_row = self.db.query(DailyAnalytics).filter(
+                DailyAnalytics.date < start_date
+            ).order_by(DailyAnalytics.date.desc()).first()
+            prev_value = prev_row.portfolio_value_eod if prev_row else None
+        cumulative = await self._get_cumulative_pnl(start_date - timedelta(days=1))
+
+        records: List[DailyAnalytics] = []
+        for day in days:
+            record = existing.get(day)
+            if record is None:
+                record = DailyAnalytics(date=day)
+                self.db.add(record)
+
+            snapshot = snapshots.get(day)
+            if day in portfolio_values:
+                value = rollups.to_decimal(portfolio_values[day])
+            elif snapshot is not None:
+                value = rollups.to_decimal(snapshot.total_value)
+            elif record.portfolio_value_eod is not None:
+                value = record.portfolio_value_eod
+            elif prev_value is not None:
+                value = prev_value
+            else:
+                value = await self._get_portfolio_value_eod(day)
+
+            # Portfolio metrics
+            record.portfolio_value_eod = value
+            record.daily_pnl = value - prev_value if prev_value is not None else Decimal('0.00')
+            record.daily_return_pct = self._calculate_daily_return(record.daily_pnl, value)
+            cumulative += record.daily_pnl
+            record.cumulative_pnl = cumulative
+            prev_value = value
+
+            self._apply_activity(record, trades.get(day), closed.get(day), signals.get(day), snapshot)
+
+            # Risk management
+            risk_mgmt = await self._get_risk_management_metrics(day)
+            record.circuit_breaker_triggers = risk_mgmt['circuit_breaker_triggers']
+            record.kill_switch_active = risk_mgmt['kill_switch_active']
+            record.alerts_triggered = risk_mgmt['alerts_triggered']
+
+            records.append(record)
+
+        # Risk metrics over warmup + range in one pass
+        series = warmup + records
+        risk_rows = rollups.rolling_risk_metrics(
+            [r.date for r in series],
+            [rollups.to_float(r.daily_return_pct) for r in series],
+            [float(r.portfolio_value_eod) for r in series],
+        )
+        for record, risk in zip(records, risk_rows[len(warmup):]):
+            for column in ('sharpe_ratio', 'sortino_ratio', 'max_drawdown_pct', 'volatility_30d', 'var_95'):
+                setattr(record, column, rollups.to_decimal(risk.get(column)))
 
-        # Position metrics
-        position_metrics = await self._get_position_metrics(target_date)
-        daily_record.positions_count = position_metrics['count']
-        daily_record.avg_position_size_usd = position_metrics.get('avg_size')
-        daily_record.max_position_size_usd = position_metrics.get('max_size')
-
-        # Risk management
-        risk_mgmt = await self._get_risk_management_metrics(target_date)
-        daily_record.circuit_breaker_triggers = risk_mgmt['circuit_breaker_triggers']
-        daily_record.kill_switch_active = risk_mgmt['kill_switch_active']
-        daily_record.alerts_triggered = risk_mgmt['alerts_triggered']
-
-        # Save to database
-        if not existing:
-            self.db.add(daily_record)
         self.db.commit()
-        self.db.refresh(daily_record)
+        for record in records:
+            self.db.refresh(record)
 
-        logger.info(
-            f"Daily analytics saved for {target_date}: "
-            f"Portfolio=${daily_record.portfolio_value_eod:,.2f}, "
-            f"PnL=${daily_record.daily_pnl:,.2f}, "
-            f"Trades={daily_record.total_trades}"
+        logger.info(f"Daily analytics backfilled: {len(records)} days ({start_date} ~ {end_date})")
+
+        if rollup_periods and records:
+            await self.rollup_periods(start_date, end_date)
+
+        return records
+
+    def _apply_activity(self, record: DailyAnalytics, trades, closed, signals, snapshot) -> None:
+        """Copy grouped SQL results (one row per day, or None) onto a daily record."""
+        # Trading activity / execution quality
+        record.total_trades = int(trades.total) if trades else 0
+        record.buy_trades = int(trades.buys or 0) if trades else 0
+        record.sell_trades = int(trades.sells or 0) if trades else 0
+        record.total_volume_usd = rollups.to_decimal(trades.volume_usd) if trades else Decimal('0')
+        record.avg_slippage_bps = rollups.to_decimal(trades.avg_slippage_bps) if trades else None
+        record.avg_execution_time_ms = rollups.to_decimal(trades.avg_exec_time_ms) if trades else None
+
+        # Performance metrics
+        if closed and closed.closed:
+            record.win_count = int(closed.wins or 0)
+            record.loss_count = int(closed.closed) - record.win_count
+            record.win_rate = Decimal(str(record.win_count / int(closed.closed)))
+            record.avg_win_pct = rollups.to_decimal(closed.avg_win_pct)
+            record.avg_loss_pct = rollups.to_decimal(closed.avg_loss_pct)
+        else:
+            record.win_count = 0
+            record.loss_count = 0
+            record.win_rate = None
+            record.avg_win_pct = None
+            record.avg_loss_pct = None
+
+        # AI metrics (cost/tokens: TODO query from cost tracking)
+        if record.ai_cost_usd is None:
+            record.ai_cost_usd = Decimal('0.00')
+        if record.ai_tokens_used is None:
+            record.ai_tokens_used = 0
+        record.signals_generated = int(signals.signals) if signals else 0
+        record.signal_avg_confidence = rollups.to_decimal(signals.avg_confidence) if signals else None
+        resolved = int(signals.resolved or 0) if signals else 0
+        record.signal_accuracy = (
+            Decimal(str(int(signals.resolved_wins or 0) / resolved)) if resolved else None
         )
 
-        return daily_record
+        # Position metrics
+        positions = (snapshot.positions or []) if snapshot is not None else []
+        record.positions_count = len(positions)
+        if positions:
+            sizes = [float(p.get('value', 0)) for p in positions]
+            record.avg_position_size_usd = Decimal(str(sum(sizes) / len(sizes)))
+            record.max_position_size_usd = Decimal(str(max(sizes)))
+        else:
+            record.avg_position_size_usd = None
+            record.max_position_size_usd = None
 
     async def _get_portfolio_value_eod(self, target_date: date) -> Decimal:
         """Get end-of-day portfolio value from Prometheus."""
@@ -171,20 +271,6 @@ class AnalyticsAggregator:
             return Decimal(str(value))
         return Decimal('100000.00')  # Default initial value
 
-    async def _get_daily_pnl(self, target_date: date) -> Decimal:
-        """Get daily P&L from Prometheus."""
-        # Query Prometheus for portfolio_daily_pnl_usd
-        # For now, calculate from previous day
-        previous_day = self.db.query(DailyAnalytics).filter(
-            DailyAnalytics.date == target_date - timedelta(days=1)
-        ).first()
-
-        current_value = await self._get_portfolio_value_eod(target_date)
-
-        if previous_day:
-            return current_value - previous_day.portfolio_value_eod
-        return Decimal('0.00')
-
     def _calculate_daily_return(self, pnl: Decimal, portfolio_value: Decimal) -> Optional[Decimal]:
         """Calculate daily return percentage."""
         if portfolio_value and portfolio_value > 0:
@@ -200,194 +286,6 @@ class AnalyticsAggregator:
 
         return Decimal(str(result)) if result else Decimal('0.00')
 
-    async def _get_trade_stats(self, target_date: date) -> Dict:
-        """Get trading activity statistics."""
-        # Query trade_executions table
-        trades = self.db.query(TradeExecution).filter(
-            func.date(TradeExecution.execution_timestamp) == target_date
-        ).all()
-
-        total = len(trades)
-        buys = sum(1 for t in trades if t.action == 'BUY')
-        sells = sum(1 for t in trades if t.action == 'SELL')
-        volume_usd = sum(float(t.position_size_usd or 0) for t in trades)
-
-        return {
-            'total': total,
-            'buys': buys,
-            'sells': sells,
-            'volume_usd': Decimal(str(volume_usd)),
-        }
-
-    async def _get_performance_metrics(self, target_date: date) -> Dict:
-        """Get performance metrics from closed trades."""
-        # Query closed trades for the day
-        closed_trades = self.db.query(TradeExecution).filter(
-            func.date(TradeExecution.exit_timestamp) == target_date,
-            TradeExecution.status == 'CLOSED',
-        ).all()
-
-        if not closed_trades:
-            return {
-                'win_count': 0,
-                'loss_count': 0,
-                'win_rate': None,
-                'avg_win_pct': None,
-                'avg_loss_pct': None,
-            }
-
-        wins = [t for t in closed_trades if t.is_win]
-        losses = [t for t in closed_trades if not t.is_win]
-
-        win_count = len(wins)
-        loss_count = len(losses)
-        win_rate = Decimal(str(win_count / len(closed_trades))) if closed_trades else None
-
-        avg_win_pct = None
-        if wins:
-            avg_win_pct = Decimal(str(sum(float(t.pnl_pct or 0) for t in wins) / len(wins)))
-
-        avg_loss_pct = None
-        if losses:
-            avg_loss_pct = Decimal(str(sum(float(t.pnl_pct or 0) for t in losses) / len(losses)))
-
-        return {
-            'win_count': win_count,
-            'loss_count': loss_count,
-            'win_rate': win_rate,
-            'avg_win_pct': avg_win_pct,
-            'avg_loss_pct': avg_loss_pct,
-        }
-
-    async def _calculate_risk_metrics(self, target_date: date) -> Dict:
-        """Calculate risk metrics."""
-        # Get last 30 days of returns
-        thirty_days_ago = target_date - timedelta(days=30)
-        daily_records = self.db.query(DailyAnalytics).filter(
-            DailyAnalytics.date >= thirty_days_ago,
-            DailyAnalytics.date <= target_date,
-        ).order_by(DailyAnalytics.date).all()
-
-        if len(daily_records) < 5:
-            return {}
-
-        returns = [float(r.daily_return_pct or 0) for r in daily_records if r.daily_return_pct]
-
-        if not returns:
-            return {}
-
-        # Calculate Sharpe Ratio
-        import numpy as np
-        returns_array = np.array(returns)
-        avg_return = np.mean(returns_array)
-        std_return = np.std(returns_array)
-
-        # Annualized Sharpe (assuming 252 trading days)
-        sharpe_ratio = None
-        if std_return > 0:
-            sharpe_ratio = Decimal(str((avg_return / std_return) * np.sqrt(252)))
-
-        # Calculate Sortino Ratio (downside deviation)
-        downside_returns = [r for r in returns if r < 0]
-        sortino_ratio = None
-        if downside_returns:
-            downside_std = np.std(downside_returns)
-            if downside_std > 0:
-                sortino_ratio = Decimal(str((avg_return / downside_std) * np.sqrt(252)))
-
-        # Calculate Maximum Drawdown
-        cumulative_returns = np.cumprod(1 + returns_array / 100)
-        running_max = np.maximum.accumulate(cumulative_returns)
-        drawdowns = (cumulative_returns - running_max) / running_max * 100
-        max_drawdown = Decimal(str(np.min(drawdowns)))
-
-        # Calculate 30-day volatility (annualized)
-        volatility_30d = Decimal(str(std_return * np.sqrt(252)))
-
-        # Calculate VaR (95% confidence)
-        var_95_pct = np.percentile(returns_array, 5)
-        portfolio_value = await self._get_portfolio_value_eod(target_date)
-        var_95 = portfolio_value * Decimal(str(var_95_pct / 100))
-
-        return {
-            'sharpe_ratio': sharpe_ratio,
-            'sortino_ratio': sortino_ratio,
-            'max_drawdown_pct': max_drawdown,
-            'volatility_30d': volatility_30d,
-            'var_95': var_95,
-        }
-
-    async def _get_ai_metrics(self, target_date: date) -> Dict:
-        """Get AI cost and performance metrics."""
-        # In production, query Prometheus for ai_cost_usd_total, ai_tokens_used_total
-        # For now, query signal_performance table
-        signals = self.db.query(SignalPerformance).filter(
-            func.date(SignalPerformance.generated_at) == target_date
-        ).all()
-
-        signals_generated = len(signals)
-
-        avg_confidence = None
-        if signals:
-            avg_confidence = Decimal(str(sum(float(s.confidence or 0) for s in signals) / len(signals)))
-
-        # Calculate accuracy for resolved signals
-        resolved_signals = [s for s in signals if s.status == 'RESOLVED']
-        accuracy = None
-        if resolved_signals:
-            wins = sum(1 for s in resolved_signals if s.outcome == 'WIN')
-            accuracy = Decimal(str(wins / len(resolved_signals)))
-
-        return {
-            'cost_usd': Decimal('0.00'),  # TODO: Query from cost tracking
-            'tokens_used': 0,  # TODO: Query from cost tracking
-            'signals_generated': signals_generated,
-            'avg_confidence': avg_confidence,
-            'accuracy': accuracy,
-        }
-
-    async def _get_execution_quality(self, target_date: date) -> Dict:
-        """Get execution quality metrics."""
-        trades = self.db.query(TradeExecution).filter(
-            func.date(TradeExecution.execution_timestamp) == target_date
-        ).all()
-
-        if not trades:
-            return {}
-
-        avg_slippage = sum(float(t.slippage_bps or 0) for t in trades) / len(trades)
-        avg_exec_time = sum(float(t.execution_time_ms or 0) for t in trades) / len(trades)
-
-        return {
-            'avg_slippage_bps': Decimal(str(avg_slippage)),
-            'avg_exec_time_ms': Decimal(str(avg_exec_time)),
-        }
-
-    async def _get_position_metrics(self, target_date: date) -> Dict:
-        """Get position sizing metrics."""
-        # Get snapshot for target date
-        snapshot = self.db.query(PortfolioSnapshot).filter(
-            PortfolioSnapshot.snapshot_date == target_date
-        ).first()
-
-        if not snapshot:
-            return {'count': 0}
-
-        positions = snapshot.positions or []
-
-        avg_size = None
-        max_size = None
-        if positions:
-            sizes = [float(p.get('value', 0)) for p in positions]
-            avg_size = Decimal(str(sum(sizes) / len(sizes)))
-            max_size = Decimal(str(max(sizes)))
-
-        return {
-            'count': len(positions),
-            'avg_size': avg_size,
-            'max_size': max_size,
-        }
-
     async def _get_risk_management_metrics(self, target_date: date) -> Dict:
         """Get risk management trigger metrics."""
         # TODO: Query from monitoring system
@@ -500,12 +398,87 @@ class AnalyticsAggregator:
             }
         return {}
 
+    async def rollup_periods(
+        self,
+        start_date: date,
+        end_date: date,
+        weekly: bool = True,
+        monthly: bool = True,
+    ) -> Tuple[List[WeeklyAnalytics], List[MonthlyAnalytics]]:
+        """
+        Rebuild weekly/monthly rows touching a date range from daily rows.
+
+        The range is widened to whole ISO weeks / calendar months, daily rows are
+        read once (rollup columns only) and every period is upserted in one commit.
+
+        Returns:
+            (weekly records, monthly records)
+        """
+        week_lo = start_date - timedelta(days=start_date.weekday())
+        week_hi = end_date + timedelta(days=6 - end_date.weekday())
+        month_lo = start_date.replace(day=1)
+        month_hi = end_date.replace(day=monthrange(end_date.year, end_date.month)[1])
+
+        bounds = ([(week_lo, week_hi)] if weekly else []) + ([(month_lo, month_hi)] if monthly else [])
+        if not bounds:
+            return [], []
+        rows = self.db.execute(rollups.daily_series_stmt(
+            min(lo for lo, _ in bounds), max(hi for _, hi in bounds)
+        )).all()
+
+        weekly_records: List[WeeklyAnalytics] = []
+        if weekly:
+            periods = rollups.weekly_rollups(
+                [r for r in rows if week_lo <= rollups.as_date(r.date) <= week_hi]
+            )
+            existing = {
+                (w.year, w.week_number): w
+                for w in self.db.query(WeeklyAnalytics).filter(
+                    WeeklyAnalytics.year.in_(sorted({year for year, _ in periods}))
+                ).all()
+            } if periods else {}
+            for (year, week_number), fields in periods.items():
+                record = existing.get((year, week_number))
+                if record is None:
+                    record = WeeklyAnalytics(year=year, week_number=week_number)
+                    self.db.add(record)
+                for column, value in fields.items():
+                    setattr(record, column, value)
+                weekly_records.append(record)
+
+        monthly_records: List[MonthlyAnalytics] = []
+        if monthly:
+            periods = rollups.monthly_rollups(
+                [r for r in rows if month_lo <= rollups.as_date(r.date) <= month_hi]
+            )
+            existing = {
+                (m.year, m.month): m
+                for m in self.db.query(MonthlyAnalytics).filter(
+                    MonthlyAnalytics.year.in_(sorted({year for year, _ in periods}))
+                ).all()
+            } if periods else {}
+            for (year, month), fields in periods.items():
+                record = existing.get((year, month))
+                if record is None:
+                    record = MonthlyAnalytics(year=year, month=month)
+                    self.db.add(record)
+                for column, value in fields.items():
+                    setattr(record, column, value)
+                monthly_records.append(record)
+
+        self.db.commit()
+        logger.info(
+            f"Period rollups rebuilt from daily rows ({start_date} ~ {end_date}): "
+            f"{len(weekly_records)} weeks, {len(monthly_records)} months"
+        )
+        return weekly_records, monthly_records
+
     async def aggregate_weekly_metrics(self, year: int, week_number: int) -> WeeklyAnalytics:
         """
         Aggregate weekly metrics from daily analytics.
 
         Args:
-            year: Year
+            year: ISO year
             week_number: ISO week number (1-53)
 
         Returns:
@@ -513,92 +486,20 @@ class AnalyticsAggregator:
         """
         logger.info(f"Aggregating weekly metrics for {year}-W{week_number}")
 
-        # Calculate week start/end dates
-        from datetime import datetime, timedelta
-        first_day = datetime.strptime(f'{year}-W{week_number}-1', '%Y-W%W-%w').date()
-        last_day = first_day + timedelta(days=6)
-
-        # Get daily records for the week
-        daily_records = self.db.query(DailyAnalytics).filter(
-            DailyAnalytics.date >= first_day,
-            DailyAnalytics.date <= last_day,
-        ).order_by(DailyAnalytics.date).all()
+        first_day = date.fromisocalendar(year, week_number, 1)
+        weekly, _ = await self.rollup_periods(first_day, first_day + timedelta(days=6), monthly=False)
 
-        if not daily_records:
+        if not weekly:
             logger.warning(f"No daily records for week {year}-W{week_number}")
             return None
 
-        # Check if already exists
-        existing = self.db.query(WeeklyAnalytics).filter(
-            WeeklyAnalytics.year == year,
-            WeeklyAnalytics.week_number == week_number,
-        ).first()
-
-        if existing:
-            weekly = existing
-        else:
-            weekly = WeeklyAnalytics(
-                year=year,
-                week_number=week_number,
-                week_start_date=first_day,
-                week_end_date=last_day,
-            )
-
-        # Aggregate metrics
-        weekly.portfolio_value_start = daily_records[0].portfolio_value_eod
-        weekly.portfolio_value_end = daily_records[-1].portfolio_value_eod
-        weekly.weekly_pnl = sum(float(r.daily_pnl or 0) for r in daily_records)
-        weekly.weekly_pnl = Decimal(str(weekly.weekly_pnl))
-
-        if weekly.portfolio_value_start > 0:
-            weekly.weekly_return_pct = (
-                (weekly.portfolio_value_end - weekly.portfolio_value_start) /
-                weekly.portfolio_value_start * 100
-            )
-
-        # Trading activity
-        weekly.total_trades = sum(r.total_trades for r in daily_records)
-        weekly.total_volume_usd = Decimal(str(sum(float(r.total_volume_usd or 0) for r in daily_records)))
-        weekly.avg_daily_trades = Decimal(str(weekly.total_trades / len(daily_records)))
-
-        # Performance
-        weekly.win_count = sum(r.win_count for r in daily_records)
-        weekly.loss_count = sum(r.loss_count for r in daily_records)
-        total_closed = weekly.win_count + weekly.loss_count
-        weekly.win_rate = Decimal(str(weekly.win_count / total_closed)) if total_closed > 0 else None
+        logger.info(f"Weekly analytics saved for {year}-W{week_number}: PnL=${weekly[0].weekly_pnl:,.2f}")
 
-        # Risk metrics
-        sharpe_ratios = [float(r.sharpe_ratio) for r in daily_records if r.sharpe_ratio]
-        weekly.sharpe_ratio = Decimal(str(sum(sharpe_ratios) / len(sharpe_ratios))) if sharpe_ratios else None
-
-        drawdowns = [float(r.max_drawdown_pct) for r in daily_records if r.max_drawdown_pct]
-        weekly.max_drawdown_pct = Decimal(str(min(drawdowns))) if drawdowns else None
-
-        # AI costs
-        weekly.total_ai_cost_usd = Decimal(str(sum(float(r.ai_cost_usd or 0) for r in daily_records)))
-        weekly.avg_daily_ai_cost = weekly.total_ai_cost_usd / len(daily_records)
-
-        # Best/worst days
-        best_day = max(daily_records, key=lambda r: float(r.daily_return_pct or 0))
-        worst_day = min(daily_records, key=lambda r: float(r.daily_return_pct or 0))
-        weekly.best_day_date = best_day.date
-        weekly.best_day_return_pct = best_day.daily_return_pct
-        weekly.worst_day_date = worst_day.date
-        weekly.worst_day_return_pct = worst_day.daily_return_pct
-
-        # Save
-        if not existing:
-            self.db.add(weekly)
-        self.db.commit()
-        self.db.refresh(weekly)
-
-        logger.info(f"Weekly analytics saved for {year}-W{week_number}: PnL=${weekly.weekly_pnl:,.2f}")
-
-        return weekly
+        return weekly[0]
 
     async def aggregate_monthly_metrics(self, year: int, month: int) -> MonthlyAnalytics:
         """
-        Aggregate monthly metrics from daily/weekly analytics.
+        Aggregate monthly metrics from daily analytics.
 
         Args:
             year: Year
@@ -609,79 +510,17 @@ class AnalyticsAggregator:
         """
         logger.info(f"Aggregating monthly metrics for {year}-{month:02d}")
 
-        # Get daily records for the month
-        from calendar import monthrange
-        _, last_day = monthrange(year, month)
-
         first_date = date(year, month, 1)
-        last_date = date(year, month, last_day)
+        last_date = date(year, month, monthrange(year, month)[1])
+        _, monthly = await self.rollup_periods(first_date, last_date, weekly=False)
 
-        daily_records = self.db.query(DailyAnalytics).filter(
-            DailyAnalytics.date >= first_date,
-            DailyAnalytics.date <= last_date,
-        ).order_by(DailyAnalytics.date).all()
-
-        if not daily_records:
+        if not monthly:
             logger.warning(f"No daily records for {year}-{month:02d}")
             return None
 
-        # Check if already exists
-        existing = self.db.query(MonthlyAnalytics).filter(
-            MonthlyAnalytics.year == year,
-            MonthlyAnalytics.month == month,
-        ).first()
-
-        if existing:
-            monthly = existing
-        else:
-            monthly = MonthlyAnalytics(year=year, month=month)
-
-        # Aggregate metrics
-        monthly.portfolio_value_start = daily_records[0].portfolio_value_eod
-        monthly.portfolio_value_end = daily_records[-1].portfolio_value_eod
-        monthly.monthly_pnl = Decimal(str(sum(float(r.daily_pnl or 0) for r in daily_records)))
-
-        if monthly.portfolio_value_start > 0:
-            monthly.monthly_return_pct = (
-                (monthly.portfolio_value_end - monthly.portfolio_value_start) /
-                monthly.portfolio_value_start * 100
-            )
-
-        # Trading activity
-        monthly.total_trades = sum(r.total_trades for r in daily_records)
-        monthly.total_volume_usd = Decimal(str(sum(float(r.total_volume_usd or 0) for r in daily_records)))
-        monthly.trading_days = len(daily_records)
-
-        # Performance
-        monthly.win_count = sum(r.win_count for r in daily_records)
-        monthly.loss_count = sum(r.loss_count for r in daily_records)
-        total_closed = monthly.win_count + monthly.loss_count
-        monthly.win_rate = Decimal(str(monthly.win_count / total_closed)) if total_closed > 0 else None
-
-        # Risk metrics
-        sharpe_ratios = [float(r.sharpe_ratio) for r in daily_records if r.sharpe_ratio]
-        monthly.sharpe_ratio = Decimal(str(sum(sharpe_ratios) / len(sharpe_ratios))) if sharpe_ratios else None
-
-        sortino_ratios = [float(r.sortino_ratio) for r in daily_records if r.sortino_ratio]
-        monthly.sortino_ratio = Decimal(str(sum(sortino_ratios) / len(sortino_ratios))) if sortino_ratios else None
-
-        drawdowns = [float(r.max_drawdown_pct) for r in daily_records if r.max_drawdown_pct]
-        monthly.max_drawdown_pct = Decimal(str(min(drawdowns))) if drawdowns else None
-
-        # AI costs
-        monthly.total_ai_cost_usd = Decimal(str(sum(float(r.ai_cost_usd or 0) for r in daily_records)))
-        monthly.avg_daily_ai_cost = monthly.total_ai_cost_usd / monthly.trading_days
-        monthly.total_tokens_used = sum(r.ai_tokens_used for r in daily_records)
-
-        # Save
-        if not existing:
-            self.db.add(monthly)
-        self.db.commit()
-        self.db.refresh(monthly)
-
-        logger.info(f"Monthly analytics saved for {year}-{month:02d}: PnL=${monthly.monthly_pnl:,.2f}")
+        logger.info(f"Monthly analytics saved for {year}-{month:02d}: PnL=${monthly[0].monthly_pnl:,.2f}")
 
-        return monthly
+        return monthly[0]
 
     async def run_daily_aggregation(self):
         """
@@ -706,7 +545,6 @@ class AnalyticsAggregator:
                 await self.aggregate_weekly_metrics(iso_year, iso_week)
 
             # 4. Check if we need monthly aggregation (last day of month)
-            from calendar import monthrange
             _, last_day = monthrange(target_date.year, target_date.month)
             if target_date.day == last_day:
                 await self.aggregate_monthly_metrics(target_date.year, target_date.month)
@@ -164,6 +164,21 @@ class DailyPriceSyncScheduler:
             f"✓ Scheduler started: Daily sync at {self.sync_time} {self.timezone}"
         )
 
+    def register_jobs(self, runtime):
+        """Register the daily sync with the shared SchedulerRuntime (instead of start())."""
+        from backend.schedulers.scheduler_runtime import ScheduledJob
+
+        hour, minute = map(int, self.sync_time.split(":"))
+        runtime.add_job(ScheduledJob(
+            id="daily_price_sync",
+            name="Daily Stock Price Sync",
+            func=self._scheduled_sync,
+            trigger=CronTrigger(hour=hour, minute=minute, timezone=self.timezone),
+            concurrency_class="yfinance",
+            jitter_seconds=60,
+            misfire_grace_seconds=3600,
+        ))
+
     def stop(self):
         """Stop the scheduler."""
         if not self.is_running:
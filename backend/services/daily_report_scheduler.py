@@ -174,6 +174,27 @@ class DailyReportScheduler:
             f"Weekly: Mondays {self.weekly_time}, Monthly: 1st {self.monthly_time}"
         )
     
+    def register_jobs(self, runtime):
+        """Register daily/weekly/monthly reports with the shared SchedulerRuntime (instead of start())."""
+        from backend.schedulers.scheduler_runtime import ScheduledJob
+        
+        for job_id, name, func, trigger in (
+            ("daily_report_generation", "Daily Report Generation", self._generate_daily_report,
+             CronTrigger(hour=self.daily_time.hour, minute=self.daily_time.minute)),
+            ("weeklyreport_generation", "Weekly Report Generation", self._generate_weekly_report,
+             CronTrigger(day_of_week='mon', hour=self.weekly_time.hour, minute=self.weekly_time.minute)),
+            ("monthly_report_generation", "Monthly Report Generation", self._generate_monthly_report,
+             CronTrigger(day=1, hour=self.monthly_time.hour, minute=self.monthly_time.minute)),
+        ):
+            runtime.add_job(ScheduledJob(
+                id=job_id,
+                name=name,
+                func=func,
+                trigger=trigger,
+                concurrency_class="db_heavy",
+                misfire_grace_seconds=3600,
+            ))
+    
     def stop(self):
         """Stop the scheduler."""
         if not self.is_running:
@@ -1,13 +1,24 @@
 """
 Options Filter
 옵션 이상 징후 감지 필터 (Massive API 연동)
+
+yfinance 호출은 스레드에서 실행(동시성 제한)하고, 체인 분석은
+OptionsChainEngine 벡터 연산으로 수행하여 유니버스 전체를 한 스캔 주기 안에 처리합니다.
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 import asyncio
+import logging
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+from backend.ai.options.chain_engine import OptionsChainEngine
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class OptionsFilterResult:
@@ -21,6 +32,8 @@ class OptionsFilterResult:
     whale_activity: bool
     passed: bool
     reason: str
+    net_dollar_delta: Optional[float] = None    # 체결 흐름 Dollar-Delta
+    net_gamma_exposure: Optional[float] = None  # 딜러 Gamma Exposure (1% 변동당 $)
 
 
 class OptionsFilter:
@@ -43,11 +56,37 @@ class OptionsFilter:
         put_call_bullish_threshold: float = 0.7,  # 0.7 미만이면 강세
         put_call_bearish_threshold: float = 1.3,  # 1.3 초과면 약세
         unusual_volume_ratio: float = 2.0,  # 평균 대비 2배
+        max_concurrency: int = 8,  # 동시 yfinance 체인 요청 수
     ):
         self.massive_api_client = massive_api_client
         self.put_call_bullish_threshold = put_call_bullish_threshold
         self.put_call_bearish_threshold = put_call_bearish_threshold
         self.unusual_volume_ratio = unusual_volume_ratio
+        self.max_concurrency = max_concurrency
+        self.engine = OptionsChainEngine()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """이벤트 루프별 세마포어 (루프가 바뀌면 재생성)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def check_many(self, tickers: List[str]) -> Dict[str, OptionsFilterResult]:
+        """
+        여러 종목 일괄 체크 (체인 조회는 max_concurrency 만큼 병렬)
+        
+        Args:
+            tickers: 종목 티커 리스트
+            
+        Returns:
+            {ticker: OptionsFilterResult}
+        """
+        results = await asyncio.gather(*(self.check(ticker) for ticker in tickers))
+        return dict(zip(tickers, results))
     
     async def check(self, ticker: str) -> OptionsFilterResult:
         """
@@ -90,15 +129,37 @@ class OptionsFilter:
                 reason=f"오류: {str(e)}"
             )
     
-    async def _check_with_yfinance(self, ticker: str) -> OptionsFilterResult:
-        """yfinance를 사용한 기본 옵션 분석"""
+    @staticmethod
+    def _fetch_chain(ticker: str) -> Optional[Tuple[pd.DataFrame, Optional[float]]]:
+        """가장 가까운 만기 옵션 체인 + 현재가 (blocking, 스레드에서 실행)"""
         import yfinance as yf
         
+        stock = yf.Ticker(ticker)
+        if not stock.options:
+            return None
+        
+        nearest_expiry = stock.options[0]
+        opt_chain = stock.option_chain(nearest_expiry)
+        
+        calls = opt_chain.calls.assign(contract_type='call', expiration=nearest_expiry)
+        puts = opt_chain.puts.assign(contract_type='put', expiration=nearest_expiry)
+        chain = pd.concat([calls, puts], ignore_index=True)
+        
+        spot = None
         try:
-            stock = yf.Ticker(ticker)
+            spot = float(stock.fast_info['last_price'])
+        except Exception:
+            pass  # 현재가 없으면 Greeks 생략
+        
+        return chain, spot
+    
+    async def _check_with_yfinance(self, ticker: str) -> OptionsFilterResult:
+        """yfinance를 사용한 기본 옵션 분석"""
+        try:
+            async with self._get_semaphore():
+                fetched = await asyncio.to_thread(self._fetch_chain, ticker)
             
-            # 옵션 체인 가져오기
-            if not stock.options:
+            if fetched is None:
                 return OptionsFilterResult(
                     ticker=ticker,
                     score=0,
@@ -111,66 +172,8 @@ class OptionsFilter:
                     reason="옵션 데이터 없음"
                 )
             
-            # 가장 가까운 만기 옵션 체인
-            nearest_expiry = stock.options[0]
-            opt_chain = stock.option_chain(nearest_expiry)
-            
-            calls = opt_chain.calls
-            puts = opt_chain.puts
-            
-            # Put/Call 비율 계산
-            total_call_volume = calls['volume'].sum() if 'volume' in calls.columns else 0
-            total_put_volume = puts['volume'].sum() if 'volume' in puts.columns else 0
-            
-            put_call_ratio = total_put_volume / total_call_volume if total_call_volume > 0 else 1.0
-            
-            # 평균 IV 계산
-            avg_iv = None
-            if 'impliedVolatility' in calls.columns:
-                avg_iv = float(calls['impliedVolatility'].mean())
-            
-            # 이상 거래량 감지 (간단 버전)
-            total_volume = total_call_volume + total_put_volume
-            unusual_volume = total_volume > 10000  # 임계값
-            
-            # 센티먼트 결정
-            if put_call_ratio < self.put_call_bullish_threshold:
-                options_sentiment = "BULLISH"
-            elif put_call_ratio > self.put_call_bearish_threshold:
-                options_sentiment = "BEARISH"
-            else:
-                options_sentiment = "NEUTRAL"
-            
-            # 점수 계산 (강세 신호일수록 높은 점수)
-            if options_sentiment == "BULLISH":
-                score = min(100, (self.put_call_bullish_threshold - put_call_ratio) / self.put_call_bullish_threshold * 100)
-                passed = True
-                reason = f"옵션 강세 신호 (P/C: {put_call_ratio:.2f})"
-            elif options_sentiment == "BEARISH":
-                score = 0
-                passed = False
-                reason = f"옵션 약세 신호 (P/C: {put_call_ratio:.2f})"
-            else:
-                score = 30
-                passed = False
-                reason = f"옵션 중립 (P/C: {put_call_ratio:.2f})"
-            
-            # 이상 거래량이면 보너스
-            if unusual_volume and passed:
-                score = min(100, score + 20)
-                reason += ", 이상 거래량 감지"
-            
-            return OptionsFilterResult(
-                ticker=ticker,
-                score=score,
-                put_call_ratio=put_call_ratio,
-                unusual_volume=unusual_volume,
-                implied_volatility=avg_iv,
-                options_sentiment=options_sentiment,
-                whale_activity=False,  # yfinance로는 감지 불가
-                passed=passed,
-                reason=reason
-            )
+            chain, spot = fetched
+            return self._score_chain(ticker, chain, spot)
             
         except Exception as e:
             return OptionsFilterResult(
@@ -185,6 +188,88 @@ class OptionsFilter:
                 reason=f"yfinance 오류: {str(e)}"
             )
     
+    def _score_chain(
+        self,
+        ticker: str,
+        chain: pd.DataFrame,
+        spot: Optional[float] = None,
+    ) -> OptionsFilterResult:
+        """
+        옵션 체인 점수화 (벡터 연산)
+        
+        Args:
+            ticker: 종목 티커
+            chain: 콜+풋 체인 (contract_type 컬럼)
+            spot: 현재가 (있으면 IV/Greeks 계산)
+        """
+        prepared = self.engine.prepare(chain, spot=spot)
+        is_call = (prepared['contract_type'] == 'call').to_numpy()
+        volume = prepared['volume'].to_numpy()
+        
+        # Put/Call 비율 계산
+        total_call_volume = float(volume[is_call].sum())
+        total_put_volume = float(volume[~is_call].sum())
+        
+        put_call_ratio = total_put_volume / total_call_volume if total_call_volume > 0 else 1.0
+        
+        # 평균 IV 계산 (콜 기준, Black-Scholes IV → 없으면 제공자 IV)
+        avg_iv = None
+        call_iv = prepared.loc[is_call, 'iv'].to_numpy(dtype=float)
+        if np.isfinite(call_iv).any():
+            avg_iv = float(np.nanmean(call_iv))
+        elif 'impliedVolatility' in prepared.columns:
+            avg_iv = float(prepared.loc[is_call, 'impliedVolatility'].mean())
+        
+        # 이상 거래량 감지 (간단 버전)
+        total_volume = total_call_volume + total_put_volume
+        unusual_volume = total_volume > 10000  # 임계값
+        
+        # 센티먼트 결정
+        if put_call_ratio < self.put_call_bullish_threshold:
+            options_sentiment = "BULLISH"
+        elif put_call_ratio > self.put_call_bearish_threshold:
+            options_sentiment = "BEARISH"
+        else:
+            options_sentiment = "NEUTRAL"
+        
+        # 점수 계산 (강세 신호일수록 높은 점수)
+        if options_sentiment == "BULLISH":
+            score = min(100, (self.put_call_bullish_threshold - put_call_ratio) / self.put_call_bullish_threshold * 100)
+            passed = True
+            reason = f"옵션 강세 신호 (P/C: {put_call_ratio:.2f})"
+        elif options_sentiment == "BEARISH":
+            score = 0
+            passed = False
+            reason = f"옵션 약세 신호 (P/C: {put_call_ratio:.2f})"
+        else:
+            score = 30
+            passed = False
+            reason = f"옵션 중립 (P/C: {put_call_ratio:.2f})"
+        
+        # 이상 거래량이면 보너스
+        if unusual_volume and passed:
+            score = min(100, score + 20)
+            reason += ", 이상 거래량 감지"
+        
+        net_dollar_delta = net_gamma_exposure = None
+        if spot:
+            net_dollar_delta = float(prepared['flow_dollar_delta'].sum())
+            net_gamma_exposure = float(prepared['gamma_exposure'].sum())
+        
+        return OptionsFilterResult(
+            ticker=ticker,
+            score=score,
+            put_call_ratio=put_call_ratio,
+            unusual_volume=unusual_volume,
+            implied_volatility=avg_iv,
+            options_sentiment=options_sentiment,
+            whale_activity=False,  # yfinance로는 감지 불가
+            passed=passed,
+            reason=reason,
+            net_dollar_delta=net_dollar_delta,
+            net_gamma_exposure=net_gamma_exposure,
+        )
+    
     async def _check_with_massive_api(self, ticker: str) -> OptionsFilterResult:
         """Massive API를 사용한 고급 옵션 분석"""
         try:
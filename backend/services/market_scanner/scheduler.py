@@ -9,6 +9,7 @@ Screener Scheduler
 import asyncio
 import logging
 from datetime import datetime, time
+from functools import partial
 from typing import Optional, Callable, Awaitable, List
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -81,6 +82,20 @@ class ScreenerScheduler:
         logger.info("  - Pre-Market: 08:00 EST (월-금)")
         logger.info("  - Mid-Day: 12:00 EST (월-금)")
     
+    def register_jobs(self, runtime):
+        """공용 SchedulerRuntime 에 스캔 작업 등록 (start() 대신)"""
+        from backend.schedulers.scheduler_runtime import ScheduledJob
+        
+        for scan_type, hour, name in (("premarket", 8, "Pre-Market Scan"), ("midday", 12, "Mid-Day Scan")):
+            runtime.add_job(ScheduledJob(
+                id=f"{scan_type}_scan",
+                name=name,
+                func=partial(self._run_scan, scan_type=scan_type),
+                trigger=CronTrigger(hour=hour, minute=0, day_of_week="mon-fri", timezone=EST),
+                concurrency_class="yfinance",
+                misfire_grace_seconds=900,
+            ))
+    
     def stop(self):
         """스케줄러 중지"""
         if not self.is_running:
@@ -153,6 +153,23 @@ class StockPriceScheduler:
         self.is_running = False
         logger.info("Scheduler stopped")
     
+    def register_jobs(self, runtime):
+        """Register the daily update with the shared SchedulerRuntime (instead of start())."""
+        from backend.schedulers.scheduler_runtime import ScheduledJob
+        
+        runtime.add_job(ScheduledJob(
+            id="daily_stock_price_update",
+            name="Daily Stock Price Update",
+            func=self._run_daily_update,
+            trigger=CronTrigger(
+                hour=self.schedule_time.hour,
+                minute=self.schedule_time.minute
+            ),
+            concurrency_class="yfinance",
+            jitter_seconds=60,
+            misfire_grace_seconds=3600,
+        ))
+    
     async def _run_daily_update(self):
         """Run daily stock price update with error recovery."""
         logger.info("Starting daily stock price update")
@@ -5,7 +5,9 @@ Phase E + Option 2 통합
 실시간으로 포지션을 모니터링하고 손절 조건 체크
 
 핵심 기능:
-1. 주기적으로 모든 포지션 체크 (1분 간격)
+1. 주기적으로 모든 포지션 체크 (1분 간격, 가격은 체크마다 일괄 조회)
+   - PriceBus 연결 시: 포지션별 손절가를 임계값 감시로 등록 → 틱 도착 즉시 체크
+     (주기 루프는 감시 동기화 + last-value cache 기반 점검만 수행)
 2. 손절 조건 체크 (손실률, 변동성, 시간 등)
 3. Consensus 투표 (1/3 승인으로 즉시 실행)
 4. Auto Trader로 Stop-loss 주문 전달
@@ -23,6 +25,9 @@ from backend.data.position_tracker import PositionTracker, Position
 from backend.ai.consensus.consensus_engine import ConsensusEngine
 from backend.automation.auto_trader import AutoTrader
 from backend.schemas.base_schema import MarketContext, NewsFeatures, MarketSegment
+from backend.market_data.price_fetcher import PriceFetcher
+from backend.market_data.snapshot_service import MarketSnapshotService
+from backend.market_data.price_bus import BELOW, PriceBus, ThresholdEvent
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +63,12 @@ class StopLossMonitor:
         kis_broker=None,
         stop_loss_threshold_pct: float = -10.0,
         check_interval_seconds: int = 60,
-        enable_auto_execute: bool = False
+        enable_auto_execute: bool = False,
+        price_fetcher: Optional[PriceFetcher] = None,
+        snapshot_service: Optional[MarketSnapshotService] = None,
+        price_bus: Optional[PriceBus] = None,
+        max_quote_age_seconds: float = 120.0,
+        max_concurrent_quotes: int = 4
     ):
         """
         Initialize Stop-Loss Monitor
@@ -71,6 +81,11 @@ class StopLossMonitor:
             stop_loss_threshold_pct: 손절 기준 (-10.0 = -10%)
             check_interval_seconds: 체크 간격 (초)
             enable_auto_execute: 자동 실행 여부
+            price_fetcher: 일괄 가격 조회기 (Broker 없거나 실패 시 사용)
+            snapshot_service: 공유 시장 스냅샷 서비스 (지정 시 price_fetcher 대신 사용)
+            price_bus: 실시간 가격 버스 (지정 시 손절가 돌파 이벤트로 즉시 체크)
+            max_quote_age_seconds: 버스 last-value cache 허용 나이 (초과 시 가격 조회기 사용)
+            max_concurrent_quotes: Broker 종목별 시세 요청 동시 실행 수 (KIS 초당 호출 제한)
         """
         self.position_tracker = position_tracker
         self.consensus_engine = consensus_engine
@@ -79,6 +94,16 @@ class StopLossMonitor:
         self.stop_loss_threshold_pct = stop_loss_threshold_pct
         self.check_interval_seconds = check_interval_seconds
         self.enable_auto_execute = enable_auto_execute
+        self.price_fetcher = price_fetcher
+        self.snapshot_service = snapshot_service
+        self.price_bus = price_bus
+        self.max_quote_age_seconds = max_quote_age_seconds
+        self._quote_semaphore = asyncio.Semaphore(max(1, max_concurrent_quotes))
+
+        # 이벤트 기반 손절 감시 (ticker → 감시 중인 손절가)
+        self._stop_levels: Dict[str, float] = {}
+        self._executing: set = set()
+        self.event_trigger_count = 0
 
         # 모니터링 상태
         self.is_running = False
@@ -104,6 +129,7 @@ class StopLossMonitor:
 
         try:
             while self.is_running:
+                self.sync_stop_watches()
                 await self._check_all_positions()
                 await asyncio.sleep(self.check_interval_seconds)
 
@@ -115,11 +141,86 @@ class StopLossMonitor:
             logger.error(f"Stop-Loss monitoring error: {e}")
             self.is_running = False
 
+        finally:
+            self._clear_stop_watches()
+
     def stop_monitoring(self):
         """모니터링 중지"""
         logger.info("Stopping Stop-Loss monitoring...")
         self.is_running = False
 
+    # ========================================================================
+    # Event-driven stop checks (PriceBus)
+    # ========================================================================
+
+    def _stop_key(self, ticker: str) -> str:
+        return f"stop_loss:{id(self)}:{ticker}"
+
+    def stop_price(self, position: Position) -> float:
+        """손절가 (평균 매수가 × (1 + 손절 기준%))"""
+        return position.avg_entry_price * (1 + self.stop_loss_threshold_pct / 100)
+
+    def sync_stop_watches(self) -> int:
+        """
+        포지션별 손절가 감시를 PriceBus에 동기화
+
+        신규/평단 변경 포지션은 감시 등록(교체), 청산된 포지션은 감시 해제.
+
+        Returns:
+            감시 중인 포지션 수
+        """
+        if self.price_bus is None:
+            return 0
+
+        positions = {p.ticker: p for p in self.position_tracker.get_all_positions()}
+
+        for ticker in list(self._stop_levels):
+            if ticker not in positions:
+                self.price_bus.remove_threshold(self._stop_key(ticker))
+                self.price_bus.untrack([ticker])
+                del self._stop_levels[ticker]
+
+        for ticker, position in positions.items():
+            if not position.avg_entry_price:
+                continue
+            level = self.stop_price(position)
+            key = self._stop_key(ticker)
+            if self._stop_levels.get(ticker) == level and self.price_bus.get_threshold(key) is not None:
+                continue
+            if ticker not in self._stop_levels:
+                self.price_bus.track([ticker])
+            self._stop_levels[ticker] = level
+            self.price_bus.add_threshold(ticker, level, BELOW, self._on_stop_event, key=key)
+
+        return len(self._stop_levels)
+
+    def _clear_stop_watches(self) -> None:
+        if self.price_bus is None:
+            return
+        for ticker in list(self._stop_levels):
+            self.price_bus.remove_threshold(self._stop_key(ticker))
+            self.price_bus.untrack([ticker])
+        self._stop_levels.clear()
+
+    async def _on_stop_event(self, event: ThresholdEvent):
+        """손절가 돌파 틱 → 해당 포지션 즉시 체크 (가격 조회 없음)"""
+        ticker = event.symbol
+        # 1회 감시이므로 다음 동기화에서 재등록되도록 표시 해제
+        self._stop_levels.pop(ticker, None)
+
+        position = self.position_tracker.get_position(ticker)
+        if position is None or ticker in self._executing:
+            return
+
+        self.event_trigger_count += 1
+        self._executing.add(ticker)
+        try:
+            await self._check_position(position, event.price)
+        except Exception as e:
+            logger.error(f"Error checking position {ticker} on price event: {e}")
+        finally:
+            self._executing.discard(ticker)
+
     async def _check_all_positions(self):
         """
         모든 포지션 체크
@@ -135,23 +236,35 @@ class StopLossMonitor:
 
         logger.info(f"[Check #{self.check_count}] Monitoring {len(positions)} positions...")
 
+        # 전체 포지션 가격을 한 번에 조회 (포지션별 순차 조회 대신)
+        prices = await self._get_current_prices([p.ticker for p in positions])
+
         for position in positions:
+            current_price = prices.get(position.ticker)
+            if current_price is None:
+                logger.warning(f"Cannot get price for {position.ticker}, skipping")
+                continue
+            if position.ticker in self._executing:
+                continue
+
             try:
-                await self._check_position(position)
+                await self._check_position(position, current_price)
             except Exception as e:
                 logger.error(f"Error checking position {position.ticker}: {e}")
 
-    async def _check_position(self, position: Position):
+    async def _check_position(self, position: Position, current_price: Optional[float] = None):
         """
         개별 포지션 체크
 
         Args:
             position: Position 객체
+            current_price: 미리 조회한 현재 가격 (없으면 개별 조회)
         """
         ticker = position.ticker
 
         # 1. 현재 가격 조회
-        current_price = await self._get_current_price(ticker)
+        if current_price is None:
+            current_price = await self._get_current_price(ticker)
 
         if current_price is None:
             logger.warning(f"Cannot get price for {ticker}, skipping")
@@ -197,17 +310,69 @@ class StopLossMonitor:
             현재 가격 (실패 시 None)
         """
         if self.broker is None:
-            # Broker 없으면 Mock 가격 (테스트용)
-            return None
+            # Broker 없으면 가격 조회기 사용 (둘 다 없으면 테스트용 None)
+            prices = await self._fetch_prices([ticker])
+            return prices.get(ticker)
 
         try:
-            price_info = self.broker.get_price(ticker)
+            # Broker API는 동기 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            price_info = await asyncio.to_thread(self.broker.get_price, ticker)
             return price_info.get("current_price") if price_info else None
 
         except Exception as e:
             logger.error(f"Error getting price for {ticker}: {e}")
             return None
 
+    async def _get_current_prices(self, tickers: List[str]) -> Dict[str, Optional[float]]:
+        """
+        여러 종목 현재 가격 일괄 조회
+
+        Broker가 있으면 종목별 요청을 동시에 실행하고 (max_concurrent_quotes 로 제한), 실패한 종목은
+        가격 조회기(일괄 다운로드 + 공유 캐시)로 보완한다.
+
+        Args:
+            tickers: 종목 티커 리스트
+
+        Returns:
+            {ticker: 현재 가격 또는 None}
+        """
+        tickers = list(dict.fromkeys(tickers))
+
+        # 실시간 버스 last-value cache 우선 (최근 틱이 있는 종목은 조회 없음)
+        streamed: Dict[str, Optional[float]] = {}
+        if self.price_bus is not None:
+            streamed = {
+                t: p for t, p in self.price_bus.last_prices(tickers, self.max_quote_age_seconds).items()
+                if p is not None
+            }
+            tickers = [t for t in tickers if t not in streamed]
+            if not tickers:
+                return streamed
+
+        if self.broker is None:
+            return {**streamed, **await self._fetch_prices(tickers)}
+
+        async def gated(ticker: str) -> Optional[float]:
+            async with self._quote_semaphore:
+                return await self._get_current_price(ticker)
+
+        results = await asyncio.gather(*(gated(t) for t in tickers))
+        prices = dict(zip(tickers, results))
+
+        missing = [t for t, price in prices.items() if price is None]
+        if missing:
+            prices.update(await self._fetch_prices(missing))
+
+        return {**streamed, **prices}
+
+    async def _fetch_prices(self, tickers: List[str]) -> Dict[str, Optional[float]]:
+        """Broker 외 가격 소스 (스냅샷 서비스 → 가격 조회기, 둘 다 없으면 None)"""
+        if self.snapshot_service is not None:
+            return await self.snapshot_service.get_prices(tickers)
+        if self.price_fetcher is not None:
+            return await self.price_fetcher.get_prices_async(tickers)
+        return {ticker: None for ticker in tickers}
+
     async def _execute_stop_loss(self, position: Position, condition: StopLossCondition):
         """
         Stop-Loss 실행
@@ -311,6 +476,9 @@ class StopLossMonitor:
             "current_positions": len(self.position_tracker.get_all_positions()),
             "stop_loss_threshold_pct": self.stop_loss_threshold_pct,
             "check_interval_seconds": self.check_interval_seconds,
+            "event_driven": self.price_bus is not None,
+            "stop_watches": len(self._stop_levels),
+            "event_trigger_count": self.event_trigger_count,
             "recent_triggers": [
                 {
                     "ticker": t.ticker,
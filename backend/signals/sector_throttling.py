@@ -6,6 +6,8 @@ Features:
 - Tracks signals per sector with time windows
 - Configurable limits per sector
 - Correlation-based risk detection
+- O(1) ring-buffer window counters per sector / ticker / direction
+- Optional Redis mirror so several API workers share one throttle state
 
 This prevents scenarios where multiple news articles about the same topic
 (e.g., "Semiconductor subsidies") generate 10+ BUY signals for related stocks,
@@ -16,12 +18,21 @@ Date: 2025-11-15
 """
 
 import logging
+import os
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
 
+from backend.signals.sliding_window import (
+    REDIS_AVAILABLE,
+    SlidingWindowCounters,
+    WindowSpec,
+    redis,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +62,11 @@ class SectorThrottleConfig:
     # Emergency brake
     enable_emergency_brake: bool = True
     emergency_brake_threshold: float = 0.3  # 30% portfolio in one sector = stop
+    
+    # Window counters
+    counter_buckets_per_window: int = 60  # resolution = window / buckets
+    retention_days: int = 7  # sector summary totals
+    recent_signal_history: int = 1000  # SignalRecord kept for inspection
 
 
 # Default sector groupings (can be extended)
@@ -146,13 +162,47 @@ class ThrottleDecision:
 class SectorSignalTracker:
     """
     Tracks signal generation per sector with time-based windows.
+    
+    Counts live in time-bucketed ring buffers (hourly / daily / retention)
+    keyed by sector, ticker and direction, so throttle checks are O(1)
+    regardless of how many signals were recorded. With a Redis client the
+    counters are mirrored and read back from Redis, sharing one throttle
+    state across API workers.
     """
     
-    def __init__(self, config: Optional[SectorThrottleConfig] = None):
+    PRUNE_EVERY = 500  # records between local key pruning
+    
+    def __init__(
+        self,
+        config: Optional[SectorThrottleConfig] = None,
+        redis_client=None,
+        redis_url: Optional[str] = None,
+        redis_prefix: str = "throttle:sector",
+        clock: Callable[[], float] = time.time,
+    ):
         self.config = config or SectorThrottleConfig()
         
-        # Signal history
-        self._signals: List[SignalRecord] = []
+        redis_url = redis_url or os.getenv("SECTOR_THROTTLE_REDIS_URL")
+        if redis_client is None and redis_url:
+            if REDIS_AVAILABLE:
+                redis_client = redis.Redis.from_url(redis_url, socket_timeout=1)
+            else:
+                logger.warning("redis package not installed - sector throttle uses local counters only")
+        
+        buckets = self.config.counter_buckets_per_window
+        self.counters = SlidingWindowCounters(
+            windows=[
+                WindowSpec("hourly", self.config.hourly_window_minutes * 60, buckets),
+                WindowSpec("daily", self.config.daily_window_hours * 3600, buckets),
+                WindowSpec("retention", self.config.retention_days * 86400, self.config.retention_days * 24),
+            ],
+            redis_client=redis_client,
+            redis_prefix=redis_prefix,
+            clock=clock,
+        )
+        
+        # Recent signal history (bounded, not used for counting)
+        self._signals: deque = deque(maxlen=self.config.recent_signal_history)
         
         # Statistics
         self.stats = {
@@ -166,12 +216,19 @@ class SectorSignalTracker:
             f"SectorSignalTracker initialized: "
             f"max {self.config.max_trades_per_sector_per_hour}/hour, "
             f"{self.config.max_trades_per_sector_per_day}/day per sector"
+            f"{' (redis mirror)' if redis_client is not None else ''}"
         )
     
     def get_ticker_sector(self, ticker: str) -> str:
         """Get sector for a ticker"""
         return SECTOR_MAPPING.get(ticker.upper(), "UNKNOWN")
     
+    def _resolve_sector(self, ticker: str, sectors_from_news: Optional[List[str]]) -> str:
+        if sectors_from_news and len(sectors_from_news) > 0:
+            # Use sector from news analysis if available
+            return sectors_from_news[0].upper()
+        return self.get_ticker_sector(ticker)
+    
     def can_generate_signal(
         self,
         ticker: str,
@@ -189,37 +246,23 @@ class SectorSignalTracker:
         Returns:
             ThrottleDecision with allow/deny and reason
         """
-        now = datetime.now()
+        now = self.counters.clock()
         
         # 1. Determine sector
-        sector = self.get_ticker_sector(ticker)
-        if sectors_from_news and len(sectors_from_news) > 0:
-            # Use sector from news analysis if available
-            sector = sectors_from_news[0].upper()
-        
-        # 2. Count signals in time windows
-        hourly_cutoff = now - timedelta(minutes=self.config.hourly_window_minutes)
-        daily_cutoff = now - timedelta(hours=self.config.daily_window_hours)
-        
-        hourly_sector_count = sum(
-            1 for s in self._signals
-            if s.sector == sector and s.timestamp >= hourly_cutoff
-        )
-        
-        daily_sector_count = sum(
-            1 for s in self._signals
-            if s.sector == sector and s.timestamp >= daily_cutoff
-        )
+        sector = self._resolve_sector(ticker, sectors_from_news)
         
-        hourly_total_count = sum(
-            1 for s in self._signals
-            if s.timestamp >= hourly_cutoff
+        # 2. Count signals in time windows (O(1) per key)
+        sector_key = f"sector:{sector}"
+        correlated = CORRELATED_SECTORS.get(sector, [])
+        hourly = self.counters.counts(
+            "hourly", [sector_key, "total"] + [f"sector:{c}" for c in correlated], now
         )
+        daily = self.counters.counts("daily", [sector_key, "total"], now)
         
-        daily_total_count = sum(
-            1 for s in self._signals
-            if s.timestamp >= daily_cutoff
-        )
+        hourly_sector_count = hourly[sector_key]
+        daily_sector_count = daily[sector_key]
+        hourly_total_count = hourly["total"]
+        daily_total_count = daily["total"]
         
         # 3. Check limits
         
@@ -282,12 +325,8 @@ class SectorSignalTracker:
             )
         
         # Check correlated sectors
-        correlated = CORRELATED_SECTORS.get(sector, [])
         for corr_sector in correlated:
-            corr_hourly = sum(
-                1 for s in self._signals
-                if s.sector == corr_sector and s.timestamp >= hourly_cutoff
-            )
+            corr_hourly = hourly[f"sector:{corr_sector}"]
             if corr_hourly >= self.config.max_trades_per_sector_per_hour:
                 logger.warning(
                     f"Correlated sector {corr_sector} is at limit, "
@@ -337,9 +376,7 @@ class SectorSignalTracker:
             news_source_id: ID of source news article
             executed: Whether signal was actually executed
         """
-        sector = self.get_ticker_sector(ticker)
-        if sectors_from_news and len(sectors_from_news) > 0:
-            sector = sectors_from_news[0].upper()
+        sector = self._resolve_sector(ticker, sectors_from_news)
         
         record = SignalRecord(
             ticker=ticker,
@@ -351,6 +388,16 @@ class SectorSignalTracker:
             executed=executed,
         )
         
+        keys = [
+            "total",
+            f"sector:{sector}",
+            f"ticker:{ticker.upper()}",
+            f"direction:{str(action).upper()}",
+        ]
+        if executed:
+            keys.append(f"sector_executed:{sector}")
+        self.counters.increment(keys)
+        
         self._signals.append(record)
         self.stats["total_signals"] += 1
         if executed:
@@ -361,17 +408,25 @@ class SectorSignalTracker:
             f"confidence={confidence:.2f} executed={executed}"
         )
         
-        # Cleanup old signals (older than 7 days)
-        self._cleanup_old_signals()
+        # Drop expired local counter keys (bucket expiry itself is O(1))
+        if self.stats["total_signals"] % self.PRUNE_EVERY == 0:
+            self._cleanup_old_signals()
     
     def _cleanup_old_signals(self):
-        """Remove signals older than 7 days to prevent memory bloat"""
-        cutoff = datetime.now() - timedelta(days=7)
-        initial_count = len(self._signals)
-        self._signals = [s for s in self._signals if s.timestamp >= cutoff]
-        removed = initial_count - len(self._signals)
+        """Drop counter keys with no signals left in any window"""
+        removed = self.counters.prune()
         if removed > 0:
-            logger.debug(f"Cleaned up {removed} old signal records")
+            logger.debug(f"Pruned {removed} expired throttle counter keys")
+    
+    def get_ticker_count(self, ticker: str, window: str = "hourly") -> int:
+        """Signals for a ticker in a window (hourly / daily / retention)"""
+        return self.counters.count(window, f"ticker:{ticker.upper()}")
+    
+    def get_direction_counts(self, window: str = "hourly") -> Dict[str, int]:
+        """Signals per direction (BUY / SELL) in a window"""
+        keys = self.counters.active_keys(window, prefix="direction:")
+        counts = self.counters.counts(window, keys)
+        return {key.split(":", 1)[1]: count for key, count in counts.items()}
     
     def get_sector_summary(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -380,22 +435,25 @@ class SectorSignalTracker:
         Returns:
             Dictionary with sector statistics
         """
-        now = datetime.now()
-        hourly_cutoff = now - timedelta(minutes=self.config.hourly_window_minutes)
-        daily_cutoff = now - timedelta(hours=self.config.daily_window_hours)
+        now = self.counters.clock()
+        sectors = [
+            key.split(":", 1)[1]
+            for key in self.counters.active_keys("retention", prefix="sector:", now=now)
+        ]
+        if not sectors:
+            return {}
+        
+        sector_keys = [f"sector:{sector}" for sector in sectors]
+        hourly = self.counters.counts("hourly", sector_keys, now)
+        daily = self.counters.counts("daily", sector_keys, now)
+        retained = self.counters.counts(
+            "retention", sector_keys + [f"sector_executed:{sector}" for sector in sectors], now
+        )
         
         summary = {}
-        
-        # Get all unique sectors
-        sectors = set(s.sector for s in self._signals)
-        
         for sector in sectors:
-            sector_signals = [s for s in self._signals if s.sector == sector]
-            
-            hourly_count = sum(1 for s in sector_signals if s.timestamp >= hourly_cutoff)
-            daily_count = sum(1 for s in sector_signals if s.timestamp >= daily_cutoff)
-            
-            executed_count = sum(1 for s in sector_signals if s.executed)
+            hourly_count = hourly[f"sector:{sector}"]
+            daily_count = daily[f"sector:{sector}"]
             
             summary[sector] = {
                 "hourly_count": hourly_count,
@@ -404,8 +462,8 @@ class SectorSignalTracker:
                 "daily_limit": self.config.max_trades_per_sector_per_day,
                 "hourly_remaining": max(0, self.config.max_trades_per_sector_per_hour - hourly_count),
                 "daily_remaining": max(0, self.config.max_trades_per_sector_per_day - daily_count),
-                "total_signals": len(sector_signals),
-                "executed_signals": executed_count,
+                "total_signals": retained[f"sector:{sector}"],
+                "executed_signals": retained[f"sector_executed:{sector}"],
             }
         
         return summary
@@ -417,13 +475,11 @@ class SectorSignalTracker:
         Returns:
             List of (sector, count) tuples sorted by activity
         """
-        now = datetime.now()
-        hourly_cutoff = now - timedelta(minutes=self.config.hourly_window_minutes)
-        
-        sector_counts = defaultdict(int)
-        for signal in self._signals:
-            if signal.timestamp >= hourly_cutoff:
-                sector_counts[signal.sector] += 1
+        keys = self.counters.active_keys("hourly", prefix="sector:")
+        counts = self.counters.counts("hourly", keys)
+        sector_counts = {
+            key.split(":", 1)[1]: count for key, count in counts.items() if count > 0
+        }
         
         # Sort by count, descending
         hot_sectors = sorted(sector_counts.items(), key=lambda x: x[1], reverse=True)
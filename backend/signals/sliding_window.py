@@ -0,0 +1,256 @@
+"""
+Time-Bucketed Sliding Window Counters
+
+Ring-buffer counters for signal throttling:
+- Each window (e.g. 1 hour) is split into N buckets (e.g. 60 x 1 minute)
+- increment / count are O(1); expired buckets are cleared as the ring advances
+  (each bucket is cleared once per rotation → amortized O(1) expiry)
+- Window resolution is one bucket: a count covers the current bucket plus the
+  previous N-1 buckets
+
+Optional Redis mirror:
+- One hash per (window, bucket epoch): {prefix}:{window}:{epoch} → {counter_key: count}
+- Writes are a single pipelined HINCRBY/EXPIRE round trip
+- Reads sum the N live buckets with one pipelined HMGET round trip
+- Several API workers sharing the same Redis see one throttle state
+
+Author: AI Trading System
+Date: 2026-10-18
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class WindowSpec:
+    """Sliding window definition"""
+    name: str
+    window_seconds: int
+    num_buckets: int = 60
+
+    @property
+    def bucket_seconds(self) -> float:
+        return self.window_seconds / self.num_buckets
+
+    def epoch(self, now: float) -> int:
+        """Bucket index since the Unix epoch"""
+        return int(now // self.bucket_seconds)
+
+
+class RingCounter:
+    """Single counter over one sliding window (ring of bucket counts)"""
+
+    __slots__ = ("buckets", "total", "last_epoch")
+
+    def __init__(self, num_buckets: int):
+        self.buckets: List[int] = [0] * num_buckets
+        self.total = 0
+        self.last_epoch: Optional[int] = None
+
+    def advance(self, epoch: int) -> None:
+        """Expire buckets that fell out of the window up to `epoch`"""
+        if self.last_epoch is None:
+            self.last_epoch = epoch
+            return
+
+        gap = epoch - self.last_epoch
+        if gap <= 0:
+            return
+
+        size = len(self.buckets)
+        if gap >= size:
+            self.buckets = [0] * size
+            self.total = 0
+        else:
+            for e in range(self.last_epoch + 1, epoch + 1):
+                idx = e % size
+                self.total -= self.buckets[idx]
+                self.buckets[idx] = 0
+        self.last_epoch = epoch
+
+    def add(self, epoch: int, amount: int = 1) -> None:
+        self.advance(epoch)
+        self.buckets[epoch % len(self.buckets)] += amount
+        self.total += amount
+
+    def count(self, epoch: int) -> int:
+        self.advance(epoch)
+        return self.total
+
+
+class RedisWindowMirror:
+    """
+    Redis mirror for sliding window counters (shared across workers)
+
+    All errors are soft: callers fall back to local counters.
+    """
+
+    def __init__(self, client, prefix: str = "throttle"):
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, spec: WindowSpec, epoch: int) -> str:
+        return f"{self.prefix}:{spec.name}:{epoch}"
+
+    def increment(self, specs: Iterable[WindowSpec], keys: Iterable[str], now: float) -> None:
+        keys = list(keys)
+        pipe = self.client.pipeline(transaction=False)
+        for spec in specs:
+            bucket_key = self._key(spec, spec.epoch(now))
+            for key in keys:
+                pipe.hincrby(bucket_key, key, 1)
+            # 윈도우 + 버킷 1개 만큼 유지 후 자동 만료
+            pipe.expire(bucket_key, int(spec.window_seconds + spec.bucket_seconds) + 1)
+        pipe.execute()
+
+    def counts(self, spec: WindowSpec, keys: List[str], now: float) -> Dict[str, int]:
+        current = spec.epoch(now)
+        pipe = self.client.pipeline(transaction=False)
+        for epoch in range(current - spec.num_buckets + 1, current + 1):
+            pipe.hmget(self._key(spec, epoch), keys)
+
+        totals = dict.fromkeys(keys, 0)
+        for values in pipe.execute():
+            for key, value in zip(keys, values):
+                if value is not None:
+                    totals[key] += int(value)
+        return totals
+
+    def bucket_keys(self, spec: WindowSpec, now: float) -> List[str]:
+        """All counter keys seen in the live window"""
+        current = spec.epoch(now)
+        pipe = self.client.pipeline(transaction=False)
+        for epoch in range(current - spec.num_buckets + 1, current + 1):
+            pipe.hkeys(self._key(spec, epoch))
+
+        seen = set()
+        for fields in pipe.execute():
+            seen.update(f.decode() if isinstance(f, bytes) else f for f in fields)
+        return sorted(seen)
+
+
+class SlidingWindowCounters:
+    """
+    Keyed sliding window counters over several windows
+
+    Usage:
+        counters = SlidingWindowCounters([WindowSpec("hourly", 3600), WindowSpec("daily", 86400)])
+        counters.increment(["sector:SEMICONDUCTORS", "ticker:NVDA", "total"])
+        counters.count("hourly", "sector:SEMICONDUCTORS")
+    """
+
+    def __init__(
+        self,
+        windows: List[WindowSpec],
+        redis_client=None,
+        redis_prefix: str = "throttle",
+        clock: Callable[[], float] = time.time,
+    ):
+        self.windows: Dict[str, WindowSpec] = {spec.name: spec for spec in windows}
+        self._counters: Dict[str, Dict[str, RingCounter]] = {spec.name: {} for spec in windows}
+        self.mirror = RedisWindowMirror(redis_client, redis_prefix) if redis_client is not None else None
+        self.clock = clock
+
+        self.stats = {
+            "increments": 0,
+            "redis_errors": 0,
+            "pruned_keys": 0,
+        }
+
+    def _ring(self, window: str, key: str) -> RingCounter:
+        counters = self._counters[window]
+        ring = counters.get(key)
+        if ring is None:
+            ring = counters[key] = RingCounter(self.windows[window].num_buckets)
+        return ring
+
+    def increment(self, keys: Iterable[str], now: Optional[float] = None) -> None:
+        """Add one event to every key in every window"""
+        now = self.clock() if now is None else now
+        keys = list(keys)
+        for name, spec in self.windows.items():
+            epoch = spec.epoch(now)
+            for key in keys:
+                self._ring(name, key).add(epoch)
+        self.stats["increments"] += 1
+
+        if self.mirror is not None:
+            try:
+                self.mirror.increment(self.windows.values(), keys, now)
+            except Exception as e:
+                self.stats["redis_errors"] += 1
+                logger.warning(f"Redis throttle mirror write failed (Soft Fail): {e}")
+
+    def counts(self, window: str, keys: List[str], now: Optional[float] = None) -> Dict[str, int]:
+        """Counts for several keys in one window (one Redis round trip when mirrored)"""
+        now = self.clock() if now is None else now
+        spec = self.windows[window]
+
+        if self.mirror is not None:
+            try:
+                return self.mirror.counts(spec, keys, now)
+            except Exception as e:
+                self.stats["redis_errors"] += 1
+                logger.warning(f"Redis throttle mirror read failed, using local counters: {e}")
+
+        epoch = spec.epoch(now)
+        counters = self._counters[window]
+        return {key: counters[key].count(epoch) if key in counters else 0 for key in keys}
+
+    def count(self, window: str, key: str, now: Optional[float] = None) -> int:
+        return self.counts(window, [key], now)[key]
+
+    def active_keys(self, window: str, prefix: str = "", now: Optional[float] = None) -> List[str]:
+        """Keys with a non-zero count in the window"""
+        now = self.clock() if now is None else now
+        spec = self.windows[window]
+
+        if self.mirror is not None:
+            try:
+                return [k for k in self.mirror.bucket_keys(spec, now) if k.startswith(prefix)]
+            except Exception as e:
+                self.stats["redis_errors"] += 1
+                logger.warning(f"Redis throttle mirror read failed, using local counters: {e}")
+
+        epoch = spec.epoch(now)
+        return [
+            key for key, ring in self._counters[window].items()
+            if key.startswith(prefix) and ring.count(epoch) > 0
+        ]
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop local keys whose counts expired in every window"""
+        now = self.clock() if now is None else now
+        removed = 0
+        for name, spec in self.windows.items():
+            epoch = spec.epoch(now)
+            counters = self._counters[name]
+            for key in [k for k, ring in counters.items() if ring.count(epoch) == 0]:
+                del counters[key]
+                removed += 1
+        self.stats["pruned_keys"] += removed
+        return removed
+
+    def reset(self, window: Optional[str] = None) -> None:
+        """Clear local counters (all windows, or one)"""
+        for name in ([window] if window else list(self._counters)):
+            self._counters[name] = {}
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "keys": {name: len(counters) for name, counters in self._counters.items()},
+            "redis_mirror": self.mirror is not None,
+        }
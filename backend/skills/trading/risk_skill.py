@@ -11,6 +11,7 @@ import logging
 from typing import List, Dict, Any, Optional
 import math
 
+from backend.analytics import risk_metrics
 from backend.skills.base_skill import BaseSkill, SkillCategory, CostTier
 
 logger = logging.getLogger(__name__)
@@ -667,24 +668,11 @@ class RiskSkill(BaseSkill):
                 "message": "Insufficient data for drawdown calculation"
             }
 
-        peak = equity_curve[0]
-        max_dd = 0
-        max_dd_start_idx = 0
-        max_dd_end_idx = 0
-        current_dd_start_idx = 0
+        summary = risk_metrics.drawdown_summary(equity_curve)
+        max_dd_start_idx = summary.peak_index
+        max_dd_end_idx = summary.trough_index
 
-        for i, value in enumerate(equity_curve):
-            if value > peak:
-                peak = value
-                current_dd_start_idx = i
-            else:
-                dd = (peak - value) / peak
-                if dd > max_dd:
-                    max_dd = dd
-                    max_dd_start_idx = current_dd_start_idx
-                    max_dd_end_idx = i
-
-        max_dd_pct = max_dd * 100
+        max_dd_pct = abs(summary.max_drawdown) * 100
         current_value = equity_curve[-1]
         current_peak = max(equity_curve)
         current_dd_pct = ((current_peak - current_value) / current_peak) * 100
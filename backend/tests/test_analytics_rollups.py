@@ -0,0 +1,254 @@
+"""
+Analytics Rollup Tests
+
+Tests for:
+- Set-based daily backfill from grouped SQL (trades, closed trades, signals, snapshots)
+- Weekly/monthly rollups derived from daily rows
+- Windowed risk metrics
+- RiskAnalyzer on precomputed daily rows
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.analytics import rollups
+from backend.analytics.risk_analytics import RiskAnalyzer
+from backend.core.models.analytics_models import (
+    DailyAnalytics,
+    MonthlyAnalytics,
+    PortfolioSnapshot,
+    SignalPerformance,
+    TradeExecution,
+    WeeklyAnalytics,
+)
+from backend.services.analytics_aggregator import AnalyticsAggregator
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_sqlite(element, compiler, **kw):
+    return "JSON"
+
+
+TABLES = [
+    DailyAnalytics.__table__,
+    TradeExecution.__table__,
+    PortfolioSnapshot.__table__,
+    SignalPerformance.__table__,
+    WeeklyAnalytics.__table__,
+    MonthlyAnalytics.__table__,
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for table in TABLES:
+        table.create(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _trade(n, day, action="BUY", size=1000, exit_day=None, is_win=None, pnl_pct=None):
+    executed = datetime.combine(day, datetime.min.time()) + timedelta(hours=15)
+    return TradeExecution(
+        trade_id=f"T{n}",
+        ticker="AAPL",
+        action=action,
+        signal_timestamp=executed,
+        execution_timestamp=executed,
+        exit_timestamp=datetime.combine(exit_day, datetime.min.time()) + timedelta(hours=20) if exit_day else None,
+        entry_price=Decimal("100"),
+        shares=10,
+        position_size_usd=Decimal(str(size)),
+        slippage_bps=Decimal("2"),
+        execution_time_ms=Decimal("40"),
+        pnl_pct=None if pnl_pct is None else Decimal(str(pnl_pct)),
+        is_win=is_win,
+        status="CLOSED" if exit_day else "OPEN",
+    )
+
+
+def _snapshot(day, value, positions=()):
+    return PortfolioSnapshot(
+        snapshot_date=day,
+        snapshot_timestamp=datetime.combine(day, datetime.min.time()) + timedelta(hours=21),
+        total_value=Decimal(str(value)),
+        cash=Decimal("0"),
+        invested_value=Decimal(str(value)),
+        positions=list(positions),
+        positions_count=len(positions),
+    )
+
+
+def _signal(n, day, confidence, status="PENDING", outcome=None):
+    return SignalPerformance(
+        signal_id=f"S{n}",
+        ticker="AAPL",
+        signal="BUY",
+        confidence=Decimal(str(confidence)),
+        source="ensemble",
+        generated_at=datetime.combine(day, datetime.min.time()) + timedelta(hours=10),
+        signal_price=Decimal("100"),
+        status=status,
+        outcome=outcome,
+    )
+
+
+class TestDailyBackfill:
+    """범위 백필 (grouped SQL)"""
+
+    async def test_backfill_aggregates_each_day_in_one_job(self, db):
+        d1, d2, d3 = date(2026, 3, 2), date(2026, 3, 3), date(2026, 3, 4)
+        db.add_all([
+            _trade(1, d1, "BUY", 1000, exit_day=d2, is_win=True, pnl_pct=4.0),
+            _trade(2, d1, "SELL", 500, exit_day=d2, is_win=False, pnl_pct=-2.0),
+            _trade(3, d2, "BUY", 2000, exit_day=d2, is_win=None, pnl_pct=None),
+            _signal(1, d1, 0.8, "RESOLVED", "WIN"),
+            _signal(2, d1, 0.6, "RESOLVED", "LOSS"),
+            _signal(3, d1, 0.7),
+            _snapshot(d1, 100_000, [{"ticker": "AAPL", "value": 3000}, {"ticker": "NVDA", "value": 1000}]),
+            _snapshot(d2, 101_000),
+            _snapshot(d3, 100_500),
+        ])
+        db.commit()
+
+        records = await AnalyticsAggregator(db).backfill_daily_metrics(d1, d3)
+
+        assert [r.date for r in records] == [d1, d2, d3]
+        day1, day2, day3 = records
+        assert (day1.total_trades, day1.buy_trades, day1.sell_trades) == (2, 1, 1)
+        assert float(day1.total_volume_usd) == pytest.approx(1500)
+        assert float(day1.avg_slippage_bps) == pytest.approx(2)
+        assert day1.signals_generated == 3
+        assert float(day1.signal_avg_confidence) == pytest.approx(0.7)
+        assert float(day1.signal_accuracy) == pytest.approx(0.5)
+        assert (day1.positions_count, float(day1.max_position_size_usd)) == (2, 3000)
+
+        # 청산일(d2) 기준 승/패, is_win NULL은 패
+        assert (day2.win_count, day2.loss_count) == (1, 2)
+        assert float(day2.avg_win_pct) == pytest.approx(4.0)
+        assert float(day2.avg_loss_pct) == pytest.approx(-1.0)
+
+        assert float(day2.daily_pnl) == pytest.approx(1000)
+        assert float(day3.daily_pnl) == pytest.approx(-500)
+        assert float(day3.cumulative_pnl) == pytest.approx(500)
+        assert day3.total_trades == 0
+
+    async def test_single_day_matches_range_and_is_idempotent(self, db):
+        days = [date(2026, 3, 2) + timedelta(days=i) for i in range(3)]
+        for i, day in enumerate(days):
+            db.add(_snapshot(day, 100_000 + 100 * i))
+            db.add(_trade(i, day, size=100 * (i + 1)))
+        db.commit()
+
+        aggregator = AnalyticsAggregator(db)
+        await aggregator.backfill_daily_metrics(days[0], days[1])
+        single = await aggregator.backfill_daily_metrics(days[2], days[2], rollup_periods=False)
+        again = await aggregator.backfill_daily_metrics(days[0], days[2])
+
+        assert float(single[0].cumulative_pnl) == pytest.approx(200)
+        assert float(again[-1].cumulative_pnl) == pytest.approx(200)
+        assert db.query(DailyAnalytics).count() == 3
+        assert [r.total_trades for r in again] == [1, 1, 1]
+
+
+class TestPeriodRollups:
+    """일별 행에서 파생되는 주간/월간 롤업"""
+
+    async def test_weekly_and_monthly_from_daily_rows(self, db):
+        start = date(2026, 3, 30)  # Monday, ISO week 14 spans March/April
+        values = [100_000, 101_000, 99_000, 102_000, 103_000]
+        for i, value in enumerate(values):
+            day = start + timedelta(days=i)
+            db.add(_snapshot(day, value))
+            db.add(_trade(i, day, exit_day=day, is_win=i % 2 == 0, pnl_pct=1.0))
+        db.commit()
+
+        aggregator = AnalyticsAggregator(db)
+        await aggregator.backfill_daily_metrics(start, start + timedelta(days=4))
+
+        weekly = db.query(WeeklyAnalytics).one()
+        assert (weekly.year, weekly.week_number) == (2026, 14)
+        assert weekly.week_start_date == start
+        assert float(weekly.weekly_pnl) == pytest.approx(3000)
+        assert weekly.total_trades == 5
+        assert (weekly.win_count, weekly.loss_count) == (3, 2)
+        assert weekly.worst_day_date == start + timedelta(days=2)
+
+        march, april = db.query(MonthlyAnalytics).order_by(MonthlyAnalytics.month).all()
+        assert (march.month, march.trading_days, april.trading_days) == (3, 2, 3)
+        assert float(april.portfolio_value_start) == pytest.approx(99_000)
+        assert float(april.best_week_return_pct) == pytest.approx((103_000 - 99_000) / 99_000 * 100)
+
+        assert (await aggregator.aggregate_weekly_metrics(2026, 14)).id == weekly.id
+        assert await aggregator.aggregate_monthly_metrics(2026, 6) is None
+
+
+class TestRollingRisk:
+    """윈도우 리스크 지표"""
+
+    def test_matches_direct_window_calculation(self):
+        rng = np.random.default_rng(3)
+        dates = [date(2026, 1, 1) + timedelta(days=i) for i in range(60)]
+        returns = list(rng.normal(0.1, 1.0, 60))
+        returns[10] = 0.0
+        values = list(100_000 * np.cumprod(1 + np.array(returns) / 100))
+
+        rows = rollups.rolling_risk_metrics(dates, returns, values)
+
+        assert rows[3] == {}  # 5개 미만
+        window = np.array([r for r in returns[15:46] if r != 0])
+        expected = rollups.risk_metrics_from_returns(window, values[45])
+        assert rows[45] == pytest.approx(expected)
+        assert rows[45]["max_drawdown_pct"] <= 0
+
+
+class TestRiskAnalyzer:
+    """사전 집계 행 기반 리스크 대시보드"""
+
+    async def test_drawdown_and_var_from_daily_series(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: DailyAnalytics.__table__.create(sync_conn))
+
+        values = [100, 110, 105, 99, 112, 108, 108, 115, 120, 118, 117, 119, 121, 125, 122,
+                  124, 126, 127, 123, 128, 130, 126]
+        today = datetime.utcnow().date()
+        async with AsyncSession(engine) as session:
+            for i, value in enumerate(values):
+                previous = values[i - 1] if i else value
+                session.add(DailyAnalytics(
+                    date=today - timedelta(days=len(values) - 1 - i),
+                    portfolio_value_eod=Decimal(value),
+                    daily_pnl=Decimal(value - previous),
+                    daily_return_pct=Decimal(str((value - previous) / previous * 100)),
+                    ai_cost_usd=Decimal("0"),
+                ))
+            await session.commit()
+
+            analyzer = RiskAnalyzer(session)
+            drawdown = await analyzer.analyze_drawdown_metrics(lookback_days=60)
+            var = await analyzer.calculate_var_metrics(lookback_days=30)
+
+        await engine.dispose()
+
+        assert drawdown["max_drawdown"]["pct"] == pytest.approx((99 - 110) / 110 * 100)
+        assert drawdown["max_drawdown"]["recovery_days"] == 1
+        # 닫힌 손실 구간: [105, 99], [108, 108], [118, 117, 119], [122, 124], [123] / 마지막 [126]은 진행 중
+        assert drawdown["statistics"]["total_drawdown_periods"] == 5
+        assert drawdown["statistics"]["max_drawdown_duration_days"] == 3
+        assert drawdown["current_drawdown"]["current_value"] == 126
+        assert var["data_points"] == len(values)
+        assert var["portfolio_value"] == 126
@@ -0,0 +1,205 @@
+"""
+Backfill Queue Tests
+
+Tests for:
+- (ticker, date-range) chunk planning
+- Jobs and progress survive a restart (new queue instance on the same DB)
+- Exclusive per-source claims and lease expiry recovery
+- Retry with exponential back-off, then failure after max attempts
+- Workers resuming a retried chunk from its checkpoint
+- Cancellation of queued and running chunks
+"""
+
+import asyncio
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.data.backfill_queue import BackfillQueue, default_queue_url, parse_concurrency, plan_chunks
+from backend.data.backfill_worker import BackfillChunkCancelled, BackfillWorker, EmbeddedBackfillWorkers
+
+PRICE_PARAMS = {"tickers": ["aapl", "MSFT"], "start_date": "2022-01-01",
+                "end_date": "2024-06-30", "interval": "1d"}
+
+
+@pytest.fixture
+def url(tmp_path):
+    return f"sqlite:///{tmp_path / 'queue.db'}"
+
+
+@pytest.fixture
+def queue(url):
+    return BackfillQueue(url, retry_base_seconds=0)
+
+
+class TestPlanning:
+    def test_price_chunks_cover_range_per_ticker(self):
+        chunks = plan_chunks("price_backfill", PRICE_PARAMS)
+
+        assert len(chunks) == 2 * 3
+        aapl = [c for c in chunks if c["ticker"] == "AAPL"]
+        assert aapl[0]["start_date"] == datetime(2022, 1, 1)
+        assert aapl[-1]["end_date"] == datetime(2024, 6, 30)
+        assert all(a["end_date"] == b["start_date"] for a, b in zip(aapl, aapl[1:]))
+
+    def test_news_without_tickers_and_concurrency_spec(self):
+        chunks = plan_chunks("news_backfill", {"start_date": "2025-01-01", "end_date": "2025-01-20"})
+
+        assert [c["ticker"] for c in chunks] == [None, None, None]
+        assert parse_concurrency("yfinance=8, multi_source=0") == {"yfinance": 8, "multi_source": 0}
+
+    def test_default_queue_url_is_independent_of_cwd(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("BACKFILL_QUEUE_URL", raising=False)
+        url = default_queue_url()
+        monkeypatch.chdir(tmp_path)
+
+        assert default_queue_url() == url
+        assert os.path.isabs(url.split(":///", 1)[1])
+
+
+class TestQueue:
+    def test_job_survives_restart(self, queue, url):
+        job = queue.enqueue("price_backfill", PRICE_PARAMS)
+        assert job["status"] == "pending"
+        assert job["progress"]["total_tickers"] == 2
+        assert job["progress"]["total_chunks"] == 6
+
+        chunk = queue.claim("w1", "yfinance")
+        queue.complete(chunk["id"], "w1", {"total_data_points": 250, "saved_data_points": 250})
+
+        reopened = BackfillQueue(url).get_job(job["job_id"])
+        assert reopened["status"] == "running"
+        assert reopened["started_at"] is not None
+        assert reopened["progress"]["saved_data_points"] == 250
+        assert reopened["progress"]["completed_chunks"] == 1
+
+    def test_claims_are_exclusive_and_per_source(self, queue):
+        queue.enqueue("price_backfill", PRICE_PARAMS)
+
+        claimed = [queue.claim(f"w{i}", "yfinance") for i in range(7)]
+
+        ids = [c["id"] for c in claimed if c]
+        assert len(ids) == len(set(ids)) == 6
+        assert claimed[-1] is None
+        assert queue.claim("n1", "multi_source") is None
+        assert claimed[0]["params"]["interval"] == "1d"
+
+    def test_expired_lease_is_reclaimed(self, url):
+        queue = BackfillQueue(url, lease_seconds=-1)  # 즉시 만료
+        queue.enqueue("price_backfill", {**PRICE_PARAMS, "tickers": ["AAPL"], "start_date": "2024-01-01"})
+
+        first = queue.claim("crashed", "yfinance")
+        queue.checkpoint(first["id"], "crashed", {"last_time": "2024-03-01T00:00:00"})
+        second = queue.claim("w2", "yfinance")
+
+        assert second["id"] == first["id"]
+        assert second["attempts"] == 2
+        assert second["checkpoint"] == {"last_time": "2024-03-01T00:00:00"}
+        assert not queue.complete(first["id"], "crashed", {})  # lease 상실
+
+    def test_retry_backoff_then_failure(self, url):
+        queue = BackfillQueue(url, max_attempts=2, retry_base_seconds=60)
+        job = queue.enqueue("price_backfill", {**PRICE_PARAMS, "tickers": ["AAPL"], "start_date": "2024-01-01"})
+
+        chunk = queue.claim("w1", "yfinance")
+        queue.fail(chunk["id"], "w1", "HTTP 429")
+        assert queue.claim("w1", "yfinance") is None  # back-off 대기 중
+        pending = queue.get_chunks(job["job_id"])[0]
+        assert pending["status"] == "pending"
+        assert pending["next_run_at"] > datetime.now() + timedelta(seconds=50)
+        assert queue.retry_delay(3) == 240
+
+        with queue.engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE backfill_chunks SET next_run_at = '2000-01-01 00:00:00'")
+        chunk = queue.claim("w1", "yfinance")
+        queue.fail(chunk["id"], "w1", "HTTP 429")
+
+        job = queue.get_job(job["job_id"])
+        assert job["status"] == "failed"
+        assert job["progress"]["failed_tickers"] == 1
+        assert "1 chunk(s) failed" in job["error_message"]
+
+
+class TestWorker:
+    def test_retried_chunk_resumes_from_checkpoint(self, queue):
+        job = queue.enqueue("price_backfill", {**PRICE_PARAMS, "tickers": ["AAPL"], "start_date": "2024-01-01"})
+        seen = []
+
+        async def flaky(chunk, checkpoint):
+            seen.append(dict(chunk["checkpoint"]))
+            saved = chunk["progress"].get("saved_data_points", 0)
+            if not chunk["checkpoint"]:
+                checkpoint({"last_time": "2024-03-01T00:00:00"}, {"saved_data_points": 40})
+                raise ConnectionError("reset by peer")
+            return {"total_data_points": saved + 80, "saved_data_points": saved + 80}
+
+        worker = BackfillWorker(queue, "yfinance", "w1", handlers={"price_backfill": flaky})
+        assert asyncio.run(worker.run_once())
+        assert asyncio.run(worker.run_once())
+        assert not asyncio.run(worker.run_once())
+
+        assert seen == [{}, {"last_time": "2024-03-01T00:00:00"}]
+        job = queue.get_job(job["job_id"])
+        assert job["status"] == "completed"
+        assert job["progress"]["saved_data_points"] == 120
+        assert job["progress"]["processed_tickers"] == 1
+        assert worker.stats == {"chunks_completed": 1, "chunks_failed": 1, "chunks_cancelled": 0}
+
+    def test_cancel_stops_queued_and_running_chunks(self, queue):
+        job = queue.enqueue("news_backfill", {"start_date": "2025-01-01", "end_date": "2025-01-20",
+                                              "tickers": ["NVDA"]})
+
+        async def cancelled_mid_chunk(chunk, checkpoint):
+            assert queue.cancel(job["job_id"]) == "running"
+            if not checkpoint({"saved_urls": ["https://a"]}, {"saved_articles": 1}):
+                raise BackfillChunkCancelled()
+            return {}
+
+        worker = BackfillWorker(queue, "multi_source", "w1", handlers={"news_backfill": cancelled_mid_chunk})
+        asyncio.run(worker.run_once())
+
+        job = queue.get_job(job["job_id"])
+        assert job["status"] == "cancelled"
+        assert job["progress"]["saved_articles"] == 1
+        assert {c["status"] for c in queue.get_chunks(job["job_id"])} == {"cancelled"}
+        assert queue.cancel(job["job_id"]) == "cancelled"
+        assert not asyncio.run(worker.run_once())
+
+    def test_failed_chunk_of_cancelled_job_is_not_retried(self, queue):
+        job = queue.enqueue("price_backfill", {**PRICE_PARAMS, "tickers": ["AAPL"], "start_date": "2024-01-01"})
+
+        async def cancelled_then_failed(chunk, checkpoint):
+            queue.cancel(job["job_id"])
+            raise ConnectionError("rate limited")
+
+        worker = BackfillWorker(queue, "yfinance", "w1", handlers={"price_backfill": cancelled_then_failed})
+        asyncio.run(worker.run_once())
+
+        assert [c["status"] for c in queue.get_chunks(job["job_id"])] == ["cancelled"]
+        assert queue.claim("w2", "yfinance") is None
+
+    def test_embedded_workers_drain_queue(self, queue):
+        job = queue.enqueue("price_backfill", {**PRICE_PARAMS, "tickers": ["AAPL"], "start_date": "2024-01-01"})
+
+        handler_threads = set()
+
+        async def fetched(chunk, checkpoint):
+            handler_threads.add(threading.current_thread())
+            return {"total_data_points": 10, "saved_data_points": 10}
+
+        async def main():
+            embedded = EmbeddedBackfillWorkers(queue, poll_interval=0.01)
+            for worker in embedded.workers:
+                worker.handlers = {"price_backfill": fetched}
+            embedded.start()
+            while queue.get_job(job["job_id"])["status"] != "completed":
+                await asyncio.sleep(0.01)
+            await embedded.stop()
+            return embedded
+
+        embedded = asyncio.run(asyncio.wait_for(main(), timeout=5))
+        assert {w.source for w in embedded.workers} == {"yfinance", "multi_source"}
+        assert threading.main_thread() not in handler_threads  # API 이벤트 루프 밖에서 실행
+        assert queue.get_job(job["job_id"])["progress"]["saved_data_points"] == 10
@@ -0,0 +1,167 @@
+"""
+Backtest Data Cache Tests
+
+Tests for:
+- Repeated runs over a cached period do no loader (DB / network) I/O
+- Incremental append of newer days and rewrite for earlier days
+- Memory-mapped zero-copy price arrays and torn-append / torn-rewrite recovery
+- Empty (failed) loader results are not committed as cached
+- Per-day news partitions (crawled_at) with one loader call per missing run
+- Engines reading prices through the shared data-source interface
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.backtesting.data_cache import BacktestDataCache, BacktestDataLoader
+
+
+class FakeLoader(BacktestDataLoader):
+    """영업일 일봉 + 일자별 뉴스 2건, 호출 기록"""
+
+    def __init__(self):
+        self.calls = []
+
+    def load_prices(self, ticker, start, end):
+        self.calls.append(("prices", ticker, start, end))
+        days = pd.bdate_range(start, end)
+        close = np.array([d.toordinal() % 1000 for d in days], dtype=float)
+        return pd.DataFrame({"time": days, "open": close - 1, "high": close + 1, "low": close - 2,
+                             "close": close, "volume": 1e6, "adjusted_close": close})
+
+    def load_news(self, start, end):
+        self.calls.append(("news", start, end))
+        items, day = [], start
+        while day <= end:
+            crawled = datetime.combine(day, datetime.min.time()) + timedelta(hours=9)
+            items.append({"id": day.toordinal(), "title": "NVDA beats", "tickers": ["NVDA"], "crawled_at": crawled})
+            items.append({"id": -day.toordinal(), "title": "AMD", "tickers": ["AMD"], "crawled_at": crawled})
+            day += timedelta(days=1)
+        return items
+
+
+START, END = date(2025, 3, 3), date(2025, 3, 28)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BacktestDataCache(tmp_path, loader=FakeLoader())
+
+
+class TestPrices:
+    def test_repeated_runs_cost_no_loader_io(self, cache, tmp_path):
+        first = cache.get_prices("nvda", START, END)
+        assert len(first) == 20
+        calls = len(cache.loader.calls)
+
+        again = cache.get_prices("NVDA", START + timedelta(days=3), END - timedelta(days=3))
+        fresh = BacktestDataCache(tmp_path, loader=cache.loader).get_prices("NVDA", START, END)
+
+        assert len(cache.loader.calls) == calls
+        pd.testing.assert_frame_equal(fresh, first)
+        assert again.index[0] >= pd.Timestamp(START + timedelta(days=3))
+
+    def test_incremental_append_and_prepend(self, cache):
+        cache.get_prices("NVDA", START, END)
+        extended = cache.get_prices("NVDA", START, END + timedelta(days=14))
+
+        assert cache.loader.calls[-1] == ("prices", "NVDA", END + timedelta(days=1), END + timedelta(days=14))
+        assert len(extended) == 30
+        assert extended.index.is_monotonic_increasing
+
+        earlier = cache.get_prices("NVDA", START - timedelta(days=7), END)
+        assert cache.loader.calls[-1] == ("prices", "NVDA", START - timedelta(days=7), START - timedelta(days=1))
+        assert len(earlier) == 25
+        assert cache.get_stats()["rewrites"] == 1
+
+    def test_price_arrays_are_memory_mapped(self, cache):
+        cache.get_prices("NVDA", START, END)
+        arrays = cache.get_price_arrays("NVDA", START, END)
+
+        assert isinstance(arrays["close"], np.memmap)
+        assert not arrays["close"].flags.writeable
+
+    def test_uncommitted_tail_is_discarded(self, cache, tmp_path):
+        cache.get_prices("NVDA", START, END)
+        with open(tmp_path / "prices" / "NVDA" / "close.bin", "ab") as f:
+            f.write(b"\x00" * 12)  # meta.json 커밋 전 중단된 append
+
+        reopened = BacktestDataCache(tmp_path, loader=cache.loader)
+        df = reopened.get_prices("NVDA", START, END + timedelta(days=7))
+
+        assert len(df) == 25
+        assert (tmp_path / "prices" / "NVDA" / "close.bin").stat().st_size == 25 * 8
+        assert df["close"].iloc[-1] == date(2025, 4, 4).toordinal() % 1000
+
+    def test_empty_load_is_not_cached(self, cache):
+        real_load = FakeLoader.load_prices
+        cache.loader.load_prices = lambda ticker, start, end: real_load(cache.loader, ticker, start, end).iloc[:0]
+        assert cache.get_prices("NVDA", START, END).empty
+        assert cache.get_stats()["empty_loads"] == 1
+
+        del cache.loader.load_prices  # rate limit 해제
+        assert len(cache.get_prices("NVDA", START, END)) == 20
+
+    def test_interrupted_rewrite_keeps_previous_generation(self, cache, tmp_path, monkeypatch):
+        cache.get_prices("NVDA", START, END)
+        monkeypatch.setattr(cache, "_write_meta", lambda *args, **kwargs: (_ for _ in ()).throw(OSError("crash")))
+        with pytest.raises(OSError):
+            cache.get_prices("NVDA", START - timedelta(days=7), END)
+
+        reopened = BacktestDataCache(tmp_path, loader=cache.loader)
+        df = reopened.get_prices("NVDA", START, END)
+        assert len(df) == 20
+        assert df["close"].iloc[0] == START.toordinal() % 1000
+
+        earlier = reopened.get_prices("NVDA", START - timedelta(days=7), END)
+        assert len(earlier) == 25
+        assert not (tmp_path / "prices" / "NVDA" / "close.bin").exists()
+
+
+class TestNews:
+    def test_day_partitions_and_ticker_filter(self, cache, tmp_path):
+        news = cache.get_news(START, START + timedelta(days=4), ticker="nvda")
+
+        assert len(news) == 5
+        assert cache.loader.calls == [("news", START, START + timedelta(days=4))]
+        assert (tmp_path / "news" / "2025-03" / "2025-03-05.jsonl").exists()
+
+        # 캐시된 일자 사이의 빈 구간만 loader 호출
+        cache.get_news(START - timedelta(days=2), START + timedelta(days=6))
+        assert cache.loader.calls[1:] == [
+            ("news", START - timedelta(days=2), START - timedelta(days=1)),
+            ("news", START + timedelta(days=5), START + timedelta(days=6)),
+        ]
+        assert cache.get_news(START, START)[0]["crawled_at"] == "2025-03-03T09:00:00"
+
+
+class TestEngines:
+    def test_engines_share_the_cache(self, cache):
+        from backend.backtest.vintage_backtest import VintageBacktest
+        from backend.backtesting.backtest_engine import BacktestEngine
+
+        market = asyncio.run(BacktestEngine(data_source=cache)._get_market_data(
+            ["NVDA"], datetime(2025, 3, 9), None))
+        assert market["NVDA"]["close"] == date(2025, 3, 7).toordinal() % 1000  # 주말 → 직전 거래일
+
+        closes = cache.closes_by_date(["NVDA", "AMD"], START, END)
+        assert set(closes["2025-03-04"]) == {"NVDA", "AMD"}
+
+        signals = [{"ticker": "NVDA", "action": "BUY", "date": datetime(2025, 3, 4), "confidence": 0.8}]
+        calls = len(cache.loader.calls)
+        VintageBacktest(data_source=cache).run_backtest(signals, None, datetime(2025, 3, 10), datetime(2025, 3, 20))
+        assert len(cache.loader.calls) == calls  # NVDA 는 이미 캐시됨
+
+    def test_pit_provider_has_no_intraday_lookahead(self, cache):
+        from backend.backtesting.pit_backtest_engine import HistoricalMarketDataProvider
+
+        provider = HistoricalMarketDataProvider(data_source=cache)
+        provider.set_range(datetime(2025, 3, 10), datetime(2025, 3, 14))
+
+        # 장중에는 전일 종가, 장 마감(16:00) 이후에 당일 종가
+        assert provider.get_price("NVDA", datetime(2025, 3, 11, 9, 31)) == date(2025, 3, 10).toordinal() % 1000
+        assert provider.get_price("NVDA", datetime(2025, 3, 11, 16, 0)) == date(2025, 3, 11).toordinal() % 1000
@@ -0,0 +1,146 @@
+"""
+Backtest Fast Path Tests
+
+Tests for:
+- BarArray built from per-symbol frames (union index, NaN for missing bars)
+- Fast path (VectorizedStrategy + ArrayPortfolio) matching the event queue path:
+  same fills, portfolio history, trades and performance metrics
+- Constitution limits (max positions, cash) applied against start-of-bar state
+"""
+
+import asyncio
+import queue
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.backtesting.engine import (
+    BacktestEngine,
+    BarArray,
+    DataHandler,
+    DemoStrategy,
+    DemoVectorizedStrategy,
+    MarketEvent,
+)
+
+RULES = {
+    "max_position_size_pct": 0.2,
+    "max_positions": 3,
+    "conviction_threshold_buy": 0.7,
+    "conviction_threshold_sell": 0.6,
+    "kill_switch_daily_loss_pct": 0.05,
+}
+
+
+class RandomWalkDataHandler(DataHandler):
+    """시드 고정 랜덤 워크 (DemoDataHandler 와 같은 스트리밍, 기간/종목 수 가변)"""
+
+    def __init__(self, event_queue: queue.Queue, symbols, days: int = 120, seed: int = 1):
+        super().__init__(event_queue)
+        rng = np.random.default_rng(seed)
+        dates = pd.bdate_range("2024-01-01", periods=days)
+        self.data = {
+            symbol: pd.DataFrame(
+                {"close": 100 + rng.standard_normal(days).cumsum() * 3, "volume": 1e6},
+                index=dates,
+            )
+            for symbol in symbols
+        }
+        self.data_stream = iter(dates)
+        self.latest_data = {}
+
+    async def next(self) -> bool:
+        try:
+            timestamp = next(self.data_stream)
+        except StopIteration:
+            return False
+        self.latest_data = {symbol: df.loc[timestamp] for symbol, df in self.data.items()}
+        self.event_queue.put(MarketEvent(timestamp, self.latest_data))
+        return True
+
+    def get_latest_price(self, symbol):
+        if symbol in self.latest_data:
+            return float(self.latest_data[symbol]["close"])
+        return None
+
+    def get_latest_data(self):
+        return self.latest_data
+
+    def get_bar_array(self) -> BarArray:
+        return BarArray.from_frames(self.data)
+
+
+def _run(fast: bool, symbols, window: int, capital: float = 100_000.0, rules=None, days: int = 120):
+    np.random.seed(42)  # Broker 슬리피지 부호
+    engine = BacktestEngine(
+        "2024-01-01", "2024-06-30", capital,
+        RandomWalkDataHandler,
+        DemoVectorizedStrategy if fast else DemoStrategy,
+        data_kwargs={"symbols": symbols, "days": days},
+        strategy_kwargs={"window": window},
+        constitution_rules=rules or RULES,
+        fast_path=fast,
+    )
+    result = asyncio.run(engine.run())
+    return engine.portfolio, result
+
+
+def test_bar_array_from_frames():
+    idx = pd.bdate_range("2024-01-01", periods=4)
+    frames = {
+        "AAA": pd.DataFrame({"close": [1.0, 2.0, 3.0, 4.0], "volume": 10.0}, index=idx),
+        "BBB": pd.DataFrame({"close": [5.0, 6.0]}, index=idx[1:3]),
+    }
+
+    bars = BarArray.from_frames(frames)
+
+    assert len(bars) == 4
+    assert bars.symbols == ["AAA", "BBB"]
+    close = bars.field("close")
+    assert close.shape == (4, 2)
+    assert close[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert np.isnan(close[0, 1]) and np.isnan(close[3, 1])
+    assert np.isnan(bars.field("volume")[1, 1])
+
+
+@pytest.mark.parametrize(
+    "symbols,window",
+    [
+        (["AAPL"], 3),
+        (["AAPL", "MSFT", "NVDA", "AMD", "TSLA"], 5),
+        ([f"S{i:02d}" for i in range(12)], 8),
+    ],
+)
+def test_fast_path_matches_event_path(symbols, window):
+    event_portfolio, event_result = _run(False, symbols, window)
+    fast_portfolio, fast_result = _run(True, symbols, window)
+
+    assert len(event_portfolio.history) > 2
+    assert fast_portfolio.history == event_portfolio.history
+    assert fast_portfolio.trades == event_portfolio.trades
+    assert fast_portfolio.positions == event_portfolio.positions
+    assert fast_portfolio.cash == event_portfolio.cash
+    assert fast_result == event_result
+
+
+def test_fast_path_respects_position_and_cash_limits():
+    symbols = [f"S{i:02d}" for i in range(20)]
+    rules = dict(RULES, max_positions=2, max_position_size_pct=0.6)
+
+    event_portfolio, event_result = _run(False, symbols, 4, capital=10_000.0, rules=rules)
+    fast_portfolio, fast_result = _run(True, symbols, 4, capital=10_000.0, rules=rules)
+
+    assert fast_portfolio.history == event_portfolio.history
+    assert fast_result == event_result
+    assert max(len(h["positions"]) for h in fast_portfolio.history) <= 2
+    assert min(h["cash"] for h in fast_portfolio.history) >= 0
+
+
+def test_fast_path_requires_vectorized_strategy():
+    engine = BacktestEngine(
+        "2024-01-01", "2024-06-30", 100_000.0, RandomWalkDataHandler, DemoStrategy,
+        data_kwargs={"symbols": ["AAPL"]}, constitution_rules=RULES, fast_path=True,
+    )
+    with pytest.raises(TypeError):
+        engine.run_fast()
@@ -0,0 +1,237 @@
+"""
+Correlation Engine Tests
+
+Tests for:
+- Ledoit-Wolf / EWMA estimators
+- Aligned return matrix from close prices
+- Per-day cache and intraday incremental update
+- RiskAnalyzer correlation analysis and stress test on the shared matrix
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from backend.analytics.correlation_engine import (
+    CorrelationEngine,
+    daily_returns,
+    ewma_covariance,
+    ledoit_wolf,
+)
+from backend.analytics.risk_analytics import RiskAnalyzer
+from backend.core.models.analytics_models import PortfolioSnapshot
+from backend.database.models import StockPrice
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_sqlite(element, compiler, **kw):
+    return "JSON"
+
+
+TODAY = datetime(2026, 10, 14, 15, 0)  # Wednesday
+
+
+def _closes(days: int = 90, end: date = date(2026, 10, 13), seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, days)
+    returns = pd.DataFrame({
+        "SPY": market,
+        "NVDA": 1.5 * market + rng.normal(0, 0.005, days),
+        "AMD": 1.4 * market + rng.normal(0, 0.005, days),
+        "XOM": -0.5 * market + rng.normal(0, 0.005, days),
+    }, index=pd.bdate_range(end=end, periods=days))
+    return 100 * (1 + returns).cumprod()
+
+
+class FakeLoader:
+    def __init__(self, closes: pd.DataFrame):
+        self.closes = closes
+        self.calls = []
+
+    async def __call__(self, tickers, start):
+        self.calls.append((sorted(tickers), start))
+        return self.closes[[t for t in tickers if t in self.closes.columns]].copy()
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def _no_prices(tickers):
+    return {}
+
+
+class TestEstimators:
+    def test_ledoit_wolf_matches_direct_formula(self):
+        rng = np.random.default_rng(1)
+        x = rng.normal(size=(40, 6)) @ rng.normal(size=(6, 6))
+
+        shrunk, shrinkage = ledoit_wolf(x)
+
+        n, p = x.shape
+        c = x - x.mean(axis=0)
+        sample = c.T @ c / n
+        mu = np.trace(sample) / p
+        delta2 = np.sum((sample - mu * np.eye(p)) ** 2) / p
+        beta2 = sum(np.sum((np.outer(r, r) - sample) ** 2) for r in c) / (n * n * p)
+        expected = min(beta2, delta2) / delta2
+
+        assert shrinkage == pytest.approx(expected)
+        assert shrunk == pytest.approx(expected * mu * np.eye(p) + (1 - expected) * sample)
+        assert np.all(np.linalg.eigvalsh(shrunk) > 0)
+
+    def test_ledoit_wolf_matches_sklearn(self):
+        covariance = pytest.importorskip("sklearn.covariance")
+        rng = np.random.default_rng(2)
+        x = rng.normal(size=(30, 8))
+
+        shrunk, shrinkage = ledoit_wolf(x)
+        expected_cov, expected_shrinkage = covariance.ledoit_wolf(x)
+
+        assert shrinkage == pytest.approx(expected_shrinkage)
+        assert shrunk == pytest.approx(expected_cov)
+
+    def test_ewma_weights_recent_rows(self):
+        returns = np.vstack([np.full((50, 2), 0.001), [[0.05, -0.05]]])
+        cov = ewma_covariance(returns, lam=0.94)
+        assert cov[0, 1] < 0
+        assert cov[0, 0] == pytest.approx(cov[1, 1])
+
+    def test_returns_aligned_across_tickers(self):
+        closes = _closes(10)
+        closes.iloc[3, 1] = np.nan          # 단일 결측 → 직전 종가로 채움
+        closes.iloc[0:2, 2] = np.nan        # 상장 전 → 해당 날짜 제외
+        returns = daily_returns(closes)
+        assert not returns.isna().any().any()
+        assert returns.index[0] == closes.index[3]
+
+
+class TestEngine:
+    async def test_matrix_cached_per_day(self):
+        loader = FakeLoader(_closes())
+        clock = Clock(TODAY)
+        engine = CorrelationEngine(close_loader=loader, price_source=_no_prices, clock=clock)
+
+        first = await engine.get_matrix(["NVDA", "AMD", "XOM", "SPY"])
+        second = await engine.get_matrix(["SPY", "XOM", "AMD", "NVDA"])
+
+        assert first is second
+        assert len(loader.calls) == 1
+        assert first.observations == 60
+
+        returns = daily_returns(_closes()[first.tickers]).tail(60)
+        assert first.correlation("sample") == pytest.approx(np.corrcoef(returns.to_numpy(), rowvar=False))
+        corr = dict(((p["ticker1"], p["ticker2"]), p["correlation"]) for p in first.pairs())
+        assert corr[("AMD", "NVDA")] > 0.7
+        assert corr[("NVDA", "XOM")] < 0
+
+        clock.now += timedelta(days=1)
+        await engine.get_matrix(["NVDA", "AMD"])
+        await engine.get_matrix(["NVDA", "AMD", "XOM", "SPY"])
+        assert len(loader.calls) == 3
+
+    async def test_intraday_update_without_reload(self):
+        closes = _closes()
+        loader = FakeLoader(closes)
+        clock = Clock(TODAY)
+        prices = {"NVDA": float(closes["NVDA"].iloc[-1]) * 1.10, "AMD": float(closes["AMD"].iloc[-1]) * 1.08}
+
+        async def source(tickers):
+            return prices
+
+        engine = CorrelationEngine(close_loader=loader, price_source=source, clock=clock)
+        matrix = await engine.get_matrix(["NVDA", "AMD"])
+
+        assert matrix.intraday
+        assert matrix.observations == 60
+        daily = daily_returns(closes[["AMD", "NVDA"]]).tail(59).to_numpy()
+        expected = np.vstack([daily, [0.08, 0.10]])
+        assert matrix.covariance("sample") == pytest.approx(np.cov(expected, rowvar=False))
+
+        prices["NVDA"] = float(closes["NVDA"].iloc[-1]) * 0.9
+        assert engine.update_intraday(prices) == 1
+        updated = await engine.get_matrix(["NVDA", "AMD"])
+        assert updated is not matrix
+        assert len(loader.calls) == 1
+
+    async def test_past_day_entries_evicted(self):
+        loader = FakeLoader(_closes())
+        clock = Clock(TODAY)
+        engine = CorrelationEngine(close_loader=loader, price_source=_no_prices, clock=clock)
+
+        await engine.get_matrix(["NVDA", "AMD"])
+        await engine.get_matrix(["NVDA", "XOM", "SPY"])
+        await engine.get_matrix(["NVDA", "AMD"], lookback_days=30)
+        assert engine.get_stats()["cached_sets"] == 3
+
+        clock.now += timedelta(days=1)
+        await engine.get_matrix(["AMD", "XOM"])
+
+        assert engine.get_stats()["cached_sets"] == 1
+        assert list(engine._locks) == [(("AMD", "XOM"), 60)]
+        assert engine.stats["evictions"] == 3
+
+    async def test_insufficient_history_returns_none(self):
+        engine = CorrelationEngine(close_loader=FakeLoader(_closes(10)), price_source=_no_prices, clock=Clock(TODAY))
+        assert await engine.get_matrix(["NVDA", "AMD"]) is None
+        assert await engine.get_matrix(["NVDA"]) is None
+
+
+class TestRiskAnalyzer:
+    async def test_correlation_and_stress_share_matrix(self):
+        db_engine = create_async_engine("sqlite+aiosqlite://")
+        async with db_engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: PortfolioSnapshot.__table__.create(sync_conn))
+            await conn.run_sync(lambda sync_conn: StockPrice.__table__.create(sync_conn))
+
+        engine = CorrelationEngine(close_loader=FakeLoader(pd.DataFrame()), price_source=_no_prices, clock=Clock(TODAY))
+
+        async with AsyncSession(db_engine) as session:
+            for ticker, series in _closes().items():
+                session.add_all([
+                    StockPrice(ticker=ticker, time=ts.to_pydatetime(), open=px, high=px, low=px, close=px, volume=1)
+                    for ts, px in series.items()
+                ])
+            session.add(PortfolioSnapshot(
+                snapshot_date=TODAY.date(),
+                snapshot_timestamp=TODAY,
+                total_value=Decimal("100000"),
+                cash=Decimal("10000"),
+                invested_value=Decimal("90000"),
+                positions=[
+                    {"ticker": "NVDA", "value": 40000, "sector": "Technology"},
+                    {"ticker": "AMD", "value": 30000, "sector": "Technology"},
+                    {"ticker": "XOM", "value": 20000, "sector": "Energy"},
+                ],
+                positions_count=3,
+            ))
+            await session.commit()
+
+            analyzer = RiskAnalyzer(session, correlation_engine=engine)
+            correlation = await analyzer.analyze_correlation_risk(lookback_days=60)
+            stress = await analyzer.stress_test_portfolio()
+
+        await db_engine.dispose()
+
+        assert engine.stats["daily_loads"] == 1
+        assert correlation["tickers_analyzed"] == 3
+        assert correlation["correlation_pairs"] == 3
+        assert correlation["highly_correlated"][0]["ticker1"] in ("AMD", "NVDA")
+        assert 0 <= correlation["shrinkage_intensity"] <= 1
+        assert correlation["diversification_ratio"] > 1
+
+        # β ≈ 0.4·1.5 + 0.3·1.4 + 0.2·(-0.5) = 0.92
+        assert stress["portfolio_beta"] == pytest.approx(0.92, abs=0.15)
+        crash = stress["stress_scenarios"][0]
+        assert crash["impact_usd"] == pytest.approx(-20000 * stress["portfolio_beta"])
+        assert stress["stress_scenarios"][2]["impact_usd"] < 0
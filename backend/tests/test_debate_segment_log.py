@@ -0,0 +1,197 @@
+"""
+Debate Segment Log Tests
+
+Tests for:
+- Append-only JSONL segments with rolling and an offset index
+- Restart from the index (aggregates restored, only recent records in memory)
+- Recovery when segments are ahead of the index (including a torn index line)
+- Incremental agent / consensus aggregates matching a full rescan
+- Streaming export and legacy per-debate JSON migration
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.ai.meta.debate_logger import (
+    AgentVote,
+    DebateLogger,
+    DebateRecord,
+    MarketContextSnapshot,
+    VoteType,
+)
+from backend.ai.meta.debate_segment_log import DebateAggregates, DebateSummary
+
+
+def _log(dl, ticker="NVDA", decision=VoteType.BUY, consensus=0.9, votes=None):
+    votes = votes or [
+        AgentVote("claude", VoteType.BUY, 0.8, "fundamentals"),
+        AgentVote("gemini", VoteType.SELL, 0.6, "valuation"),
+        AgentVote("gpt", VoteType.ABSTAIN, 0.0, "n/a"),
+    ]
+    return dl.log_debate(ticker, "BUY 결정", votes, MarketContextSnapshot(price=100.0), decision, consensus)
+
+
+def _rescan_agent(records, agent):
+    """이전 get_agent_performance 구현 (전체 재스캔)"""
+    stats = {"total_votes": 0, "correct_predictions": 0, "total_pnl": 0.0, "wins": 0, "losses": 0, "abstains": 0}
+    for record in records:
+        if record.outcome.pnl_result is None:
+            continue
+        for vote in record.votes:
+            if vote.agent_name != agent:
+                continue
+            stats["total_votes"] += 1
+            if vote.vote == VoteType.ABSTAIN:
+                stats["abstains"] += 1
+                continue
+            pnl = record.outcome.pnl_result
+            if pnl > 0:
+                stats["wins"] += 1
+                stats["correct_predictions"] += vote.vote in (VoteType.BUY, VoteType.DCA)
+            elif pnl < 0:
+                stats["losses"] += 1
+                stats["correct_predictions"] += vote.vote in (VoteType.SELL, VoteType.STOP_LOSS)
+            stats["total_pnl"] += pnl
+    return stats
+
+
+@pytest.fixture
+def populated(tmp_path):
+    dl = DebateLogger(storage_path=tmp_path, max_memory_records=3, segment_max_bytes=2048)
+    records = []
+    for i in range(12):
+        record = _log(dl, ticker=["NVDA", "AMD"][i % 2], consensus=[0.3, 0.6, 0.9][i % 3])
+        if i % 4 != 3:
+            dl.update_outcome(record.id, executed=True, pnl_result=[120.0, -80.0, 0.0][i % 3])
+        records.append(record)
+    # 같은 토론 outcome 재업데이트 → 이전 기여분 교체
+    dl.update_outcome(records[0].id, pnl_result=-50.0)
+    return tmp_path, dl, records
+
+
+class TestSegmentLog:
+    def test_appends_roll_segments_and_index(self, populated):
+        path, dl, _ = populated
+        segments = sorted((path / "segments").glob("debates-*.jsonl"))
+        assert len(segments) > 1
+        assert all(seg.stat().st_size <= 2048 for seg in segments[:-1])
+        index_lines = (path / "index.jsonl").read_text().splitlines()
+        assert len(index_lines) == 12 + 9 + 1
+        assert not list(path.rglob("*.json"))
+
+    def test_restart_restores_from_index(self, populated):
+        path, dl, records = populated
+        reopened = DebateLogger(storage_path=path, max_memory_records=3)
+
+        assert len(reopened._records) == 3
+        assert reopened.get_stats()["total_debates"] == 12
+        assert reopened.get_stats()["storage"]["reads"] == 3  # 최근 3건만 본문 읽기
+        old = reopened.get_debate(records[0].id)  # 메모리 밖 → 오프셋 읽기
+        assert old.outcome.pnl_result == -50.0
+        assert reopened.get_agent_performance("claude") == dl.get_agent_performance("claude")
+        assert reopened.get_consensus_analysis() == dl.get_consensus_analysis()
+
+    def test_recovers_entries_missing_from_index(self, populated):
+        path, dl, records = populated
+        index = path / "index.jsonl"
+        lines = index.read_text().splitlines(keepends=True)
+        index.write_text("".join(lines[:-3]))  # 마지막 3개 인덱스 라인 유실
+        active = sorted((path / "segments").glob("debates-*.jsonl"))[-1]
+        with open(active, "ab") as f:
+            f.write(b'{"op": "debate", "rec')  # 기록 중 중단
+
+        reopened = DebateLogger(storage_path=path)
+
+        assert reopened.get_stats()["storage"]["recovered_entries"] == 3
+        assert reopened.get_debate(records[0].id).outcome.pnl_result == -50.0
+        assert reopened.get_agent_performance("gemini") == dl.get_agent_performance("gemini")
+        new = _log(reopened)
+        assert DebateLogger(storage_path=path).get_debate(new.id).ticker == "NVDA"
+
+    def test_torn_index_line_is_truncated(self, populated):
+        path, dl, records = populated
+        index = path / "index.jsonl"
+        data = index.read_bytes()
+        index.write_bytes(data[:-10])  # 마지막 인덱스 라인 기록 중 중단
+
+        reopened = DebateLogger(storage_path=path)
+        assert reopened.get_stats()["storage"]["recovered_entries"] == 1
+        assert index.read_bytes().endswith(b"\n")
+
+        new = _log(reopened)
+        again = DebateLogger(storage_path=path)
+        assert again.get_stats()["storage"]["recovered_entries"] == 0
+        assert again.get_stats()["total_debates"] == 13
+        assert again.get_debate(new.id).ticker == "NVDA"
+        assert again.get_debate(records[0].id).outcome.pnl_result == -50.0
+
+
+class TestAggregates:
+    def test_incremental_matches_rescan(self, populated):
+        _, dl, records = populated
+        latest = [dl.get_debate(r.id) for r in records]
+        for agent in ("claude", "gemini", "gpt"):
+            perf = dl.get_agent_performance(agent)
+            expected = _rescan_agent(latest, agent)
+            assert {k: perf[k] for k in expected} == pytest.approx(expected)
+
+        buckets = dl.get_consensus_analysis()
+        assert sum(b["count"] for b in buckets.values()) == 9
+        assert buckets["low (0.0-0.5)"]["total_pnl"] == pytest.approx(-50.0 + 120.0 + 120.0)
+
+    def test_window_boundary_is_exact(self):
+        aggregates = DebateAggregates()
+        cutoff = datetime(2026, 10, 1, 12, 0)
+        for i, ts in enumerate([cutoff - timedelta(hours=1), cutoff + timedelta(hours=1), cutoff + timedelta(days=2)]):
+            aggregates.add_debate(DebateSummary(f"d{i}", "NVDA", ts, "BUY", 0.9, [("claude", "BUY")], pnl=10.0))
+
+        assert aggregates.agent_performance("claude", cutoff)["total_votes"] == 2
+        assert aggregates.consensus_analysis(cutoff)["high (0.8-1.0)"]["count"] == 2
+
+    def test_recent_and_outcome_queries_use_index(self, populated):
+        path, _, records = populated
+        dl = DebateLogger(storage_path=path, max_memory_records=2)
+
+        recent = dl.get_recent_debates(ticker="AMD", limit=4)
+        assert [r.id for r in recent] == [records[i].id for i in (11, 9, 7, 5)]
+        losers = dl.get_debates_with_outcomes(max_pnl=-1)
+        assert {r.id for r in losers} == {records[i].id for i in (0, 1, 4, 10)}
+
+
+class TestExport:
+    def test_streaming_export(self, populated, tmp_path_factory):
+        path, dl, _ = populated
+        out = tmp_path_factory.mktemp("export")
+
+        assert dl.export_for_training(out / "train.jsonl") == 9
+        lines = (out / "train.jsonl").read_text().splitlines()
+        assert all(json.loads(line)["outcome"]["pnl_result"] is not None for line in lines)
+
+        assert dl.export_for_training(out / "train.json", format="json") == 9
+        data = json.loads((out / "train.json").read_text())
+        assert data[0]["outcome"]["pnl_result"] == -50.0
+
+    def test_memory_only_logger(self, tmp_path):
+        dl = DebateLogger()
+        record = _log(dl)
+        dl.update_outcome(record.id, pnl_result=10.0)
+        assert dl.export_for_training(tmp_path / "m.jsonl") == 1
+        assert dl.get_agent_performance("claude")["wins"] == 1
+
+
+def test_legacy_json_files_migrated(tmp_path):
+    legacy = DebateLogger()
+    record = _log(legacy)
+    record.outcome.pnl_result = 25.0
+    month_dir = tmp_path / record.timestamp.strftime("%Y-%m")
+    month_dir.mkdir()
+    (month_dir / f"{record.id}.json").write_text(json.dumps(record.to_dict(), indent=2))
+
+    dl = DebateLogger(storage_path=tmp_path)
+
+    assert dl.get_debate(record.id).outcome.pnl_result == 25.0
+    assert dl.get_agent_performance("claude")["total_pnl"] == 25.0
+    assert DebateLogger(storage_path=tmp_path).get_stats()["total_debates"] == 1
+    assert isinstance(dl.get_debate(record.id), DebateRecord)
@@ -0,0 +1,198 @@
+"""
+Enhanced News Pipeline DAG Tests
+
+Tests for:
+- Independent stages running concurrently (narrative ∥ fact_check, horizon ∥ policy)
+- Batch methods receiving the whole article batch
+- Filter short-circuit and per-article stage errors
+- Per-stage latency / throughput metrics
+- Batch endpoint size limit
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.ai.intelligence.base import IntelligenceResult
+from backend.ai.intelligence.enhanced_news_pipeline import (
+    FILTERED_OUT_INSIGHT,
+    EnhancedNewsProcessingPipeline,
+    StageSpec,
+)
+
+
+def _result(name, **data):
+    return IntelligenceResult(success=True, component_name=name, data=data, reasoning=name)
+
+
+class Timeline:
+    def __init__(self):
+        self.spans = {}
+
+    async def span(self, key, delay):
+        start = time.perf_counter()
+        await asyncio.sleep(delay)
+        self.spans.setdefault(key, []).append((start, time.perf_counter()))
+
+
+class SlowComponents:
+    """All six stages as single-article components with fixed latency"""
+
+    def __init__(self, timeline, delay=0.05, reject=(), fail=()):
+        self.timeline = timeline
+        self.delay = delay
+        self.reject = set(reject)
+        self.fail = set(fail)
+
+    async def filter_news(self, article):
+        await self.timeline.span("filter", self.delay)
+        return _result("filter", is_relevant=article["title"] not in self.reject)
+
+    async def analyze_news(self, article):
+        await self.timeline.span("narrative", self.delay)
+        if article["title"] in self.fail:
+            raise RuntimeError("narrative LLM timeout")
+        return _result("narrative", narrative_phase="EMERGING", theme=article["title"])
+
+    async def verify_data(self, article):
+        await self.timeline.span("fact_check", self.delay)
+        return _result("fact_check", verification_status="VERIFIED")
+
+    async def confirm_narrative(self, narrative):
+        await self.timeline.span("market_confirm", self.delay)
+        return _result("market_confirm", confirmation_status="CONFIRMED", theme=narrative["theme"])
+
+    async def tag_horizons(self, insight):
+        await self.timeline.span("horizon", self.delay)
+        return _result("horizon", horizons=["short_term"], theme=insight["theme"])
+
+    async def analyze_feasibility(self, insight):
+        await self.timeline.span("policy", self.delay)
+        return _result("policy", realization_probability=0.8)
+
+    def as_components(self):
+        return {name: self for name in (
+            "news_filter", "narrative_engine", "fact_checker",
+            "market_confirmation", "horizon_tagger", "policy_feasibility",
+        )}
+
+
+class BatchNarrative:
+    def __init__(self):
+        self.calls = []
+
+    async def analyze_news_batch(self, articles):
+        self.calls.append([a["title"] for a in articles])
+        return [_result("narrative", narrative_phase="CONSENSUS", theme=a["title"]) for a in articles]
+
+
+def _articles(n):
+    return [{"title": f"article-{i}", "content": "..."} for i in range(n)]
+
+
+def _pipeline(components, **kwargs):
+    return EnhancedNewsProcessingPipeline(llm_provider=None, intelligence_components=components, **kwargs)
+
+
+class TestScheduling:
+    async def test_independent_stages_overlap(self):
+        timeline = Timeline()
+        pipeline = _pipeline(SlowComponents(timeline).as_components())
+
+        start = time.perf_counter()
+        result = await pipeline.process_article({"title": "NVDA beats"})
+        elapsed = time.perf_counter() - start
+
+        assert result.success
+        assert list(result.stages) == ["filter", "narrative", "fact_check", "market_confirm", "horizon", "policy"]
+        # critical path: filter → narrative → market_confirm → horizon|policy = 4 × 50ms
+        assert elapsed < 0.27
+        (n_start, n_end), = timeline.spans["narrative"]
+        (f_start, f_end), = timeline.spans["fact_check"]
+        assert f_start < n_end and n_start < f_end
+        (h_start, h_end), = timeline.spans["horizon"]
+        (p_start, p_end), = timeline.spans["policy"]
+        assert p_start < h_end and h_start < p_end
+        assert "✅ Verified facts" in result.final_insight
+
+    async def test_burst_runs_articles_concurrently(self):
+        pipeline = _pipeline(SlowComponents(Timeline(), delay=0.02).as_components(), max_concurrency=50)
+
+        start = time.perf_counter()
+        results = await pipeline.process_batch(_articles(50))
+        elapsed = time.perf_counter() - start
+
+        assert all(r.success for r in results)
+        assert [r.stages["narrative"].data["theme"] for r in results] == [f"article-{i}" for i in range(50)]
+        assert elapsed < 0.5  # serial: 50 × 6 × 20ms = 6s
+
+    def test_invalid_dag_rejected(self):
+        with pytest.raises(ValueError):
+            _pipeline({}, dag=(StageSpec("narrative", ("filter",), "x", "y", "_stage2_narrative"),))
+
+
+class TestBatching:
+    async def test_batch_method_receives_chunks(self):
+        narrative = BatchNarrative()
+        pipeline = _pipeline({"narrative_engine": narrative}, batch_size=4)
+
+        results = await pipeline.process_batch(_articles(10))
+
+        assert [len(c) for c in narrative.calls] == [4, 4, 2]
+        assert all(r.stages["narrative"].data["narrative_phase"] == "CONSENSUS" for r in results)
+
+    async def test_filter_short_circuits_and_errors_are_isolated(self):
+        timeline = Timeline()
+        components = SlowComponents(timeline, delay=0.0, reject={"article-1"}, fail={"article-2"})
+        pipeline = _pipeline(components.as_components())
+
+        results = await pipeline.process_batch(_articles(4) + [{"content": "no title"}])
+
+        assert results[1].final_insight == FILTERED_OUT_INSIGHT
+        assert list(results[1].stages) == ["filter"]
+        assert len(timeline.spans["narrative"]) == 3  # rejected article skipped
+        assert len(timeline.spans["market_confirm"]) == 2  # failed article stops
+
+        assert not results[2].success
+        assert "narrative LLM timeout" in results[2].final_insight
+        assert results[0].success and results[3].success
+        assert not results[4].success
+
+        stats = pipeline.get_statistics()
+        assert stats["early_terminations"] == 1
+        assert stats["component_failures"] == {"narrative": 1}
+
+
+class TestMetrics:
+    async def test_stage_metrics(self):
+        pipeline = _pipeline(SlowComponents(Timeline(), delay=0.01).as_components())
+
+        await pipeline.process_batch(_articles(5))
+        await pipeline.process_batch(_articles(3))
+
+        stats = pipeline.get_statistics()
+        assert stats["batches"] == 2
+        assert stats["total_processed"] == 8
+        narrative = stats["stage_metrics"]["narrative"]
+        assert narrative["batches"] == 2 and narrative["items"] == 8
+        assert narrative["avg_batch_latency_ms"] >= 10
+        assert narrative["items_per_sec"] > 0
+        assert stats["stage_metrics"]["final_insight"]["items"] == 8
+
+
+class TestBatchEndpoint:
+    def test_oversized_batch_rejected(self):
+        pytest.importorskip("matplotlib")  # chart_generator import
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from backend.api.intelligence_router import MAX_PIPELINE_BATCH_SIZE, router
+
+        app = FastAPI()
+        app.include_router(router)
+        articles = [{"title": f"headline {i}"} for i in range(MAX_PIPELINE_BATCH_SIZE + 1)]
+
+        response = TestClient(app).post("/api/intelligence/pipeline/process-batch", json={"articles": articles})
+
+        assert response.status_code == 422
@@ -0,0 +1,151 @@
+"""
+Feature Snapshot Store Tests
+
+Tests for:
+- Point-in-time inputs per (ticker, decision time): prices, news, macro, prior decisions
+- As-of binary search matching a brute-force scan
+- Append for later snapshots, merge + rewrite for earlier ones, reopen from disk
+- PointInTimeDataAccess reading snapshots without a database
+- Look-ahead audit
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.backtesting.data_cache import BacktestDataSource
+from backend.backtesting.feature_snapshots import (
+    FeatureSnapshot,
+    FeatureSnapshotBuilder,
+    FeatureSnapshotStore,
+)
+from backend.backtesting.pit_data_access import PointInTimeDataAccess
+
+
+class MemorySource(BacktestDataSource):
+    """영업일 일봉 (close = 날짜 서수) + 일자별 뉴스 (08:00 NVDA, 12:00 AMD)"""
+
+    def get_prices(self, ticker, start, end):
+        days = pd.bdate_range(start, end)
+        close = np.array([d.toordinal() % 1000 for d in days], dtype=float)
+        return pd.DataFrame({"close": close, "volume": 1e6}, index=days)
+
+    def get_news(self, start, end, ticker=None):
+        items, day = [], start
+        while day <= end:
+            base = datetime.combine(day, time.min)
+            items.append({"id": day.toordinal() * 10, "tickers": ["NVDA"], "crawled_at": (base + timedelta(hours=8)).isoformat()})
+            items.append({"id": day.toordinal() * 10 + 1, "ticker": "AMD", "crawled_at": base + timedelta(hours=12)})
+            day += timedelta(days=1)
+        return items
+
+
+START, END = date(2025, 3, 3), date(2025, 3, 28)
+
+MACRO = [
+    {"snapshot_date": date(2025, 2, 28), "created_at": datetime(2025, 2, 28, 18), "regime": "RISK_ON"},
+    {"snapshot_date": date(2025, 3, 10), "created_at": datetime(2025, 3, 10, 18), "regime": "RISK_OFF"},
+]
+DECISIONS = [
+    {"ticker": "NVDA", "created_at": datetime(2025, 3, 4, 9, 30), "action": "BUY", "confidence": 0.8},
+    {"ticker": "NVDA", "created_at": datetime(2025, 3, 5, 15, 0), "action": "HOLD", "confidence": 0.6},
+    {"ticker": "AMD", "created_at": datetime(2025, 3, 5, 10, 0), "action": "SELL", "confidence": 0.7},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FeatureSnapshotStore(tmp_path)
+    FeatureSnapshotBuilder(store, data_source=MemorySource()).build(
+        ["NVDA", "AMD"], START, END, macro_snapshots=MACRO, decisions=DECISIONS)
+    return store
+
+
+class TestBuild:
+    def test_inputs_are_point_in_time(self, store):
+        snapshot = store.as_of("nvda", datetime(2025, 3, 5, 9, 30))
+
+        assert snapshot.as_of == datetime(2025, 3, 5, 9, 30)
+        assert snapshot.features["close"] == date(2025, 3, 4).toordinal() % 1000  # 전일 종가
+        # 24h 창: 전일 08:00 뉴스는 창 밖, 당일 08:00 뉴스만
+        assert snapshot.news_ids == [date(2025, 3, 5).toordinal() * 10]
+        assert snapshot.macro["regime"] == "RISK_ON"
+        # 같은 시각의 결정은 제외, 이전 결정만
+        assert [d["action"] for d in snapshot.prior_decisions] == ["BUY"]
+
+        later = store.as_of("NVDA", datetime(2025, 3, 11, 9, 30))
+        assert later.macro["regime"] == "RISK_OFF"
+        assert [d["action"] for d in later.prior_decisions] == ["BUY", "HOLD"]
+
+    def test_as_of_matches_brute_force(self, store):
+        all_rows = list(store.snapshots("AMD"))
+        assert len(all_rows) == 20
+        rng = np.random.default_rng(3)
+        for _ in range(50):
+            when = datetime(2025, 3, 1) + timedelta(minutes=int(rng.integers(0, 40 * 24 * 60)))
+            expected = [s for s in all_rows if s.as_of <= when]
+            found = store.as_of("AMD", when)
+            assert (found.as_of if found else None) == (expected[-1].as_of if expected else None)
+
+        assert store.as_of("AMD", datetime(2025, 3, 3, 9, 0)) is None
+        assert store.as_of("AMD", datetime(2025, 3, 28, 15), max_staleness=timedelta(hours=1)) is None
+
+    def test_feature_frame(self, store):
+        frame = store.feature_frame("NVDA")
+        assert len(frame) == 20
+        assert "rsi_14" in frame.columns
+        assert frame.index[0] == pd.Timestamp("2025-03-03 09:30")
+
+
+class TestStorage:
+    def test_append_and_rewrite(self, store, tmp_path):
+        builder = FeatureSnapshotBuilder(store, data_source=MemorySource())
+        builder.build(["NVDA"], date(2025, 3, 31), date(2025, 4, 4))
+        assert store.get_stats()["rewrites"] == 0
+        assert len(list(store.snapshots("NVDA"))) == 25
+
+        # 과거 구간 재생성 + 새 피처 → 병합 후 재작성
+        extra = FeatureSnapshot("NVDA", datetime(2025, 3, 3, 9, 30), features={"sentiment": 0.4}, news_ids=[7])
+        store.write("NVDA", [extra])
+        assert store.get_stats()["rewrites"] == 1
+
+        reopened = FeatureSnapshotStore(tmp_path)
+        rows = list(reopened.snapshots("NVDA"))
+        assert len(rows) == 25
+        assert rows[0].features == {"sentiment": 0.4} and rows[0].news_ids == [7]
+        assert rows[1].features["close"] == date(2025, 3, 3).toordinal() % 1000
+        assert rows[-1].as_of == datetime(2025, 4, 4, 9, 30)
+        assert reopened.feature_names("NVDA")[-1] == "sentiment"
+
+    def test_uncommitted_tail_is_discarded(self, store, tmp_path):
+        with open(tmp_path / "snapshots" / "AMD" / "as_of.bin", "ab") as f:
+            f.write(b"\x00" * 5)  # meta.json 커밋 전 중단된 append
+
+        reopened = FeatureSnapshotStore(tmp_path)
+        FeatureSnapshotBuilder(reopened, data_source=MemorySource()).build(["AMD"], date(2025, 3, 31), date(2025, 3, 31))
+
+        assert (tmp_path / "snapshots" / "AMD" / "as_of.bin").stat().st_size == 21 * 8
+        assert reopened.as_of("AMD", datetime(2025, 4, 1)).news_ids[-1] == date(2025, 3, 30).toordinal() * 10 + 1
+
+
+class TestReplay:
+    def test_pit_access_reads_snapshots_without_db(self, store):
+        pit = PointInTimeDataAccess(snapshot_store=store)
+        pit.set_simulation_time(datetime(2025, 3, 6, 10, 0))
+
+        market = pit.get_market_data("NVDA")
+        assert market["snapshot_as_of"] == "2025-03-06T09:30:00"
+        assert market["features"]["close"] == date(2025, 3, 5).toordinal() % 1000
+        assert pit.get_available_news_ids("AMD") == [date(2025, 3, 5).toordinal() * 10 + 1]
+        assert pit.check_integrity()["status"] == "OK"
+
+    def test_lookahead_audit(self, store):
+        nvda_news = {date(2025, 3, 4).toordinal() * 10: datetime(2025, 3, 4, 8)}
+        assert store.audit_lookahead("NVDA", nvda_news) == []
+
+        # 실제 crawled_at 이 스냅샷 시점 이후 → 위반
+        nvda_news[date(2025, 3, 5).toordinal() * 10] = datetime(2025, 3, 5, 11)
+        violations = store.audit_lookahead("NVDA", nvda_news)
+        assert [v["as_of"] for v in violations] == ["2025-03-05T09:30:00"]
@@ -0,0 +1,195 @@
+"""
+LLM Gateway Tests
+
+Tests for:
+- Per-provider concurrency limits
+- Async retry / back-off classification
+- Token-per-minute budget
+- Hedged requests and failover
+- LLMProvider routing through the gateway
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.ai.llm_gateway import (
+    LLMAPIError,
+    LLMGateway,
+    ProviderLimits,
+    TokenBudget,
+    is_retryable,
+)
+from backend.ai.llm_providers import LLMProvider, MockLLMClient, ModelConfig, ModelProvider
+
+
+def _gateway(**limits) -> LLMGateway:
+    return LLMGateway(limits={"mock": ProviderLimits(**{"base_delay": 0.001, **limits})})
+
+
+class TestConcurrency:
+    """제공자별 동시성 제한"""
+
+    async def test_semaphore_caps_in_flight_requests(self):
+        gateway = _gateway(max_concurrency=2)
+        active, peak = 0, 0
+
+        async def request():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "ok"
+
+        results = await asyncio.gather(*(gateway.call("mock", request) for _ in range(8)))
+
+        assert results == ["ok"] * 8
+        assert peak == 2
+        assert gateway.get_stats()["providers"]["mock"]["successes"] == 8
+
+
+class TestRetry:
+    """비동기 재시도"""
+
+    async def test_retries_transient_errors(self):
+        gateway = _gateway(max_retries=3)
+        calls = []
+
+        async def request():
+            calls.append(1)
+            if len(calls) < 3:
+                raise LLMAPIError("rate limited", status_code=429)
+            return "ok"
+
+        assert await gateway.call("mock", request) == "ok"
+        assert len(calls) == 3
+        assert gateway.pool("mock").stats["retries"] == 2
+
+    async def test_does_not_retry_client_errors(self):
+        gateway = _gateway(max_retries=3)
+        calls = []
+
+        async def request():
+            calls.append(1)
+            raise LLMAPIError("bad request", status_code=400)
+
+        with pytest.raises(LLMAPIError):
+            await gateway.call("mock", request)
+        assert len(calls) == 1
+
+    def test_retryable_classification(self):
+        class RateLimitError(Exception):
+            pass
+
+        assert is_retryable(asyncio.TimeoutError())
+        assert is_retryable(RateLimitError())
+        assert is_retryable(LLMAPIError("overloaded", status_code=529))
+        assert not is_retryable(ValueError("missing key"))
+
+
+class TestTokenBudget:
+    """분당 토큰 예산"""
+
+    async def test_waits_when_budget_exhausted(self):
+        budget = TokenBudget(tokens_per_minute=6000)  # 100 tokens/sec
+
+        assert await budget.acquire(6000) == 0.0
+        start = time.monotonic()
+        await budget.acquire(20)
+
+        assert time.monotonic() - start >= 0.15
+
+    async def test_settle_refunds_unused_tokens(self):
+        budget = TokenBudget(tokens_per_minute=6000)
+        await budget.acquire(6000)
+
+        budget.settle(reserved=6000, actual=1000)
+
+        assert budget.available >= 4999
+
+
+class TestHedging:
+    """Hedged request"""
+
+    async def test_fallback_wins_when_primary_is_slow(self):
+        gateway = _gateway()
+
+        async def slow():
+            await asyncio.sleep(1.0)
+            return "primary"
+
+        async def fast():
+            return "fallback"
+
+        start = time.monotonic()
+        result = await gateway.hedge("mock", slow, fast, hedge_after=0.02)
+
+        assert result == "fallback"
+        assert time.monotonic() - start < 0.5
+        assert gateway.hedge_stats == {"hedged_requests": 1, "hedge_wins": 1, "failovers": 0}
+
+    async def test_fast_primary_skips_hedge(self):
+        gateway = _gateway()
+        fallback_calls = []
+
+        async def primary():
+            return "primary"
+
+        async def fallback():
+            fallback_calls.append(1)
+            return "fallback"
+
+        assert await gateway.hedge("mock", primary, fallback, hedge_after=0.5) == "primary"
+        assert fallback_calls == []
+
+    async def test_fails_over_when_primary_errors(self):
+        gateway = _gateway()
+
+        async def broken():
+            raise ValueError("OPENAI_API_KEY not found")
+
+        async def fallback():
+            return "fallback"
+
+        assert await gateway.hedge("mock", broken, fallback) == "fallback"
+        assert gateway.hedge_stats["failovers"] == 1
+
+    async def test_deadline_requires_enough_samples(self):
+        gateway = LLMGateway(hedge_min_samples=3, hedge_min_delay=0.0)
+        pool = gateway.pool("mock")
+        assert gateway.hedge_deadline("mock") is None
+
+        for seconds in (0.1, 0.2, 0.3):
+            pool.latency.record(seconds)
+
+        assert gateway.hedge_deadline("mock") == pytest.approx(0.3)
+
+
+class TestLLMProvider:
+    """LLMProvider 게이트웨이 연동"""
+
+    async def test_complete_with_system_does_not_mutate_config(self):
+        gateway = _gateway()
+        config = ModelConfig(model="mock", provider=ModelProvider.MOCK)
+        provider = LLMProvider(default_config=config, gateway=gateway)
+        provider._clients[ModelProvider.MOCK] = MockLLMClient(latency=0.0)
+
+        response = await provider.complete_with_system("system", "What is the market sentiment?")
+
+        assert response.provider == ModelProvider.MOCK
+        assert config.system_prompt is None
+        stats = provider.get_stats()["providers"]["mock"]
+        assert stats["successes"] == 1
+        assert stats["tokens_used"] == response.tokens_used
+
+    async def test_parallel_calls_overlap(self):
+        provider = LLMProvider(gateway=_gateway(max_concurrency=8))
+        provider._clients[ModelProvider.MOCK] = MockLLMClient(latency=0.05)
+        config = provider.create_mock_config()
+
+        start = time.monotonic()
+        await asyncio.gather(*(provider.complete("prompt", config) for _ in range(6)))
+
+        assert time.monotonic() - start < 0.2
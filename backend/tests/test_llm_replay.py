@@ -0,0 +1,132 @@
+"""
+LLM Replay Cache Tests
+
+Tests for:
+- Request fingerprints (stable, sensitive to every sampling field)
+- record / replay / record_missing modes and hit-rate stats
+- Concurrent misses for the same request calling the API once
+- LLMProvider and AIClientFactory clients recording and replaying responses
+"""
+
+import asyncio
+
+import pytest
+
+from backend.ai.ai_client_factory import AIClientFactory, MockAIClient, ReplayAIClient
+from backend.ai.llm_providers import BaseLLMClient, LLMProvider, LLMResponse, ModelConfig, ModelProvider
+from backend.ai.llm_replay import (
+    LLMReplayCache,
+    LLMReplayMissError,
+    LLMReplayStore,
+    ReplayMode,
+    request_fingerprint,
+)
+
+
+class CountingClient(BaseLLMClient):
+    def __init__(self):
+        super().__init__("test")
+        self.calls = 0
+
+    async def complete(self, prompt, config):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return LLMResponse(content=f"#{self.calls}: {prompt}", model=config.model,
+                           provider=config.provider, tokens_used=42)
+
+
+def _provider(tmp_path, mode):
+    replay = LLMReplayCache(LLMReplayStore(tmp_path), mode)
+    provider = LLMProvider(replay=replay)
+    client = CountingClient()
+    provider._clients[ModelProvider.MOCK] = client
+    return provider, client
+
+
+CONFIG = ModelConfig(model="mock-model", provider=ModelProvider.MOCK, temperature=0.2)
+
+
+def test_fingerprint():
+    request = {"model": "m", "prompt": "p", "temperature": 0.2}
+    assert request_fingerprint(request) == request_fingerprint(dict(reversed(list(request.items()))))
+    assert request_fingerprint(request) != request_fingerprint({**request, "temperature": 0.3})
+    assert request_fingerprint(LLMProvider._replay_request("p", CONFIG)) != \
+        request_fingerprint(LLMProvider._replay_request("p", ModelConfig(model="mock-model", provider=ModelProvider.MOCK)))
+
+
+class TestModes:
+    async def test_record_missing_then_replay(self, tmp_path):
+        provider, client = _provider(tmp_path, ReplayMode.RECORD_MISSING)
+        first = await provider.complete("NVDA outlook?", CONFIG)
+        again = await provider.complete("NVDA outlook?", CONFIG)
+
+        assert client.calls == 1
+        assert again.content == first.content and again.tokens_used == 42
+        assert again.metadata["replayed"] is True and "replayed" not in first.metadata
+
+        replay_only, fresh_client = _provider(tmp_path, ReplayMode.REPLAY)
+        replayed = await replay_only.complete("NVDA outlook?", CONFIG)
+        assert replayed.content == first.content
+        assert fresh_client.calls == 0
+
+        with pytest.raises(LLMReplayMissError):
+            await replay_only.complete("AMD outlook?", CONFIG)
+        stats = replay_only.get_stats()["replay"]
+        assert stats["hits"] == 1 and stats["replay_misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["by_model"]["mock-model"]["hits"] == 1
+
+    async def test_record_always_calls_and_overwrites(self, tmp_path):
+        provider, client = _provider(tmp_path, ReplayMode.RECORD)
+        await provider.complete("q", CONFIG)
+        latest = await provider.complete("q", CONFIG)
+
+        assert client.calls == 2
+        replay_only, _ = _provider(tmp_path, ReplayMode.REPLAY)
+        assert (await replay_only.complete("q", CONFIG)).content == latest.content
+        assert len(LLMReplayStore(tmp_path)) == 1
+
+    async def test_off_passes_through(self, tmp_path):
+        provider, client = _provider(tmp_path, ReplayMode.OFF)
+        await provider.complete("q", CONFIG)
+        await provider.complete("q", CONFIG)
+        assert client.calls == 2
+        assert "replay" not in provider.get_stats()
+
+    async def test_concurrent_misses_call_once(self, tmp_path):
+        provider, client = _provider(tmp_path, ReplayMode.RECORD_MISSING)
+        results = await asyncio.gather(*(provider.complete("same", CONFIG) for _ in range(5)))
+
+        assert client.calls == 1
+        assert len({r.content for r in results}) == 1
+        assert provider.replay.get_stats()["api_calls"] == 1
+
+    async def test_failed_call_is_not_recorded(self, tmp_path):
+        replay = LLMReplayCache(LLMReplayStore(tmp_path), ReplayMode.RECORD_MISSING)
+
+        async def boom():
+            raise RuntimeError("rate limited")
+
+        with pytest.raises(RuntimeError):
+            await replay.call({"model": "m", "prompt": "p"}, boom)
+        assert len(replay.store) == 0
+
+
+async def test_ai_client_factory_wraps_clients(tmp_path):
+    replay = LLMReplayCache(LLMReplayStore(tmp_path), ReplayMode.RECORD_MISSING)
+    AIClientFactory.clear_cache()
+    try:
+        client = AIClientFactory.create("mock-model", "mock", replay=replay)
+        assert isinstance(client, ReplayAIClient) and isinstance(client.client, MockAIClient)
+        assert AIClientFactory.create("mock-model", "mock", replay=replay) is client
+
+        first = await client.call_api("Google TPU?", system_prompt="analyst")
+        await client.call_api("Google TPU?", system_prompt="analyst")
+        await client.search_web("TPU partnership")
+
+        assert client.client.call_count == 1
+        assert client.get_usage_stats()["replay"]["hits"] == 1
+        replayed = ReplayAIClient(MockAIClient(), LLMReplayCache(LLMReplayStore(tmp_path), ReplayMode.REPLAY))
+        assert await replayed.call_api("Google TPU?", system_prompt="analyst") == first
+    finally:
+        AIClientFactory.clear_cache()
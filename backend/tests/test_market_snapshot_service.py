@@ -0,0 +1,187 @@
+"""
+Market Snapshot Service Tests
+
+Tests for:
+- Single-flight builds for concurrent requests
+- Session-aware TTLs and stale-while-revalidate
+- Watchlist background refresh (one batch prefetch)
+- Prices from snapshots with PriceFetcher fallback
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+from backend.market_data.ohlcv_builder import EST
+from backend.market_data.snapshot_service import MarketSnapshotService, market_session_phase
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+class FakeBuilder:
+    """symbol → market_data (blocking, counts calls)"""
+
+    def __init__(self, delay: float = 0.0, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, symbol: str):
+        with self._lock:
+            self.calls.append(symbol)
+            version = len(self.calls)
+        time.sleep(self.delay)
+        if symbol in self.fail:
+            raise RuntimeError("source down")
+        return {"price_data": {"current_price": 100.0 + version}, "version": version}
+
+
+class FakeOhlcv:
+    def __init__(self):
+        self.prefetched = []
+
+    def prefetch(self, symbols):
+        self.prefetched.append(list(symbols))
+
+
+class FakePriceFetcher:
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = []
+
+    async def get_prices_async(self, tickers, max_age=None):
+        self.calls.append((list(tickers), max_age))
+        return {t: self.prices.get(t) for t in tickers}
+
+
+REGULAR = datetime(2026, 10, 14, 11, 0, tzinfo=EST)   # Wednesday
+CLOSED = datetime(2026, 10, 17, 11, 0, tzinfo=EST)    # Saturday
+
+
+def _service(builder, clock, **kwargs) -> MarketSnapshotService:
+    kwargs.setdefault("price_fetcher", FakePriceFetcher({}))
+    return MarketSnapshotService(snapshot_builder=builder, clock=clock, **kwargs)
+
+
+class TestSessionPhase:
+    def test_phases(self):
+        assert market_session_phase(REGULAR) == "regular"
+        assert market_session_phase(REGULAR.replace(hour=7)) == "extended"
+        assert market_session_phase(REGULAR.replace(hour=17)) == "extended"
+        assert market_session_phase(REGULAR.replace(hour=22)) == "closed"
+        assert market_session_phase(CLOSED) == "closed"
+
+
+class TestSnapshots:
+    async def test_concurrent_requests_share_one_build(self):
+        builder = FakeBuilder(delay=0.05)
+        service = _service(builder, Clock(REGULAR))
+
+        results = await asyncio.gather(*(service.get_market_data("nvda") for _ in range(10)))
+
+        assert builder.calls == ["NVDA"]
+        assert all(r["version"] == 1 for r in results)
+        assert service.stats["builds"] == 1
+        assert service.stats["shared_waits"] == 9
+
+    async def test_ttl_depends_on_session(self):
+        builder = FakeBuilder()
+        clock = Clock(REGULAR)
+        service = _service(builder, clock, snapshot_ttl={"regular": 60, "closed": 3600}, stale_grace=1.0)
+
+        await service.get_snapshot("NVDA")
+        clock.advance(59)
+        await service.get_snapshot("NVDA")
+        clock.advance(2)
+        await service.get_snapshot("NVDA")
+        assert len(builder.calls) == 2
+
+        clock.now = CLOSED
+        await service.get_snapshot("NVDA")
+        clock.advance(1800)
+        snapshot = await service.get_snapshot("NVDA")
+        assert len(builder.calls) == 3
+        assert snapshot.market_data["version"] == 3
+
+    async def test_stale_snapshot_returned_while_refreshing(self):
+        builder = FakeBuilder(delay=0.02)
+        clock = Clock(REGULAR)
+        service = _service(builder, clock, snapshot_ttl={"regular": 60}, stale_grace=3.0)
+
+        await service.get_snapshot("NVDA")
+        clock.advance(90)
+
+        stale = await service.get_snapshot("NVDA")
+        assert stale.market_data["version"] == 1
+        assert service.stats["stale_hits"] == 1
+
+        await asyncio.sleep(0.1)
+        fresh = await service.get_snapshot("NVDA")
+        assert fresh.market_data["version"] == 2
+
+        # grace 초과 → 갱신 대기
+        clock.advance(200)
+        assert (await service.get_snapshot("NVDA")).market_data["version"] == 3
+
+    async def test_build_failure_returns_fallback_without_caching(self):
+        builder = FakeBuilder(fail={"BAD"})
+        service = _service(builder, Clock(REGULAR))
+
+        market_data = await service.get_market_data("BAD")
+
+        assert market_data["price_data"]["current_price"] == 0
+        assert service.peek("BAD") is None
+        assert service.stats["build_errors"] == 1
+
+
+class TestWatchlist:
+    async def test_refresh_prefetches_due_symbols_once(self):
+        builder = FakeBuilder()
+        ohlcv = FakeOhlcv()
+        clock = Clock(REGULAR)
+        service = _service(builder, clock, ohlcv_builder=ohlcv, snapshot_ttl={"regular": 60}, refresh_ahead=0.8)
+        service.watch(["NVDA", "AAPL"])
+
+        assert sorted(await service.refresh_watchlist()) == ["AAPL", "NVDA"]
+        assert ohlcv.prefetched == [["NVDA", "AAPL", "^VIX"]]
+
+        clock.advance(30)
+        assert await service.refresh_watchlist() == []
+
+        clock.advance(20)  # 50s ≥ 60 × 0.8
+        assert sorted(await service.refresh_watchlist()) == ["AAPL", "NVDA"]
+        assert len(builder.calls) == 4
+
+    def test_watchlist_is_bounded(self):
+        service = _service(FakeBuilder(), Clock(REGULAR), max_watchlist=2)
+        service.watch(["A", "B"])
+        service.watch(["C", "A"])
+        assert service.watchlist == ["C", "A"]
+
+
+class TestPrices:
+    async def test_prices_from_snapshot_then_fetcher(self):
+        builder = FakeBuilder()
+        clock = Clock(REGULAR)
+        fetcher = FakePriceFetcher({"AAPL": 190.0, "NVDA": 880.0})
+        service = _service(builder, clock, price_fetcher=fetcher, price_ttl={"regular": 15})
+
+        await service.get_snapshot("NVDA")
+        prices = await service.get_prices(["NVDA", "AAPL"])
+
+        assert prices == {"NVDA": 101.0, "AAPL": 190.0}
+        assert fetcher.calls == [(["AAPL"], 15)]
+
+        clock.advance(20)
+        assert await service.get_price("NVDA") == 880.0
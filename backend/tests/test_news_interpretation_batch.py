@@ -0,0 +1,154 @@
+"""
+News Interpretation Batch Tests
+
+Tests for:
+- Several headlines packed into one structured prompt
+- Bounded-concurrency per-article fallback when the batch response is unusable
+- Interpretation cache keyed by (ticker, article hash, prompt version, macro snapshot)
+- Macro context loaded once per batch
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.ai.debate.news_interpretation import (
+    InterpretationCache,
+    build_batch_prompt,
+    parse_batch_response,
+)
+
+MACRO = {
+    "id": 11, "regime": "RISK_ON", "fed_stance": "DOVISH", "vix_category": "LOW",
+    "market_sentiment": "GREED", "sp500_trend": "UP", "dominant_narrative": "AI capex",
+}
+
+
+def _interp(idx=None, bias="BULLISH"):
+    data = {"headline_bias": bias, "expected_impact": "MEDIUM", "time_horizon": "INTRADAY",
+            "confidence": 0.7, "reasoning": "r"}
+    if idx is not None:
+        data["id"] = idx
+    return data
+
+
+class FakeGLM:
+    """batch 프롬프트에는 JSON 배열, 단일 프롬프트에는 객체로 응답"""
+
+    def __init__(self, latency=0.02, batch_ok=True):
+        self.latency = latency
+        self.batch_ok = batch_ok
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+
+    async def chat(self, messages, max_tokens, temperature):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.latency)
+        self.active -= 1
+
+        if "JSON 배열" in prompt:
+            count = prompt.count("헤드라인:")
+            body = json.dumps([_interp(i) for i in range(count)]) if self.batch_ok else "not json"
+        else:
+            body = json.dumps(_interp(bias="BEARISH"))
+        return {"choices": [{"message": {"content": f"```json\n{body}\n```"}}]}
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("ENABLE_NEWS_INTERPRETATION", "true")
+    from backend.ai.debate.news_agent import NewsAgent
+
+    agent = NewsAgent(news_query=object(), interpretation_cache=InterpretationCache())
+    agent.glm_client = FakeGLM()
+    agent.macro_loads = 0
+
+    async def load_macro():
+        agent.macro_loads += 1
+        return MACRO
+
+    agent._load_macro_context = load_macro
+    return agent
+
+
+def _articles(n, prefix="headline"):
+    return [{"title": f"{prefix} {i}", "summary": f"summary {i}"} for i in range(n)]
+
+
+class TestBatching:
+    async def test_headlines_packed_into_batch_prompts(self, agent):
+        agent.interpretation_batch_size = 5
+
+        results = await agent.interpret_articles("NVDA", _articles(10))
+
+        assert len(results) == 10
+        assert all(r["headline_bias"] == "BULLISH" for r in results)
+        assert len(agent.glm_client.prompts) == 2
+        assert agent.glm_client.max_active == 2  # 두 배치 동시 실행
+        assert agent.macro_loads == 1
+        assert "지배적 서사: AI capex" in agent.glm_client.prompts[0]
+
+    async def test_fallback_to_bounded_single_calls(self, agent):
+        agent.glm_client = FakeGLM(batch_ok=False)
+        agent.interpretation_batch_size = 8
+        agent.interpretation_concurrency = 3
+
+        results = await agent.interpret_articles("NVDA", _articles(8))
+
+        assert [r["headline_bias"] for r in results] == ["BEARISH"] * 8
+        assert len(agent.glm_client.prompts) == 1 + 8
+        assert agent.glm_client.max_active <= 3
+        assert agent.interpretation_stats["single_calls"] == 8
+
+
+class TestCache:
+    async def test_same_article_not_reinterpreted(self, agent):
+        articles = _articles(4)
+        await agent.interpret_articles("NVDA", articles)
+        calls = len(agent.glm_client.prompts)
+
+        again = await agent.interpret_articles("nvda", articles + articles[:2])
+
+        assert len(again) == 6
+        assert len(agent.glm_client.prompts) == calls
+        assert agent.interpretation_cache.get_stats()["hits"] >= 4
+
+    async def test_key_includes_ticker_and_macro_snapshot(self, agent):
+        items = [("Fed cuts rates", "")]
+        await agent.interpret_batch("NVDA", items, MACRO)
+        await agent.interpret_batch("NVDA", items, MACRO)
+        await agent.interpret_batch("AMD", items, MACRO)
+        await agent.interpret_batch("NVDA", items, {**MACRO, "id": 12})
+
+        assert len(agent.glm_client.prompts) == 3
+
+    def test_ttl_and_lru(self):
+        now = [0.0]
+        cache = InterpretationCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+        cache.put(("A",), _interp())
+        cache.put(("B",), _interp())
+        cache.get(("A",))
+        cache.put(("C",), _interp())
+
+        assert cache.get(("B",)) is None  # LRU eviction
+        assert cache.get(("A",)) is not None
+        now[0] = 11
+        assert cache.get(("A",)) is None  # expired
+
+
+class TestPromptParsing:
+    def test_batch_prompt_numbers_items(self):
+        prompt = build_batch_prompt("NVDA", [("a", "x" * 1000), ("b", "")], None)
+        assert "[0] 헤드라인: a" in prompt and "[1] 헤드라인: b" in prompt
+        assert "x" * 301 not in prompt
+
+    def test_parse_skips_missing_and_malformed(self):
+        text = "```json\n" + json.dumps([_interp(1), {"id": 0, "headline_bias": "BULLISH"}, _interp(7)]) + "\n```"
+        parsed = parse_batch_response(text, count=3)
+        assert list(parsed) == [1]
+        assert "id" not in parsed[1]
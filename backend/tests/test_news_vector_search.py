@@ -0,0 +1,146 @@
+"""
+News Vector Search Tests
+
+Tests for:
+- Dual-write column values (dimension / zero-vector guards)
+- HNSW search SQL shape and per-query ef_search
+- Keyset backfill of ARRAY embeddings into embedding_vec
+- NewsArticle HNSW index DDL
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from backend.database.news_vector_search import (
+    NEWS_EMBEDDING_DIM,
+    NewsEmbeddingBackfill,
+    NewsVectorSearch,
+    embedding_columns,
+    to_vector_value,
+)
+
+
+def _embedding(seed=1.0):
+    return [seed] + [0.01] * (NEWS_EMBEDDING_DIM - 1)
+
+
+class FakeSession:
+    """execute() 기록 + 미리 정한 결과 반환"""
+
+    def __init__(self, results=()):
+        self.results = list(results)
+        self.executed = []
+        self.commits = 0
+        self.closed = False
+
+    @contextmanager
+    def begin_nested(self):
+        yield
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.executed.append((sql, params))
+        if "set_config" in sql:
+            return None
+        rows = self.results.pop(0)
+        return SimpleNamespace(all=lambda: rows, one=lambda: rows)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class TestDualWrite:
+    def test_columns(self):
+        emb = _embedding()
+        assert embedding_columns(emb, dual_write=True) == {"embedding": emb, "embedding_vec": emb}
+        assert embedding_columns(emb, dual_write=False)["embedding"] is None
+
+    def test_unconvertible_embeddings_stay_array_only(self):
+        assert to_vector_value([0.0] * NEWS_EMBEDDING_DIM) is None  # 임베딩 실패 fallback
+        assert to_vector_value([0.1] * 1536) is None                 # 차원 불일치
+        assert to_vector_value(None) is None
+        assert embedding_columns([0.1] * 1536, dual_write=True)["embedding_vec"] is None
+
+
+class TestSearch:
+    def test_search_sets_ef_search_and_orders_by_distance(self):
+        row = SimpleNamespace(id=7, title="NVDA beats", published_date=None, tickers=["NVDA"], similarity=0.97)
+        session = FakeSession([[row]])
+        search = NewsVectorSearch()
+
+        hits = search.search(session, _embedding(), k=5, ef_search=200, since=datetime(2026, 10, 1), exclude_id=3)
+
+        (ef_sql, ef_params), (sql, params) = session.executed
+        assert "set_config('hnsw.ef_search'" in ef_sql and ef_params == {"ef_search": "200"}
+        assert "ORDER BY n.embedding_vec <=> CAST(:query AS vector)" in sql
+        assert "LIMIT :k" in sql
+        assert "n.published_date >= :since" in sql and "n.id <> :exclude_id" in sql
+        assert params["k"] == 5 and params["query"].startswith("[1.0,0.01,")
+        assert hits[0].id == 7 and hits[0].similarity == pytest.approx(0.97)
+        assert search.get_stats()["queries"] == 1
+
+    def test_ef_search_at_least_k(self):
+        session = FakeSession([[]])
+        NewsVectorSearch(default_ef_search=40).search(session, _embedding(), k=100)
+        assert session.executed[0][1] == {"ef_search": "100"}
+
+    def test_invalid_query_rejected(self):
+        with pytest.raises(ValueError):
+            NewsVectorSearch().search(FakeSession(), [0.1] * 10)
+        with pytest.raises(ValueError):
+            NewsVectorSearch().search(FakeSession(), _embedding(), iterative_scan="fast")
+
+    def test_near_duplicates_threshold(self):
+        rows = [
+            SimpleNamespace(id=1, title="a", published_date=None, tickers=None, similarity=0.99),
+            SimpleNamespace(id=2, title="b", published_date=None, tickers=None, similarity=0.90),
+        ]
+        hits = NewsVectorSearch().find_near_duplicates(FakeSession([rows]), _embedding(), threshold=0.95)
+        assert [h.id for h in hits] == [1]
+
+
+class TestBackfill:
+    def test_keyset_batches_until_exhausted(self):
+        session = FakeSession([
+            SimpleNamespace(last_id=1000, scanned=1000, converted=990),
+            SimpleNamespace(last_id=1450, scanned=400, converted=400),
+            SimpleNamespace(last_id=None, scanned=0, converted=0),
+        ])
+        backfill = NewsEmbeddingBackfill(session_factory=lambda: session, batch_size=1000, pause_seconds=0)
+
+        stats = backfill.run()
+
+        assert [p["after_id"] for _, p in session.executed] == [0, 1000, 1450]
+        assert "CAST(n.embedding AS vector(384))" in session.executed[0][0]
+        assert session.commits == 3 and session.closed
+        assert stats["converted"] == 1390 and stats["skipped"] == 10
+        assert stats["batches"] == 2 and stats["last_id"] == 1450
+
+    async def test_max_batches_in_background(self):
+        session = FakeSession([SimpleNamespace(last_id=10, scanned=10, converted=10)])
+        backfill = NewsEmbeddingBackfill(session_factory=lambda: session, batch_size=10, pause_seconds=0)
+
+        stats = await backfill.run_in_background(max_batches=1)
+
+        assert stats["batches"] == 1 and len(session.executed) == 1
+
+
+def test_hnsw_index_ddl():
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    from backend.database.models import NewsArticle
+
+    index = next(i for i in NewsArticle.__table__.indexes if i.name == "idx_news_embedding_hnsw")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "USING hnsw (embedding_vec vector_cosine_ops)" in ddl
+    assert "m = 16" in ddl and "ef_construction = 64" in ddl
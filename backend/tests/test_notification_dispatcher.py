@@ -0,0 +1,197 @@
+"""
+Notification Dispatcher Tests
+
+Tests for:
+- Per-connection WebSocket queues (stalled client isolation)
+- Drop-oldest / coalesce slow consumer policies
+- Rate-shaped, batched outbound delivery (Telegram/Slack, opt-in)
+"""
+
+import asyncio
+import json
+import time
+
+from backend.notifications.dispatcher import (
+    OutboundBatcher,
+    SlowConsumerPolicy,
+    WebSocketBroadcaster,
+)
+from backend.notifications.slack_notifier import SlackNotifier
+from backend.notifications.telegram_notifier import TelegramNotifier
+
+
+class FakeWebSocket:
+    """send_text만 구현한 WebSocket 대역"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+
+    async def send_text(self, text: str):
+        if self.fail:
+            raise ConnectionError("closed")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+
+class TestWebSocketBroadcaster:
+    """WebSocket fan-out"""
+
+    async def test_stalled_client_does_not_block_others(self):
+        broadcaster = WebSocketBroadcaster(send_timeout=10)
+        fast, stalled = FakeWebSocket(), FakeWebSocket(delay=5)
+        broadcaster.add(fast)
+        broadcaster.add(stalled)
+
+        start = time.monotonic()
+        for i in range(3):
+            await broadcaster.broadcast({"type": "tick", "seq": i})
+        await asyncio.sleep(0.05)
+
+        assert time.monotonic() - start < 1
+        assert [json.loads(m)["seq"] for m in fast.sent] == [0, 1, 2]
+        assert stalled.sent == []
+        await broadcaster.close()
+
+    async def test_failed_client_is_removed(self):
+        broadcaster = WebSocketBroadcaster()
+        ok, broken = FakeWebSocket(), FakeWebSocket(fail=True)
+        broadcaster.add(ok)
+        broadcaster.add(broken)
+
+        await broadcaster.broadcast({"type": "x"})
+        await broadcaster.flush(timeout=1)
+
+        assert broadcaster.connections == {ok}
+        assert broadcaster.get_stats()["send_errors"] == 1
+
+    async def test_drop_oldest_when_queue_full(self):
+        broadcaster = WebSocketBroadcaster(max_queue=2)
+        ws = FakeWebSocket()
+        broadcaster.add(ws)
+
+        # 이벤트 루프에 양보하지 않으므로 writer가 아직 아무것도 보내지 않음
+        for i in range(5):
+            await broadcaster.broadcast({"seq": i})
+        await broadcaster.flush(timeout=1)
+
+        assert [json.loads(m)["seq"] for m in ws.sent] == [3, 4]
+        assert broadcaster.get_stats()["dropped"] == 3
+
+    async def test_coalesce_replaces_pending_message(self):
+        broadcaster = WebSocketBroadcaster(policy=SlowConsumerPolicy.COALESCE)
+        ws = FakeWebSocket()
+        broadcaster.add(ws)
+
+        for price in (100, 101, 102):
+            await broadcaster.broadcast({"ticker": "AAPL", "price": price}, coalesce_key="AAPL")
+        await broadcaster.broadcast({"type": "order_filled"})
+        await broadcaster.flush(timeout=1)
+
+        assert [json.loads(m) for m in ws.sent] == [
+            {"ticker": "AAPL", "price": 102},
+            {"type": "order_filled"},
+        ]
+        stats = broadcaster.get_stats()
+        assert stats["coalesced"] == 2
+        assert stats["messages_sent"] == 2
+
+
+class TestOutboundBatcher:
+    """Rate-shaped outbound delivery"""
+
+    async def test_merges_queued_messages_within_weight(self):
+        batches = []
+
+        async def send_batch(messages):
+            batches.append(messages)
+            return True
+
+        batcher = OutboundBatcher(
+            send_batch, min_interval=0, max_batch_weight=10, weigh=len
+        )
+        for text in ["aaaa", "bbbb", "cccc"]:
+            await batcher.submit(text)
+        await batcher.flush(timeout=1)
+
+        assert batches == [["aaaa", "bbbb"], ["cccc"]]
+        assert batcher.get_stats()["messages_sent"] == 3
+        await batcher.close()
+
+    async def test_respects_min_interval(self):
+        sent_at = []
+
+        async def send_batch(messages):
+            sent_at.append(time.monotonic())
+            return True
+
+        batcher = OutboundBatcher(
+            send_batch, min_interval=0.05, max_batch_size=1
+        )
+        for i in range(3):
+            await batcher.submit(i)
+        await batcher.flush(timeout=1)
+
+        gaps = [b - a for a, b in zip(sent_at, sent_at[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+        await batcher.close()
+
+    async def test_telegram_batches_into_single_message(self, monkeypatch):
+        notifier = TelegramNotifier("token", "chat", batch_outbound=True)
+        notifier.outbox.min_interval = 0
+        posted = []
+
+        async def fake_post(message):
+            posted.append(message)
+            return True
+
+        monkeypatch.setattr(notifier, "_post_message", fake_post)
+
+        assert await notifier.send_message("first")
+        assert await notifier.send_message("second")
+        assert await notifier.send_message("silent", disable_notification=True)
+        await notifier.outbox.flush(timeout=1)
+
+        assert [p["text"] for p in posted] == ["first\n\nsecond", "silent"]
+        assert notifier.get_stats()["outbound"]["batches_sent"] == 2
+        await notifier.outbox.close()
+
+    async def test_slack_batches_never_drop_blocks(self, monkeypatch):
+        notifier = SlackNotifier("https://hooks.slack.test/x", batch_outbound=True)
+        notifier.outbox.min_interval = 0
+        posted = []
+
+        async def fake_post(payload):
+            posted.append(payload)
+            return True
+
+        monkeypatch.setattr(notifier, "_post_payload", fake_post)
+
+        for n in range(3):
+            blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": f"{n}-{i}"}} for i in range(24)]
+            assert await notifier.send_message({"blocks": blocks})
+        await notifier.outbox.flush(timeout=1)
+
+        # 24 blocks + divider = 25 → two payloads fill one message (49 blocks incl. divider)
+        assert [len(p["blocks"]) for p in posted] == [49, 24]
+        sections = [b for p in posted for b in p["blocks"] if b["type"] == "section"]
+        assert len(sections) == 72
+        assert all(len(p["blocks"]) <= SlackNotifier.MAX_BLOCKS for p in posted)
+        await notifier.outbox.close()
+
+    def test_manager_factory_sends_directly_by_default(self, monkeypatch, tmp_path):
+        from backend.notifications.notification_manager import create_notification_manager
+
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+        monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat")
+        monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.slack.test/x")
+        settings = str(tmp_path / "settings.json")
+
+        manager = create_notification_manager(settings_path=settings)
+        assert not manager.telegram.batch_outbound
+        assert not manager.slack.batch_outbound
+
+        batched = create_notification_manager(settings_path=settings, batch_outbound=True)
+        assert batched.telegram.batch_outbound and batched.slack.batch_outbound
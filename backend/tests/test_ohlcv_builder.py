@@ -0,0 +1,203 @@
+"""
+Multi-Timeframe OHLCV Builder Tests
+
+Tests for:
+- stock_prices first, one intraday fetch, one batched daily download for cold symbols
+- Recent days filled from the intraday series
+- Local 1W/1M/4H resampling and per-session caching
+- Vectorized watchlist indicators
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.market_data.ohlcv_builder import EST, MultiTimeframeBuilder, compute_indicators
+
+
+def _daily(days: int = 400, end: str = "2026-10-15", start_price: float = 100.0) -> pd.DataFrame:
+    index = pd.bdate_range(end=end, periods=days)
+    close = start_price + np.arange(days, dtype=float)
+    return pd.DataFrame({
+        "Open": close - 0.5, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1000.0,
+    }, index=index)
+
+
+def _hourly(dates=("2026-10-15", "2026-10-16")) -> pd.DataFrame:
+    index = pd.DatetimeIndex([
+        pd.Timestamp(f"{d} {h:02d}:30", tz=EST) for d in dates for h in range(9, 16)
+    ])
+    close = 600.0 + np.arange(len(index), dtype=float)
+    return pd.DataFrame({
+        "Open": close, "High": close + 0.5, "Low": close - 0.5, "Close": close, "Volume": 10.0,
+    }, index=index)
+
+
+class FakeSources:
+    def __init__(self, daily=None, hourly=None, remote_daily=None):
+        self.daily = daily or {}
+        self.hourly = hourly or {}
+        self.remote_daily = remote_daily or {}
+        self.calls = {"db": [], "intraday": [], "download": []}
+
+    def load_db(self, symbols, start):
+        self.calls["db"].append(list(symbols))
+        return {s: self.daily[s] for s in symbols if s in self.daily}
+
+    def load_intraday(self, symbols):
+        self.calls["intraday"].append(list(symbols))
+        return {s: self.hourly[s] for s in symbols if s in self.hourly}
+
+    def download_daily(self, symbols, start):
+        self.calls["download"].append(list(symbols))
+        return {s: self.remote_daily[s] for s in symbols if s in self.remote_daily}
+
+
+def _builder(sources: FakeSources, now: datetime) -> MultiTimeframeBuilder:
+    return MultiTimeframeBuilder(
+        daily_loader=sources.load_db,
+        intraday_loader=sources.load_intraday,
+        daily_downloader=sources.download_daily,
+        clock=lambda: now,
+    )
+
+
+AFTER_CLOSE = EST.localize(datetime(2026, 10, 16, 18, 0))
+
+
+class TestLoading:
+    """DB 우선 로드"""
+
+    def test_watchlist_loads_in_one_batch(self):
+        sources = FakeSources(
+            daily={"AAPL": _daily(), "NVDA": _daily()},
+            hourly={"AAPL": _hourly(), "NVDA": _hourly()},
+            remote_daily={"TSLA": _daily(50)},
+        )
+        builder = _builder(sources, AFTER_CLOSE)
+
+        builder.prefetch(["AAPL", "NVDA", "TSLA"])
+
+        assert sources.calls == {
+            "db": [["AAPL", "NVDA", "TSLA"]],
+            "intraday": [["AAPL", "NVDA", "TSLA"]],
+            "download": [["TSLA"]],
+        }
+
+    def test_cold_symbol_gets_full_daily_history(self):
+        sources = FakeSources(hourly={"TSLA": _hourly()}, remote_daily={"TSLA": _daily()})
+        builder = _builder(sources, AFTER_CLOSE)
+
+        frames = builder.get_frames("TSLA", ("1d", "1m"))
+        builder.prefetch(["TSLA"])
+
+        assert sources.calls["download"] == [["TSLA"]]
+        assert len(frames["1d"]) == 401  # 다운로드 일봉 + 시간봉 집계 10-16
+        assert len(frames["1m"]) > 12
+        assert builder.summarize_watchlist(["TSLA"]).loc["TSLA", "ma_200"] < frames["1d"]["Close"].iloc[-1]
+
+    def test_cold_symbol_without_downloader_uses_intraday_daily(self):
+        sources = FakeSources(daily={"AAPL": _daily()}, hourly={"AAPL": _hourly(), "TSLA": _hourly()})
+        builder = MultiTimeframeBuilder(
+            daily_loader=sources.load_db,
+            intraday_loader=sources.load_intraday,
+            daily_downloader=None,
+            clock=lambda: AFTER_CLOSE,
+        )
+
+        daily = builder.get_frames("TSLA", ("1d",))["1d"]
+
+        assert sources.calls["download"] == []
+        assert list(daily.index) == [pd.Timestamp("2026-10-15"), pd.Timestamp("2026-10-16")]
+        assert builder.get_stats()["intraday_daily_symbols"] == 1
+
+    def test_intraday_fills_days_missing_from_db(self):
+        sources = FakeSources(daily={"AAPL": _daily()}, hourly={"AAPL": _hourly()})
+        daily = _builder(sources, AFTER_CLOSE).get_frames("AAPL", ("1d",))["1d"]
+
+        # DB ends 10-15 (kept), 10-16 comes from the hourly bars
+        assert daily.index[-1] == pd.Timestamp("2026-10-16")
+        assert daily.loc["2026-10-15", "Close"] == _daily()["Close"].iloc[-1]
+        last = daily.iloc[-1]
+        assert last["Open"] == 607.0 and last["Close"] == 613.0 and last["Volume"] == 70.0
+
+
+class TestResampling:
+    """리샘플링 + 세션 캐시"""
+
+    def test_derived_timeframes(self):
+        sources = FakeSources(daily={"AAPL": _daily()}, hourly={"AAPL": _hourly()})
+        frames = _builder(sources, AFTER_CLOSE).get_frames("AAPL")
+
+        weekly, monthly, four_hour = frames["1w"], frames["1m"], frames["4h"]
+        assert weekly["High"].max() == frames["1d"]["High"].max()
+        assert weekly["Volume"].sum() == frames["1d"]["Volume"].sum()
+        assert monthly.index.is_month_start.all()
+        assert len(four_hour) < len(frames["1h"])
+        assert four_hour["Volume"].sum() == frames["1h"]["Volume"].sum()
+
+    def test_cached_for_the_session(self):
+        sources = FakeSources(daily={"AAPL": _daily()}, hourly={"AAPL": _hourly()})
+        now = {"t": AFTER_CLOSE}
+        builder = MultiTimeframeBuilder(
+            daily_loader=sources.load_db,
+            intraday_loader=sources.load_intraday,
+            daily_downloader=sources.download_daily,
+            clock=lambda: now["t"],
+        )
+
+        builder.get_multi_timeframe_data("AAPL")
+        builder.get_multi_timeframe_data("aapl")
+        assert len(sources.calls["intraday"]) == 1
+        assert builder.get_stats()["cache_hits"] == 1
+
+        now["t"] = EST.localize(datetime(2026, 10, 17, 18, 0))
+        builder.get_frames("AAPL")
+        assert len(sources.calls["intraday"]) == 2
+
+    def test_multi_timeframe_summary_shape(self):
+        sources = FakeSources(daily={"AAPL": _daily()}, hourly={"AAPL": _hourly()})
+        data = _builder(sources, AFTER_CLOSE).get_multi_timeframe_data("AAPL")
+
+        assert set(data) == {"1d", "1w", "1m", "4h"}
+        assert data["1d"]["trend"] == "uptrend"
+        assert set(data["1d"]) == {"current_price", "change_pct", "volume", "trend", "rsi", "last_date"}
+
+
+class TestIndicators:
+    """벡터화 지표"""
+
+    def test_matches_per_symbol_reference(self):
+        rng = np.random.default_rng(0)
+        index = pd.bdate_range(end="2026-10-16", periods=260)
+        close = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, (260, 3)), axis=0)),
+            index=index, columns=["AAPL", "NVDA", "MSFT"],
+        )
+
+        summary = compute_indicators(close)
+
+        for symbol in close:
+            series = close[symbol]
+            delta = series.diff()
+            gain = delta.where(delta > 0, 0).rolling(14).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+            rsi = (100 - 100 / (1 + gain / loss)).iloc[-1]
+            macd = series.ewm(span=12, adjust=False).mean() - series.ewm(span=26, adjust=False).mean()
+
+            assert summary.loc[symbol, "rsi"] == pytest.approx(rsi)
+            assert summary.loc[symbol, "macd"] == pytest.approx(macd.iloc[-1])
+            assert summary.loc[symbol, "ma_200"] == pytest.approx(series.rolling(200).mean().iloc[-1])
+
+    def test_watchlist_summary(self):
+        sources = FakeSources(
+            daily={"AAPL": _daily(), "NVDA": _daily(start_price=50)},
+            hourly={"AAPL": _hourly()},
+        )
+        summary = _builder(sources, AFTER_CLOSE).summarize_watchlist(["AAPL", "NVDA"])
+
+        assert list(summary.index) == ["AAPL", "NVDA"]
+        assert (summary["trend"] == "uptrend").all()
+        assert summary.loc["NVDA", "current_price"] == _daily(start_price=50)["Close"].iloc[-1]
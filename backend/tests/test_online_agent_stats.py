@@ -0,0 +1,163 @@
+"""
+Online Agent Stats Tests
+
+Tests for:
+- Decayed Welford accumulators match a full recomputation when decay is off
+- Exponential decay down-weights old trades
+- Per-ticker / per-regime scopes
+- Compact state persistence and replay of legacy outcome files
+- Per-trade weight updates
+"""
+
+import json
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.ai.meta.agent_weight_trainer import AgentWeightTrainer
+from backend.ai.meta.online_agent_stats import DecayedStats, OnlineAgentStats
+
+
+def _trades(n, seed=7):
+    rng = random.Random(seed)
+    now = datetime.now()
+    for i in range(n):
+        pct = rng.uniform(-6, 8)
+        yield {
+            "agent_name": "claude",
+            "ticker": rng.choice(["NVDA", "AAPL"]),
+            "vote": rng.choice(["BUY", "SELL", "HOLD"]),
+            "outcome": "PROFIT" if pct > 0 else "LOSS",
+            "pnl_amount": pct * 10,
+            "pnl_percentage": pct,
+            "confidence": rng.uniform(0.5, 0.9),
+            "regime": rng.choice(["RISK_ON", "RISK_OFF"]),
+            "timestamp": now - timedelta(minutes=n - i),
+        }
+
+
+def _naive(trades):
+    returns = [t["pnl_percentage"] for t in trades]
+    correct = sum(
+        (t["vote"] == "BUY" and t["outcome"] == "PROFIT") or (t["vote"] == "SELL" and t["outcome"] == "LOSS")
+        for t in trades
+    )
+    confidence = sum(t["confidence"] for t in trades) / len(trades)
+    return {
+        "win_rate": sum(t["pnl_amount"] > 0 for t in trades) / len(trades),
+        "avg_return": statistics.mean(returns),
+        "sharpe_ratio": statistics.mean(returns) / statistics.stdev(returns),
+        "max_drawdown": abs(min(r for r in returns if r < 0)),
+        "prediction_accuracy": correct / len(trades),
+        "avg_confidence": confidence,
+    }
+
+
+class TestDecayedStats:
+    def test_matches_recomputation_without_decay(self):
+        trainer = AgentWeightTrainer(lookback_days=0)  # 감쇠 없음
+        trades = list(_trades(200))
+        for trade in trades:
+            trainer.record_outcome(**trade)
+
+        metrics = trainer.get_agent_metrics("claude")
+        expected = _naive(trades)
+        assert metrics.total_trades == 200
+        for name, value in expected.items():
+            assert getattr(metrics, name) == pytest.approx(value, rel=1e-9)
+
+        nvda = [t for t in trades if t["ticker"] == "NVDA"]
+        assert trainer.get_agent_metrics("claude", ticker="nvda").avg_return == pytest.approx(_naive(nvda)["avg_return"])
+        risk_off = [t for t in trades if t["regime"] == "RISK_OFF"]
+        assert trainer.get_agent_metrics("claude", regime="RISK_OFF").win_rate == pytest.approx(_naive(risk_off)["win_rate"])
+
+    def test_old_trades_decay(self):
+        tau = 10 * 86400
+        stats = DecayedStats()
+        t0 = datetime(2026, 10, 1).timestamp()
+        stats.update(t0, -10.0, False, True, False, 0.5, tau)
+        stats.update(t0 + tau, 10.0, True, False, True, 0.5, tau)
+
+        view = stats.view(t0 + tau, tau)
+        assert view["weight"] == pytest.approx(1 + 1 / 2.718281828, rel=1e-6)
+        assert view["mean"] > 0  # 최근 이익이 오래된 손실보다 큰 비중
+        assert view["worst_loss"] == pytest.approx(10 / 2.718281828, rel=1e-6)
+        assert stats.view(t0 + 10 * tau, tau)["weight"] < 0.001
+
+    def test_out_of_order_record_is_weighted_by_age(self):
+        tau = 86400.0
+        in_order, late = DecayedStats(), DecayedStats()
+        in_order.update(0.0, 1.0, True, False, True, 0.6, tau)
+        in_order.update(tau, 3.0, True, False, True, 0.6, tau)
+        late.update(tau, 3.0, True, False, True, 0.6, tau)
+        late.update(0.0, 1.0, True, False, True, 0.6, tau)
+
+        assert late.view(tau, tau)["mean"] == pytest.approx(in_order.view(tau, tau)["mean"])
+        assert late.view(tau, tau)["std"] == pytest.approx(in_order.view(tau, tau)["std"])
+
+    def test_stale_agent_falls_back_to_defaults(self):
+        trainer = AgentWeightTrainer(lookback_days=1)
+        trainer.record_outcome("claude", "NVDA", "BUY", "PROFIT", 10, 5.0, 0.7,
+                               timestamp=datetime.now() - timedelta(days=10))
+        metrics = trainer.get_agent_metrics("claude")
+        assert metrics.total_trades == 0
+        assert metrics.win_rate == 0.5
+
+
+class TestPersistence:
+    def test_state_restored_without_outcome_history(self, tmp_path):
+        trainer = AgentWeightTrainer(storage_path=tmp_path)
+        for trade in _trades(30):
+            trainer.record_outcome(**trade)
+        before = trainer.get_agent_metrics("claude")
+
+        (tmp_path / "outcomes_claude.jsonl").unlink()
+        reopened = AgentWeightTrainer(storage_path=tmp_path)
+
+        after = reopened.get_agent_metrics("claude")
+        assert after.avg_return == pytest.approx(before.avg_return)
+        assert after.sharpe_ratio == pytest.approx(before.sharpe_ratio)
+        state = json.loads((tmp_path / "agent_stats_state.json").read_text())
+        assert len(state["stats"]) == 1 + 2 + 2  # 전체 + 티커 2 + 레짐 2
+
+    def test_legacy_outcomes_replayed_once(self, tmp_path):
+        trades = list(_trades(20))
+        with open(tmp_path / "outcomes_claude.jsonl", "w") as f:
+            for t in trades:
+                f.write(json.dumps({
+                    "timestamp": t["timestamp"].isoformat(), "ticker": t["ticker"], "vote": t["vote"],
+                    "outcome": t["outcome"], "pnl_amount": t["pnl_amount"],
+                    "pnl_percentage": t["pnl_percentage"], "confidence": t["confidence"],
+                }) + "\n")
+
+        trainer = AgentWeightTrainer(storage_path=tmp_path, lookback_days=0)
+
+        assert trainer.get_agent_metrics("claude").avg_return == pytest.approx(_naive(trades)["avg_return"])
+        assert (tmp_path / "agent_stats_state.json").exists()
+        engine = OnlineAgentStats.load(tmp_path / "agent_stats_state.json", decay_days=0)
+        assert engine.view("claude")["count"] == 20
+
+
+class TestWeights:
+    def test_update_on_record(self, tmp_path):
+        trainer = AgentWeightTrainer(storage_path=tmp_path, update_on_record=True)
+        for _ in range(5):
+            trainer.record_outcome("claude", "NVDA", "BUY", "LOSS", -100, -8.0, 0.9)
+
+        assert trainer.get_weight("claude") < AgentWeightTrainer.DEFAULT_WEIGHT
+        assert trainer.get_weight("gemini") == AgentWeightTrainer.DEFAULT_WEIGHT
+        saved = json.loads((tmp_path / "agent_weights.json").read_text())
+        assert saved["weights"]["claude"] == pytest.approx(trainer.get_weight("claude"))
+
+    def test_recalculate_weights_uses_incremental_metrics(self):
+        trainer = AgentWeightTrainer()
+        for _ in range(10):
+            trainer.record_outcome("claude", "NVDA", "BUY", "PROFIT", 100, 5.0, 0.6)
+            trainer.record_outcome("gemini", "NVDA", "BUY", "LOSS", -100, -5.0, 0.9)
+
+        weights = trainer.recalculate_weights()
+
+        assert weights["claude"] > weights["gemini"]
+        assert trainer.get_ranking()[0][0] == "claude"
@@ -0,0 +1,173 @@
+"""
+Options Chain Engine Tests
+
+Tests for:
+- Vectorized trade-side classification (matches per-row rule)
+- Black-Scholes greeks and implied volatility round-trip
+- Dollar-delta / gamma exposure aggregation by strike and expiry
+- SmartOptionsAnalyzer and OptionsFilter on the vectorized engine
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.ai.options.chain_engine import (
+    OptionsChainEngine,
+    black_scholes_greeks,
+    classify_trade_side,
+    implied_volatility,
+)
+from backend.ai.options.smart_options_analyzer import SmartOptionsAnalyzer
+from backend.services.market_scanner.filters.options_filter import OptionsFilter
+
+NOW = datetime(2026, 10, 16, 10, 0)
+EXPIRY = "2026-11-20"
+
+
+def _chain(spot: float = 100.0, sigma: float = 0.3, now: datetime = NOW, expiry: str = EXPIRY) -> pd.DataFrame:
+    """합성 체인: BS 이론가 주변 호가, 행사가별 체결 위치를 돌아가며 배치"""
+    strikes = np.arange(80.0, 125.0, 5.0)
+    rows = []
+    t = (pd.Timestamp(expiry) + pd.Timedelta(hours=16) - pd.Timestamp(now)).total_seconds() / (365 * 86400)
+    for contract_type in ("call", "put"):
+        fair = black_scholes_greeks(spot, strikes, t, sigma, contract_type == "call")["price"]
+        for i, (strike, price) in enumerate(zip(strikes, fair)):
+            bid, ask = price * 0.98, price * 1.02
+            last = (ask, bid, price)[i % 3]
+            rows.append({
+                "strike": strike,
+                "lastPrice": last,
+                "bid": bid,
+                "ask": ask,
+                "volume": 100 * (i + 1),
+                "openInterest": 1000 * (i + 1),
+                "impliedVolatility": sigma,
+                "contract_type": contract_type,
+                "expiration": expiry,
+            })
+    return pd.DataFrame(rows)
+
+
+class TestTradeSide:
+    """체결 방향 벡터 판별"""
+
+    def test_matches_row_rule(self):
+        analyzer = SmartOptionsAnalyzer()
+        rng = np.random.default_rng(3)
+        bid = rng.uniform(0, 5, 500)
+        ask = bid + rng.uniform(-0.5, 1.0, 500)
+        last = bid + rng.uniform(-0.5, 1.5, 500)
+
+        vectorized = classify_trade_side(last, bid, ask)
+        expected = [analyzer._determine_trade_side(l, b, a).value for l, b, a in zip(last, bid, ask)]
+
+        assert vectorized.tolist() == expected
+
+
+class TestBlackScholes:
+    """Black-Scholes Greeks / IV"""
+
+    def test_known_values_and_parity(self):
+        calls = black_scholes_greeks(100.0, 100.0, 1.0, 0.2, True, rate=0.05)
+        puts = black_scholes_greeks(100.0, 100.0, 1.0, 0.2, False, rate=0.05)
+
+        assert float(calls["price"]) == pytest.approx(10.4506, abs=1e-3)
+        assert float(calls["delta"]) == pytest.approx(0.6368, abs=1e-3)
+        assert float(calls["gamma"]) == pytest.approx(0.018762, abs=1e-5)
+        # Put-Call parity: C - P = S - K e^{-rT}
+        assert float(calls["price"] - puts["price"]) == pytest.approx(100 - 100 * np.exp(-0.05), abs=1e-6)
+        assert float(calls["delta"] - puts["delta"]) == pytest.approx(1.0)
+
+    def test_implied_volatility_round_trip(self):
+        strikes = np.array([70.0, 90.0, 100.0, 110.0, 140.0])
+        sigmas = np.array([0.15, 0.25, 0.4, 0.6, 0.9])
+        is_call = np.array([True, False, True, False, True])
+        prices = black_scholes_greeks(100.0, strikes, 0.5, sigmas, is_call)["price"]
+
+        recovered = implied_volatility(prices, 100.0, strikes, 0.5, is_call)
+
+        np.testing.assert_allclose(recovered, sigmas, atol=1e-4)
+
+    def test_price_below_intrinsic_is_nan(self):
+        iv = implied_volatility(np.array([5.0]), 100.0, 80.0, 0.5, np.array([True]))
+        assert np.isnan(iv[0])
+
+
+class TestExposure:
+    """행사가/만기별 노출 집계"""
+
+    def test_prepare_and_aggregate(self):
+        engine = OptionsChainEngine()
+        prepared = engine.prepare(_chain(), spot=100.0, now=NOW)
+
+        np.testing.assert_allclose(prepared["iv"], 0.3, atol=1e-3)
+        calls = prepared[prepared["contract_type"] == "call"]
+        assert (calls["delta"].diff().dropna() < 0).all()  # 행사가↑ → 콜 델타↓
+        assert (prepared.loc[prepared["contract_type"] == "put", "gamma_exposure"] <= 0).all()
+
+        by_strike = engine.exposure_by_strike(prepared)
+        assert by_strike.loc[(EXPIRY, 100.0), "gamma_exposure"] == pytest.approx(
+            prepared.loc[prepared["strike"] == 100.0, "gamma_exposure"].sum()
+        )
+        assert by_strike["flow_dollar_delta"].sum() == pytest.approx(prepared["flow_dollar_delta"].sum())
+
+    def test_without_spot_skips_greeks(self):
+        prepared = OptionsChainEngine().prepare(_chain(), now=NOW)
+        assert prepared["delta"].isna().all()
+        assert OptionsChainEngine.net_delta(prepared) is None
+
+
+class TestAnalyzer:
+    """SmartOptionsAnalyzer 벡터화"""
+
+    async def test_contract_summary_matches_row_loop(self):
+        analyzer = SmartOptionsAnalyzer()
+        chain = _chain()
+        calls = chain[chain["contract_type"] == "call"]
+
+        summary = await analyzer._analyze_contracts(calls, "call")
+
+        buy = sell = 0
+        for _, row in calls.iterrows():
+            side = analyzer._determine_trade_side(row["lastPrice"], row["bid"], row["ask"]).value
+            buy += row["volume"] if side == "BUY" else 0
+            sell += row["volume"] if side == "SELL" else 0
+        assert summary["buy_volume"] == buy
+        assert summary["sell_volume"] == sell
+        assert summary["total_volume"] == calls["volume"].sum()
+
+    async def test_analyze_flow_with_greeks(self):
+        analyzer = SmartOptionsAnalyzer(whale_threshold=50_000)
+        flow = await analyzer.analyze_flow("TEST", chain_data=_chain(), current_price=100.0)
+
+        assert -1.0 <= flow.net_delta <= 1.0
+        assert flow.gamma_by_strike
+        assert all(order["premium"] >= 50_000 for order in flow.whale_orders)
+        directions = {(o["contract_type"], o["trade_side"], o["direction"]) for o in flow.whale_orders}
+        assert ("call", "BUY", "BEARISH") not in directions
+        assert ("put", "BUY", "BULLISH") not in directions
+
+
+class TestOptionsFilter:
+    """OptionsFilter 일괄 체크"""
+
+    async def test_check_many_uses_threaded_fetch(self, monkeypatch):
+        options_filter = OptionsFilter(max_concurrency=2)
+        fetched = []
+
+        def fake_fetch(ticker):
+            fetched.append(ticker)
+            now = datetime.now()
+            return _chain(now=now, expiry=(now + timedelta(days=30)).strftime("%Y-%m-%d")), 100.0
+
+        monkeypatch.setattr(options_filter, "_fetch_chain", fake_fetch)
+        results = await options_filter.check_many(["AAA", "BBB", "CCC"])
+
+        assert sorted(fetched) == ["AAA", "BBB", "CCC"]
+        result = results["AAA"]
+        assert result.implied_volatility == pytest.approx(0.3, abs=1e-3)
+        assert result.net_gamma_exposure is not None
+        assert result.put_call_ratio == pytest.approx(1.0)
@@ -0,0 +1,257 @@
+"""
+Realtime Price Bus Tests
+
+Tests for:
+- Last-value cache and stale-tick handling
+- Threshold crossing (sorted watches, once / re-arm)
+- Replay source and dashboard stream
+- Polling source heartbeats for unchanged prices
+- Event-driven stop-loss checks without per-tick fetches
+- Bounded broker quote fan-out
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.data.position_tracker import PositionTracker
+from backend.market_data.price_bus import ABOVE, BELOW, PollingQuoteSource, PriceBus, Quote, ReplayQuoteSource
+from backend.services.stop_loss_monitor import StopLossMonitor
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+
+class TestLastValueCache:
+    def test_last_and_max_age(self):
+        now = [1000.0]
+        bus = PriceBus(clock=lambda: now[0])
+        bus.publish(Quote("NVDA", 500.0, timestamp=995.0))
+
+        assert bus.last("NVDA").price == 500.0
+        assert bus.last_prices(["NVDA", "AMD"], max_age=10) == {"NVDA": 500.0, "AMD": None}
+        now[0] = 1010.0
+        assert bus.last("NVDA", max_age=10) is None
+
+    async def test_polling_heartbeat_keeps_unchanged_price_fresh(self):
+        class Fetcher:
+            async def get_prices_async(self, symbols, max_age=None):
+                return {"NVDA": 500.0}
+
+        bus = PriceBus()
+        ticks = Recorder()
+        bus.on_quote(ticks)
+        bus.track(["NVDA"])
+        stream = PollingQuoteSource(price_fetcher=Fetcher(), interval_seconds=0.01).stream(bus.symbols)
+
+        first = await stream.__anext__()
+        bus.publish(first)
+        second = await stream.__anext__()
+        bus.publish(second)
+        await stream.aclose()
+
+        assert (first.heartbeat, second.heartbeat) == (False, True)
+        assert bus.last("NVDA") is second
+        assert len(ticks.events) == 1
+        assert bus.stats["heartbeats"] == 1
+
+    def test_out_of_order_tick_ignored(self):
+        bus = PriceBus()
+        bus.publish(Quote("NVDA", 500.0, timestamp=2.0))
+        bus.publish(Quote("NVDA", 400.0, timestamp=1.0))
+        assert bus.last("NVDA").price == 500.0
+
+
+class TestThresholds:
+    def test_only_crossed_watches_fire(self):
+        bus = PriceBus()
+        rec = Recorder()
+        for level in (90.0, 95.0, 98.0):
+            bus.add_threshold("NVDA", level, BELOW, rec, key=f"stop:{level}")
+        bus.add_threshold("NVDA", 110.0, ABOVE, rec, key="take_profit")
+
+        bus.publish(Quote("NVDA", 100.0, timestamp=1))
+        assert rec.events == []
+
+        events = bus.publish(Quote("NVDA", 94.0, timestamp=2))
+        assert sorted(e.watch.level for e in events) == [95.0, 98.0]
+        assert bus.get_threshold("stop:98.0") is None
+        assert bus.get_threshold("stop:90.0") is not None
+
+        bus.publish(Quote("NVDA", 111.0, timestamp=3))
+        assert [e.watch.key for e in rec.events][-1] == "take_profit"
+        assert bus.stats["threshold_events"] == 3
+
+    def test_repeating_watch_rearms_after_recross(self):
+        bus = PriceBus()
+        rec = Recorder()
+        bus.add_threshold("AMD", 100.0, BELOW, rec, once=False)
+
+        for ts, price in enumerate([101, 99, 98, 101, 97]):
+            bus.publish(Quote("AMD", float(price), timestamp=ts))
+
+        assert [e.price for e in rec.events] == [99.0, 97.0]
+
+    def test_already_crossed_fires_on_registration(self):
+        bus = PriceBus()
+        rec = Recorder()
+        bus.publish(Quote("AMD", 80.0, timestamp=1))
+        bus.add_threshold("AMD", 85.0, BELOW, rec)
+        assert len(rec.events) == 1
+
+    def test_replacing_key_and_interest_set(self):
+        bus = PriceBus()
+        rec = Recorder()
+        bus.add_threshold("AMD", 85.0, BELOW, rec, key="stop:AMD")
+        bus.add_threshold("AMD", 80.0, BELOW, rec, key="stop:AMD")
+        assert bus.get_stats()["thresholds"] == 1
+        assert bus.symbols == {"AMD"}
+
+        bus.remove_threshold("stop:AMD")
+        assert bus.symbols == set()
+
+    def test_invalid_direction(self):
+        with pytest.raises(ValueError):
+            PriceBus().add_threshold("AMD", 1.0, "sideways", print)
+
+
+class TestSources:
+    async def test_replay_drives_async_subscribers(self):
+        bus = PriceBus()
+        received = []
+
+        async def on_stop(event):
+            received.append((event.symbol, event.price))
+
+        bus.add_threshold("NVDA", 95.0, BELOW, on_stop)
+        bus.track(["AMD"])
+        source = ReplayQuoteSource([
+            ("NVDA", 100.0, 1.0), ("AMD", 50.0, 2.0), ("TSLA", 10.0, 2.5), ("NVDA", 94.0, 3.0),
+        ])
+
+        await bus.run(source, restart=False)
+        await bus.drain()
+
+        assert received == [("NVDA", 94.0)]
+        assert bus.last("TSLA") is None  # 관심 종목이 아님
+        assert bus.stats["quotes"] == 3
+
+    async def test_dashboard_stream_gets_ticks_and_events(self):
+        bus = PriceBus()
+        bus.publish(Quote("NVDA", 100.0, timestamp=1))
+        bus.add_threshold("NVDA", 99.0, BELOW, Recorder())
+
+        stream = bus.stream(["NVDA"])
+        first = await stream.__anext__()
+        bus.publish(Quote("NVDA", 98.0, timestamp=2))
+        second = await stream.__anext__()
+        third = await stream.__anext__()
+        await stream.aclose()
+
+        assert (first["type"], first["price"]) == ("quote", 100.0)
+        assert (second["type"], third["type"]) == ("quote", "threshold")
+        assert bus.get_stats()["listeners"] == 0
+
+
+class FakePriceFetcher:
+    def __init__(self):
+        self.calls = []
+
+    async def get_prices_async(self, tickers, max_age=None):
+        self.calls.append(list(tickers))
+        return {t: None for t in tickers}
+
+
+class FakeConsensus:
+    async def vote_on_signal(self, context, action, additional_info):
+        return SimpleNamespace(approved=True, approve_count=1, total_votes=3)
+
+
+class FakeAutoTrader:
+    def __init__(self):
+        self.executed = []
+
+    async def execute_stop_loss(self, ticker, consensus_result, current_price):
+        self.executed.append((ticker, current_price, time.monotonic()))
+        return {"executed": True}
+
+
+class TestEventDrivenStopLoss:
+    async def test_stop_triggers_on_tick_without_fetch(self, tmp_path):
+        tracker = PositionTracker(data_dir=str(tmp_path))
+        tracker.create_position("NVDA", "NVIDIA", initial_price=100.0, initial_amount=10_000)
+        tracker.create_position("AMD", "AMD", initial_price=50.0, initial_amount=5_000)
+
+        bus = PriceBus()
+        fetcher = FakePriceFetcher()
+        trader = FakeAutoTrader()
+        monitor = StopLossMonitor(
+            tracker,
+            consensus_engine=FakeConsensus(),
+            auto_trader=trader,
+            stop_loss_threshold_pct=-10.0,
+            enable_auto_execute=True,
+            price_fetcher=fetcher,
+            price_bus=bus,
+        )
+
+        assert monitor.sync_stop_watches() == 2
+        assert bus.symbols == {"NVDA", "AMD"}
+
+        bus.publish(Quote("NVDA", 95.0))
+        bus.publish(Quote("AMD", 49.0))
+        published_at = time.monotonic()
+        bus.publish(Quote("NVDA", 89.0))
+        await bus.drain()
+
+        assert [(t, p) for t, p, _ in trader.executed] == [("NVDA", 89.0)]
+        assert trader.executed[0][2] - published_at < 0.5
+        assert fetcher.calls == []
+        assert monitor.event_trigger_count == 1
+
+        # 주기 점검도 버스 캐시 가격 사용 (조회 없음)
+        await monitor._check_all_positions()
+        assert fetcher.calls == []
+
+        # 감시 재동기화 → 청산된 포지션 감시 해제
+        del tracker.positions["AMD"]
+        assert monitor.sync_stop_watches() == 1
+        assert "AMD" not in bus.symbols
+
+
+class FakeBroker:
+    """동기 get_price (스레드에서 호출) + 동시 호출 수 기록"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_price(self, ticker):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return {"current_price": 100.0}
+
+
+class TestBrokerFanOut:
+    async def test_broker_quotes_are_bounded(self, tmp_path):
+        broker = FakeBroker()
+        monitor = StopLossMonitor(PositionTracker(data_dir=str(tmp_path)), kis_broker=broker,
+                                  max_concurrent_quotes=2)
+        tickers = [f"T{i}" for i in range(8)]
+
+        prices = await monitor._get_current_prices(tickers)
+
+        assert prices == {t: 100.0 for t in tickers}
+        assert broker.peak <= 2
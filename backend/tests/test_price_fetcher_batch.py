@@ -0,0 +1,97 @@
+"""
+PriceFetcher Batch API Tests
+
+Tests for:
+- One bulk request for all cache misses
+- Alpha Vantage hedge after the latency budget
+- In-flight sharing between concurrent callers
+- Per-source statistics
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.market_data.price_fetcher import PriceFetcher
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    monkeypatch.delenv("ALPHA_VANTAGE_API_KEY", raising=False)
+    return PriceFetcher(latency_budget=0.05)
+
+
+class TestSyncBatch:
+    """get_multiple_prices"""
+
+    def test_single_bulk_request_for_cache_misses(self, fetcher, monkeypatch):
+        calls = []
+
+        def fake_bulk(tickers):
+            calls.append(list(tickers))
+            return {t: 100.0 + i for i, t in enumerate(tickers)}
+
+        monkeypatch.setattr(fetcher, "get_prices_yahoo_bulk", fake_bulk)
+        fetcher.set_cache("AAPL", 190.0)
+
+        prices = fetcher.get_multiple_prices(["AAPL", "MSFT", "NVDA"])
+
+        assert prices == {"AAPL": 190.0, "MSFT": 100.0, "NVDA": 101.0}
+        assert calls == [["MSFT", "NVDA"]]
+        assert fetcher.get_source_stats()["sources"]["yahoo"]["requests"] == 1
+
+
+class TestAsyncBatch:
+    """get_prices_async"""
+
+    async def test_hedges_with_alpha_vantage_after_budget(self, fetcher, monkeypatch):
+        fetcher.alpha_vantage_key = "test"
+
+        def slow_bulk(tickers):
+            time.sleep(0.5)
+            return {t: 1.0 for t in tickers}
+
+        monkeypatch.setattr(fetcher, "get_prices_yahoo_bulk", slow_bulk)
+        monkeypatch.setattr(fetcher, "get_price_alpha_vantage", lambda t: 2.0)
+
+        start = time.monotonic()
+        prices = await fetcher.get_prices_async(["AAPL", "MSFT"])
+
+        assert prices == {"AAPL": 2.0, "MSFT": 2.0}
+        assert time.monotonic() - start < 0.4
+        assert fetcher.get_cached_price("AAPL") == 2.0
+
+    async def test_falls_back_for_tickers_missing_from_bulk(self, fetcher, monkeypatch):
+        fetcher.alpha_vantage_key = "test"
+        monkeypatch.setattr(fetcher, "get_prices_yahoo_bulk", lambda tickers: {"AAPL": 1.0})
+        monkeypatch.setattr(fetcher, "get_price_alpha_vantage", lambda t: 3.0)
+
+        prices = await fetcher.get_prices_async(["AAPL", "DELISTED"])
+
+        assert prices == {"AAPL": 1.0, "DELISTED": 3.0}
+        stats = fetcher.get_source_stats()["sources"]
+        assert stats["yahoo"]["ticker_hit_rate"] == 0.5
+        assert stats["alpha_vantage"]["requests"] == 1
+
+    async def test_concurrent_callers_share_one_fetch(self, fetcher, monkeypatch):
+        calls = []
+
+        def bulk(tickers):
+            calls.append(list(tickers))
+            time.sleep(0.02)
+            return {t: 5.0 for t in tickers}
+
+        monkeypatch.setattr(fetcher, "get_prices_yahoo_bulk", bulk)
+
+        results = await asyncio.gather(*(fetcher.get_prices_async(["AAPL"]) for _ in range(5)))
+
+        assert all(r == {"AAPL": 5.0} for r in results)
+        assert calls == [["AAPL"]]
+
+    async def test_max_age_bypasses_older_cache(self, fetcher, monkeypatch):
+        monkeypatch.setattr(fetcher, "get_prices_yahoo_bulk", lambda tickers: {"AAPL": 7.0})
+        fetcher.set_cache("AAPL", 6.0)
+
+        assert await fetcher.get_prices_async(["AAPL"]) == {"AAPL": 6.0}
+        assert await fetcher.get_prices_async(["AAPL"], max_age=0) == {"AAPL": 7.0}
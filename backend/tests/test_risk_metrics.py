@@ -0,0 +1,145 @@
+"""
+Risk Metrics Tests
+
+Tests for:
+- Drawdown series / summary vs. loop reference
+- Historical, parametric and Cornish-Fisher VaR / CVaR
+- Rolling Sharpe / Sortino / max drawdown vs. per-window reference
+- Engines sharing the implementation (Shadow Trading, Signal Backtest, performance metrics)
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from backend.analytics import risk_metrics
+from backend.backtest.performance_metrics import calculate_max_drawdown
+from backend.backtesting.performance_metrics import calculate_drawdown_series
+
+
+def _loop_max_drawdown(values):
+    peak = values[0]
+    max_dd = 0.0
+    for value in values:
+        peak = max(peak, value)
+        max_dd = min(max_dd, (value - peak) / peak)
+    return max_dd
+
+
+@pytest.fixture
+def equity():
+    rng = np.random.default_rng(7)
+    return 100 * np.cumprod(1 + rng.normal(0.0003, 0.012, 2520))
+
+
+class TestDrawdown:
+    def test_matches_loop_reference(self, equity):
+        assert risk_metrics.max_drawdown(equity) == pytest.approx(_loop_max_drawdown(equity))
+        assert risk_metrics.drawdown_series(equity).max() == 0.0
+
+    def test_summary_peak_trough_recovery(self):
+        values = [100, 110, 99, 88, 95, 111, 105, 100]
+        summary = risk_metrics.drawdown_summary(values)
+
+        assert summary.max_drawdown == pytest.approx(88 / 110 - 1)
+        assert (summary.peak_index, summary.trough_index, summary.recovery_index) == (1, 3, 5)
+        assert summary.recovery_periods == 2
+        assert summary.durations.tolist() == [3]
+        assert summary.open_duration == 2
+        assert summary.current_drawdown == pytest.approx(100 / 111 - 1)
+
+    def test_empty_and_flat(self):
+        assert risk_metrics.max_drawdown([]) == 0.0
+        summary = risk_metrics.drawdown_summary([5.0, 5.0, 5.0])
+        assert summary.max_drawdown == 0.0
+        assert summary.recovery_index is None
+        assert summary.durations.size == 0
+
+
+class TestValueAtRisk:
+    def test_historical_matches_percentile_and_tail_mean(self, equity):
+        returns = np.diff(equity) / equity[:-1] * 100
+        result = risk_metrics.value_at_risk(returns, [0.95, 0.99])
+
+        for confidence in (0.95, 0.99):
+            threshold = np.percentile(returns, (1 - confidence) * 100)
+            assert result[confidence]["var"] == pytest.approx(threshold)
+            assert result[confidence]["cvar"] == pytest.approx(returns[returns <= threshold].mean())
+
+    def test_parametric_closed_form(self):
+        rng = np.random.default_rng(3)
+        returns = rng.normal(0.001, 0.02, 5000)
+        mu, sigma = returns.mean(), returns.std(ddof=1)
+        z = NormalDist().inv_cdf(0.05)
+
+        result = risk_metrics.value_at_risk(returns, [0.95], risk_metrics.PARAMETRIC)[0.95]
+
+        assert result["var"] == pytest.approx(mu + sigma * z)
+        assert result["cvar"] == pytest.approx(mu - sigma * NormalDist().pdf(z) / 0.05)
+
+    def test_cornish_fisher_widens_fat_left_tail(self):
+        rng = np.random.default_rng(11)
+        returns = rng.normal(0.0005, 0.01, 5000)
+        returns[rng.random(5000) < 0.03] -= 0.05  # 급락 꼬리
+
+        normal = risk_metrics.value_at_risk(returns, [0.99], risk_metrics.PARAMETRIC)[0.99]
+        adjusted = risk_metrics.value_at_risk(returns, [0.99], risk_metrics.CORNISH_FISHER)[0.99]
+
+        assert adjusted["var"] < normal["var"]
+        assert adjusted["cvar"] < adjusted["var"]
+
+    def test_cornish_fisher_reduces_to_normal_without_skew(self):
+        returns = np.tile([-0.01, 0.01], 500)  # skew 0, but platykurtic
+        z = NormalDist().inv_cdf(0.05)
+        kurt = -2.0
+        expected = returns.std(ddof=1) * (z + (z ** 3 - 3 * z) * kurt / 24)
+        result = risk_metrics.value_at_risk(returns, [0.95], risk_metrics.CORNISH_FISHER)[0.95]
+        assert result["var"] == pytest.approx(expected, rel=1e-6)
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            risk_metrics.value_at_risk([0.1, 0.2], [1.5])
+        with pytest.raises(ValueError):
+            risk_metrics.value_at_risk([0.1, 0.2], [0.95], method="monte_carlo")
+
+
+class TestRolling:
+    def test_rolling_sharpe_and_sortino_match_reference(self, equity):
+        returns = np.diff(equity) / equity[:-1]
+        window = 63
+        sharpe = risk_metrics.rolling_sharpe(returns, window)
+        sortino = risk_metrics.rolling_sortino(returns, window)
+
+        assert np.isnan(sharpe[: window - 1]).all()
+        for end in (window - 1, 500, returns.size - 1):
+            chunk = returns[end - window + 1:end + 1]
+            downside = np.sqrt(np.mean(np.minimum(chunk, 0) ** 2))
+            assert sharpe[end] == pytest.approx(risk_metrics.sharpe_ratio(chunk))
+            assert sortino[end] == pytest.approx(chunk.mean() / downside * np.sqrt(252))
+
+    def test_rolling_max_drawdown(self, equity):
+        window = 252
+        rolling = risk_metrics.rolling_max_drawdown(equity, window)
+        assert rolling[-1] == pytest.approx(_loop_max_drawdown(equity[-window:]))
+        assert np.nanmin(rolling) == pytest.approx(risk_metrics.max_drawdown(equity), abs=0.5)
+
+    def test_flat_window_is_nan(self):
+        returns = np.concatenate([np.full(30, 0.001), np.random.default_rng(1).normal(0, 0.01, 30)])
+        sharpe = risk_metrics.rolling_sharpe(returns, 20)
+        assert np.isnan(sharpe[25])
+        assert np.isfinite(sharpe[-1])
+
+
+class TestSharedCallers:
+    def test_performance_metric_helpers(self, equity):
+        values = equity[:300].tolist()
+        assert calculate_max_drawdown(values) == pytest.approx(_loop_max_drawdown(values))
+        assert max(calculate_drawdown_series(values)) == pytest.approx(-_loop_max_drawdown(values))
+
+    def test_signal_backtest_engine_drawdown_pct(self, equity):
+        from backend.backtesting.signal_backtest_engine import SignalBacktestEngine
+
+        engine = SignalBacktestEngine.__new__(SignalBacktestEngine)
+        engine.equity_curve = equity[:500].tolist()
+        assert engine._calculate_max_drawdown() == pytest.approx(_loop_max_drawdown(engine.equity_curve) * 100)
@@ -0,0 +1,209 @@
+"""
+Scheduler Runtime Tests
+
+Tests for:
+- Run history with wait/run durations
+- Overlap prevention (in-process and via the cross-process job lock)
+- Per-class concurrency limits
+- Retries, timeouts and misfire records
+- Catch-up of cron runs missed while the scheduler was down
+- Trigger jitter
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from apscheduler.events import EVENT_JOB_MISSED, JobExecutionEvent
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from backend.schedulers.scheduler_runtime import (
+    DEFAULT_HISTORY_DB_PATH,
+    JobRunHistory,
+    ScheduledJob,
+    SchedulerRuntime,
+    parse_concurrency_classes,
+)
+
+
+@pytest.fixture
+def history(tmp_path):
+    return JobRunHistory(f"sqlite:///{tmp_path / 'runs.db'}")
+
+
+def _runtime(history, **concurrency):
+    return SchedulerRuntime(history, concurrency=parse_concurrency_classes(
+        ",".join(f"{k}={v}" for k, v in concurrency.items())), owner="test")
+
+
+def _sleeper(seconds):
+    async def sleep():
+        await asyncio.sleep(seconds)
+    return sleep
+
+
+def _job(job_id, func, concurrency_class="default", **kwargs):
+    return ScheduledJob(id=job_id, func=func, trigger=IntervalTrigger(hours=1),
+                        concurrency_class=concurrency_class, **kwargs)
+
+
+class TestExecution:
+    def test_history_records_durations(self, history):
+        runtime = _runtime(history)
+
+        runtime.add_job(_job("sync_prices", _sleeper(0.05), "yfinance"))
+        runtime.add_job(_job("blocking", lambda: time.sleep(0.02)))
+
+        assert asyncio.run(runtime.run_now("sync_prices")) == "success"
+        assert asyncio.run(runtime.run_now("blocking")) == "success"
+
+        run = history.recent("sync_prices")[0]
+        assert run["status"] == "success"
+        assert run["run_type"] == "manual"
+        assert run["concurrency_class"] == "yfinance"
+        assert run["duration_ms"] >= 45
+        assert history.summary()["blocking"]["by_status"] == {"success": 1}
+
+    def test_overlapping_run_is_skipped(self, history):
+        runtime = _runtime(history)
+        runtime.add_job(_job("slow", _sleeper(0.1)))
+
+        async def main():
+            return await asyncio.gather(runtime.run_now("slow"), runtime.run_now("slow"))
+
+        assert sorted(asyncio.run(main())) == ["skipped", "success"]
+        assert runtime.stats["skipped_overlap"] == 1
+
+    def test_job_locked_by_other_scheduler_is_skipped(self, history):
+        runtime = _runtime(history)
+        runtime.add_job(_job("shadow_trader", lambda: None))
+
+        assert history.try_lock("shadow_trader", "other-host")
+        assert asyncio.run(runtime.run_now("shadow_trader")) == "skipped"
+        assert runtime.stats["skipped_locked"] == 1
+
+        history.unlock("shadow_trader", "other-host")
+        assert asyncio.run(runtime.run_now("shadow_trader")) == "success"
+        assert history.try_lock("shadow_trader", "other-host")  # 실행 후 해제됨
+
+    def test_concurrency_class_limit(self, history):
+        runtime = _runtime(history, llm=1)
+        events = []
+
+        def gated(name, release):
+            async def run():
+                events.append(("start", name))
+                await release.wait()
+                events.append(("end", name))
+            return run
+
+        async def main():
+            release = asyncio.Event()
+            for i in range(3):
+                runtime.add_job(_job(f"llm_{i}", gated(f"llm_{i}", release), "llm"))
+            runtime.add_job(_job("db", gated("db", release), "db_heavy"))
+
+            runs = asyncio.gather(*(runtime.run_now(job_id) for job_id in runtime.jobs))
+            while len(events) < 2:
+                await asyncio.sleep(0)
+            for _ in range(20):  # 나머지 llm 작업이 슬롯 없이 시작할 기회
+                await asyncio.sleep(0)
+            started = {name for _, name in events}
+            release.set()
+            await runs
+            return started
+
+        started = asyncio.run(main())
+        assert len(started) == 2 and "db" in started  # llm 1개 + db_heavy 1개
+
+        # llm 작업은 겹치지 않고 하나씩 (start, end) 순서로 실행
+        llm = [kind for kind, name in events if name.startswith("llm")]
+        assert llm == ["start", "end"] * 3
+        assert len(history.recent()) == 4
+
+        with pytest.raises(ValueError):
+            runtime.add_job(_job("bad", gated("bad", asyncio.Event()), "gpu"))
+
+
+class TestFailures:
+    def test_retry_then_success(self, history):
+        runtime = _runtime(history)
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ConnectionError("broker offline")
+
+        runtime.add_job(_job("accountability", flaky, retries=2, retry_delay_seconds=0))
+
+        assert asyncio.run(runtime.run_now("accountability")) == "success"
+        runs = history.recent("accountability")
+        assert [(r["attempt"], r["status"]) for r in reversed(runs)] == [(1, "failed"), (2, "success")]
+        assert "broker offline" in runs[1]["error"]
+
+    def test_timeout(self, history):
+        runtime = _runtime(history)
+        runtime.add_job(_job("hung", _sleeper(5), timeout_seconds=0.05))
+
+        assert asyncio.run(runtime.run_now("hung")) == "timeout"
+        assert runtime.stats["timeouts"] == 1
+
+    def test_misfire_is_recorded(self, history):
+        runtime = _runtime(history)
+        runtime.add_job(_job("report", lambda: None, misfire_grace_seconds=60))
+
+        scheduled = datetime.now().astimezone() - timedelta(minutes=5)
+        runtime._on_scheduler_event(JobExecutionEvent(EVENT_JOB_MISSED, "report", "default", scheduled))
+
+        run = history.recent("report")[0]
+        assert run["status"] == "missed"
+        assert run["scheduled_at"] == scheduled.replace(tzinfo=None)
+
+
+class TestScheduling:
+    def test_scheduled_run_and_catch_up(self, history):
+        ran = []
+        now = datetime.now()
+        missed_fire = (now - timedelta(minutes=2)).replace(second=0, microsecond=0)
+
+        async def main():
+            runtime = _runtime(history)
+            runtime.add_job(ScheduledJob(id="once", func=lambda: ran.append("once"),
+                                         trigger=DateTrigger(run_date=datetime.now() + timedelta(seconds=0.1))))
+            runtime.add_job(ScheduledJob(id="daily_report", func=lambda: ran.append("daily_report"),
+                                         trigger=CronTrigger(hour=missed_fire.hour, minute=missed_fire.minute),
+                                         misfire_grace_seconds=600))
+            runtime.add_job(ScheduledJob(id="old_report", func=lambda: ran.append("old_report"),
+                                         trigger=CronTrigger(hour=missed_fire.hour, minute=missed_fire.minute),
+                                         misfire_grace_seconds=600))
+            await asyncio.to_thread(history.record, {
+                "job_id": "old_report", "run_type": "scheduled", "concurrency_class": "default",
+                "status": "success", "attempt": 1, "started_at": now - timedelta(minutes=1)})
+            runtime.start()
+            await asyncio.sleep(0.5)
+            runtime.shutdown()
+            return runtime
+
+        runtime = asyncio.run(main())
+
+        assert sorted(ran) == ["daily_report", "once"]  # old_report 는 이미 실행됨
+        assert runtime.stats["catch_up_runs"] == 1
+        assert history.recent("daily_report")[0]["run_type"] == "catch_up"
+        assert history.recent("once")[0]["run_type"] == "scheduled"
+
+    def test_jitter_applied_to_trigger(self, history):
+        runtime = _runtime(history)
+        job = _job("news_poller", lambda: None, jitter_seconds=15)
+        runtime.add_job(job)
+
+        assert job.trigger.jitter == 15
+        assert parse_concurrency_classes("llm=3, broker=0")["broker"] == 1
+
+    def test_default_history_db_is_anchored_to_project_root(self):
+        assert DEFAULT_HISTORY_DB_PATH.is_absolute()
+        assert DEFAULT_HISTORY_DB_PATH.parent.parent == Path(__file__).resolve().parents[2]
@@ -0,0 +1,135 @@
+"""
+SEC Parser Tests
+
+Tests for:
+- HTML cleaning (lxml / stdlib fallback parity)
+- Single-pass section extraction (table of contents skipping)
+- Streaming section extraction + TextChunker integration
+"""
+
+import pytest
+from datetime import datetime
+
+from backend.data.sec_parser import SECParser, stream_filing_chunks
+from backend.data.vector_store.chunker import TextChunker
+from backend.core.models.sec_models import FilingMetadata, FilingType, SECSection
+
+
+BODY = " ".join(["revenue"] * 80)
+
+
+def _make_filing_html(paragraphs_per_section: int = 3) -> str:
+    """목차 + 본문 섹션을 가진 샘플 10-K HTML"""
+    html = [
+        "<html><head><title>10-K</title><style>p {color: red}</style></head><body>",
+        # 목차 (본문이 짧아 섹션으로 인정되면 안 됨)
+        "<p>ITEM 1A. Risk Factors 12</p>",
+        "<p>ITEM 7. Management's Discussion 40</p>",
+    ]
+    sections = [
+        ("1", "BUSINESS"),
+        ("1A", "RISK FACTORS"),
+        ("2", "PROPERTIES"),
+        ("7", "MANAGEMENT'S DISCUSSION AND ANALYSIS"),
+        ("8", "FINANCIAL STATEMENTS"),
+    ]
+    for item, title in sections:
+        html.append(f"<div><span>ITEM {item}.</span> <span>{title}</span></div>")
+        for _ in range(paragraphs_per_section):
+            html.append(f"<p>{BODY}</p><table><tr><td>ITEM 99. TABLE</td></tr></table>")
+            html.append("<script>var hidden = 'ITEM 3. LEGAL PROCEEDINGS';</script>")
+    html.append("</body></html>")
+    return "".join(html)
+
+
+def _make_metadata() -> FilingMetadata:
+    return FilingMetadata(
+        ticker="TEST",
+        cik="0000000001",
+        company_name="Test Corp",
+        filing_type=FilingType.FORM_10K,
+        filing_date=datetime(2024, 11, 1),
+        fiscal_period="FY2024",
+        accession_number="0000000001-24-000001",
+        filing_url="https://example.com",
+        document_url="https://example.com/doc.html"
+    )
+
+
+class TestCleanHtml:
+    """HTML 정제"""
+
+    def test_removes_scripts_styles_and_tables(self):
+        text = SECParser()._clean_html(_make_filing_html())
+
+        assert "var hidden" not in text
+        assert "color: red" not in text
+        assert "ITEM 99" not in text
+        assert "revenue" in text
+
+    def test_stdlib_fallback_matches_lxml(self):
+        html = _make_filing_html()
+        parser = SECParser()
+        if not parser.use_lxml:
+            pytest.skip("lxml not installed")
+
+        lxml_text = parser._clean_html(html)
+        parser.use_lxml = False
+        assert parser._clean_html(html) == lxml_text
+
+
+class TestSectionExtraction:
+    """단일 패스 섹션 추출"""
+
+    def test_extracts_sections_and_skips_toc(self):
+        parsed = SECParser().parse(_make_metadata(), _make_filing_html())
+
+        assert set(parsed.sections) == {
+            SECSection.BUSINESS,
+            SECSection.RISK_FACTORS,
+            SECSection.MDA,
+            SECSection.FINANCIAL_STATEMENTS,
+        }
+        risk = parsed.get_section(SECSection.RISK_FACTORS)
+        assert risk.word_count >= 240
+        # Item 2 (PROPERTIES) 본문은 Item 1A에 섞이지 않음
+        assert "PROPERTIES" not in risk.content
+
+    def test_short_sections_are_ignored(self):
+        html = "<p>ITEM 1A. RISK FACTORS</p><p>Too short.</p>"
+        parsed = SECParser().parse(_make_metadata(), html)
+
+        assert parsed.sections == {}
+
+
+class TestStreaming:
+    """스트리밍 섹션 추출"""
+
+    @pytest.mark.parametrize("chunk_size", [64, 1000, 1_000_000])
+    def test_stream_matches_full_parse(self, chunk_size):
+        html = _make_filing_html()
+        parser = SECParser()
+        full = parser.parse(_make_metadata(), html).sections
+
+        streamed = list(parser.iter_sections(html, chunk_size=chunk_size))
+
+        assert [s.section_type for s in streamed] == list(full)
+        for section in streamed:
+            assert section.content == full[section.section_type].content
+
+    def test_accepts_chunk_iterable(self):
+        html = _make_filing_html()
+        chunks = (html[i:i + 500] for i in range(0, len(html), 500))
+
+        streamed = list(SECParser().iter_sections(chunks))
+
+        assert len(streamed) == 4
+
+    def test_chunker_consumes_sections_lazily(self):
+        html = _make_filing_html(paragraphs_per_section=40)
+
+        chunks = list(stream_filing_chunks(html, chunk_size=2000, overlap=100))
+
+        assert {c["metadata"]["section"] for c in chunks} == {"Item 1", "Item 1A", "Item 7", "Item 8"}
+        assert all(c["metadata"]["method"] == "section" for c in chunks)
+        assert all(TextChunker.estimate_tokens(c["content"]) <= 2000 for c in chunks)
@@ -0,0 +1,168 @@
+"""
+Sector Throttling Tests
+
+Tests for:
+- Ring-buffer window counters (O(1) count, bucket expiry)
+- SectorSignalTracker limits on the window counters
+- Shared throttle state through the Redis mirror
+"""
+
+from collections import defaultdict
+
+from backend.signals.sector_throttling import SectorSignalTracker, SectorThrottleConfig
+from backend.signals.sliding_window import RingCounter, SlidingWindowCounters, WindowSpec
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """hash 명령만 지원하는 최소 Redis (파이프라인 포함)"""
+
+    def __init__(self):
+        self.hashes = defaultdict(dict)
+        self.round_trips = 0
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def hincrby(self, key, field, amount):
+        self.ops.append(("hincrby", key, field, amount))
+
+    def expire(self, key, seconds):
+        self.ops.append(("expire", key))
+
+    def hmget(self, key, fields):
+        self.ops.append(("hmget", key, fields))
+
+    def hkeys(self, key):
+        self.ops.append(("hkeys", key))
+
+    def execute(self):
+        self.redis.round_trips += 1
+        results = []
+        for op in self.ops:
+            bucket = self.redis.hashes[op[1]]
+            if op[0] == "hincrby":
+                bucket[op[2]] = bucket.get(op[2], 0) + op[3]
+                results.append(bucket[op[2]])
+            elif op[0] == "hmget":
+                results.append([bucket.get(f) for f in op[2]])
+            elif op[0] == "hkeys":
+                results.append(list(bucket))
+            else:
+                results.append(True)
+        return results
+
+
+def _tracker(clock, redis_client=None, **config):
+    return SectorSignalTracker(
+        SectorThrottleConfig(**config), redis_client=redis_client, clock=clock
+    )
+
+
+class TestRingCounter:
+    """링 버퍼 카운터"""
+
+    def test_expires_buckets_as_window_slides(self):
+        ring = RingCounter(num_buckets=4)
+        ring.add(10)
+        ring.add(11)
+        ring.add(11)
+
+        assert ring.count(12) == 3
+        assert ring.count(14) == 2  # epoch 10 expired
+        assert ring.count(15) == 0
+        ring.add(100)
+        assert ring.count(100) == 1
+
+    def test_keyed_counters_and_prune(self):
+        clock = FakeClock()
+        counters = SlidingWindowCounters([WindowSpec("hourly", 3600)], clock=clock)
+        counters.increment(["sector:TECH", "total"])
+        counters.increment(["sector:ENERGY", "total"])
+
+        assert counters.counts("hourly", ["sector:TECH", "total", "sector:NONE"]) == {
+            "sector:TECH": 1, "total": 2, "sector:NONE": 0,
+        }
+        assert sorted(counters.active_keys("hourly", prefix="sector:")) == ["sector:ENERGY", "sector:TECH"]
+
+        clock.now += 3600
+        assert counters.count("hourly", "total") == 0
+        assert counters.prune() == 3
+
+
+class TestSectorSignalTracker:
+    """섹터 스로틀링"""
+
+    def test_hourly_sector_limit_and_expiry(self):
+        clock = FakeClock()
+        tracker = _tracker(clock, max_trades_per_sector_per_hour=3)
+
+        for ticker in ("NVDA", "AMD", "INTC"):
+            assert tracker.can_generate_signal(ticker, "BUY").allowed
+            tracker.record_signal(ticker, "BUY", 0.8, executed=True)
+
+        decision = tracker.can_generate_signal("QCOM", "BUY")
+        assert not decision.allowed
+        assert decision.current_count_hourly == 3
+        assert tracker.stats["throttle_by_sector"]["SEMICONDUCTORS"] == 1
+
+        clock.now += 3600
+        decision = tracker.can_generate_signal("QCOM", "BUY")
+        assert decision.allowed
+        assert decision.current_count_daily == 3
+
+    def test_correlated_sector_warning_and_summaries(self):
+        clock = FakeClock()
+        tracker = _tracker(clock, max_trades_per_sector_per_hour=2)
+        tracker.record_signal("NVDA", "BUY", 0.8, executed=True)
+        tracker.record_signal("AMD", "SELL", 0.8)
+
+        decision = tracker.can_generate_signal("AAPL", "BUY")
+        assert decision.allowed
+        assert "SEMICONDUCTORS" in decision.reason
+
+        summary = tracker.get_sector_summary()["SEMICONDUCTORS"]
+        assert summary["hourly_count"] == 2
+        assert summary["total_signals"] == 2
+        assert summary["executed_signals"] == 1
+        assert tracker.get_hot_sectors() == [("SEMICONDUCTORS", 2)]
+        assert tracker.get_ticker_count("nvda") == 1
+        assert tracker.get_direction_counts() == {"BUY": 1, "SELL": 1}
+
+    def test_workers_share_state_through_redis(self):
+        clock = FakeClock()
+        redis_client = FakeRedis()
+        worker_a = _tracker(clock, redis_client, max_trades_per_sector_per_hour=2)
+        worker_b = _tracker(clock, redis_client, max_trades_per_sector_per_hour=2)
+
+        worker_a.record_signal("NVDA", "BUY", 0.8)
+        worker_b.record_signal("AMD", "BUY", 0.8)
+
+        decision = worker_a.can_generate_signal("INTC", "BUY")
+        assert not decision.allowed
+        assert decision.current_count_hourly == 2
+        assert worker_b.get_sector_summary()["SEMICONDUCTORS"]["total_signals"] == 2
+
+    def test_falls_back_to_local_counters_when_redis_fails(self):
+        class BrokenRedis:
+            def pipeline(self, transaction=False):
+                raise ConnectionError("redis down")
+
+        tracker = _tracker(FakeClock(), BrokenRedis(), max_trades_per_sector_per_hour=1)
+        tracker.record_signal("NVDA", "BUY", 0.8)
+
+        assert not tracker.can_generate_signal("AMD", "BUY").allowed
+        assert tracker.counters.stats["redis_errors"] >= 2
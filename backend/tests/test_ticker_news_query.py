@@ -0,0 +1,164 @@
+"""
+Ticker News Query Tests
+
+Tests for:
+- Multi-ticker retrieval in one query per kind (news / emergency)
+- Index-friendly SQL shape (tickers @>, FTS fallback, LATERAL per-ticker limit, snippet only)
+- Per-ticker TTL cache shared across debate agents
+- Ticker tags stored upper-case (tickers @> is case-sensitive)
+- NewsAgent / SentimentAgent / AnalystAgent using the shared layer
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from backend.database.news_query import (
+    EmergencyNewsItem,
+    TickerNewsItem,
+    TickerNewsQuery,
+    ticker_news_sql,
+)
+
+NOW = datetime(2026, 10, 14, 15, 0)
+
+
+def _news_row(ticker, id_, hours_ago, sentiment=None, matched_by="tickers"):
+    return SimpleNamespace(
+        query_ticker=ticker, id=id_, title=f"{ticker} headline {id_}", snippet="snippet",
+        source="Reuters", published_date=NOW - timedelta(hours=hours_ago),
+        tickers=[ticker], tags=["earnings"], sentiment_score=sentiment, matched_by=matched_by,
+    )
+
+
+def _emergency_row(ticker, id_):
+    return SimpleNamespace(
+        query_ticker=ticker, id=id_, ticker=ticker, query=f"{ticker} halted",
+        search_date=NOW, was_emergency=True,
+    )
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    def __init__(self, owner):
+        self.owner = owner
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params):
+        sql = str(statement)
+        self.owner.executed.append((sql, params))
+        rows = self.owner.emergency_rows if "grounding_search_logs" in sql else self.owner.news_rows
+        return FakeResult([r for r in rows if r.query_ticker in params["tickers"]])
+
+
+class FakeDB:
+    def __init__(self, news_rows=(), emergency_rows=()):
+        self.news_rows = list(news_rows)
+        self.emergency_rows = list(emergency_rows)
+        self.executed = []
+
+    def __call__(self):
+        return FakeSession(self)
+
+
+@pytest.fixture
+def db():
+    return FakeDB(
+        news_rows=[
+            _news_row("AMD", 3, 1, sentiment=-0.5),
+            _news_row("NVDA", 1, 2, sentiment=0.6),
+            _news_row("NVDA", 2, 30, sentiment=0.4, matched_by="text"),
+        ],
+        emergency_rows=[_emergency_row("NVDA", 9)],
+    )
+
+
+class TestQuery:
+    def test_ticker_tags_are_stored_upper_case(self):
+        from backend.database.models import NewsArticle
+
+        article = NewsArticle(tickers=["nvda", " Amd", "NVDA"])
+        assert article.tickers == ["NVDA", "AMD"]
+        article.tickers = None
+        assert article.tickers is None
+
+    async def test_multi_ticker_single_round_trip(self, db):
+        query = TickerNewsQuery(session_factory=db, clock=lambda: NOW)
+
+        bundles = await query.fetch_for_debate(["nvda", "AMD", "NVDA", "TSLA"])
+
+        assert list(bundles) == ["NVDA", "AMD", "TSLA"]
+        assert len(db.executed) == 2
+        (news_sql, news_params), (_, emergency_params) = db.executed
+        assert news_params["tickers"] == ["NVDA", "AMD", "TSLA"]
+        assert news_params["since"] == NOW - timedelta(days=15)
+        assert news_params["per_ticker"] == 30 and emergency_params["per_ticker"] == 5
+
+        nvda = bundles["NVDA"]
+        assert [n.id for n in nvda.news] == [1, 2]
+        assert isinstance(nvda.news[0], TickerNewsItem)
+        assert nvda.news[1].matched_by == "text"
+        assert isinstance(nvda.emergency[0], EmergencyNewsItem)
+        assert bundles["TSLA"].news == [] and bundles["TSLA"].emergency == []
+
+    async def test_cache_shared_between_callers(self, db):
+        query = TickerNewsQuery(session_factory=db, clock=lambda: NOW)
+
+        await query.fetch_for_debate(["NVDA"])
+        await query.get_bundle("nvda")
+        await query.fetch_for_debate(["NVDA", "AMD"])
+
+        assert [p["tickers"] for _, p in db.executed] == [["NVDA"], ["NVDA"], ["AMD"], ["AMD"]]
+        assert query.stats["cache_hits"] == 2
+
+        query.invalidate(["NVDA"])
+        await query.get_bundle("NVDA")
+        assert len(db.executed) == 6
+
+    def test_sql_uses_indexed_predicates_and_light_columns(self):
+        sql = str(ticker_news_sql(text_fallback=True))
+        assert "CROSS JOIN LATERAL" in sql
+        assert "n.tickers @> ARRAY[t.ticker]::varchar[]" in sql
+        assert "plainto_tsquery('simple', t.ticker)" in sql
+        assert "LIMIT :per_ticker" in sql
+        assert "left(coalesce(n.summary, n.content), :snippet_chars)" in sql
+        assert "n.embedding" not in sql and "n.*" not in sql
+
+        assert "to_tsvector" not in str(ticker_news_sql(text_fallback=False))
+
+
+class TestAgents:
+    async def test_agents_share_the_query_layer(self, db, monkeypatch):
+        monkeypatch.setenv("ENABLE_NEWS_INTERPRETATION", "false")
+        from backend.ai.debate.analyst_agent import AnalystAgent
+        from backend.ai.debate.news_agent import NewsAgent
+        from backend.ai.debate.sentiment_agent import SentimentAgent
+
+        query = TickerNewsQuery(session_factory=db, clock=lambda: NOW)
+        news_agent = NewsAgent(news_query=query)
+
+        async def fake_sentiment(ticker, summaries, trend=None, regulatory=None):
+            return {"score": 0.5, "positive_count": 2, "negative_count": 0, "keywords": ["AI"]}
+
+        news_agent._analyze_sentiment = fake_sentiment
+        vote = await news_agent.analyze("NVDA")
+        sentiment_vote = await SentimentAgent(news_query=query).analyze("NVDA")
+        analyst_vote = await AnalystAgent(news_query=query).analyze("NVDA")
+
+        assert vote["news_count"] == 2 and vote["emergency_count"] == 1
+        assert sentiment_vote["news_sentiment"]["avg_sentiment"] == pytest.approx(0.5)
+        assert analyst_vote["news_context"]["recent_headlines"][0] == "NVDA headline 1"
+        assert len(db.executed) == 2  # 세 에이전트가 한 번의 조회 결과를 공유
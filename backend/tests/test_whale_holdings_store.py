@@ -0,0 +1,136 @@
+"""
+13F Holdings Store Tests
+
+Tests for:
+- Columnar holdings with precomputed quarter-over-quarter deltas
+- Ticker → investor inverted index
+- Bulk Whale Wisdom scoring matches the per-ticker path
+- FeatureStore bulk retrieval with a single bulk computation
+"""
+
+from datetime import datetime
+
+import pytest
+
+from backend.data.feature_store.cache_layer import CacheLayer
+from backend.data.feature_store.store import FeatureStore
+from backend.data.features.holdings_store import HoldingsStore
+from backend.data.features.whale_wisdom_factor import (
+    Filing13F,
+    WhaleWisdomCalculator,
+    WhaleWisdomFeature,
+)
+from backend.data.feature_store import features as feature_defs
+
+
+def _filings():
+    latest = Filing13F("FUND", datetime(2026, 8, 14), datetime(2026, 6, 30), [
+        {"ticker": "AAPL", "shares": 150, "value": 600},
+        {"ticker": "NVDA", "shares": 100, "value": 400},
+    ])
+    previous = Filing13F("FUND", datetime(2026, 5, 15), datetime(2026, 3, 31), [
+        {"ticker": "AAPL", "shares": 100, "value": 500},
+        {"ticker": "MSFT", "shares": 50, "value": 500},
+    ])
+    return [latest, previous]
+
+
+class InMemoryCache(CacheLayer):
+    """테스트용 캐시 레이어"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl):
+        self.data[key] = value
+
+    async def exists(self, key):
+        return key in self.data
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def close(self):
+        pass
+
+
+class TestHoldingsStore:
+    """컬럼 저장소 / 역색인"""
+
+    def test_quarter_over_quarter_deltas(self):
+        store = HoldingsStore()
+        store.add_filings("FUND", _filings())
+
+        aapl = store.positions("AAPL").iloc[0]
+        assert aapl["weight"] == pytest.approx(0.6)
+        assert aapl["prev_weight"] == pytest.approx(0.5)
+        assert aapl["weight_delta"] == pytest.approx(0.1)
+        assert aapl["share_delta"] == 50
+        assert not aapl["is_new"]
+
+        nvda = store.positions("NVDA").iloc[0]
+        assert nvda["is_new"]
+        assert store.positions("MSFT").empty  # 이전 분기에만 보유
+        assert store.weight("FUND", "AAPL") == pytest.approx(_filings()[0].get_position_weight("AAPL"))
+
+    def test_reloading_investor_replaces_rows(self):
+        store = HoldingsStore()
+        store.add_filings("FUND", _filings())
+        store.add_filings("FUND", _filings()[:1])
+
+        assert store.get_stats()["rows"] == 2
+        assert store.positions("AAPL").iloc[0]["is_new"]
+
+
+class TestWhaleWisdomBulk:
+    """유니버스 일괄 스코어링"""
+
+    async def test_bulk_scores_match_single_ticker(self):
+        calculator = WhaleWisdomCalculator()
+        tickers = ["AAPL", "NVDA", "TSLA", "SPY", "ZZZZ"]
+
+        bulk = await calculator.calculate_whale_scores(tickers)
+
+        for ticker in tickers:
+            single = await calculator.calculate_whale_wisdom_score(ticker)
+            assert bulk[ticker]["score"] == pytest.approx(single["score"])
+            assert bulk[ticker]["components"] == pytest.approx(single["components"])
+            assert bulk[ticker]["big_bet_detected"] == single["big_bet_detected"]
+        assert bulk["ZZZZ"]["score"] == pytest.approx(0.0)
+
+    async def test_investor_holdings_use_index(self):
+        calculator = WhaleWisdomCalculator()
+        holdings = await calculator.sec_collector.get_all_investor_holdings("NVDA", ["DRUCKENMILLER", "ARKK"])
+
+        assert [h["investor_id"] for h in holdings] == ["DRUCKENMILLER"]
+        filings = await calculator.sec_collector.fetch_13f_filings("DRUCKENMILLER", 2)
+        assert holdings[0]["position_weight"] == pytest.approx(filings[0].get_position_weight("NVDA"))
+        assert holdings[0]["weight_change"] == pytest.approx(
+            filings[0].get_position_weight("NVDA") - filings[1].get_position_weight("NVDA")
+        )
+
+
+class TestFeatureStoreBulk:
+    """FeatureStore 일괄 조회"""
+
+    async def test_misses_computed_in_one_bulk_call(self, monkeypatch):
+        feature = WhaleWisdomFeature()
+        calls = []
+
+        async def bulk(tickers, as_of_date):
+            calls.append(list(tickers))
+            results = await feature.calculate_bulk(tickers, as_of_date)
+            return {ticker: result["value"] for ticker, result in results.items()}
+
+        monkeypatch.setitem(feature_defs.BULK_FEATURE_CALCULATORS, "whale_wisdom_score", bulk)
+        store = FeatureStore(redis_cache=InMemoryCache(), timescale_cache=InMemoryCache(), data_collector=object())
+
+        first = await store.get_features_bulk(["aapl", "nvda", "tsla"], "whale_wisdom_score")
+        second = await store.get_features_bulk(["AAPL", "NVDA", "TSLA"], "whale_wisdom_score")
+
+        assert calls == [["AAPL", "NVDA", "TSLA"]]
+        assert first == second
+        assert all(0.0 <= value <= 1.0 for value in first.values())